@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Measure per-call latency and allocations of the control-loop hot paths.
+
+Runs the benchmarks in tests/perf/harness.py (WANController and
+SteeringDaemon cycles, signal processing, CAKE netlink stats parsing, the
+4-state queue controller and the SQLite metrics batch), compares them with the checked-in baseline and
+exits non-zero on a regression. --update-baseline rewrites the baseline
+from this run, keeping its thresholds.
+
+Usage:
+    python3 scripts/bench_cycle_latency.py
+    python3 scripts/bench_cycle_latency.py --only SignalProcessor.process --json
+    python3 scripts/bench_cycle_latency.py --time-pct 50 --rounds 10
+    python3 scripts/bench_cycle_latency.py --update-baseline
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+_repo_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_repo_root / "src"))  # dev layout
+sys.path.insert(0, str(_repo_root))           # tests.perf.harness
+
+from tests.perf.harness import BASELINE_PATH, BENCHMARKS, compare, measure  # noqa: E402
+
+
+def _print_table(results: list, baseline: dict) -> None:
+    print(f"{'benchmark':<36} {'p50 us':>9} {'p99 us':>9} {'alloc B':>9} {'leak B':>8} {'p50 x':>6}")
+    for result in results:
+        base = baseline.get(result.name)
+        ratio = f"{result.p50_us / base['p50_us']:.2f}" if base and base["p50_us"] else "-"
+        print(
+            f"{result.name:<36} {result.p50_us:>9.1f} {result.p99_us:>9.1f} "
+            f"{result.alloc_peak_bytes:>9.0f} {result.retained_bytes:>8.1f} {ratio:>6}"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", action="append", choices=sorted(BENCHMARKS),
+                        help="Run only this benchmark (repeatable)")
+    parser.add_argument("--rounds", type=int, default=5, help="Timed rounds per benchmark")
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="Multiplier on calls per round")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH,
+                        help="Baseline JSON file")
+    parser.add_argument("--time-pct", type=float, help="Override the p50/p99 growth threshold")
+    parser.add_argument("--alloc-pct", type=float, help="Override the allocation threshold")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Write this run's figures to the baseline file")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    stored = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    baseline = stored.get("benchmarks", {})
+    thresholds = dict(stored.get("thresholds", {"time_pct": 300.0, "alloc_pct": 25.0}))
+    if args.time_pct is not None:
+        thresholds["time_pct"] = args.time_pct
+    if args.alloc_pct is not None:
+        thresholds["alloc_pct"] = args.alloc_pct
+
+    names = args.only or list(BENCHMARKS)
+    results = [measure(name, rounds=args.rounds, scale=args.scale) for name in names]
+    regressions = [
+        line
+        for result in results
+        if result.name in baseline
+        for line in compare(result, baseline[result.name], thresholds)
+    ]
+
+    if args.json:
+        print(json.dumps({"results": [r.to_dict() for r in results],
+                          "regressions": regressions}, indent=2))
+    else:
+        _print_table(results, baseline)
+        for line in regressions:
+            print(f"REGRESSION: {line}")
+
+    if args.update_baseline:
+        for result in results:
+            baseline[result.name] = {
+                "p50_us": result.p50_us,
+                "p99_us": result.p99_us,
+                "alloc_peak_bytes": result.alloc_peak_bytes,
+            }
+        stored["benchmarks"] = dict(sorted(baseline.items()))
+        stored.setdefault("thresholds", thresholds)
+        args.baseline.write_text(json.dumps(stored, indent=2) + "\n")
+        print(f"Baseline written to {args.baseline}", file=sys.stderr)
+        return 0
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Benchmark OperationProfiler against ArrayOperationProfiler.
+
+Replays a lognormal latency stream into both profilers and reports record()
+cost, stats() cost with a full window, and retained memory per label. The
+daemons call stats() per label for every /health request and profiling
+report, with 1200-sample windows in the background threads.
+
+Usage:
+    python3 scripts/bench_profiler.py
+    python3 scripts/bench_profiler.py --samples 50000 --window 1200 --json
+"""
+import argparse
+import json
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+_script_dir = Path(__file__).resolve().parent
+sys.path.insert(0, str(_script_dir.parent / "src"))  # dev layout
+sys.path.insert(0, str(_script_dir.parent.parent))    # prod layout (/opt)
+
+from wanctl.perf_profiler import ArrayOperationProfiler, OperationProfiler  # noqa: E402
+
+LABEL = "autorate_cycle_total"
+
+
+def _stream(count: int, seed: int) -> list[float]:
+    rng = random.Random(seed)
+    return [rng.lognormvariate(1.5, 0.6) for _ in range(count)]
+
+
+def _fill(profiler_cls: type, values: list[float], window: int) -> object:
+    profiler = profiler_cls(max_samples=window)
+    for value in values:
+        # "+ 0.0" allocates a fresh float, like a real elapsed-time measurement
+        profiler.record(LABEL, value + 0.0)
+    return profiler
+
+
+def bench(profiler_cls: type, values: list[float], window: int, stats_calls: int) -> dict:
+    """Time record() over ``values`` and stats() ``stats_calls`` times."""
+    start = time.perf_counter()
+    profiler = _fill(profiler_cls, values, window)
+    record_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(stats_calls):
+        stats = profiler.stats(LABEL)  # type: ignore[attr-defined]
+    stats_s = time.perf_counter() - start
+
+    # Separate pass: tracemalloc slows allocation and would skew record timing
+    tracemalloc.start()
+    retained = _fill(profiler_cls, values, window)
+    retained_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del retained
+
+    return {
+        "profiler": profiler_cls.__name__,
+        "record_ns": record_s / len(values) * 1e9,
+        "stats_us": stats_s / stats_calls * 1e6,
+        "retained_kib": retained_bytes / 1024,
+        "p95_ms": stats["p95_ms"],
+        "p99_ms": stats["p99_ms"],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=20000, help="values recorded per run")
+    parser.add_argument("--window", type=int, default=1200, help="max_samples per label")
+    parser.add_argument("--stats-calls", type=int, default=2000, help="stats() calls timed")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", action="store_true", help="print JSON instead of a table")
+    args = parser.parse_args(argv)
+
+    values = _stream(args.samples, args.seed)
+    results = [
+        bench(cls, values, args.window, args.stats_calls)
+        for cls in (OperationProfiler, ArrayOperationProfiler)
+    ]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(f"{args.samples} samples, window={args.window}, {args.stats_calls} stats() calls")
+    print(f"{'profiler':<24}{'record ns':>12}{'stats us':>12}{'KiB':>10}{'p95':>9}{'p99':>9}")
+    for r in results:
+        print(
+            f"{r['profiler']:<24}{r['record_ns']:>12.0f}{r['stats_us']:>12.1f}"
+            f"{r['retained_kib']:>10.1f}{r['p95_ms']:>9.2f}{r['p99_ms']:>9.2f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
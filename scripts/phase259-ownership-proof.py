@@ -17,7 +17,9 @@ from wanctl.readonly_validator import iter_commands, validate_command  # noqa: E
 from wanctl.router_client import get_router_client  # noqa: E402
 from wanctl.steering.daemon import SteeringConfig  # noqa: E402
 from wanctl.steering.route_manager import RouteManager  # noqa: E402
+from wanctl.steering.route_ownership_guard import RouteOwnershipGuard  # noqa: E402
 from wanctl.steering.route_ownership_inspector import (  # noqa: E402
+    DEFAULT_ROUTE_PRINT,
     ROUTE_PRINT,
     RouteOwnershipInspector,
 )
@@ -27,6 +29,8 @@ STATIC_READ_COMMANDS = (
     "/tool netwatch print detail",
     "/system script print detail",
     ROUTE_PRINT,
+    RouteOwnershipGuard.SCRIPT_PRINT,
+    DEFAULT_ROUTE_PRINT,
 )
 
 
@@ -78,7 +82,6 @@ def run_proof(client: RouterClientLike, route_manager: RouteManagerLike) -> tupl
         f"match={snap['match']} "
         f"netwatch_entries={netwatch['entries_count']} "
         f"route_mutating_active={netwatch['route_mutating_active_count']} "
-        f"total_routes={routes['total_route_count']} "
         f"default_routes={len(routes['default_routes'])}",
     )
 
@@ -159,7 +159,7 @@ def sample_health(url: str = DEFAULT_HEALTH_URL) -> dict[str, Any]:
                 "inspector_error": str(exc),
                 "last_inspected_at": None,
                 "netwatch": {"entries_count": 0, "route_mutating_active_count": 0},
-                "routes": {"total_route_count": 0, "default_routes": []},
+                "routes": {"default_routes": []},
             },
             "route_management": {},
             "error": str(exc),
@@ -412,11 +412,6 @@ def assemble_divergences(
         final_ownership.get("netwatch", {}) if isinstance(final_ownership, dict) else {}
     )
     comparisons = [
-        (
-            "total_route_count",
-            ownership_routes.get("total_route_count"),
-            cc_routes.get("total_route_count"),
-        ),
         (
             "default_routes",
             _normalize_routes(ownership_routes.get("default_routes", [])),
@@ -428,6 +423,16 @@ def assemble_divergences(
             cc_netwatch.get("route_mutating_active_count"),
         ),
     ]
+    # Live inspection no longer refreshes the total route count; compare it
+    # only for samples that still carry it
+    if "total_route_count" in ownership_routes:
+        comparisons.append(
+            (
+                "total_route_count",
+                ownership_routes.get("total_route_count"),
+                cc_routes.get("total_route_count"),
+            )
+        )
     for field, health_value, cross_value in comparisons:
         if health_value != cross_value:
             divergences.append(
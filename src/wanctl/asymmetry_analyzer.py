@@ -18,8 +18,10 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
-from wanctl.irtt_measurement import IRTTResult
+if TYPE_CHECKING:
+    from wanctl.irtt_measurement import IRTTResult
 
 # Direction encoding for SQLite REAL column persistence
 DIRECTION_ENCODING: dict[str, float] = {
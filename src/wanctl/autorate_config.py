@@ -17,6 +17,7 @@ from wanctl.config_validation_utils import (
 )
 from wanctl.timeouts import DEFAULT_AUTORATE_PING_TIMEOUT, DEFAULT_AUTORATE_SSH_TIMEOUT
 from wanctl.tuning.models import SafetyBounds, TuningConfig
+from wanctl.zone_events import DEFAULT_ZONE_EVENT_SOCKET
 
 # =============================================================================
 # CONSTANTS
@@ -76,6 +77,10 @@ class ReflectorQualityConfig(TypedDict):
     window_size: int
     probe_interval_sec: float
     recovery_count: int
+    candidates: list[str]
+    active_count: int | None
+    probe_budget_per_sec: float
+    reselect_interval_sec: float
 
 
 class OWDAsymmetryConfig(TypedDict):
@@ -652,6 +657,10 @@ class Config(BaseConfig):
         self.router_password = router.get("password", "")
         self.router_port = router.get("port", 443)
         self.router_verify_ssl = router.get("verify_ssl", True)
+        # SSH command mode (only used if transport=ssh or after REST failover)
+        self.router_ssh_mode = self.validate_ssh_mode(
+            router.get("ssh_mode", "exec"), "router.ssh_mode"
+        )
 
     def _load_rate_limiter_config(self) -> None:
         """Load rate limiter settings from router.rate_limiter YAML section.
@@ -716,6 +725,13 @@ class Config(BaseConfig):
         self.metrics_enabled = metrics_config.get("enabled", False)
         self.metrics_host = metrics_config.get("host", "127.0.0.1")
         self.metrics_port = metrics_config.get("port", 9100)
+        openmetrics = metrics_config.get("openmetrics", False)
+        if not isinstance(openmetrics, bool):
+            logging.getLogger(__name__).warning(
+                f"metrics.openmetrics must be bool, got {type(openmetrics).__name__}; using false"
+            )
+            openmetrics = False
+        self.metrics_openmetrics = openmetrics
 
     def _load_alerting_config(self) -> None:
         """Load alerting configuration.
@@ -1056,6 +1072,119 @@ class Config(BaseConfig):
         self.cake_stats_cadence_sec: float = float(cadence_sec)
         logger.info("CAKE stats background cadence: %ss", self.cake_stats_cadence_sec)
 
+    def _load_router_apply_config(self) -> None:
+        """Load the router apply mode.
+
+        continuous_monitoring.router_apply_mode selects where rate changes are
+        written: "sync" (default) applies them on the control thread, "async"
+        posts them to a per-WAN writer thread. Unknown values warn and fall
+        back to "sync".
+        """
+        logger = logging.getLogger(__name__)
+        cm = self.data.get("continuous_monitoring", {})
+        if not isinstance(cm, dict):
+            cm = {}
+
+        mode = cm.get("router_apply_mode", "sync")
+        if mode not in ("sync", "async"):
+            logger.warning(
+                "continuous_monitoring.router_apply_mode must be 'sync' or 'async', "
+                "got %r; defaulting to 'sync'",
+                mode,
+            )
+            mode = "sync"
+
+        self.router_apply_mode: str = mode
+        logger.info("Router apply mode: %s", self.router_apply_mode)
+
+    def _load_measurement_scheduler_config(self) -> None:
+        """Load the background measurement scheduler configuration.
+
+        Validates continuous_monitoring.measurement_scheduler. Invalid values
+        warn and fall back to defaults. idle_cadence_factor is capped at 2.0 so
+        idle producers stay inside the consumers' staleness windows (0.5s RTT
+        soft limit, 3x IRTT cadence).
+
+        Sets self.measurement_scheduler_config to a dict with all parameters.
+        """
+        logger = logging.getLogger(__name__)
+        cm = self.data.get("continuous_monitoring", {})
+        if not isinstance(cm, dict):
+            cm = {}
+        ms = cm.get("measurement_scheduler", {})
+        if not isinstance(ms, dict):
+            logger.warning(
+                f"continuous_monitoring.measurement_scheduler must be dict, "
+                f"got {type(ms).__name__}; using defaults"
+            )
+            ms = {}
+
+        enabled = ms.get("enabled", False)
+        if not isinstance(enabled, bool):
+            logger.warning(
+                f"continuous_monitoring.measurement_scheduler.enabled must be bool, "
+                f"got {enabled!r}; defaulting to false"
+            )
+            enabled = False
+
+        def _number(key: str, default: float, lo: float, hi: float) -> float:
+            value = ms.get(key, default)
+            if (
+                not isinstance(value, (int, float))
+                or isinstance(value, bool)
+                or not lo <= value <= hi
+            ):
+                logger.warning(
+                    f"continuous_monitoring.measurement_scheduler.{key} must be number "
+                    f"in [{lo}, {hi}], got {value!r}; defaulting to {default}"
+                )
+                value = default
+            return float(value)
+
+        self.measurement_scheduler_config = {
+            "enabled": enabled,
+            "idle_after_sec": _number("idle_after_sec", 60.0, 0.0, 3600.0),
+            "idle_cadence_factor": _number("idle_cadence_factor", 2.0, 1.0, 2.0),
+            "busy_cadence_factor": _number("busy_cadence_factor", 0.5, 0.1, 1.0),
+            "lead_margin_ms": _number("lead_margin_ms", 5.0, 0.0, 50.0),
+        }
+        if enabled:
+            logger.info(
+                "Measurement scheduler: idle_after=%ss, idle_factor=%s, busy_factor=%s, "
+                "lead_margin=%sms",
+                self.measurement_scheduler_config["idle_after_sec"],
+                self.measurement_scheduler_config["idle_cadence_factor"],
+                self.measurement_scheduler_config["busy_cadence_factor"],
+                self.measurement_scheduler_config["lead_margin_ms"],
+            )
+
+    def _load_zone_events_config(self) -> None:
+        """Load zone transition event publishing (optional, disabled by default).
+
+        When enabled, WANController pushes a datagram to the steering daemon's
+        zone event socket on every DL/UL zone change. Invalid socket paths warn
+        and disable publishing rather than failing startup.
+        """
+        logger = logging.getLogger(__name__)
+        events = self.data.get("zone_events", {})
+        if not isinstance(events, dict):
+            events = {}
+
+        self.zone_event_socket: str | None = None
+        if not events.get("enabled", False):
+            return
+
+        socket_path = events.get("socket_path", DEFAULT_ZONE_EVENT_SOCKET)
+        if not isinstance(socket_path, str) or not socket_path.startswith("/"):
+            logger.warning(
+                "zone_events.socket_path must be an absolute path, got %r; zone events disabled",
+                socket_path,
+            )
+            return
+
+        self.zone_event_socket = socket_path
+        logger.info("Zone events: publishing transitions to %s", socket_path)
+
     def _load_reflector_quality_config(self) -> None:
         """Load reflector quality scoring configuration.
 
@@ -1113,17 +1242,84 @@ class Config(BaseConfig):
             )
             recovery_count = 3
 
+        fleet = self._load_reflector_fleet_settings(rq, logger)
         self.reflector_quality_config = {
             "min_score": float(min_score),
             "window_size": window_size,
             "probe_interval_sec": float(probe_interval_sec),
             "recovery_count": recovery_count,
+            "candidates": fleet["candidates"],
+            "active_count": fleet["active_count"],
+            "probe_budget_per_sec": fleet["probe_budget_per_sec"],
+            "reselect_interval_sec": fleet["reselect_interval_sec"],
         }
         logger.info(
             f"Reflector quality: min_score={min_score}, window={window_size}, "
             f"probe_interval={probe_interval_sec}s, recovery_count={recovery_count}"
         )
 
+    def _load_reflector_fleet_settings(self, rq: dict, logger: logging.Logger) -> dict:
+        """Load the reflector fleet keys of the reflector_quality: section.
+
+        The fleet is enabled by a non-empty candidates list. Invalid values
+        warn and fall back to defaults (does not crash).
+        """
+        candidates = rq.get("candidates", [])
+        if not isinstance(candidates, list) or not all(
+            isinstance(c, str) and c for c in candidates
+        ):
+            logger.warning(
+                f"reflector_quality.candidates must be list of host strings, "
+                f"got {candidates!r}; reflector fleet disabled"
+            )
+            candidates = []
+
+        active_count = rq.get("active_count")
+        if active_count is not None and (
+            not isinstance(active_count, int) or isinstance(active_count, bool) or active_count < 1
+        ):
+            logger.warning(
+                f"reflector_quality.active_count must be int >= 1, "
+                f"got {active_count!r}; defaulting to len(ping_hosts)"
+            )
+            active_count = None
+
+        probe_budget = rq.get("probe_budget_per_sec", 2.0)
+        if (
+            not isinstance(probe_budget, (int, float))
+            or isinstance(probe_budget, bool)
+            or not 0 < probe_budget <= 20
+        ):
+            logger.warning(
+                f"reflector_quality.probe_budget_per_sec must be number in (0, 20], "
+                f"got {probe_budget!r}; defaulting to 2.0"
+            )
+            probe_budget = 2.0
+
+        reselect_interval = rq.get("reselect_interval_sec", 30)
+        if (
+            not isinstance(reselect_interval, (int, float))
+            or isinstance(reselect_interval, bool)
+            or reselect_interval < 5
+        ):
+            logger.warning(
+                f"reflector_quality.reselect_interval_sec must be number >= 5, "
+                f"got {reselect_interval!r}; defaulting to 30"
+            )
+            reselect_interval = 30
+
+        if candidates:
+            logger.info(
+                f"Reflector fleet: {len(candidates)} candidates, active_count={active_count}, "
+                f"probe_budget={probe_budget}/s, reselect_interval={reselect_interval}s"
+            )
+        return {
+            "candidates": list(candidates),
+            "active_count": active_count,
+            "probe_budget_per_sec": float(probe_budget),
+            "reselect_interval_sec": float(reselect_interval),
+        }
+
     def _load_owd_asymmetry_config(self) -> None:
         """Load OWD asymmetry detection configuration.
 
@@ -1659,6 +1855,15 @@ class Config(BaseConfig):
         # Background CAKE stats cadence (optional, default preserves 50ms behavior)
         self._load_cake_stats_cadence_config()
 
+        # Router apply mode (optional, default keeps synchronous applies)
+        self._load_router_apply_config()
+
+        # Measurement scheduler (optional, default keeps fixed producer cadences)
+        self._load_measurement_scheduler_config()
+
+        # Zone transition events for steering (optional, disabled by default)
+        self._load_zone_events_config()
+
         # Reflector quality scoring (optional, all defaults if absent)
         self._load_reflector_quality_config()
 
@@ -8,13 +8,14 @@ control to WANController instances via ContinuousAutoRate.
 
 import argparse
 import atexit
+import importlib
 import logging
 import sys
 import time
 import traceback
 from collections.abc import Mapping
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from wanctl.autorate_config import Config
 from wanctl.backends.linux_cake_adapter import LinuxCakeAdapter
@@ -22,10 +23,9 @@ from wanctl.config_base import ConfigValidationError, get_storage_config
 from wanctl.config_validation_utils import validate_retention_tuner_compat
 from wanctl.daemon_utils import check_cleanup_deadline
 from wanctl.health_check import start_health_server, update_health_status
-from wanctl.irtt_measurement import IRTTMeasurement
-from wanctl.irtt_thread import IRTTThread
 from wanctl.lock_utils import LockAcquisitionError, LockFile, validate_and_acquire_lock
 from wanctl.logging_utils import setup_logging
+from wanctl.measurement_scheduler import IRTT_SCHEDULE_SOURCE, MeasurementScheduler
 from wanctl.metrics import (
     record_runtime_pressure,
     record_storage_checkpoint,
@@ -36,6 +36,7 @@ from wanctl.metrics import (
 from wanctl.router_client import clear_router_password
 from wanctl.routeros_interface import RouterOS
 from wanctl.rtt_backend_factory import RttBackendHandle, build_rtt_backend
+from wanctl.runtime_pressure import read_process_age_seconds
 from wanctl.signal_utils import (
     SHUTDOWN_TIMEOUT_SECONDS,
     get_shutdown_event,
@@ -60,6 +61,27 @@ from wanctl.wan_controller import (
     _mark_tuning_executed,
 )
 
+if TYPE_CHECKING:
+    from wanctl.irtt_thread import IRTTThread
+
+# IRTT is resolved on first attribute access, like the heavy backends in
+# wanctl.backends: importing the daemon does not load it, only starting the
+# IRTT thread does.
+_LAZY_IRTT: dict[str, str] = {
+    "IRTTMeasurement": "wanctl.irtt_measurement",
+    "IRTTThread": "wanctl.irtt_thread",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IRTT.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
 # =============================================================================
 # CONSTANTS
 # =============================================================================
@@ -438,9 +460,13 @@ def _start_servers(
 
     if first_config.metrics_enabled:
         try:
+            metrics_kwargs: dict[str, Any] = {}
+            if getattr(first_config, "metrics_openmetrics", False) is True:
+                metrics_kwargs["openmetrics"] = True
             metrics_server = start_metrics_server(
                 host=first_config.metrics_host,
                 port=first_config.metrics_port,
+                **metrics_kwargs,
             )
             storage_config = get_storage_config(first_config.data)
             db_path = storage_config.get("db_path")
@@ -474,23 +500,52 @@ def _start_servers(
     return metrics_server, health_server
 
 
+def _build_measurement_scheduler(
+    controller: "ContinuousAutoRate",
+) -> MeasurementScheduler | None:
+    """Create the shared measurement scheduler if enabled in the first WAN's config."""
+    scheduler_config = controller.wan_controllers[0]["config"].measurement_scheduler_config
+    if scheduler_config.get("enabled") is not True:
+        return None
+    return MeasurementScheduler(
+        CYCLE_INTERVAL_SECONDS,
+        idle_after_sec=scheduler_config["idle_after_sec"],
+        idle_cadence_factor=scheduler_config["idle_cadence_factor"],
+        busy_cadence_factor=scheduler_config["busy_cadence_factor"],
+        lead_margin_sec=scheduler_config["lead_margin_ms"] / 1000.0,
+    )
+
+
 def _start_irtt_thread(
     controller: "ContinuousAutoRate",
-) -> IRTTThread | None:
+    measurement_scheduler: MeasurementScheduler | None = None,
+) -> "IRTTThread | None":
     """Start IRTT background measurement thread if IRTT is available.
 
-    Returns None if IRTT is disabled or unavailable.
+    Returns None if IRTT is disabled or unavailable. This is where the IRTT
+    modules are first imported.
     """
     first_config = controller.wan_controllers[0]["config"]
     logger = controller.wan_controllers[0]["logger"]
 
-    measurement = IRTTMeasurement(first_config.irtt_config, logger)
+    irtt = sys.modules[__name__]  # resolves the lazy IRTT names
+    measurement = irtt.IRTTMeasurement(first_config.irtt_config, logger)
     if not measurement.is_available():
         return None
 
     shutdown_event = get_shutdown_event()
     cadence_sec = first_config.irtt_config.get("cadence_sec", 10.0)
-    thread = IRTTThread(measurement, cadence_sec, shutdown_event, logger)
+    thread: IRTTThread
+    if measurement_scheduler is None:
+        thread = irtt.IRTTThread(measurement, cadence_sec, shutdown_event, logger)
+    else:
+        thread = irtt.IRTTThread(
+            measurement,
+            cadence_sec,
+            shutdown_event,
+            logger,
+            schedule=measurement_scheduler.register(IRTT_SCHEDULE_SOURCE, cadence_sec),
+        )
     thread.start()
     return thread
 
@@ -507,7 +562,8 @@ def _configure_controller_flags(
 
 def _setup_daemon_state(
     controller: "ContinuousAutoRate",
-    irtt_thread: IRTTThread | None,
+    irtt_thread: "IRTTThread | None",
+    measurement_scheduler: MeasurementScheduler | None = None,
 ) -> DeferredIOWorker | None:
     """Wire IRTT thread, start background RTT, create I/O worker, and log startup info.
 
@@ -517,11 +573,14 @@ def _setup_daemon_state(
     for wan_info in controller.wan_controllers:
         wan_info["controller"].set_irtt_thread(irtt_thread)
         wan_info["controller"].init_fusion_healer()
+        if measurement_scheduler is not None:
+            wan_info["controller"].set_measurement_scheduler(measurement_scheduler)
 
     rtt_shutdown = get_shutdown_event()
     for wan_info in controller.wan_controllers:
         wan_info["controller"].start_background_rtt(rtt_shutdown)
         wan_info["controller"].start_background_cake_stats(get_shutdown_event())
+        wan_info["controller"].start_background_router_apply(get_shutdown_event())
 
     # Create deferred I/O worker for background SQLite writes (Phase 155: CYCLE-02)
     io_worker: DeferredIOWorker | None = None
@@ -721,57 +780,11 @@ def _run_maintenance(
 def _build_tuning_layers() -> list[list[tuple[str, Any]]]:
     """Build layer definitions for bottom-up tuning (SIGP-04).
 
-    Lazy-imports tuning strategy modules.
+    Lazy-imports the layer table (and through it the strategy modules).
     """
-    from wanctl.tuning.strategies.advanced import (
-        tune_baseline_bounds_max,
-        tune_baseline_bounds_min,
-        tune_fusion_weight,
-        tune_reflector_min_score,
-    )
-    from wanctl.tuning.strategies.congestion_thresholds import (
-        calibrate_target_bloat,
-        calibrate_warn_bloat,
-    )
-    from wanctl.tuning.strategies.response import (
-        tune_dl_factor_down,
-        tune_dl_green_required,
-        tune_dl_step_up,
-        tune_ul_factor_down,
-        tune_ul_green_required,
-        tune_ul_step_up,
-    )
-    from wanctl.tuning.strategies.signal_processing import (
-        tune_alpha_load,
-        tune_hampel_sigma,
-        tune_hampel_window,
-    )
+    from wanctl.tuning.layers import build_tuning_layers
 
-    _layer_t = list[tuple[str, Any]]
-    signal: _layer_t = [
-        ("hampel_sigma_threshold", tune_hampel_sigma),
-        ("hampel_window_size", tune_hampel_window),
-    ]
-    ewma: _layer_t = [("load_time_constant_sec", tune_alpha_load)]
-    threshold: _layer_t = [
-        ("target_bloat_ms", calibrate_target_bloat),
-        ("warn_bloat_ms", calibrate_warn_bloat),
-    ]
-    advanced: _layer_t = [
-        ("fusion_icmp_weight", tune_fusion_weight),
-        ("reflector_min_score", tune_reflector_min_score),
-        ("baseline_rtt_min", tune_baseline_bounds_min),
-        ("baseline_rtt_max", tune_baseline_bounds_max),
-    ]
-    response: _layer_t = [
-        ("dl_step_up_mbps", tune_dl_step_up),
-        ("ul_step_up_mbps", tune_ul_step_up),
-        ("dl_factor_down", tune_dl_factor_down),
-        ("ul_factor_down", tune_ul_factor_down),
-        ("dl_green_required", tune_dl_green_required),
-        ("ul_green_required", tune_ul_green_required),
-    ]
-    return [signal, ewma, threshold, advanced, response]
+    return build_tuning_layers()
 
 
 def _check_pending_reverts(
@@ -779,6 +792,7 @@ def _check_pending_reverts(
     wan_info: dict[str, Any],
     db_path: str,
     metrics_writer: Any,
+    metric_window: Any = None,
 ) -> None:
     """Check and apply pending observation reverts for a WAN controller."""
     from wanctl.tuning.applier import persist_revert_record
@@ -797,6 +811,7 @@ def _check_pending_reverts(
             wc.wan_name,
             revert_threshold=DEFAULT_REVERT_THRESHOLD,
             min_congestion_rate=DEFAULT_MIN_CONGESTION_RATE,
+            window=metric_window,
         )
         if reverts:
             _apply_tuning_to_controller(wc, reverts)
@@ -826,13 +841,16 @@ def _check_oscillation_lockout(
     wan_info: dict[str, Any],
     tuning_config: TuningConfig,
     db_path: str,
+    metric_window: Any = None,
 ) -> None:
     """Check oscillation lockout for response layer (RTUN-04)."""
     from wanctl.tuning.analyzer import _query_wan_metrics
     from wanctl.tuning.strategies.response import check_oscillation_lockout
 
     try:
-        osc_metrics = _query_wan_metrics(db_path, wc.wan_name, tuning_config.lookback_hours)
+        osc_metrics = _query_wan_metrics(
+            db_path, wc.wan_name, tuning_config.lookback_hours, metric_window
+        )
         check_oscillation_lockout(
             osc_metrics,
             wc.get_parameter_locks(),
@@ -855,6 +873,7 @@ def _analyze_and_apply_tuning(
     db_path: str,
     metrics_writer: Any,
     active_strategies: list[tuple[str, Any]],
+    metric_window: Any = None,
 ) -> None:
     """Run tuning analysis and apply results for a single WAN controller."""
     from wanctl.tuning.analyzer import run_tuning_analysis
@@ -869,6 +888,7 @@ def _analyze_and_apply_tuning(
             tuning_config=tuning_config,
             current_params=current_params,
             strategies=active_strategies,
+            metric_window=metric_window,
         )
         if results:
             applied = apply_tuning_results(results, tuning_config, metrics_writer)
@@ -885,6 +905,7 @@ def _analyze_and_apply_tuning(
                     wc.wan_name,
                     start_ts=int(time.time()) - tuning_config.cadence_sec,
                     end_ts=int(time.time()),
+                    window=metric_window,
                 )
                 if pre_rate is not None:
                     wc.set_pending_observation(
@@ -914,11 +935,13 @@ def _run_tuning_for_wan(
     db_path: str,
     metrics_writer: Any,
     all_layers: list[list[tuple[str, Any]]],
+    max_age_sec: int | None = None,
 ) -> None:
     """Run one adaptive tuning pass for a single WAN controller."""
     from wanctl.tuning.safety import is_parameter_locked
 
-    _check_pending_reverts(wc, wan_info, db_path, metrics_writer)
+    window = _get_metric_window(wc, db_path, tuning_config, max_age_sec)
+    _check_pending_reverts(wc, wan_info, db_path, metrics_writer, metric_window=window)
 
     # Select active layer via round-robin (SIGP-04)
     active_layer = all_layers[wc.tuning_layer_index % len(all_layers)]
@@ -926,7 +949,7 @@ def _run_tuning_for_wan(
 
     # Oscillation lockout for response layer (RTUN-04)
     if active_layer is all_layers[-1]:
-        _check_oscillation_lockout(wc, wan_info, tuning_config, db_path)
+        _check_oscillation_lockout(wc, wan_info, tuning_config, db_path, metric_window=window)
 
     # Filter excluded and locked parameters
     excluded = tuning_config.exclude_params
@@ -947,7 +970,13 @@ def _run_tuning_for_wan(
     )
 
     _analyze_and_apply_tuning(
-        wc, wan_info, tuning_config, db_path, metrics_writer, active_strategies
+        wc,
+        wan_info,
+        tuning_config,
+        db_path,
+        metrics_writer,
+        active_strategies,
+        metric_window=window,
     )
 
     _mark_tuning_executed(wc)
@@ -964,6 +993,22 @@ def _run_tuning_for_wan(
     )
 
 
+def _get_metric_window(
+    wc: Any,
+    db_path: str,
+    tuning_config: TuningConfig,
+    max_age_sec: int | None,
+) -> Any:
+    """Return the controller's shared MetricWindow, or None to query SQLite directly."""
+    from wanctl.tuning.metric_window import MetricWindow
+
+    get_window = getattr(wc, "get_metric_window", None)
+    if not db_path or not callable(get_window):
+        return None
+    window = get_window(db_path, tuning_config.lookback_hours, max_age_sec)
+    return window if isinstance(window, MetricWindow) else None
+
+
 def _log_excluded_params(
     wc: Any,
     wan_info: dict[str, Any],
@@ -1040,13 +1085,23 @@ def _run_adaptive_tuning(controller: "ContinuousAutoRate") -> None:
     first_config = controller.wan_controllers[0]["config"]
     storage_config = get_storage_config(first_config.data)
     db_path = storage_config.get("db_path", "")
+    # Shared metric windows only cache what storage keeps at 1m granularity
+    max_age_sec = storage_config.get("retention", {}).get("aggregate_1m_age_seconds")
     metrics_writer = controller.wan_controllers[0]["controller"].get_metrics_writer()
 
     for wan_info in controller.wan_controllers:
         wc = wan_info["controller"]
         if not wc.is_tuning_enabled:
             continue
-        _run_tuning_for_wan(wc, wan_info, tuning_config, db_path, metrics_writer, all_layers)
+        _run_tuning_for_wan(
+            wc,
+            wan_info,
+            tuning_config,
+            db_path,
+            metrics_writer,
+            all_layers,
+            max_age_sec=max_age_sec if isinstance(max_age_sec, int) else None,
+        )
 
 
 def _handle_sigusr1_reload(
@@ -1104,7 +1159,7 @@ def _save_controller_state(
 
 def _stop_background_threads(
     controller: "ContinuousAutoRate",
-    irtt_thread: IRTTThread | None,
+    irtt_thread: "IRTTThread | None",
     deadline: float,
     logger: logging.Logger,
 ) -> None:
@@ -1224,7 +1279,7 @@ def _close_metrics_writer(
 def _cleanup_daemon(
     controller: "ContinuousAutoRate",
     lock_files: list[Path],
-    irtt_thread: IRTTThread | None,
+    irtt_thread: "IRTTThread | None",
     metrics_server: Any,
     health_server: Any,
     emergency_lock_cleanup: Any,
@@ -1257,11 +1312,22 @@ def _cleanup_daemon(
         wan_info["logger"].info(f"Daemon shutdown complete ({total:.1f}s)")
 
 
+def _log_time_to_first_cycle(controller: "ContinuousAutoRate") -> None:
+    """Log process start -> first completed control cycle (startup profile)."""
+    age = read_process_age_seconds()
+    if age is None:
+        return
+    controller.wan_controllers[0]["logger"].info(
+        f"Startup stage: first cycle complete ({age:.3f}s after process start)"
+    )
+
+
 def _run_daemon_loop(
     controller: "ContinuousAutoRate",
     maintenance_conn: Any,
     maintenance_retention_config: Mapping[str, Any],
     maintenance_interval_seconds: int,
+    measurement_scheduler: MeasurementScheduler | None = None,
 ) -> None:
     """Main daemon control loop with cycle management, maintenance, and tuning."""
     consecutive_failures = 0
@@ -1269,12 +1335,18 @@ def _run_daemon_loop(
     last_maintenance = time.monotonic()
     last_tuning = time.monotonic()
     shutdown_event = get_shutdown_event()
+    first_cycle = True
 
     while not is_shutdown_requested():
         cycle_start = time.monotonic()
+        if measurement_scheduler is not None:
+            measurement_scheduler.mark_cycle(cycle_start)
 
         cycle_success = controller.run_cycle(use_lock=False)  # Lock already held
         elapsed = time.monotonic() - cycle_start
+        if first_cycle:
+            _log_time_to_first_cycle(controller)
+            first_cycle = False
 
         consecutive_failures, watchdog_enabled = _track_cycle_failures(
             controller, cycle_success, consecutive_failures, watchdog_enabled
@@ -1391,8 +1463,9 @@ def main() -> int | None:
         controller.wan_controllers[0]["logger"].info(
             "Startup stage: metrics/health servers started"
         )
-        irtt_thread = _start_irtt_thread(controller)
-        io_worker = _setup_daemon_state(controller, irtt_thread)
+        measurement_scheduler = _build_measurement_scheduler(controller)
+        irtt_thread = _start_irtt_thread(controller, measurement_scheduler)
+        io_worker = _setup_daemon_state(controller, irtt_thread, measurement_scheduler)
 
     try:
         _run_daemon_loop(
@@ -1400,6 +1473,7 @@ def main() -> int | None:
             maintenance_conn,
             maintenance_retention_config,
             maintenance_interval_seconds,
+            measurement_scheduler,
         )
     finally:
         _cleanup_daemon(
@@ -28,6 +28,7 @@ import time
 from typing import TYPE_CHECKING, Any
 
 from wanctl.backends.base import RouterBackend
+from wanctl.cake_signal import CakeTinStats
 
 if TYPE_CHECKING:
     from wanctl.config_base import BaseConfig
@@ -231,7 +232,8 @@ class LinuxCakeBackend(RouterBackend):
         """Get CAKE qdisc statistics with per-tin parsing.
 
         Returns a superset dict compatible with existing consumers (5 base fields)
-        plus extended CAKE fields (tins, memory, ecn, capacity).
+        plus extended CAKE fields (tins, memory, ecn, capacity). ``tin_stats``
+        carries the per-tin counters as a CakeTinStats for CakeSignalProcessor.
 
         Args:
             queue: Ignored for linux-cake (interface set at init). Kept for ABC compat.
@@ -288,6 +290,7 @@ class LinuxCakeBackend(RouterBackend):
             tins.append(tin_stats)
 
         stats["tins"] = tins
+        stats["tin_stats"] = CakeTinStats.from_dicts(tins)
         stats["ecn_marked"] = total_ecn
 
         return stats
@@ -340,6 +343,19 @@ class LinuxCakeBackend(RouterBackend):
 
         return True
 
+    def get_transport_stats(self) -> dict[str, Any]:
+        """Return transport counters for the health endpoint.
+
+        Every operation on this backend is a tc subprocess call, so there is
+        no fallback to count. NetlinkCakeBackend overrides this.
+        """
+        return {
+            "transport": "tc",
+            "shared_socket": False,
+            "tc_fallbacks": 0,
+            "tc_fallbacks_by_operation": {},
+        }
+
     # =========================================================================
     # CAKE-specific methods (not in ABC)
     # =========================================================================
@@ -21,9 +21,10 @@ Usage in daemon (ContinuousAutoRate.__init__):
 
 from __future__ import annotations
 
+import concurrent.futures
 import logging
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from wanctl.backends.linux_cake import LinuxCakeBackend, LinuxHtbFqCodelBackend
 from wanctl.cake_params import build_cake_params, build_expected_readback
@@ -37,6 +38,9 @@ def _make_backend(config: BaseConfig, direction: str) -> LinuxCakeBackend:
     cake_params = config.data.get("cake_params", {})
     qdisc_mode = str(cake_params.get(f"{direction}_qdisc", "cake"))
     if qdisc_mode == "htb_fq_codel":
+        if config.router_transport == "linux-cake-netlink":
+            from wanctl.backends.netlink_cake import NetlinkHtbFqCodelBackend
+            return NetlinkHtbFqCodelBackend.from_config(config, direction=direction)
         return LinuxHtbFqCodelBackend.from_config(config, direction=direction)
     if qdisc_mode != "cake":
         raise ValueError(
@@ -84,6 +88,8 @@ class LinuxCakeAdapter:
             "autorate_router_write_skipped": 0.0,
             "autorate_router_write_fallback": 0.0,
         }
+        # Upload writer for concurrent directions (async router apply mode only)
+        self._upload_pool: concurrent.futures.ThreadPoolExecutor | None = None
 
     @property
     def needs_rate_limiting(self) -> bool:
@@ -127,6 +133,24 @@ class LinuxCakeAdapter:
             return False
         return (now - last_write_ts) < self._increase_coalesce_window_sec
 
+    def enable_concurrent_directions(self) -> None:
+        """Write download and upload on separate threads in set_limits().
+
+        Used by the async router apply writer so a slow write on one interface
+        does not delay the other. Subprocess backends run both tc processes in
+        parallel; netlink backends still serialize on the shared socket lock.
+        """
+        if self._upload_pool is None:
+            self._upload_pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="wanctl-cake-upload"
+            )
+
+    def close(self) -> None:
+        """Release the upload writer thread, if concurrent directions are enabled."""
+        if self._upload_pool is not None:
+            self._upload_pool.shutdown(wait=True)
+            self._upload_pool = None
+
     def set_limits(self, wan: str, down_bps: int, up_bps: int) -> bool:
         """Set CAKE bandwidth on both download and upload interfaces.
 
@@ -153,79 +177,18 @@ class LinuxCakeAdapter:
         dl_ok = True
         ul_ok = True
 
+        ul_future: concurrent.futures.Future[tuple[bool, str, float]] | None = None
+        if ul_changed and self._upload_pool is not None:
+            ul_future = self._upload_pool.submit(self._set_direction, wan, "upload", up_bps, now)
         if dl_changed:
-            if self._should_coalesce_increase(
-                requested_bps=down_bps,
-                last_applied_bps=self._last_set_down_bps,
-                last_write_ts=self._last_dl_write_ts,
-                threshold_bps=self._dl_increase_coalesce_bps,
-                now=now,
-            ):
-                self._last_set_limits_stats["autorate_router_write_skipped"] += 0.0
-                self.logger.debug(
-                    "%s: Coalescing small download increase on %s (%s -> %sbps)",
-                    wan,
-                    self.dl_backend.interface,
-                    self._last_set_down_bps,
-                    down_bps,
-                )
-            else:
-                start = time.perf_counter()
-                dl_ok = self.dl_backend.set_bandwidth(queue="", rate_bps=down_bps)
-                elapsed_ms = getattr(
-                    self.dl_backend,
-                    "_last_write_elapsed_ms",
-                    (time.perf_counter() - start) * 1000.0,
-                )
-                if getattr(self.dl_backend, "_last_write_used_fallback", False):
-                    self._last_set_limits_stats["autorate_router_write_fallback"] += elapsed_ms
-                elif getattr(self.dl_backend, "_last_write_skipped", False):
-                    self._last_set_limits_stats["autorate_router_write_skipped"] += elapsed_ms
-                else:
-                    self._last_set_limits_stats["autorate_router_write_download"] += elapsed_ms
-                if dl_ok:
-                    self._last_set_down_bps = self._backend_applied_rate_or_default(
-                        self.dl_backend,
-                        down_bps,
-                    )
-                    self._last_dl_write_ts = now
-
-        if ul_changed:
-            if self._should_coalesce_increase(
-                requested_bps=up_bps,
-                last_applied_bps=self._last_set_up_bps,
-                last_write_ts=self._last_ul_write_ts,
-                threshold_bps=self._ul_increase_coalesce_bps,
-                now=now,
-            ):
-                self._last_set_limits_stats["autorate_router_write_skipped"] += 0.0
-                self.logger.debug(
-                    "%s: Coalescing small upload increase on %s (%s -> %sbps)",
-                    wan,
-                    self.ul_backend.interface,
-                    self._last_set_up_bps,
-                    up_bps,
-                )
-            else:
-                start = time.perf_counter()
-                ul_ok = self.ul_backend.set_bandwidth(queue="", rate_bps=up_bps)
-                elapsed_ms = getattr(
-                    self.ul_backend,
-                    "_last_write_elapsed_ms",
-                    (time.perf_counter() - start) * 1000.0,
-                )
-                if getattr(self.ul_backend, "_last_write_used_fallback", False):
-                    self._last_set_limits_stats["autorate_router_write_fallback"] += elapsed_ms
-                elif getattr(self.ul_backend, "_last_write_skipped", False):
-                    self._last_set_limits_stats["autorate_router_write_skipped"] += elapsed_ms
-                else:
-                    self._last_set_limits_stats["autorate_router_write_upload"] += elapsed_ms
-                if ul_ok:
-                    self._last_set_up_bps = self._backend_applied_rate_or_default(
-                        self.ul_backend,
-                        up_bps,
-                    )
-                    self._last_ul_write_ts = now
+            dl_ok, stats_key, elapsed_ms = self._set_direction(wan, "download", down_bps, now)
+            self._last_set_limits_stats[stats_key] += elapsed_ms
+        if ul_future is not None:
+            ul_ok, stats_key, elapsed_ms = ul_future.result()
+            self._last_set_limits_stats[stats_key] += elapsed_ms
+        elif ul_changed:
+            ul_ok, stats_key, elapsed_ms = self._set_direction(wan, "upload", up_bps, now)
+            self._last_set_limits_stats[stats_key] += elapsed_ms
 
         if not dl_ok:
             self.logger.error(
@@ -238,6 +201,64 @@ class LinuxCakeAdapter:
 
         return dl_ok and ul_ok
 
+    def _set_direction(
+        self, wan: str, direction: str, requested_bps: int, now: float
+    ) -> tuple[bool, str, float]:
+        """Write (or coalesce) one direction's bandwidth.
+
+        Touches only that direction's state so download and upload can run on
+        different threads.
+
+        Returns:
+            (success, write stats key, elapsed_ms)
+        """
+        if direction == "download":
+            backend = self.dl_backend
+            last_bps, last_write_ts = self._last_set_down_bps, self._last_dl_write_ts
+            threshold_bps = self._dl_increase_coalesce_bps
+        else:
+            backend = self.ul_backend
+            last_bps, last_write_ts = self._last_set_up_bps, self._last_ul_write_ts
+            threshold_bps = self._ul_increase_coalesce_bps
+
+        if self._should_coalesce_increase(
+            requested_bps=requested_bps,
+            last_applied_bps=last_bps,
+            last_write_ts=last_write_ts,
+            threshold_bps=threshold_bps,
+            now=now,
+        ):
+            self.logger.debug(
+                "%s: Coalescing small %s increase on %s (%s -> %sbps)",
+                wan,
+                direction,
+                backend.interface,
+                last_bps,
+                requested_bps,
+            )
+            return True, "autorate_router_write_skipped", 0.0
+
+        start = time.perf_counter()
+        ok = backend.set_bandwidth(queue="", rate_bps=requested_bps)
+        elapsed_ms = getattr(
+            backend,
+            "_last_write_elapsed_ms",
+            (time.perf_counter() - start) * 1000.0,
+        )
+        if getattr(backend, "_last_write_used_fallback", False):
+            stats_key = "autorate_router_write_fallback"
+        elif getattr(backend, "_last_write_skipped", False):
+            stats_key = "autorate_router_write_skipped"
+        else:
+            stats_key = f"autorate_router_write_{direction}"
+        if ok:
+            applied_bps = self._backend_applied_rate_or_default(backend, requested_bps)
+            if direction == "download":
+                self._last_set_down_bps, self._last_dl_write_ts = applied_bps, now
+            else:
+                self._last_set_up_bps, self._last_ul_write_ts = applied_bps, now
+        return ok, stats_key, elapsed_ms
+
     def consume_last_set_limits_stats(self) -> dict[str, float]:
         """Return and clear the most recent per-direction write timings."""
         stats = dict(self._last_set_limits_stats)
@@ -278,6 +299,13 @@ class LinuxCakeAdapter:
         ul_stats = self.ul_backend._parse_cake_msg(msgs)
         return dl_stats, ul_stats
 
+    def get_transport_stats(self) -> dict[str, dict[str, Any]]:
+        """Return per-direction transport counters (netlink vs tc fallbacks)."""
+        return {
+            "download": self.dl_backend.get_transport_stats(),
+            "upload": self.ul_backend.get_transport_stats(),
+        }
+
     @classmethod
     def from_config(cls, config: BaseConfig, logger: logging.Logger) -> LinuxCakeAdapter:
         """Create LinuxCakeAdapter from config, initializing CAKE qdiscs.
@@ -7,6 +7,14 @@ Falls back to subprocess (via super()) on any netlink failure.
 Performance: Netlink tc call ~0.3ms vs subprocess tc ~3.1ms, reclaiming ~5ms
 per 50ms control cycle (two directions x ~2.8ms savings each).
 
+NetlinkHtbFqCodelBackend applies the same transport to HTB + fq_codel
+directions (tc class change, fq_codel stats, initialization and readback).
+
+Backends built from config share one SharedIPRoute per process for
+writes; BackgroundCakeStatsThread dumps on a separate SharedIPRoute so rate
+changes never queue behind a stats dump. Every subprocess fallback is
+counted per operation and reported via get_transport_stats().
+
 Requirements: NLNK-01, NLNK-02, NLNK-03, NLNK-04
 Optional dependency: pyroute2>=0.9.5 (install via `pip install wanctl[netlink]`)
 
@@ -23,10 +31,12 @@ Config schema:
 from __future__ import annotations
 
 import logging
+import threading
 import time
 from typing import TYPE_CHECKING, Any
 
-from wanctl.backends.linux_cake import LinuxCakeBackend
+from wanctl.backends.linux_cake import LinuxCakeBackend, LinuxHtbFqCodelBackend
+from wanctl.cake_signal import MAX_TINS, TIN_FIELD_INDEX, CakeTinStats
 
 if TYPE_CHECKING:
     from wanctl.config_base import BaseConfig
@@ -86,6 +96,189 @@ _VALIDATE_KEY_TO_TCA: dict[str, str] = {
     "wash": "TCA_CAKE_WASH",
 }
 
+# HTB tree layout created by LinuxHtbFqCodelBackend.initialize_cake():
+# root qdisc 1: -> class 1:10 -> fq_codel leaf 10:
+_TC_H_ROOT = 0xFFFFFFFF
+_HTB_ROOT_HANDLE = 0x10000  # 1:
+_HTB_CLASS_HANDLE = 0x10010  # 1:10
+_FQ_CODEL_HANDLE = 0x100000  # 10:
+
+# tc size suffixes (tc treats "k" as KiB for burst/limit sizes).
+_SIZE_MULTIPLIERS: dict[str, int] = {
+    "kb": 1024,
+    "mb": 1024**2,
+    "gb": 1024**3,
+    "k": 1024,
+    "m": 1024**2,
+    "g": 1024**3,
+    "b": 1,
+}
+
+
+def _parse_size_bytes(value: str | int) -> int:
+    """Convert a tc size string ("256k", "1mb", "1500") to bytes."""
+    raw = str(value).lower().strip()
+    for suffix, mult in _SIZE_MULTIPLIERS.items():
+        if raw.endswith(suffix):
+            return int(raw[: -len(suffix)]) * mult
+    return int(raw)
+
+
+def _stat_value(section: Any, key: str) -> Any:
+    """Read a field from a TCA_STATS2 section (dict or nla object)."""
+    if isinstance(section, dict):
+        return section.get(key, 0)
+    return getattr(section, key, 0)
+
+
+def _base_stats(stats2: Any) -> dict[str, Any]:
+    """Extract the 5 base qdisc counters from a TCA_STATS2 attribute."""
+    basic = stats2.get_attr("TCA_STATS_BASIC") or {}
+    queue_stats = stats2.get_attr("TCA_STATS_QUEUE") or {}
+    return {
+        "packets": _stat_value(basic, "packets"),
+        "bytes": _stat_value(basic, "bytes"),
+        "dropped": _stat_value(queue_stats, "drops"),
+        "queued_packets": _stat_value(queue_stats, "qlen"),
+        "queued_bytes": _stat_value(queue_stats, "backlog"),
+    }
+
+
+def _tin_column(field: str) -> int:
+    return TIN_FIELD_INDEX[field] * MAX_TINS
+
+
+# Per-tin netlink attribute -> CakeTinStats column (offset into .values)
+_TIN_ATTR_COLUMN: dict[str, int] = {
+    "TCA_CAKE_TIN_STATS_SENT_BYTES64": _tin_column("sent_bytes"),
+    "TCA_CAKE_TIN_STATS_SENT_PACKETS": _tin_column("sent_packets"),
+    "TCA_CAKE_TIN_STATS_DROPPED_PACKETS": _tin_column("dropped_packets"),
+    "TCA_CAKE_TIN_STATS_ECN_MARKED_PACKETS": _tin_column("ecn_marked_packets"),
+    "TCA_CAKE_TIN_STATS_BACKLOG_BYTES": _tin_column("backlog_bytes"),
+    "TCA_CAKE_TIN_STATS_PEAK_DELAY_US": _tin_column("peak_delay_us"),
+    "TCA_CAKE_TIN_STATS_AVG_DELAY_US": _tin_column("avg_delay_us"),
+    "TCA_CAKE_TIN_STATS_BASE_DELAY_US": _tin_column("base_delay_us"),
+    "TCA_CAKE_TIN_STATS_SPARSE_FLOWS": _tin_column("sparse_flows"),
+    "TCA_CAKE_TIN_STATS_BULK_FLOWS": _tin_column("bulk_flows"),
+    "TCA_CAKE_TIN_STATS_UNRESPONSIVE_FLOWS": _tin_column("unresponsive_flows"),
+}
+
+
+def _fill_tin_stats(tin_stats: CakeTinStats, tins_container: Any) -> None:
+    """Copy TCA_CAKE_TIN_STATS_1.._8 into tin_stats columns.
+
+    pyroute2 nla objects keep their attributes as an ``attrs`` list, and
+    get_attr() scans that list on every call, so each tin's list is walked
+    once and mapped by name instead of doing 11 lookups per tin. Objects
+    without an ``attrs`` list fall back to get_attr().
+    """
+    values = tin_stats.values
+    for i in range(MAX_TINS):
+        tin = tins_container.get_attr(f"TCA_CAKE_TIN_STATS_{i + 1}")  # tins are 1-indexed
+        if tin is None:
+            break
+        attrs = tin.get("attrs") if isinstance(tin, dict) else None
+        if attrs is not None:
+            for attr in attrs:
+                column = _TIN_ATTR_COLUMN.get(attr[0])
+                if column is not None:
+                    values[column + i] = attr[1] or 0
+        else:
+            for name, column in _TIN_ATTR_COLUMN.items():
+                values[column + i] = tin.get_attr(name) or 0
+        tin_stats.count = i + 1
+
+
+class SharedIPRoute:
+    """Persistent IPRoute shared by several backends.
+
+    shared_iproute() returns the process-wide instance used by the writers;
+    BackgroundCakeStatsThread owns a second instance for its dumps, so a
+    7-20ms dump never holds the lock a set_bandwidth request needs.
+
+    A pyroute2 socket must not carry two requests at once, so every call is
+    serialized by a lock. Dump responses are materialized inside the lock so
+    a lazy response iterator never reads the socket unguarded.
+
+    The underlying IPRoute is opened on first use and re-opened after
+    close(). Backends never close it themselves: their _reset_ipr() calls
+    invalidate(), so a failed request drops the socket once for every user.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._ipr: Any = None
+        self.opens = 0
+        # Value of opens when a request last failed on the socket
+        self._failed_open = 0
+
+    def _ensure(self) -> Any:
+        if not _pyroute2_available:
+            raise ImportError("pyroute2 not installed")
+        if self._ipr is None:
+            self._ipr = IPRoute(groups=0)
+            self.opens += 1
+        return self._ipr
+
+    def tc(self, *args: Any, **kwargs: Any) -> Any:
+        """Run one IPRoute.tc() request under the socket lock."""
+        with self._lock:
+            ipr = self._ensure()
+            try:
+                result = ipr.tc(*args, **kwargs)
+                if result is not None and not isinstance(result, (list, tuple)):
+                    result = list(result)
+            except Exception:
+                self._failed_open = self.opens
+                raise
+            return result
+
+    def link_lookup(self, **kwargs: Any) -> list[int]:
+        """Resolve interface indices under the socket lock."""
+        with self._lock:
+            ipr = self._ensure()
+            try:
+                return list(ipr.link_lookup(**kwargs))
+            except Exception:
+                self._failed_open = self.opens
+                raise
+
+    def invalidate(self) -> None:
+        """Close the socket if its last request failed; the next request re-opens it.
+
+        Every backend that saw the failure calls this. Only the first call
+        closes the socket: once a request has re-opened it, resets left over
+        from the old failure do not touch the new socket.
+        """
+        with self._lock:
+            if self._ipr is not None and self._failed_open == self.opens:
+                try:
+                    self._ipr.close()
+                finally:
+                    self._ipr = None
+
+    def close(self) -> None:
+        """Close the underlying socket; the next request re-opens it."""
+        with self._lock:
+            if self._ipr is not None:
+                try:
+                    self._ipr.close()
+                finally:
+                    self._ipr = None
+
+
+_shared_iproute: SharedIPRoute | None = None
+_shared_iproute_lock = threading.Lock()
+
+
+def shared_iproute() -> SharedIPRoute:
+    """Return the process-wide SharedIPRoute, creating it on first use."""
+    global _shared_iproute
+    with _shared_iproute_lock:
+        if _shared_iproute is None:
+            _shared_iproute = SharedIPRoute()
+        return _shared_iproute
+
 
 class NetlinkCakeBackend(LinuxCakeBackend):
     """CAKE backend using pyroute2 netlink instead of subprocess tc.
@@ -96,7 +289,8 @@ class NetlinkCakeBackend(LinuxCakeBackend):
 
     Singleton IPRoute instance persists across calls for daemon lifetime.
     When the netlink socket dies, the reference is nulled and re-created
-    on the next call.
+    on the next call. When a SharedIPRoute is passed in, it is used instead
+    of a private IPRoute so all backends in the process share one socket.
     """
 
     def __init__(
@@ -104,6 +298,7 @@ class NetlinkCakeBackend(LinuxCakeBackend):
         interface: str,
         logger: logging.Logger | None = None,
         tc_timeout: float = 5.0,
+        iproute: SharedIPRoute | None = None,
     ):
         """Initialize NetlinkCakeBackend.
 
@@ -111,12 +306,15 @@ class NetlinkCakeBackend(LinuxCakeBackend):
             interface: Network interface name (e.g., "eth0", "br-wan-dl")
             logger: Logger instance. If None, creates a default logger.
             tc_timeout: Default timeout for subprocess tc fallback commands.
+            iproute: Shared netlink socket. If None, a private IPRoute is used.
         """
         super().__init__(interface=interface, logger=logger, tc_timeout=tc_timeout)
         self._ipr: Any = (
             None  # IPRoute | None -- Any to avoid type errors when pyroute2 absent
         )
+        self._shared_ipr = iproute
         self._ifindex: int | None = None
+        self._tc_fallbacks: dict[str, int] = {}
         self._last_apply_started_monotonic: float | None = None
         self._last_apply_finished_monotonic: float | None = None
         self._last_apply_was_kernel_write: bool = False
@@ -137,24 +335,53 @@ class NetlinkCakeBackend(LinuxCakeBackend):
         if not _pyroute2_available:
             raise ImportError("pyroute2 not installed")
         if self._ipr is None:
-            self._ipr = IPRoute(groups=0)
+            if self._shared_ipr is not None:
+                self._ipr = self._shared_ipr
+            else:
+                self._ipr = IPRoute(groups=0)
             indices = self._ipr.link_lookup(ifname=self.interface)
             if not indices:
-                self._ipr.close()
-                self._ipr = None
+                self._reset_ipr()
                 raise OSError(f"Interface {self.interface} not found")
             self._ifindex = indices[0]
         return self._ipr
 
     def _reset_ipr(self) -> None:
-        """Close and null the IPRoute reference to force reconnect on next call."""
+        """Null the IPRoute reference to force reconnect on next call.
+
+        A private IPRoute is closed here. A shared one is only invalidated
+        through its SharedIPRoute, which closes it at most once per failure
+        and leaves a healthy socket to the other backends.
+        """
         if self._ipr is not None:
             try:
-                self._ipr.close()
+                if self._shared_ipr is not None:
+                    self._shared_ipr.invalidate()
+                else:
+                    self._ipr.close()
             except Exception as e:
                 self.logger.debug("Failed to close IPRoute during reset: %s", e)
             self._ipr = None
 
+    def _record_tc_fallback(self, operation: str) -> None:
+        """Count one subprocess tc fallback for an operation."""
+        self._tc_fallbacks[operation] = self._tc_fallbacks.get(operation, 0) + 1
+
+    @property
+    def tc_fallback_count(self) -> int:
+        """Total subprocess tc fallbacks since startup."""
+        return sum(self._tc_fallbacks.values())
+
+    def get_transport_stats(self) -> dict[str, Any]:
+        """Return netlink transport counters for the health endpoint."""
+        return {
+            "transport": "netlink",
+            "shared_socket": self._shared_ipr is not None,
+            "socket_opens": self._shared_ipr.opens if self._shared_ipr is not None else None,
+            "tc_fallbacks": self.tc_fallback_count,
+            "tc_fallbacks_by_operation": dict(self._tc_fallbacks),
+        }
+
     # =========================================================================
     # Overridden methods with netlink + fallback
     # =========================================================================
@@ -214,6 +441,7 @@ class NetlinkCakeBackend(LinuxCakeBackend):
                 e,
             )
             self._reset_ipr()
+            self._record_tc_fallback("set_bandwidth")
             result = super().set_bandwidth(queue, rate_bps)
             self._last_apply_started_monotonic = apply_start_mono or apply_finish_mono
             self._last_apply_finished_monotonic = apply_finish_mono
@@ -252,6 +480,7 @@ class NetlinkCakeBackend(LinuxCakeBackend):
                 e,
             )
             self._reset_ipr()
+            self._record_tc_fallback("get_bandwidth")
             return super().get_bandwidth(queue)
 
     def get_queue_stats(self, queue: str) -> dict[str, Any] | None:
@@ -262,6 +491,7 @@ class NetlinkCakeBackend(LinuxCakeBackend):
         - 5 base fields: packets, bytes, dropped, queued_packets, queued_bytes
         - 4 extended fields: memory_used, memory_limit, capacity_estimate, ecn_marked
         - tins list: per-tin dicts with 11 fields each
+        - tin_stats: the same per-tin counters as a CakeTinStats
 
         Falls back to subprocess on NetlinkError/OSError/ImportError.
 
@@ -281,6 +511,7 @@ class NetlinkCakeBackend(LinuxCakeBackend):
                 e,
             )
             self._reset_ipr()
+            self._record_tc_fallback("get_queue_stats")
             return super().get_queue_stats(queue)
 
         result = self._parse_cake_msg(
@@ -288,6 +519,7 @@ class NetlinkCakeBackend(LinuxCakeBackend):
         )  # dump already filtered by index
         if result is None:
             self._reset_ipr()
+            self._record_tc_fallback("get_queue_stats")
             return super().get_queue_stats(queue)
         return result
 
@@ -322,36 +554,7 @@ class NetlinkCakeBackend(LinuxCakeBackend):
         if stats2 is None:
             return None
 
-        basic = stats2.get_attr("TCA_STATS_BASIC") or {}
-        queue_stats = stats2.get_attr("TCA_STATS_QUEUE") or {}
-
-        stats: dict[str, Any] = {
-            "packets": (
-                basic.get("packets", 0)
-                if isinstance(basic, dict)
-                else getattr(basic, "packets", 0)
-            ),
-            "bytes": (
-                basic.get("bytes", 0)
-                if isinstance(basic, dict)
-                else getattr(basic, "bytes", 0)
-            ),
-            "dropped": (
-                queue_stats.get("drops", 0)
-                if isinstance(queue_stats, dict)
-                else getattr(queue_stats, "drops", 0)
-            ),
-            "queued_packets": (
-                queue_stats.get("qlen", 0)
-                if isinstance(queue_stats, dict)
-                else getattr(queue_stats, "qlen", 0)
-            ),
-            "queued_bytes": (
-                queue_stats.get("backlog", 0)
-                if isinstance(queue_stats, dict)
-                else getattr(queue_stats, "backlog", 0)
-            ),
-        }
+        stats: dict[str, Any] = _base_stats(stats2)
 
         app = stats2.get_attr("TCA_STATS_APP")
         if app is not None:
@@ -365,58 +568,15 @@ class NetlinkCakeBackend(LinuxCakeBackend):
             stats["memory_limit"] = 0
             stats["capacity_estimate"] = 0
 
-        tins: list[dict[str, Any]] = []
-        total_ecn = 0
+        tin_stats = CakeTinStats()
         if app is not None:
             tins_container = app.get_attr("TCA_CAKE_STATS_TIN_STATS")
             if tins_container is not None:
-                for i in range(
-                    1, 9
-                ):  # tins are 1-indexed: TCA_CAKE_TIN_STATS_1 through _8
-                    tin = tins_container.get_attr(f"TCA_CAKE_TIN_STATS_{i}")
-                    if tin is None:
-                        break
-                    tin_stats: dict[str, Any] = {
-                        "sent_bytes": tin.get_attr("TCA_CAKE_TIN_STATS_SENT_BYTES64")
-                        or 0,
-                        "sent_packets": tin.get_attr("TCA_CAKE_TIN_STATS_SENT_PACKETS")
-                        or 0,
-                        "dropped_packets": tin.get_attr(
-                            "TCA_CAKE_TIN_STATS_DROPPED_PACKETS"
-                        )
-                        or 0,
-                        "ecn_marked_packets": tin.get_attr(
-                            "TCA_CAKE_TIN_STATS_ECN_MARKED_PACKETS"
-                        )
-                        or 0,
-                        "backlog_bytes": tin.get_attr(
-                            "TCA_CAKE_TIN_STATS_BACKLOG_BYTES"
-                        )
-                        or 0,
-                        "peak_delay_us": tin.get_attr(
-                            "TCA_CAKE_TIN_STATS_PEAK_DELAY_US"
-                        )
-                        or 0,
-                        "avg_delay_us": tin.get_attr("TCA_CAKE_TIN_STATS_AVG_DELAY_US")
-                        or 0,
-                        "base_delay_us": tin.get_attr(
-                            "TCA_CAKE_TIN_STATS_BASE_DELAY_US"
-                        )
-                        or 0,
-                        "sparse_flows": tin.get_attr("TCA_CAKE_TIN_STATS_SPARSE_FLOWS")
-                        or 0,
-                        "bulk_flows": tin.get_attr("TCA_CAKE_TIN_STATS_BULK_FLOWS")
-                        or 0,
-                        "unresponsive_flows": tin.get_attr(
-                            "TCA_CAKE_TIN_STATS_UNRESPONSIVE_FLOWS"
-                        )
-                        or 0,
-                    }
-                    total_ecn += tin_stats["ecn_marked_packets"]
-                    tins.append(tin_stats)
-
-        stats["tins"] = tins
-        stats["ecn_marked"] = total_ecn
+                _fill_tin_stats(tin_stats, tins_container)
+
+        stats["tin_stats"] = tin_stats
+        stats["tins"] = tin_stats.to_dicts()
+        stats["ecn_marked"] = tin_stats.total("ecn_marked_packets")
         return stats
 
     def initialize_cake(self, params: dict[str, Any]) -> bool:  # noqa: C901
@@ -454,6 +614,7 @@ class NetlinkCakeBackend(LinuxCakeBackend):
                 # the kernel expects specific netlink attrs that pyroute2 doesn't set.
                 # Fall back to subprocess tc for initialization (one-time at startup).
                 # Netlink is still used for the hot path (set_bandwidth, get_queue_stats).
+                self._record_tc_fallback("initialize_cake")
                 return super().initialize_cake(params)
             if "overhead" in params:
                 kwargs["overhead"] = int(params["overhead"])
@@ -513,6 +674,7 @@ class NetlinkCakeBackend(LinuxCakeBackend):
                 e,
             )
             self._reset_ipr()
+            self._record_tc_fallback("initialize_cake")
             return super().initialize_cake(params)
 
     def validate_cake(self, expected: dict[str, Any]) -> bool:
@@ -590,6 +752,7 @@ class NetlinkCakeBackend(LinuxCakeBackend):
                 e,
             )
             self._reset_ipr()
+            self._record_tc_fallback("validate_cake")
             return super().validate_cake(expected)
 
     def test_connection(self) -> bool:
@@ -613,19 +776,21 @@ class NetlinkCakeBackend(LinuxCakeBackend):
                 e,
             )
             self._reset_ipr()
+            self._record_tc_fallback("test_connection")
             return super().test_connection()
 
     def close(self) -> None:
         """Release IPRoute resources.
 
-        Safe to call when no IPRoute exists (no-op).
+        Safe to call when no IPRoute exists (no-op). A shared IPRoute is left
+        open for the other backends; its owner closes it.
         """
-        if self._ipr is not None:
+        if self._ipr is not None and self._shared_ipr is None:
             try:
                 self._ipr.close()
             except Exception as e:
                 self.logger.debug("Failed to close IPRoute: %s", e)
-            self._ipr = None
+        self._ipr = None
 
     @classmethod
     def from_config(
@@ -633,7 +798,8 @@ class NetlinkCakeBackend(LinuxCakeBackend):
     ) -> NetlinkCakeBackend:
         """Create NetlinkCakeBackend from config object.
 
-        Same logic as LinuxCakeBackend.from_config but returns NetlinkCakeBackend.
+        Same logic as LinuxCakeBackend.from_config but returns NetlinkCakeBackend
+        bound to the process-wide SharedIPRoute.
 
         Args:
             config: Configuration object with .data dict containing cake_params.
@@ -653,4 +819,237 @@ class NetlinkCakeBackend(LinuxCakeBackend):
                 f"cake_params.{interface_key} required for linux-cake-netlink transport"
             )
         tc_timeout = config.data.get("timeouts", {}).get("tc_command", 5.0)
-        return cls(interface=interface, tc_timeout=tc_timeout)
+        return cls(interface=interface, tc_timeout=tc_timeout, iproute=shared_iproute())
+
+
+class NetlinkHtbFqCodelBackend(NetlinkCakeBackend, LinuxHtbFqCodelBackend):
+    """HTB + fq_codel backend using pyroute2 netlink instead of subprocess tc.
+
+    Reuses the NetlinkCakeBackend socket lifecycle and fallback counters;
+    the HTB/fq_codel operations fall back to LinuxHtbFqCodelBackend (tc
+    subprocess) on NetlinkError/OSError/ImportError.
+
+    Owns the tree root 1: -> class 1:10 -> fq_codel 10:, same layout as
+    the subprocess backend, so either transport can re-initialize it.
+    """
+
+    def set_bandwidth(self, queue: str, rate_bps: int) -> bool:
+        """Set HTB class rate/ceil via netlink change-class. Falls back on failure."""
+        start = time.perf_counter()
+        rate_kbit = rate_bps // 1000
+        applied_rate_bps = rate_kbit * 1000
+        if applied_rate_bps == self._last_bandwidth_bps:
+            self._last_write_elapsed_ms = (time.perf_counter() - start) * 1000.0
+            self._last_write_skipped = True
+            self._last_write_used_fallback = False
+            self.logger.debug(
+                "Netlink: skipping no-op HTB bandwidth update on %s: %sbps",
+                self.interface,
+                applied_rate_bps,
+            )
+            return True
+
+        burst = _parse_size_bytes(self._htb_burst)
+        try:
+            ipr = self._get_ipr()
+            ipr.tc(
+                "change-class",
+                kind="htb",
+                index=self._ifindex,
+                handle=_HTB_CLASS_HANDLE,
+                parent=_HTB_ROOT_HANDLE,
+                rate=f"{rate_kbit}kbit",
+                ceil=f"{rate_kbit}kbit",
+                burst=burst,
+                cburst=burst,
+            )
+        except (NetlinkError, OSError, ImportError) as e:
+            self.logger.warning(
+                "Netlink HTB class change failed on %s: %s -- falling back to subprocess",
+                self.interface,
+                e,
+            )
+            self._reset_ipr()
+            self._record_tc_fallback("set_bandwidth")
+            result = LinuxHtbFqCodelBackend.set_bandwidth(self, queue, rate_bps)
+            self._last_write_elapsed_ms = (time.perf_counter() - start) * 1000.0
+            self._last_write_used_fallback = True
+            return result
+
+        self._last_bandwidth_bps = applied_rate_bps
+        self._last_write_elapsed_ms = (time.perf_counter() - start) * 1000.0
+        self._last_write_skipped = False
+        self._last_write_used_fallback = False
+        self.logger.debug("Netlink: set %s HTB bandwidth to %skbit", self.interface, rate_kbit)
+        return True
+
+    def get_queue_stats(self, queue: str) -> dict[str, Any] | None:
+        """Return base fq_codel stats via netlink. Falls back on failure."""
+        try:
+            ipr = self._get_ipr()
+            msgs = ipr.tc("dump", index=self._ifindex)
+        except (NetlinkError, OSError, ImportError) as e:
+            self.logger.warning(
+                "Netlink stats dump failed on %s: %s -- falling back to subprocess",
+                self.interface,
+                e,
+            )
+            self._reset_ipr()
+            self._record_tc_fallback("get_queue_stats")
+            return LinuxHtbFqCodelBackend.get_queue_stats(self, queue)
+
+        stats = self._parse_cake_msg(msgs, filter_ifindex=False)
+        if stats is None:
+            # Same contract as the subprocess backend: zeros when no leaf yet.
+            return {
+                "packets": 0,
+                "bytes": 0,
+                "dropped": 0,
+                "queued_packets": 0,
+                "queued_bytes": 0,
+                "tins": [],
+            }
+        return stats
+
+    def _parse_cake_msg(self, msgs: list, filter_ifindex: bool = True) -> dict[str, Any] | None:
+        """Parse fq_codel leaf stats from a tc dump message list.
+
+        HTB directions have no CAKE qdisc. Overriding the CAKE parser lets the
+        shared single-dump readers (LinuxCakeAdapter.get_both_queue_stats and
+        BackgroundCakeStatsThread, which builds this class for HTB directions)
+        handle both backend kinds unchanged.
+
+        Returns:
+            Base stats with an empty tins list, or None if no fq_codel found.
+        """
+        for msg in msgs:
+            if msg.get_attr("TCA_KIND") != "fq_codel":
+                continue
+            if filter_ifindex and msg.get("index", 0) != self._ifindex:
+                continue
+            stats2 = msg.get_attr("TCA_STATS2")
+            if stats2 is None:
+                return None
+            stats = _base_stats(stats2)
+            stats["tins"] = []
+            return stats
+        return None
+
+    def initialize_cake(self, params: dict[str, Any]) -> bool:
+        """Initialize HTB root, shaped class and fq_codel leaf via netlink.
+
+        Mirrors LinuxHtbFqCodelBackend.initialize_cake(): the old root is
+        deleted first (missing root is fine), then the tree is replaced.
+        Falls back to the subprocess sequence on failure.
+        """
+        bandwidth = str(params.get("bandwidth", "100000kbit"))
+        burst = str(params.get("htb_burst", "256k"))
+        self._htb_burst = burst
+        fq_target = str(params.get("fq_codel_target", "5ms"))
+        fq_interval = str(params.get("fq_codel_interval", "100ms"))
+        try:
+            ipr = self._get_ipr()
+            try:
+                ipr.tc("del", index=self._ifindex, parent=_TC_H_ROOT)
+            except NetlinkError as e:
+                self.logger.debug("Netlink: no root qdisc to delete on %s: %s", self.interface, e)
+            ipr.tc(
+                "replace",
+                kind="htb",
+                index=self._ifindex,
+                handle=_HTB_ROOT_HANDLE,
+                parent=_TC_H_ROOT,
+                default=0x10,
+            )
+            burst_bytes = _parse_size_bytes(burst)
+            ipr.tc(
+                "replace-class",
+                kind="htb",
+                index=self._ifindex,
+                handle=_HTB_CLASS_HANDLE,
+                parent=_HTB_ROOT_HANDLE,
+                rate=bandwidth,
+                ceil=bandwidth,
+                burst=burst_bytes,
+                cburst=burst_bytes,
+            )
+            ipr.tc(
+                "replace",
+                kind="fq_codel",
+                index=self._ifindex,
+                handle=_FQ_CODEL_HANDLE,
+                parent=_HTB_CLASS_HANDLE,
+                fqc_target=fq_target,
+                fqc_interval=fq_interval,
+            )
+        except (NetlinkError, OSError, ImportError) as e:
+            self.logger.warning(
+                "Netlink HTB/fq_codel init failed on %s: %s -- falling back to subprocess",
+                self.interface,
+                e,
+            )
+            self._reset_ipr()
+            self._record_tc_fallback("initialize_cake")
+            return LinuxHtbFqCodelBackend.initialize_cake(self, params)
+
+        if bandwidth.endswith("kbit"):
+            self._last_bandwidth_bps = int(bandwidth[:-4]) * 1000
+        self.logger.info(
+            "Netlink: initialized HTB/fq_codel on %s: bandwidth=%s", self.interface, bandwidth
+        )
+        return True
+
+    def validate_cake(self, expected: dict[str, Any]) -> bool:
+        """Verify the HTB class and fq_codel leaf exist via netlink readback.
+
+        CAKE readback keys do not apply to HTB/fq_codel, so ``expected`` is
+        ignored; the check is structural. Falls back to the subprocess
+        backend (which trusts initialization) on netlink failure.
+        """
+        try:
+            ipr = self._get_ipr()
+            classes = ipr.tc("dump-class", index=self._ifindex)
+            qdiscs = ipr.tc("dump", index=self._ifindex)
+        except (NetlinkError, OSError, ImportError) as e:
+            self.logger.warning(
+                "Netlink validate failed on %s: %s -- falling back to subprocess",
+                self.interface,
+                e,
+            )
+            self._reset_ipr()
+            self._record_tc_fallback("validate_cake")
+            return LinuxHtbFqCodelBackend.validate_cake(self, expected)
+
+        has_class = any(
+            msg.get_attr("TCA_KIND") == "htb" and msg.get("handle") == _HTB_CLASS_HANDLE
+            for msg in classes or []
+        )
+        has_leaf = any(msg.get_attr("TCA_KIND") == "fq_codel" for msg in qdiscs or [])
+        if not (has_class and has_leaf):
+            self.logger.error(
+                "HTB/fq_codel readback failed on %s: class 1:10=%s fq_codel=%s",
+                self.interface,
+                has_class,
+                has_leaf,
+            )
+            return False
+        return True
+
+    def test_connection(self) -> bool:
+        """Test connectivity by checking for the fq_codel leaf via netlink."""
+        try:
+            ipr = self._get_ipr()
+            msgs = ipr.tc("dump", index=self._ifindex)
+        except (NetlinkError, OSError, ImportError) as e:
+            self.logger.warning(
+                "Netlink test_connection failed on %s: %s -- falling back to subprocess",
+                self.interface,
+                e,
+            )
+            self._reset_ipr()
+            self._record_tc_fallback("test_connection")
+            return LinuxHtbFqCodelBackend.test_connection(self)
+        if any(msg.get_attr("TCA_KIND") == "fq_codel" for msg in msgs or []):
+            return True
+        self.logger.error("No fq_codel qdisc found on %s via netlink", self.interface)
+        return False
@@ -28,7 +28,6 @@ from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 
-from wanctl.benchmark_compare import run_compare, run_history
 from wanctl.history import parse_duration, parse_timestamp
 from wanctl.lock_utils import is_process_alive, read_lock_pid
 from wanctl.rtt_measurement import parse_ping_output
@@ -693,10 +692,14 @@ def main() -> int:
     parser = create_parser()
     args = parser.parse_args()
 
-    # Route subcommands
+    # Route subcommands (imported here so a bare benchmark run skips them)
     if args.command == "compare":
+        from wanctl.benchmark_compare import run_compare
+
         return run_compare(args)
     if args.command == "history":
+        from wanctl.benchmark_compare import run_history
+
         return run_history(args)
 
     # Bare invocation: run benchmark
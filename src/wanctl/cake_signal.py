@@ -5,7 +5,7 @@ smoothed signals via EWMA. These signals augment the primary RTT-based
 congestion detection with queue-level observability.
 
 Signal flow:
-    NetlinkCakeBackend.get_queue_stats() -> raw dict
+    NetlinkCakeBackend.get_queue_stats() -> raw dict (per-tin CakeTinStats)
         -> CakeSignalProcessor.update() -> CakeSignalSnapshot
             -> stored on WANController._dl_cake_snapshot / _ul_cake_snapshot
             -> exposed via get_health_data() for monitoring
@@ -27,8 +27,10 @@ Requirements: CAKE-01, CAKE-02, CAKE-03
 
 from __future__ import annotations
 
+from array import array
+from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, overload
 
 # Unsigned 32-bit max for counter wrapping.
 U32_MAX = 0xFFFFFFFF
@@ -86,6 +88,89 @@ def _active_tin_indices(tin_count: int) -> range:
     return range(tin_count)
 
 
+# CAKE supports at most 8 tins (diffserv8).
+MAX_TINS = 8
+
+# Per-tin counter fields, in column order. Matches the keys of the per-tin
+# dicts in get_queue_stats()["tins"].
+TIN_FIELDS: tuple[str, ...] = (
+    "sent_bytes",
+    "sent_packets",
+    "dropped_packets",
+    "ecn_marked_packets",
+    "backlog_bytes",
+    "peak_delay_us",
+    "avg_delay_us",
+    "base_delay_us",
+    "sparse_flows",
+    "bulk_flows",
+    "unresponsive_flows",
+)
+TIN_FIELD_INDEX: dict[str, int] = {name: i for i, name in enumerate(TIN_FIELDS)}
+
+# Offsets of the columns CakeSignalProcessor reads in CakeTinStats.values
+_DROPPED = TIN_FIELD_INDEX["dropped_packets"] * MAX_TINS
+_ECN_MARKED = TIN_FIELD_INDEX["ecn_marked_packets"] * MAX_TINS
+_BACKLOG = TIN_FIELD_INDEX["backlog_bytes"] * MAX_TINS
+_PEAK_DELAY = TIN_FIELD_INDEX["peak_delay_us"] * MAX_TINS
+_AVG_DELAY = TIN_FIELD_INDEX["avg_delay_us"] * MAX_TINS
+_BASE_DELAY = TIN_FIELD_INDEX["base_delay_us"] * MAX_TINS
+
+_ZERO_COLUMN = array("Q", bytes(8 * MAX_TINS))
+_ZERO_BLOCK = array("Q", bytes(8 * MAX_TINS * len(TIN_FIELDS)))
+
+_DEFAULT_TIN_NAMES = ("Bulk", "BestEffort", "Video", "Voice")
+_BESTEFFORT_TIN_NAMES = ("BestEffort",)
+
+
+class CakeTinStats:
+    """Fixed-layout per-tin CAKE counters in one flat array.
+
+    Struct-of-arrays across MAX_TINS tins: field ``j`` (TIN_FIELDS order) of
+    tin ``i`` is ``values[j * MAX_TINS + i]``, so each field is a contiguous
+    column. Only the first ``count`` tins are valid. NetlinkCakeBackend fills
+    one directly from the netlink attributes so CakeSignalProcessor reads
+    columns instead of per-tin dicts.
+
+    Treat as immutable once filled: the processor keeps a reference to the
+    previous cycle's stats instead of copying its drop counters, and
+    snapshots read the values from other threads.
+    """
+
+    __slots__ = ("count", "values")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.values = array("Q", _ZERO_BLOCK)
+
+    @classmethod
+    def from_dicts(cls, tins: Iterable[Mapping[str, Any]]) -> CakeTinStats:
+        """Build from get_queue_stats()-style per-tin dicts (missing keys read as 0)."""
+        stats = cls()
+        values = stats.values
+        for i, tin in enumerate(tins):
+            if i >= MAX_TINS:
+                break
+            for j, name in enumerate(TIN_FIELDS):
+                values[j * MAX_TINS + i] = tin.get(name) or 0
+            stats.count = i + 1
+        return stats
+
+    def column(self, name: str) -> array[int]:
+        """Return one field across the valid tins."""
+        start = TIN_FIELD_INDEX[name] * MAX_TINS
+        return self.values[start : start + self.count]
+
+    def total(self, name: str) -> int:
+        """Sum one field across the valid tins."""
+        return sum(self.column(name))
+
+    def to_dicts(self) -> list[dict[str, int]]:
+        """Materialize the get_queue_stats()["tins"] list of per-tin dicts."""
+        values = self.values
+        return [dict(zip(TIN_FIELDS, values[i::MAX_TINS], strict=True)) for i in range(self.count)]
+
+
 @dataclass(frozen=True, slots=True)
 class TinSnapshot:
     """Immutable per-tin statistics snapshot for one cycle.
@@ -113,6 +198,65 @@ class TinSnapshot:
     delay_delta_us: int = 0
 
 
+class TinSnapshotView(Sequence[TinSnapshot]):
+    """Read-only per-tin view over one cycle's CakeTinStats and drop deltas.
+
+    CakeSignalProcessor hands this out as CakeSignalSnapshot.tins instead of
+    building a TinSnapshot per tin every cycle; TinSnapshot objects are only
+    built when a consumer (health endpoint, logs) indexes or iterates it.
+    """
+
+    __slots__ = ("_deltas", "_names", "_stats")
+
+    def __init__(self, names: Sequence[str], stats: CakeTinStats, deltas: array[int]) -> None:
+        self._names = names
+        self._stats = stats
+        self._deltas = deltas
+
+    def __len__(self) -> int:
+        return self._stats.count
+
+    @overload
+    def __getitem__(self, index: int) -> TinSnapshot: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> tuple[TinSnapshot, ...]: ...
+
+    def __getitem__(self, index: int | slice) -> TinSnapshot | tuple[TinSnapshot, ...]:
+        if isinstance(index, slice):
+            return tuple(self[i] for i in range(*index.indices(len(self))))
+        count = self._stats.count
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("tin index out of range")
+        values = self._stats.values
+        avg_delay = values[_AVG_DELAY + index]
+        base_delay = values[_BASE_DELAY + index]
+        return TinSnapshot(
+            name=self._names[index] if index < len(self._names) else f"Tin{index}",
+            dropped_packets=values[_DROPPED + index],
+            drop_delta=self._deltas[index],
+            backlog_bytes=values[_BACKLOG + index],
+            peak_delay_us=values[_PEAK_DELAY + index],
+            ecn_marked_packets=values[_ECN_MARKED + index],
+            avg_delay_us=avg_delay,
+            base_delay_us=base_delay,
+            delay_delta_us=max(0, avg_delay - base_delay),
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return tuple(self) == tuple(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def __repr__(self) -> str:
+        return f"TinSnapshotView({list(self)!r})"
+
+
 @dataclass(frozen=True, slots=True)
 class CakeSignalSnapshot:
     """Immutable snapshot of processed CAKE signals for one cycle.
@@ -124,7 +268,8 @@ class CakeSignalSnapshot:
         total_drop_rate: EWMA drops/sec for all tins including Bulk.
         backlog_bytes: Sum of active-tin backlog bytes.
         peak_delay_us: Max peak_delay across active tins.
-        tins: Per-tin snapshots (tuple for immutability).
+        tins: Per-tin snapshots (a TinSnapshotView when built by
+            CakeSignalProcessor).
         cold_start: True on first update (delta not yet available).
         avg_delay_us: Max avg_delay across BestEffort+Video+Voice tins.
         base_delay_us: Max base_delay across BestEffort+Video+Voice tins.
@@ -135,7 +280,7 @@ class CakeSignalSnapshot:
     total_drop_rate: float
     backlog_bytes: int
     peak_delay_us: int
-    tins: tuple[TinSnapshot, ...]
+    tins: Sequence[TinSnapshot]
     cold_start: bool
     # NOTE (Phase 193, REVIEWS concern 4): avg_delay_us and base_delay_us are
     # independent max()-over-tins aggregations retained for diagnostic parity with
@@ -204,8 +349,8 @@ class CakeSignalProcessor:
         tin_names: list[str] | None = None,
     ) -> None:
         self._config = config
-        self._tin_names = tin_names or ["Bulk", "BestEffort", "Video", "Voice"]
-        self._prev_counters: dict[int, int] | None = None  # tin_index -> dropped_packets
+        self._tin_names = tin_names or list(_DEFAULT_TIN_NAMES)
+        self._prev_values: array[int] | None = None  # previous cycle's CakeTinStats.values
         self._cold_start = True
         self._drop_rate_ewma = 0.0  # Active (excludes Bulk)
         self._total_drop_rate_ewma = 0.0  # All tins
@@ -227,7 +372,7 @@ class CakeSignalProcessor:
 
     def reset(self) -> None:
         """Discard counter, EWMA, and snapshot state for a true cold start."""
-        self._prev_counters = None
+        self._prev_values = None
         self._cold_start = True
         self._drop_rate_ewma = 0.0
         self._total_drop_rate_ewma = 0.0
@@ -236,6 +381,11 @@ class CakeSignalProcessor:
     def update(self, raw_stats: dict[str, Any] | None) -> CakeSignalSnapshot | None:
         """Process one cycle of CAKE stats.
 
+        Reads the fixed-layout ``tin_stats`` columns that both CAKE backends
+        provide, or packs the ``tins`` dicts into a CakeTinStats first for
+        other callers. Deltas, EWMA inputs and active-tin aggregates are then computed
+        in one pass over the tins.
+
         Args:
             raw_stats: Return value from NetlinkCakeBackend.get_queue_stats(),
                 or None if stats unavailable.
@@ -250,174 +400,74 @@ class CakeSignalProcessor:
         if raw_stats is None:
             return self._last_snapshot
 
-        tins_raw: list[dict[str, Any]] = raw_stats.get("tins", [])
-        if not tins_raw:
+        tin_stats: CakeTinStats | None = raw_stats.get("tin_stats")
+        if tin_stats is None:
+            tin_stats = CakeTinStats.from_dicts(raw_stats.get("tins", []))
+        count = tin_stats.count
+        if count == 0:
             return self._last_snapshot
 
         # Phase 205 Q4: meaningful Prometheus label for single-tin besteffort
         # layouts. Operator-supplied custom tin_names pass through unchanged.
-        default_tin_names = ["Bulk", "BestEffort", "Video", "Voice"]
-        if len(tins_raw) == 1 and self._tin_names == default_tin_names:
-            tin_names = ["BestEffort"]
+        if count == 1 and tuple(self._tin_names) == _DEFAULT_TIN_NAMES:
+            tin_names: Sequence[str] = _BESTEFFORT_TIN_NAMES
         else:
             tin_names = self._tin_names
 
-        # Extract current per-tin drop counters
-        current_counters: dict[int, int] = {}
-        for i, tin in enumerate(tins_raw):
-            current_counters[i] = tin.get("dropped_packets", 0)
-
-        # Cold start: store counters, return zero-rate snapshot
-        if self._prev_counters is None:
-            self._prev_counters = current_counters
-            self._cold_start = True
-
-            tin_snapshots = tuple(
-                TinSnapshot(
-                    name=tin_names[i] if i < len(tin_names) else f"Tin{i}",
-                    dropped_packets=current_counters.get(i, 0),
-                    drop_delta=0,
-                    backlog_bytes=tins_raw[i].get("backlog_bytes", 0),
-                    peak_delay_us=tins_raw[i].get("peak_delay_us", 0),
-                    ecn_marked_packets=tins_raw[i].get("ecn_marked_packets", 0),
-                    avg_delay_us=tins_raw[i].get("avg_delay_us", 0),
-                    base_delay_us=tins_raw[i].get("base_delay_us", 0),
-                    delay_delta_us=max(
-                        0,
-                        tins_raw[i].get("avg_delay_us", 0)
-                        - tins_raw[i].get("base_delay_us", 0),
-                    ),
-                )
-                for i in range(len(tins_raw))
+        values = tin_stats.values
+
+        # Cold start: no previous counters, so deltas (and rates) stay zero
+        prev_values = self._prev_values
+        cold_start = prev_values is None
+        deltas = array("Q", _ZERO_COLUMN)
+
+        # Active tins exclude Bulk (index 0) only for multi-tin layouts
+        first_active = _active_tin_indices(count).start
+        active_drops = total_drops = 0
+        active_backlog = active_peak_delay = active_avg_delay = 0
+        active_base_delay = active_max_delay_delta = 0
+        for i in range(count):
+            delta = 0
+            if prev_values is not None:
+                delta = u32_delta(values[_DROPPED + i], prev_values[_DROPPED + i])
+                deltas[i] = delta
+                total_drops += delta
+            if i < first_active:
+                continue
+            active_drops += delta
+            active_backlog += values[_BACKLOG + i]
+            peak = values[_PEAK_DELAY + i]
+            if peak > active_peak_delay:
+                active_peak_delay = peak
+            avg, base = values[_AVG_DELAY + i], values[_BASE_DELAY + i]
+            if avg > active_avg_delay:
+                active_avg_delay = avg
+            if base > active_base_delay:
+                active_base_delay = base
+            if avg - base > active_max_delay_delta:
+                active_max_delay_delta = avg - base
+
+        # Filled stats are never mutated, so keep a reference, not a copy
+        self._prev_values = values
+        self._cold_start = cold_start
+
+        if not cold_start:
+            # Convert to drops/sec and EWMA smooth
+            alpha = self._alpha
+            self._drop_rate_ewma = (1.0 - alpha) * self._drop_rate_ewma + alpha * (
+                active_drops / CYCLE_INTERVAL_SECONDS
             )
-
-            # Compute backlog and peak delay across active tins.
-            active_indices = _active_tin_indices(len(tins_raw))
-            active_backlog = sum(
-                tins_raw[i].get("backlog_bytes", 0) for i in active_indices
-            )
-            active_peak_delay = max(
-                (tins_raw[i].get("peak_delay_us", 0) for i in active_indices),
-                default=0,
-            )
-            active_avg_delay = max(
-                (tins_raw[i].get("avg_delay_us", 0) for i in active_indices),
-                default=0,
-            )
-            active_base_delay = max(
-                (tins_raw[i].get("base_delay_us", 0) for i in active_indices),
-                default=0,
-            )
-            active_max_delay_delta = max(
-                (
-                    max(
-                        0,
-                        tins_raw[i].get("avg_delay_us", 0)
-                        - tins_raw[i].get("base_delay_us", 0),
-                    )
-                    for i in active_indices
-                ),
-                default=0,
-            )
-
-            snapshot = CakeSignalSnapshot(
-                drop_rate=0.0,
-                total_drop_rate=0.0,
-                backlog_bytes=active_backlog,
-                peak_delay_us=active_peak_delay,
-                tins=tin_snapshots,
-                cold_start=True,
-                avg_delay_us=active_avg_delay,
-                base_delay_us=active_base_delay,
-                max_delay_delta_us=active_max_delay_delta,
-            )
-            self._last_snapshot = snapshot
-            return snapshot
-
-        # Compute deltas
-        deltas: dict[int, int] = {}
-        for i in range(len(tins_raw)):
-            prev = self._prev_counters.get(i, 0)
-            curr = current_counters.get(i, 0)
-            deltas[i] = u32_delta(curr, prev)
-
-        # Update previous counters for next cycle
-        self._prev_counters = current_counters
-
-        # Sum active drops (exclude Bulk only for multi-tin layouts)
-        active_indices = _active_tin_indices(len(tins_raw))
-        active_drops = sum(deltas.get(i, 0) for i in active_indices)
-        total_drops = sum(deltas.get(i, 0) for i in range(len(tins_raw)))
-
-        # Convert to drops/sec
-        active_drops_per_sec = active_drops / CYCLE_INTERVAL_SECONDS
-        total_drops_per_sec = total_drops / CYCLE_INTERVAL_SECONDS
-
-        # EWMA smooth
-        alpha = self._alpha
-        self._drop_rate_ewma = (
-            (1.0 - alpha) * self._drop_rate_ewma + alpha * active_drops_per_sec
-        )
-        self._total_drop_rate_ewma = (
-            (1.0 - alpha) * self._total_drop_rate_ewma + alpha * total_drops_per_sec
-        )
-
-        # Build per-tin snapshots
-        tin_snapshots = tuple(
-            TinSnapshot(
-                name=tin_names[i] if i < len(tin_names) else f"Tin{i}",
-                dropped_packets=current_counters.get(i, 0),
-                drop_delta=deltas.get(i, 0),
-                backlog_bytes=tins_raw[i].get("backlog_bytes", 0),
-                peak_delay_us=tins_raw[i].get("peak_delay_us", 0),
-                ecn_marked_packets=tins_raw[i].get("ecn_marked_packets", 0),
-                avg_delay_us=tins_raw[i].get("avg_delay_us", 0),
-                base_delay_us=tins_raw[i].get("base_delay_us", 0),
-                delay_delta_us=max(
-                    0,
-                    tins_raw[i].get("avg_delay_us", 0)
-                    - tins_raw[i].get("base_delay_us", 0),
-                ),
+            self._total_drop_rate_ewma = (1.0 - alpha) * self._total_drop_rate_ewma + alpha * (
+                total_drops / CYCLE_INTERVAL_SECONDS
             )
-            for i in range(len(tins_raw))
-        )
-
-        # Compute backlog and peak delay across active tins.
-        active_backlog = sum(
-            tins_raw[i].get("backlog_bytes", 0) for i in active_indices
-        )
-        active_peak_delay = max(
-            (tins_raw[i].get("peak_delay_us", 0) for i in active_indices),
-            default=0,
-        )
-        active_avg_delay = max(
-            (tins_raw[i].get("avg_delay_us", 0) for i in active_indices),
-            default=0,
-        )
-        active_base_delay = max(
-            (tins_raw[i].get("base_delay_us", 0) for i in active_indices),
-            default=0,
-        )
-        active_max_delay_delta = max(
-            (
-                max(
-                    0,
-                    tins_raw[i].get("avg_delay_us", 0)
-                    - tins_raw[i].get("base_delay_us", 0),
-                )
-                for i in active_indices
-            ),
-            default=0,
-        )
 
-        self._cold_start = False
         snapshot = CakeSignalSnapshot(
-            drop_rate=self._drop_rate_ewma,
-            total_drop_rate=self._total_drop_rate_ewma,
+            drop_rate=self._drop_rate_ewma if not cold_start else 0.0,
+            total_drop_rate=self._total_drop_rate_ewma if not cold_start else 0.0,
             backlog_bytes=active_backlog,
             peak_delay_us=active_peak_delay,
-            tins=tin_snapshots,
-            cold_start=False,
+            tins=TinSnapshotView(tin_names, tin_stats, deltas),
+            cold_start=cold_start,
             avg_delay_us=active_avg_delay,
             base_delay_us=active_base_delay,
             max_delay_delta_us=active_max_delay_delta,
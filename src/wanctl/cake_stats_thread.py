@@ -1,7 +1,8 @@
 """Background thread for CAKE qdisc stats collection.
 
 Offloads netlink tc("dump") calls from the main control loop to a dedicated
-daemon thread with its own IPRoute connection (thread-safe by isolation).
+daemon thread. The thread dumps on its own netlink socket, so a 7-20ms
+dump never holds the socket lock the main thread's bandwidth writes take.
 
 The main loop reads cached stats via get_latest() (GIL-protected pointer
 swap, lock-free) instead of blocking on 7-20ms netlink I/O per cycle.
@@ -15,7 +16,8 @@ import time
 from dataclasses import dataclass
 from typing import Any
 
-from wanctl.perf_profiler import OperationProfiler
+from wanctl.measurement_scheduler import MeasurementSlot
+from wanctl.perf_profiler import ArrayOperationProfiler
 
 logger = logging.getLogger(__name__)
 
@@ -42,15 +44,19 @@ class OverlapSnapshot:
 class BackgroundCakeStatsThread:
     """Dedicated background thread for CAKE qdisc stats reads.
 
-    Creates its own NetlinkCakeBackend instances with independent IPRoute
-    connections so there's no thread-safety issue with the main thread's
-    backends (which handle set_bandwidth).
+    Creates its own netlink backends (NetlinkHtbFqCodelBackend for HTB
+    directions, NetlinkCakeBackend otherwise) on a stats-only SharedIPRoute,
+    separate from the process-wide socket used for set_bandwidth, so rate
+    changes never wait behind a dump.
 
     Args:
         dl_interface: Download interface name (e.g. "ens17")
         ul_interface: Upload interface name (e.g. "ens16")
         shutdown_event: threading.Event signaling graceful shutdown
         cadence_sec: Seconds between reads (default 0.05 = 20Hz, matching cycle)
+        schedule: Optional MeasurementSlot that plans each next read start
+            instead of the fixed cadence_sec wait
+        htb_directions: (download, upload) flags for HTB + fq_codel directions
     """
 
     def __init__(
@@ -59,14 +65,18 @@ class BackgroundCakeStatsThread:
         ul_interface: str,
         shutdown_event: threading.Event,
         cadence_sec: float = 0.05,
+        schedule: MeasurementSlot | None = None,
+        htb_directions: tuple[bool, bool] = (False, False),
     ) -> None:
         self._dl_interface = dl_interface
         self._ul_interface = ul_interface
         self._shutdown_event = shutdown_event
         self._cadence_sec = cadence_sec
+        self._schedule = schedule
+        self._htb_directions = htb_directions
         self._cached: CakeStatsSnapshot | None = None
         self._overlap: OverlapSnapshot = OverlapSnapshot()
-        self._profiler = OperationProfiler(max_samples=1200)
+        self._profiler = ArrayOperationProfiler(max_samples=1200)
         self._thread: threading.Thread | None = None
 
     def get_latest(self) -> CakeStatsSnapshot | None:
@@ -104,11 +114,19 @@ class BackgroundCakeStatsThread:
 
     def _run(self) -> None:
         """Stats collection loop — runs until shutdown_event is set."""
-        from wanctl.backends.netlink_cake import NetlinkCakeBackend
+        from wanctl.backends.netlink_cake import (
+            NetlinkCakeBackend,
+            NetlinkHtbFqCodelBackend,
+            SharedIPRoute,
+        )
 
-        # Create dedicated backends with their own IPRoute connections
-        dl_backend = NetlinkCakeBackend(interface=self._dl_interface)
-        ul_backend = NetlinkCakeBackend(interface=self._ul_interface)
+        # Dedicated backends (own ifindex/parse state) on a stats-only socket
+        iproute = SharedIPRoute()
+        dl_htb, ul_htb = self._htb_directions
+        dl_cls = NetlinkHtbFqCodelBackend if dl_htb else NetlinkCakeBackend
+        ul_cls = NetlinkHtbFqCodelBackend if ul_htb else NetlinkCakeBackend
+        dl_backend = dl_cls(interface=self._dl_interface, iproute=iproute)
+        ul_backend = ul_cls(interface=self._ul_interface, iproute=iproute)
 
         # Prime both backends so each has its interface index resolved before
         # parsing shared dumps. Without this, UL parsing can miss because
@@ -142,9 +160,11 @@ class BackgroundCakeStatsThread:
             except Exception:
                 logger.debug("Background CAKE stats error", exc_info=True)
 
+            if self._schedule is not None:
+                self._schedule.wait_next(elapsed_s, self._shutdown_event)
+                continue
             sleep_s = max(0.0, self._cadence_sec - elapsed_s)
             self._shutdown_event.wait(timeout=sleep_s)
 
-        # Cleanup IPRoute connections
-        dl_backend._reset_ipr()
-        ul_backend._reset_ipr()
+        # Release the stats socket (owned by this thread)
+        iproute.close()
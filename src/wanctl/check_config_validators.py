@@ -120,6 +120,7 @@ KNOWN_AUTORATE_PATHS: set[str] = {
     "router.password",
     "router.port",
     "router.verify_ssl",
+    "router.ssh_mode",
     # State file (imperatively loaded)
     "state_file",
     # Timeouts (imperatively loaded)
@@ -136,6 +137,7 @@ KNOWN_AUTORATE_PATHS: set[str] = {
     "metrics.enabled",
     "metrics.host",
     "metrics.port",
+    "metrics.openmetrics",
     # Storage (from STORAGE_SCHEMA)
     "storage",
     "storage.retention_days",
@@ -188,6 +190,10 @@ KNOWN_AUTORATE_PATHS: set[str] = {
     "reflector_quality.window_size",
     "reflector_quality.probe_interval_sec",
     "reflector_quality.recovery_count",
+    "reflector_quality.candidates",
+    "reflector_quality.active_count",
+    "reflector_quality.probe_budget_per_sec",
+    "reflector_quality.reselect_interval_sec",
     # OWD asymmetry detection (_load_owd_asymmetry_config)
     "owd_asymmetry",
     "owd_asymmetry.ratio_threshold",
@@ -249,6 +255,13 @@ KNOWN_AUTORATE_PATHS: set[str] = {
     # Cycle budget warning (WANController.__init__)
     "continuous_monitoring.warning_threshold_pct",
     "continuous_monitoring.cake_stats_cadence_sec",
+    "continuous_monitoring.router_apply_mode",
+    "continuous_monitoring.measurement_scheduler",
+    "continuous_monitoring.measurement_scheduler.enabled",
+    "continuous_monitoring.measurement_scheduler.idle_after_sec",
+    "continuous_monitoring.measurement_scheduler.idle_cadence_factor",
+    "continuous_monitoring.measurement_scheduler.busy_cadence_factor",
+    "continuous_monitoring.measurement_scheduler.lead_margin_ms",
     # Measurement backend selection (Phase 240, CFG-01) -- additive, inert until Phase 242
     "measurement",
     "measurement.backend",
@@ -281,6 +294,10 @@ KNOWN_AUTORATE_PATHS: set[str] = {
     "cake_signal.recovery.probe_ceiling_pct",
     # Startup/periodic maintenance retention cadence
     "storage.maintenance_interval_seconds",
+    # Zone transition events pushed to steering (_load_zone_events_config)
+    "zone_events",
+    "zone_events.enabled",
+    "zone_events.socket_path",
 }
 
 # Regex for detecting environment variable references in string values
@@ -75,6 +75,7 @@ KNOWN_STEERING_PATHS: set[str] = {
     "router.password",
     "router.port",
     "router.verify_ssl",
+    "router.ssh_mode",
     # CAKE state sources -- imperatively loaded in _load_state_sources
     "cake_state_sources",
     "cake_state_sources.primary",
@@ -107,6 +108,7 @@ KNOWN_STEERING_PATHS: set[str] = {
     "confidence.penalty_duration_sec",
     "confidence.penalty_threshold_add",
     "confidence.dry_run",
+    "confidence.compiled_evaluation",
     # Route management -- inert and off by default in Phase 252
     "route_management",
     "route_management.enabled",
@@ -159,6 +161,11 @@ KNOWN_STEERING_PATHS: set[str] = {
     "alerting.mention_role_id",
     "alerting.mention_severity",
     "alerting.max_webhooks_per_minute",
+    # Zone events -- imperatively loaded in _load_zone_events_config
+    "zone_events",
+    "zone_events.enabled",
+    "zone_events.socket_path",
+    "zone_events.idle_interval_seconds",
     # Schema version
     "schema_version",
 }
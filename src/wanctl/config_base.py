@@ -8,6 +8,8 @@ from typing import Any, TypedDict
 
 import yaml
 
+from wanctl.config_snapshot import ConfigSnapshot, snapshot_from_parsed
+
 
 class RetentionConfig(TypedDict):
     """Typed dict for storage retention configuration."""
@@ -407,17 +409,24 @@ class BaseConfig:
                 or if required config keys are missing or invalid
         """
         self.config_file_path = config_path
-        with open(config_path) as f:
-            try:
-                self.data = yaml.safe_load(f)
-            except yaml.YAMLError as e:
-                if hasattr(e, "problem_mark") and e.problem_mark is not None:
-                    mark = e.problem_mark
-                    raise ConfigValidationError(
-                        f"YAML parse error in {config_path} at line {mark.line + 1}, "
-                        f"column {mark.column + 1}: {e.problem}"
-                    ) from e
-                raise ConfigValidationError(f"YAML parse error in {config_path}: {e}") from e
+        with open(config_path, "rb") as f:
+            raw = f.read()
+        try:
+            self.data = yaml.safe_load(raw)
+        except yaml.YAMLError as e:
+            if hasattr(e, "problem_mark") and e.problem_mark is not None:
+                mark = e.problem_mark
+                raise ConfigValidationError(
+                    f"YAML parse error in {config_path} at line {mark.line + 1}, "
+                    f"column {mark.column + 1}: {e.problem}"
+                ) from e
+            raise ConfigValidationError(f"YAML parse error in {config_path}: {e}") from e
+
+        # Frozen copy taken before validation fills in defaults; SIGUSR1
+        # reloads diff against it (see config_snapshot.py).
+        self.snapshot: ConfigSnapshot | None = None
+        if isinstance(self.data, dict):
+            self.snapshot = snapshot_from_parsed(raw, self.data)
 
         # Validate schema version (defaults to 1.0 for legacy configs)
         self._validate_schema_version()
@@ -625,3 +634,25 @@ class BaseConfig:
         raise ConfigValidationError(
             f"{field_name}: must be valid IPv4, IPv6 address, or hostname, got: '{value}'"
         )
+
+    @classmethod
+    def validate_ssh_mode(cls, value: Any, field_name: str) -> str:
+        """Validate a RouterOS SSH command mode ("exec" or "shell").
+
+        Unlike the checks above this never raises: the mode is never
+        interpolated into a command, so an unknown value is logged and
+        replaced with "exec" rather than refusing to start.
+
+        Args:
+            value: The configured mode
+            field_name: Name of the config field (for log messages)
+
+        Returns:
+            The mode, or "exec" if the value is not a supported mode
+        """
+        if value in ("exec", "shell"):
+            return str(value)
+        logging.getLogger(__name__).warning(
+            "%s must be 'exec' or 'shell', got %r; defaulting to 'exec'", field_name, value
+        )
+        return "exec"
@@ -0,0 +1,186 @@
+"""Immutable, content-addressed snapshots of a daemon YAML config file.
+
+SIGUSR1 reload used to re-open and re-parse the YAML file once per
+hot-reloadable subsystem. A ConfigSnapshot is parsed once, frozen, and
+cached by the SHA-256 of the file bytes, so:
+
+- every reloader in a reload (and every WAN sharing a file) shares one parse;
+- an unchanged file costs one read + hash, with no YAML parsing at all;
+- ConfigSnapshot.changed() compares per-path digests, letting the daemons
+  reconfigure only the subsystems whose config sections actually changed.
+
+Section validation stays with each subsystem's _reload_* method; the
+snapshot only guarantees the parsed document is a mapping and never
+changes after construction.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any
+
+import yaml
+
+# Distinct file contents kept in the cache (one per WAN config is typical).
+SNAPSHOT_CACHE_SIZE = 16
+
+# Digest for a path that does not exist in the document.
+_ABSENT_DIGEST = "absent"
+
+
+def _freeze(value: Any) -> Any:
+    """Deep-copy parsed YAML into read-only containers."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Deep-copy frozen containers back into plain dicts and lists."""
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+def content_hash(raw: bytes) -> str:
+    """SHA-256 hex digest of raw config file bytes (the snapshot cache key)."""
+    return hashlib.sha256(raw).hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class ConfigSnapshot:
+    """One parsed config document, frozen and addressed by content hash.
+
+    Attributes:
+        content_hash: SHA-256 of the file bytes the snapshot was parsed from
+        data: Deeply read-only view of the document (mappings and tuples)
+    """
+
+    content_hash: str
+    data: Mapping[str, Any]
+    _digests: dict[str, str] = field(default_factory=dict, compare=False, repr=False)
+
+    @classmethod
+    def from_mapping(cls, data: Mapping[str, Any] | None, digest: str) -> ConfigSnapshot:
+        """Freeze an already-parsed document (None is treated as empty)."""
+        if data is None:
+            data = {}
+        if not isinstance(data, Mapping):
+            raise TypeError(f"config document must be a mapping, got {type(data).__name__}")
+        return cls(content_hash=digest, data=_freeze(dict(data)))
+
+    def get(self, path: str) -> Any:
+        """Return a plain (mutable) copy of the value at a dotted path, or None."""
+        node: Any = self.data
+        for key in path.split("."):
+            if not isinstance(node, Mapping) or key not in node:
+                return None
+            node = node[key]
+        return _thaw(node)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a plain (mutable) deep copy of the whole document."""
+        result: dict[str, Any] = _thaw(self.data)
+        return result
+
+    def digest(self, path: str) -> str:
+        """Stable digest of the subtree at a dotted path (memoized)."""
+        cached = self._digests.get(path)
+        if cached is not None:
+            return cached
+        node: Any = self.data
+        digest = None
+        for key in path.split("."):
+            if not isinstance(node, Mapping) or key not in node:
+                digest = _ABSENT_DIGEST
+                break
+            node = node[key]
+        if digest is None:
+            encoded = json.dumps(_thaw(node), sort_keys=True, default=str).encode()
+            digest = hashlib.blake2b(encoded, digest_size=16).hexdigest()
+        self._digests[path] = digest
+        return digest
+
+    def changed(self, previous: ConfigSnapshot | None, *paths: str) -> bool:
+        """True if any of ``paths`` differs from ``previous`` (None: always True)."""
+        if previous is None:
+            return True
+        if previous.content_hash == self.content_hash:
+            return False
+        return any(self.digest(p) != previous.digest(p) for p in paths)
+
+
+_cache: OrderedDict[str, ConfigSnapshot] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _cached(digest: str) -> ConfigSnapshot | None:
+    with _cache_lock:
+        snapshot = _cache.get(digest)
+        if snapshot is not None:
+            _cache.move_to_end(digest)
+        return snapshot
+
+
+def _remember(snapshot: ConfigSnapshot) -> ConfigSnapshot:
+    with _cache_lock:
+        existing = _cache.get(snapshot.content_hash)
+        if existing is not None:
+            _cache.move_to_end(snapshot.content_hash)
+            return existing
+        _cache[snapshot.content_hash] = snapshot
+        while len(_cache) > SNAPSHOT_CACHE_SIZE:
+            _cache.popitem(last=False)
+        return snapshot
+
+
+def snapshot_from_parsed(raw: bytes, data: Any) -> ConfigSnapshot:
+    """Register a document the caller already parsed from ``raw``.
+
+    Used by BaseConfig at startup so the first SIGUSR1 reload of an
+    unchanged file is a cache hit.
+    """
+    digest = content_hash(raw)
+    return _cached(digest) or _remember(ConfigSnapshot.from_mapping(data, digest))
+
+
+def load_config_snapshot(config_path: str) -> ConfigSnapshot:
+    """Read ``config_path`` and return its snapshot, parsing only on cache miss.
+
+    Raises:
+        OSError: If the file cannot be read
+        yaml.YAMLError: If the file is not valid YAML
+        TypeError: If the document is not a mapping
+    """
+    with open(config_path, "rb") as f:
+        raw = f.read()
+    digest = content_hash(raw)
+    snapshot = _cached(digest)
+    if snapshot is not None:
+        return snapshot
+    return _remember(ConfigSnapshot.from_mapping(yaml.safe_load(raw), digest))
+
+
+def reload_data(config_path: str, data: dict[str, Any] | None = None) -> dict[str, Any]:
+    """Return the config document a _reload_* method should apply.
+
+    reload() passes the data of the snapshot it just loaded, so a SIGUSR1
+    reads the file once no matter how many subsystems it reconfigures. A
+    reloader called on its own (no ``data``) loads the snapshot itself.
+
+    Raises:
+        Same as load_config_snapshot() when ``data`` is None
+    """
+    if data is not None:
+        return data
+    return load_config_snapshot(config_path).as_dict()
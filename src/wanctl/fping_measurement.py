@@ -23,9 +23,10 @@ from collections.abc import Callable
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Protocol
 
-from wanctl.perf_profiler import OperationProfiler
+from wanctl.perf_profiler import ArrayOperationProfiler
 
 if TYPE_CHECKING:
+    from wanctl.measurement_scheduler import MeasurementSlot
     from wanctl.rtt_backend import RttSample
 
 
@@ -295,6 +296,7 @@ class FpingThread:
         cadence_sec: float,
         shutdown_event: threading.Event,
         logger: logging.Logger,
+        schedule: MeasurementSlot | None = None,
     ) -> None:
         if measurement._timeout >= cadence_sec:
             msg = f"fping timeout {measurement._timeout:.3f}s must be less than cadence {cadence_sec:.3f}s"
@@ -304,8 +306,9 @@ class FpingThread:
         self._cadence_sec = cadence_sec
         self._shutdown_event = shutdown_event
         self._logger = logger
+        self._schedule = schedule
         self._cached_result: RttSample | None = None
-        self._profiler = OperationProfiler(max_samples=1200)
+        self._profiler = ArrayOperationProfiler(max_samples=1200)
         self._thread: threading.Thread | None = None
 
     @property
@@ -340,8 +343,8 @@ class FpingThread:
     def _run(self) -> None:
         """Measurement loop -- runs until *shutdown_event* is set."""
         while not self._shutdown_event.is_set():
+            t0 = time.perf_counter()
             try:
-                t0 = time.perf_counter()
                 result = self._measurement.probe(self._hosts_fn())
                 elapsed_ms = (time.perf_counter() - t0) * 1000.0
                 self._profiler.record("fping_background_cycle", elapsed_ms)
@@ -349,4 +352,7 @@ class FpingThread:
                     self._cached_result = result
             except Exception:
                 self._logger.debug("fping measurement error", exc_info=True)
-            self._shutdown_event.wait(timeout=self._cadence_sec)
+            if self._schedule is not None:
+                self._schedule.wait_next(time.perf_counter() - t0, self._shutdown_event)
+            else:
+                self._shutdown_event.wait(timeout=self._cadence_sec)
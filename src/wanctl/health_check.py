@@ -11,6 +11,8 @@ Usage:
     server.shutdown()  # in finally block
 """
 
+import csv
+import io
 import json
 import logging
 import re
@@ -24,19 +26,40 @@ from typing import TYPE_CHECKING, Any
 from urllib.parse import parse_qs, urlparse
 
 from wanctl.build_identity import get_build_identity
+from wanctl.quantile_sketch import QuantileSketch
 from wanctl.runtime_pressure import (
     build_runtime_section as build_runtime_status_section,
 )
 from wanctl.runtime_pressure import (
     build_storage_section as build_storage_status_section,
 )
-from wanctl.storage.db_utils import discover_wan_dbs, query_all_wans
-from wanctl.storage.reader import count_metrics, query_metrics
+from wanctl.storage.db_utils import discover_wan_dbs, iter_all_wans, query_all_wans
+from wanctl.storage.reader import (
+    METRIC_ROW_FIELDS,
+    compute_summary,
+    count_metrics,
+    iter_metrics,
+    query_metric_sketches,
+    query_metrics,
+)
 from wanctl.storage.writer import DEFAULT_DB_PATH
 
 # Default: warn when less than 100MB free on data partition
 _DISK_SPACE_WARNING_BYTES = 100 * 1024 * 1024  # 100 MB
 
+# Streamed /metrics/history formats and their content types
+_HISTORY_STREAM_CONTENT_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+# Bytes buffered per chunk of a streamed /metrics/history response
+_HISTORY_STREAM_CHUNK_BYTES = 64 * 1024
+
+# Longest range a streamed /metrics/history response may cover. The health
+# server handles one request at a time, so an export must not hold it for long.
+_HISTORY_STREAM_MAX_RANGE_SEC = 7 * 86400
+
 
 def _get_disk_space_status(
     path: str = "/var/lib/wanctl",
@@ -70,13 +93,26 @@ def _get_disk_space_status(
 
 if TYPE_CHECKING:
     from wanctl.autorate_continuous import ContinuousAutoRate
-    from wanctl.perf_profiler import OperationProfiler
+    from wanctl.perf_profiler import Profiler
 
 logger = logging.getLogger(__name__)
 
 
+def _lifetime_percentiles(stats: dict[str, Any]) -> dict[str, Any] | None:
+    """Long-horizon p50/p99/p999 from ArrayOperationProfiler stats, if present."""
+    lifetime = stats.get("lifetime")
+    if not isinstance(lifetime, dict):
+        return None
+    return {
+        "count": lifetime["count"],
+        "p50": round(lifetime["p50_ms"], 1),
+        "p99": round(lifetime["p99_ms"], 1),
+        "p999": round(lifetime["p999_ms"], 1),
+    }
+
+
 def _build_cycle_budget(
-    profiler: "OperationProfiler",
+    profiler: "Profiler",
     overrun_count: int,
     cycle_interval_ms: float,
     total_label: str,
@@ -88,7 +124,7 @@ def _build_cycle_budget(
     Returns None when the profiler has no data (cold start, D9).
 
     Args:
-        profiler: OperationProfiler with accumulated cycle timing samples
+        profiler: Profiler with accumulated cycle timing samples
         overrun_count: Cumulative overrun counter since startup
         cycle_interval_ms: Configured cycle interval in milliseconds
         total_label: Profiler label for total cycle time (e.g. "autorate_cycle_total")
@@ -122,6 +158,9 @@ def _build_cycle_budget(
         "status": status,
         "warning_threshold_pct": warning_threshold_pct,
     }
+    lifetime = _lifetime_percentiles(stats)
+    if lifetime is not None:
+        result["cycle_time_ms"]["lifetime"] = lifetime
 
     # Per-subsystem breakdown (Phase 131: PERF-01, per D-08)
     subsystem_labels = [
@@ -135,7 +174,7 @@ def _build_cycle_budget(
         "autorate_router_communication",
         "autorate_post_cycle",
     ]
-    subsystems: dict[str, dict[str, float]] = {}
+    subsystems: dict[str, dict[str, Any]] = {}
     for label in subsystem_labels:
         sub_stats = profiler.stats(label)
         if isinstance(sub_stats, dict) and "avg_ms" in sub_stats:
@@ -145,6 +184,9 @@ def _build_cycle_budget(
                 "p95": round(sub_stats["p95_ms"], 1),
                 "p99": round(sub_stats["p99_ms"], 1),
             }
+            sub_lifetime = _lifetime_percentiles(sub_stats)
+            if sub_lifetime is not None:
+                subsystems[short_name]["lifetime"] = sub_lifetime
     if subsystems:
         result["subsystems"] = subsystems
 
@@ -295,6 +337,18 @@ class HealthCheckHandler(BaseHTTPRequestHandler):
         wan_health["runtime"] = self._build_runtime_section(
             health_data, wan_health.get("cycle_budget")
         )
+        zone_events = health_data.get("zone_events")
+        if isinstance(zone_events, dict):
+            wan_health["zone_events"] = zone_events
+        router_transport = health_data.get("router_transport")
+        if isinstance(router_transport, dict):
+            wan_health["router_transport"] = router_transport
+        router_apply = self._build_router_apply_section(health_data)
+        if router_apply is not None:
+            wan_health["router_apply"] = router_apply
+        measurement_schedule = health_data.get("measurement_schedule")
+        if isinstance(measurement_schedule, dict):
+            wan_health["measurement_schedule"] = measurement_schedule
 
         return wan_health
 
@@ -604,12 +658,57 @@ class HealthCheckHandler(BaseHTTPRequestHandler):
 
         return result or None
 
+    def _build_router_apply_section(self, health_data: dict[str, Any]) -> dict[str, Any] | None:
+        """Build async router apply status (acknowledged rates, lag, mailbox counters)."""
+        router_apply = health_data.get("router_apply")
+        if not isinstance(router_apply, dict):
+            return None
+
+        def _mbps(rate: Any) -> float | None:
+            return round(rate / 1e6, 1) if isinstance(rate, (int, float)) else None
+
+        pending = router_apply.get("pending_target")
+        last = router_apply.get("last_result")
+        result: dict[str, Any] = {
+            "mode": router_apply.get("mode", "async"),
+            "acknowledged": {
+                "download_mbps": _mbps(router_apply.get("acknowledged_dl_rate")),
+                "upload_mbps": _mbps(router_apply.get("acknowledged_ul_rate")),
+            },
+            "pending": (
+                {"download_mbps": _mbps(pending[0]), "upload_mbps": _mbps(pending[1])}
+                if isinstance(pending, tuple)
+                else None
+            ),
+            "last_apply": (
+                {
+                    "success": bool(last["success"]),
+                    "apply_ms": round(last["apply_ms"], 1),
+                    "lag_ms": round(last["lag_ms"], 1),
+                    "age_sec": round(last["age_sec"], 3),
+                }
+                if isinstance(last, dict)
+                else None
+            ),
+        }
+        for key in ("posted", "superseded", "applied", "failed"):
+            result[key] = int(router_apply.get(key, 0))
+        result["in_flight"] = bool(router_apply.get("in_flight", False))
+        stats = router_apply.get("stats")
+        if isinstance(stats, dict) and "avg_ms" in stats:
+            result["apply_time_ms"] = {
+                "avg": round(stats["avg_ms"], 1),
+                "p95": round(stats["p95_ms"], 1),
+                "max": round(stats["max_ms"], 1),
+            }
+        return result
+
     def _build_reflector_section(self, health_data: dict[str, Any]) -> dict[str, Any]:
         """Build reflector quality status (REFL-04). Always present."""
         scorer = health_data["reflector"]["scorer"]
         if scorer is not None:
             statuses = scorer.get_all_statuses()
-            return {
+            section: dict[str, Any] = {
                 "available": True,
                 "hosts": {
                     s.host: {
@@ -620,6 +719,10 @@ class HealthCheckHandler(BaseHTTPRequestHandler):
                     for s in statuses
                 },
             }
+            fleet = health_data["reflector"].get("fleet")
+            if isinstance(fleet, dict):
+                section["fleet"] = fleet
+            return section
         return {"available": True, "hosts": {}}
 
     def _build_fusion_section(self, health_data: dict[str, Any]) -> dict[str, Any]:
@@ -840,15 +943,19 @@ class HealthCheckHandler(BaseHTTPRequestHandler):
         if tuning_data["enabled"] is not True:
             return {"enabled": False, "reason": "disabled"}
 
+        window = tuning_data.get("window")
         tuning_state = tuning_data["state"]
         if tuning_state is None or tuning_state.last_run_ts is None:
-            return {
+            awaiting: dict[str, Any] = {
                 "enabled": True,
                 "last_run_ago_sec": None,
                 "parameters": {},
                 "recent_adjustments": [],
                 "reason": "awaiting_data",
             }
+            if isinstance(window, dict):
+                awaiting["window"] = window
+            return awaiting
 
         last_run_ago = round(time.monotonic() - tuning_state.last_run_ts, 1)
         params_dict = self._build_tuning_params_dict(wan_controller, tuning_state)
@@ -872,6 +979,8 @@ class HealthCheckHandler(BaseHTTPRequestHandler):
         }
 
         tuning["safety"] = self._build_tuning_safety_section(health_data, tuning_state)
+        if isinstance(window, dict):
+            tuning["window"] = window
 
         return tuning
 
@@ -1072,6 +1181,17 @@ class HealthCheckHandler(BaseHTTPRequestHandler):
         limit = params.get("limit", 1000)
 
         db_paths, source_mode = self._resolve_history_db_paths()
+        if params.get("summary"):
+            self._handle_metrics_history_summary(params, start_ts, end_ts, db_paths, source_mode)
+            return
+        if params.get("format") in _HISTORY_STREAM_CONTENT_TYPES:
+            if end_ts - start_ts > _HISTORY_STREAM_MAX_RANGE_SEC:
+                self._send_json_error(
+                    400, f"format={params['format']} ranges are limited to 7d; split the export"
+                )
+                return
+            self._stream_metrics_history(params, start_ts, end_ts, db_paths)
+            return
         if len(db_paths) == 1:
             total_count = count_metrics(
                 db_path=db_paths[0],
@@ -1137,6 +1257,146 @@ class HealthCheckHandler(BaseHTTPRequestHandler):
 
         self._send_json_response(response)
 
+    def _handle_metrics_history_summary(
+        self,
+        params: dict[str, Any],
+        start_ts: int,
+        end_ts: int,
+        db_paths: list[Path],
+        source_mode: str,
+    ) -> None:
+        """Handle /metrics/history?summary=1.
+
+        Merges the pre-aggregated sketches per metric by default; with exact=1
+        computes from stored rows per metric and tier, as wanctl-history
+        --summary --exact does.
+        """
+        exact = params.get("exact", False)
+        query_kwargs: dict[str, Any] = {
+            "start_ts": start_ts,
+            "end_ts": end_ts,
+            "metrics": params.get("metrics"),
+            "wan": params.get("wan"),
+        }
+        if exact:
+            results = query_all_wans(
+                query_metrics, db_paths=db_paths, use_observed_tiers=True, **query_kwargs
+            )
+        else:
+            results = query_all_wans(query_metric_sketches, db_paths=db_paths, **query_kwargs)
+        if getattr(results, "all_failed", False):
+            self._send_json_error(503, "All metrics databases failed to read")
+            return
+
+        data: list[dict[str, Any]] = []
+        if exact:
+            groups: dict[tuple[str, str], list[float]] = {}
+            for row in results:
+                key = (row["metric_name"], str(row.get("granularity")))
+                groups.setdefault(key, []).append(row["value"])
+            for (metric_name, granularity), values in sorted(groups.items()):
+                data.append(
+                    {
+                        "metric_name": metric_name,
+                        "granularity": granularity,
+                        "count": len(values),
+                        **compute_summary(values),
+                    }
+                )
+        else:
+            merged: dict[str, QuantileSketch] = {}
+            for row in results:
+                merged.setdefault(row["metric_name"], QuantileSketch()).merge(row["sketch"])
+            for metric_name, sketch in sorted(merged.items()):
+                data.append(
+                    {"metric_name": metric_name, "granularity": "sketch", **sketch.summary()}
+                )
+
+        self._send_json_response(
+            {
+                "data": data,
+                "metadata": {
+                    "summary_mode": "exact" if exact else "sketch",
+                    "source": {
+                        "mode": source_mode,
+                        "db_paths": [str(path) for path in db_paths],
+                    },
+                    "query": {
+                        "start": datetime.fromtimestamp(start_ts, tz=UTC).isoformat(),
+                        "end": datetime.fromtimestamp(end_ts, tz=UTC).isoformat(),
+                        "metrics": params.get("metrics"),
+                        "wan": params.get("wan"),
+                    },
+                },
+            }
+        )
+
+    def _stream_metrics_history(
+        self,
+        params: dict[str, Any],
+        start_ts: int,
+        end_ts: int,
+        db_paths: list[Path],
+    ) -> None:
+        """Handle /metrics/history?format=ndjson|csv.
+
+        Streams every matching row, newest first like the JSON response, with
+        chunked transfer encoding. Rows are read page by page and written in
+        bounded chunks, so memory stays flat; the caller limits the range
+        (_HISTORY_STREAM_MAX_RANGE_SEC). Read errors after the headers are
+        sent can only end the stream early. The readers hold pooled
+        connections while open and are closed however the stream ends.
+        """
+        rows = iter_all_wans(
+            iter_metrics,
+            db_paths=db_paths,
+            start_ts=start_ts,
+            end_ts=end_ts,
+            metrics=params.get("metrics"),
+            wan=params.get("wan"),
+            use_observed_tiers=True,
+            newest_first=True,
+        )
+        stream_format = params["format"]
+        try:
+            # Chunked encoding needs HTTP/1.1; the connection still closes after
+            self.protocol_version = "HTTP/1.1"
+            self.close_connection = True
+            self.send_response(200)
+            self.send_header("Content-Type", _HISTORY_STREAM_CONTENT_TYPES[stream_format])
+            self.send_header("Transfer-Encoding", "chunked")
+            self.send_header("Connection", "close")
+            self.end_headers()
+
+            buffer = io.StringIO()
+            csv_writer = None
+            if stream_format == "csv":
+                csv_writer = csv.DictWriter(
+                    buffer, fieldnames=METRIC_ROW_FIELDS, lineterminator="\n"
+                )
+                csv_writer.writeheader()
+            for row in rows:
+                formatted = self._format_metric(row)
+                if csv_writer is not None:
+                    csv_writer.writerow(formatted)
+                else:
+                    buffer.write(json.dumps(formatted) + "\n")
+                if buffer.tell() >= _HISTORY_STREAM_CHUNK_BYTES:
+                    self._write_chunk(buffer.getvalue().encode())
+                    buffer.seek(0)
+                    buffer.truncate()
+            self._write_chunk(buffer.getvalue().encode())
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            logger.debug("Client closed /metrics/history stream early")
+        finally:
+            rows.close()
+
+    def _write_chunk(self, data: bytes) -> None:
+        """Write one chunk of a chunked response (empty data writes nothing)."""
+        if data:
+            self.wfile.write(f"{len(data):X}\r\n".encode() + data + b"\r\n")
+
     def _resolve_history_db_paths(self) -> tuple[list[Path], str]:
         """Resolve the DB set used by /metrics/history.
 
@@ -1167,7 +1427,8 @@ class HealthCheckHandler(BaseHTTPRequestHandler):
         """Parse and validate query parameters from URL.
 
         Returns:
-            Dict with parsed parameters (range, from, to, metrics, wan, limit, offset)
+            Dict with parsed parameters (range, from, to, metrics, wan, summary,
+            exact, format, limit, offset)
 
         Raises:
             ValueError: If any parameter is invalid
@@ -1201,6 +1462,13 @@ class HealthCheckHandler(BaseHTTPRequestHandler):
         if "wan" in query_params:
             result["wan"] = query_params["wan"][0]
 
+        # Parse 'summary' and 'exact' flags
+        result.update(self._parse_summary_flags(query_params))
+
+        # Parse 'format' param (json, or a streamed format)
+        if "format" in query_params:
+            result["format"] = self._parse_format_param(query_params)
+
         # Parse 'limit' param (int, default 1000, max 10000)
         if "limit" in query_params:
             try:
@@ -1250,6 +1518,47 @@ class HealthCheckHandler(BaseHTTPRequestHandler):
             )
         return timedelta(seconds=int(match.group(1)) * units[match.group(2)])
 
+    def _parse_summary_flags(self, query_params: dict[str, list[str]]) -> dict[str, bool]:
+        """Parse the boolean 'summary' and 'exact' query flags.
+
+        Raises:
+            ValueError: If a flag is not 1/true/yes or 0/false/no, or exact is
+                given without summary
+        """
+        flags: dict[str, bool] = {}
+        for name in ("summary", "exact"):
+            if name not in query_params:
+                continue
+            value = query_params[name][0]
+            lowered = value.strip().lower()
+            if lowered in ("1", "true", "yes"):
+                flags[name] = True
+            elif lowered in ("0", "false", "no"):
+                flags[name] = False
+            else:
+                raise ValueError(f"Invalid {name} value: '{value}'. Use 1/true or 0/false")
+        if flags.get("exact") and not flags.get("summary"):
+            raise ValueError("exact requires summary")
+        return flags
+
+    def _parse_format_param(self, query_params: dict[str, list[str]]) -> str:
+        """Parse the 'format' query param: json (default), ndjson or csv.
+
+        Raises:
+            ValueError: If the format is unknown, or a streamed format is
+                combined with summary, limit or offset
+        """
+        value = query_params["format"][0]
+        stream_format = value.strip().lower()
+        if stream_format == "json":
+            return stream_format
+        if stream_format not in _HISTORY_STREAM_CONTENT_TYPES:
+            raise ValueError(f"Invalid format value: '{value}'. Use json, ndjson or csv")
+        for name in ("summary", "limit", "offset"):
+            if name in query_params:
+                raise ValueError(f"{name} is not supported with format={stream_format}")
+        return stream_format
+
     def _parse_iso_timestamp(self, value: str) -> int:
         """Parse ISO 8601 timestamp string into Unix timestamp.
 
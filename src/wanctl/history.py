@@ -9,26 +9,39 @@ Usage:
     wanctl-history --last 24h --metrics wanctl_rtt_ms,wanctl_state
     wanctl-history --from "2026-01-25 14:00" --to "2026-01-25 15:00"
     wanctl-history --last 7d --summary
+    wanctl-history --last 1h --summary --exact
     wanctl-history --last 1h --json
+    wanctl-history --last 7d --ndjson > export.ndjson
+    wanctl-history --last 30d --export history.wca
 """
 
 import argparse
+import csv
 import json
 import logging
+import os
 import re
 import sqlite3
 import sys
 import time
 from collections import Counter
+from collections.abc import Iterable
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import TextIO
 
 from tabulate import tabulate
 
-from wanctl.storage.db_utils import discover_wan_dbs, query_all_wans
+from wanctl.quantile_sketch import QuantileSketch
+from wanctl.storage.archive import write_archive, write_parquet
+from wanctl.storage.db_utils import discover_wan_dbs, iter_all_wans, query_all_wans
+from wanctl.storage.read_pool import acquire_read_connection, release_read_connection
 from wanctl.storage.reader import (
+    METRIC_ROW_FIELDS,
     compute_summary,
     count_metrics,
+    iter_metrics,
+    query_metric_sketches,
     query_metrics,
 )
 from wanctl.storage.writer import DEFAULT_DB_PATH
@@ -187,6 +200,73 @@ def format_json(results: list[dict]) -> str:
     return json.dumps(results, indent=2)
 
 
+def write_ndjson(rows: Iterable[dict], out: TextIO) -> int:
+    """Write metric records as newline-delimited JSON, one row at a time.
+
+    Args:
+        rows: Metric records, e.g. streamed from iter_metrics()
+        out: Text stream to write to
+
+    Returns:
+        Number of rows written
+    """
+    count = 0
+    for row in rows:
+        out.write(json.dumps(row))
+        out.write("\n")
+        count += 1
+    return count
+
+
+def write_csv(rows: Iterable[dict], out: TextIO) -> int:
+    """Write metric records as CSV with a header row, one row at a time.
+
+    Args:
+        rows: Metric records, e.g. streamed from iter_metrics()
+        out: Text stream to write to
+
+    Returns:
+        Number of rows written (excluding the header)
+    """
+    writer = csv.DictWriter(
+        out, fieldnames=METRIC_ROW_FIELDS, extrasaction="ignore", lineterminator="\n"
+    )
+    writer.writeheader()
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+# Map state values to names (matching autorate encoding: GREEN=0, YELLOW=1, etc.)
+_STATE_NAMES = {
+    0: "GREEN",
+    1: "YELLOW",
+    2: "SOFT_RED",
+    3: "RED",
+}
+
+
+def _append_state_lines(output_lines: list[str], counter: Counter[int], total: int) -> None:
+    """Append a state metric's distribution as percentages."""
+    for state_val, count in sorted(counter.items()):
+        state_name = _STATE_NAMES.get(state_val, f"STATE_{state_val}")
+        pct = (count / total) * 100
+        output_lines.append(f"  {state_name}: {pct:.1f}%")
+
+
+def _append_stats_lines(output_lines: list[str], stats: dict) -> None:
+    """Append min/max/avg/p50/p95/p99 lines for a computed summary."""
+    if stats:
+        output_lines.append(f"  min: {format_value(stats['min'])}")
+        output_lines.append(f"  max: {format_value(stats['max'])}")
+        output_lines.append(f"  avg: {format_value(stats['avg'])}")
+        output_lines.append(f"  p50: {format_value(stats['p50'])}")
+        output_lines.append(f"  p95: {format_value(stats['p95'])}")
+        output_lines.append(f"  p99: {format_value(stats['p99'])}")
+
+
 def format_summary(results: list[dict]) -> str:
     """Format query results as summary statistics.
 
@@ -230,29 +310,49 @@ def format_summary(results: list[dict]) -> str:
 
         if is_state_metric:
             # Show state distribution as percentages
-            counter = Counter(int(v) for v in values)
-            total = len(values)
-            # Map state values to names (matching autorate encoding: GREEN=0, YELLOW=1, etc.)
-            state_names = {
-                0: "GREEN",
-                1: "YELLOW",
-                2: "SOFT_RED",
-                3: "RED",
-            }
-            for state_val, count in sorted(counter.items()):
-                state_name = state_names.get(state_val, f"STATE_{state_val}")
-                pct = (count / total) * 100
-                output_lines.append(f"  {state_name}: {pct:.1f}%")
+            _append_state_lines(output_lines, Counter(int(v) for v in values), len(values))
         else:
             # Compute numeric statistics
-            stats = compute_summary(values)
-            if stats:
-                output_lines.append(f"  min: {format_value(stats['min'])}")
-                output_lines.append(f"  max: {format_value(stats['max'])}")
-                output_lines.append(f"  avg: {format_value(stats['avg'])}")
-                output_lines.append(f"  p50: {format_value(stats['p50'])}")
-                output_lines.append(f"  p95: {format_value(stats['p95'])}")
-                output_lines.append(f"  p99: {format_value(stats['p99'])}")
+            _append_stats_lines(output_lines, compute_summary(values))
+
+    return "\n".join(output_lines)
+
+
+def format_sketch_summary(results: list[dict]) -> str:
+    """Format merged summary sketches in format_summary()'s layout.
+
+    Sketches describe the underlying samples whatever tier now stores them,
+    so each metric gets a single section pooled across WANs and tiers.
+
+    Args:
+        results: List of records from query_metric_sketches()
+
+    Returns:
+        Formatted summary string
+    """
+    merged: dict[str, QuantileSketch] = {}
+    for row in results:
+        merged.setdefault(row["metric_name"], QuantileSketch()).merge(row["sketch"])
+
+    output_lines: list[str] = []
+    for metric_name, sketch in sorted(merged.items()):
+        output_lines.append(f"\n{metric_name} ({sketch.count} samples)")
+        output_lines.append("-" * 40)
+
+        is_state_metric = (
+            "state" in metric_name.lower()
+            and 0 <= sketch.min <= sketch.max <= 10
+            and sketch.min == int(sketch.min)
+            and sketch.max == int(sketch.max)
+        )
+        if is_state_metric:
+            # Bucket representatives sit within 1.1% of the integer states
+            counter: Counter[int] = Counter()
+            for value, count in sketch.distribution().items():
+                counter[round(value)] += count
+            _append_state_lines(output_lines, counter, sketch.count)
+        else:
+            _append_stats_lines(output_lines, sketch.summary())
 
     return "\n".join(output_lines)
 
@@ -558,7 +658,11 @@ Examples:
   %(prog)s --last 24h --metrics wanctl_rtt_ms,wanctl_state
   %(prog)s --from "2026-01-25 14:00" --to "2026-01-25 15:00"
   %(prog)s --last 7d --summary
+  %(prog)s --last 1h --summary --exact
   %(prog)s --last 1h --json
+  %(prog)s --last 7d --ndjson > export.ndjson
+  %(prog)s --last 30d --export history.wca
+  %(prog)s --last 30d --export history.parquet --format parquet
   %(prog)s --last 1h --wan spectrum -v
         """,
     )
@@ -652,11 +756,44 @@ Examples:
         action="store_true",
         help="Output as JSON instead of table",
     )
+    output_group.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Stream rows as newline-delimited JSON (constant memory for any range)",
+    )
+    output_group.add_argument(
+        "--csv",
+        dest="csv_output",
+        action="store_true",
+        help="Stream rows as CSV (constant memory for any range)",
+    )
+    output_group.add_argument(
+        "--export",
+        metavar="PATH",
+        type=Path,
+        default=None,
+        help="Write rows to an archive file for offline analysis (see --format)",
+    )
+    output_group.add_argument(
+        "--format",
+        dest="export_format",
+        choices=["columnar", "parquet"],
+        default=None,
+        help=(
+            "With --export: columnar (compact Gorilla-encoded archive, read with "
+            "wanctl.storage.MetricsArchive; default) or parquet (requires pyarrow)"
+        ),
+    )
     output_group.add_argument(
         "--summary",
         action="store_true",
         help="Show summary statistics (min/max/avg/p95) instead of raw data",
     )
+    output_group.add_argument(
+        "--exact",
+        action="store_true",
+        help="With --summary, compute from stored rows instead of the pre-aggregated sketches",
+    )
     output_group.add_argument(
         "-v",
         "--verbose",
@@ -805,7 +942,7 @@ def per_wan_ingestion_rate_bucketed(
         stem = db_path.stem
         wan_name = stem.removeprefix("metrics-") if stem.startswith("metrics-") else stem
         try:
-            conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+            conn = acquire_read_connection(db_path)
             try:
                 where = "WHERE timestamp BETWEEN ? AND ?"
                 params: list[int | str] = [start_ts, end_ts]
@@ -825,7 +962,7 @@ def per_wan_ingestion_rate_bucketed(
                     for metric_name, count in conn.execute(sql, params).fetchall()
                 ]
             finally:
-                conn.close()
+                release_read_connection(conn)
         except (sqlite3.DatabaseError, OSError) as exc:
             logger.warning("Failed bucketed count for %s: %s", db_path.name, exc)
             failures += 1
@@ -1001,6 +1138,97 @@ def _handle_special_query(
     return None
 
 
+def _handle_sketch_summary(
+    args: argparse.Namespace, db_paths: list[Path], start_ts: int, end_ts: int
+) -> int:
+    """Handle --summary from the pre-aggregated sketches (default summary mode)."""
+    metrics_list = [m.strip() for m in args.metrics.split(",")] if args.metrics else None
+    results = query_all_wans(
+        query_metric_sketches,
+        db_paths=db_paths,
+        start_ts=start_ts,
+        end_ts=end_ts,
+        metrics=metrics_list,
+        wan=args.wan,
+    )
+    if getattr(results, "all_failed", False):
+        print("All metrics databases failed to read.", file=sys.stderr)
+        return 1
+    if not results:
+        print("No data found for the specified time range.")
+        return 0
+    print(format_sketch_summary(results))
+    return 0
+
+
+def _check_arg_combinations(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """Reject flags that only apply together with another mode."""
+    if (args.by_table or args.rolling) and not args.ingestion_rate:
+        parser.error("--by-table and --rolling requires --ingestion-rate")
+    if args.exact and not args.summary:
+        parser.error("--exact requires --summary")
+    if args.export_format and args.export is None:
+        parser.error("--format requires --export")
+    exports = [
+        flag
+        for flag, enabled in (
+            ("--ndjson", args.ndjson),
+            ("--csv", args.csv_output),
+            ("--export", args.export is not None),
+        )
+        if enabled
+    ]
+    if not exports:
+        return
+    if len(exports) > 1:
+        parser.error(f"{' and '.join(exports)} are mutually exclusive")
+    if args.json_output or args.summary:
+        parser.error(f"{exports[0]} cannot be combined with --json or --summary")
+    if args.alerts or args.tuning or args.tins or args.ingestion_rate:
+        parser.error(f"{exports[0]} exports metrics rows only")
+
+
+def _handle_stream_export(
+    args: argparse.Namespace, db_paths: list[Path], start_ts: int, end_ts: int
+) -> int:
+    """Handle --ndjson/--csv/--export: stream metrics rows oldest first without buffering them."""
+    metrics_list = [m.strip() for m in args.metrics.split(",")] if args.metrics else None
+    rows = iter_all_wans(
+        iter_metrics,
+        db_paths=db_paths,
+        start_ts=start_ts,
+        end_ts=end_ts,
+        metrics=metrics_list,
+        wan=args.wan,
+        use_observed_tiers=True,
+    )
+    try:
+        if args.export is not None:
+            return _write_export_file(args, rows)
+        writer = write_csv if args.csv_output else write_ndjson
+        writer(rows, sys.stdout)
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # Output closed early (e.g. piped into head); keep exit-time flush quiet
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    finally:
+        rows.close()
+    return 0
+
+
+def _write_export_file(args: argparse.Namespace, rows: Iterable[dict]) -> int:
+    """Write --export PATH in the --format encoding (columnar archive by default)."""
+    export_format = args.export_format or "columnar"
+    writer = write_parquet if export_format == "parquet" else write_archive
+    try:
+        count = writer(rows, args.export)
+    except (ImportError, OSError) as exc:
+        print(f"Export failed: {exc}", file=sys.stderr)
+        return 1
+    print(f"Exported {count} rows to {args.export} ({export_format})")
+    return 0
+
+
 def main() -> int:
     """Main entry point for wanctl-history CLI.
 
@@ -1010,8 +1238,7 @@ def main() -> int:
     parser = create_parser()
     args = parser.parse_args()
 
-    if (args.by_table or args.rolling) and not args.ingestion_rate:
-        parser.error("--by-table and --rolling requires --ingestion-rate")
+    _check_arg_combinations(parser, args)
     if args.rolling:
         try:
             _parse_rolling_seconds(args.rolling)
@@ -1036,6 +1263,12 @@ def main() -> int:
     if special_result is not None:
         return special_result
 
+    if args.ndjson or args.csv_output or args.export is not None:
+        return _handle_stream_export(args, db_paths, start_ts, end_ts)
+
+    if args.summary and not args.exact and not args.json_output:
+        return _handle_sketch_summary(args, db_paths, start_ts, end_ts)
+
     # Parse metrics filter
     metrics_list = None
     if args.metrics:
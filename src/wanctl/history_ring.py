@@ -0,0 +1,141 @@
+"""Fixed-capacity, array-backed ring buffer for numeric state histories.
+
+Steering state keeps short rolling histories (RTT, RTT delta, CAKE drops,
+queue depth) that are appended every cycle and persisted with the state
+file. A deque of boxed floats costs ~40 bytes per sample and had to be
+rebuilt as a list on every save; HistoryRing stores raw machine values in a
+preallocated array.array and overwrites the oldest slot in place.
+
+Persisted form (encode_history / decode_history):
+
+    {"ring": "d", "maxlen": 50, "codec": "zlib",
+     "b64": "<zlib of little-endian values, oldest first>"}
+
+zlib keeps mostly-zero counter histories smaller than their JSON lists.
+decode_history also accepts raw (codec-less) payloads and plain JSON lists,
+so state files written before the compact form (or by external tools) keep
+loading.
+"""
+
+from __future__ import annotations
+
+import base64
+import sys
+import zlib
+from array import array
+from collections import deque
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+
+class HistoryRing:
+    """Bounded history of numbers with deque-like append/iterate/index.
+
+    Args:
+        typecode: array.array typecode ("d" for floats, "q" for counters)
+        maxlen: Capacity; the oldest value is evicted once full
+        values: Initial values (only the newest ``maxlen`` are kept)
+    """
+
+    __slots__ = ("typecode", "maxlen", "_data", "_start", "_len", "_encoded")
+
+    def __init__(self, typecode: str, maxlen: int, values: Iterable[float] = ()) -> None:
+        if maxlen < 1:
+            raise ValueError(f"maxlen must be >= 1, got {maxlen}")
+        self.typecode = typecode
+        self.maxlen = maxlen
+        self._data: array[Any] = array(typecode, bytes(array(typecode).itemsize * maxlen))
+        self._start = 0
+        self._len = 0
+        self._encoded: dict[str, Any] | None = None
+        for value in values:
+            self.append(value)
+
+    def append(self, value: float) -> None:
+        """Append a value, evicting the oldest when full."""
+        idx = (self._start + self._len) % self.maxlen
+        try:
+            self._data[idx] = value
+        except TypeError:
+            # Integer rings accept float-typed counters
+            self._data[idx] = int(value)
+        if self._len < self.maxlen:
+            self._len += 1
+        else:
+            self._start = (self._start + 1) % self.maxlen
+        self._encoded = None
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[float]:
+        data, start, maxlen = self._data, self._start, self.maxlen
+        for i in range(self._len):
+            yield data[(start + i) % maxlen]
+
+    def __getitem__(self, index: int) -> float:
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("HistoryRing index out of range")
+        value: float = self._data[(self._start + index) % self.maxlen]
+        return value
+
+    def __repr__(self) -> str:
+        return f"HistoryRing({self.typecode!r}, maxlen={self.maxlen}, {self.tolist()!r})"
+
+    def _ordered(self) -> array[Any]:
+        """Return the values oldest-first as a new array."""
+        end = self._start + self._len
+        if end <= self.maxlen:
+            return self._data[self._start : end]
+        return self._data[self._start :] + self._data[: end - self.maxlen]
+
+    def tolist(self) -> list[float]:
+        """Return the values oldest-first as a list."""
+        return self._ordered().tolist()
+
+    def encode(self) -> dict[str, Any]:
+        """Return the compact persisted form (cached until the next append)."""
+        if self._encoded is None:
+            values = self._ordered()
+            if sys.byteorder == "big":
+                values.byteswap()
+            self._encoded = {
+                "ring": self.typecode,
+                "maxlen": self.maxlen,
+                "codec": "zlib",
+                "b64": base64.b64encode(zlib.compress(values.tobytes())).decode("ascii"),
+            }
+        return self._encoded
+
+
+def encode_history(value: Any) -> Any:
+    """Return the persisted form of a history value (deques become lists)."""
+    if isinstance(value, HistoryRing):
+        return value.encode()
+    if isinstance(value, deque):
+        return list(value)
+    return value
+
+
+def decode_history(value: Any) -> list[float] | None:
+    """Return the values of a persisted history, or None if unrecognized.
+
+    Accepts the compact {"ring", "b64"} form and plain JSON lists.
+    """
+    if isinstance(value, list):
+        return value
+    if not isinstance(value, dict) or "b64" not in value:
+        return None
+    try:
+        payload = base64.b64decode(value["b64"], validate=True)
+        if value.get("codec") == "zlib":
+            payload = zlib.decompress(payload)
+        values: array[Any] = array(value.get("ring", "d"))
+        values.frombytes(payload)
+    except (TypeError, ValueError, zlib.error):
+        return None
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values.tolist()
@@ -11,9 +11,13 @@ from __future__ import annotations
 
 import logging
 import threading
+from typing import TYPE_CHECKING
 
 from wanctl.irtt_measurement import IRTTMeasurement, IRTTResult
-from wanctl.perf_profiler import OperationProfiler
+from wanctl.perf_profiler import ArrayOperationProfiler
+
+if TYPE_CHECKING:
+    from wanctl.measurement_scheduler import MeasurementSlot
 
 
 class IRTTThread:
@@ -24,6 +28,8 @@ class IRTTThread:
         cadence_sec: Seconds between measurement bursts.
         shutdown_event: :class:`threading.Event` that signals graceful shutdown.
         logger: Logger for lifecycle and error messages.
+        schedule: Optional :class:`MeasurementSlot` that plans each next
+            burst start instead of the fixed *cadence_sec* wait.
     """
 
     def __init__(
@@ -32,14 +38,16 @@ class IRTTThread:
         cadence_sec: float,
         shutdown_event: threading.Event,
         logger: logging.Logger,
+        schedule: MeasurementSlot | None = None,
     ) -> None:
         self._measurement = measurement
         self._cadence_sec = cadence_sec
         self._shutdown_event = shutdown_event
         self._logger = logger
+        self._schedule = schedule
         self._cached_result: IRTTResult | None = None
         self._last_attempt_succeeded: bool | None = None
-        self._profiler = OperationProfiler(max_samples=1200)
+        self._profiler = ArrayOperationProfiler(max_samples=1200)
         self._thread: threading.Thread | None = None
 
     # ------------------------------------------------------------------
@@ -85,11 +93,11 @@ class IRTTThread:
 
     def _run(self) -> None:
         """Measurement loop -- runs until *shutdown_event* is set."""
+        import time
+
         while not self._shutdown_event.is_set():
+            t0 = time.perf_counter()
             try:
-                import time
-
-                t0 = time.perf_counter()
                 result = self._measurement.measure()
                 elapsed_ms = (time.perf_counter() - t0) * 1000.0
                 self._profiler.record("irtt_background_cycle", elapsed_ms)
@@ -99,4 +107,7 @@ class IRTTThread:
             except Exception:
                 self._last_attempt_succeeded = False
                 self._logger.debug("IRTT measurement error", exc_info=True)
-            self._shutdown_event.wait(timeout=self._cadence_sec)
+            if self._schedule is not None:
+                self._schedule.wait_next(time.perf_counter() - t0, self._shutdown_event)
+            else:
+                self._shutdown_event.wait(timeout=self._cadence_sec)
@@ -0,0 +1,250 @@
+"""Phase-aligned, load-adaptive cadence for background measurement threads.
+
+The RTT, CAKE stats, fping and IRTT producers each used to wait a fixed
+cadence after every measurement, so the snapshot the control loop read was
+anywhere between fresh and one full cadence old, and probing ran at the same
+rate whether the link was idle or congested.
+
+One MeasurementScheduler is shared by every producer in the daemon:
+
+- The daemon loop reports each cycle start (mark_cycle), which fixes the
+  phase of the grid of control-loop reads.
+- Each producer holds a MeasurementSlot and calls wait_next() after every
+  measurement. The slot plans the next start so the measurement finishes
+  lead_margin before a cycle read, using a conservative estimate of its own
+  duration, on the read nearest one cadence after the previous target.
+- WANController reports its zones every cycle (report_zones). The cadence
+  is multiplied by busy_cadence_factor while a zone is YELLOW/SOFT_RED/RED,
+  and by idle_cadence_factor once the WAN has been GREEN for idle_after_sec,
+  never below the slot's minimum cadence.
+- Consumers record the snapshot age they read (observe_age), reported per
+  source in /health.
+
+Until the first mark_cycle() a slot falls back to a plain fixed-cadence wait.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from typing import Any
+
+from wanctl.perf_profiler import ArrayOperationProfiler
+
+# Source name of the process-wide IRTT thread (per-WAN producers use "<wan>:<kind>")
+IRTT_SCHEDULE_SOURCE = "irtt"
+
+_CONGESTED_ZONES = frozenset({"YELLOW", "SOFT_RED", "RED"})
+
+# Longest single wait before re-planning, so zone changes reach slow producers
+_MAX_WAIT_CHUNK_SEC = 1.0
+
+# Weight of a faster-than-expected measurement in the duration estimate.
+# Slower measurements replace the estimate outright.
+_DURATION_DECAY = 0.1
+
+
+class MeasurementSlot:
+    """Next-start planner for one background producer.
+
+    Created by :meth:`MeasurementScheduler.register`; not constructed directly.
+    """
+
+    def __init__(
+        self,
+        scheduler: MeasurementScheduler,
+        source: str,
+        cadence_sec: float,
+        wan: str | None,
+        min_cadence_sec: float,
+    ) -> None:
+        self.source = source
+        self.wan = wan
+        self.cadence_sec = cadence_sec
+        self.min_cadence_sec = min_cadence_sec
+        self._scheduler = scheduler
+        self._expected_sec = 0.0
+        self._target_read: float | None = None
+        self._last_start: float | None = None
+
+    @property
+    def effective_cadence_sec(self) -> float:
+        """Cadence after the congestion factor and the minimum-cadence floor."""
+        factor = self._scheduler.cadence_factor(self.wan)
+        return max(self.min_cadence_sec, self.cadence_sec * factor)
+
+    def wait_next(
+        self,
+        elapsed_sec: float,
+        shutdown_event: threading.Event,
+        min_delay_sec: float = 0.0,
+    ) -> None:
+        """Wait until the next planned measurement start, or shutdown.
+
+        Args:
+            elapsed_sec: Duration of the measurement that just finished
+            shutdown_event: Ends the wait early when set
+            min_delay_sec: Lower bound on the wait (e.g. blackout backoff)
+        """
+        now = time.monotonic()
+        self._record_duration(elapsed_sec)
+        if self._last_start is None:
+            self._last_start = now - elapsed_sec
+        floor = now + min_delay_sec
+        while True:
+            now = time.monotonic()
+            start, target = self._plan(now)
+            start = max(start, floor)
+            remaining = start - now
+            if remaining <= 0:
+                break
+            if shutdown_event.wait(timeout=min(remaining, _MAX_WAIT_CHUNK_SEC)):
+                return
+        self._target_read = target
+        self._last_start = time.monotonic()
+
+    def _record_duration(self, elapsed_sec: float) -> None:
+        if elapsed_sec >= self._expected_sec:
+            self._expected_sec = elapsed_sec
+        else:
+            self._expected_sec += _DURATION_DECAY * (elapsed_sec - self._expected_sec)
+
+    def _plan(self, now: float) -> tuple[float, float | None]:
+        """Return (start, targeted read) for the next measurement."""
+        cadence = self.effective_cadence_sec
+        anchor = self._scheduler.cycle_anchor
+        if anchor is None:
+            assert self._last_start is not None
+            return self._last_start + cadence, None
+
+        interval = self._scheduler.cycle_interval_sec
+        lead = self._expected_sec + self._scheduler.lead_margin_sec
+        k = math.ceil((now + lead - anchor) / interval)
+        if self._target_read is not None:
+            k = max(k, round((self._target_read + cadence - anchor) / interval))
+        target = anchor + k * interval
+        return target - lead, target
+
+    def get_status(self) -> dict[str, Any]:
+        """Return cadence, duration estimate and consumption age for this producer."""
+        return {
+            "wan": self.wan,
+            "cadence_sec": self.cadence_sec,
+            "effective_cadence_sec": round(self.effective_cadence_sec, 4),
+            "expected_duration_ms": round(self._expected_sec * 1000.0, 3),
+            "age_at_read_ms": self._scheduler.age_stats(self.source),
+        }
+
+
+class MeasurementScheduler:
+    """Shared read-grid phase and congestion state for background producers.
+
+    Args:
+        cycle_interval_sec: Control-loop cycle interval
+        idle_after_sec: Seconds of all-GREEN before the idle factor applies
+        idle_cadence_factor: Cadence multiplier while idle (>= 1.0)
+        busy_cadence_factor: Cadence multiplier while congested (<= 1.0)
+        lead_margin_sec: Slack between a measurement's expected finish and the read
+    """
+
+    def __init__(
+        self,
+        cycle_interval_sec: float,
+        *,
+        idle_after_sec: float = 60.0,
+        idle_cadence_factor: float = 2.0,
+        busy_cadence_factor: float = 0.5,
+        lead_margin_sec: float = 0.005,
+    ) -> None:
+        self.cycle_interval_sec = cycle_interval_sec
+        self.idle_after_sec = idle_after_sec
+        self.idle_cadence_factor = idle_cadence_factor
+        self.busy_cadence_factor = busy_cadence_factor
+        self.lead_margin_sec = lead_margin_sec
+        self.cycle_anchor: float | None = None
+        self._slots: dict[str, MeasurementSlot] = {}
+        self._congested: dict[str, bool] = {}
+        self._last_congested: dict[str, float] = {}
+        self._ages = ArrayOperationProfiler(max_samples=1200)
+
+    def register(
+        self,
+        source: str,
+        cadence_sec: float,
+        *,
+        wan: str | None = None,
+        min_cadence_sec: float | None = None,
+    ) -> MeasurementSlot:
+        """Create the slot for a producer.
+
+        Args:
+            source: Unique producer name, also the key for observe_age()
+            cadence_sec: Configured cadence of the producer
+            wan: WAN whose zones drive the cadence; None follows all WANs
+            min_cadence_sec: Floor for the adapted cadence (default: cycle interval)
+        """
+        if min_cadence_sec is None:
+            min_cadence_sec = self.cycle_interval_sec
+        slot = MeasurementSlot(self, source, cadence_sec, wan, min_cadence_sec)
+        self._slots[source] = slot
+        return slot
+
+    def mark_cycle(self, now: float | None = None) -> None:
+        """Record the start of a control-loop cycle (time.monotonic())."""
+        self.cycle_anchor = time.monotonic() if now is None else now
+
+    def report_zones(self, wan: str, dl_zone: str, ul_zone: str, now: float | None = None) -> None:
+        """Record one cycle's congestion zones for a WAN."""
+        if now is None:
+            now = time.monotonic()
+        congested = dl_zone in _CONGESTED_ZONES or ul_zone in _CONGESTED_ZONES
+        if congested or wan not in self._last_congested:
+            self._last_congested[wan] = now
+        self._congested[wan] = congested
+
+    def mode(self, wan: str | None = None) -> str:
+        """Return "busy", "idle" or "normal" for a WAN, or across all WANs."""
+        wans = [wan] if wan in self._congested else list(self._congested)
+        if not wans:
+            return "normal"
+        if any(self._congested[w] for w in wans):
+            return "busy"
+        now = time.monotonic()
+        if all(now - self._last_congested[w] >= self.idle_after_sec for w in wans):
+            return "idle"
+        return "normal"
+
+    def cadence_factor(self, wan: str | None = None) -> float:
+        """Return the cadence multiplier for the current mode."""
+        mode = self.mode(wan)
+        if mode == "busy":
+            return self.busy_cadence_factor
+        if mode == "idle":
+            return self.idle_cadence_factor
+        return 1.0
+
+    def observe_age(self, source: str, age_sec: float) -> None:
+        """Record the age of a producer's snapshot at the moment it was read."""
+        if source in self._slots:
+            self._ages.record(source, age_sec * 1000.0)
+
+    def age_stats(self, source: str) -> dict[str, Any]:
+        """Return snapshot age-at-read stats for a producer."""
+        return self._ages.stats(source)
+
+    def get_status(self, wan: str | None = None) -> dict[str, Any]:
+        """Return scheduler mode and per-producer status.
+
+        Args:
+            wan: Limit sources to this WAN's producers plus shared ones
+        """
+        return {
+            "mode": self.mode(wan),
+            "cadence_factor": self.cadence_factor(wan),
+            "sources": {
+                source: slot.get_status()
+                for source, slot in self._slots.items()
+                if wan is None or slot.wan in (None, wan)
+            },
+        }
@@ -3,7 +3,9 @@ Simple Prometheus-compatible metrics exporter.
 
 Provides a lightweight HTTP endpoint for Prometheus scraping without
 requiring the prometheus_client library. Follows the Prometheus text
-exposition format (v0.0.4).
+exposition format (v0.0.4), or OpenMetrics 1.0 when enabled and requested
+via the Accept header. Responses are gzip-compressed for scrapers that send
+Accept-Encoding: gzip.
 
 Usage:
     from wanctl.metrics import metrics, start_metrics_server
@@ -15,38 +17,393 @@ Usage:
     metrics.set_gauge('wanctl_bandwidth_mbps', 750.5, labels={'wan': 'spectrum', 'direction': 'download'})
     metrics.inc_counter('wanctl_cycles_total', labels={'wan': 'spectrum'})
 
+    # Hot paths: intern the series once, then update through the handle
+    cycles = metrics.counter('wanctl_cycles_total', labels={'wan': 'spectrum'})
+    cycles.inc()
+
     # Metrics are automatically exposed at http://127.0.0.1:9100/metrics
 """
 
+import gzip
 import logging
 import threading
+from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_left
 from collections.abc import Callable
 from http.server import BaseHTTPRequestHandler, HTTPServer
-from typing import Any
+from itertools import accumulate
+from typing import Any, NamedTuple, TypeVar
 
 from wanctl.runtime_pressure import get_storage_file_snapshot, read_process_resident_memory_bytes
 
 logger = logging.getLogger(__name__)
 
+TEXT_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# Default histogram upper bounds (seconds), sized around the 50ms control cycle
+DEFAULT_LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.02,
+    0.03,
+    0.04,
+    0.05,
+    0.075,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+)
+DEFAULT_QUANTILES = (0.5, 0.9, 0.99)
+# Summary sliding window in observations (60s of 50ms cycles)
+DEFAULT_SUMMARY_WINDOW = 1200
+
+
+class _SeriesBase(ABC):
+    """Interned series state shared by every metric type.
+
+    render() returns the exposition text for the series (one or more lines),
+    or None while the series has no value.
+    """
+
+    __slots__ = ("key", "base", "dirty", "index")
+
+    def __init__(self, key: str, base: str) -> None:
+        self.key = key
+        self.base = base
+        self.dirty = False
+        # Line position in the cached exposition, -1 when not laid out
+        self.index = -1
+
+    @abstractmethod
+    def render(self, openmetrics: bool) -> str | None: ...
+
+    @abstractmethod
+    def clear(self) -> None: ...
+
+
+class _Series(_SeriesBase):
+    """One gauge/counter sample with its pre-rendered exposition line prefixes."""
+
+    __slots__ = ("value", "prefix", "om_prefix")
+
+    def __init__(self, key: str, base: str, kind: str) -> None:
+        super().__init__(key, base)
+        # None until first set/inc (and again after reset); unset series are not exposed
+        self.value: float | None = None
+        self.prefix = f"{key} "
+        if kind == "counter" and not base.endswith("_total"):
+            # OpenMetrics counter samples always carry the _total suffix
+            self.om_prefix = f"{base}_total{key[len(base) :]} "
+        else:
+            self.om_prefix = self.prefix
+
+    def render(self, openmetrics: bool) -> str | None:
+        if self.value is None:
+            return None
+        return (self.om_prefix if openmetrics else self.prefix) + f"{self.value}"
+
+    def clear(self) -> None:
+        self.value = None
+
+
+def _label_parts(key: str, base: str) -> tuple[str, str]:
+    """Return ("{labels}", "labels,") for a series key (both empty without labels)."""
+    inner = key[len(base) + 1 : -1]
+    if not inner:
+        return "", ""
+    return f"{{{inner}}}", f"{inner},"
+
+
+class _Histogram(_SeriesBase):
+    """Cumulative histogram with a preallocated per-bucket count array.
+
+    counts[i] holds observations in (bounds[i-1], bounds[i]]; the extra last
+    slot is the +Inf overflow. Cumulative bucket values are only summed when
+    the series is rendered.
+    """
+
+    __slots__ = (
+        "bounds",
+        "counts",
+        "sum",
+        "count",
+        "_bucket_prefixes",
+        "_sum_prefix",
+        "_count_prefix",
+    )
+
+    def __init__(self, key: str, base: str, bounds: tuple[float, ...]) -> None:
+        super().__init__(key, base)
+        self.bounds = tuple(sorted(float(b) for b in bounds))
+        self.counts: array[int] = array("Q", bytes(8 * (len(self.bounds) + 1)))
+        self.sum = 0.0
+        self.count = 0
+        labels, label_prefix = _label_parts(key, base)
+        self._bucket_prefixes = [
+            f'{base}_bucket{{{label_prefix}le="{le}"}} '
+            for le in [*(repr(b) for b in self.bounds), "+Inf"]
+        ]
+        self._sum_prefix = f"{base}_sum{labels} "
+        self._count_prefix = f"{base}_count{labels} "
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def render(self, openmetrics: bool) -> str | None:
+        if not self.count:
+            return None
+        cumulative = accumulate(self.counts)
+        lines = [
+            prefix + f"{total}"
+            for prefix, total in zip(self._bucket_prefixes, cumulative, strict=True)
+        ]
+        lines.append(self._sum_prefix + f"{self.sum}")
+        lines.append(self._count_prefix + f"{self.count}")
+        return "\n".join(lines)
+
+    def clear(self) -> None:
+        for i in range(len(self.counts)):
+            self.counts[i] = 0
+        self.sum = 0.0
+        self.count = 0
+
+
+class _Summary(_SeriesBase):
+    """Quantile summary over a sliding window held in a preallocated ring.
+
+    Quantiles use OperationProfiler's rank rule (sorted[int(q * (n - 1))]) and
+    are computed only when the series is rendered; _sum/_count are lifetime.
+    """
+
+    __slots__ = (
+        "quantiles",
+        "ring",
+        "pos",
+        "size",
+        "sum",
+        "count",
+        "_quantile_prefixes",
+        "_sum_prefix",
+        "_count_prefix",
+    )
+
+    def __init__(self, key: str, base: str, quantiles: tuple[float, ...], window: int) -> None:
+        super().__init__(key, base)
+        self.quantiles = tuple(quantiles)
+        self.ring: array[float] = array("d", bytes(8 * max(1, window)))
+        self.pos = 0
+        self.size = 0
+        self.sum = 0.0
+        self.count = 0
+        labels, label_prefix = _label_parts(key, base)
+        self._quantile_prefixes = [
+            f'{base}{{{label_prefix}quantile="{q!r}"}} ' for q in self.quantiles
+        ]
+        self._sum_prefix = f"{base}_sum{labels} "
+        self._count_prefix = f"{base}_count{labels} "
+
+    def observe(self, value: float) -> None:
+        ring = self.ring
+        ring[self.pos] = value
+        self.pos = (self.pos + 1) % len(ring)
+        if self.size < len(ring):
+            self.size += 1
+        self.sum += value
+        self.count += 1
+
+    def render(self, openmetrics: bool) -> str | None:
+        if not self.count:
+            return None
+        window = sorted(self.ring[: self.size])
+        last = len(window) - 1
+        lines = [
+            prefix + f"{window[int(q * last)]}"
+            for prefix, q in zip(self._quantile_prefixes, self.quantiles, strict=True)
+        ]
+        lines.append(self._sum_prefix + f"{self.sum}")
+        lines.append(self._count_prefix + f"{self.count}")
+        return "\n".join(lines)
+
+    def clear(self) -> None:
+        self.pos = 0
+        self.size = 0
+        self.sum = 0.0
+        self.count = 0
+
+
+_S = TypeVar("_S", bound=_SeriesBase)
+
+
+class GaugeHandle:
+    """Interned gauge series. set() updates the value in place."""
+
+    __slots__ = ("_registry", "_series")
+
+    def __init__(self, registry: "MetricsRegistry", series: _Series) -> None:
+        self._registry = registry
+        self._series = series
+
+    def set(self, value: float) -> None:
+        """Set the gauge value."""
+        self._registry._store(self._series, value)
+
+
+class CounterHandle:
+    """Interned counter series. inc() adds to the value in place."""
+
+    __slots__ = ("_registry", "_series")
+
+    def __init__(self, registry: "MetricsRegistry", series: _Series) -> None:
+        self._registry = registry
+        self._series = series
+
+    def inc(self, value: int = 1) -> None:
+        """Increment the counter."""
+        self._registry._add(self._series, value)
+
+
+class ObserverHandle:
+    """Interned histogram or summary series. observe() records one value."""
+
+    __slots__ = ("_registry", "_series")
+
+    def __init__(self, registry: "MetricsRegistry", series: _Histogram | _Summary) -> None:
+        self._registry = registry
+        self._series = series
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        self._registry._observe(self._series, value)
+
 
 class MetricsRegistry:
     """
-    Thread-safe metrics registry supporting Prometheus-style gauges and counters.
+    Thread-safe metrics registry supporting Prometheus-style gauges, counters,
+    histograms and summaries.
 
     Gauges represent point-in-time values that can go up or down.
     Counters represent monotonically increasing values (e.g., total events).
+    Histograms count observations into fixed cumulative buckets, so latency
+    distributions aggregate across series and time windows in PromQL.
+    Summaries report quantiles over a recent window of observations.
+
+    Each (name, labels) pair is interned once into a series that carries its
+    pre-rendered "name{labels} " prefix, so updates only store a number. The
+    exposition text is cached line by line: a scrape re-renders only the
+    series updated since the previous scrape, and re-sorts only when a
+    series or HELP text was added. gauge()/counter()/histogram()/summary()
+    return handles for hot paths that skip even the intern lookup.
 
     All methods are thread-safe for concurrent access from multiple threads.
     """
 
+    # Exposition order of metric types
+    _KINDS = ("gauge", "counter", "histogram", "summary")
+
     def __init__(self) -> None:
         """Initialize empty metrics registry with thread lock."""
-        self._gauges: dict[str, float] = {}
-        self._counters: dict[str, int] = {}
+        self._gauges: dict[str, _Series] = {}
+        self._counters: dict[str, _Series] = {}
+        self._histograms: dict[str, _Histogram] = {}
+        self._summaries: dict[str, _Summary] = {}
+        self._interned: dict[tuple[str, str, tuple[tuple[str, str], ...]], Any] = {}
         self._gauge_help: dict[str, str] = {}
         self._counter_help: dict[str, str] = {}
+        self._histogram_help: dict[str, str] = {}
+        self._summary_help: dict[str, str] = {}
+        self._tables: dict[str, dict[str, Any]] = {
+            "gauge": self._gauges,
+            "counter": self._counters,
+            "histogram": self._histograms,
+            "summary": self._summaries,
+        }
+        self._helps = {
+            "gauge": self._gauge_help,
+            "counter": self._counter_help,
+            "histogram": self._histogram_help,
+            "summary": self._summary_help,
+        }
         self._scrape_callbacks: dict[str, Callable[[], None]] = {}
         self._lock = threading.Lock()
+        # Exposition cache: text and OpenMetrics lines share one layout
+        self._lines: list[str] = []
+        self._om_lines: list[str] = []
+        self._dirty: list[_SeriesBase] = []
+        self._layout_stale = False
+        self._bodies: dict[bool, str] = {}
+        self._encoded: dict[tuple[bool, bool], bytes] = {}
+
+    def gauge(
+        self,
+        name: str,
+        labels: dict[str, str] | None = None,
+        help_text: str | None = None,
+    ) -> GaugeHandle:
+        """Return the interned handle for a gauge series (not exposed until set)."""
+        with self._lock:
+            self._set_help("gauge", name, help_text)
+            return GaugeHandle(self, self._intern_value("gauge", name, labels))
+
+    def counter(
+        self,
+        name: str,
+        labels: dict[str, str] | None = None,
+        help_text: str | None = None,
+    ) -> CounterHandle:
+        """Return the interned handle for a counter series (not exposed until inc)."""
+        with self._lock:
+            self._set_help("counter", name, help_text)
+            return CounterHandle(self, self._intern_value("counter", name, labels))
+
+    def histogram(
+        self,
+        name: str,
+        labels: dict[str, str] | None = None,
+        help_text: str | None = None,
+        buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ) -> ObserverHandle:
+        """Return the interned handle for a histogram series.
+
+        The bucket bounds are fixed when the series is first created; later
+        calls for the same series reuse them.
+        """
+        with self._lock:
+            self._set_help("histogram", name, help_text)
+            series = self._intern(
+                "histogram", name, labels, lambda key, base: _Histogram(key, base, buckets)
+            )
+            return ObserverHandle(self, series)
+
+    def summary(
+        self,
+        name: str,
+        labels: dict[str, str] | None = None,
+        help_text: str | None = None,
+        quantiles: tuple[float, ...] = DEFAULT_QUANTILES,
+        window: int = DEFAULT_SUMMARY_WINDOW,
+    ) -> ObserverHandle:
+        """Return the interned handle for a summary series.
+
+        Quantiles are computed over the last ``window`` observations; the
+        settings are fixed when the series is first created.
+        """
+        with self._lock:
+            self._set_help("summary", name, help_text)
+            series = self._intern(
+                "summary",
+                name,
+                labels,
+                lambda key, base: _Summary(key, base, quantiles, window),
+            )
+            return ObserverHandle(self, series)
 
     def set_gauge(
         self,
@@ -64,11 +421,9 @@ class MetricsRegistry:
             labels: Optional label dict (e.g., {'wan': 'spectrum', 'direction': 'download'})
             help_text: Optional HELP description for the metric
         """
-        key = self._make_key(name, labels)
         with self._lock:
-            self._gauges[key] = value
-            if help_text and name not in self._gauge_help:
-                self._gauge_help[name] = help_text
+            self._store_locked(self._intern_value("gauge", name, labels), value)
+            self._set_help("gauge", name, help_text)
 
     def inc_counter(
         self,
@@ -86,11 +441,36 @@ class MetricsRegistry:
             value: Amount to increment (default: 1)
             help_text: Optional HELP description for the metric
         """
-        key = self._make_key(name, labels)
         with self._lock:
-            self._counters[key] = self._counters.get(key, 0) + value
-            if help_text and name not in self._counter_help:
-                self._counter_help[name] = help_text
+            series = self._intern_value("counter", name, labels)
+            self._store_locked(series, (series.value or 0) + value)
+            self._set_help("counter", name, help_text)
+
+    def observe_histogram(
+        self,
+        name: str,
+        value: float,
+        labels: dict[str, str] | None = None,
+        help_text: str | None = None,
+        buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        """
+        Record one histogram observation.
+
+        Args:
+            name: Metric name (e.g., 'wanctl_router_write_duration_seconds')
+            value: Observed value
+            labels: Optional label dict
+            help_text: Optional HELP description for the metric
+            buckets: Bucket upper bounds, used when the series is first created
+        """
+        with self._lock:
+            series = self._intern(
+                "histogram", name, labels, lambda key, base: _Histogram(key, base, buckets)
+            )
+            series.observe(value)
+            self._mark_locked(series)
+            self._set_help("histogram", name, help_text)
 
     def get_gauge(self, name: str, labels: dict[str, str] | None = None) -> float | None:
         """
@@ -105,7 +485,8 @@ class MetricsRegistry:
         """
         key = self._make_key(name, labels)
         with self._lock:
-            return self._gauges.get(key)
+            series = self._gauges.get(key)
+            return series.value if series is not None else None
 
     def get_counter(self, name: str, labels: dict[str, str] | None = None) -> int | None:
         """
@@ -120,8 +501,10 @@ class MetricsRegistry:
         """
         key = self._make_key(name, labels)
         with self._lock:
-            return self._counters.get(key)
-
+            series = self._counters.get(key)
+            if series is None or series.value is None:
+                return None
+            return int(series.value)
 
     def register_scrape_callback(self, name: str, callback: Callable[[], None]) -> None:
         """Register a callback invoked before metrics exposition."""
@@ -146,16 +529,134 @@ class MetricsRegistry:
             return key.split("{")[0]
         return key
 
-    def exposition(self) -> str:
-        """
-        Generate Prometheus text exposition format output.
+    def _intern(
+        self,
+        kind: str,
+        name: str,
+        labels: dict[str, str] | None,
+        factory: Callable[[str, str], _S],
+    ) -> _S:
+        """Return the series for (name, labels), creating it on first use.
 
-        Returns:
-            String in Prometheus exposition format (v0.0.4)
+        The intern key keeps the caller's label order, so repeat calls skip
+        the sort/format in _make_key. Caller holds the lock.
         """
+        intern_key = (kind, name, tuple(labels.items()) if labels else ())
+        series: _S | None = self._interned.get(intern_key)
+        if series is None:
+            key = self._make_key(name, labels)
+            table = self._tables[kind]
+            series = table.get(key)
+            if series is None:
+                series = table[key] = factory(key, self._extract_base_name(key))
+            self._interned[intern_key] = series
+        return series
+
+    def _intern_value(self, kind: str, name: str, labels: dict[str, str] | None) -> _Series:
+        return self._intern(kind, name, labels, lambda key, base: _Series(key, base, kind))
+
+    def _set_help(self, kind: str, name: str, help_text: str | None) -> None:
+        """Store HELP text on first use (caller holds the lock)."""
+        helps = self._helps[kind]
+        if help_text and name not in helps:
+            helps[name] = help_text
+            self._layout_stale = True
+
+    def _store(self, series: _Series, value: float) -> None:
+        with self._lock:
+            self._store_locked(series, value)
+
+    def _add(self, series: _Series, value: int) -> None:
+        with self._lock:
+            self._store_locked(series, (series.value or 0) + value)
+
+    def _observe(self, series: _Histogram | _Summary, value: float) -> None:
+        with self._lock:
+            series.observe(value)
+            self._mark_locked(series)
+
+    def _store_locked(self, series: _Series, value: float) -> None:
+        series.value = value
+        self._mark_locked(series)
+
+    def _mark_locked(self, series: _SeriesBase) -> None:
+        """Queue a changed series for re-rendering (caller holds the lock)."""
+        if series.index < 0:
+            self._layout_stale = True
+        elif not series.dirty:
+            series.dirty = True
+            self._dirty.append(series)
+
+    def _family_header(self, kind: str, base: str) -> tuple[list[str], list[str]]:
+        """Return the HELP/TYPE lines for a metric family (text, OpenMetrics)."""
+        family = base
+        if kind == "counter" and base.endswith("_total"):
+            family = base[: -len("_total")]
+        lines: list[str] = []
+        om_lines: list[str] = []
+        helps = self._helps[kind]
+        if base in helps:
+            lines.append(f"# HELP {base} {helps[base]}")
+            om_lines.append(f"# HELP {family} {helps[base]}")
+        lines.append(f"# TYPE {base} {kind}")
+        om_lines.append(f"# TYPE {family} {kind}")
+        return lines, om_lines
+
+    def _rebuild_layout(self) -> None:
+        """Re-sort all series and render every line (new series or HELP text)."""
         lines: list[str] = []
+        om_lines: list[str] = []
         emitted_help: set[str] = set()
-
+        for kind in self._KINDS:
+            table = self._tables[kind]
+            for key in sorted(table):
+                series = table[key]
+                series.dirty = False
+                text = series.render(False)
+                if text is None:
+                    series.index = -1
+                    continue
+                if series.base not in emitted_help:
+                    header, om_header = self._family_header(kind, series.base)
+                    lines.extend(header)
+                    om_lines.extend(om_header)
+                    emitted_help.add(series.base)
+                series.index = len(lines)
+                lines.append(text)
+                om_lines.append(series.render(True) or "")
+        self._lines = lines
+        self._om_lines = om_lines
+
+    def _refresh(self) -> None:
+        """Bring the cached lines up to date (caller holds the lock)."""
+        if self._layout_stale:
+            self._rebuild_layout()
+            self._layout_stale = False
+        elif self._dirty:
+            lines, om_lines = self._lines, self._om_lines
+            for series in self._dirty:
+                lines[series.index] = series.render(False) or ""
+                om_lines[series.index] = series.render(True) or ""
+                series.dirty = False
+        else:
+            return
+        self._dirty.clear()
+        self._bodies.clear()
+        self._encoded.clear()
+
+    def _body(self, openmetrics: bool) -> str:
+        """Return the cached exposition body (caller holds the lock)."""
+        self._refresh()
+        body = self._bodies.get(openmetrics)
+        if body is None:
+            if openmetrics:
+                body = "\n".join(self._om_lines + ["# EOF"]) + "\n"
+            else:
+                body = "\n".join(self._lines) + "\n" if self._lines else ""
+            self._bodies[openmetrics] = body
+        return body
+
+    def _run_scrape_callbacks(self) -> None:
         with self._lock:
             callbacks = list(self._scrape_callbacks.values())
 
@@ -165,34 +666,52 @@ class MetricsRegistry:
             except Exception:
                 logger.warning("Metrics scrape callback failed", exc_info=True)
 
+    def exposition(self, openmetrics: bool = False) -> str:
+        """
+        Generate Prometheus text exposition format output.
+
+        Args:
+            openmetrics: Emit OpenMetrics 1.0 text instead of Prometheus v0.0.4
+
+        Returns:
+            String in Prometheus exposition format (v0.0.4) or OpenMetrics
+        """
+        self._run_scrape_callbacks()
         with self._lock:
-            # Emit gauges
-            for key, value in sorted(self._gauges.items()):
-                base_name = self._extract_base_name(key)
-                if base_name not in emitted_help:
-                    if base_name in self._gauge_help:
-                        lines.append(f"# HELP {base_name} {self._gauge_help[base_name]}")
-                    lines.append(f"# TYPE {base_name} gauge")
-                    emitted_help.add(base_name)
-                lines.append(f"{key} {value}")
-
-            # Emit counters
-            for key, value in sorted(self._counters.items()):
-                base_name = self._extract_base_name(key)
-                if base_name not in emitted_help:
-                    if base_name in self._counter_help:
-                        lines.append(f"# HELP {base_name} {self._counter_help[base_name]}")
-                    lines.append(f"# TYPE {base_name} counter")
-                    emitted_help.add(base_name)
-                lines.append(f"{key} {value}")
-
-        return "\n".join(lines) + "\n" if lines else ""
+            return self._body(openmetrics)
+
+    def render(self, openmetrics: bool = False, use_gzip: bool = False) -> bytes:
+        """Return the encoded (optionally gzip-compressed) exposition body.
+
+        The encoded bytes are cached until the next metric update.
+        """
+        self._run_scrape_callbacks()
+        cache_key = (openmetrics, use_gzip)
+        with self._lock:
+            body = self._body(openmetrics)
+            data = self._encoded.get(cache_key)
+        if data is not None:
+            return data
+        data = body.encode("utf-8")
+        if use_gzip:
+            data = gzip.compress(data, compresslevel=6)
+        with self._lock:
+            # Only cache if no update landed while compressing outside the lock
+            if self._bodies.get(openmetrics) is body:
+                self._encoded[cache_key] = data
+        return data
 
     def reset(self) -> None:
-        """Clear all metrics (mainly for testing)."""
+        """Clear all metrics (mainly for testing).
+
+        Interned series are kept, unset, so outstanding handles stay valid.
+        """
         with self._lock:
-            self._gauges.clear()
-            self._counters.clear()
+            for table in self._tables.values():
+                for series in table.values():
+                    series.clear()
+            self._dirty.clear()
+            self._layout_stale = True
             self._scrape_callbacks.clear()
 
 
@@ -226,12 +745,20 @@ class MetricsHandler(BaseHTTPRequestHandler):
     def do_GET(self) -> None:
         """Handle GET requests to /metrics endpoint."""
         if self.path == "/metrics":
-            content = metrics.exposition()
+            openmetrics = getattr(self.server, "openmetrics", False) and (
+                "application/openmetrics-text" in self.headers.get("Accept", "")
+            )
+            use_gzip = "gzip" in self.headers.get("Accept-Encoding", "")
+            body = metrics.render(openmetrics=openmetrics, use_gzip=use_gzip)
             self.send_response(200)
-            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
-            self.send_header("Content-Length", str(len(content)))
+            self.send_header(
+                "Content-Type", OPENMETRICS_CONTENT_TYPE if openmetrics else TEXT_CONTENT_TYPE
+            )
+            if use_gzip:
+                self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(body)))
             self.end_headers()
-            self.wfile.write(content.encode("utf-8"))
+            self.wfile.write(body)
         elif self.path == "/health":
             # Simple health check endpoint
             content = "OK\n"
@@ -247,6 +774,12 @@ class MetricsHandler(BaseHTTPRequestHandler):
             self.wfile.write(b"Not Found\n")
 
 
+class _MetricsHTTPServer(HTTPServer):
+    """HTTPServer carrying the exposition options read by MetricsHandler."""
+
+    openmetrics = False
+
+
 class MetricsServer:
     """
     HTTP server for Prometheus metrics endpoint.
@@ -255,17 +788,21 @@ class MetricsServer:
     The server is automatically stopped when the main process exits.
     """
 
-    def __init__(self, host: str = "127.0.0.1", port: int = 9100) -> None:
+    def __init__(
+        self, host: str = "127.0.0.1", port: int = 9100, openmetrics: bool = False
+    ) -> None:
         """
         Initialize metrics server.
 
         Args:
             host: Bind address (default: 127.0.0.1 for local-only access)
             port: Listen port (default: 9100, Prometheus node_exporter convention)
+            openmetrics: Serve OpenMetrics text to scrapers that accept it
         """
         self.host = host
         self.port = port
-        self._server: HTTPServer | None = None
+        self.openmetrics = openmetrics
+        self._server: _MetricsHTTPServer | None = None
         self._thread: threading.Thread | None = None
         self._started = False
 
@@ -281,7 +818,8 @@ class MetricsServer:
             return False
 
         try:
-            self._server = HTTPServer((self.host, self.port), MetricsHandler)
+            self._server = _MetricsHTTPServer((self.host, self.port), MetricsHandler)
+            self._server.openmetrics = self.openmetrics
             self._thread = threading.Thread(
                 target=self._server.serve_forever,
                 name="wanctl-metrics-server",
@@ -310,7 +848,9 @@ class MetricsServer:
         return self._started
 
 
-def start_metrics_server(host: str = "127.0.0.1", port: int = 9100) -> MetricsServer:
+def start_metrics_server(
+    host: str = "127.0.0.1", port: int = 9100, openmetrics: bool = False
+) -> MetricsServer:
     """
     Start a metrics server in the background.
 
@@ -319,11 +859,12 @@ def start_metrics_server(host: str = "127.0.0.1", port: int = 9100) -> MetricsSe
     Args:
         host: Bind address (default: 127.0.0.1 for local-only access)
         port: Listen port (default: 9100)
+        openmetrics: Serve OpenMetrics text to scrapers that accept it
 
     Returns:
         MetricsServer instance (can be used to stop the server later)
     """
-    server = MetricsServer(host, port)
+    server = MetricsServer(host, port, openmetrics=openmetrics)
     server.start()
     return server
 
@@ -351,6 +892,11 @@ METRIC_BURST_ACTIVE = "wanctl_burst_active"
 METRIC_BURST_TRIGGERS = "wanctl_burst_triggers_total"
 METRIC_BURST_LAST_DELTA_MS = "wanctl_burst_last_trigger_delta_ms"
 METRIC_BURST_LAST_ACCEL_MS = "wanctl_burst_last_trigger_accel_ms"
+METRIC_AUTORATE_CYCLE_SECONDS = "wanctl_autorate_cycle_seconds"
+METRIC_SUBSYSTEM_SECONDS = "wanctl_subsystem_duration_seconds"
+METRIC_ROUTER_WRITE_SECONDS = "wanctl_router_write_duration_seconds"
+METRIC_STEERING_CYCLE_SECONDS = "wanctl_steering_cycle_seconds"
+METRIC_STORAGE_WRITE_SECONDS = "wanctl_storage_write_duration_seconds"
 
 # State value mappings for numeric representation
 STATE_VALUES = {
@@ -361,6 +907,90 @@ STATE_VALUES = {
 }
 
 
+class _AutorateHandles(NamedTuple):
+    """Interned per-WAN series updated every autorate cycle."""
+
+    dl_rate: GaugeHandle
+    ul_rate: GaugeHandle
+    baseline_rtt: GaugeHandle
+    load_rtt: GaugeHandle
+    rtt_delta: GaugeHandle
+    dl_state: GaugeHandle
+    ul_state: GaugeHandle
+    cycles: CounterHandle
+    cycle_duration: GaugeHandle
+    cycle_latency: ObserverHandle
+    burst_active: GaugeHandle
+    burst_triggers: CounterHandle
+    burst_last_delta: GaugeHandle
+    burst_last_accel: GaugeHandle
+
+
+_autorate_handles: dict[str, _AutorateHandles] = {}
+
+
+def _get_autorate_handles(wan: str) -> _AutorateHandles:
+    """Return (creating once) the autorate cycle series for a WAN."""
+    handles = _autorate_handles.get(wan)
+    if handles is not None:
+        return handles
+    wan_labels = {"wan": wan}
+    dl_labels = {"wan": wan, "direction": "download"}
+    ul_labels = {"wan": wan, "direction": "upload"}
+    bandwidth_help = "Current bandwidth limit in Mbps"
+    state_help = "Current state (1=GREEN, 2=YELLOW, 3=SOFT_RED, 4=RED)"
+    handles = _AutorateHandles(
+        dl_rate=metrics.gauge(METRIC_BANDWIDTH_MBPS, dl_labels, bandwidth_help),
+        ul_rate=metrics.gauge(METRIC_BANDWIDTH_MBPS, ul_labels, bandwidth_help),
+        baseline_rtt=metrics.gauge(
+            METRIC_RTT_BASELINE_MS, wan_labels, "Baseline RTT in milliseconds"
+        ),
+        load_rtt=metrics.gauge(
+            METRIC_RTT_LOAD_MS, wan_labels, "Load RTT (EWMA smoothed) in milliseconds"
+        ),
+        rtt_delta=metrics.gauge(
+            METRIC_RTT_DELTA_MS, wan_labels, "RTT delta (load - baseline) in milliseconds"
+        ),
+        dl_state=metrics.gauge(METRIC_STATE, dl_labels, state_help),
+        ul_state=metrics.gauge(METRIC_STATE, ul_labels, state_help),
+        cycles=metrics.counter(
+            METRIC_CYCLES_TOTAL, wan_labels, "Total number of autorate cycles"
+        ),
+        cycle_duration=metrics.gauge(
+            METRIC_CYCLE_DURATION_SECONDS,
+            wan_labels,
+            "Duration of last autorate cycle in seconds",
+        ),
+        cycle_latency=metrics.histogram(
+            METRIC_AUTORATE_CYCLE_SECONDS,
+            wan_labels,
+            "Autorate cycle duration in seconds",
+        ),
+        burst_active=metrics.gauge(
+            METRIC_BURST_ACTIVE,
+            dl_labels,
+            "Whether download burst mitigation is active in the current autorate cycle",
+        ),
+        burst_triggers=metrics.counter(
+            METRIC_BURST_TRIGGERS,
+            dl_labels,
+            "Total confirmed download burst mitigation triggers",
+        ),
+        burst_last_delta=metrics.gauge(
+            METRIC_BURST_LAST_DELTA_MS,
+            dl_labels,
+            "RTT delta in milliseconds when the most recent download burst was confirmed",
+        ),
+        burst_last_accel=metrics.gauge(
+            METRIC_BURST_LAST_ACCEL_MS,
+            dl_labels,
+            "RTT acceleration in milliseconds per cycle when the most recent download burst was confirmed",
+        ),
+    )
+    _autorate_handles[wan] = handles
+    return handles
+
+
 def record_autorate_cycle(
     wan_name: str,
     dl_rate_mbps: float,
@@ -379,6 +1009,9 @@ def record_autorate_cycle(
     """
     Record metrics for an autorate cycle.
 
+    Runs every cycle, so it updates pre-interned handles instead of
+    resolving label dicts on each call.
+
     Args:
         wan_name: WAN identifier (e.g., 'spectrum', 'att')
         dl_rate_mbps: Download rate in Mbps
@@ -389,99 +1022,71 @@ def record_autorate_cycle(
         ul_state: Upload state (GREEN/YELLOW/RED)
         cycle_duration: Cycle duration in seconds
     """
-    wan = wan_name.lower()
+    handles = _get_autorate_handles(wan_name.lower())
 
-    # Bandwidth gauges
-    metrics.set_gauge(
-        METRIC_BANDWIDTH_MBPS,
-        dl_rate_mbps,
-        labels={"wan": wan, "direction": "download"},
-        help_text="Current bandwidth limit in Mbps",
-    )
-    metrics.set_gauge(
-        METRIC_BANDWIDTH_MBPS,
-        ul_rate_mbps,
-        labels={"wan": wan, "direction": "upload"},
-        help_text="Current bandwidth limit in Mbps",
-    )
-
-    # RTT gauges
-    metrics.set_gauge(
-        METRIC_RTT_BASELINE_MS,
-        baseline_rtt,
-        labels={"wan": wan},
-        help_text="Baseline RTT in milliseconds",
-    )
-    metrics.set_gauge(
-        METRIC_RTT_LOAD_MS,
-        load_rtt,
-        labels={"wan": wan},
-        help_text="Load RTT (EWMA smoothed) in milliseconds",
-    )
-    metrics.set_gauge(
-        METRIC_RTT_DELTA_MS,
-        max(0.0, load_rtt - baseline_rtt),
-        labels={"wan": wan},
-        help_text="RTT delta (load - baseline) in milliseconds",
-    )
+    handles.dl_rate.set(dl_rate_mbps)
+    handles.ul_rate.set(ul_rate_mbps)
+    handles.baseline_rtt.set(baseline_rtt)
+    handles.load_rtt.set(load_rtt)
+    handles.rtt_delta.set(max(0.0, load_rtt - baseline_rtt))
 
     # State gauges (numeric for alerting)
-    dl_state_value = STATE_VALUES.get(dl_state, 0)
-    ul_state_value = STATE_VALUES.get(ul_state, 0)
-    metrics.set_gauge(
-        METRIC_STATE,
-        dl_state_value,
-        labels={"wan": wan, "direction": "download"},
-        help_text="Current state (1=GREEN, 2=YELLOW, 3=SOFT_RED, 4=RED)",
-    )
-    metrics.set_gauge(
-        METRIC_STATE,
-        ul_state_value,
-        labels={"wan": wan, "direction": "upload"},
-        help_text="Current state (1=GREEN, 2=YELLOW, 3=SOFT_RED, 4=RED)",
-    )
+    handles.dl_state.set(STATE_VALUES.get(dl_state, 0))
+    handles.ul_state.set(STATE_VALUES.get(ul_state, 0))
 
-    # Cycle counter and duration
-    metrics.inc_counter(
-        METRIC_CYCLES_TOTAL,
-        labels={"wan": wan},
-        help_text="Total number of autorate cycles",
-    )
-    metrics.set_gauge(
-        METRIC_CYCLE_DURATION_SECONDS,
-        cycle_duration,
-        labels={"wan": wan},
-        help_text="Duration of last autorate cycle in seconds",
-    )
+    handles.cycles.inc()
+    handles.cycle_duration.set(cycle_duration)
+    handles.cycle_latency.observe(cycle_duration)
 
-    burst_labels = {"wan": wan, "direction": "download"}
-    metrics.set_gauge(
-        METRIC_BURST_ACTIVE,
-        1.0 if burst_active else 0.0,
-        labels=burst_labels,
-        help_text="Whether download burst mitigation is active in the current autorate cycle",
-    )
+    handles.burst_active.set(1.0 if burst_active else 0.0)
     if burst_trigger_delta > 0:
-        metrics.inc_counter(
-            METRIC_BURST_TRIGGERS,
-            labels=burst_labels,
-            value=burst_trigger_delta,
-            help_text="Total confirmed download burst mitigation triggers",
-        )
+        handles.burst_triggers.inc(burst_trigger_delta)
     if burst_last_delta_ms is not None:
-        metrics.set_gauge(
-            METRIC_BURST_LAST_DELTA_MS,
-            burst_last_delta_ms,
-            labels=burst_labels,
-            help_text="RTT delta in milliseconds when the most recent download burst was confirmed",
-        )
+        handles.burst_last_delta.set(burst_last_delta_ms)
     if burst_last_accel_ms is not None:
-        metrics.set_gauge(
-            METRIC_BURST_LAST_ACCEL_MS,
-            burst_last_accel_ms,
-            labels=burst_labels,
-            help_text="RTT acceleration in milliseconds per cycle when the most recent download burst was confirmed",
-        )
+        handles.burst_last_accel.set(burst_last_accel_ms)
+
+
+_subsystem_handles: dict[tuple[str, str, str], ObserverHandle] = {}
+
+
+def record_subsystem_timings(daemon: str, wan_name: str, timings: dict[str, float]) -> None:
+    """
+    Record per-subsystem cycle timings (PerfTimer labels) as summaries.
+
+    Summaries report p50/p90/p99 over the last DEFAULT_SUMMARY_WINDOW cycles,
+    the Prometheus counterpart of the /health profiler percentiles.
+    Subsystems that did not run this cycle (0.0ms) are skipped.
+
+    Args:
+        daemon: Daemon label and timing-label prefix ('autorate' or 'steering')
+        wan_name: WAN identifier
+        timings: PerfTimer label -> elapsed milliseconds
+    """
+    wan = wan_name.lower()
+    strip = len(daemon) + 1
+    for label, elapsed_ms in timings.items():
+        if elapsed_ms <= 0.0:
+            continue
+        handle = _subsystem_handles.get((daemon, wan, label))
+        if handle is None:
+            subsystem = label[strip:] if label.startswith(f"{daemon}_") else label
+            handle = _subsystem_handles[(daemon, wan, label)] = metrics.summary(
+                METRIC_SUBSYSTEM_SECONDS,
+                {"daemon": daemon, "wan": wan, "subsystem": subsystem},
+                "Cycle subsystem duration in seconds",
+            )
+        handle.observe(elapsed_ms / 1000.0)
+
+
+def record_router_write(wan_name: str, duration_seconds: float) -> None:
+    """Record the latency of one router rate write (successful or not)."""
+    metrics.observe_histogram(
+        METRIC_ROUTER_WRITE_SECONDS,
+        duration_seconds,
+        labels={"wan": wan_name.lower()},
+        help_text="Router rate write latency in seconds",
+    )
 
 
 def record_rate_limit_event(wan_name: str) -> None:
@@ -542,6 +1147,16 @@ def record_steering_state(
     )
 
 
+def record_steering_cycle(primary_wan: str, cycle_seconds: float) -> None:
+    """Record one steering cycle duration."""
+    metrics.observe_histogram(
+        METRIC_STEERING_CYCLE_SECONDS,
+        cycle_seconds,
+        labels={"wan": primary_wan.lower()},
+        help_text="Steering cycle duration in seconds",
+    )
+
+
 def record_steering_transition(primary_wan: str, from_state: str, to_state: str) -> None:
     """Record a steering state transition."""
     metrics.inc_counter(
@@ -590,6 +1205,12 @@ def record_storage_write_success(process_role: str, duration_ms: float, row_coun
             labels=labels,
             help_text="Maximum successful SQLite write transaction duration in milliseconds",
         )
+    metrics.observe_histogram(
+        METRIC_STORAGE_WRITE_SECONDS,
+        duration_ms / 1000.0,
+        labels=labels,
+        help_text="SQLite write transaction duration (through commit) in seconds",
+    )
 
 
 
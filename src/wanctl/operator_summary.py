@@ -16,6 +16,7 @@ from tabulate import tabulate
 
 from wanctl.history import per_wan_ingestion_rate_bucketed
 from wanctl.storage.db_utils import discover_wan_dbs
+from wanctl.storage.read_pool import acquire_read_connection, release_read_connection
 
 # TOOL-03 / D-14: stable stderr prefix for per-DB digest skips. Tests assert on
 # this prefix plus wan=/db= context, not the full OS error text.
@@ -233,7 +234,7 @@ def print_digest(db_paths: list[Path]) -> dict[str, int]:
         wan_name = _wan_name_from_db_path(db_path)
 
         try:
-            conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+            conn = acquire_read_connection(db_path)
         except (sqlite3.OperationalError, OSError) as exc:
             print(
                 f"{_DIGEST_SKIP_PREFIX} wan={wan_name} db={db_path}: {exc}",
@@ -255,7 +256,7 @@ def print_digest(db_paths: list[Path]) -> dict[str, int]:
                 counts["read_skipped"] += 1
                 continue
         finally:
-            conn.close()
+            release_read_connection(conn)
         line = _format_digest_line(wan_name, hard_red_rows)
 
         try:
@@ -13,13 +13,24 @@ Use OperationProfiler for accumulating metrics across multiple cycles:
     profiler = OperationProfiler(max_samples=100)
     profiler.record("label", elapsed_ms)
     stats = profiler.stats("label")
+
+ArrayOperationProfiler is the daemon hot-path variant: same interface, but
+record() only appends to a per-label buffer that is folded in bulk into a
+fixed array('d') window, a sliding window QuantileSketch and a lifetime
+QuantileSketch. It also reports long-horizon (since start) p50/p99/p999 per
+label.
 """
 
 import logging
+import math
+import threading
 import time
+from array import array
 from collections import deque
 from collections.abc import Callable
-from typing import Any
+from typing import Any, Protocol
+
+from wanctl.quantile_sketch import QuantileSketch
 
 
 class PerfTimer:
@@ -195,6 +206,261 @@ class OperationProfiler:
         return report
 
 
+class Profiler(Protocol):
+    """Interface shared by OperationProfiler and ArrayOperationProfiler."""
+
+    def record(self, label: str, elapsed_ms: float) -> None: ...
+
+    def stats(self, label: str) -> dict[str, Any]: ...
+
+    def report(self, logger: logging.Logger | None = None) -> str: ...
+
+
+# =============================================================================
+# ARRAY-BACKED PROFILER
+# =============================================================================
+
+# record() only buffers; every _FOLD_BATCH samples (or on stats()) the batch
+# is copied into the window ring and bucketed into the lifetime sketch in
+# one bulk pass.
+_FOLD_BATCH = 256
+
+
+class _LabelSeries:
+    """Recent-window ring and sketch, pending buffer and lifetime sketch for one label.
+
+    ``window`` holds the bucket counts of exactly the samples in ``ring``:
+    fold() adds the new samples and discards the ones they overwrite.
+
+    record() appends to ``pending`` without locking (list.append is atomic);
+    fold() takes ``lock`` because stats() folds from the health thread while
+    the owning thread may fold at the batch threshold.
+    """
+
+    __slots__ = (
+        "ring",
+        "capacity",
+        "pos",
+        "size",
+        "pending",
+        "fold_at",
+        "window",
+        "lifetime",
+        "lock",
+    )
+
+    def __init__(self, max_samples: int):
+        self.capacity = max(1, max_samples)
+        self.ring = array("d", bytes(8 * self.capacity))
+        self.pos = 0
+        self.size = 0
+        self.pending: list[float] = []
+        self.fold_at = min(_FOLD_BATCH, self.capacity)
+        self.window = QuantileSketch()
+        self.lifetime = QuantileSketch()
+        self.lock = threading.Lock()
+
+    def fold(self) -> None:
+        """Move pending samples into the window ring and the lifetime sketch."""
+        with self.lock:
+            pending = self.pending
+            batch = pending[:]
+            if not batch:
+                return
+            # Samples appended after the copy stay pending for the next fold
+            del pending[: len(batch)]
+            # Bucket the batch once for both sketches
+            added = QuantileSketch()
+            added.update(batch)
+            self.lifetime.merge(added)
+            capacity = self.capacity
+            values = batch[-capacity:]
+            pos = self.pos
+            self._evict(self.size + len(values) - capacity)
+            if len(values) == len(batch):
+                self.window.merge(added)
+            else:
+                self.window.update(values)
+            head = min(len(values), capacity - pos)
+            self.ring[pos : pos + head] = array("d", values[:head])
+            if head < len(values):
+                self.ring[: len(values) - head] = array("d", values[head:])
+            self.pos = (pos + len(values)) % capacity
+            self.size = min(self.size + len(batch), capacity)
+
+    def _evict(self, count: int) -> None:
+        """Discard the ``count`` oldest window samples from ``window`` (caller holds ``lock``)."""
+        if count <= 0:
+            return
+        if count >= self.size:
+            self.window = QuantileSketch()
+            return
+        # Full ring: oldest sample at pos. Filling ring: oldest at 0.
+        start = self.pos if self.size == self.capacity else 0
+        end = start + count
+        ring = self.ring
+        evicted = (
+            ring[start:end] if end <= self.capacity else ring[start:] + ring[: end - self.capacity]
+        )
+        self.window.discard(evicted)
+
+    def window_samples(self) -> array:
+        """Samples of the recent window, unordered (caller holds ``lock``)."""
+        return self.ring if self.size == self.capacity else self.ring[: self.size]
+
+
+class ArrayOperationProfiler:
+    """OperationProfiler with a fixed array window and lifetime percentiles.
+
+    Drop-in for the daemon profilers: record() only appends to a per-label
+    buffer, which is folded into the window ring and a lifetime
+    QuantileSketch in bulk every _FOLD_BATCH samples or when stats() reads
+    the label.
+
+    stats() keeps OperationProfiler's keys and window statistics over the
+    last max_samples samples, minus the raw "samples" list, and adds p50_ms
+    plus a "lifetime" block with p50/p99/p999 since start (or the last
+    clear()) from the sketch, which retains no samples. Window count, min,
+    max and avg are exact; window percentiles come from the window sketch
+    (within ~1.1%) in O(buckets), or from a sort with exact=True.
+
+    Example:
+        profiler = ArrayOperationProfiler(max_samples=1200)
+        profiler.record("autorate_cycle_total", 12.5)
+        profiler.stats("autorate_cycle_total")["lifetime"]["p999_ms"]
+    """
+
+    __slots__ = ("max_samples", "_series")
+
+    def __init__(self, max_samples: int = 100):
+        """
+        Initialize profiler.
+
+        Args:
+            max_samples: Size of each label's recent-sample window.
+        """
+        self.max_samples = max_samples
+        self._series: dict[str, _LabelSeries] = {}
+
+    def record(self, label: str, elapsed_ms: float) -> None:
+        """Record a measurement.
+
+        Args:
+            label: Name of the operation being measured
+            elapsed_ms: Elapsed time in milliseconds
+        """
+        series = self._series.get(label)
+        if series is None:
+            series = self._series[label] = _LabelSeries(self.max_samples)
+        pending = series.pending
+        pending.append(elapsed_ms)
+        if len(pending) >= series.fold_at:
+            series.fold()
+
+    def stats(self, label: str, exact: bool = False) -> dict[str, Any]:
+        """Get statistics for a label.
+
+        Args:
+            label: Name of the operation
+            exact: Sort the window for exact percentiles instead of reading
+                them from the window sketch
+
+        Returns:
+            Dict with window and lifetime statistics, or empty dict if label not found
+        """
+        series = self._series.get(label)
+        if series is None:
+            return {}
+        series.fold()
+        with series.lock:
+            samples = series.window_samples()
+            count = len(samples)
+            if count == 0:
+                return {}
+            lo, hi, total = min(samples), max(samples), sum(samples)
+            qs = (0.5, 0.95, 0.99)
+            if exact:
+                ordered = sorted(samples)
+                # Same rank rule as OperationProfiler
+                p50, p95, p99 = (ordered[int(q * (count - 1))] for q in qs)
+            else:
+                window = series.window
+                window.min, window.max = lo, hi
+                p50, p95, p99 = window.quantiles(qs, nearest_rank=False)
+            lifetime = series.lifetime
+            l50, l99, l999 = lifetime.quantiles((0.5, 0.99, 0.999)) or (math.nan,) * 3
+            life_count, life_total = lifetime.count, lifetime.total
+            life_lo, life_hi = lifetime.min, lifetime.max
+
+        return {
+            "count": count,
+            "min_ms": lo,
+            "max_ms": hi,
+            "avg_ms": total / count,
+            "p50_ms": p50,
+            "p95_ms": p95,
+            "p99_ms": p99,
+            "lifetime": {
+                "count": life_count,
+                "min_ms": life_lo,
+                "max_ms": life_hi,
+                "avg_ms": life_total / life_count if life_count else math.nan,
+                "p50_ms": l50,
+                "p99_ms": l99,
+                "p999_ms": l999,
+            },
+        }
+
+    def labels(self) -> list[str]:
+        """Labels that have recorded at least one sample."""
+        return [label for label, series in self._series.items() if series.size or series.pending]
+
+    def clear(self, label: str | None = None) -> None:
+        """Clear window and lifetime data for a label, or all labels.
+
+        Args:
+            label: Name of operation to clear, or None to clear all
+        """
+        if label is None:
+            self._series.clear()
+        elif label in self._series:
+            self._series[label] = _LabelSeries(self.max_samples)
+
+    def report(self, logger: logging.Logger | None = None) -> str:
+        """Generate a summary report of all collected metrics.
+
+        Args:
+            logger: Optional logger. If provided, logs the report at INFO level.
+
+        Returns:
+            Formatted report string
+        """
+        labels = sorted(self.labels())
+        if not labels:
+            report = "No profiling data collected"
+        else:
+            lines = ["=== Profiling Report ==="]
+            for label in labels:
+                stats = self.stats(label)
+                life = stats["lifetime"]
+                lines.append(
+                    f"{label}: count={stats['count']}, "
+                    f"min={stats['min_ms']:.1f}ms, "
+                    f"avg={stats['avg_ms']:.1f}ms, "
+                    f"max={stats['max_ms']:.1f}ms, "
+                    f"p95={stats['p95_ms']:.1f}ms, "
+                    f"p99={stats['p99_ms']:.1f}ms, "
+                    f"lifetime(n={life['count']}) p50={life['p50_ms']:.1f}ms "
+                    f"p99={life['p99_ms']:.1f}ms p999={life['p999_ms']:.1f}ms"
+                )
+            report = "\n".join(lines)
+
+        if logger:
+            logger.info(report)
+
+        return report
+
+
 def measure_operation(
     func: Callable[..., Any], label: str, logger: logging.Logger | None = None
 ) -> Callable[..., Any]:
@@ -232,7 +498,7 @@ PROFILE_REPORT_INTERVAL = 1200  # ~60s at 50ms cycles
 
 
 def record_cycle_profiling(
-    profiler: OperationProfiler,
+    profiler: Profiler,
     timings: dict[str, float],
     cycle_start: float,
     cycle_interval_ms: float,
@@ -249,7 +515,7 @@ def record_cycle_profiling(
     Each daemon's _record_profiling() method delegates to this function.
 
     Args:
-        profiler: OperationProfiler instance to record timings to
+        profiler: OperationProfiler/ArrayOperationProfiler to record timings to
         timings: Dict of label->elapsed_ms for each subsystem
         cycle_start: perf_counter() timestamp when cycle started
         cycle_interval_ms: Target cycle interval in milliseconds
@@ -293,7 +559,7 @@ def record_cycle_profiling(
             extra[f"{suffix}_ms"] = round(elapsed_ms, 1)
         logger.debug("Cycle timing", extra=extra)
 
-    # Periodic profiling report (deque maxlen handles eviction, no clear needed)
+    # Periodic profiling report (bounded windows handle eviction, no clear needed)
     profile_cycle_count += 1
     if profiling_enabled and profile_cycle_count >= PROFILE_REPORT_INTERVAL:
         profiler.report(logger)
@@ -0,0 +1,240 @@
+"""
+Quantile Sketch - Mergeable log-bucketed summaries.
+
+Log-bucketed counts with fixed relative accuracy (DDSketch-style): every
+sample lands in bucket ``floor(log2(|v|) * SKETCH_BUCKETS_PER_OCTAVE)``, kept
+separately for positive and negative values, with near-zero samples counted
+on their own. Two sketches merge by adding bucket counts.
+
+Shared by the metric history tier (storage's downsampler writes one sketch
+per time bucket, rolled up 1m -> 5m -> 1h, and queries merge stored sketches
+instead of rescanning samples) and ArrayOperationProfiler's percentiles.
+
+count/sum/min/max are exact; quantiles are within ~1.1% relative error and
+clamped to the exact min/max.
+"""
+
+import math
+import struct
+from array import array
+from collections import Counter
+from collections.abc import Iterable
+from itertools import repeat
+from operator import mul
+
+# 2^(1/64) - 1 = 1.1% worst case
+SKETCH_BUCKETS_PER_OCTAVE = 32
+
+# Magnitudes below this count as zero (keeps negative bucket indexes small)
+SKETCH_ZERO_THRESHOLD = 1e-9
+
+_SKETCH_VERSION = 1
+_HEADER = struct.Struct("<BIHH")
+
+
+_MAX_BUCKET_INDEX = 32767
+
+
+def _bucket_index(magnitude: float) -> int:
+    # Clamped to the int16 blob encoding; only magnitudes beyond 2^1023 hit it
+    return min(math.floor(math.log2(magnitude) * SKETCH_BUCKETS_PER_OCTAVE), _MAX_BUCKET_INDEX)
+
+
+def _bucket_counts(magnitudes: list[float]) -> Counter[int]:
+    """Bucket counts for many magnitudes in one C-level pass (same as _bucket_index)."""
+    return Counter(
+        map(math.floor, map(mul, map(math.log2, magnitudes), repeat(SKETCH_BUCKETS_PER_OCTAVE)))
+    )
+
+
+def _bucket_value(index: int) -> float:
+    """Geometric midpoint of a bucket, the representative for its samples."""
+    return float(2.0 ** ((index + 0.5) / SKETCH_BUCKETS_PER_OCTAVE))
+
+
+class QuantileSketch:
+    """Mergeable count/sum/min/max plus log-bucketed quantile sketch."""
+
+    __slots__ = ("count", "total", "min", "max", "zeros", "positive", "negative")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.zeros = 0
+        self.positive: dict[int, int] = {}
+        self.negative: dict[int, int] = {}
+
+    def add(self, value: float) -> None:
+        """Add one sample. Non-finite values are ignored."""
+        if not math.isfinite(value):
+            return
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        magnitude = abs(value)
+        if magnitude < SKETCH_ZERO_THRESHOLD:
+            self.zeros += 1
+            return
+        buckets = self.positive if value > 0 else self.negative
+        index = _bucket_index(magnitude)
+        buckets[index] = buckets.get(index, 0) + 1
+
+    def update(self, values: Iterable[float]) -> None:
+        """Add many samples at once; equivalent to add() per value, but bucketed in bulk."""
+        finite = list(filter(math.isfinite, values))
+        if not finite:
+            return
+        lo = min(finite)
+        self.count += len(finite)
+        self.total += sum(finite)
+        self.min = min(self.min, lo)
+        self.max = max(self.max, max(finite))
+        if lo >= SKETCH_ZERO_THRESHOLD:  # latencies: the all-positive common case
+            positive, negative = finite, []
+        else:
+            positive = [v for v in finite if v >= SKETCH_ZERO_THRESHOLD]
+            negative = [-v for v in finite if v <= -SKETCH_ZERO_THRESHOLD]
+        self.zeros += len(finite) - len(positive) - len(negative)
+        for buckets, magnitudes in ((self.positive, positive), (self.negative, negative)):
+            if magnitudes:
+                for index, n in _bucket_counts(magnitudes).items():
+                    index = min(index, _MAX_BUCKET_INDEX)
+                    buckets[index] = buckets.get(index, 0) + n
+
+    def discard(self, values: Iterable[float]) -> None:
+        """Remove samples added earlier, for sliding windows.
+
+        count, sum and bucket counts are updated exactly; min/max are left
+        as they were, so callers that need them exact must reset them.
+        """
+        finite = list(filter(math.isfinite, values))
+        if not finite:
+            return
+        self.count -= len(finite)
+        self.total -= sum(finite)
+        positive = [v for v in finite if v >= SKETCH_ZERO_THRESHOLD]
+        negative = [-v for v in finite if v <= -SKETCH_ZERO_THRESHOLD]
+        self.zeros -= len(finite) - len(positive) - len(negative)
+        for buckets, magnitudes in ((self.positive, positive), (self.negative, negative)):
+            if magnitudes:
+                for index, n in _bucket_counts(magnitudes).items():
+                    index = min(index, _MAX_BUCKET_INDEX)
+                    left = buckets[index] - n
+                    if left:
+                        buckets[index] = left
+                    else:
+                        del buckets[index]
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Fold another sketch into this one (exact for count/sum/min/max)."""
+        if other.count == 0:
+            return
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.zeros += other.zeros
+        for mine, theirs in ((self.positive, other.positive), (self.negative, other.negative)):
+            for index, n in theirs.items():
+                mine[index] = mine.get(index, 0) + n
+
+    def _ascending(self) -> list[tuple[int, int, int]]:
+        """(sign, bucket index, count) triples in ascending value order.
+
+        Representatives are computed only for the buckets a caller needs.
+        """
+        triples = [(-1, i, self.negative[i]) for i in sorted(self.negative, reverse=True)]
+        if self.zeros:
+            triples.append((0, 0, self.zeros))
+        triples.extend((1, i, self.positive[i]) for i in sorted(self.positive))
+        return triples
+
+    def quantiles(self, qs: tuple[float, ...], nearest_rank: bool = True) -> list[float]:
+        """Approximate quantiles for ascending ``qs`` in [0, 1].
+
+        nearest_rank=False uses the floor rank ``int(q * (count - 1))`` of
+        OperationProfiler instead.
+        """
+        if self.count == 0:
+            return []
+        results: list[float] = []
+        triples = self._ascending()
+        pos = 0
+        seen = triples[0][2]
+        offset = 0.5 if nearest_rank else 0.0
+        for q in qs:
+            # Nearest rank by default, so small samples do not understate the tail
+            rank = int(q * (self.count - 1) + offset)
+            while seen <= rank and pos + 1 < len(triples):
+                pos += 1
+                seen += triples[pos][2]
+            sign, index, _ = triples[pos]
+            value = sign * _bucket_value(index) if sign else 0.0
+            results.append(min(max(value, self.min), self.max))
+        return results
+
+    def distribution(self) -> dict[float, int]:
+        """Sample counts per bucket representative, ascending."""
+        return {
+            (sign * _bucket_value(index) if sign else 0.0): n
+            for sign, index, n in self._ascending()
+        }
+
+    def summary(self) -> dict:
+        """Summary in compute_summary()'s shape, plus the sample count.
+
+        Returns an empty dict for an empty sketch.
+        """
+        if self.count == 0:
+            return {}
+        p50, p95, p99 = self.quantiles((0.50, 0.95, 0.99))
+        return {
+            "min": self.min,
+            "max": self.max,
+            "avg": self.total / self.count,
+            "p50": p50,
+            "p95": p95,
+            "p99": p99,
+            "count": self.count,
+        }
+
+    def buckets_blob(self) -> bytes:
+        """Serialize the bucket counts (count/sum/min/max are stored as columns)."""
+        blob = bytearray(
+            _HEADER.pack(_SKETCH_VERSION, self.zeros, len(self.positive), len(self.negative))
+        )
+        for buckets in (self.positive, self.negative):
+            indexes = sorted(buckets)
+            blob += array("h", indexes).tobytes()
+            blob += array("I", [buckets[i] for i in indexes]).tobytes()
+        return bytes(blob)
+
+    @classmethod
+    def from_row(
+        cls, count: int, total: float, minimum: float, maximum: float, blob: bytes
+    ) -> "QuantileSketch":
+        """Rebuild a sketch from a storage metric_sketches row."""
+        version, zeros, n_positive, n_negative = _HEADER.unpack_from(blob)
+        if version != _SKETCH_VERSION:
+            raise ValueError(f"Unsupported sketch version: {version}")
+        sketch = cls()
+        sketch.count = count
+        sketch.total = total
+        sketch.min = minimum
+        sketch.max = maximum
+        sketch.zeros = zeros
+        offset = _HEADER.size
+        for buckets, n in ((sketch.positive, n_positive), (sketch.negative, n_negative)):
+            indexes = array("h")
+            indexes.frombytes(blob[offset : offset + 2 * n])
+            offset += 2 * n
+            counts = array("I")
+            counts.frombytes(blob[offset : offset + 4 * n])
+            offset += 4 * n
+            buckets.update(zip(indexes, counts, strict=True))
+        return sketch
@@ -0,0 +1,345 @@
+"""Reflector fleet: automatic top-K reflector selection from a candidate pool.
+
+ReflectorScorer tracks success/failure for the fixed ping_hosts list. With
+reflector_quality.candidates configured, WANController uses ReflectorFleet
+instead. Every candidate is scored on RTT stability (EWMA jitter), loss
+(the inherited rolling success window) and path diversity (address prefix),
+and the best active_count candidates are the active reflectors.
+
+Cost stays flat however large the pool is:
+    - Active reflectors are scored from the per-host results of the normal
+      measurement cycle (record_rtts); no extra probes.
+    - Standby candidates (and deprioritized actives) are pinged one at a
+      time by a background prober thread limited to probe_budget_per_sec,
+      least recently sampled first. maybe_probe() is a no-op, so the control
+      loop never blocks on a probe.
+    - Reselection runs on the prober thread every reselect_interval_sec, or
+      on the next probe tick after an active reflector is deprioritized. The
+      control loop only reads the cached active list.
+
+A challenger replaces an incumbent only if it beats the incumbent's cost by
+20% and at least 1 ms, so reflectors are not swapped on noise. Candidates
+sharing a /24 (IPv4) or /48 (IPv6) are penalized so the active set does not
+collapse onto one path.
+
+Swaps are buffered as "promoted"/"demoted" events next to the scorer's
+deprioritization/recovery events.
+"""
+
+from __future__ import annotations
+
+import ipaddress
+import logging
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from wanctl.reflector_scorer import ReflectorScorer, ReflectorStatus
+
+if TYPE_CHECKING:
+    from wanctl.rtt_measurement import RTTMeasurement
+
+# EWMA weight for per-host RTT and jitter
+_RTT_ALPHA = 0.1
+
+# Samples a candidate needs before it can be selected
+_MIN_SAMPLES = 5
+
+# Cost of 100% loss, in jitter milliseconds
+_LOSS_PENALTY_MS = 50.0
+
+# Cost added per already-selected reflector on the same path prefix
+_DIVERSITY_PENALTY_MS = 5.0
+
+# Incumbent advantage: a challenger must win by this fraction and absolute margin
+_SWAP_FRACTION = 0.2
+_SWAP_MARGIN_MS = 1.0
+
+
+@dataclass(slots=True)
+class _RttStats:
+    """Rolling RTT and jitter for one candidate."""
+
+    rtt_ms: float | None = None
+    jitter_ms: float = 0.0
+    last_rtt_ms: float | None = None
+    samples: int = 0
+    last_sample_ts: float = 0.0
+
+    def add(self, rtt_ms: float, now: float) -> None:
+        if self.rtt_ms is None or self.last_rtt_ms is None:
+            self.rtt_ms = rtt_ms
+        else:
+            self.rtt_ms += _RTT_ALPHA * (rtt_ms - self.rtt_ms)
+            self.jitter_ms += _RTT_ALPHA * (abs(rtt_ms - self.last_rtt_ms) - self.jitter_ms)
+        self.last_rtt_ms = rtt_ms
+        self.samples += 1
+        self.last_sample_ts = now
+
+
+def _path_group(host: str) -> str:
+    """Return the address prefix used for path diversity (hostnames group alone)."""
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return host
+    prefix = 24 if address.version == 4 else 48
+    return str(ipaddress.ip_network(f"{host}/{prefix}", strict=False))
+
+
+class ReflectorFleet(ReflectorScorer):
+    """ReflectorScorer over a candidate pool that keeps the best K active.
+
+    Args:
+        hosts: Configured ping_hosts; they start as the active set.
+        candidates: Additional candidate reflectors.
+        active_count: Number of active reflectors (default: len(hosts)).
+        probe_budget_per_sec: Standby probes per second.
+        reselect_interval_sec: Seconds between active-set reselections.
+        min_score: See ReflectorScorer.
+        window_size: See ReflectorScorer.
+        probe_interval_sec: See ReflectorScorer (unused; the prober replaces it).
+        recovery_count: See ReflectorScorer.
+        logger: Logger instance (defaults to module logger).
+        wan_name: WAN identifier for log messages.
+    """
+
+    def __init__(
+        self,
+        hosts: list[str],
+        candidates: list[str],
+        active_count: int | None = None,
+        probe_budget_per_sec: float = 2.0,
+        reselect_interval_sec: float = 30.0,
+        min_score: float = 0.8,
+        window_size: int = 50,
+        probe_interval_sec: float = 30.0,
+        recovery_count: int = 3,
+        logger: logging.Logger | None = None,
+        wan_name: str = "",
+    ) -> None:
+        pool = list(dict.fromkeys([*hosts, *candidates]))
+        super().__init__(
+            pool,
+            min_score=min_score,
+            window_size=window_size,
+            probe_interval_sec=probe_interval_sec,
+            recovery_count=recovery_count,
+            logger=logger,
+            wan_name=wan_name,
+        )
+        if active_count is None:
+            active_count = len(hosts)
+        self._active_count = max(1, min(active_count, len(pool)))
+        self._active: list[str] = pool[: self._active_count]
+        self._stats: dict[str, _RttStats] = {h: _RttStats() for h in pool}
+        self._groups: dict[str, str] = {h: _path_group(h) for h in pool}
+        self._probe_budget_per_sec = probe_budget_per_sec
+        self._reselect_interval_sec = reselect_interval_sec
+        self._last_reselect = time.monotonic()
+        # Guards scorer state shared by the control loop and the prober thread
+        self._lock = threading.Lock()
+        self._probes = 0
+        self._swaps = 0
+        self._thread: threading.Thread | None = None
+
+    # =========================================================================
+    # CONTROL LOOP API
+    # =========================================================================
+
+    def _record_result(self, host: str, success: bool) -> None:
+        with self._lock:
+            was_deprioritized = host in self._deprioritized
+            super()._record_result(host, success)
+            if not was_deprioritized and host in self._deprioritized and host in self._active:
+                # Replace a failing active reflector on the next probe tick
+                self._last_reselect = 0.0
+
+    def record_rtts(self, per_host_results: dict[str, float | None]) -> None:
+        """Feed per-host RTTs from a measurement cycle into the jitter scores.
+
+        Args:
+            per_host_results: Mapping of host -> RTT in ms (None on failure).
+        """
+        now = time.monotonic()
+        with self._lock:
+            for host, rtt_ms in per_host_results.items():
+                stats = self._stats.get(host)
+                if stats is not None and rtt_ms is not None:
+                    stats.add(rtt_ms, now)
+
+    def drain_events(self) -> list[dict]:
+        """Return and clear buffered transition events (thread-safe)."""
+        with self._lock:
+            return super().drain_events()
+
+    def get_active_hosts(self) -> list[str]:
+        """Return the non-deprioritized active reflectors.
+
+        When every active reflector is deprioritized, returns the best-scoring
+        one until the prober reselects.
+        """
+        active = self._active
+        healthy = [h for h in active if h not in self._deprioritized]
+        if healthy:
+            return healthy
+        best = max(active, key=self._score_for_host)
+        self._logger.warning(
+            f"{self._wan_name}: All active reflectors deprioritized, forcing best-scoring {best}"
+        )
+        return [best]
+
+    def get_all_statuses(self) -> list[ReflectorStatus]:
+        """Return quality status for every candidate ("standby" when not active)."""
+        active = set(self._active)
+        return [
+            status
+            if status.host in active or status.status == "deprioritized"
+            else ReflectorStatus(
+                host=status.host,
+                score=status.score,
+                status="standby",
+                measurements=status.measurements,
+                consecutive_successes=status.consecutive_successes,
+            )
+            for status in super().get_all_statuses()
+        ]
+
+    def maybe_probe(self, now: float, rtt_measurement: RTTMeasurement) -> list[tuple[str, bool]]:
+        """No-op: the prober thread samples standby and deprioritized hosts."""
+        return []
+
+    def get_fleet_status(self) -> dict[str, Any]:
+        """Return active set, probe budget counters and per-candidate RTT stats."""
+        return {
+            "active": list(self._active),
+            "active_count": self._active_count,
+            "pool_size": len(self._hosts),
+            "probe_budget_per_sec": self._probe_budget_per_sec,
+            "probes": self._probes,
+            "swaps": self._swaps,
+            "candidates": {
+                host: {
+                    "rtt_ms": round(stats.rtt_ms, 2) if stats.rtt_ms is not None else None,
+                    "jitter_ms": round(stats.jitter_ms, 3),
+                    "samples": stats.samples,
+                }
+                for host, stats in self._stats.items()
+            },
+        }
+
+    # =========================================================================
+    # PROBER THREAD
+    # =========================================================================
+
+    def start(self, rtt_measurement: RTTMeasurement, shutdown_event: threading.Event) -> None:
+        """Start the background prober daemon thread."""
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(rtt_measurement, shutdown_event),
+            name="wanctl-reflector-fleet",
+            daemon=True,
+        )
+        self._thread.start()
+        self._logger.info(
+            f"{self._wan_name}: Reflector fleet started "
+            f"({self._active_count} active of {len(self._hosts)}, "
+            f"budget={self._probe_budget_per_sec}/s)"
+        )
+
+    def stop(self) -> None:
+        """Join the prober thread (up to 5s timeout)."""
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+
+    def _run(self, rtt_measurement: RTTMeasurement, shutdown_event: threading.Event) -> None:
+        interval = 1.0 / self._probe_budget_per_sec
+        while not shutdown_event.is_set():
+            t0 = time.monotonic()
+            try:
+                self.probe_next(rtt_measurement)
+                if t0 - self._last_reselect >= self._reselect_interval_sec:
+                    self.reselect()
+            except Exception:
+                self._logger.debug("Reflector fleet probe error", exc_info=True)
+            shutdown_event.wait(timeout=max(0.0, interval - (time.monotonic() - t0)))
+
+    def probe_next(self, rtt_measurement: RTTMeasurement) -> tuple[str, bool] | None:
+        """Ping the least recently sampled host outside the active set.
+
+        Returns:
+            (host, success), or None when every candidate is active and healthy.
+        """
+        in_use = set(self.get_active_hosts())
+        idle = [h for h in self._hosts if h not in in_use]
+        if not idle:
+            return None
+        host = min(idle, key=lambda h: self._stats[h].last_sample_ts)
+        rtt_ms = rtt_measurement.ping_host(host, count=1)
+        now = time.monotonic()
+        with self._lock:
+            self._probes += 1
+            ReflectorScorer._record_result(self, host, rtt_ms is not None)
+            stats = self._stats[host]
+            if rtt_ms is not None:
+                stats.add(rtt_ms, now)
+            else:
+                stats.last_sample_ts = now
+        return host, rtt_ms is not None
+
+    def reselect(self) -> bool:
+        """Recompute the active set.
+
+        Returns:
+            True if the active set changed.
+        """
+        with self._lock:
+            self._last_reselect = time.monotonic()
+            incumbents = set(self._active)
+            costs = {h: self._cost(h, h in incumbents) for h in self._hosts}
+            chosen: list[str] = []
+            group_counts: dict[str, int] = {}
+            remaining = list(self._hosts)
+            while remaining and len(chosen) < self._active_count:
+                best = min(
+                    remaining,
+                    key=lambda h: (
+                        costs[h] + _DIVERSITY_PENALTY_MS * group_counts.get(self._groups[h], 0),
+                        h not in incumbents,
+                    ),
+                )
+                remaining.remove(best)
+                chosen.append(best)
+                group = self._groups[best]
+                group_counts[group] = group_counts.get(group, 0) + 1
+
+            promoted = [h for h in chosen if h not in incumbents]
+            if not promoted:
+                return False
+            demoted = [h for h in self._active if h not in chosen]
+            for host in promoted:
+                self._pending_events.append(
+                    {"event_type": "promoted", "host": host, "score": self._score_for_host(host)}
+                )
+            for host in demoted:
+                self._pending_events.append(
+                    {"event_type": "demoted", "host": host, "score": self._score_for_host(host)}
+                )
+            self._swaps += len(promoted)
+            self._active = chosen
+        self._logger.info(
+            f"{self._wan_name}: Reflector fleet swapped {demoted} -> {promoted} (active={chosen})"
+        )
+        return True
+
+    def _cost(self, host: str, incumbent: bool) -> float:
+        """Selection cost: jitter plus loss penalty (lower is better)."""
+        stats = self._stats[host]
+        if host in self._deprioritized or stats.samples < _MIN_SAMPLES:
+            return math.inf
+        cost = stats.jitter_ms + _LOSS_PENALTY_MS * (1.0 - self._score_for_host(host))
+        if incumbent:
+            cost -= max(_SWAP_MARGIN_MS, _SWAP_FRACTION * cost)
+        return cost
@@ -0,0 +1,255 @@
+"""Background router apply thread with a latest-value-wins mailbox.
+
+In async apply mode the control loop posts the desired (dl, ul) rates and
+moves on instead of blocking on the router/kernel write. A dedicated writer
+thread per WAN performs the write. The mailbox holds a single slot: a target
+posted while the writer is busy replaces any target still waiting, so a slow
+write never builds a backlog and the router only receives the newest rates.
+
+The writer applies whatever it is given. Flash wear (change-only) and
+RateLimiter gating stay on the control thread, which decides what to post,
+and completed applies are handed back through collect() so controller state
+is only mutated on the control thread.
+
+Pattern follows BackgroundCakeStatsThread from cake_stats_thread.py.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field, replace
+from typing import Any
+
+from wanctl.perf_profiler import ArrayOperationProfiler
+
+logger = logging.getLogger(__name__)
+
+# apply_fn(dl_rate, ul_rate) -> (success, (applied_dl, applied_ul), write_timings)
+RouterApplyFn = Callable[[int, int], tuple[bool, tuple[int, int], dict[str, float]]]
+
+
+@dataclass(frozen=True)
+class RouterApplyResult:
+    """Outcome of one apply performed by the writer thread.
+
+    applied_writes/failed_writes are filled in by collect(): the number of
+    writes that succeeded or failed since the previous collect(), this one
+    included.
+    """
+
+    seq: int
+    dl_rate: int
+    ul_rate: int
+    success: bool
+    applied_dl_rate: int
+    applied_ul_rate: int
+    posted_monotonic: float
+    completed_monotonic: float
+    apply_ms: float
+    write_timings: dict[str, float] = field(default_factory=dict)
+    error: Exception | None = None
+    applied_writes: int = 0
+    failed_writes: int = 0
+
+    @property
+    def lag_ms(self) -> float:
+        """Milliseconds from post to acknowledged completion."""
+        return (self.completed_monotonic - self.posted_monotonic) * 1000.0
+
+
+class BackgroundRouterApplyThread:
+    """Dedicated writer thread for one WAN's rate applies.
+
+    Args:
+        wan_name: WAN name (thread name and logging)
+        apply_fn: Performs the write; see RouterApplyFn
+        shutdown_event: threading.Event signaling graceful shutdown. The writer
+            keeps applying after it is set and only exits on stop(), once the
+            waiting target has been applied.
+    """
+
+    def __init__(
+        self,
+        wan_name: str,
+        apply_fn: RouterApplyFn,
+        shutdown_event: threading.Event,
+    ) -> None:
+        self._wan_name = wan_name
+        self._apply_fn = apply_fn
+        self._shutdown_event = shutdown_event
+        self._cond = threading.Condition()
+        self._seq = 0
+        # (seq, dl_rate, ul_rate, posted_monotonic)
+        self._slot: tuple[int, int, int, float] | None = None
+        self._in_flight: tuple[int, int, int, float] | None = None
+        self._latest: RouterApplyResult | None = None
+        self._collected_seq = 0
+        self._posted = 0
+        self._superseded = 0
+        self._applied = 0
+        self._failed = 0
+        # Writes completed since the last collect()
+        self._uncollected_applied = 0
+        self._uncollected_failed = 0
+        self._profiler = ArrayOperationProfiler(max_samples=1200)
+        self._stopping = False
+        self._thread: threading.Thread | None = None
+
+    def post(self, dl_rate: int, ul_rate: int) -> None:
+        """Post a target, replacing any target the writer has not picked up yet."""
+        with self._cond:
+            self._seq += 1
+            self._posted += 1
+            if self._slot is not None:
+                self._superseded += 1
+            self._slot = (self._seq, dl_rate, ul_rate, time.monotonic())
+            self._cond.notify_all()
+
+    def pending_target(self) -> tuple[int, int] | None:
+        """Return the newest posted target that has not completed, if any."""
+        with self._cond:
+            entry = self._slot or self._in_flight
+        return (entry[1], entry[2]) if entry is not None else None
+
+    def cancel_pending(self) -> None:
+        """Drop a waiting target (an apply already in flight still completes)."""
+        with self._cond:
+            self._slot = None
+
+    @property
+    def busy(self) -> bool:
+        """True while a target is waiting or being applied."""
+        with self._cond:
+            return self._slot is not None or self._in_flight is not None
+
+    def collect(self) -> RouterApplyResult | None:
+        """Return the newest completed apply not yet collected.
+
+        Results completed between two collect() calls are folded into the
+        newest one, matching the mailbox's latest-value-wins semantics. Its
+        applied_writes/failed_writes still count every write in between, so
+        per-write bookkeeping (rate limiter, router failures) sees them all.
+        """
+        with self._cond:
+            latest = self._latest
+            if latest is None or latest.seq <= self._collected_seq:
+                return None
+            self._collected_seq = latest.seq
+            result = replace(
+                latest,
+                applied_writes=self._uncollected_applied,
+                failed_writes=self._uncollected_failed,
+            )
+            self._uncollected_applied = 0
+            self._uncollected_failed = 0
+            return result
+
+    def wait_idle(self, timeout: float) -> bool:
+        """Block until no target is waiting or in flight. Returns False on timeout."""
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: self._slot is None and self._in_flight is None, timeout=timeout
+            )
+
+    def get_profile_stats(self) -> dict[str, object]:
+        """Return background apply timing stats."""
+        return self._profiler.stats("router_apply_background")
+
+    def get_status(self) -> dict[str, Any]:
+        """Return mailbox counters and the latest acknowledged apply."""
+        with self._cond:
+            latest = self._latest
+            status: dict[str, Any] = {
+                "posted": self._posted,
+                "superseded": self._superseded,
+                "applied": self._applied,
+                "failed": self._failed,
+                "in_flight": self._in_flight is not None,
+                "waiting": self._slot is not None,
+            }
+        status["last_result"] = (
+            {
+                "success": latest.success,
+                "applied_dl_rate": latest.applied_dl_rate,
+                "applied_ul_rate": latest.applied_ul_rate,
+                "apply_ms": latest.apply_ms,
+                "lag_ms": latest.lag_ms,
+                "age_sec": time.monotonic() - latest.completed_monotonic,
+            }
+            if latest is not None
+            else None
+        )
+        return status
+
+    def start(self) -> None:
+        """Create and start the background daemon thread."""
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"wanctl-router-apply-{self._wan_name}",
+            daemon=True,
+        )
+        self._thread.start()
+        logger.info("Background router apply thread started (WAN=%s)", self._wan_name)
+
+    def stop(self) -> None:
+        """Wake and join the background thread (up to 5s timeout)."""
+        if self._thread is not None:
+            with self._cond:
+                self._stopping = True
+                self._cond.notify_all()
+            self._thread.join(timeout=5.0)
+            logger.info("Background router apply thread stopped (WAN=%s)", self._wan_name)
+
+    def _run(self) -> None:
+        """Apply loop — runs until stop(), after draining any waiting target.
+
+        shutdown_event is already set when the controller's final
+        wait_idle() runs, so it must not end the loop before the last
+        posted target reaches the router.
+        """
+        while True:
+            with self._cond:
+                while self._slot is None and not self._stopping:
+                    self._cond.wait(timeout=0.5)
+                entry = self._slot
+                if entry is None:
+                    return
+                self._in_flight, self._slot = entry, None
+
+            seq, dl_rate, ul_rate, posted = entry
+            error: Exception | None = None
+            applied = (dl_rate, ul_rate)
+            timings: dict[str, float] = {}
+            t0 = time.perf_counter()
+            try:
+                success, applied, timings = self._apply_fn(dl_rate, ul_rate)
+            except Exception as e:
+                success, error = False, e
+                logger.debug("Background router apply error", exc_info=True)
+            apply_ms = (time.perf_counter() - t0) * 1000.0
+            self._profiler.record("router_apply_background", apply_ms)
+
+            result = RouterApplyResult(
+                seq=seq,
+                dl_rate=dl_rate,
+                ul_rate=ul_rate,
+                success=success,
+                applied_dl_rate=applied[0],
+                applied_ul_rate=applied[1],
+                posted_monotonic=posted,
+                completed_monotonic=time.monotonic(),
+                apply_ms=apply_ms,
+                write_timings=timings,
+                error=error,
+            )
+            with self._cond:
+                self._latest = result
+                self._in_flight = None
+                if success:
+                    self._applied += 1
+                    self._uncollected_applied += 1
+                else:
+                    self._failed += 1
+                    self._uncollected_failed += 1
+                self._cond.notify_all()
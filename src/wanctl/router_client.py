@@ -48,7 +48,7 @@ from __future__ import annotations
 import logging
 import os
 import time as _time
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Any, Union
 
 from wanctl.routeros_ssh import RouterOSSSH
 
@@ -346,6 +346,18 @@ class FailoverRouterClient:
             self._probe_interval = _REPROBE_INITIAL_INTERVAL  # reset interval
             return self._get_fallback().run_cmd(cmd, capture=capture, timeout=timeout)  # type: ignore[no-any-return]
 
+    def get_transport_stats(self) -> dict[str, Any]:
+        """Return the active transport and its own stats for the health endpoint."""
+        if self._using_fallback:
+            transport, client = self.fallback_transport, self._fallback_client
+        else:
+            transport, client = self.primary_transport, self._primary_client
+        stats: dict[str, Any] = {"transport": transport, "using_fallback": self._using_fallback}
+        client_stats = getattr(client, "get_transport_stats", None)
+        if callable(client_stats):
+            stats.update(client_stats())
+        return stats
+
     def close(self) -> None:
         """Close all transport connections.
 
@@ -5,6 +5,7 @@ and delegates command execution to the underlying transport backend.
 """
 
 import logging
+from typing import Any
 
 from wanctl.autorate_config import Config
 from wanctl.router_client import get_router_client_with_failover
@@ -69,3 +70,7 @@ class RouterOS:
             return False
 
         return True
+
+    def get_transport_stats(self) -> dict[str, Any]:
+        """Return router client transport stats for the health endpoint."""
+        return self.client.get_transport_stats()
@@ -642,69 +642,13 @@ class RouterOSREST:
         self, cmd: str, timeout: int | None = None
     ) -> list[dict[str, Any]] | None:
         """Handle /ip route print commands via REST."""
-        timeout_val = timeout if timeout is not None else self.timeout
-        url = f"{self.base_url}/ip/route"
-        filter_spec = self._parse_where_filter(cmd)
-
-        try:
-            resp = self._request("GET", url, timeout=timeout_val)
-            if not resp.ok:
-                self.logger.error(f"Failed to get routes: {resp.status_code}")
-                return None
-
-            items = resp.json()
-            if filter_spec is None:
-                return items  # type: ignore[no-any-return]
-
-            field, value, contains_match = filter_spec
-            matched = []
-            for item in items:
-                item_value = item.get(field)
-                if not isinstance(item_value, str):
-                    continue
-                if (contains_match and value in item_value) or (
-                    not contains_match and item_value == value
-                ):
-                    matched.append(item)
-            return matched
-
-        except requests.RequestException as e:
-            self.logger.error(f"REST API error getting routes: {e}")
-            return None
+        return self._handle_print("ip/route", "routes", cmd, timeout=timeout)
 
     def _handle_netwatch_print(
         self, cmd: str, timeout: int | None = None
     ) -> list[dict[str, Any]] | None:
         """Handle /tool netwatch print commands via REST (read-only GET)."""
-        timeout_val = timeout if timeout is not None else self.timeout
-        url = f"{self.base_url}/tool/netwatch"
-        filter_spec = self._parse_where_filter(cmd)
-
-        try:
-            resp = self._request("GET", url, timeout=timeout_val)
-            if not resp.ok:
-                self.logger.error(f"Failed to get netwatch: {resp.status_code}")
-                return None
-
-            items = resp.json()
-            if filter_spec is None:
-                return items  # type: ignore[no-any-return]
-
-            field, value, contains_match = filter_spec
-            matched = []
-            for item in items:
-                item_value = item.get(field)
-                if not isinstance(item_value, str):
-                    continue
-                if (contains_match and value in item_value) or (
-                    not contains_match and item_value == value
-                ):
-                    matched.append(item)
-            return matched
-
-        except requests.RequestException as e:
-            self.logger.error(f"REST API error getting netwatch: {e}")
-            return None
+        return self._handle_print("tool/netwatch", "netwatch", cmd, timeout=timeout)
 
     @staticmethod
     def _parse_netwatch_set_args(cmd: str) -> tuple[str | None, dict[str, str]] | None:
@@ -851,36 +795,81 @@ class RouterOSREST:
         self, cmd: str, timeout: int | None = None
     ) -> list[dict[str, Any]] | None:
         """Handle /system script print commands via REST (read-only GET)."""
+        return self._handle_print("system/script", "scripts", cmd, timeout=timeout)
+
+    def _handle_print(
+        self, path: str, label: str, cmd: str, timeout: int | None = None
+    ) -> list[dict[str, Any]] | None:
+        """Read a menu via GET, pushing filter and projection to the router.
+
+        An exact ``where`` filter and a ``proplist=`` projection are sent as
+        query parameters so RouterOS returns only the matching rows and
+        columns, rather than the whole table for filtering here. Both are
+        re-applied to the response, so the result is the same from a router
+        that ignores either parameter.
+        """
         timeout_val = timeout if timeout is not None else self.timeout
-        url = f"{self.base_url}/system/script"
+        url = f"{self.base_url}/{path}"
         filter_spec = self._parse_where_filter(cmd)
+        proplist = self._parse_proplist(cmd)
+
+        params: dict[str, str] = {}
+        if filter_spec is not None:
+            field, value, contains_match = filter_spec
+            if not contains_match:
+                params[field] = value
+            elif proplist is not None and field not in proplist:
+                # The contains match runs here, so the router must return the field
+                proplist = [*proplist, field]
+        if proplist is not None:
+            params[".proplist"] = ",".join(proplist)
 
         try:
-            resp = self._request("GET", url, timeout=timeout_val)
+            if params:
+                resp = self._request("GET", url, params=params, timeout=timeout_val)
+            else:
+                resp = self._request("GET", url, timeout=timeout_val)
             if not resp.ok:
-                self.logger.error(f"Failed to get scripts: {resp.status_code}")
+                self.logger.error(f"Failed to get {label}: {resp.status_code}")
                 return None
 
             items = resp.json()
-            if filter_spec is None:
-                return items  # type: ignore[no-any-return]
-
-            field, value, contains_match = filter_spec
-            matched = []
-            for item in items:
-                item_value = item.get(field)
-                if not isinstance(item_value, str):
-                    continue
-                if (contains_match and value in item_value) or (
-                    not contains_match and item_value == value
-                ):
-                    matched.append(item)
-            return matched
+            if filter_spec is not None:
+                items = self._match_where_filter(items, filter_spec)
+            if proplist is not None:
+                items = [{key: item[key] for key in proplist if key in item} for item in items]
+            return items  # type: ignore[no-any-return]
 
         except requests.RequestException as e:
-            self.logger.error(f"REST API error getting scripts: {e}")
+            self.logger.error(f"REST API error getting {label}: {e}")
             return None
 
+    @staticmethod
+    def _parse_proplist(cmd: str) -> list[str] | None:
+        """Extract the property names of a ``print proplist=a,b,c`` command."""
+        match = re.search(r"\bproplist=([^\s\]]+)", cmd)
+        if not match:
+            return None
+        props = [prop for prop in match.group(1).strip('"').split(",") if prop]
+        return props or None
+
+    @staticmethod
+    def _match_where_filter(
+        items: list[dict[str, Any]], filter_spec: tuple[str, str, bool]
+    ) -> list[dict[str, Any]]:
+        """Apply a parsed ``where`` filter to print results."""
+        field, value, contains_match = filter_spec
+        matched = []
+        for item in items:
+            item_value = item.get(field)
+            if not isinstance(item_value, str):
+                continue
+            if (contains_match and value in item_value) or (
+                not contains_match and item_value == value
+            ):
+                matched.append(item)
+        return matched
+
     def _find_unique_route(
         self, field: str, value: str, timeout: int | None = None
     ) -> dict[str, Any] | None:
@@ -6,7 +6,9 @@ consistent behavior (retry logic, timeouts, logging).
 
 Uses paramiko for persistent SSH connections to minimize connection overhead.
 A single connection is maintained for the daemon lifetime, with automatic
-reconnection on failure.
+reconnection on failure. With ssh_mode="shell" commands are written into a
+persistent console channel instead of a new exec channel each
+(see routeros_ssh_shell.py).
 
 Usage:
     from wanctl.routeros_ssh import RouterOSSSH
@@ -29,14 +31,23 @@ from __future__ import annotations
 import logging
 import time
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import paramiko
 
 if TYPE_CHECKING:
     from wanctl.config_base import BaseConfig
 
+from wanctl.perf_profiler import ArrayOperationProfiler
 from wanctl.retry_utils import retry_with_backoff
+from wanctl.routeros_ssh_shell import RouterOSShellSession
+
+# "exec": one exec channel per command; "shell": persistent console channel
+SSH_MODES = ("exec", "shell")
+
+# RouterOS login flags for the console: no colors (c), no terminal
+# auto-detection (t), and a width that keeps frames on one line
+_SHELL_LOGIN_SUFFIX = "+ct4096w"
 
 
 class RouterOSSSH:
@@ -58,6 +69,7 @@ class RouterOSSSH:
         ssh_key: Path to SSH private key file
         timeout: Command timeout in seconds
         logger: Logger instance for debug/error messages
+        ssh_mode: "exec" (default) or "shell"
     """
 
     def __init__(
@@ -67,6 +79,7 @@ class RouterOSSSH:
         ssh_key: str,
         timeout: int = 15,
         logger: logging.Logger | None = None,
+        ssh_mode: str = "exec",
     ):
         """Initialize RouterOS SSH client.
 
@@ -76,13 +89,28 @@ class RouterOSSSH:
             ssh_key: Path to SSH private key file
             timeout: Command timeout in seconds (default: 15)
             logger: Logger instance (optional, creates null logger if not provided)
+            ssh_mode: "exec" opens an exec channel per command; "shell" keeps a
+                persistent console channel open (default: "exec")
+
+        Raises:
+            ValueError: If ssh_mode is not one of SSH_MODES
         """
+        if ssh_mode not in SSH_MODES:
+            raise ValueError(f"Unsupported ssh_mode: {ssh_mode!r}")
         self.host = host
         self.user = user
         self.ssh_key = ssh_key
         self.timeout = timeout
         self.logger = logger or logging.getLogger(__name__)
+        self.ssh_mode = ssh_mode
         self._client: paramiko.SSHClient | None = None
+        self._shell_client: paramiko.SSHClient | None = None
+        self._shell: RouterOSShellSession | None = (
+            RouterOSShellSession(self._open_shell_channel, self.logger)
+            if ssh_mode == "shell"
+            else None
+        )
+        self._profiler = ArrayOperationProfiler(max_samples=1200)
 
     def _get_known_hosts_path(self) -> Path:
         """Get path to user's known_hosts file.
@@ -111,6 +139,7 @@ class RouterOSSSH:
         - router_user: str
         - ssh_key: str
         - timeout_ssh_command: int (optional, defaults to 15)
+        - router_ssh_mode: str (optional, defaults to "exec")
 
         Args:
             config: Configuration object with router connection settings
@@ -119,12 +148,14 @@ class RouterOSSSH:
         Returns:
             Configured RouterOSSSH instance
         """
+        ssh_mode = getattr(config, "router_ssh_mode", "exec")
         return cls(
             host=config.router_host,
             user=config.router_user,
             ssh_key=config.ssh_key,
             timeout=getattr(config, "timeout_ssh_command", 15),
             logger=logger,
+            ssh_mode=ssh_mode if ssh_mode in SSH_MODES else "exec",
         )
 
     def _connect(self) -> None:
@@ -141,22 +172,26 @@ class RouterOSSSH:
             paramiko.SSHException: On connection failure or host key mismatch
             FileNotFoundError: If SSH key file doesn't exist
         """
-        self._client = paramiko.SSHClient()
+        self._client = self._new_client(self.user)
+
+    def _new_client(self, username: str) -> paramiko.SSHClient:
+        """Create and connect an SSHClient with host key validation enabled."""
+        client = paramiko.SSHClient()
 
         # Load system and user known_hosts for host key verification
         # This prevents MITM attacks by validating router identity
-        self._client.load_system_host_keys()
-        self._client.load_host_keys(str(self._get_known_hosts_path()))
+        client.load_system_host_keys()
+        client.load_host_keys(str(self._get_known_hosts_path()))
 
         # RejectPolicy is the default - connection fails if host key not in known_hosts
         # Do NOT use AutoAddPolicy - it accepts any key and enables MITM attacks
-        self._client.set_missing_host_key_policy(paramiko.RejectPolicy())
+        client.set_missing_host_key_policy(paramiko.RejectPolicy())
 
-        self.logger.debug(f"Establishing SSH connection to {self.user}@{self.host}")
+        self.logger.debug(f"Establishing SSH connection to {username}@{self.host}")
 
-        self._client.connect(
+        client.connect(
             hostname=self.host,
-            username=self.user,
+            username=username,
             key_filename=self.ssh_key,
             timeout=10,  # Connection timeout
             allow_agent=False,
@@ -164,6 +199,7 @@ class RouterOSSSH:
         )
 
         self.logger.debug(f"SSH connection established to {self.host}")
+        return client
 
     def _is_connected(self) -> bool:
         """Check if SSH connection is still alive.
@@ -191,6 +227,49 @@ class RouterOSSSH:
                     pass  # nosec B110 - cleanup during reconnect, failure acceptable
             self._connect()
 
+    def _open_shell_channel(self) -> paramiko.Channel:
+        """Open a console channel on a dedicated connection for shell mode.
+
+        Runs on the shell session's reconnect thread, so the connection is
+        separate from the exec client used by run_cmd() meanwhile.
+        """
+        if self._shell_client is not None:
+            try:
+                self._shell_client.close()
+            except Exception:
+                pass  # nosec B110 - replacing a dead connection, failure acceptable
+            self._shell_client = None
+        self._shell_client = self._new_client(self.user + _SHELL_LOGIN_SUFFIX)
+        transport = self._shell_client.get_transport()
+        if transport is None:
+            raise paramiko.SSHException("SSH transport unavailable for shell channel")
+        channel = transport.open_session()
+        channel.get_pty(term="dumb", width=4096, height=10000)
+        channel.invoke_shell()
+        return channel
+
+    def _run_shell_cmd(self, cmd: str, capture: bool, timeout: int) -> tuple[int, str, str] | None:
+        """Run a command over the shell session, or None to use an exec channel.
+
+        The session reconnects in the background; until it is ready, and on
+        a channel failure mid-command, the command goes over exec instead.
+        A timeout is raised like an exec timeout.
+        """
+        assert self._shell is not None
+        if not self._shell.ready:
+            self._shell.start()
+            return None
+        try:
+            ((rc, stdout_text, stderr_text),) = self._shell.run([cmd], timeout=timeout)
+        except ConnectionError as e:
+            self.logger.debug(f"RouterOS shell unavailable, using exec channel: {e}")
+            return None
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"RouterOS stdout: {stdout_text}")
+        if capture:
+            return rc, stdout_text, stderr_text
+        return rc, "", ""
+
     @retry_with_backoff(max_attempts=2, initial_delay=0.05, backoff_factor=1.0, max_delay=0.1)
     def run_cmd(
         self, cmd: str, capture: bool = False, timeout: int | None = None
@@ -223,11 +302,18 @@ class RouterOSSSH:
         Raises:
             Exception: On non-retryable errors or after max retry attempts
         """
+        timeout_val = timeout if timeout is not None else self.timeout
+        if self._shell is not None:
+            self.logger.debug(f"RouterOS shell command: {cmd} (timeout={timeout_val}s)")
+            shell_result = self._run_shell_cmd(cmd, capture, timeout_val)
+            if shell_result is not None:
+                return shell_result
+
         self._ensure_connected()
         assert self._client is not None  # Guaranteed by _ensure_connected()
 
-        timeout_val = timeout if timeout is not None else self.timeout
         self.logger.debug(f"RouterOS command: {cmd} (timeout={timeout_val}s)")
+        start = time.perf_counter()
 
         try:
             # Execute command with timeout
@@ -262,6 +348,7 @@ class RouterOSSSH:
                 time.sleep(poll_interval)
                 elapsed += poll_interval
             exit_status = stdout.channel.recv_exit_status()
+            self._profiler.record("ssh_exec_command", (time.perf_counter() - start) * 1000.0)
 
             if capture:
                 stdout_text = stdout.read().decode("utf-8", errors="replace")
@@ -280,12 +367,32 @@ class RouterOSSSH:
             self._client = None
             raise
 
+    def get_transport_stats(self) -> dict[str, Any]:
+        """Return SSH mode and per-command latency for the health endpoint."""
+        stats: dict[str, Any] = {
+            "transport": "ssh",
+            "ssh_mode": self.ssh_mode,
+            "exec_command_ms": self._profiler.stats("ssh_exec_command"),
+        }
+        if self._shell is not None:
+            stats["shell"] = self._shell.get_status()
+        return stats
+
     def close(self) -> None:
         """Close the persistent SSH connection.
 
         Should be called when the daemon shuts down to clean up resources.
         Safe to call multiple times or when not connected.
         """
+        if self._shell is not None:
+            self._shell.close()
+        if self._shell_client is not None:
+            try:
+                self._shell_client.close()
+            except Exception as e:
+                self.logger.debug(f"Error closing SSH shell connection: {e}")
+            finally:
+                self._shell_client = None
         if self._client is not None:
             try:
                 self._client.close()
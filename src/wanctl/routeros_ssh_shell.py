@@ -0,0 +1,265 @@
+"""Persistent RouterOS console channel for SSH command execution.
+
+In exec mode RouterOSSSH opens a new SSH exec channel for every command, so
+each rate write pays a channel open/close round trip on top of the command
+itself. In shell mode a single interactive console channel stays open for
+the life of the client and commands are written into it.
+
+Each command is framed so the console reports its outcome in-band:
+
+    {:local r 0; :do {<cmd>} on-error={:set r 1}; :put "<tag>_rc=$r"}
+    :put "<tag>_end"
+
+The tag carries a per-session nonce and a sequence number. Responses are
+read up to the tag's end marker, so several framed commands can be written
+back to back and their responses split apart in order. Output lines that
+contain the tag are the console's echo of the frame and are dropped.
+
+A dropped channel or a response that misses its deadline leaves the console
+in an unknown state, so the channel is closed and a background thread
+reopens it with backoff. RouterOSSSH runs commands over exec channels until
+the session is ready again.
+"""
+
+from __future__ import annotations
+
+import codecs
+import logging
+import re
+import secrets
+import threading
+import time
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import paramiko
+
+from wanctl.perf_profiler import ArrayOperationProfiler
+
+# Opens an authenticated console channel (pty + shell already requested)
+ShellChannelOpener = Callable[[], paramiko.Channel]
+
+# Reconnect backoff after a dropped or desynchronized channel
+_RECONNECT_INITIAL_DELAY = 0.5
+_RECONNECT_MAX_DELAY = 30.0
+
+# Deadline for the login banner and first prompt to be flushed
+_SYNC_TIMEOUT = 10.0
+
+_ANSI_RE = re.compile(r"\x1b\[[0-9;?]*[A-Za-z]")
+_PROMPT_RE = re.compile(r"^\[[^\]]*\]\s*>\s*$")
+
+
+class RouterOSShellSession:
+    """One persistent RouterOS console channel with sentinel-framed commands.
+
+    Args:
+        open_channel: Opens a fresh console channel; see ShellChannelOpener
+        logger: Logger instance
+    """
+
+    def __init__(self, open_channel: ShellChannelOpener, logger: logging.Logger) -> None:
+        self._open_channel = open_channel
+        self._logger = logger
+        # Serializes command I/O on the channel
+        self._lock = threading.Lock()
+        self._channel: paramiko.Channel | None = None
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._buffer = ""
+        self._nonce = secrets.token_hex(4)
+        self._seq = 0
+        self._closed = threading.Event()
+        # Guards _connecting; taken inside _lock, never the other way round
+        self._start_lock = threading.Lock()
+        self._connecting = False
+        self._reconnect_thread: threading.Thread | None = None
+        self._connects = 0
+        self._drops = 0
+        self._last_command_ms: float | None = None
+        self._profiler = ArrayOperationProfiler(max_samples=1200)
+
+    @property
+    def ready(self) -> bool:
+        """True while a synchronized console channel is open."""
+        return self._channel is not None
+
+    def start(self) -> None:
+        """Open the channel in the background unless it is open or opening."""
+        with self._start_lock:
+            if self._closed.is_set() or self.ready or self._connecting:
+                return
+            self._connecting = True
+        self._reconnect_thread = threading.Thread(
+            target=self._reconnect_loop,
+            name="wanctl-ssh-shell-reconnect",
+            daemon=True,
+        )
+        self._reconnect_thread.start()
+
+    def run(self, cmds: Sequence[str], timeout: float) -> list[tuple[int, str, str]]:
+        """Write all commands at once, then read their responses in order.
+
+        Args:
+            cmds: RouterOS commands (single line each)
+            timeout: Seconds allowed for the whole batch
+
+        Returns:
+            (returncode, stdout, stderr) per command. A failed command reports
+            returncode 1 with the console output as stderr.
+
+        Raises:
+            ConnectionError: If the channel is not open or drops mid-batch
+            TimeoutError: If a response misses the deadline
+        """
+        with self._lock:
+            channel = self._channel
+            if channel is None:
+                raise ConnectionError("RouterOS shell channel is not connected")
+            tags = []
+            frames = []
+            for cmd in cmds:
+                self._seq += 1
+                tag = f"__wanctl_{self._nonce}_{self._seq}"
+                tags.append(tag)
+                frames.append(_frame(cmd, tag))
+
+            start = time.perf_counter()
+            deadline = time.monotonic() + timeout
+            results = []
+            try:
+                channel.sendall("".join(frames).encode())
+                for tag in tags:
+                    results.append(_parse_response(self._read_until(channel, tag, deadline), tag))
+                    elapsed_ms = (time.perf_counter() - start) * 1000.0
+                    self._profiler.record("ssh_shell_command", elapsed_ms)
+                    self._last_command_ms = elapsed_ms
+            except TimeoutError:
+                self._drop(channel, "response timed out")
+                raise
+            except (OSError, EOFError, paramiko.SSHException) as e:
+                self._drop(channel, str(e) or type(e).__name__)
+                raise ConnectionError(f"RouterOS shell channel failed: {e}") from e
+            return results
+
+    def get_status(self) -> dict[str, Any]:
+        """Return connection counters and per-command latency."""
+        return {
+            "connected": self.ready,
+            "connects": self._connects,
+            "drops": self._drops,
+            "last_command_ms": self._last_command_ms,
+            "command_ms": self._profiler.stats("ssh_shell_command"),
+        }
+
+    def close(self) -> None:
+        """Close the channel and stop reconnecting. Safe to call repeatedly."""
+        self._closed.set()
+        with self._lock:
+            channel, self._channel = self._channel, None
+        if channel is not None:
+            _close_quietly(channel)
+        if self._reconnect_thread is not None:
+            self._reconnect_thread.join(timeout=5.0)
+
+    def _drop(self, channel: paramiko.Channel, reason: str) -> None:
+        """Close a channel that can no longer be trusted and reconnect. Caller holds _lock."""
+        self._logger.warning(f"RouterOS shell channel dropped ({reason}); reconnecting")
+        self._channel = None
+        self._drops += 1
+        _close_quietly(channel)
+        self.start()
+
+    def _reconnect_loop(self) -> None:
+        delay = 0.0
+        while not self._closed.wait(delay):
+            try:
+                channel = self._open_and_sync()
+            except Exception as e:
+                delay = min(max(delay * 2, _RECONNECT_INITIAL_DELAY), _RECONNECT_MAX_DELAY)
+                self._logger.debug(f"RouterOS shell connect failed: {e}; retry in {delay:.1f}s")
+                continue
+            with self._lock:
+                if self._closed.is_set():
+                    _close_quietly(channel)
+                    return
+                self._channel = channel
+                self._connects += 1
+                with self._start_lock:
+                    self._connecting = False
+            self._logger.info("RouterOS shell channel connected")
+            return
+
+    def _open_and_sync(self) -> paramiko.Channel:
+        """Open a channel and discard the banner up to a sync marker."""
+        channel = self._open_channel()
+        tag = f"__wanctl_{self._nonce}_sync{self._connects}"
+        try:
+            channel.sendall(f':put "{tag}_end"\r\n'.encode())
+            self._buffer = ""
+            self._decoder.reset()
+            self._read_until(channel, tag, time.monotonic() + _SYNC_TIMEOUT)
+        except Exception:
+            _close_quietly(channel)
+            raise
+        return channel
+
+    def _read_until(self, channel: paramiko.Channel, tag: str, deadline: float) -> str:
+        """Receive until the tag's end marker line; return the text before it."""
+        end_re = re.compile(rf"^{re.escape(tag)}_end$", re.MULTILINE)
+        while True:
+            match = end_re.search(self._buffer)
+            if match is not None:
+                block = self._buffer[: match.start()]
+                self._buffer = self._buffer[match.end() :].lstrip("\n")
+                return block
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"RouterOS shell response timed out ({tag})")
+            channel.settimeout(remaining)
+            try:
+                data = channel.recv(65536)
+            except TimeoutError as e:
+                raise TimeoutError(f"RouterOS shell response timed out ({tag})") from e
+            if not data:
+                raise EOFError("RouterOS shell channel closed by peer")
+            self._buffer += self._decoder.decode(data).replace("\r", "")
+
+
+def _frame(cmd: str, tag: str) -> str:
+    """Wrap a command so the console prints its return code and an end marker."""
+    cmd = " ".join(cmd.splitlines())
+    return (
+        f'{{:local r 0; :do {{{cmd}}} on-error={{:set r 1}}; :put "{tag}_rc=$r"}}\r\n'
+        f':put "{tag}_end"\r\n'
+    )
+
+
+def _parse_response(block: str, tag: str) -> tuple[int, str, str]:
+    """Split a framed response into (returncode, stdout, stderr).
+
+    A missing return code line means the console rejected the frame before
+    running it (syntax error), which is reported as a failure.
+    """
+    rc_re = re.compile(rf"^{re.escape(tag)}_rc=(\d+)$")
+    rc = 1
+    output: list[str] = []
+    for raw_line in block.split("\n"):
+        line = _ANSI_RE.sub("", raw_line).rstrip()
+        rc_match = rc_re.match(line)
+        if rc_match is not None:
+            rc = int(rc_match.group(1))
+            continue
+        if tag in line or not line or _PROMPT_RE.match(line):
+            continue
+        output.append(line)
+    text = "\n".join(output)
+    if rc == 0:
+        return 0, text, ""
+    return rc, "", text
+
+
+def _close_quietly(channel: paramiko.Channel) -> None:
+    try:
+        channel.close()
+    except Exception:
+        pass  # nosec B110 - closing a broken channel, failure acceptable
@@ -28,11 +28,8 @@ import shutil
 import threading
 import time
 from collections.abc import Callable
-from typing import Any, Protocol, cast
+from typing import TYPE_CHECKING, Any, Protocol, cast
 
-from wanctl.check_config_validators import MEASUREMENT_BACKENDS
-from wanctl.fping_measurement import FpingMeasurement, FpingThread
-from wanctl.irtt_thread import IRTTThread
 from wanctl.rtt_backend import (
     IrttRttBackend,
     RttBackend,
@@ -47,6 +44,14 @@ from wanctl.rtt_measurement import (
     RTTSnapshot,
 )
 
+if TYPE_CHECKING:
+    from wanctl.fping_measurement import FpingThread
+    from wanctl.irtt_thread import IRTTThread
+    from wanctl.measurement_scheduler import MeasurementSlot
+
+# fping, IRTT and the config validator table are imported on first use:
+# icmplib-only deployments (and steering) never load them at startup.
+
 _FALLBACK_WARNED: set[tuple[str, str]] = set()
 
 
@@ -158,22 +163,27 @@ class RttBackendHandle:
         *,
         pool: concurrent.futures.ThreadPoolExecutor | None = None,
         cadence_sec: float,
+        schedule_for: Callable[[float], MeasurementSlot] | None = None,
     ) -> RttDriverThread:
         """Build the concrete driver only after pool and hosts_fn exist.
 
         The icmplib path uses the caller-supplied controller cadence.  The fping
         and irtt paths deliberately ignore that value and use their own cadences
-        resolved at factory time.
+        resolved at factory time.  ``schedule_for`` registers the chosen driver's
+        cadence with the measurement scheduler and returns its slot.
         """
         if self.backend_active == "irtt":
             if self.irtt_config is None:
                 raise ValueError("irtt backend requested but no IRTT config")
+            from wanctl.irtt_thread import IRTTThread
+
             irtt_backend = cast(IrttRttBackend, self.backend)
             irtt_thread = IRTTThread(
                 irtt_backend._measurement,
                 cadence_sec=self.irtt_cadence_sec,
                 shutdown_event=shutdown_event,
                 logger=self._logger,
+                schedule=schedule_for(self.irtt_cadence_sec) if schedule_for else None,
             )
             server = self.irtt_config.get("server")
             if not isinstance(server, str) or not server:
@@ -181,6 +191,8 @@ class RttBackendHandle:
             return _IrttDriverThread(irtt_thread, server)
 
         if self.backend_active == "fping":
+            from wanctl.fping_measurement import FpingThread
+
             try:
                 fping_thread = FpingThread(
                     self.backend,  # type: ignore[arg-type]
@@ -188,6 +200,7 @@ class RttBackendHandle:
                     cadence_sec=self.fping_cadence_sec,
                     shutdown_event=shutdown_event,
                     logger=self._logger,
+                    schedule=schedule_for(self.fping_cadence_sec) if schedule_for else None,
                 )
             except ValueError as exc:
                 self._warn_once(
@@ -210,6 +223,7 @@ class RttBackendHandle:
             logger=self._logger,
             pool=pool,
             cadence_sec=cadence_sec,
+            schedule=schedule_for(cadence_sec) if schedule_for else None,
         )
 
     def _warn_once(self, reason: str, message: str) -> None:
@@ -230,6 +244,8 @@ def build_rtt_backend(
     """Resolve and construct the configured RTT backend handle."""
     measurement_config = (getattr(config, "data", {}).get("measurement", {}) or {})
     requested = measurement_config.get("backend", "icmplib")
+    from wanctl.check_config_validators import MEASUREMENT_BACKENDS
+
     if requested not in MEASUREMENT_BACKENDS:
         msg = f"Unknown measurement.backend: {requested!r}. Must be one of: {list(MEASUREMENT_BACKENDS)}"
         raise ValueError(msg)
@@ -279,6 +295,8 @@ def build_rtt_backend(
         )
 
     if requested == "fping" and shutil.which("fping") is not None:
+        from wanctl.fping_measurement import FpingMeasurement
+
         fping_backend = FpingMeasurement(_fping_measurement_config(fping_config, source_ip), logger)
         controller_measurement = _build_controller_measurement(config, source_ip, logger)
         return RttBackendHandle(
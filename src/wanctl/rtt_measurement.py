@@ -19,9 +19,10 @@ from typing import TYPE_CHECKING
 
 import icmplib
 
-from wanctl.perf_profiler import OperationProfiler
+from wanctl.perf_profiler import ArrayOperationProfiler
 
 if TYPE_CHECKING:
+    from wanctl.measurement_scheduler import MeasurementSlot
     from wanctl.rtt_backend import RttSample
 
 # Pre-compiled regex for RTT parsing (avoids per-call compilation overhead)
@@ -460,6 +461,8 @@ class BackgroundRTTThread:
         cadence_sec: Minimum seconds between measurement cycles. Autorate
             binds this to the controller interval so the background probe rate
             cannot outrun the control loop.
+        schedule: Optional :class:`MeasurementSlot` that plans each next
+            measurement start instead of the fixed *cadence_sec* wait.
     """
 
     def __init__(
@@ -470,6 +473,7 @@ class BackgroundRTTThread:
         logger: logging.Logger,
         pool: concurrent.futures.ThreadPoolExecutor,
         cadence_sec: float = 0.0,
+        schedule: "MeasurementSlot | None" = None,
     ) -> None:
         self._rtt_measurement = rtt_measurement
         self._hosts_fn = hosts_fn
@@ -477,9 +481,10 @@ class BackgroundRTTThread:
         self._logger = logger
         self._pool = pool
         self._cadence_sec = cadence_sec
+        self._schedule = schedule
         self._cached: RTTSnapshot | None = None
         self._last_cycle_status: RTTCycleStatus | None = None
-        self._profiler = OperationProfiler(max_samples=1200)
+        self._profiler = ArrayOperationProfiler(max_samples=1200)
         self._thread: threading.Thread | None = None
         # Briefly back off reflector probing during a live all-host ICMP blackout
         # so the controller can ride on cached RTT without hammering public targets.
@@ -583,16 +588,25 @@ class BackgroundRTTThread:
             except Exception:
                 self._logger.debug("Background RTT measurement error", exc_info=True)
 
+            blackout = (
+                self._last_cycle_status is not None
+                and self._last_cycle_status.successful_count == 0
+                and self._cached is not None
+            )
+            if self._schedule is not None:
+                self._schedule.wait_next(
+                    elapsed_s,
+                    self._shutdown_event,
+                    min_delay_sec=self._blackout_backoff_sec if blackout else 0.0,
+                )
+                continue
+
             # Adjust sleep to account for measurement duration
             if self._cadence_sec > 0:
                 sleep_s = max(0.0, self._cadence_sec - elapsed_s)
             else:
                 sleep_s = 0.0
-            if (
-                self._last_cycle_status is not None
-                and self._last_cycle_status.successful_count == 0
-                and self._cached is not None
-            ):
+            if blackout:
                 sleep_s = max(sleep_s, self._blackout_backoff_sec)
             self._shutdown_event.wait(timeout=sleep_s)
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import Any
 
@@ -50,6 +51,25 @@ def read_process_memory_status(status_path: str = "/proc/self/status") -> tuple[
     return rss_bytes, swap_bytes
 
 
+def read_process_age_seconds(
+    stat_path: str = "/proc/self/stat", uptime_path: str = "/proc/uptime"
+) -> float | None:
+    """Seconds since this process started, from /proc/self/stat starttime.
+
+    Measured from exec, so it includes interpreter startup and imports that
+    happen before any wanctl code can take a timestamp.
+    """
+    try:
+        # comm (field 2) may contain spaces; fields after the last ')' are fixed
+        fields = Path(stat_path).read_text().rsplit(")", 1)[1].split()
+        start_ticks = int(fields[19])  # field 22 (starttime), 0-based after comm
+        uptime = float(Path(uptime_path).read_text().split()[0])
+        ticks_per_sec = os.sysconf("SC_CLK_TCK")
+    except (IndexError, ValueError, OSError):
+        return None
+    return max(0.0, uptime - start_ticks / ticks_per_sec)
+
+
 def classify_memory_status(rss_bytes: int | None) -> str:
     """Classify RSS pressure into ok/warning/critical/unknown."""
     if rss_bytes is None:
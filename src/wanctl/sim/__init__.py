@@ -0,0 +1,40 @@
+"""Faster-than-real-time closed-loop autorate simulator.
+
+Runs an unmodified WANController.run_cycle() against a fluid model of a
+CAKE bottleneck on a virtual clock. The rates the controller applies change
+the simulated queue, and so the RTT and CAKE stats it measures next cycle.
+
+Example:
+    config = Config("/etc/wanctl/spectrum.yaml")
+    link = BottleneckLink(
+        download=LinkDirection(
+            capacity_bps=Trace.diurnal(600e6, 900e6),
+            demand_bps=Trace.constant(1e9),
+        ),
+        upload=LinkDirection(Trace.constant(38e6), Trace.constant(20e6)),
+        base_rtt_ms=22.0,
+        jitter_ms=1.0,
+    )
+    with Simulation(config, link) as sim:
+        print(sim.run(86400, sample_every=20).summary())
+"""
+
+from wanctl.sim.clock import VirtualClock
+from wanctl.sim.engine import (
+    SimulatedCakeBackend,
+    SimulatedRTTMeasurement,
+    Simulation,
+    SimulationResult,
+)
+from wanctl.sim.link import BottleneckLink, LinkDirection, Trace
+
+__all__ = [
+    "BottleneckLink",
+    "LinkDirection",
+    "SimulatedCakeBackend",
+    "SimulatedRTTMeasurement",
+    "Simulation",
+    "SimulationResult",
+    "Trace",
+    "VirtualClock",
+]
@@ -0,0 +1,119 @@
+"""Virtual clock for running wanctl control code faster than real time.
+
+Controller code reads time through its module-level ``time`` import
+(``time.monotonic()`` for hold-downs, staleness and rate limiting,
+``time.time()`` for windows and timestamps). Those attributes are the
+control cycle's time seams: the test suite swaps them with
+``patch("wanctl.<module>.time...")``, and VirtualClock.install() binds the
+modules in CONTROL_TIME_SEAMS the same way, so simulated seconds pass only
+when the simulator calls advance(). Everything else (storage, alerting,
+background threads, the test suite's own modules) keeps real time.
+
+``time.perf_counter()`` stays real: PerfTimer profiling and cycle-budget
+accounting keep measuring actual CPU cost, which is what the simulator
+reports as cycles per second.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import importlib
+import time
+from collections.abc import Iterable, Iterator
+from types import ModuleType
+from typing import Any
+
+# Arbitrary non-zero origin so "timestamp == 0.0" sentinels never match.
+DEFAULT_START_MONOTONIC = 1000.0
+
+# Modules whose ``time`` attribute WANController.run_cycle() reads through
+CONTROL_TIME_SEAMS = (
+    "wanctl.wan_controller",
+    "wanctl.wan_controller_state",
+    "wanctl.queue_controller",
+    "wanctl.backends.linux_cake_adapter",
+    "wanctl.rate_utils",
+    "wanctl.pending_rates",
+    "wanctl.fusion_healer",
+    "wanctl.reflector_fleet",
+    "wanctl.router_connectivity",
+)
+
+
+class _ClockedTime:
+    """Stand-in for the ``time`` module bound to a VirtualClock."""
+
+    def __init__(self, clock: VirtualClock):
+        self._clock = clock
+
+    def monotonic(self) -> float:
+        return self._clock.now
+
+    def time(self) -> float:
+        return self._clock.wall_time()
+
+    def sleep(self, seconds: float) -> None:
+        self._clock.advance(seconds)
+
+    def __getattr__(self, name: str) -> Any:
+        # perf_counter, strftime, struct_time, ... come from the real module
+        return getattr(time, name)
+
+
+class VirtualClock:
+    """Manually advanced monotonic + wall clock.
+
+    Attributes:
+        now: Current simulated monotonic time in seconds
+        wall_start: Wall-clock (epoch) time that corresponds to ``start``
+    """
+
+    def __init__(
+        self,
+        start: float = DEFAULT_START_MONOTONIC,
+        wall_start: float | None = None,
+    ):
+        self.start = start
+        self.now = start
+        self.wall_start = time.time() if wall_start is None else wall_start
+        self.time_module = _ClockedTime(self)
+
+    @property
+    def elapsed(self) -> float:
+        """Simulated seconds since construction."""
+        return self.now - self.start
+
+    def wall_time(self) -> float:
+        """Simulated epoch seconds (``time.time()`` equivalent)."""
+        return self.wall_start + (self.now - self.start)
+
+    def advance(self, seconds: float) -> None:
+        """Move the clock forward; negative steps are ignored."""
+        if seconds > 0:
+            self.now += seconds
+
+    @contextlib.contextmanager
+    def install(self, modules: Iterable[str] = CONTROL_TIME_SEAMS) -> Iterator[list[str]]:
+        """Bind the ``time`` seam of each named module to this clock.
+
+        Modules are imported if needed. Only seams still pointing at the
+        real ``time`` module are touched, and each is restored on exit.
+
+        Args:
+            modules: Dotted module names (the control cycle's seams by default)
+
+        Yields:
+            Names of the modules that were rebound.
+        """
+        real_time = time
+        patched: list[ModuleType] = []
+        for name in modules:
+            module = importlib.import_module(name)
+            if getattr(module, "time", None) is real_time:
+                patched.append(module)
+                module.time = self.time_module  # type: ignore[attr-defined]
+        try:
+            yield [module.__name__ for module in patched]
+        finally:
+            for module in patched:
+                module.time = real_time  # type: ignore[attr-defined]
@@ -0,0 +1,306 @@
+"""Closed-loop autorate simulation: a real WANController against a modelled link.
+
+Simulation wires one WANController to a BottleneckLink:
+
+- the router is a real LinuxCakeAdapter over two SimulatedCakeBackend
+  instances, so ``tc qdisc change ... bandwidth`` lands in the link model,
+  and the inline CAKE stats path reads the model's counters;
+- RTT comes from SimulatedRTTMeasurement through the controller's normal
+  blocking-measurement path (no background threads run in a simulation);
+- the control cycle's time seams (CONTROL_TIME_SEAMS) read a VirtualClock,
+  which advances one cycle interval per run_cycle().
+
+Cycles therefore run back to back, as fast as the controller code allows,
+while hold-downs, rate limits and EWMA windows see simulated time.
+
+Side effects are contained. State is written to a private temporary
+directory, and SQLite history, Prometheus recording, alert webhooks and
+zone events are disabled on the simulation's copy of the config.
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+import statistics
+import tempfile
+import time
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from wanctl.autorate_config import Config
+from wanctl.backends.linux_cake import LinuxCakeBackend
+from wanctl.backends.linux_cake_adapter import LinuxCakeAdapter
+from wanctl.sim.clock import CONTROL_TIME_SEAMS, VirtualClock
+from wanctl.sim.link import BottleneckLink
+from wanctl.wan_controller import CYCLE_INTERVAL_SECONDS, WANController
+
+# Download uses all four zones; upload never reports SOFT_RED. Both share codes.
+ZONES = ("GREEN", "YELLOW", "SOFT_RED", "RED")
+_ZONE_CODES = {zone: code for code, zone in enumerate(ZONES)}
+
+
+class SimulatedCakeBackend(LinuxCakeBackend):
+    """LinuxCakeBackend whose tc commands act on a BottleneckLink.
+
+    Bandwidth writes go through the real set_bandwidth() path (kbit
+    rounding, no-op skip), and only the tc subprocess is replaced.
+    """
+
+    def __init__(self, link: BottleneckLink, direction: str, logger: logging.Logger):
+        super().__init__(interface=f"sim-{direction}", logger=logger)
+        self.link = link
+        self.direction = direction
+        self._last_bandwidth_bps = int(link.shaper_bps(direction))
+
+    def _run_tc(self, args: list[str], timeout: float | None = None) -> tuple[int, str, str]:
+        if "bandwidth" in args:
+            rate = args[args.index("bandwidth") + 1]
+            if rate.endswith("kbit"):
+                self.link.set_shaper(self.direction, int(rate[:-4]) * 1000)
+                return 0, "", ""
+        return 1, "", f"unsupported simulated tc command: {' '.join(args)}"
+
+    def get_queue_stats(self, queue: str) -> dict | None:
+        """Return the link model's CAKE counters for this direction."""
+        return self.link.queue_stats(self.direction)
+
+
+class SimulatedRTTMeasurement:
+    """RTTMeasurement stand-in: one link probe per reflector."""
+
+    def __init__(self, link: BottleneckLink):
+        self.link = link
+
+    def ping_hosts_with_results(
+        self, hosts: list[str], count: int = 1, timeout: float = 3.0
+    ) -> dict[str, float | None]:
+        probe = self.link.probe_rtt_ms
+        return {host: probe() for host in hosts}
+
+
+@dataclass(slots=True)
+class SimulationResult:
+    """Per-cycle series from a simulation run (sampled every ``sample_every`` cycles).
+
+    Attributes:
+        cycle_interval_sec: Simulated seconds per controller cycle
+        cycles: Controller cycles executed
+        wall_seconds: Real time spent running them
+    """
+
+    cycle_interval_sec: float
+    cycles: int = 0
+    wall_seconds: float = 0.0
+    failed_cycles: int = 0
+    t_sec: array[float] = field(default_factory=lambda: array("d"))
+    load_rtt_ms: array[float] = field(default_factory=lambda: array("d"))
+    queue_delay_ms: array[float] = field(default_factory=lambda: array("d"))
+    dl_rate_bps: array[float] = field(default_factory=lambda: array("d"))
+    dl_capacity_bps: array[float] = field(default_factory=lambda: array("d"))
+    ul_rate_bps: array[float] = field(default_factory=lambda: array("d"))
+    ul_capacity_bps: array[float] = field(default_factory=lambda: array("d"))
+    dl_zone: array[int] = field(default_factory=lambda: array("b"))
+    ul_zone: array[int] = field(default_factory=lambda: array("b"))
+    dl_utilization: float = 0.0
+    ul_utilization: float = 0.0
+
+    @property
+    def cycles_per_second(self) -> float:
+        """Controller cycles per real second."""
+        return self.cycles / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    @property
+    def speedup(self) -> float:
+        """Simulated seconds per real second."""
+        return self.cycles_per_second * self.cycle_interval_sec
+
+    def summary(self) -> dict[str, Any]:
+        """Headline closed-loop metrics for comparing configs."""
+        samples = len(self.t_sec)
+        delays = sorted(self.queue_delay_ms)
+
+        def pct(q: float) -> float:
+            if not delays:
+                return 0.0
+            return round(delays[min(len(delays) - 1, int(q * len(delays)))], 2)
+
+        def zone_share(zones: array[int]) -> dict[str, float]:
+            if not zones:
+                return {zone: 0.0 for zone in ZONES}
+            return {
+                zone: round(zones.count(code) / len(zones), 4)
+                for zone, code in _ZONE_CODES.items()
+            }
+
+        def rate_changes(rates: array[float]) -> int:
+            return sum(1 for i in range(1, len(rates)) if rates[i] != rates[i - 1])
+
+        return {
+            "simulated_sec": round(self.cycles * self.cycle_interval_sec, 3),
+            "cycles": self.cycles,
+            "failed_cycles": self.failed_cycles,
+            "samples": samples,
+            "wall_sec": round(self.wall_seconds, 3),
+            "cycles_per_sec": round(self.cycles_per_second, 1),
+            "speedup": round(self.speedup, 1),
+            "queue_delay_ms": {
+                "mean": round(statistics.fmean(delays), 2) if delays else 0.0,
+                "p50": pct(0.50),
+                "p95": pct(0.95),
+                "p99": pct(0.99),
+                "max": round(delays[-1], 2) if delays else 0.0,
+            },
+            "utilization": {
+                "download": round(self.dl_utilization, 4),
+                "upload": round(self.ul_utilization, 4),
+            },
+            "zones": {"download": zone_share(self.dl_zone), "upload": zone_share(self.ul_zone)},
+            "rate_changes": {
+                "download": rate_changes(self.dl_rate_bps),
+                "upload": rate_changes(self.ul_rate_bps),
+            },
+        }
+
+
+def _simulation_config(config: Config, state_dir: Path) -> Config:
+    """Copy ``config`` with every host side effect pointed away from the system."""
+    sim_config = copy.copy(config)
+    data = dict(config.data)
+    data["storage"] = {**(data.get("storage") or {}), "db_path": ""}
+    sim_config.data = data
+    sim_config.state_file = state_dir / f"{config.wan_name}_state.json"
+    sim_config.metrics_enabled = False
+    sim_config.alerting_config = None
+    sim_config.zone_event_socket = None
+    return sim_config
+
+
+class Simulation:
+    """Run one WANController in closed loop with a BottleneckLink.
+
+    Args:
+        config: Loaded autorate Config (not modified; a copy is used)
+        link: Link model; its shaper starts at the config ceilings
+        logger: Controller logger (defaults to the handler-less ``wanctl.sim`` logger)
+        clock: Virtual clock (a fresh one by default)
+        state_dir: Where the controller's state file goes (temporary by default)
+
+    Attributes:
+        time_seams: Modules bound to ``clock`` while cycles run
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        link: BottleneckLink,
+        *,
+        logger: logging.Logger | None = None,
+        clock: VirtualClock | None = None,
+        state_dir: str | Path | None = None,
+    ):
+        self.link = link
+        self.clock = clock or VirtualClock()
+        self.time_seams: tuple[str, ...] = CONTROL_TIME_SEAMS
+        if logger is None:
+            # Quiet by default: a simulated day would otherwise print every
+            # congestion warning through logging's last-resort handler.
+            logger = logging.getLogger("wanctl.sim")
+            if not logger.handlers:
+                logger.addHandler(logging.NullHandler())
+        self.logger = logger
+        self._tmpdir: tempfile.TemporaryDirectory[str] | None = None
+        if state_dir is None:
+            self._tmpdir = tempfile.TemporaryDirectory(prefix="wanctl-sim-")
+            state_dir = self._tmpdir.name
+        self.config = _simulation_config(config, Path(state_dir))
+        self.cycle_interval_sec = CYCLE_INTERVAL_SECONDS
+        link.set_shaper("download", self.config.download_ceiling)
+        link.set_shaper("upload", self.config.upload_ceiling)
+        self.controller: WANController | None = None
+
+    def _build_controller(self) -> WANController:
+        config = self.config
+        router = LinuxCakeAdapter(
+            dl_backend=SimulatedCakeBackend(self.link, "download", self.logger),
+            ul_backend=SimulatedCakeBackend(self.link, "upload", self.logger),
+            logger=self.logger,
+            last_set_down_bps=config.download_ceiling,
+            last_set_up_bps=config.upload_ceiling,
+            # Same increase coalescing LinuxCakeAdapter.from_config() configures
+            dl_increase_coalesce_bps=config.download_step_up,
+            ul_increase_coalesce_bps=config.upload_step_up,
+            increase_coalesce_window_sec=0.2,
+        )
+        return WANController(
+            wan_name=config.wan_name,
+            config=config,
+            router=router,  # type: ignore[arg-type]  # LinuxCakeAdapter duck-types RouterOS
+            rtt_measurement=SimulatedRTTMeasurement(self.link),  # type: ignore[arg-type]
+            logger=self.logger,
+        )
+
+    def run(self, duration_sec: float, *, sample_every: int = 1) -> SimulationResult:
+        """Advance the closed loop by ``duration_sec`` simulated seconds.
+
+        Calling run() again continues from where the previous call stopped.
+
+        Args:
+            duration_sec: Simulated time to run
+            sample_every: Record every Nth cycle in the result series
+
+        Returns:
+            SimulationResult for this call's cycles.
+        """
+        if sample_every < 1:
+            raise ValueError("sample_every must be >= 1")
+        interval = self.cycle_interval_sec
+        cycles = int(round(duration_sec / interval))
+        result = SimulationResult(cycle_interval_sec=interval)
+        link = self.link
+        clock = self.clock
+        zone_code = _ZONE_CODES.get
+        start_t = link.t
+
+        with clock.install(self.time_seams):
+            if self.controller is None:
+                self.controller = self._build_controller()
+            controller = self.controller
+            wall_start = time.perf_counter()
+            for i in range(cycles):
+                link.advance(interval)
+                clock.advance(interval)
+                if not controller.run_cycle():
+                    result.failed_cycles += 1
+                if i % sample_every:
+                    continue
+                result.t_sec.append(link.t)
+                result.queue_delay_ms.append(link.queue_delay_ms)
+                result.load_rtt_ms.append(controller.load_rtt)
+                result.dl_rate_bps.append(link.shaper_bps("download"))
+                result.ul_rate_bps.append(link.shaper_bps("upload"))
+                result.dl_capacity_bps.append(link.capacity_bps("download"))
+                result.ul_capacity_bps.append(link.capacity_bps("upload"))
+                result.dl_zone.append(zone_code(controller._dl_zone, 0))
+                result.ul_zone.append(zone_code(controller._ul_zone, 0))
+            result.wall_seconds = time.perf_counter() - wall_start
+
+        result.cycles = cycles
+        if link.t > start_t:
+            result.dl_utilization = link.utilization("download")
+            result.ul_utilization = link.utilization("upload")
+        return result
+
+    def close(self) -> None:
+        """Remove the temporary state directory (if the simulation created one)."""
+        if self._tmpdir is not None:
+            self._tmpdir.cleanup()
+            self._tmpdir = None
+
+    def __enter__(self) -> Simulation:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
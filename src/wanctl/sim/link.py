@@ -0,0 +1,308 @@
+"""Fluid model of a CAKE-shaped WAN bottleneck.
+
+Each direction is modelled as two queues in series:
+
+1. The CAKE shaper at the rate the controller applied. Bulk traffic queues
+   here. COBALT holds that queue near ``cake_target_ms`` by dropping the
+   excess, which is what the simulated CAKE drop and backlog counters report.
+2. The ISP bottleneck at the link capacity minus cross-traffic. When the
+   shaper rate exceeds what the link can carry, the excess builds an
+   unmanaged buffer (bufferbloat) up to ``buffer_ms`` deep.
+
+ICMP probes are sparse flows, so CAKE's flow isolation lets them skip the
+shaper queue. The probed RTT is therefore base RTT + download ISP queue
+delay + upload ISP queue delay + jitter. That is the closed loop: the
+controller's rate choice decides whether the ISP queue fills, and the
+queue decides the RTT the controller sees next cycle.
+
+Traffic is responsive. While demand exceeds the shaper rate, senders push
+``probe_overshoot`` above it (TCP probing for bandwidth), so a saturated
+shaper shows a small, steady drop rate rather than dropping all excess
+demand.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from bisect import bisect_right
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+# Bits per simulated packet (full-size Ethernet payload).
+PACKET_BITS = 1500 * 8
+
+
+class Trace:
+    """Piecewise-constant schedule of ``(start_sec, value)`` points.
+
+    The value of the last point at or before ``t`` applies; times before
+    the first point use the first value.
+    """
+
+    __slots__ = ("_times", "_values")
+
+    def __init__(self, points: Iterable[tuple[float, float]]):
+        ordered = sorted((float(t), float(v)) for t, v in points)
+        if not ordered:
+            raise ValueError("Trace needs at least one (time, value) point")
+        self._times = tuple(t for t, _ in ordered)
+        self._values = tuple(v for _, v in ordered)
+
+    @classmethod
+    def constant(cls, value: float) -> Trace:
+        """Trace that never changes."""
+        return cls([(0.0, value)])
+
+    @classmethod
+    def diurnal(
+        cls,
+        low: float,
+        high: float,
+        *,
+        period_sec: float = 86400.0,
+        step_sec: float = 300.0,
+        peak_sec: float = 72000.0,
+    ) -> Trace:
+        """Cosine day/night cycle between ``low`` and ``high``.
+
+        Args:
+            low: Value at the trough (opposite ``peak_sec``)
+            high: Value at ``peak_sec``
+            period_sec: Cycle length (default one day)
+            step_sec: Resolution of the piecewise-constant steps
+            peak_sec: Offset of the peak within the period (default 20:00)
+        """
+        if step_sec <= 0 or period_sec <= 0:
+            raise ValueError("period_sec and step_sec must be positive")
+        mid = (low + high) / 2.0
+        amplitude = (high - low) / 2.0
+        steps = int(math.ceil(period_sec / step_sec))
+        return cls(
+            (
+                i * step_sec,
+                mid + amplitude * math.cos(2.0 * math.pi * (i * step_sec - peak_sec) / period_sec),
+            )
+            for i in range(steps)
+        )
+
+    def at(self, t: float) -> float:
+        """Value in effect at time ``t`` (seconds since simulation start)."""
+        index = bisect_right(self._times, t) - 1
+        return self._values[index if index > 0 else 0]
+
+
+_ZERO = Trace.constant(0.0)
+
+
+@dataclass(frozen=True, slots=True)
+class LinkDirection:
+    """Traffic and capacity schedule for one direction of the bottleneck.
+
+    Attributes:
+        capacity_bps: Physical/ISP bottleneck capacity over time
+        demand_bps: Offered load from shaped (responsive) hosts
+        cross_traffic_bps: Unshaped load sharing the ISP bottleneck
+        buffer_ms: ISP buffer depth, in milliseconds at capacity
+    """
+
+    capacity_bps: Trace
+    demand_bps: Trace
+    cross_traffic_bps: Trace = field(default=_ZERO)
+    buffer_ms: float = 250.0
+
+
+class _DirectionState:
+    """Mutable per-direction queues and CAKE counters."""
+
+    __slots__ = (
+        "spec",
+        "shaper_bps",
+        "cake_queue_bits",
+        "isp_queue_bits",
+        "isp_delay_ms",
+        "sent_bits",
+        "dropped_packets",
+        "peak_delay_us",
+        "delivered_bits",
+        "achievable_bits",
+    )
+
+    def __init__(self, spec: LinkDirection, shaper_bps: float):
+        self.spec = spec
+        self.shaper_bps = shaper_bps
+        self.cake_queue_bits = 0.0
+        self.isp_queue_bits = 0.0
+        self.isp_delay_ms = 0.0
+        self.sent_bits = 0.0
+        self.dropped_packets = 0.0
+        self.peak_delay_us = 0.0
+        self.delivered_bits = 0.0
+        self.achievable_bits = 0.0
+
+    def step(self, t: float, dt: float, target_sec: float, overshoot: float) -> None:
+        spec = self.spec
+        capacity = spec.capacity_bps.at(t)
+        cross = spec.cross_traffic_bps.at(t)
+        demand = spec.demand_bps.at(t)
+        rate = self.shaper_bps
+
+        # Responsive senders: fill the shaper and probe slightly above it.
+        offered = demand if demand <= rate else min(demand, rate * (1.0 + overshoot))
+
+        # Stage 1: CAKE shaper queue, held near target by COBALT drops.
+        backlog = self.cake_queue_bits + offered * dt
+        sent = min(rate * dt, backlog)
+        backlog -= sent
+        limit = rate * target_sec
+        if backlog > limit:
+            self.dropped_packets += (backlog - limit) / PACKET_BITS
+            backlog = limit
+        self.cake_queue_bits = backlog
+        self.sent_bits += sent
+        if rate > 0:
+            delay_us = backlog / rate * 1e6
+            if delay_us > self.peak_delay_us:
+                self.peak_delay_us = delay_us
+
+        # Stage 2: ISP bottleneck shared with cross-traffic.
+        if capacity > 0:
+            queue = self.isp_queue_bits + (sent + cross * dt) - capacity * dt
+            queue = min(max(queue, 0.0), capacity * spec.buffer_ms / 1000.0)
+            self.isp_queue_bits = queue
+            self.isp_delay_ms = queue / capacity * 1000.0
+        else:
+            self.isp_delay_ms = float(spec.buffer_ms)
+        available = max(capacity - cross, 0.0) * dt
+        self.achievable_bits += min(demand * dt, available)
+        self.delivered_bits += min(sent, available)
+
+    def queue_stats(self) -> dict[str, Any]:
+        """Counters in the LinuxCakeBackend.get_queue_stats() shape (one tin)."""
+        rate = self.shaper_bps
+        avg_delay_us = int(self.cake_queue_bits / rate * 1e6) if rate > 0 else 0
+        sent_packets = int(self.sent_bits / PACKET_BITS)
+        sent_bytes = int(self.sent_bits / 8)
+        dropped = int(self.dropped_packets)
+        backlog_bytes = int(self.cake_queue_bits / 8)
+        peak_delay_us = int(self.peak_delay_us)
+        # Peak is per read interval, like the kernel's per-dump peak_delay
+        self.peak_delay_us = float(avg_delay_us)
+        return {
+            "packets": sent_packets,
+            "bytes": sent_bytes,
+            "dropped": dropped,
+            "queued_packets": int(self.cake_queue_bits / PACKET_BITS),
+            "queued_bytes": backlog_bytes,
+            "memory_used": backlog_bytes,
+            "memory_limit": 0,
+            "capacity_estimate": int(rate),
+            "tins": [
+                {
+                    "sent_bytes": sent_bytes,
+                    "sent_packets": sent_packets,
+                    "dropped_packets": dropped,
+                    "ecn_marked_packets": 0,
+                    "backlog_bytes": backlog_bytes,
+                    "peak_delay_us": peak_delay_us,
+                    "avg_delay_us": avg_delay_us,
+                    "base_delay_us": 0,
+                    "sparse_flows": 1,
+                    "bulk_flows": 1 if backlog_bytes else 0,
+                    "unresponsive_flows": 0,
+                }
+            ],
+            "ecn_marked": 0,
+        }
+
+
+class BottleneckLink:
+    """Two-direction fluid bottleneck driven by the controller's shaper rates.
+
+    Args:
+        download: Download direction schedule
+        upload: Upload direction schedule
+        base_rtt_ms: Propagation RTT with empty queues
+        jitter_ms: Standard deviation of per-probe Gaussian jitter
+        loss_pct: Probability (0-100) that a single probe is lost
+        cake_target_ms: CAKE/COBALT target queue delay
+        probe_overshoot: Fraction above the shaper rate that saturating
+            senders offer (drives the steady-state CAKE drop rate)
+        seed: Seed for jitter and loss (runs are reproducible)
+    """
+
+    def __init__(
+        self,
+        download: LinkDirection,
+        upload: LinkDirection,
+        *,
+        base_rtt_ms: float = 20.0,
+        jitter_ms: float = 0.5,
+        loss_pct: float = 0.0,
+        cake_target_ms: float = 5.0,
+        probe_overshoot: float = 0.02,
+        seed: int = 0,
+    ):
+        self.base_rtt_ms = base_rtt_ms
+        self.jitter_ms = jitter_ms
+        self.loss_fraction = loss_pct / 100.0
+        self._target_sec = cake_target_ms / 1000.0
+        self._overshoot = probe_overshoot
+        self._rng = random.Random(seed)
+        self.t = 0.0
+        self._directions = {
+            "download": _DirectionState(download, download.capacity_bps.at(0.0)),
+            "upload": _DirectionState(upload, upload.capacity_bps.at(0.0)),
+        }
+        self._dl = self._directions["download"]
+        self._ul = self._directions["upload"]
+
+    def set_shaper(self, direction: str, rate_bps: float) -> None:
+        """Apply a CAKE bandwidth (what ``tc qdisc change ... bandwidth`` sets)."""
+        self._directions[direction].shaper_bps = float(rate_bps)
+
+    def shaper_bps(self, direction: str) -> float:
+        """Currently applied CAKE bandwidth for ``direction``."""
+        return self._directions[direction].shaper_bps
+
+    def capacity_bps(self, direction: str) -> float:
+        """Bottleneck capacity for ``direction`` at the current time."""
+        return self._directions[direction].spec.capacity_bps.at(self.t)
+
+    def advance(self, dt: float) -> None:
+        """Integrate both directions over ``dt`` seconds."""
+        t = self.t
+        self._dl.step(t, dt, self._target_sec, self._overshoot)
+        self._ul.step(t, dt, self._target_sec, self._overshoot)
+        self.t = t + dt
+
+    @property
+    def queue_delay_ms(self) -> float:
+        """Current ISP queueing delay seen by a sparse probe (both directions)."""
+        return self._dl.isp_delay_ms + self._ul.isp_delay_ms
+
+    def probe_rtt_ms(self) -> float | None:
+        """One ICMP probe RTT, or None if the probe was lost."""
+        rng = self._rng
+        if self.loss_fraction and rng.random() < self.loss_fraction:
+            return None
+        rtt = self.base_rtt_ms + self.queue_delay_ms
+        if self.jitter_ms:
+            rtt += rng.gauss(0.0, self.jitter_ms)
+        return max(rtt, self.base_rtt_ms * 0.5)
+
+    def queue_stats(self, direction: str) -> dict[str, Any]:
+        """CAKE stats dict for ``direction`` (see LinuxCakeBackend.get_queue_stats)."""
+        return self._directions[direction].queue_stats()
+
+    def utilization(self, direction: str) -> float:
+        """Delivered / achievable bits for ``direction`` since the start.
+
+        Achievable is min(demand, capacity - cross-traffic): 1.0 means the
+        shaper never held back traffic the link could have carried.
+        """
+        state = self._directions[direction]
+        if state.achievable_bits <= 0:
+            return 0.0
+        return state.delivered_bits / state.achievable_bits
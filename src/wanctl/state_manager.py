@@ -14,6 +14,7 @@ from collections.abc import Callable
 from pathlib import Path
 from typing import Any, TypeVar
 
+from .history_ring import HistoryRing, decode_history, encode_history
 from .state_utils import atomic_write_json, safe_json_load_file
 
 # Type variable for validator return types
@@ -456,16 +457,24 @@ class SteeringStateManager(StateManager):
     """Specialized state manager for steering daemon.
 
     Extends StateManager with steering-specific functionality:
-    - Deque-based bounded history (automatic eviction)
+    - Array-backed bounded history rings (automatic eviction, compact save)
     - Legacy state name migration
     - File-level locking for concurrent access
     - State file backups (.backup and .corrupt)
     """
 
-    # Default maximum length for history deques and transitions list.
+    # Default maximum length for history rings and transitions list.
     # Controls memory usage for long-running daemons by limiting stored history.
     DEFAULT_HISTORY_MAXLEN = 50
 
+    # Rolling numeric histories kept as HistoryRing, with their array typecodes
+    HISTORY_TYPECODES = {
+        "history_rtt": "d",
+        "history_delta": "d",
+        "cake_drops_history": "q",
+        "queue_depth_history": "q",
+    }
+
     def __init__(
         self,
         state_file: Path,
@@ -481,7 +490,7 @@ class SteeringStateManager(StateManager):
             schema: StateSchema defining valid fields and defaults
             logger: Logger instance
             context: Context for error messages
-            history_maxlen: Maximum length for history deques (default: DEFAULT_HISTORY_MAXLEN)
+            history_maxlen: Maximum length for history rings (default: DEFAULT_HISTORY_MAXLEN)
         """
         super().__init__(state_file, schema, logger, context)
         self.history_maxlen = (
@@ -494,8 +503,8 @@ class SteeringStateManager(StateManager):
         """Load state from file with validation, backup recovery, and legacy migration.
 
         If the primary state file is corrupt, attempts to load from the backup
-        file before falling back to defaults. Handles deque conversion from
-        JSON lists.
+        file before falling back to defaults. Restores history rings from the
+        compact base64 form or from JSON lists.
 
         Returns:
             True if state loaded successfully (from primary or backup)
@@ -503,7 +512,7 @@ class SteeringStateManager(StateManager):
         """
         if not self.state_file.exists():
             self.logger.debug(f"{self.context}: No state file, using defaults")
-            self.state = self.schema.get_defaults()
+            self._set_defaults()
             return False
 
         # Load JSON from file
@@ -529,8 +538,9 @@ class SteeringStateManager(StateManager):
                     # Save corrupt file for analysis before overwriting
                     self._backup_state_file(suffix=".corrupt")
                     try:
+                        self._decode_histories(loaded)
                         self.state = self.schema.validate_state(loaded, logger=self.logger)
-                        self._convert_lists_to_deques()
+                        self._restore_histories()
                         return True
                     except Exception as e:
                         self.logger.error(f"{self.context}: Backup validation failed: {e}")
@@ -539,42 +549,55 @@ class SteeringStateManager(StateManager):
             # No backup or backup also corrupt - use defaults
             self.logger.warning(f"{self.context}: Failed to parse state file, using defaults")
             self._backup_state_file(suffix=".corrupt")
-            self.state = self.schema.get_defaults()
+            self._set_defaults()
             return False
 
         try:
-            # Validate and fill defaults
+            # Decode compact histories, then validate and fill defaults
+            self._decode_histories(loaded)
             self.state = self.schema.validate_state(loaded, logger=self.logger)
-            # Convert JSON lists back to deques for bounded history
-            self._convert_lists_to_deques()
+            self._restore_histories()
             self.logger.debug(f"{self.context}: Loaded state from {self.state_file}")
             return True
         except Exception as e:
             self.logger.error(f"{self.context}: Failed to validate state: {e}")
             self._backup_state_file(suffix=".corrupt")
-            self.state = self.schema.get_defaults()
+            self._set_defaults()
             return False
 
-    def _convert_lists_to_deques(self) -> None:
-        """Convert list-based history fields to bounded deques.
+    def _set_defaults(self) -> None:
+        """Set state to schema defaults with empty history rings."""
+        self.state = self.schema.get_defaults()
+        self._restore_histories()
 
-        Deques with maxlen automatically evict oldest elements when full,
+    def _decode_histories(self, loaded: dict[str, Any]) -> None:
+        """Replace compact base64 histories in a loaded state dict with lists."""
+        for key in self.HISTORY_TYPECODES:
+            if key in loaded:
+                values = decode_history(loaded[key])
+                loaded[key] = values if values is not None else []
+
+    def _restore_histories(self) -> None:
+        """Convert history fields to bounded HistoryRing buffers.
+
+        Rings with maxlen automatically evict oldest elements when full,
         preventing unbounded growth on long-running daemons.
-        Uses self.history_maxlen for the deque maximum length.
+        Uses self.history_maxlen for the ring capacity.
         """
-        history_keys = ["history_rtt", "history_delta", "cake_drops_history", "queue_depth_history"]
-        for key in history_keys:
-            if key in self.state:
-                if isinstance(self.state[key], list):
-                    self.state[key] = deque(self.state[key], maxlen=self.history_maxlen)
-                elif not isinstance(self.state[key], deque):
-                    self.state[key] = deque(maxlen=self.history_maxlen)
+        for key, typecode in self.HISTORY_TYPECODES.items():
+            if key not in self.state:
+                continue
+            value = self.state[key]
+            if isinstance(value, HistoryRing) and value.maxlen == self.history_maxlen:
+                continue
+            values = value if isinstance(value, (list, deque, HistoryRing)) else ()
+            self.state[key] = HistoryRing(typecode, self.history_maxlen, values)
 
     def save(self, use_lock: bool = True) -> bool:
         """Save state to file atomically with optional file locking.
 
         File locking prevents concurrent writes from multiple processes.
-        Converts deques to lists for JSON serialization.
+        History rings are written in their compact base64 form.
 
         Args:
             use_lock: If True, acquire lock before writing (default: True)
@@ -583,21 +606,11 @@ class SteeringStateManager(StateManager):
             True if save succeeded, False otherwise
         """
         try:
-            # Convert deques to lists for JSON serialization
+            # Encode history rings (deques become lists) for JSON serialization
             state_to_save = dict(self.state)
-            for key in [
-                "history_rtt",
-                "history_delta",
-                "cake_drops_history",
-                "queue_depth_history",
-            ]:
-                if isinstance(state_to_save.get(key), type(state_to_save.get(key))) and hasattr(
-                    state_to_save[key], "__iter__"
-                ):
-                    try:
-                        state_to_save[key] = list(state_to_save[key])
-                    except (TypeError, ValueError):
-                        pass  # Keep as-is if conversion fails
+            for key in self.HISTORY_TYPECODES:
+                if key in state_to_save:
+                    state_to_save[key] = encode_history(state_to_save[key])
 
             if not use_lock:
                 # Direct write without locking
@@ -636,17 +649,19 @@ class SteeringStateManager(StateManager):
     def add_measurement(self, current_rtt: float, delta: float) -> None:
         """Add RTT measurement and delta to history.
 
-        Uses deques for automatic bounded history eviction.
-        No manual trim needed - deques with maxlen automatically evict oldest elements.
+        Uses history rings for automatic bounded history eviction.
+        No manual trim needed - rings with maxlen automatically evict oldest elements.
 
         Args:
             current_rtt: Current RTT measurement in milliseconds
             delta: RTT delta (current_rtt - baseline_rtt) in milliseconds
         """
-        if "history_rtt" in self.state and isinstance(self.state["history_rtt"], deque):
-            self.state["history_rtt"].append(current_rtt)
-        if "history_delta" in self.state and isinstance(self.state["history_delta"], deque):
-            self.state["history_delta"].append(delta)
+        history_rtt = self.state.get("history_rtt")
+        if isinstance(history_rtt, (HistoryRing, deque)):
+            history_rtt.append(current_rtt)
+        history_delta = self.state.get("history_delta")
+        if isinstance(history_delta, (HistoryRing, deque)):
+            history_delta.append(delta)
 
     def log_transition(self, old_state: str, new_state: str) -> None:
         """Log a state transition with timestamp and counters.
@@ -674,4 +689,4 @@ class SteeringStateManager(StateManager):
     def reset(self) -> None:
         """Reset state to default values."""
         self.logger.info(f"Resetting {self.context}")
-        self.state = self.schema.get_defaults()
+        self._set_defaults()
@@ -37,6 +37,7 @@ from typing import Any
 from ..alert_engine import AlertEngine
 from ..backends.linux_cake import TIN_NAMES
 from ..config_base import BaseConfig, get_storage_config
+from ..config_snapshot import ConfigSnapshot, load_config_snapshot, reload_data
 from ..config_validation_utils import (
     deprecate_param,
     validate_alpha,
@@ -47,12 +48,14 @@ from ..lock_utils import validate_and_acquire_lock
 from ..logging_utils import setup_logging
 from ..metrics import (
     get_storage_metrics_snapshot,
+    record_steering_cycle,
     record_steering_state,
     record_steering_transition,
     record_storage_maintenance_lock_skip,
+    record_subsystem_timings,
 )
 from ..perf_profiler import (
-    OperationProfiler,
+    ArrayOperationProfiler,
     PerfTimer,
     record_cycle_profiling,
 )
@@ -79,6 +82,7 @@ from ..systemd_utils import (
     notify_watchdog,
 )
 from ..timeouts import DEFAULT_STEERING_SSH_TIMEOUT
+from ..zone_events import DEFAULT_ZONE_EVENT_SOCKET, ZoneEvent, ZoneEventListener
 from .cake_stats import CakeStatsReader, CongestionSignals
 from .congestion_assessment import (
     CongestionState,
@@ -258,6 +262,10 @@ class SteeringConfig(BaseConfig):
         self.router_password = router.get("password", "")
         self.router_port = router.get("port", 443)
         self.router_verify_ssl = router.get("verify_ssl", True)
+        # SSH command mode (only used if transport=ssh or after REST failover)
+        self.router_ssh_mode = self.validate_ssh_mode(
+            router.get("ssh_mode", "exec"), "router.ssh_mode"
+        )
 
     def _load_topology(self) -> None:
         """Load topology - which WANs to monitor and steer between."""
@@ -416,6 +424,7 @@ class SteeringConfig(BaseConfig):
                 "recovery_threshold": recovery_threshold,
                 "sustain_duration_sec": confidence.get("sustain_duration_sec", 2.0),
                 "recovery_sustain_sec": confidence.get("recovery_sustain_sec", 3.0),
+                "compiled_evaluation": bool(confidence.get("compiled_evaluation", False)),
             },
             "timers": {
                 "hold_down_duration_sec": confidence.get("hold_down_duration_sec", 30.0),
@@ -839,6 +848,49 @@ class SteeringConfig(BaseConfig):
         self.health_check_host = health.get("host", "127.0.0.1")
         self.health_check_port = health.get("port", 9102)
 
+    def _load_zone_events_config(self) -> None:
+        """Load event-driven wakeup settings (optional, disabled by default).
+
+        When enabled, the daemon binds a Unix datagram socket that autorate
+        publishes zone transitions to, and wakes immediately on each event
+        instead of waiting for the next measurement tick. While idle (steering
+        off, everything GREEN) the tick may stretch to idle_interval_seconds,
+        since a zone change will wake the loop anyway.
+        """
+        logger = logging.getLogger(__name__)
+        events = self.data.get("zone_events", {})
+        if not isinstance(events, dict):
+            events = {}
+
+        self.zone_events_config: dict[str, Any] | None = None
+        if not events.get("enabled", False):
+            return
+
+        socket_path = events.get("socket_path", DEFAULT_ZONE_EVENT_SOCKET)
+        if not isinstance(socket_path, str) or not socket_path.startswith("/"):
+            logger.warning(
+                f"zone_events.socket_path must be an absolute path, got {socket_path!r}; "
+                "zone events disabled"
+            )
+            return
+
+        idle_interval = events.get("idle_interval_seconds", self.measurement_interval)
+        if (
+            not isinstance(idle_interval, (int, float))
+            or isinstance(idle_interval, bool)
+            or idle_interval < self.measurement_interval
+        ):
+            logger.warning(
+                f"zone_events.idle_interval_seconds must be >= measurement.interval_seconds "
+                f"({self.measurement_interval}), got {idle_interval!r}; using interval"
+            )
+            idle_interval = self.measurement_interval
+
+        self.zone_events_config = {
+            "socket_path": socket_path,
+            "idle_interval_seconds": float(idle_interval),
+        }
+
     def _load_specific_fields(self) -> None:
         """Load steering daemon-specific configuration fields.
 
@@ -877,6 +929,9 @@ class SteeringConfig(BaseConfig):
         # Alerting (optional, disabled by default per INFRA-05)
         self._load_alerting_config()
 
+        # Event-driven wakeups (optional, depends on _load_rtt_measurement)
+        self._load_zone_events_config()
+
 
 # =============================================================================
 # STATE MANAGEMENT
@@ -1060,6 +1115,39 @@ class BaselineLoader:
         self.logger = logger
         self._stale_baseline_warned = False
         self._wan_staleness_threshold = STALE_WAN_ZONE_THRESHOLD_SECONDS
+        self._zone_event: ZoneEvent | None = None
+
+    def apply_zone_event(self, event: ZoneEvent) -> bool:
+        """Record a pushed autorate zone transition for the primary WAN.
+
+        Returns:
+            True if the event targets the primary WAN and was recorded.
+        """
+        if event.wan_name != self.config.primary_wan:
+            return False
+        self._zone_event = event
+        return True
+
+    def _event_zone(self) -> str | None:
+        """DL zone from the latest pushed event, if newer than the state file.
+
+        The state file is written at most every few seconds, so a fresh event
+        is the most recent zone autorate has decided. Events older than the
+        staleness threshold (or older than the file) are ignored.
+        """
+        event = self._zone_event
+        if event is None:
+            return None
+        now = time.time()
+        if now - event.timestamp > self._wan_staleness_threshold:
+            return None
+        try:
+            file_mtime = self.config.primary_state_file.stat().st_mtime
+        except OSError:
+            file_mtime = 0.0
+        if event.timestamp < file_mtime:
+            return None
+        return event.dl_state
 
     def load_baseline_rtt(self) -> tuple[float | None, str | None]:
         """
@@ -1087,11 +1175,14 @@ class BaselineLoader:
         # STEER-03: Check file staleness before parsing
         self._check_staleness()
 
-        # FUSE-01: Extract WAN zone from same dict (zero additional I/O)
-        if self.is_wan_zone_stale():
-            wan_zone: str | None = "GREEN"  # SAFE-01: stale defaults to GREEN
-        else:
-            wan_zone = state.get("congestion", {}).get("dl_state", None)
+        # FUSE-01: Extract WAN zone from same dict (zero additional I/O).
+        # A fresh pushed zone event wins over the (slower) state file.
+        wan_zone: str | None = self._event_zone()
+        if wan_zone is None:
+            if self.is_wan_zone_stale():
+                wan_zone = "GREEN"  # SAFE-01: stale defaults to GREEN
+            else:
+                wan_zone = state.get("congestion", {}).get("dl_state", None)
 
         # autorate_continuous format: state['ewma']['baseline_rtt']
         if "ewma" in state and "baseline_rtt" in state["ewma"]:
@@ -1259,6 +1350,8 @@ class SteeringDaemon:
         rtt_backend_active: str | None = None,
     ):
         self.config = config
+        snapshot = getattr(config, "snapshot", None)
+        self._config_snapshot = snapshot if isinstance(snapshot, ConfigSnapshot) else None
         self.state_mgr = state
         self.router = router
         self.rtt_measurement = rtt_measurement
@@ -1297,6 +1390,26 @@ class SteeringDaemon:
         # Guard refresh tracking (set dynamically in _run_periodic_tasks)
         self._last_guard_refresh: float = 0.0
 
+        # Event-driven wakeups (attached by main() when zone_events enabled)
+        self._zone_listener: ZoneEventListener | None = None
+
+    def attach_zone_listener(self, listener: ZoneEventListener) -> None:
+        """Attach the zone event listener so /health can report its counters."""
+        self._zone_listener = listener
+
+    def is_idle(self) -> bool:
+        """Return True when a longer tick is safe: steering off and everything GREEN.
+
+        Used by run_daemon_loop() to stretch the cycle interval only when a
+        zone event (not the tick) is what would start the next transition.
+        """
+        state = self.state_mgr.state
+        return (
+            self._is_current_state_good(state["current_state"])
+            and state.get("congestion_state", "GREEN") == "GREEN"
+            and self._wan_zone in (None, "GREEN")
+        )
+
     def _init_route_management(self) -> None:
         """Initialize guarded route-management helpers without changing defaults."""
         self.route_ownership_guard: RouteOwnershipGuard | None = None
@@ -1418,16 +1531,13 @@ class SteeringDaemon:
                     self.config.route_management_mode = "dry_run"
                     return
 
-    def _reload_route_management_config(self) -> None:
+    def _reload_route_management_config(self, data: dict[str, Any] | None = None) -> None:
         """Re-read route_management config from YAML on SIGUSR1.
 
         Updates self.config's route_management fields and self.route_manager.mode.
         """
-        import yaml
-
         try:
-            with open(self.config.config_file_path) as f:
-                fresh_data = yaml.safe_load(f)
+            fresh_data = reload_data(self.config.config_file_path, data)
         except Exception as e:
             self.logger.error(f"[ROUTE_MANAGEMENT] Config reload failed: {e}")
             return
@@ -1798,6 +1908,7 @@ class SteeringDaemon:
     def _init_confidence_controller(self) -> None:
         """Initialize confidence-based steering controller (if enabled)."""
         self.confidence_controller: ConfidenceController | None = None
+        self._confidence_compiled = False
         if self.config.use_confidence_scoring and self.config.confidence_config:
             self.confidence_controller = ConfidenceController(
                 config_v3=self.config.confidence_config,
@@ -1805,13 +1916,25 @@ class SteeringDaemon:
                 state_good=self.config.state_good,
                 state_degraded=self.config.state_degraded,
                 cycle_interval=ASSESSMENT_INTERVAL_SECONDS,
+                stats_history_len=self.config.history_size,
+            )
+            self._confidence_compiled = bool(
+                self.config.confidence_config["confidence"].get("compiled_evaluation", False)
             )
+            if self._confidence_compiled:
+                # Counters continue from the histories restored with the state file
+                state = self.state_mgr.state
+                self.confidence_controller.reset_sustain_counters(
+                    state.get("cake_state_history", []),
+                    state.get("cake_drops_history", []),
+                    state.get("queue_depth_history", []),
+                )
             dry_run_status = self.config.confidence_config["dry_run"]["enabled"]
             self.logger.info(f"[CONFIDENCE] Confidence scoring enabled (dry_run={dry_run_status})")
 
     def _init_steering_profiling(self, config: SteeringConfig) -> None:
         """Initialize per-subsystem timing for cycle budget analysis."""
-        self._profiler = OperationProfiler(max_samples=1200)
+        self._profiler = ArrayOperationProfiler(max_samples=1200)
         self._profile_cycle_count = 0
         self._profiling_enabled = False
         self._overrun_count = 0
@@ -1837,7 +1960,34 @@ class SteeringDaemon:
         if hasattr(self.baseline_loader, "_wan_staleness_threshold"):
             self.baseline_loader._wan_staleness_threshold = self._wan_staleness_sec
 
-    def _reload_dry_run_config(self) -> None:
+    def reload(self) -> None:
+        """Reload hot-reloadable config sections (SIGUSR1 handler).
+
+        Parses the file once into a ConfigSnapshot. The kill switches
+        (confidence.dry_run, wan_state.enabled) and route management always
+        re-apply, even when the file is unchanged: auto-abort can move the
+        runtime mode away from the YAML, and SIGUSR1 is how operators force
+        the configured state back. Other reloaders run only when their
+        sections changed since the last applied snapshot.
+        """
+        try:
+            snapshot = load_config_snapshot(self.config.config_file_path)
+        except Exception as e:
+            self.logger.error(f"Config reload failed: {e}")
+            return
+        previous = getattr(self, "_config_snapshot", None)
+
+        data = snapshot.as_dict()
+        self._reload_dry_run_config(data)
+        self._reload_wan_state_config(data)
+        if snapshot.changed(previous, "alerting.webhook_url"):
+            self._reload_webhook_url_config(data)
+        old_mode = self.route_manager.mode if self.route_manager else None
+        self._reload_route_management_config(data)
+        self._handle_mode_change(old_mode=old_mode)
+        self._config_snapshot = snapshot
+
+    def _reload_dry_run_config(self, data: dict[str, Any] | None = None) -> None:
         """Re-read dry_run flag from config YAML file (triggered by SIGUSR1).
 
         Only reloads the confidence.dry_run field. All other config values
@@ -1848,10 +1998,7 @@ class SteeringDaemon:
             return
 
         try:
-            import yaml
-
-            with open(self.config.config_file_path) as f:
-                fresh_data = yaml.safe_load(f)
+            fresh_data = reload_data(self.config.config_file_path, data)
         except Exception as e:
             self.logger.error(f"[CONFIDENCE] Config reload failed: {e}")
             return
@@ -1874,7 +2021,7 @@ class SteeringDaemon:
             f"[CONFIDENCE] Config reload: dry_run={old_dry_run}->{new_dry_run} mode={mode_str}"
         )
 
-    def _reload_wan_state_config(self) -> None:
+    def _reload_wan_state_config(self, data: dict[str, Any] | None = None) -> None:
         """Re-read wan_state.enabled from config YAML file (triggered by SIGUSR1).
 
         Only reloads the wan_state.enabled field. All other wan_state values
@@ -1884,10 +2031,7 @@ class SteeringDaemon:
         grace period (safe ramp-up after re-enable).
         """
         try:
-            import yaml
-
-            with open(self.config.config_file_path) as f:
-                fresh_data = yaml.safe_load(f)
+            fresh_data = reload_data(self.config.config_file_path, data)
         except Exception as e:
             self.logger.error(f"[WAN_STATE] Config reload failed: {e}")
             return
@@ -1916,13 +2060,10 @@ class SteeringDaemon:
         else:
             self.logger.warning(f"[WAN_STATE] Config reload: enabled={old_enabled}->{new_enabled}")
 
-    def _reload_webhook_url_config(self) -> None:
+    def _reload_webhook_url_config(self, data: dict[str, Any] | None = None) -> None:
         """Re-read alerting.webhook_url from config YAML (triggered by SIGUSR1)."""
         try:
-            import yaml
-
-            with open(self.config.config_file_path) as f:
-                data = yaml.safe_load(f) or {}
+            data = reload_data(self.config.config_file_path, data)
             alerting = data.get("alerting", {})
             new_url = alerting.get("webhook_url", "")
             # Expand ${ENV_VAR} references
@@ -2018,6 +2159,9 @@ class SteeringDaemon:
             },
             "storage": storage_snapshot,
             "storage_files": storage_files,
+            "zone_events": (
+                self._zone_listener.get_health_data() if self._zone_listener is not None else None
+            ),
         }
 
     def _is_current_state_good(self, current_state: str) -> bool:
@@ -2549,25 +2693,38 @@ class SteeringDaemon:
         if self.confidence_controller:
             state = self.state_mgr.state
 
-            # Convert CongestionSignals to ConfidenceSignals format
-            phase2b_signals = ConfidenceSignals(
-                cake_state=state.get("congestion_state", "GREEN"),
-                rtt_delta_ms=signals.rtt_delta,
-                drops_per_sec=float(signals.cake_drops),
-                queue_depth_pct=float(signals.queued_packets),  # Simplified (packets not %)
-                cake_state_history=list(state.get("cake_state_history", [])),
-                drops_history=list(state.get("cake_drops_history", [])),
-                queue_history=list(state.get("queue_depth_history", [])),
-                wan_zone=self.get_effective_wan_zone(),
-            )
+            if self._confidence_compiled:
+                # Histories are mirrored by the controller's sustain counters
+                confidence_decision = self.confidence_controller.evaluate_compiled(
+                    state.get("congestion_state", "GREEN"),
+                    signals.rtt_delta,
+                    float(signals.cake_drops),
+                    float(signals.queued_packets),  # Simplified (packets not %)
+                    state["current_state"],
+                    wan_zone=self.get_effective_wan_zone(),
+                    wan_red_weight=self._wan_red_weight,
+                    wan_soft_red_weight=self._wan_soft_red_weight,
+                )
+            else:
+                # Convert CongestionSignals to ConfidenceSignals format
+                phase2b_signals = ConfidenceSignals(
+                    cake_state=state.get("congestion_state", "GREEN"),
+                    rtt_delta_ms=signals.rtt_delta,
+                    drops_per_sec=float(signals.cake_drops),
+                    queue_depth_pct=float(signals.queued_packets),  # Simplified (packets not %)
+                    cake_state_history=list(state.get("cake_state_history", [])),
+                    drops_history=list(state.get("cake_drops_history", [])),
+                    queue_history=list(state.get("queue_depth_history", [])),
+                    wan_zone=self.get_effective_wan_zone(),
+                )
 
-            # Evaluate confidence (returns decision or None if dry-run)
-            confidence_decision = self.confidence_controller.evaluate(
-                phase2b_signals,
-                state["current_state"],
-                wan_red_weight=self._wan_red_weight,
-                wan_soft_red_weight=self._wan_soft_red_weight,
-            )
+                # Evaluate confidence (returns decision or None if dry-run)
+                confidence_decision = self.confidence_controller.evaluate(
+                    phase2b_signals,
+                    state["current_state"],
+                    wan_red_weight=self._wan_red_weight,
+                    wan_soft_red_weight=self._wan_soft_red_weight,
+                )
 
             # In live mode (dry_run=False), use confidence decision for routing
             assert (
@@ -2621,10 +2778,12 @@ class SteeringDaemon:
             # Track router connectivity success
             self.router_connectivity.record_success()
 
-            # Update history (W4 fix: deques handle automatic eviction)
+            # Update history (W4 fix: history rings handle automatic eviction)
             state["cake_drops_history"].append(cake_drops)
             state["queue_depth_history"].append(queued_packets)
-            # No manual trim needed - deques with maxlen automatically evict oldest elements
+            if self.confidence_controller:
+                self.confidence_controller.record_cake_stats(cake_drops, queued_packets)
+            # No manual trim needed - rings with maxlen automatically evict oldest elements
 
             return (cake_drops, queued_packets)
         # W8 fix: Track consecutive CAKE read failures (stats returned None)
@@ -2691,13 +2850,17 @@ class SteeringDaemon:
         Thin wrapper around shared record_cycle_profiling() -- preserves method
         signature for test compatibility.
         """
+        timings = {
+            "steering_cake_stats": cake_ms,
+            "steering_rtt_measurement": rtt_ms,
+            "steering_state_management": state_ms,
+        }
+        if self.config.metrics_enabled:
+            record_subsystem_timings("steering", self.config.primary_wan, timings)
+            record_steering_cycle(self.config.primary_wan, time.perf_counter() - cycle_start)
         self._overrun_count, self._profile_cycle_count = record_cycle_profiling(
             profiler=self._profiler,
-            timings={
-                "steering_cake_stats": cake_ms,
-                "steering_rtt_measurement": rtt_ms,
-                "steering_state_management": state_ms,
-            },
+            timings=timings,
             cycle_start=cycle_start,
             cycle_interval_ms=self._cycle_interval_ms,
             logger=self.logger,
@@ -2845,6 +3008,8 @@ class SteeringDaemon:
             cake_state_history = state.get("cake_state_history", [])
             cake_state_history.append(state["congestion_state"])
             state["cake_state_history"] = cake_state_history[-10:]
+            if self.confidence_controller:
+                self.confidence_controller.record_cake_state(state["congestion_state"])
 
         if state_changed:
             self.logger.info(
@@ -3040,6 +3205,7 @@ def run_daemon_loop(
     maintenance_conn: Any = None,
     maintenance_retention_config: Any = None,
     maintenance_interval_seconds: int = DEFAULT_MAINTENANCE_INTERVAL,
+    zone_listener: ZoneEventListener | None = None,
 ) -> int:
     """
     Run continuous daemon loop with watchdog and failure tracking.
@@ -3057,6 +3223,8 @@ def run_daemon_loop(
             (None disables periodic maintenance; startup maintenance still ran).
         maintenance_retention_config: Retention policy for cleanup/downsample.
         maintenance_interval_seconds: Cadence between maintenance passes.
+        zone_listener: Bound zone event listener. When set, the loop also wakes
+            on autorate zone transitions and may stretch the tick while idle.
 
     Returns:
         Exit code: 0 for graceful shutdown
@@ -3079,6 +3247,8 @@ def run_daemon_loop(
     maintenance_db_path = storage_config.get("db_path") if maintenance_conn is not None else None
     last_maintenance = time.monotonic()
 
+    idle_interval = _idle_interval(config, zone_listener)
+
     # Main event loop - runs continuously until shutdown signal
     while not shutdown_event.is_set():
         cycle_start = time.monotonic()
@@ -3143,12 +3313,7 @@ def run_daemon_loop(
             logger.info(
                 "SIGUSR1 received, reloading config (dry_run + wan_state + webhook_url + route_management)"
             )
-            daemon._reload_dry_run_config()
-            daemon._reload_wan_state_config()
-            daemon._reload_webhook_url_config()
-            old_mode = daemon.route_manager.mode if daemon.route_manager else None
-            daemon._reload_route_management_config()
-            daemon._handle_mode_change(old_mode=old_mode)
+            daemon.reload()
             reset_reload_state()
 
         # Always notify watchdog - process alive even when RTT fails.
@@ -3159,14 +3324,59 @@ def run_daemon_loop(
             notify_degraded(f"cycle failure ({consecutive_failures})")
 
         # Sleep for remainder of cycle interval (interruptible)
-        sleep_time = max(0, config.measurement_interval - elapsed)
-        if sleep_time > 0 and not shutdown_event.is_set():
-            shutdown_event.wait(timeout=sleep_time)
+        interval = config.measurement_interval
+        if idle_interval > interval and daemon.is_idle():
+            interval = idle_interval
+        _sleep_until_next_cycle(daemon, zone_listener, interval - elapsed, shutdown_event)
 
     logger.info("Shutdown signal received, exiting gracefully")
     return 0
 
 
+def _idle_interval(config: SteeringConfig, zone_listener: ZoneEventListener | None) -> float:
+    """Cycle interval to use while idle (stretched only when events can wake us)."""
+    if zone_listener is None or config.zone_events_config is None:
+        return float(config.measurement_interval)
+    return float(config.zone_events_config["idle_interval_seconds"])
+
+
+def _sleep_until_next_cycle(
+    daemon: SteeringDaemon,
+    zone_listener: ZoneEventListener | None,
+    sleep_time: float,
+    shutdown_event: threading.Event,
+) -> None:
+    """Sleep until the next tick or an autorate zone event, whichever is first.
+
+    Without a listener this is a plain interruptible wait. With one, events
+    that arrived while the cycle was running are drained without sleeping,
+    so a transition during a slow cycle starts the next one at once.
+    """
+    sleep_time = max(0.0, sleep_time)
+    if zone_listener is None:
+        if sleep_time > 0 and not shutdown_event.is_set():
+            shutdown_event.wait(timeout=sleep_time)
+        return
+    pending = zone_listener.drain()
+    if not pending and sleep_time > 0 and not shutdown_event.is_set():
+        pending = zone_listener.wait(sleep_time, shutdown_event)
+    for event in pending:
+        daemon.baseline_loader.apply_zone_event(event)
+
+
+def _open_zone_listener(config: SteeringConfig, logger: logging.Logger) -> ZoneEventListener | None:
+    """Bind the zone event socket when zone_events is enabled (else None)."""
+    if config.zone_events_config is None:
+        return None
+    listener = ZoneEventListener(config.zone_events_config["socket_path"], logger)
+    try:
+        listener.open()
+    except OSError as e:
+        logger.warning(f"Zone event listener unavailable, using periodic tick only: {e}")
+        return None
+    return listener
+
+
 # =============================================================================
 # MAIN
 # =============================================================================
@@ -3579,6 +3789,10 @@ def main() -> int | None:
     except SystemExit as e:
         return int(e.code) if e.code is not None else 0
 
+    zone_listener = _open_zone_listener(config, logger)
+    if zone_listener is not None:
+        daemon.attach_zone_listener(zone_listener)
+
     try:
         return run_daemon_loop(
             daemon,
@@ -3588,6 +3802,7 @@ def main() -> int | None:
             maintenance_conn=maintenance_conn,
             maintenance_retention_config=maintenance_retention_config,
             maintenance_interval_seconds=maintenance_interval_seconds,
+            zone_listener=zone_listener,
         )
     except KeyboardInterrupt:
         logger.info("Interrupted by user (KeyboardInterrupt)")
@@ -3600,6 +3815,8 @@ def main() -> int | None:
         logger.error(traceback.format_exc())
         return 1
     finally:
+        if zone_listener is not None:
+            zone_listener.close()
         _cleanup_steering_daemon(daemon, config, health_server, logger)
 
 
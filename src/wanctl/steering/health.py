@@ -211,6 +211,9 @@ class SteeringHealthHandler(BaseHTTPRequestHandler):
         health["ownership_inspection"] = self._build_ownership_inspection_section(health_data)
         health["storage"] = self._build_storage_section(health_data)
         health["runtime"] = self._build_runtime_section(health_data, health.get("cycle_budget"))
+        zone_events = health_data.get("zone_events")
+        if isinstance(zone_events, dict):
+            health["zone_events"] = zone_events
         self._add_alerting_section(health)
 
         return self.daemon.router_connectivity.is_reachable
@@ -441,6 +444,7 @@ class SteeringHealthHandler(BaseHTTPRequestHandler):
         ownership: dict[str, Any] = raw if isinstance(raw, dict) else {}
         routes_raw = ownership.get("routes")
         routes = routes_raw if isinstance(routes_raw, dict) else {}
+        routes_section: dict[str, Any] = {"default_routes": routes.get("default_routes", [])}
         section = {
             "observed_owner": str(ownership.get("observed_owner", "unknown")),
             "configured_owner": str(ownership.get("configured_owner", "unknown")),
@@ -448,16 +452,16 @@ class SteeringHealthHandler(BaseHTTPRequestHandler):
             "inspector_status": str(ownership.get("inspector_status", "unknown")),
             "inspector_error": ownership.get("inspector_error"),
             "last_inspected_at": ownership.get("last_inspected_at"),
-            "routes": {
-                "total_route_count": int(routes.get("total_route_count", 0) or 0),
-                "default_routes": routes.get("default_routes", []),
-            },
+            "routes": routes_section,
         }
         # Backward-compatible passthrough for historical/phase evidence payloads.
-        # Live Phase 268+ inspection no longer emits netwatch, but preserving the
-        # field when present keeps older health fixtures lossless.
+        # Live Phase 268+ inspection no longer emits netwatch, and live inspection
+        # no longer counts every route, but preserving the fields when present
+        # keeps older health fixtures lossless.
         if isinstance(ownership.get("netwatch"), dict):
             section["netwatch"] = ownership["netwatch"]
+        if "total_route_count" in routes:
+            routes_section["total_route_count"] = int(routes["total_route_count"] or 0)
         return section
 
     def _build_rtt_source_section(self, health_data: dict[str, Any]) -> dict[str, Any]:
@@ -70,10 +70,14 @@ class RouteOwnershipGuard:
     defaults to 'ok' unless there are actual route conflicts detected.
     """
 
-    SCRIPT_PRINT = "/system script print detail"
+    # Script sources are no longer inspected; names are enough to prove the
+    # table is readable and keep each inspection small
+    SCRIPT_PRINT = "/system script print proplist=.id,name"
 
     def __init__(self, router_client: RouteOwnershipClient) -> None:
         self.router_client = router_client
+        # cmd -> (raw output, parsed rows) of the last successful read
+        self._read_cache: dict[str, tuple[str, list[dict[str, Any]]]] = {}
 
     def inspect(self) -> RouteOwnershipGuardResult:
         """Return current route ownership status, failing closed on uncertainty.
@@ -117,6 +121,10 @@ class RouteOwnershipGuard:
                 owner="unknown",
                 error=f"failed to read RouterOS {label}: {err or out or 'unknown error'}",
             )
+        cached = self._read_cache.get(cmd)
+        if cached is not None and cached[0] == out:
+            # Unchanged since the last inspection: skip re-parsing
+            return cached[1]
         try:
             parsed = json.loads(out or "[]")
         except json.JSONDecodeError as exc:
@@ -137,6 +145,7 @@ class RouteOwnershipGuard:
                 owner="unknown",
                 error=f"unexpected RouterOS {label} output shape",
             )
+        self._read_cache[cmd] = (out, parsed)
         return parsed
 
 
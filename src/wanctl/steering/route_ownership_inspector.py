@@ -14,7 +14,15 @@ from wanctl.steering.route_ownership_guard import (
     RouteOwnershipGuardResult,
 )
 
+# Full route table; kept for the independent cross-check harnesses
 ROUTE_PRINT = "/ip route print"
+# Refreshes read only the default routes, filtered and projected router-side
+# where the client supports it. The total route count is not refreshed: a
+# count over REST would need POST /print count-only, and inspection is GET-only.
+DEFAULT_ROUTE_PRINT = (
+    "/ip route print proplist=.id,dst-address,gateway,disabled,distance,comment"
+    ' where dst-address="0.0.0.0/0"'
+)
 
 
 class RouteOwnershipInspector:
@@ -36,6 +44,8 @@ class RouteOwnershipInspector:
         self._lock = threading.Lock()
         self._stop = threading.Event()
         self._thread: threading.Thread | None = None
+        # cmd -> (raw output, parsed rows) of the last successful read
+        self._read_cache: dict[str, tuple[str, list[dict[str, Any]]]] = {}
         self._cached = self._base_snapshot(
             observed_owner="unknown",
             configured_owner="unknown",
@@ -90,11 +100,15 @@ class RouteOwnershipInspector:
             route_mode = str(route_manager_snapshot.get("mode", "off"))
 
             guard_result = self._guard.inspect()
-            route_entries = self._read_json_list(ROUTE_PRINT, "route")
+            route_entries = self._read_json_list(DEFAULT_ROUTE_PRINT, "route")
 
             observed_owner = _observed_owner(guard_result, route_mode)
             match = observed_owner == configured_owner and observed_owner != "unknown"
-            default_routes = [_project_default_route(route) for route in route_entries if route.get("dst-address") == "0.0.0.0/0"]
+            default_routes = [
+                _project_default_route(route)
+                for route in route_entries
+                if route.get("dst-address") == "0.0.0.0/0"
+            ]
 
             return self._base_snapshot(
                 observed_owner=observed_owner,
@@ -103,10 +117,7 @@ class RouteOwnershipInspector:
                 inspector_error=guard_result.error,
                 match=match,
                 last_inspected_at=_utc_now_iso(),
-                routes={
-                    "total_route_count": len(route_entries),
-                    "default_routes": default_routes,
-                },
+                routes={"default_routes": default_routes},
             )
         except Exception as exc:
             self._logger.debug("Ownership inspection refresh failed", exc_info=True)
@@ -130,6 +141,10 @@ class RouteOwnershipInspector:
         rc, out, err = self._router_client.run_cmd(cmd, capture=True, timeout=5)
         if rc != 0:
             raise RuntimeError(f"failed to read RouterOS {label}: {err or out or 'unknown error'}")
+        cached = self._read_cache.get(cmd)
+        if cached is not None and cached[0] == out:
+            # Unchanged since the last refresh: skip re-parsing
+            return cached[1]
         try:
             parsed = json.loads(out or "[]")
         except json.JSONDecodeError as exc:
@@ -138,6 +153,7 @@ class RouteOwnershipInspector:
             parsed = [parsed]
         if not isinstance(parsed, list) or not all(isinstance(item, dict) for item in parsed):
             raise RuntimeError(f"unexpected RouterOS {label} output shape")
+        self._read_cache[cmd] = (out, parsed)
         return parsed
 
     def _base_snapshot(
@@ -158,7 +174,7 @@ class RouteOwnershipInspector:
             "inspector_status": inspector_status,
             "inspector_error": inspector_error,
             "last_inspected_at": last_inspected_at,
-            "routes": routes or {"total_route_count": 0, "default_routes": []},
+            "routes": routes or {"default_routes": []},
         }
 
 
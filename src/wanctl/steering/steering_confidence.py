@@ -17,6 +17,7 @@ Design Document: docs/PHASE_2B_DESIGN.md
 import logging
 import time
 from collections import deque
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 
 # =============================================================================
@@ -171,6 +172,172 @@ def compute_confidence(
     return score, contributors
 
 
+# =============================================================================
+# COMPILED EVALUATION
+# =============================================================================
+
+# Small-integer encodings for the compiled evaluator. Unknown CAKE states score
+# like GREEN and unknown WAN zones like None, matching compute_confidence().
+CAKE_STATE_CODES: dict[str, int] = {"GREEN": 0, "YELLOW": 1, "SOFT_RED": 2, "RED": 3}
+WAN_ZONE_CODES: dict[str | None, int] = {None: 0, "GREEN": 0, "YELLOW": 0, "SOFT_RED": 1, "RED": 2}
+_SOFT_RED_CODE = CAKE_STATE_CODES["SOFT_RED"]
+
+# cake_state_history is trimmed to this many entries by the steering daemon
+CAKE_STATE_HISTORY_LEN = 10
+
+
+@dataclass(frozen=True, slots=True)
+class ConfidenceTable:
+    """Score contributions from ConfidenceWeights, indexed by encoded state/zone.
+
+    SOFT_RED's entry only applies once the state has been sustained, which
+    the evaluator checks separately.
+    """
+
+    state_scores: tuple[int, ...]
+    state_contributors: tuple[str, ...]  # "" = no contributor
+    wan_scores: tuple[int, ...]
+    wan_contributors: tuple[str, ...]
+    wan_red_weight: int | None
+    wan_soft_red_weight: int | None
+
+
+def compile_confidence_table(
+    wan_red_weight: int | None = None, wan_soft_red_weight: int | None = None
+) -> ConfidenceTable:
+    """Precompute the contribution table (None weights use ConfidenceWeights)."""
+    return ConfidenceTable(
+        state_scores=(
+            ConfidenceWeights.GREEN_STATE,
+            ConfidenceWeights.YELLOW_STATE,
+            ConfidenceWeights.SOFT_RED_SUSTAINED,
+            ConfidenceWeights.RED_STATE,
+        ),
+        state_contributors=("", "YELLOW", "SOFT_RED_sustained", "RED"),
+        wan_scores=(
+            0,
+            wan_soft_red_weight
+            if wan_soft_red_weight is not None
+            else ConfidenceWeights.WAN_SOFT_RED,
+            wan_red_weight if wan_red_weight is not None else ConfidenceWeights.WAN_RED,
+        ),
+        wan_contributors=("", "WAN_SOFT_RED", "WAN_RED"),
+        wan_red_weight=wan_red_weight,
+        wan_soft_red_weight=wan_soft_red_weight,
+    )
+
+
+class SustainCounters:
+    """
+    Incremental form of the history windows compute_confidence() slices.
+
+    Fed every value the daemon appends to cake_state_history and the CAKE
+    drops/queue histories, and capped at the same lengths, so the sustained
+    checks are integer comparisons instead of list copies and slices.
+    """
+
+    def __init__(self, stats_history_len: int | None = None):
+        self._stats_cap = stats_history_len
+        self.soft_red_run = 0
+        self.drops_len = 0
+        self.recent_drops: deque[float] = deque(maxlen=3)
+        self.queue_high_run = 0
+
+    def _cap_stats(self, count: int) -> int:
+        return count if self._stats_cap is None else min(count, self._stats_cap)
+
+    def record_cake_state(self, cake_state: str) -> None:
+        """Mirror an append to cake_state_history."""
+        if cake_state == "SOFT_RED":
+            self.soft_red_run = min(self.soft_red_run + 1, CAKE_STATE_HISTORY_LEN)
+        else:
+            self.soft_red_run = 0
+
+    def record_cake_stats(self, drops: float, queue_depth: float) -> None:
+        """Mirror an append to the drops and queue depth histories."""
+        self.drops_len = self._cap_stats(self.drops_len + 1)
+        self.recent_drops.append(drops)
+        if queue_depth > 50.0:
+            self.queue_high_run = self._cap_stats(self.queue_high_run + 1)
+        else:
+            self.queue_high_run = 0
+
+    def reset(
+        self,
+        cake_state_history: Iterable[str] = (),
+        drops_history: Iterable[float] = (),
+        queue_history: Iterable[float] = (),
+    ) -> None:
+        """Re-derive the counters from existing histories (e.g. restored state)."""
+        self.soft_red_run = self.drops_len = self.queue_high_run = 0
+        self.recent_drops.clear()
+        for cake_state in list(cake_state_history)[-CAKE_STATE_HISTORY_LEN:]:
+            self.record_cake_state(cake_state)
+        for drops in drops_history:
+            self.drops_len = self._cap_stats(self.drops_len + 1)
+            self.recent_drops.append(drops)
+        for queue_depth in queue_history:
+            if queue_depth > 50.0:
+                self.queue_high_run = self._cap_stats(self.queue_high_run + 1)
+            else:
+                self.queue_high_run = 0
+
+
+def compute_confidence_compiled(
+    table: ConfidenceTable,
+    counters: SustainCounters,
+    cake_state: str,
+    rtt_delta_ms: float,
+    queue_depth_pct: float,
+    wan_zone: str | None,
+    logger: logging.Logger,
+) -> tuple[int, list[str]]:
+    """
+    Table-driven compute_confidence() over SustainCounters.
+
+    Returns the same (score, contributing_signals) as compute_confidence()
+    for signals whose histories the counters mirror.
+    """
+    contributors = []
+
+    state_code = CAKE_STATE_CODES.get(cake_state, 0)
+    if state_code == _SOFT_RED_CODE and counters.soft_red_run < 3:
+        state_code = 0
+    score = table.state_scores[state_code]
+    state_contributor = table.state_contributors[state_code]
+    if state_contributor:
+        contributors.append(state_contributor)
+
+    if rtt_delta_ms > 120.0:
+        score += ConfidenceWeights.RTT_DELTA_SEVERE
+        contributors.append(f"rtt_delta={rtt_delta_ms:.1f}ms(severe)")
+    elif rtt_delta_ms > 80.0:
+        score += ConfidenceWeights.RTT_DELTA_HIGH
+        contributors.append(f"rtt_delta={rtt_delta_ms:.1f}ms(high)")
+
+    if counters.drops_len >= 3:
+        recent_drops = counters.recent_drops
+        if recent_drops[-1] > recent_drops[0] and recent_drops[-1] > 0:
+            score += ConfidenceWeights.DROPS_INCREASING
+            contributors.append(f"drops_increasing({recent_drops[-1]:.1f}/s)")
+
+    if counters.queue_high_run >= 2:
+        score += ConfidenceWeights.QUEUE_HIGH_SUSTAINED
+        contributors.append(f"queue_high({queue_depth_pct:.0f}%)")
+
+    wan_code = WAN_ZONE_CODES.get(wan_zone, 0)
+    if wan_code:
+        score += table.wan_scores[wan_code]
+        contributors.append(table.wan_contributors[wan_code])
+
+    score = max(0, min(100, score))
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"[CONFIDENCE] Confidence={score} signals=[{', '.join(contributors)}]")
+
+    return score, contributors
+
+
 # =============================================================================
 # TIMER STATE TRACKING
 # =============================================================================
@@ -534,6 +701,7 @@ class ConfidenceController:
         state_good: str = "WAN1_GOOD",
         state_degraded: str = "WAN1_DEGRADED",
         cycle_interval: float = 0.05,
+        stats_history_len: int | None = None,
     ):
         self.logger = logger
         self.config = config_v3
@@ -578,6 +746,13 @@ class ConfidenceController:
         # State
         self.timer_state = TimerState()
 
+        # Compiled evaluation (evaluate_compiled): contribution table and
+        # sustained-signal counters the daemon feeds as histories grow
+        self.compiled = bool(confidence_cfg.get("compiled_evaluation", False))
+        self.sustain = SustainCounters(stats_history_len) if self.compiled else None
+        self._table = compile_confidence_table()
+        self._state_kinds: dict[str, tuple[bool, bool]] = {}
+
         self.logger.info("[CONFIDENCE] Controller initialized (confidence-based steering)")
         if dry_run_cfg["enabled"]:
             self.logger.warning("[CONFIDENCE][DRY-RUN] LOG-ONLY mode - no routing changes")
@@ -614,15 +789,113 @@ class ConfidenceController:
             wan_red_weight=wan_red_weight,
             wan_soft_red_weight=wan_soft_red_weight,
         )
+        return self._apply_confidence(
+            confidence,
+            contributors,
+            signals.cake_state,
+            signals.rtt_delta_ms,
+            signals.drops_per_sec,
+            signals.wan_zone,
+            current_state,
+        )
+
+    def reset_sustain_counters(
+        self,
+        cake_state_history: Iterable[str],
+        drops_history: Iterable[float],
+        queue_history: Iterable[float],
+    ) -> None:
+        """Re-derive the compiled counters from the current histories."""
+        if self.sustain is not None:
+            self.sustain.reset(cake_state_history, drops_history, queue_history)
+
+    def record_cake_state(self, cake_state: str) -> None:
+        """Feed an append to cake_state_history to the compiled counters."""
+        if self.sustain is not None:
+            self.sustain.record_cake_state(cake_state)
+
+    def record_cake_stats(self, drops: float, queue_depth: float) -> None:
+        """Feed an append to the drops/queue histories to the compiled counters."""
+        if self.sustain is not None:
+            self.sustain.record_cake_stats(drops, queue_depth)
+
+    def evaluate_compiled(
+        self,
+        cake_state: str,
+        rtt_delta_ms: float,
+        drops_per_sec: float,
+        queue_depth_pct: float,
+        current_state: str,
+        wan_zone: str | None = None,
+        wan_red_weight: int | None = None,
+        wan_soft_red_weight: int | None = None,
+    ) -> str | None:
+        """
+        evaluate() using the precomputed table and sustained-signal counters.
+
+        Histories are not passed: they are mirrored by self.sustain, which
+        must have been fed every append (record_cake_state/record_cake_stats)
+        or reset from the current histories. Decisions and contributors are
+        identical to evaluate().
+        """
+        if self.sustain is None:
+            raise RuntimeError("compiled evaluation is not enabled")
+        table = self._table
+        if (
+            table.wan_red_weight != wan_red_weight
+            or table.wan_soft_red_weight != wan_soft_red_weight
+        ):
+            # Weights come from config: recompiled once per load or reload
+            table = self._table = compile_confidence_table(wan_red_weight, wan_soft_red_weight)
+        confidence, contributors = compute_confidence_compiled(
+            table,
+            self.sustain,
+            cake_state,
+            rtt_delta_ms,
+            queue_depth_pct,
+            wan_zone,
+            self.logger,
+        )
+        return self._apply_confidence(
+            confidence,
+            contributors,
+            cake_state,
+            rtt_delta_ms,
+            drops_per_sec,
+            wan_zone,
+            current_state,
+        )
+
+    def _state_kind(self, current_state: str) -> tuple[bool, bool]:
+        """(is_good, is_degraded) for a routing state name, cached per name."""
+        kind = self._state_kinds.get(current_state)
+        if kind is None:
+            # Handles legacy names
+            kind = (
+                current_state == self.state_good or current_state.endswith("_GOOD"),
+                current_state == self.state_degraded or current_state.endswith("_DEGRADED"),
+            )
+            self._state_kinds[current_state] = kind
+        return kind
+
+    def _apply_confidence(
+        self,
+        confidence: int,
+        contributors: list[str],
+        cake_state: str,
+        rtt_delta_ms: float,
+        drops_per_sec: float,
+        wan_zone: str | None,
+        current_state: str,
+    ) -> str | None:
+        """Run flap detection and sustain timers for a computed confidence."""
         self.timer_state.confidence_score = confidence
         self.timer_state.confidence_contributors = contributors
 
         # Check flap penalty (result unused but call updates internal state)
         _ = self.flap_detector.check_flapping(self.timer_state, self.base_steer_threshold)
 
-        # Determine if in good or degraded state (handles legacy names)
-        is_good = current_state == self.state_good or current_state.endswith("_GOOD")
-        is_degraded = current_state == self.state_degraded or current_state.endswith("_DEGRADED")
+        is_good, is_degraded = self._state_kind(current_state)
 
         # Update timers
         if is_good:
@@ -660,11 +933,11 @@ class ConfidenceController:
                 decision = self.timer_mgr.update_recovery_timer(
                     self.timer_state,
                     confidence,
-                    signals.cake_state,
-                    signals.rtt_delta_ms,
-                    signals.drops_per_sec,
+                    cake_state,
+                    rtt_delta_ms,
+                    drops_per_sec,
                     current_state,
-                    wan_zone=signals.wan_zone,
+                    wan_zone=wan_zone,
                 )
 
                 if decision == "DISABLE_STEERING":
@@ -10,13 +10,25 @@ Components:
 - reader.py: Read-only query functions for CLI/API
 - retention.py: Cleanup of expired data
 - downsampler.py: Granularity reduction as data ages
+- downsampler.py also maintains summary sketches (wanctl.quantile_sketch)
+- read_pool.py: Pooled read-only connections shared by the readers
+- archive.py: Columnar export archives and their memory-mapped reader
 
 Usage:
     from wanctl.storage import MetricsWriter, STORED_METRICS
     from wanctl.storage import cleanup_old_metrics, downsample_metrics
     from wanctl.storage import query_metrics, compute_summary, select_granularity
+    from wanctl.storage import query_metric_sketches, QuantileSketch
+    from wanctl.storage import MetricsArchive, write_archive
 """
 
+from wanctl.quantile_sketch import QuantileSketch
+from wanctl.storage.archive import (
+    ArchiveSeries,
+    MetricsArchive,
+    write_archive,
+    write_parquet,
+)
 from wanctl.storage.config_snapshot import record_config_snapshot
 from wanctl.storage.downsampler import (
     DOWNSAMPLE_THRESHOLDS,
@@ -27,9 +39,12 @@ from wanctl.storage.maintenance import (
     maintenance_lock_path,
     run_startup_maintenance,
 )
+from wanctl.storage.read_pool import close_read_connections
 from wanctl.storage.reader import (
     compute_summary,
+    iter_metrics,
     query_benchmarks,
+    query_metric_sketches,
     query_metrics,
     select_granularity,
 )
@@ -41,6 +56,7 @@ from wanctl.storage.retention import (
 )
 from wanctl.storage.schema import (
     BENCHMARKS_SCHEMA,
+    METRIC_SKETCHES_SCHEMA,
     METRICS_SCHEMA,
     STORED_METRICS,
     create_tables,
@@ -53,16 +69,27 @@ __all__ = [
     "DEFAULT_DB_PATH",
     # Reader
     "query_metrics",
+    "iter_metrics",
     "query_benchmarks",
+    "query_metric_sketches",
     "compute_summary",
     "select_granularity",
+    "close_read_connections",
     # Config snapshot
     "record_config_snapshot",
     # Schema
     "BENCHMARKS_SCHEMA",
     "METRICS_SCHEMA",
+    "METRIC_SKETCHES_SCHEMA",
     "STORED_METRICS",
     "create_tables",
+    # Sketches
+    "QuantileSketch",
+    # Archives
+    "ArchiveSeries",
+    "MetricsArchive",
+    "write_archive",
+    "write_parquet",
     # Retention
     "cleanup_old_metrics",
     "vacuum_if_needed",
@@ -0,0 +1,458 @@
+"""
+Metrics Archive - Compact columnar export of metrics history for offline analysis.
+
+Rows are grouped per series (wan, metric, labels, granularity) into blocks of
+up to ARCHIVE_BLOCK_SAMPLES samples, encoded with the Gorilla scheme:
+timestamps as bucketed delta-of-deltas and values XOR'd against the previous
+value, bit-packed. A regular series with slowly changing values costs a few
+bits per sample instead of the 16 bytes of a raw (int64, float64) pair.
+
+File layout:
+    ARCHIVE_MAGIC | blocks ... | JSON index | index length (<Q) | ARCHIVE_MAGIC
+
+The index maps each series to its blocks (offset, length, count, first and
+last timestamp), so MetricsArchive memory-maps the file and decodes only the
+blocks a query selects. Parquet export (write_parquet) is available when
+pyarrow is installed.
+"""
+
+import json
+import mmap
+import struct
+from array import array
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+from wanctl.storage.reader import METRIC_ROW_FIELDS
+
+ARCHIVE_MAGIC = b"WCTLARC1"
+ARCHIVE_VERSION = 1
+
+# Samples per block; bounds encoder memory per open series and decode granularity
+ARCHIVE_BLOCK_SAMPLES = 4096
+
+# Rows per Parquet row group written by write_parquet()
+PARQUET_BATCH_ROWS = 65536
+
+_MASK64 = (1 << 64) - 1
+_F64 = struct.Struct(">d")
+_FOOTER = struct.Struct("<Q")
+
+# Delta-of-delta buckets after the single-bit zero case: (prefix, prefix bits, value bits).
+# Anything wider is written as 0b1111 plus 64 bits.
+_DOD_BUCKETS = ((0b10, 2, 7), (0b110, 3, 9), (0b1110, 4, 12))
+_DOD_VALUE_BITS = (7, 9, 12, 64)
+
+_SeriesKey = tuple[str, str, str | None, str | None]
+
+
+def _float_bits(value: float) -> int:
+    return int.from_bytes(_F64.pack(value), "big")
+
+
+def _bits_float(bits: int) -> float:
+    return float(_F64.unpack(bits.to_bytes(8, "big"))[0])
+
+
+def _signed(raw: int, nbits: int) -> int:
+    return raw - (1 << nbits) if raw >= 1 << (nbits - 1) else raw
+
+
+class _BitWriter:
+    """MSB-first bit packer."""
+
+    __slots__ = ("_buf", "_acc", "_bits")
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
+        self._acc = 0
+        self._bits = 0
+
+    def write(self, value: int, nbits: int) -> None:
+        self._acc = (self._acc << nbits) | value
+        self._bits += nbits
+        if self._bits >= 64:
+            self._flush()
+
+    def _flush(self) -> None:
+        nbytes, rem = divmod(self._bits, 8)
+        self._buf += (self._acc >> rem).to_bytes(nbytes, "big")
+        self._acc &= (1 << rem) - 1
+        self._bits = rem
+
+    def getvalue(self) -> bytes:
+        """Packed bytes, zero-padded to a whole byte."""
+        pad = -self._bits % 8
+        self._acc <<= pad
+        self._bits += pad
+        self._flush()
+        return bytes(self._buf)
+
+
+class _BitReader:
+    """MSB-first bit reader; every read is one 9-byte window, so O(1)."""
+
+    __slots__ = ("_buf", "_pos")
+
+    def __init__(self, data: bytes) -> None:
+        # Padding lets a read near the end take a full window
+        self._buf = data + bytes(9)
+        self._pos = 0
+
+    def read(self, nbits: int) -> int:
+        pos = self._pos
+        start = pos >> 3
+        window = int.from_bytes(self._buf[start : start + 9], "big")
+        self._pos = pos + nbits
+        return (window >> (72 - (pos & 7) - nbits)) & ((1 << nbits) - 1)
+
+
+class _BlockEncoder:
+    """Gorilla encoder for one block of one series."""
+
+    __slots__ = ("writer", "count", "first_ts", "last_ts", "_delta", "_bits", "_lead", "_trail")
+
+    def __init__(self, timestamp: int, value: float) -> None:
+        self.writer = _BitWriter()
+        self.count = 1
+        self.first_ts = self.last_ts = timestamp
+        self._delta = 0
+        self._bits = _float_bits(value)
+        self._lead = -1
+        self._trail = 0
+        self.writer.write(timestamp & _MASK64, 64)
+        self.writer.write(self._bits, 64)
+
+    def add(self, timestamp: int, value: float) -> None:
+        writer = self.writer
+        delta = timestamp - self.last_ts
+        dod = delta - self._delta
+        self._delta = delta
+        self.last_ts = timestamp
+        if dod == 0:
+            writer.write(0, 1)
+        else:
+            for prefix, prefix_bits, value_bits in _DOD_BUCKETS:
+                if -(1 << (value_bits - 1)) <= dod < 1 << (value_bits - 1):
+                    writer.write(prefix, prefix_bits)
+                    writer.write(dod & ((1 << value_bits) - 1), value_bits)
+                    break
+            else:
+                writer.write(0b1111, 4)
+                writer.write(dod & _MASK64, 64)
+
+        bits = _float_bits(value)
+        xor = bits ^ self._bits
+        self._bits = bits
+        self.count += 1
+        if xor == 0:
+            writer.write(0, 1)
+            return
+        # Leading zeros are stored in 5 bits, so cap at 31
+        lead = min(64 - xor.bit_length(), 31)
+        trail = (xor & -xor).bit_length() - 1
+        if self._lead >= 0 and lead >= self._lead and trail >= self._trail:
+            # Fits the previous meaningful-bit window
+            writer.write(0b10, 2)
+            writer.write(xor >> self._trail, 64 - self._lead - self._trail)
+            return
+        meaningful = 64 - lead - trail
+        writer.write(0b11, 2)
+        writer.write(lead, 5)
+        writer.write(meaningful & 63, 6)  # 64 is stored as 0
+        writer.write(xor >> trail, meaningful)
+        self._lead, self._trail = lead, trail
+
+
+def _read_dod(reader: _BitReader) -> int:
+    ones = 0
+    while ones < 4 and reader.read(1):
+        ones += 1
+    if ones == 0:
+        return 0
+    nbits = _DOD_VALUE_BITS[ones - 1]
+    return _signed(reader.read(nbits), nbits)
+
+
+def _decode_block(data: bytes, count: int) -> tuple[array, array]:
+    """Decode one block into (timestamps, values) arrays."""
+    reader = _BitReader(data)
+    ts = _signed(reader.read(64), 64)
+    bits = reader.read(64)
+    timestamps = array("q", [ts])
+    values = array("d", [_bits_float(bits)])
+    delta = 0
+    lead = trail = 0
+    for _ in range(count - 1):
+        delta += _read_dod(reader)
+        ts += delta
+        if reader.read(1):
+            if reader.read(1):
+                lead = reader.read(5)
+                trail = 64 - lead - (reader.read(6) or 64)
+            bits ^= reader.read(64 - lead - trail) << trail
+        timestamps.append(ts)
+        values.append(_bits_float(bits))
+    return timestamps, values
+
+
+class ArchiveWriter:
+    """Write metrics rows to a columnar archive file.
+
+    Rows must arrive in ascending timestamp order within each series, as
+    iter_metrics()/iter_all_wans() yield them. Memory is bounded by one open
+    block per series.
+    """
+
+    def __init__(self, path: Path | str, block_samples: int = ARCHIVE_BLOCK_SAMPLES) -> None:
+        self._file = open(path, "wb")  # noqa: SIM115 -- closed by close()/__exit__
+        self._file.write(ARCHIVE_MAGIC)
+        self._block_samples = block_samples
+        self._open: dict[_SeriesKey, _BlockEncoder] = {}
+        self._blocks: dict[_SeriesKey, list[list[int]]] = {}
+        self.rows = 0
+
+    def add(self, row: dict) -> None:
+        """Append one metrics row (keys as returned by query_metrics())."""
+        key = (row["wan_name"], row["metric_name"], row["labels"], row["granularity"])
+        timestamp = int(row["timestamp"])
+        value = float(row["value"])
+        self.rows += 1
+        encoder = self._open.get(key)
+        if encoder is None:
+            self._open[key] = _BlockEncoder(timestamp, value)
+            return
+        encoder.add(timestamp, value)
+        if encoder.count >= self._block_samples:
+            self._write_block(key, self._open.pop(key))
+
+    def _write_block(self, key: _SeriesKey, encoder: _BlockEncoder) -> None:
+        data = encoder.writer.getvalue()
+        offset = self._file.tell()
+        self._file.write(data)
+        self._blocks.setdefault(key, []).append(
+            [offset, len(data), encoder.count, encoder.first_ts, encoder.last_ts]
+        )
+
+    def close(self) -> None:
+        """Flush open blocks and write the index. The writer is unusable afterwards."""
+        if self._file.closed:
+            return
+        for key, encoder in self._open.items():
+            self._write_block(key, encoder)
+        self._open.clear()
+        index = {
+            "version": ARCHIVE_VERSION,
+            "series": [
+                {
+                    "wan_name": key[0],
+                    "metric_name": key[1],
+                    "labels": key[2],
+                    "granularity": key[3],
+                    "blocks": blocks,
+                }
+                for key, blocks in sorted(self._blocks.items(), key=lambda item: str(item[0]))
+            ],
+        }
+        encoded = json.dumps(index, separators=(",", ":")).encode()
+        self._file.write(encoded)
+        self._file.write(_FOOTER.pack(len(encoded)))
+        self._file.write(ARCHIVE_MAGIC)
+        self._file.close()
+
+    def __enter__(self) -> "ArchiveWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            # Leave no index: a truncated archive fails to open rather than misleading
+            self._file.close()
+
+
+def write_archive(
+    rows: Iterable[dict], path: Path | str, block_samples: int = ARCHIVE_BLOCK_SAMPLES
+) -> int:
+    """Write rows to a columnar archive at path.
+
+    Returns:
+        Number of rows written
+    """
+    with ArchiveWriter(path, block_samples=block_samples) as writer:
+        for row in rows:
+            writer.add(row)
+    return writer.rows
+
+
+def write_parquet(
+    rows: Iterable[dict], path: Path | str, batch_rows: int = PARQUET_BATCH_ROWS
+) -> int:
+    """Write rows to a Parquet file, one row group per batch_rows rows.
+
+    Returns:
+        Number of rows written
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ImportError("Parquet export requires pyarrow (pip install pyarrow)") from exc
+
+    schema = pa.schema(
+        [
+            ("timestamp", pa.int64()),
+            ("wan_name", pa.string()),
+            ("metric_name", pa.string()),
+            ("value", pa.float64()),
+            ("labels", pa.string()),
+            ("granularity", pa.string()),
+        ]
+    )
+    count = 0
+    with pq.ParquetWriter(str(path), schema) as writer:
+        columns: dict[str, list[Any]] = {name: [] for name in METRIC_ROW_FIELDS}
+        for row in rows:
+            for name in METRIC_ROW_FIELDS:
+                columns[name].append(row[name])
+            count += 1
+            if count % batch_rows == 0:
+                writer.write_table(pa.table(columns, schema=schema))
+                columns = {name: [] for name in METRIC_ROW_FIELDS}
+        if columns["timestamp"] or count == 0:
+            writer.write_table(pa.table(columns, schema=schema))
+    return count
+
+
+@dataclass(frozen=True, slots=True)
+class ArchiveSeries:
+    """One series in a metrics archive and the blocks that hold it."""
+
+    wan_name: str
+    metric_name: str
+    labels: str | None
+    granularity: str | None
+    # (offset, length, count, first_ts, last_ts) per block, ascending in time
+    blocks: tuple[tuple[int, int, int, int, int], ...]
+
+    @property
+    def count(self) -> int:
+        return sum(block[2] for block in self.blocks)
+
+
+class MetricsArchive:
+    """Memory-mapped reader for archives written by ArchiveWriter.
+
+    Opening reads only the index; read() decodes just the blocks that
+    overlap the requested range, so large archives load with a small
+    footprint.
+
+    Raises:
+        ValueError: If the file is not a complete metrics archive
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        self._file = open(path, "rb")  # noqa: SIM115 -- closed by close()/__exit__
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Not a wanctl metrics archive: {path}") from None
+        try:
+            self.series = self._read_index(path)
+        except ValueError:
+            self.close()
+            raise
+
+    def _read_index(self, path: Path | str) -> list[ArchiveSeries]:
+        view = self._mmap
+        trailer = len(ARCHIVE_MAGIC) + _FOOTER.size
+        if (
+            len(view) < len(ARCHIVE_MAGIC) + trailer
+            or view[: len(ARCHIVE_MAGIC)] != ARCHIVE_MAGIC
+            or view[-len(ARCHIVE_MAGIC) :] != ARCHIVE_MAGIC
+        ):
+            raise ValueError(f"Not a wanctl metrics archive: {path}")
+        (index_len,) = _FOOTER.unpack_from(view, len(view) - trailer)
+        index_start = len(view) - trailer - index_len
+        index = json.loads(view[index_start : len(view) - trailer])
+        if index.get("version") != ARCHIVE_VERSION:
+            raise ValueError(f"Unsupported archive version: {index.get('version')}")
+        return [
+            ArchiveSeries(
+                wan_name=entry["wan_name"],
+                metric_name=entry["metric_name"],
+                labels=entry["labels"],
+                granularity=entry["granularity"],
+                blocks=tuple(tuple(block) for block in entry["blocks"]),
+            )
+            for entry in index["series"]
+        ]
+
+    def select(
+        self,
+        wan_name: str | None = None,
+        metric_name: str | None = None,
+        granularity: str | None = None,
+    ) -> list[ArchiveSeries]:
+        """Series matching every given filter."""
+        return [
+            series
+            for series in self.series
+            if (wan_name is None or series.wan_name == wan_name)
+            and (metric_name is None or series.metric_name == metric_name)
+            and (granularity is None or series.granularity == granularity)
+        ]
+
+    def read(
+        self, series: ArchiveSeries, start_ts: int | None = None, end_ts: int | None = None
+    ) -> tuple[array, array]:
+        """Decode a series, optionally limited to [start_ts, end_ts].
+
+        Returns:
+            (timestamps, values) as array('q') and array('d')
+        """
+        timestamps = array("q")
+        values = array("d")
+        for offset, length, count, first_ts, last_ts in series.blocks:
+            if (start_ts is not None and last_ts < start_ts) or (
+                end_ts is not None and first_ts > end_ts
+            ):
+                continue
+            block_ts, block_values = _decode_block(self._mmap[offset : offset + length], count)
+            if (start_ts is None or first_ts >= start_ts) and (end_ts is None or last_ts <= end_ts):
+                timestamps.extend(block_ts)
+                values.extend(block_values)
+                continue
+            for ts, value in zip(block_ts, block_values, strict=True):
+                if (start_ts is None or ts >= start_ts) and (end_ts is None or ts <= end_ts):
+                    timestamps.append(ts)
+                    values.append(value)
+        return timestamps, values
+
+    def close(self) -> None:
+        """Release the mapping and the file."""
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> "MetricsArchive":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -0,0 +1,332 @@
+"""
+Cold Tier - Compressed per-day blobs for the 5m and 1h aggregate tiers.
+
+Once a day of 5m or 1h aggregates is complete, its rows in the metrics table
+are packed into one metrics_cold row per series (WAN, metric, labels) and
+day: the labels string is stored once, timestamps as uint32 deltas from the
+day start and values as byte-shuffled float64s, compressed with zlib (lzma
+payloads are also readable). A day of 5m samples shrinks from ~290 indexed
+rows to a single small blob.
+
+Readers never see the blobs: reader.py decodes the days a query reaches in
+Python and merges them with the metrics table rows, so queries return the
+same rows whether a day is hot or frozen. A tier's days are only frozen once
+no rollup will read them again (5m days stay hot while a 5m->1h rollup is
+configured); the downsampler still thaws any frozen source days before a
+rollup, and retention trims blobs to the tier cutoff.
+"""
+
+import logging
+import lzma
+import sqlite3
+import struct
+import sys
+import zlib
+from array import array
+from collections.abc import Callable, Mapping
+
+logger = logging.getLogger(__name__)
+
+# Aggregate tiers packed into per-day blobs
+COLD_GRANULARITIES = ("5m", "1h")
+
+# Blobs hold one UTC day per series
+COLD_DAY_SECONDS = 86400
+
+# Codec for new blobs; decoding accepts any codec in _DECOMPRESSORS
+COLD_CODEC = "zlib"
+
+# Payload header: format version, sample count
+_HEADER = struct.Struct("<BI")
+_FORMAT_VERSION = 1
+
+_COMPRESSORS: dict[str, Callable[[bytes], bytes]] = {
+    "zlib": lambda data: zlib.compress(data, 9),
+    "lzma": lzma.compress,
+}
+_DECOMPRESSORS: dict[str, Callable[[bytes], bytes]] = {
+    "zlib": zlib.decompress,
+    "lzma": lzma.decompress,
+}
+
+# Expanded cold rows get negative ids so they never collide with metrics ids:
+# -(blob_id * COLD_ID_STRIDE + sample_index + 1). A day has < 86400 samples.
+COLD_ID_STRIDE = 100000
+
+_Sample = tuple[int, float]
+
+
+def encode_cold_day(day_start: int, samples: list[_Sample], codec: str = COLD_CODEC) -> bytes:
+    """Encode (timestamp, value) samples of one day into a compressed payload.
+
+    Samples must be sorted by timestamp and fall within
+    [day_start, day_start + COLD_DAY_SECONDS).
+    """
+    deltas = array("I")
+    previous = day_start
+    for timestamp, _ in samples:
+        deltas.append(timestamp - previous)
+        previous = timestamp
+    values = array("d", (value for _, value in samples))
+    if sys.byteorder == "big":
+        deltas.byteswap()
+        values.byteswap()
+    # Byte planes: sign/exponent bytes of similar values line up, which is
+    # what lets the compressor find long runs in aggregate series
+    raw = values.tobytes()
+    shuffled = b"".join(raw[plane::8] for plane in range(8))
+    body = deltas.tobytes() + shuffled
+    return _HEADER.pack(_FORMAT_VERSION, len(samples)) + _COMPRESSORS[codec](body)
+
+
+def decode_cold_day(codec: str, day_start: int, payload: bytes) -> list[_Sample]:
+    """Decode a payload written by encode_cold_day().
+
+    Raises:
+        ValueError: If the codec, format version or payload size is invalid
+    """
+    decompress = _DECOMPRESSORS.get(codec)
+    if decompress is None:
+        raise ValueError(f"Unknown cold tier codec: {codec}")
+    version, count = _HEADER.unpack_from(payload)
+    if version != _FORMAT_VERSION:
+        raise ValueError(f"Unsupported cold tier payload version: {version}")
+    body = decompress(payload[_HEADER.size :])
+    if len(body) != count * 12:
+        raise ValueError("Corrupt cold tier payload")
+
+    deltas = array("I", body[: count * 4])
+    shuffled = body[count * 4 :]
+    raw = bytearray(count * 8)
+    for plane in range(8):
+        raw[plane::8] = shuffled[plane * count : (plane + 1) * count]
+    values = array("d", bytes(raw))
+    if sys.byteorder == "big":
+        deltas.byteswap()
+        values.byteswap()
+
+    samples: list[_Sample] = []
+    timestamp = day_start
+    for delta, value in zip(deltas, values, strict=True):
+        timestamp += delta
+        samples.append((timestamp, value))
+    return samples
+
+
+def cold_tier_exists(conn: sqlite3.Connection) -> bool:
+    """True if the metrics_cold table exists (databases predating it have none)."""
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'metrics_cold'"
+    ).fetchone()
+    return row is not None
+
+
+def _write_cold_day(
+    conn: sqlite3.Connection,
+    key: tuple[str, str, str, str, int],
+    samples: list[_Sample],
+) -> None:
+    wan_name, metric_name, granularity, labels, day_start = key
+    conn.execute(
+        """
+        INSERT OR REPLACE INTO metrics_cold
+            (day_start, granularity, wan_name, metric_name, labels,
+             first_ts, last_ts, count, codec, payload)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        (
+            day_start,
+            granularity,
+            wan_name,
+            metric_name,
+            labels,
+            samples[0][0],
+            samples[-1][0],
+            len(samples),
+            COLD_CODEC,
+            encode_cold_day(day_start, samples),
+        ),
+    )
+
+
+def freeze_cold_days(
+    conn: sqlite3.Connection,
+    granularity: str,
+    cutoff: int,
+    watchdog_fn: Callable[[], None] | None = None,
+) -> int:
+    """Pack complete days of granularity rows older than cutoff into blobs.
+
+    Only days ending at or before cutoff are frozen, so a tier that is still
+    receiving aggregates is left alone. Rows arriving late for an already
+    frozen day are merged into its blob on the next pass.
+
+    Args:
+        conn: Database connection
+        granularity: Tier to freeze (one of COLD_GRANULARITIES)
+        cutoff: Unix timestamp - complete days before this are frozen
+        watchdog_fn: Optional callback to ping between metric/wan combinations
+
+    Returns:
+        Number of metrics rows moved into blobs
+    """
+    if granularity not in COLD_GRANULARITIES or not cold_tier_exists(conn):
+        return 0
+    day_cutoff = (cutoff // COLD_DAY_SECONDS) * COLD_DAY_SECONDS
+    rows_frozen = 0
+
+    txn_started = False
+    try:
+        conn.execute("BEGIN")
+        txn_started = True
+
+        combinations = conn.execute(
+            """
+            SELECT DISTINCT metric_name, wan_name
+            FROM metrics
+            WHERE granularity = ?
+              AND timestamp < ?
+            """,
+            (granularity, day_cutoff),
+        ).fetchall()
+
+        for metric_name, wan_name in combinations:
+            days: dict[tuple[str, int], list[_Sample]] = {}
+            rows = conn.execute(
+                """
+                SELECT timestamp, value, labels
+                FROM metrics
+                WHERE metric_name = ?
+                  AND wan_name = ?
+                  AND granularity = ?
+                  AND timestamp < ?
+                ORDER BY timestamp
+                """,
+                (metric_name, wan_name, granularity, day_cutoff),
+            )
+            for timestamp, value, labels in rows:
+                day_start = (timestamp // COLD_DAY_SECONDS) * COLD_DAY_SECONDS
+                days.setdefault((labels or "", day_start), []).append((timestamp, value))
+                rows_frozen += 1
+
+            for (labels, day_start), samples in days.items():
+                key = (wan_name, metric_name, granularity, labels, day_start)
+                existing = conn.execute(
+                    """
+                    SELECT codec, payload FROM metrics_cold
+                    WHERE wan_name = ? AND metric_name = ? AND granularity = ?
+                      AND labels = ? AND day_start = ?
+                    """,
+                    key,
+                ).fetchone()
+                if existing is not None:
+                    merged = decode_cold_day(existing[0], day_start, existing[1]) + samples
+                    samples = sorted(merged, key=lambda sample: sample[0])
+                _write_cold_day(conn, key, samples)
+
+            conn.execute(
+                """
+                DELETE FROM metrics
+                WHERE metric_name = ?
+                  AND wan_name = ?
+                  AND granularity = ?
+                  AND timestamp < ?
+                """,
+                (metric_name, wan_name, granularity, day_cutoff),
+            )
+
+            if watchdog_fn is not None:
+                watchdog_fn()
+
+        conn.commit()
+    except Exception:
+        if txn_started:
+            try:
+                conn.execute("ROLLBACK")
+            except Exception:
+                pass  # rollback failed — original exception is more important
+        raise
+
+    if rows_frozen > 0:
+        logger.info("Froze %d %s rows into the cold tier", rows_frozen, granularity)
+
+    return rows_frozen
+
+
+def _split_cold_days(
+    conn: sqlite3.Connection, granularity: str, cutoff: int
+) -> list[tuple[str, str, str | None, list[_Sample]]]:
+    """Remove samples older than cutoff from granularity blobs.
+
+    Blobs entirely before cutoff are deleted; a blob straddling it is
+    rewritten with the remaining samples. Does not commit.
+
+    Returns:
+        (wan_name, metric_name, labels, samples) for every removed group
+    """
+    removed: list[tuple[str, str, str | None, list[_Sample]]] = []
+    blobs = conn.execute(
+        """
+        SELECT id, day_start, wan_name, metric_name, labels, last_ts, codec, payload
+        FROM metrics_cold
+        WHERE granularity = ? AND first_ts < ?
+        """,
+        (granularity, cutoff),
+    ).fetchall()
+    for blob_id, day_start, wan_name, metric_name, labels, last_ts, codec, payload in blobs:
+        samples = decode_cold_day(codec, day_start, payload)
+        older = [sample for sample in samples if sample[0] < cutoff]
+        if last_ts < cutoff:
+            conn.execute("DELETE FROM metrics_cold WHERE id = ?", (blob_id,))
+        else:
+            kept = samples[len(older) :]
+            _write_cold_day(conn, (wan_name, metric_name, granularity, labels, day_start), kept)
+        removed.append((wan_name, metric_name, labels or None, older))
+    return removed
+
+
+def thaw_cold_days(conn: sqlite3.Connection, granularity: str, cutoff: int) -> int:
+    """Move granularity samples older than cutoff from blobs back into metrics.
+
+    Used by the downsampler before rolling a frozen tier up into the next
+    one. Runs inside the caller's transaction and does not commit.
+
+    Returns:
+        Number of rows restored to the metrics table
+    """
+    if granularity not in COLD_GRANULARITIES or not cold_tier_exists(conn):
+        return 0
+    rows_thawed = 0
+    for wan_name, metric_name, labels, samples in _split_cold_days(conn, granularity, cutoff):
+        conn.executemany(
+            """
+            INSERT INTO metrics
+                (timestamp, wan_name, metric_name, value, labels, granularity)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (timestamp, wan_name, metric_name, value, labels, granularity)
+                for timestamp, value in samples
+            ],
+        )
+        rows_thawed += len(samples)
+    return rows_thawed
+
+
+def expire_cold_days(conn: sqlite3.Connection, tier_cutoffs: Mapping[str, int]) -> int:
+    """Drop blob samples older than their tier's retention cutoff.
+
+    Returns:
+        Number of samples deleted
+    """
+    if not cold_tier_exists(conn):
+        return 0
+    deleted = 0
+    for granularity in COLD_GRANULARITIES:
+        cutoff = tier_cutoffs.get(granularity)
+        if cutoff is None:
+            continue
+        for *_, samples in _split_cold_days(conn, granularity, cutoff):
+            deleted += len(samples)
+    conn.commit()
+    return deleted
@@ -5,9 +5,14 @@ Precedence rules:
 - Fall back to legacy ``metrics.db`` only when no per-WAN files exist.
 
 Merge semantics:
-- Query each discovered database independently.
-- Concatenate all rows and sort by ascending timestamp.
+- Query each discovered database independently, in parallel when there are
+  several (sqlite3 releases the GIL while a statement runs).
+- Order each database's rows by ascending timestamp and heap-merge them.
+  Ties keep database order, then each database's own row order, exactly as a
+  stable sort of the concatenated rows would.
 - Do not deduplicate overlapping timestamps because rows retain ``wan_name``.
+- ``iter_all_wans`` merges streaming readers the same way without
+  materializing rows, so memory stays bounded by one page per database.
 
 Failure handling:
 - If one database is unreadable, log a warning and continue with others.
@@ -21,9 +26,11 @@ Deployment atomicity assumption:
   avoids double-counting without risking mixed-source reads.
 """
 
+import heapq
 import logging
 import sqlite3
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Generator, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -34,6 +41,9 @@ logger = logging.getLogger(__name__)
 WAN_DB_DIR = DEFAULT_DB_PATH.parent
 WAN_DB_GLOB = "metrics-*.db"
 
+# Upper bound on concurrent per-WAN queries in query_all_wans()
+MAX_QUERY_WORKERS = 4
+
 
 class QueryAllWansResult(list[dict]):
     """Merged query results plus status about complete query failure."""
@@ -57,24 +67,83 @@ def discover_wan_dbs(db_dir: Path | None = None) -> list[Path]:
     return []
 
 
+def _row_timestamp(row: dict) -> Any:
+    return row.get("timestamp", 0)
+
+
+def _query_one(
+    query_fn: Callable[..., list[dict]], db_path: Path, kwargs: dict[str, Any]
+) -> tuple[list[dict], Exception | None]:
+    """Run query_fn against one database, returning read failures instead of raising."""
+    try:
+        return query_fn(db_path=db_path, **kwargs), None
+    except (sqlite3.DatabaseError, OSError) as exc:
+        return [], exc
+
+
 def query_all_wans(
     query_fn: Callable[..., list[dict]],
     db_paths: Sequence[Path] | None = None,
     **kwargs: Any,
 ) -> QueryAllWansResult:
     """Run a read-only query against each database and merge the rows."""
-    paths = db_paths if db_paths is not None else discover_wan_dbs()
-    results: list[dict] = []
+    paths = list(db_paths if db_paths is not None else discover_wan_dbs())
+
+    if len(paths) > 1:
+        with ThreadPoolExecutor(
+            max_workers=min(len(paths), MAX_QUERY_WORKERS),
+            thread_name_prefix="wanctl-query",
+        ) as pool:
+            outcomes = list(pool.map(lambda path: _query_one(query_fn, path, kwargs), paths))
+    else:
+        outcomes = [_query_one(query_fn, path, kwargs) for path in paths]
+
+    per_db: list[list[dict]] = []
     failures = 0
-
-    for db_path in paths:
-        try:
-            results.extend(query_fn(db_path=db_path, **kwargs))
-        except (sqlite3.DatabaseError, OSError) as exc:
+    for db_path, (rows, exc) in zip(paths, outcomes, strict=True):
+        if exc is not None:
             failures += 1
             logger.warning("Failed to query %s, skipping: %s", db_path.name, exc)
+            continue
+        # Readers return newest-first; sorting a reversed run is linear
+        per_db.append(sorted(rows, key=_row_timestamp))
 
-    results.sort(key=lambda row: row.get("timestamp", 0))
     return QueryAllWansResult(
-        results, all_failed=bool(paths) and failures == len(paths)
+        list(heapq.merge(*per_db, key=_row_timestamp)),
+        all_failed=bool(paths) and failures == len(paths),
     )
+
+
+def _iter_one(
+    iter_fn: Callable[..., Iterable[dict]], db_path: Path, kwargs: dict[str, Any]
+) -> Generator[dict, None, None]:
+    """Stream rows from one database; a read failure ends that database's rows."""
+    try:
+        yield from iter_fn(db_path=db_path, **kwargs)
+    except (sqlite3.DatabaseError, OSError) as exc:
+        logger.warning("Failed to read %s, skipping remaining rows: %s", db_path.name, exc)
+
+
+def iter_all_wans(
+    iter_fn: Callable[..., Iterable[dict]],
+    db_paths: Sequence[Path] | None = None,
+    *,
+    newest_first: bool = False,
+    **kwargs: Any,
+) -> Generator[dict, None, None]:
+    """Stream rows from each database, merged by timestamp.
+
+    iter_fn (e.g. iter_metrics) must yield rows in the order requested by
+    newest_first, which is passed through to it. Unlike query_all_wans(),
+    failures cannot be reported up front: an unreadable database is logged
+    and contributes no further rows. Closing the returned generator closes
+    every per-database reader, returning their pooled connections.
+    """
+    paths = list(db_paths if db_paths is not None else discover_wan_dbs())
+    kwargs["newest_first"] = newest_first
+    sources = [_iter_one(iter_fn, path, kwargs) for path in paths]
+    try:
+        yield from heapq.merge(*sources, key=_row_timestamp, reverse=newest_first)
+    finally:
+        for source in sources:
+            source.close()
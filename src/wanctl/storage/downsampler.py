@@ -7,6 +7,11 @@ preserving appropriate detail for different time ranges:
 - 1-minute aggregates kept for 1 day
 - 5-minute aggregates kept for 7 days
 - 1-hour aggregates kept for retention period
+
+Each pass also folds the samples it retires into per-bucket summary
+sketches (metric_sketches) that roll up alongside the aggregate tiers, and
+packs complete days of the 5m and 1h tiers into the compressed cold tier
+(cold_tier.py).
 """
 
 import json
@@ -16,6 +21,9 @@ import time
 from collections.abc import Callable
 from typing import Literal
 
+from wanctl.quantile_sketch import QuantileSketch
+from wanctl.storage.cold_tier import COLD_GRANULARITIES, freeze_cold_days, thaw_cold_days
+
 logger = logging.getLogger(__name__)
 _JSON_DECODER = json.JSONDecoder()
 
@@ -491,6 +499,124 @@ def _load_target_identities(
     return identities
 
 
+def _roll_up_sketches(
+    conn: sqlite3.Connection,
+    metric_name: str,
+    wan_name: str,
+    from_granularity: str,
+    to_granularity: str,
+    bucket_seconds: int,
+    complete_cutoff: int,
+) -> int:
+    """Fold complete source buckets into target-granularity summary sketches.
+
+    Raw samples are sketched directly; aggregate tiers merge their own
+    sketches, which are then deleted like the aggregate rows they mirror.
+    Late samples for an already-sketched bucket merge into that sketch.
+
+    Returns:
+        Number of sketch rows written
+    """
+    # Databases created before metric_sketches existed are downsampled
+    # without summaries until create_tables() runs against them.
+    table = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'metric_sketches'"
+    ).fetchone()
+    if table is None:
+        return 0
+
+    sketches: dict[int, QuantileSketch] = {}
+    if from_granularity == "raw":
+        rows = conn.execute(
+            """
+            SELECT timestamp, value
+            FROM metrics
+            WHERE wan_name = ?
+              AND metric_name = ?
+              AND granularity = 'raw'
+              AND timestamp < ?
+            """,
+            (wan_name, metric_name, complete_cutoff),
+        )
+        for timestamp, value in rows:
+            bucket_start = (timestamp // bucket_seconds) * bucket_seconds
+            sketch = sketches.get(bucket_start)
+            if sketch is None:
+                sketch = sketches[bucket_start] = QuantileSketch()
+            sketch.add(value)
+    else:
+        rows = conn.execute(
+            """
+            SELECT bucket_start, count, sum, min, max, sketch
+            FROM metric_sketches
+            WHERE wan_name = ?
+              AND metric_name = ?
+              AND granularity = ?
+              AND bucket_start < ?
+            """,
+            (wan_name, metric_name, from_granularity, complete_cutoff),
+        )
+        for source_start, *row in rows:
+            bucket_start = (source_start // bucket_seconds) * bucket_seconds
+            sketch = sketches.get(bucket_start)
+            if sketch is None:
+                sketch = sketches[bucket_start] = QuantileSketch()
+            sketch.merge(QuantileSketch.from_row(*row))
+        conn.execute(
+            """
+            DELETE FROM metric_sketches
+            WHERE wan_name = ?
+              AND metric_name = ?
+              AND granularity = ?
+              AND bucket_start < ?
+            """,
+            (wan_name, metric_name, from_granularity, complete_cutoff),
+        )
+
+    sketches = {start: sketch for start, sketch in sketches.items() if sketch.count}
+    if not sketches:
+        return 0
+
+    existing = conn.execute(
+        """
+        SELECT bucket_start, count, sum, min, max, sketch
+        FROM metric_sketches
+        WHERE wan_name = ?
+          AND metric_name = ?
+          AND granularity = ?
+          AND bucket_start >= ?
+          AND bucket_start <= ?
+        """,
+        (wan_name, metric_name, to_granularity, min(sketches), max(sketches)),
+    ).fetchall()
+    for bucket_start, *row in existing:
+        if bucket_start in sketches:
+            sketches[bucket_start].merge(QuantileSketch.from_row(*row))
+
+    conn.executemany(
+        """
+        INSERT OR REPLACE INTO metric_sketches
+            (bucket_start, granularity, wan_name, metric_name, count, sum, min, max, sketch)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        [
+            (
+                bucket_start,
+                to_granularity,
+                wan_name,
+                metric_name,
+                sketch.count,
+                sketch.total,
+                sketch.min,
+                sketch.max,
+                sketch.buckets_blob(),
+            )
+            for bucket_start, sketch in sorted(sketches.items())
+        ],
+    )
+    return len(sketches)
+
+
 def downsample_to_granularity(
     conn: sqlite3.Connection,
     from_granularity: str,
@@ -502,7 +628,8 @@ def downsample_to_granularity(
     """Downsample data from one granularity level to another.
 
     Aggregates data older than cutoff into larger time buckets.
-    Original data is deleted after aggregation.
+    Original data is deleted after aggregation; summary sketches for the
+    retired buckets are rolled up in the same transaction.
 
     Args:
         conn: Database connection
@@ -522,6 +649,9 @@ def downsample_to_granularity(
         conn.execute("BEGIN")
         txn_started = True
 
+        # Frozen source days must be back in metrics before they can roll up
+        thaw_cold_days(conn, from_granularity, (cutoff // bucket_seconds) * bucket_seconds)
+
         # Labels are processed inside each metric/WAN bucket so label
         # cardinality does not multiply full-bucket scans.
         combinations = conn.execute(
@@ -618,6 +748,15 @@ def downsample_to_granularity(
             # cutoff normally straddles a bucket; those rows must survive for
             # the next maintenance pass rather than being dropped unaggregated.
             complete_cutoff = (cutoff // bucket_seconds) * bucket_seconds
+            _roll_up_sketches(
+                conn,
+                metric_name,
+                wan_name,
+                from_granularity,
+                to_granularity,
+                bucket_seconds,
+                complete_cutoff,
+            )
             conn.execute(
                 """
                 DELETE FROM metrics
@@ -668,7 +807,8 @@ def downsample_metrics(
 ) -> dict[str, int]:
     """Run all applicable downsampling based on current time.
 
-    Processes each downsampling level in order (raw->1m->5m->1h).
+    Processes each downsampling level in order (raw->1m->5m->1h), then
+    freezes the 5m and 1h days no later rollup will read into the cold tier.
 
     Args:
         conn: Database connection
@@ -700,4 +840,16 @@ def downsample_metrics(
         if watchdog_fn is not None:
             watchdog_fn()
 
+    # A tier's day is final once its source tier's cutoff has passed it and
+    # any rollup out of the tier has run past it too. Freezing a 5m day that
+    # the 5m->1h rollup reads later would only be thawed again.
+    freeze_cutoffs: dict[str, int] = {}
+    for config in effective_thresholds.values():
+        cutoff = now - int(config["age_seconds"])
+        for granularity in (str(config["from_granularity"]), str(config["to_granularity"])):
+            if granularity in COLD_GRANULARITIES:
+                freeze_cutoffs[granularity] = min(freeze_cutoffs.get(granularity, cutoff), cutoff)
+    for granularity, cutoff in freeze_cutoffs.items():
+        freeze_cold_days(conn, granularity, cutoff, watchdog_fn=watchdog_fn)
+
     return results
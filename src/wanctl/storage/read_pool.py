@@ -0,0 +1,205 @@
+"""
+Read Pool - Reusable read-only SQLite connections keyed by database path.
+
+The query helpers in reader.py used to open a fresh read-only connection,
+re-register SQL functions and re-prepare every statement on each call. The
+health endpoint, history CLI, operator summary and tuning safety checks call
+them repeatedly, so connections are now checked out of a small per-path pool
+instead. A pooled connection keeps its statement cache (prepared statements
+survive between calls) and is opened once with read-tuned PRAGMAs.
+
+Pooled connections are re-validated on checkout by (device, inode): if the
+file at the path was replaced (unlink/rename and re-create), idle connections
+to the old file are closed and a new one is opened. Writes to the same file,
+including WAL checkpoints that rewrite the main file and bump its mtime, keep
+the identity, and SQLite itself invalidates a connection's page cache when
+the database changes, so a live daemon's readers stay pooled.
+
+Inode numbers are only reused once the old inode is freed, which cannot
+happen while a pooled connection still holds it open. The remaining window
+is between stat() and open(): a connection is only pooled if the file's
+identity and ctime were the same before and after it was opened.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from pathlib import Path
+
+from wanctl.storage.downsampler import canonicalize_series_labels
+
+logger = logging.getLogger(__name__)
+
+# Idle connections kept per database path, and across all paths (least
+# recently released paths are evicted first)
+MAX_IDLE_PER_PATH = 4
+MAX_IDLE_TOTAL = 16
+
+# Prepared statements cached per connection (sqlite3 LRU keyed by SQL text)
+READ_STATEMENT_CACHE = 128
+
+# Read-side PRAGMAs. mmap avoids read() copies for index/range scans; the
+# page cache is per connection, so both stay modest for the daemon's RSS.
+READ_PRAGMAS: tuple[str, ...] = (
+    "PRAGMA query_only=1",
+    "PRAGMA mmap_size=67108864",  # 64 MB
+    "PRAGMA cache_size=-8192",  # 8 MB
+    "PRAGMA temp_store=MEMORY",
+)
+
+_FileIdentity = tuple[int, int]
+
+
+def _file_identity(stat: os.stat_result) -> _FileIdentity:
+    return stat.st_dev, stat.st_ino
+
+
+def _replaced_during_open(before: os.stat_result, db_path: Path) -> bool:
+    # A changed ctime means the path may have been swapped (and its inode
+    # number reused) between stat() and open(); don't pool that connection
+    try:
+        after = os.stat(db_path)
+    except OSError:
+        return True
+    return (
+        _file_identity(after) != _file_identity(before) or after.st_ctime_ns != before.st_ctime_ns
+    )
+
+
+def _open_read_connection(db_path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(
+        f"file:{db_path}?mode=ro",
+        uri=True,
+        check_same_thread=False,
+        cached_statements=READ_STATEMENT_CACHE,
+    )
+    try:
+        for pragma in READ_PRAGMAS:
+            conn.execute(pragma)
+    except sqlite3.Error:
+        conn.close()
+        raise
+    conn.create_function(
+        "canonical_series_labels",
+        2,
+        canonicalize_series_labels,
+        deterministic=True,
+    )
+    return conn
+
+
+class ReadConnectionPool:
+    """Thread-safe pool of read-only connections keyed by database path.
+
+    A checked-out connection belongs to one thread until released; sqlite3's
+    same-thread check is disabled because release may happen on a different
+    thread than the original open.
+    """
+
+    def __init__(
+        self, max_idle_per_path: int = MAX_IDLE_PER_PATH, max_idle_total: int = MAX_IDLE_TOTAL
+    ) -> None:
+        self._max_idle = max_idle_per_path
+        self._max_idle_total = max_idle_total
+        self._lock = threading.Lock()
+        self._idle: dict[str, list[tuple[_FileIdentity, sqlite3.Connection]]] = {}
+        self._checked_out: dict[int, tuple[str, _FileIdentity | None]] = {}
+
+    def acquire(self, db_path: Path | str) -> sqlite3.Connection:
+        """Check out a read-only connection, opening one if none is idle.
+
+        Raises:
+            sqlite3.OperationalError: If the database cannot be opened
+        """
+        path = Path(db_path)
+        key = str(path)
+        try:
+            stat = os.stat(path)
+        except OSError as exc:
+            with self._lock:
+                gone = self._idle.pop(key, [])
+            for _, old in gone:
+                old.close()
+            raise sqlite3.OperationalError(f"unable to open database file: {exc}") from exc
+
+        identity: _FileIdentity | None = _file_identity(stat)
+        stale: list[sqlite3.Connection] = []
+        conn = None
+        with self._lock:
+            idle = self._idle.get(key, [])
+            while idle:
+                idle_identity, candidate = idle.pop()
+                if idle_identity == identity:
+                    conn = candidate
+                    break
+                stale.append(candidate)
+        for old in stale:
+            old.close()
+
+        if conn is None:
+            conn = _open_read_connection(path)
+            if _replaced_during_open(stat, path):
+                identity = None
+        with self._lock:
+            self._checked_out[id(conn)] = (key, identity)
+        return conn
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        """Return a connection to the pool (or close it if the pool is full)."""
+        with self._lock:
+            owner = self._checked_out.pop(id(conn), None)
+        key, identity = owner if owner is not None else ("", None)
+        if identity is None:
+            # Untracked, or opened while the file was being replaced
+            conn.close()
+            return
+
+        conn.row_factory = None
+        if conn.in_transaction:
+            conn.rollback()
+        evicted: list[sqlite3.Connection] = []
+        with self._lock:
+            # Re-insert so dict order tracks how recently each path was used
+            idle = self._idle.pop(key, [])
+            self._idle[key] = idle
+            if len(idle) < self._max_idle:
+                idle.append((identity, conn))
+            else:
+                evicted.append(conn)
+            total = sum(len(entries) for entries in self._idle.values())
+            for oldest in list(self._idle):
+                if total <= self._max_idle_total:
+                    break
+                entries = self._idle.pop(oldest)
+                evicted.extend(old for _, old in entries)
+                total -= len(entries)
+        for old in evicted:
+            old.close()
+
+    def close_all(self) -> None:
+        """Close every idle connection. Checked-out connections close on release."""
+        with self._lock:
+            idle = [conn for entries in self._idle.values() for _, conn in entries]
+            self._idle.clear()
+            self._checked_out.clear()
+        for conn in idle:
+            conn.close()
+
+
+_POOL = ReadConnectionPool()
+
+
+def acquire_read_connection(db_path: Path | str) -> sqlite3.Connection:
+    """Check out a pooled read-only connection for db_path."""
+    return _POOL.acquire(db_path)
+
+
+def release_read_connection(conn: sqlite3.Connection) -> None:
+    """Return a connection obtained from acquire_read_connection()."""
+    _POOL.release(conn)
+
+
+def close_read_connections() -> None:
+    """Close all idle pooled read connections (tests, shutdown)."""
+    _POOL.close_all()
@@ -2,29 +2,96 @@
 MetricsReader - Read-only query functions for metrics database.
 
 Provides query layer for CLI and API access to stored metrics and alert data.
-All connections are read-only to prevent accidental modifications.
+All connections are read-only to prevent accidental modifications and are
+checked out of the shared read pool (read_pool.py) rather than opened per call.
 """
 
+import heapq
 import json
 import logging
 import sqlite3
+from collections.abc import Callable, Iterator
+from itertools import islice
 from pathlib import Path
 from statistics import mean, quantiles
-
+from typing import Any
+
+from wanctl.quantile_sketch import QuantileSketch
+from wanctl.storage.cold_tier import (
+    COLD_DAY_SECONDS,
+    COLD_GRANULARITIES,
+    COLD_ID_STRIDE,
+    decode_cold_day,
+)
 from wanctl.storage.downsampler import canonicalize_series_labels
+from wanctl.storage.read_pool import acquire_read_connection, release_read_connection
 from wanctl.storage.writer import DEFAULT_DB_PATH
 
 logger = logging.getLogger(__name__)
 
+# Keys of a metrics row as returned by query_metrics() and iter_metrics()
+METRIC_ROW_FIELDS = ("timestamp", "wan_name", "metric_name", "value", "labels", "granularity")
 
-def _register_reader_functions(conn: sqlite3.Connection) -> None:
-    """Register deterministic series-identity normalization for mixed tiers."""
-    conn.create_function(
-        "canonical_series_labels",
-        2,
-        canonicalize_series_labels,
-        deterministic=True,
-    )
+# Rows fetched per keyset page by iter_metrics()
+STREAM_BATCH_SIZE = 1000
+
+# Tiers from finest to coarsest, as selected by _available_tier_query_sql()
+_TIER_ORDER = ("raw", "1m", "5m", "1h")
+_NO_TIER_STARTS: tuple[int | None, ...] = (None, None, None)
+
+
+def _cold_blob_filter_sql(
+    start_ts: int | None,
+    end_ts: int | None,
+    metrics: list[str] | None,
+    wan: str | None,
+    granularity: str | None,
+) -> tuple[str, list]:
+    """Build AND conditions selecting the metrics_cold blobs a filter can touch.
+
+    The day_start bounds let the day index prune blobs before first_ts and
+    last_ts are checked.
+    """
+    sql = ""
+    params: list = []
+    if start_ts is not None:
+        sql += " AND cold.day_start > ? AND cold.last_ts >= ?"
+        params.extend((start_ts - COLD_DAY_SECONDS, start_ts))
+    if end_ts is not None:
+        sql += " AND cold.day_start <= ? AND cold.first_ts <= ?"
+        params.extend((end_ts, end_ts))
+    if metrics:
+        sql += f" AND cold.metric_name IN ({','.join('?' * len(metrics))})"
+        params.extend(metrics)
+    if wan:
+        sql += " AND cold.wan_name = ?"
+        params.append(wan)
+    if granularity:
+        sql += " AND cold.granularity = ?"
+        params.append(granularity)
+    return sql, params
+
+
+def _has_cold_rows(
+    conn: sqlite3.Connection,
+    start_ts: int | None,
+    end_ts: int | None,
+    metrics: list[str] | None,
+    wan: str | None,
+    granularity: str | None,
+) -> bool:
+    """True if frozen cold-tier blobs overlap the filter."""
+    if granularity is not None and granularity not in COLD_GRANULARITIES:
+        return False
+    blob_sql, params = _cold_blob_filter_sql(start_ts, end_ts, metrics, wan, granularity)
+    try:
+        row = conn.execute(
+            f"SELECT 1 FROM metrics_cold AS cold WHERE 1=1 {blob_sql} LIMIT 1", params
+        ).fetchone()
+    except sqlite3.OperationalError:
+        # Databases created before the cold tier have no metrics_cold table
+        return False
+    return row is not None
 
 
 def _build_metrics_filter_sql(
@@ -34,7 +101,11 @@ def _build_metrics_filter_sql(
     wan: str | None = None,
     granularity: str | None = None,
 ) -> tuple[str, list]:
-    """Build the shared WHERE clause and parameters for metrics queries."""
+    """Build the shared WHERE clause and parameters for metrics table queries.
+
+    Frozen cold-tier days are not part of this source; callers decode them
+    in Python (_iter_cold_rows(), _count_cold_rows()) and combine the results.
+    """
     sql = """
         FROM metrics
         WHERE 1=1
@@ -65,14 +136,25 @@ def _build_metrics_filter_sql(
     return sql, params
 
 
-def _available_tier_query_sql(filtered_where_sql: str) -> tuple[str, str]:
+def _available_tier_query_sql(
+    filtered_where_sql: str, cold_start_count: int = 0
+) -> tuple[str, str]:
     """Build a mixed-tier query from observed per-series coverage.
 
     Retention cutoffs are intentionally not duplicated here. Maintenance is
     asynchronous and bucket-aligned, so nominal ages can hide source rows
     before their aggregate exists. The filtered rows are scanned once to find
     each tier's observed start for a WAN/metric/canonical-label series.
+
+    cold_start_count adds that many (wan_name, metric_name, series_labels,
+    timestamp) parameters after the filter's: the first in-range frozen 5m
+    sample of each series (_cold_tier_starts()), so frozen days count
+    towards the 5m start without being expanded in SQL.
     """
+    cold_starts_sql = ""
+    if cold_start_count:
+        cold_values = ", ".join(["(?, ?, ?, '5m', ?)"] * cold_start_count)
+        cold_starts_sql = f" UNION ALL VALUES {cold_values}"
     cte_sql = f"""
         WITH filtered_metrics AS (
             SELECT
@@ -80,6 +162,11 @@ def _available_tier_query_sql(filtered_where_sql: str) -> tuple[str, str]:
                 canonical_series_labels(metric_name, labels) AS series_labels
             {filtered_where_sql}
         ),
+        series_samples AS (
+            SELECT wan_name, metric_name, series_labels, granularity, timestamp
+            FROM filtered_metrics
+            {cold_starts_sql}
+        ),
         tier_starts AS (
             SELECT
                 wan_name,
@@ -88,7 +175,7 @@ def _available_tier_query_sql(filtered_where_sql: str) -> tuple[str, str]:
                 MIN(CASE WHEN granularity = 'raw' THEN timestamp END) AS raw_start,
                 MIN(CASE WHEN granularity = '1m' THEN timestamp END) AS one_minute_start,
                 MIN(CASE WHEN granularity = '5m' THEN timestamp END) AS five_minute_start
-            FROM filtered_metrics
+            FROM series_samples
             GROUP BY wan_name, metric_name, series_labels
         )
     """
@@ -169,39 +256,42 @@ def query_metrics(
 
     try:
         # Open read-only connection
-        conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
-        conn.row_factory = sqlite3.Row
-        _register_reader_functions(conn)
+        conn = acquire_read_connection(db_path)
     except sqlite3.OperationalError as e:
         logger.warning("Failed to open database: %s", e)
         return []
 
     try:
         # Build query with optional filters
-        where_sql, params = _build_metrics_filter_sql(
-            start_ts=start_ts,
-            end_ts=end_ts,
-            metrics=metrics,
-            wan=wan,
-            granularity=granularity,
-        )
+        filters = (start_ts, end_ts, metrics, wan, granularity)
+        where_sql, params = _build_metrics_filter_sql(*filters)
+        include_cold = _has_cold_rows(conn, *filters)
+        tier_starts = None
         if use_observed_tiers:
             if granularity is not None:
                 raise ValueError("granularity and use_observed_tiers are mutually exclusive")
-            cte_sql, available_from_sql = _available_tier_query_sql(where_sql)
+            cold_starts = []
+            if include_cold:
+                cold_starts = _cold_tier_starts(conn, start_ts, end_ts, metrics, wan)
+                tier_starts = _observed_tier_starts(conn, where_sql, params, cold_starts)
+            cte_sql, available_from_sql = _available_tier_query_sql(where_sql, len(cold_starts))
+            params.extend(value for start in cold_starts for value in start)
             sql = (
-                cte_sql + " SELECT metrics.timestamp, metrics.wan_name, metrics.metric_name, "
-                "metrics.value, metrics.labels, metrics.granularity "
+                cte_sql + " SELECT metrics.id, metrics.timestamp, metrics.wan_name, "
+                "metrics.metric_name, metrics.value, metrics.labels, metrics.granularity "
                 + available_from_sql
                 + " ORDER BY metrics.timestamp DESC, metrics.granularity ASC, metrics.id DESC"
             )
         else:
             sql = (
-                "SELECT timestamp, wan_name, metric_name, value, labels, granularity "
+                "SELECT id, timestamp, wan_name, metric_name, value, labels, granularity "
                 + where_sql
                 + " ORDER BY timestamp DESC, granularity ASC, id DESC"
             )
 
+        if include_cold:
+            return _merge_cold_rows(conn, sql, params, filters, tier_starts, limit, offset)
+
         if limit is not None:
             sql += " LIMIT ?"
             params.append(limit)
@@ -213,15 +303,317 @@ def query_metrics(
             params.append(offset)
 
         cursor = conn.execute(sql, params)
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+        return [dict(zip(METRIC_ROW_FIELDS, row[1:], strict=True)) for row in cursor]
 
     except sqlite3.OperationalError as e:
         # Table might not exist in empty database
         logger.debug("Query failed: %s", e)
         return []
     finally:
-        conn.close()
+        release_read_connection(conn)
+
+
+def _newest_first_key(row: tuple) -> tuple:
+    """query_metrics() order for (id, *METRIC_ROW_FIELDS) rows."""
+    return -row[1], row[6], -row[0]
+
+
+def _merge_cold_rows(
+    conn: sqlite3.Connection,
+    hot_sql: str,
+    params: list,
+    filters: tuple,
+    tier_starts: dict | None,
+    limit: int | None,
+    offset: int,
+) -> list[dict]:
+    """Merge metrics table rows with decoded cold-tier days, newest first.
+
+    The hot query is limited to offset + limit rows, and frozen days are
+    decoded newest day first only until the merge has produced enough rows.
+    """
+    wanted = None if limit is None else offset + limit
+    if wanted is not None:
+        hot_sql += " LIMIT ?"
+        params = [*params, wanted]
+    hot_rows = conn.execute(hot_sql, params)
+    cold_rows: Iterator[tuple] = _iter_cold_rows(
+        conn, *filters, newest_first=True, key=_newest_first_key
+    )
+    if tier_starts is not None:
+        cold_rows = (row for row in cold_rows if _in_observed_tiers(row, tier_starts))
+    try:
+        merged = heapq.merge(hot_rows, cold_rows, key=_newest_first_key)
+        return [
+            dict(zip(METRIC_ROW_FIELDS, row[1:], strict=True))
+            for row in islice(merged, offset, wanted)
+        ]
+    finally:
+        hot_rows.close()
+
+
+def _observed_tier_starts(
+    conn: sqlite3.Connection,
+    where_sql: str,
+    params: list,
+    cold_starts: list[tuple[str, str, str | None, int]] | None = None,
+) -> dict[tuple, tuple[int | None, ...]]:
+    """Observed raw/1m/5m start per series, keyed by (wan, metric, series labels)."""
+    cold_starts = cold_starts or []
+    cte_sql, _ = _available_tier_query_sql(where_sql, len(cold_starts))
+    rows = conn.execute(
+        cte_sql + " SELECT wan_name, metric_name, series_labels, raw_start, one_minute_start, "
+        "five_minute_start FROM tier_starts",
+        [*params, *(value for start in cold_starts for value in start)],
+    )
+    return {(row[0], row[1], row[2]): tuple(row[3:]) for row in rows}
+
+
+def _in_observed_tier(granularity: str | None, timestamp: int, starts: tuple) -> bool:
+    """Python form of the tier predicate in _available_tier_query_sql()."""
+    if granularity not in _TIER_ORDER:
+        return False
+    finer_starts = starts[: _TIER_ORDER.index(granularity)]
+    return all(start is None or timestamp < start for start in finer_starts)
+
+
+def _in_observed_tiers(row: tuple, tier_starts: dict[tuple, tuple[int | None, ...]]) -> bool:
+    """_in_observed_tier() for an (id, *METRIC_ROW_FIELDS) row."""
+    _, timestamp, wan_name, metric_name, _, labels, granularity = row
+    series = (wan_name, metric_name, canonicalize_series_labels(metric_name, labels))
+    return _in_observed_tier(granularity, timestamp, tier_starts.get(series, _NO_TIER_STARTS))
+
+
+def _cold_blob_samples(conn: sqlite3.Connection, blob_id: int, day_start: int) -> list:
+    """Decode one metrics_cold blob by id."""
+    codec, payload = conn.execute(
+        "SELECT codec, payload FROM metrics_cold WHERE id = ?", (blob_id,)
+    ).fetchone()
+    return decode_cold_day(codec, day_start, payload)
+
+
+def _cold_tier_starts(
+    conn: sqlite3.Connection,
+    start_ts: int | None,
+    end_ts: int | None,
+    metrics: list[str] | None,
+    wan: str | None,
+) -> list[tuple[str, str, str | None, int]]:
+    """First in-range frozen 5m sample per (wan, metric, series labels).
+
+    Blob metadata is read oldest day first; a blob's first_ts is used as is
+    unless the blob straddles start_ts, in which case only that blob is
+    decoded.
+    """
+    blob_sql, params = _cold_blob_filter_sql(start_ts, end_ts, metrics, wan, "5m")
+    blobs = conn.execute(
+        "SELECT id, day_start, wan_name, metric_name, labels, first_ts "
+        f"FROM metrics_cold AS cold WHERE 1=1 {blob_sql} ORDER BY day_start",
+        params,
+    ).fetchall()
+    starts: dict[tuple[str, str, str | None], int] = {}
+    for blob_id, day_start, wan_name, metric_name, labels, first_ts in blobs:
+        series = (wan_name, metric_name, canonicalize_series_labels(metric_name, labels or None))
+        if series in starts and starts[series] < day_start:
+            continue
+        first: int | None = first_ts
+        if start_ts is not None and first_ts < start_ts:
+            first = next(
+                (
+                    timestamp
+                    for timestamp, _ in _cold_blob_samples(conn, blob_id, day_start)
+                    if timestamp >= start_ts and (end_ts is None or timestamp <= end_ts)
+                ),
+                None,
+            )
+        if first is not None and (series not in starts or first < starts[series]):
+            starts[series] = first
+    return [(*series, first) for series, first in starts.items()]
+
+
+def _count_cold_rows(
+    conn: sqlite3.Connection,
+    start_ts: int | None,
+    end_ts: int | None,
+    metrics: list[str] | None,
+    wan: str | None,
+    granularity: str | None,
+    tier_starts: dict[tuple, tuple[int | None, ...]] | None = None,
+) -> int:
+    """Count frozen samples matching the filter (and observed tiers).
+
+    Blobs entirely inside the counted range contribute their stored count;
+    only blobs straddling a bound are decoded.
+    """
+    blob_sql, params = _cold_blob_filter_sql(start_ts, end_ts, metrics, wan, granularity)
+    blobs = conn.execute(
+        "SELECT id, day_start, wan_name, metric_name, labels, granularity, first_ts, last_ts, "
+        f"count FROM metrics_cold AS cold WHERE 1=1 {blob_sql}",
+        params,
+    ).fetchall()
+    total = 0
+    for blob_id, day_start, wan_name, metric_name, labels, tier, first_ts, last_ts, count in blobs:
+        high = end_ts
+        if tier_starts is not None:
+            series = (
+                wan_name,
+                metric_name,
+                canonicalize_series_labels(metric_name, labels or None),
+            )
+            finer_starts = tier_starts.get(series, _NO_TIER_STARTS)[: _TIER_ORDER.index(tier)]
+            bound = min((start for start in finer_starts if start is not None), default=None)
+            if bound is not None:
+                high = bound - 1 if high is None else min(high, bound - 1)
+        if high is not None and first_ts > high:
+            continue
+        if (start_ts is None or first_ts >= start_ts) and (high is None or last_ts <= high):
+            total += count
+            continue
+        total += sum(
+            1
+            for timestamp, _ in _cold_blob_samples(conn, blob_id, day_start)
+            if (start_ts is None or timestamp >= start_ts) and (high is None or timestamp <= high)
+        )
+    return total
+
+
+def _iter_hot_rows(
+    conn: sqlite3.Connection, where_sql: str, params: list, newest_first: bool, batch_size: int
+) -> Iterator[tuple]:
+    """Keyset-paginate metrics table rows as (id, *METRIC_ROW_FIELDS) tuples."""
+    direction, after = ("DESC", "<") if newest_first else ("ASC", ">")
+    select_sql = f"SELECT id, {', '.join(METRIC_ROW_FIELDS)} {where_sql}"
+    order_sql = f" ORDER BY timestamp {direction}, id {direction} LIMIT ?"
+    page_sql = select_sql + order_sql
+    next_page_sql = select_sql + f" AND (timestamp, id) {after} (?, ?)" + order_sql
+
+    page = conn.execute(page_sql, [*params, batch_size]).fetchall()
+    while page:
+        yield from page
+        if len(page) < batch_size:
+            break
+        last_id, last_ts = page[-1][0], page[-1][1]
+        page = conn.execute(next_page_sql, [*params, last_ts, last_id, batch_size]).fetchall()
+
+
+def _iter_cold_rows(
+    conn: sqlite3.Connection,
+    start_ts: int | None,
+    end_ts: int | None,
+    metrics: list[str] | None,
+    wan: str | None,
+    granularity: str | None,
+    *,
+    newest_first: bool,
+    key: Callable[[tuple], Any] | None = None,
+) -> Iterator[tuple]:
+    """Expand cold-tier blobs one day at a time, in the same order as _iter_hot_rows().
+
+    Rows are (id, *METRIC_ROW_FIELDS) with negative ids (see COLD_ID_STRIDE).
+    Days are visited newest or oldest first; each day's rows are sorted by
+    (timestamp, id), or ascending by key when given. Only the days a
+    consumer actually reaches are decoded.
+    """
+    blob_sql, params = _cold_blob_filter_sql(start_ts, end_ts, metrics, wan, granularity)
+    direction = "DESC" if newest_first else "ASC"
+    days = conn.execute(
+        f"SELECT DISTINCT day_start FROM metrics_cold AS cold WHERE 1=1 {blob_sql} "
+        f"ORDER BY day_start {direction}",
+        params,
+    ).fetchall()
+    for (day_start,) in days:
+        blobs = conn.execute(
+            "SELECT id, wan_name, metric_name, labels, granularity, codec, payload "
+            f"FROM metrics_cold AS cold WHERE day_start = ? {blob_sql}",
+            [day_start, *params],
+        ).fetchall()
+        day_rows = []
+        for blob_id, wan_name, metric_name, labels, tier, codec, payload in blobs:
+            samples = decode_cold_day(codec, day_start, payload)
+            for index, (timestamp, value) in enumerate(samples):
+                if start_ts is not None and timestamp < start_ts:
+                    continue
+                if end_ts is not None and timestamp > end_ts:
+                    continue
+                row_id = -(blob_id * COLD_ID_STRIDE + index + 1)
+                day_rows.append(
+                    (row_id, timestamp, wan_name, metric_name, value, labels or None, tier)
+                )
+        if key is not None:
+            day_rows.sort(key=key)
+        else:
+            day_rows.sort(key=lambda row: (row[1], row[0]), reverse=newest_first)
+        yield from day_rows
+
+
+def iter_metrics(
+    db_path: Path | str = DEFAULT_DB_PATH,
+    start_ts: int | None = None,
+    end_ts: int | None = None,
+    metrics: list[str] | None = None,
+    wan: str | None = None,
+    granularity: str | None = None,
+    *,
+    use_observed_tiers: bool = False,
+    newest_first: bool = False,
+    batch_size: int = STREAM_BATCH_SIZE,
+) -> Iterator[dict]:
+    """Stream metrics rows in (timestamp, id) order without materializing them.
+
+    Rows are fetched in pages of batch_size using keyset pagination on
+    (timestamp, id): each page is a short statement resuming after the last
+    row seen, so memory stays flat for any range and no read transaction is
+    held open between pages (WAL checkpoints proceed during a long export).
+    With use_observed_tiers, per-series tier starts are computed once up
+    front and each page is filtered like query_metrics(use_observed_tiers=True).
+    Frozen cold-tier days are decoded one day at a time and merged in order.
+
+    Yields:
+        Dicts with the same keys as query_metrics(). A missing or unopenable
+        database yields nothing.
+    """
+    if use_observed_tiers and granularity is not None:
+        raise ValueError("granularity and use_observed_tiers are mutually exclusive")
+    db_path = Path(db_path)
+    if not db_path.exists():
+        logger.debug("Database not found: %s", db_path)
+        return
+
+    try:
+        conn = acquire_read_connection(db_path)
+    except sqlite3.OperationalError as e:
+        logger.warning("Failed to open database: %s", e)
+        return
+
+    try:
+        filters = (start_ts, end_ts, metrics, wan, granularity)
+        where_sql, params = _build_metrics_filter_sql(*filters)
+        include_cold = _has_cold_rows(conn, *filters)
+        tier_starts = None
+        if use_observed_tiers:
+            cold_starts = []
+            if include_cold:
+                cold_starts = _cold_tier_starts(conn, start_ts, end_ts, metrics, wan)
+            tier_starts = _observed_tier_starts(conn, where_sql, params, cold_starts)
+
+        rows = _iter_hot_rows(conn, where_sql, params, newest_first, batch_size)
+        if include_cold:
+            rows = heapq.merge(
+                rows,
+                _iter_cold_rows(conn, *filters, newest_first=newest_first),
+                key=lambda row: (row[1], row[0]),
+                reverse=newest_first,
+            )
+        for row in rows:
+            if tier_starts is not None and not _in_observed_tiers(row, tier_starts):
+                continue
+            yield dict(zip(METRIC_ROW_FIELDS, row[1:], strict=True))
+
+    except sqlite3.OperationalError as e:
+        # Table might not exist in empty database
+        logger.debug("Query failed: %s", e)
+    finally:
+        release_read_connection(conn)
 
 
 def query_alerts(
@@ -256,7 +648,7 @@ def query_alerts(
 
     try:
         # Open read-only connection
-        conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        conn = acquire_read_connection(db_path)
         conn.row_factory = sqlite3.Row
     except sqlite3.OperationalError as e:
         logger.warning("Failed to open database: %s", e)
@@ -310,7 +702,7 @@ def query_alerts(
         logger.debug("Query failed: %s", e)
         return []
     finally:
-        conn.close()
+        release_read_connection(conn)
 
 
 def query_benchmarks(
@@ -344,7 +736,7 @@ def query_benchmarks(
         return []
 
     try:
-        conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        conn = acquire_read_connection(db_path)
         conn.row_factory = sqlite3.Row
     except sqlite3.OperationalError as e:
         logger.warning("Failed to open database: %s", e)
@@ -388,7 +780,7 @@ def query_benchmarks(
         logger.debug("Query failed: %s", e)
         return []
     finally:
-        conn.close()
+        release_read_connection(conn)
 
 
 def query_tuning_params(
@@ -423,7 +815,7 @@ def query_tuning_params(
 
     try:
         # Open read-only connection
-        conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        conn = acquire_read_connection(db_path)
         conn.row_factory = sqlite3.Row
     except sqlite3.OperationalError as e:
         logger.warning("Failed to open database: %s", e)
@@ -464,7 +856,174 @@ def query_tuning_params(
         logger.debug("Query failed: %s", e)
         return []
     finally:
-        conn.close()
+        release_read_connection(conn)
+
+
+def _iter_unsketched_samples(
+    conn: sqlite3.Connection,
+    start_ts: int | None,
+    end_ts: int | None,
+    metrics: list[str] | None,
+    wan: str | None,
+    have_sketches: bool,
+) -> Iterator[tuple[str, str, float]]:
+    """Yield (wan_name, metric_name, value) for samples no stored sketch covers.
+
+    Raw rows are never sketched (the downsampler sketches them as it deletes
+    them). An aggregate tier only lacks sketches for buckets older than the
+    first sketch of its series in that tier, i.e. rows written before
+    metric_sketches existed. Each read carries its granularity and the
+    metric/WAN filters, so the sketched bulk of the aggregate tiers is never
+    scanned.
+    """
+
+    def rows(extra_sql: str, extra_params: list, granularity: str | None = None) -> Iterator:
+        where_sql, params = _build_metrics_filter_sql(
+            start_ts=start_ts, end_ts=end_ts, metrics=metrics, wan=wan, granularity=granularity
+        )
+        sql = "SELECT wan_name, metric_name, value, timestamp " + where_sql + extra_sql
+        return conn.execute(sql, params + extra_params)
+
+    if not have_sketches:
+        for wan_name, metric_name, value, _ in rows("", []):
+            yield wan_name, metric_name, value
+        return
+
+    for wan_name, metric_name, value, _ in rows("", [], "raw"):
+        yield wan_name, metric_name, value
+
+    sql = """
+        SELECT granularity, wan_name, metric_name, MIN(bucket_start)
+        FROM metric_sketches
+        GROUP BY wan_name, metric_name, granularity
+    """
+    first_buckets: dict[str, dict[tuple[str, str], int]] = {}
+    for granularity, wan_name, metric_name, first_bucket in conn.execute(sql):
+        first_buckets.setdefault(granularity, {})[(wan_name, metric_name)] = first_bucket
+
+    for granularity in _TIER_ORDER[1:]:
+        sketched = first_buckets.get(granularity, {})
+        for (wan_name, metric_name), first_bucket in sketched.items():
+            if wan and wan_name != wan or metrics and metric_name not in metrics:
+                continue
+            if start_ts is not None and first_bucket <= start_ts:
+                continue
+            series_rows = rows(
+                " AND wan_name = ? AND metric_name = ? AND timestamp < ?",
+                [wan_name, metric_name, first_bucket],
+                granularity,
+            )
+            for _, _, value, _ in series_rows:
+                yield wan_name, metric_name, value
+
+        # Series with no sketch in this tier predate the tier's first sketch
+        # (each downsampling pass sketches every series it rolls up)
+        if sketched:
+            extra_sql, extra_params = " AND timestamp < ?", [min(sketched.values())]
+        else:
+            extra_sql, extra_params = "", []
+        for wan_name, metric_name, value, _ in rows(extra_sql, extra_params, granularity):
+            if (wan_name, metric_name) not in sketched:
+                yield wan_name, metric_name, value
+
+
+def query_metric_sketches(
+    db_path: Path | str = DEFAULT_DB_PATH,
+    start_ts: int | None = None,
+    end_ts: int | None = None,
+    metrics: list[str] | None = None,
+    wan: str | None = None,
+) -> list[dict]:
+    """Merge stored summary sketches per WAN/metric over a time range.
+
+    Summaries come from the per-bucket sketches maintained during
+    downsampling, so a multi-day range reads a few thousand sketch rows
+    instead of every sample. The not-yet-downsampled raw tail, and any
+    aggregate rows older than the first sketch of their series, are folded
+    in as individual samples. Sketch buckets are included when their start
+    falls inside the range, so range edges are bucket-aligned (up to 1h for
+    the oldest tier); use compute_summary() over query_metrics() rows when
+    exact figures matter.
+
+    Opens a read-only connection to prevent accidental writes.
+
+    Args:
+        db_path: Path to SQLite database file
+        start_ts: Start timestamp (inclusive), Unix seconds
+        end_ts: End timestamp (inclusive), Unix seconds
+        metrics: List of metric names to filter (exact match)
+        wan: WAN name to filter (e.g., "spectrum", "att")
+
+    Returns:
+        List of dicts with keys: wan_name, metric_name, sketch (QuantileSketch),
+        one per WAN/metric with data. Labels are pooled.
+        Returns empty list if database doesn't exist or no data matches.
+    """
+    db_path = Path(db_path)
+
+    if not db_path.exists():
+        logger.debug("Database not found: %s", db_path)
+        return []
+
+    try:
+        conn = acquire_read_connection(db_path)
+    except sqlite3.OperationalError as e:
+        logger.warning("Failed to open database: %s", e)
+        return []
+
+    try:
+        merged: dict[tuple[str, str], QuantileSketch] = {}
+
+        def series(wan_name: str, metric_name: str) -> QuantileSketch:
+            sketch = merged.get((wan_name, metric_name))
+            if sketch is None:
+                sketch = merged[(wan_name, metric_name)] = QuantileSketch()
+            return sketch
+
+        have_sketches = (
+            conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'metric_sketches'"
+            ).fetchone()
+            is not None
+        )
+        if have_sketches:
+            sql = """
+                SELECT wan_name, metric_name, count, sum, min, max, sketch
+                FROM metric_sketches
+                WHERE 1=1
+            """
+            params: list = []
+            if start_ts is not None:
+                sql += " AND bucket_start >= ?"
+                params.append(start_ts)
+            if end_ts is not None:
+                sql += " AND bucket_start <= ?"
+                params.append(end_ts)
+            if metrics:
+                placeholders = ",".join("?" * len(metrics))
+                sql += f" AND metric_name IN ({placeholders})"
+                params.extend(metrics)
+            if wan:
+                sql += " AND wan_name = ?"
+                params.append(wan)
+            for wan_name, metric_name, *row in conn.execute(sql, params).fetchall():
+                series(wan_name, metric_name).merge(QuantileSketch.from_row(*row))
+
+        samples = _iter_unsketched_samples(conn, start_ts, end_ts, metrics, wan, have_sketches)
+        for wan_name, metric_name, value in samples:
+            series(wan_name, metric_name).add(value)
+
+        return [
+            {"wan_name": wan_name, "metric_name": metric_name, "sketch": sketch}
+            for (wan_name, metric_name), sketch in sorted(merged.items())
+            if sketch.count
+        ]
+
+    except sqlite3.OperationalError as e:
+        logger.debug("Query failed: %s", e)
+        return []
+    finally:
+        release_read_connection(conn)
 
 
 def compute_summary(values: list[float]) -> dict:
@@ -572,31 +1131,35 @@ def count_metrics(
         return 0
 
     try:
-        conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
-        _register_reader_functions(conn)
+        conn = acquire_read_connection(db_path)
     except sqlite3.OperationalError as e:
         logger.warning("Failed to open database: %s", e)
         return 0
 
     try:
-        where_sql, params = _build_metrics_filter_sql(
-            start_ts=start_ts,
-            end_ts=end_ts,
-            metrics=metrics,
-            wan=wan,
-            granularity=granularity,
-        )
+        filters = (start_ts, end_ts, metrics, wan, granularity)
+        where_sql, params = _build_metrics_filter_sql(*filters)
+        include_cold = _has_cold_rows(conn, *filters)
+        tier_starts = None
         if use_observed_tiers:
             if granularity is not None:
                 raise ValueError("granularity and use_observed_tiers are mutually exclusive")
-            cte_sql, available_from_sql = _available_tier_query_sql(where_sql)
+            cold_starts = []
+            if include_cold:
+                cold_starts = _cold_tier_starts(conn, start_ts, end_ts, metrics, wan)
+                tier_starts = _observed_tier_starts(conn, where_sql, params, cold_starts)
+            cte_sql, available_from_sql = _available_tier_query_sql(where_sql, len(cold_starts))
+            params.extend(value for start in cold_starts for value in start)
             sql = cte_sql + " SELECT COUNT(*) " + available_from_sql
         else:
             sql = "SELECT COUNT(*) " + where_sql
         row = conn.execute(sql, params).fetchone()
-        return int(row[0]) if row is not None else 0
+        total = int(row[0]) if row is not None else 0
+        if include_cold:
+            total += _count_cold_rows(conn, *filters, tier_starts=tier_starts)
+        return total
     except sqlite3.OperationalError as e:
         logger.debug("Count query failed: %s", e)
         return 0
     finally:
-        conn.close()
+        release_read_connection(conn)
@@ -11,6 +11,8 @@ import time
 from collections.abc import Callable, Mapping
 from typing import Any
 
+from wanctl.storage.cold_tier import expire_cold_days
+
 logger = logging.getLogger(__name__)
 
 # Default retention period in days
@@ -60,6 +62,21 @@ def cleanup_old_metrics(
     return _cleanup_flat(conn, retention_days, batch_size, watchdog_fn, max_seconds)
 
 
+def _cleanup_sketches(conn: sqlite3.Connection, tier_cutoffs: Mapping[str, int]) -> None:
+    """Expire summary sketches together with the metrics tier they mirror."""
+    table = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'metric_sketches'"
+    ).fetchone()
+    if table is None:
+        return
+    for granularity, cutoff in tier_cutoffs.items():
+        conn.execute(
+            "DELETE FROM metric_sketches WHERE granularity = ? AND bucket_start < ?",
+            (granularity, cutoff),
+        )
+    conn.commit()
+
+
 def _cleanup_flat(
     conn: sqlite3.Connection,
     retention_days: int,
@@ -114,6 +131,9 @@ def _cleanup_flat(
         if rows_deleted < batch_size:
             break
 
+    _cleanup_sketches(conn, dict.fromkeys(("1m", "5m", "1h"), cutoff))
+    total_deleted += expire_cold_days(conn, dict.fromkeys(("5m", "1h"), cutoff))
+
     if total_deleted > 0:
         logger.info(
             "Retention cleanup: deleted %d metrics older than %d days",
@@ -184,6 +204,9 @@ def _cleanup_per_granularity(
             if rows_deleted < batch_size:
                 break
 
+    _cleanup_sketches(conn, tier_cutoffs)
+    total_deleted += expire_cold_days(conn, tier_cutoffs)
+
     if total_deleted > 0:
         logger.info(
             "Retention cleanup (per-granularity): deleted %d metrics total",
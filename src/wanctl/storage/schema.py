@@ -125,6 +125,63 @@ CREATE INDEX IF NOT EXISTS idx_benchmarks_wan
 """
 
 
+# Per-bucket summary sketches maintained by the downsampler. One row per
+# WAN/metric/bucket, pooled across labels; granularity follows the metrics
+# tiers (1m, 5m, 1h) and rolls up with them. See quantile_sketch.py.
+METRIC_SKETCHES_SCHEMA: str = """
+-- Summary sketches (count/sum/min/max + quantile buckets) per time bucket
+CREATE TABLE IF NOT EXISTS metric_sketches (
+    bucket_start INTEGER NOT NULL,
+    granularity TEXT NOT NULL,
+    wan_name TEXT NOT NULL,
+    metric_name TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    sum REAL NOT NULL,
+    min REAL NOT NULL,
+    max REAL NOT NULL,
+    sketch BLOB NOT NULL,
+    PRIMARY KEY (wan_name, metric_name, granularity, bucket_start)
+);
+
+-- Index for time-range summary queries across WANs and metrics
+CREATE INDEX IF NOT EXISTS idx_metric_sketches_time
+    ON metric_sketches(bucket_start);
+"""
+
+
+# Compressed per-day blobs for the 5m and 1h tiers (see storage/cold_tier.py).
+# One row per WAN/metric/labels/day; labels is '' for unlabeled series so the
+# unique key applies. first_ts/last_ts bound the samples for range pruning.
+METRICS_COLD_SCHEMA: str = """
+-- Cold tier: compressed (timestamp, value) samples per series and day
+CREATE TABLE IF NOT EXISTS metrics_cold (
+    id INTEGER PRIMARY KEY,
+    day_start INTEGER NOT NULL,
+    granularity TEXT NOT NULL,
+    wan_name TEXT NOT NULL,
+    metric_name TEXT NOT NULL,
+    labels TEXT NOT NULL DEFAULT '',
+    first_ts INTEGER NOT NULL,
+    last_ts INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    codec TEXT NOT NULL,
+    payload BLOB NOT NULL
+);
+
+-- One blob per series and day
+CREATE UNIQUE INDEX IF NOT EXISTS idx_cold_series_day
+    ON metrics_cold(wan_name, metric_name, granularity, labels, day_start);
+
+-- Index for time-range pruning and tier expiry
+CREATE INDEX IF NOT EXISTS idx_cold_granularity_time
+    ON metrics_cold(granularity, first_ts);
+
+-- Index for pruning reads to the days a range overlaps
+CREATE INDEX IF NOT EXISTS idx_cold_day
+    ON metrics_cold(day_start);
+"""
+
+
 REFLECTOR_EVENTS_SCHEMA: str = """
 -- Reflector quality events (deprioritization/recovery transitions)
 CREATE TABLE IF NOT EXISTS reflector_events (
@@ -209,6 +266,8 @@ def create_tables(conn: sqlite3.Connection) -> None:
         Uses IF NOT EXISTS so safe to call multiple times.
     """
     conn.executescript(METRICS_SCHEMA)
+    conn.executescript(METRIC_SKETCHES_SCHEMA)
+    conn.executescript(METRICS_COLD_SCHEMA)
     conn.executescript(ALERTS_SCHEMA)
     conn.executescript(BENCHMARKS_SCHEMA)
     conn.executescript(REFLECTOR_EVENTS_SCHEMA)
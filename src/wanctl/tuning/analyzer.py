@@ -9,6 +9,7 @@ import time
 from collections.abc import Callable
 
 from wanctl.storage.reader import query_metrics
+from wanctl.tuning.metric_window import MetricWindow
 from wanctl.tuning.models import SafetyBounds, TuningConfig, TuningResult
 
 logger = logging.getLogger(__name__)
@@ -21,10 +22,17 @@ def _query_wan_metrics(
     db_path: str,
     wan_name: str,
     lookback_hours: int,
+    window: MetricWindow | None = None,
 ) -> list[dict]:
-    """Query 1m-granularity metrics for a single WAN."""
+    """Query 1m-granularity metrics for a single WAN.
+
+    With a MetricWindow covering the lookback, rows come from the window's
+    cache (refreshed incrementally) instead of a full SQLite read.
+    """
     now_ts = int(time.time())
     start_ts = now_ts - (lookback_hours * 3600)
+    if window is not None and window.covers(start_ts, now_ts):
+        return window.rows(start_ts=start_ts)
     return query_metrics(
         db_path=db_path,
         start_ts=start_ts,
@@ -37,9 +45,12 @@ def _check_warmup(
     metrics_data: list[dict],
     warmup_hours: int,
     wan_name: str,
+    now_ts: int | None = None,
 ) -> bool:
     """Check if enough data exists for tuning analysis.
 
+    ``now_ts`` defaults to the current time; backtests pass the window end.
+
     Returns True if sufficient data, False otherwise.
     """
     if not metrics_data:
@@ -52,7 +63,8 @@ def _check_warmup(
         return False
 
     earliest = min(timestamps)
-    now_ts = int(time.time())
+    if now_ts is None:
+        now_ts = int(time.time())
     data_hours = (now_ts - earliest) / 3600.0
 
     if data_hours < warmup_hours:
@@ -81,6 +93,7 @@ def run_tuning_analysis(
     tuning_config: TuningConfig,
     current_params: dict[str, float],
     strategies: list[tuple[str, StrategyFn]],
+    metric_window: MetricWindow | None = None,
 ) -> list[TuningResult]:
     """Run tuning analysis for a single WAN.
 
@@ -90,6 +103,7 @@ def run_tuning_analysis(
         tuning_config: Validated tuning configuration
         current_params: Current parameter values {name: value}
         strategies: List of (parameter_name, strategy_fn) tuples
+        metric_window: Optional shared MetricWindow for this WAN
 
     Returns:
         List of TuningResult for parameters that should change.
@@ -99,10 +113,37 @@ def run_tuning_analysis(
         return []
 
     # Query metrics for this WAN
-    metrics_data = _query_wan_metrics(db_path, wan_name, tuning_config.lookback_hours)
+    metrics_data = _query_wan_metrics(
+        db_path, wan_name, tuning_config.lookback_hours, metric_window
+    )
+    return evaluate_strategies(metrics_data, wan_name, tuning_config, current_params, strategies)
+
 
-    # Check warmup
-    if not _check_warmup(metrics_data, tuning_config.warmup_hours, wan_name):
+def evaluate_strategies(
+    metrics_data: list[dict],
+    wan_name: str,
+    tuning_config: TuningConfig,
+    current_params: dict[str, float],
+    strategies: list[tuple[str, StrategyFn]],
+    now_ts: int | None = None,
+) -> list[TuningResult]:
+    """Run strategies over already-queried metrics (warmup gate included).
+
+    Shared by run_tuning_analysis() and the offline backtest, which replays
+    historical windows with ``now_ts`` set to each window's end.
+
+    Args:
+        metrics_data: 1m metric rows for one WAN
+        wan_name: WAN identifier
+        tuning_config: Validated tuning configuration
+        current_params: Current parameter values {name: value}
+        strategies: List of (parameter_name, strategy_fn) tuples
+        now_ts: Evaluation time for the warmup check (default: now)
+
+    Returns:
+        List of confidence-scaled TuningResult.
+    """
+    if not _check_warmup(metrics_data, tuning_config.warmup_hours, wan_name, now_ts):
         return []
 
     data_hours = _compute_data_hours(metrics_data)
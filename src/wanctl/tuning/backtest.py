@@ -0,0 +1,810 @@
+"""Offline backtest of tuning strategies against metrics history.
+
+wanctl-tuning-backtest replays the adaptive tuner over historical 1m
+metrics. Each WAN's history is cut into sliding windows of ``lookback_hours``
+that end one tuning cadence apart, which is the view the daemon would have had
+at each tuning pass. The daemon's rules are replayed as-is:
+
+- one layer per window, round-robin (signal, ewma, threshold, advanced,
+  response);
+- warmup gating against the window end instead of the wall clock;
+- min_confidence, safety-bounds and max_step_pct clamping through
+  apply_tuning_results();
+- the oscillation check before each response layer, which locks the response
+  parameters for OSCILLATION_LOCKOUT_SEC of history.
+
+By default, every applied change feeds the next window (closed loop), so each
+WAN series is one sequential replay and series run in parallel. With
+``--open-loop``, every strategy is evaluated on every window at the configured
+values. Windows are then independent and are spread across the process pool.
+
+Strategy output is cached per window under a key built from the window's
+content hash, the parameter values and bounds evaluated, and a digest of the
+tuning code. A rerun after new data arrives only evaluates the new windows,
+and a strategy change invalidates the whole cache.
+
+Usage:
+    wanctl-tuning-backtest --config /etc/wanctl/spectrum.yaml
+    wanctl-tuning-backtest --config /etc/wanctl/spectrum.yaml --days 90 --jobs 8
+    wanctl-tuning-backtest --config spectrum.yaml --db metrics-spectrum.db --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import hashlib
+import json
+import logging
+import math
+import os
+import sqlite3
+import sys
+import time
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from itertools import groupby
+from pathlib import Path
+from typing import Any
+
+from tabulate import tabulate
+
+from wanctl.state_utils import atomic_write_json, safe_json_load_file
+from wanctl.tuning.analyzer import evaluate_strategies
+from wanctl.tuning.applier import apply_tuning_results
+from wanctl.tuning.layers import LAYER_NAMES, build_tuning_layers
+from wanctl.tuning.metric_window import MetricWindow
+from wanctl.tuning.models import TuningConfig, TuningResult
+from wanctl.tuning.strategies.response import (
+    DEFAULT_OSCILLATION_THRESHOLD,
+    OSCILLATION_LOCKOUT_SEC,
+    RESPONSE_PARAMS,
+    check_oscillation_lockout,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path("~/.cache/wanctl/tuning-backtest")
+
+# Bump when the cached payload layout changes.
+CACHE_FORMAT_VERSION = 1
+
+# A parameter counts as converged after this many evaluations without a change.
+DEFAULT_SETTLE_EVALUATIONS = 3
+
+_RESPONSE_LAYER = len(LAYER_NAMES) - 1
+
+
+# =============================================================================
+# WINDOWS AND CACHE KEYS
+# =============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class BacktestWindow:
+    """One simulated tuning pass: metrics in [start_ts, end_ts].
+
+    Attributes:
+        index: Tuning pass number since the start of history (drives rotation)
+        start_ts: Window start (end_ts - lookback)
+        end_ts: Simulated "now" of the tuning pass
+    """
+
+    index: int
+    start_ts: int
+    end_ts: int
+
+
+def build_windows(
+    first_ts: int,
+    last_ts: int,
+    lookback_sec: int,
+    step_sec: int,
+    warmup_sec: int = 0,
+) -> list[BacktestWindow]:
+    """Sliding windows ending every ``step_sec`` from the start of history.
+
+    Passes that would end before ``warmup_sec`` of data exists are skipped,
+    but still advance ``index`` so layer rotation matches a daemon started
+    when the history began.
+    """
+    if step_sec <= 0 or lookback_sec <= 0:
+        raise ValueError("lookback and step must be positive")
+    first_index = max(1, math.ceil(warmup_sec / step_sec))
+    windows = []
+    index = first_index
+    end_ts = first_ts + index * step_sec
+    while end_ts <= last_ts:
+        windows.append(BacktestWindow(index, end_ts - lookback_sec, end_ts))
+        index += 1
+        end_ts += step_sec
+    return windows
+
+
+# Rows are hashed in fixed wall-clock buckets so each full bucket is hashed
+# once per replay, however many overlapping windows contain it.
+DIGEST_BUCKET_SEC = 3600
+
+
+def rows_digest(rows: Iterable[dict]) -> str:
+    """Content hash of metric rows (order-sensitive, as queried)."""
+    h = hashlib.blake2b(digest_size=16)
+    for row in rows:
+        h.update(
+            f"{row['timestamp']}\x1f{row['metric_name']}\x1f{row['value']!r}"
+            f"\x1f{row.get('labels') or ''}\n".encode()
+        )
+    return h.hexdigest()
+
+
+def tuning_code_digest() -> str:
+    """Digest of the tuning sources whose output the cache stores."""
+    from wanctl.tuning import analyzer, layers, models, strategies
+
+    paths = sorted(Path(strategies.__file__).parent.glob("*.py"))
+    paths += [Path(module.__file__) for module in (analyzer, layers, models)]  # type: ignore[arg-type]
+    h = hashlib.blake2b(digest_size=16)
+    for path in paths:
+        h.update(path.name.encode())
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+def _evaluation_key(
+    digest: str,
+    code_digest: str,
+    window: BacktestWindow,
+    wan_name: str,
+    param_names: Sequence[str],
+    params: dict[str, float],
+    tuning_config: TuningConfig,
+    oscillation_threshold: float | None,
+) -> str:
+    bounds = tuning_config.bounds
+    material = {
+        "format": CACHE_FORMAT_VERSION,
+        "code": code_digest,
+        "window": digest,
+        "end_ts": window.end_ts,
+        "wan": wan_name,
+        "warmup_hours": tuning_config.warmup_hours,
+        "params": {p: params.get(p) for p in param_names},
+        "bounds": {p: asdict(bounds[p]) if p in bounds else None for p in param_names},
+        "oscillation_threshold": oscillation_threshold,
+    }
+    encoded = json.dumps(material, sort_keys=True, separators=(",", ":")).encode()
+    return hashlib.blake2b(encoded, digest_size=20).hexdigest()
+
+
+class BacktestCache:
+    """One JSON file per evaluation key under ``directory`` (None disables)."""
+
+    def __init__(self, directory: str | Path | None):
+        self.directory = Path(directory).expanduser() if directory is not None else None
+
+    def _path(self, key: str) -> Path:
+        assert self.directory is not None
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        if self.directory is None:
+            return None
+        path = self._path(key)
+        if not path.exists():
+            return None
+        payload = safe_json_load_file(path, logger=logger, error_context="backtest cache entry")
+        return payload if isinstance(payload, dict) else None
+
+    def put(self, key: str, payload: dict[str, Any]) -> None:
+        if self.directory is None:
+            return
+        try:
+            atomic_write_json(self._path(key), payload)
+        except OSError as e:
+            logger.debug("Backtest cache write failed for %s: %s", key, e)
+
+
+# =============================================================================
+# REPLAY (runs in worker processes)
+# =============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class SeriesTask:
+    """Windows of one WAN history to replay in a single worker.
+
+    Attributes:
+        closed_loop: Feed applied changes into later windows and rotate
+            layers like the daemon; otherwise run every layer per window at
+            ``params``
+    """
+
+    db_path: str
+    wan_name: str
+    windows: tuple[BacktestWindow, ...]
+    params: dict[str, float]
+    tuning_config: TuningConfig
+    oscillation_threshold: float = DEFAULT_OSCILLATION_THRESHOLD
+    closed_loop: bool = True
+    cache_dir: str | None = None
+    code_digest: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class WindowOutcome:
+    """What the tuner did in one window.
+
+    Attributes:
+        evaluated: Parameters whose strategies ran (not excluded or locked)
+        changes: (parameter, old, new) for each applied change
+        lockout: Oscillation lockout fired (None when not checked)
+    """
+
+    index: int
+    end_ts: int
+    layer: str
+    rows: int
+    cached: bool
+    evaluated: tuple[str, ...]
+    changes: tuple[tuple[str, float, float], ...]
+    lockout: bool | None = None
+
+
+@dataclass(slots=True)
+class SeriesResult:
+    """Replay result for one (database, WAN) series."""
+
+    db_path: str
+    wan_name: str
+    closed_loop: bool
+    initial_params: dict[str, float]
+    outcomes: list[WindowOutcome] = field(default_factory=list)
+
+
+class _WindowDigests:
+    """Content hashes of consecutive windows, memoized per wall-clock bucket."""
+
+    def __init__(self) -> None:
+        self._bucket_digests: dict[int, str] = {}
+
+    def digest(self, rows: list[dict], window: BacktestWindow) -> str:
+        """Content hash of ``rows`` (the rows of ``window``, newest first).
+
+        Combines per-bucket digests. Buckets wholly inside the window are
+        memoized; the partial buckets at either edge are hashed each time.
+        """
+        memo = self._bucket_digests
+        first_bucket = window.start_ts // DIGEST_BUCKET_SEC
+        for stale in [b for b in memo if b < first_bucket]:
+            del memo[stale]
+        h = hashlib.blake2b(digest_size=16)
+        for bucket, group in groupby(rows, key=lambda row: row["timestamp"] // DIGEST_BUCKET_SEC):
+            lo = bucket * DIGEST_BUCKET_SEC
+            full = lo >= window.start_ts and lo + DIGEST_BUCKET_SEC - 1 <= window.end_ts
+            if not full:
+                h.update(rows_digest(group).encode())
+                continue
+            cached = memo.get(bucket)
+            if cached is None:
+                cached = memo[bucket] = rows_digest(group)
+            h.update(cached.encode())
+        return h.hexdigest()
+
+
+def _window_rows(feed: MetricWindow, window: BacktestWindow) -> list[dict]:
+    """Rows in [window.start_ts, window.end_ts], as one query_metrics() call returns them.
+
+    Consecutive windows overlap by lookback minus step, so the shared
+    MetricWindow only reads rows after the previous pass from SQLite.
+    """
+    return feed.rows(start_ts=window.start_ts, end_ts=window.end_ts, now_ts=window.end_ts)
+
+
+def _evaluate_window(
+    task: SeriesTask,
+    cache: BacktestCache,
+    feed: MetricWindow,
+    digests: _WindowDigests,
+    window: BacktestWindow,
+    strategies: list[tuple[str, Any]],
+    params: dict[str, float],
+    check_lockout: bool,
+) -> tuple[list[TuningResult], bool | None, int, bool]:
+    """Strategy results and lockout for one window, from cache when possible."""
+    rows = _window_rows(feed, window)
+    threshold = task.oscillation_threshold if check_lockout else None
+    key = _evaluation_key(
+        digests.digest(rows, window),
+        task.code_digest,
+        window,
+        task.wan_name,
+        [name for name, _ in strategies],
+        params,
+        task.tuning_config,
+        threshold,
+    )
+    cached = cache.get(key)
+    if cached is not None:
+        results = [TuningResult(**r) for r in cached["results"]]
+        return results, cached["lockout"], len(rows), True
+
+    lockout: bool | None = None
+    if threshold is not None:
+        lockout = check_oscillation_lockout(rows, {}, threshold, None, task.wan_name)
+    results = evaluate_strategies(
+        rows, task.wan_name, task.tuning_config, params, strategies, now_ts=window.end_ts
+    )
+    cache.put(key, {"lockout": lockout, "results": [asdict(r) for r in results]})
+    return results, lockout, len(rows), False
+
+
+def run_series(task: SeriesTask) -> SeriesResult:
+    """Replay the tuner over ``task.windows`` in order."""
+    layers = build_tuning_layers()
+    excluded = task.tuning_config.exclude_params
+    cache = BacktestCache(task.cache_dir)
+    feed = MetricWindow(task.db_path, task.wan_name, task.tuning_config.lookback_hours)
+    digests = _WindowDigests()
+    params = dict(task.params)
+    response_locked_until = 0
+    result = SeriesResult(task.db_path, task.wan_name, task.closed_loop, dict(task.params))
+
+    for window in task.windows:
+        if task.closed_loop:
+            layer_idx = window.index % len(layers)
+            strategies = [(p, fn) for p, fn in layers[layer_idx] if p not in excluded]
+            layer_name = LAYER_NAMES[layer_idx]
+        else:
+            layer_idx = _RESPONSE_LAYER
+            strategies = [(p, fn) for layer in layers for p, fn in layer if p not in excluded]
+            layer_name = "all"
+
+        results, lockout, rows, cached = _evaluate_window(
+            task, cache, feed, digests, window, strategies, params, layer_idx == _RESPONSE_LAYER
+        )
+        if lockout:
+            response_locked_until = window.end_ts + OSCILLATION_LOCKOUT_SEC
+        locked = window.end_ts < response_locked_until
+        evaluated = tuple(p for p, _ in strategies if not (locked and p in RESPONSE_PARAMS))
+        applied = apply_tuning_results(
+            [r for r in results if r.parameter in evaluated], task.tuning_config
+        )
+        if task.closed_loop:
+            for r in applied:
+                params[r.parameter] = r.new_value
+        result.outcomes.append(
+            WindowOutcome(
+                index=window.index,
+                end_ts=window.end_ts,
+                layer=layer_name,
+                rows=rows,
+                cached=cached,
+                evaluated=evaluated,
+                changes=tuple((r.parameter, r.old_value, r.new_value) for r in applied),
+                lockout=lockout,
+            )
+        )
+    return result
+
+
+def _quiet_worker_logging() -> None:
+    # apply_tuning_results() logs each change at WARNING; a backtest makes thousands
+    logging.getLogger("wanctl.tuning").setLevel(logging.ERROR)
+
+
+@contextlib.contextmanager
+def _quiet_local_logging() -> Iterator[None]:
+    """_quiet_worker_logging() for an in-process run, restoring the level after."""
+    tuning_logger = logging.getLogger("wanctl.tuning")
+    previous = tuning_logger.level
+    _quiet_worker_logging()
+    try:
+        yield
+    finally:
+        tuning_logger.setLevel(previous)
+
+
+# =============================================================================
+# ORCHESTRATION
+# =============================================================================
+
+
+def history_span(db_path: str | Path, wan_name: str) -> tuple[int, int] | None:
+    """First and last 1m timestamps for ``wan_name`` (None if no data)."""
+    try:
+        conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    except sqlite3.OperationalError:
+        return None
+    try:
+        row = conn.execute(
+            "SELECT MIN(timestamp), MAX(timestamp) FROM metrics "
+            "WHERE wan_name = ? AND granularity = '1m'",
+            (wan_name,),
+        ).fetchone()
+    except sqlite3.Error:
+        return None
+    finally:
+        conn.close()
+    if row is None or row[0] is None:
+        return None
+    return int(row[0]), int(row[1])
+
+
+def list_wans(db_path: str | Path) -> list[str]:
+    """WAN names with 1m data in ``db_path``."""
+    try:
+        conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    except sqlite3.OperationalError:
+        return []
+    try:
+        rows = conn.execute(
+            "SELECT DISTINCT wan_name FROM metrics WHERE granularity = '1m' ORDER BY wan_name"
+        ).fetchall()
+    except sqlite3.Error:
+        return []
+    finally:
+        conn.close()
+    return [r[0] for r in rows]
+
+
+def _split(windows: list[BacktestWindow], parts: int) -> list[tuple[BacktestWindow, ...]]:
+    size = max(1, math.ceil(len(windows) / max(1, parts)))
+    return [tuple(windows[i : i + size]) for i in range(0, len(windows), size)]
+
+
+def plan_tasks(
+    series: Sequence[tuple[str, str, dict[str, float], TuningConfig, float]],
+    *,
+    closed_loop: bool = True,
+    jobs: int = 1,
+    cache_dir: str | None = None,
+    since_ts: int | None = None,
+) -> list[SeriesTask]:
+    """Cut each (db, wan, params, tuning_config, threshold) history into tasks.
+
+    Closed-loop series are one task each; open-loop series are split into
+    ``jobs`` chunks so a single long history still uses the whole pool.
+    """
+    code_digest = tuning_code_digest()
+    tasks: list[SeriesTask] = []
+    for db_path, wan_name, params, tuning_config, threshold in series:
+        span = history_span(db_path, wan_name)
+        if span is None:
+            continue
+        first_ts, last_ts = span
+        windows = build_windows(
+            first_ts,
+            last_ts,
+            tuning_config.lookback_hours * 3600,
+            tuning_config.cadence_sec,
+            tuning_config.warmup_hours * 3600,
+        )
+        if since_ts is not None:
+            windows = [w for w in windows if w.end_ts >= since_ts]
+        if not windows:
+            continue
+        chunks = [tuple(windows)] if closed_loop else _split(windows, jobs)
+        tasks.extend(
+            SeriesTask(
+                db_path=str(db_path),
+                wan_name=wan_name,
+                windows=chunk,
+                params=params,
+                tuning_config=tuning_config,
+                oscillation_threshold=threshold,
+                closed_loop=closed_loop,
+                cache_dir=cache_dir,
+                code_digest=code_digest,
+            )
+            for chunk in chunks
+        )
+    return tasks
+
+
+def run_backtest(tasks: Sequence[SeriesTask], jobs: int = 1) -> list[SeriesResult]:
+    """Run tasks (in a process pool when ``jobs > 1``), merging chunks per series."""
+    if jobs > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(
+            max_workers=min(jobs, len(tasks)), initializer=_quiet_worker_logging
+        ) as pool:
+            parts = list(pool.map(run_series, tasks))
+    else:
+        with _quiet_local_logging():
+            parts = [run_series(task) for task in tasks]
+
+    merged: dict[tuple[str, str], SeriesResult] = {}
+    for part in parts:
+        key = (part.db_path, part.wan_name)
+        if key in merged:
+            merged[key].outcomes.extend(part.outcomes)
+        else:
+            merged[key] = part
+    for series in merged.values():
+        series.outcomes.sort(key=lambda o: o.index)
+    return list(merged.values())
+
+
+# =============================================================================
+# REPORT
+# =============================================================================
+
+
+def _parameter_report(
+    name: str,
+    initial: float | None,
+    outcomes: list[WindowOutcome],
+    settle: int,
+) -> dict[str, Any]:
+    """Trajectory, reversals and convergence for one parameter."""
+    value = initial
+    trajectory: list[list[float]] = []
+    evaluations_since_change = 0
+    last_direction = 0
+    reversals = 0
+    evaluations = 0
+    for outcome in outcomes:
+        if name not in outcome.evaluated:
+            continue
+        evaluations += 1
+        change = next((c for c in outcome.changes if c[0] == name), None)
+        if change is None:
+            evaluations_since_change += 1
+            continue
+        _, old, new = change
+        direction = 1 if new > old else -1
+        if last_direction and direction != last_direction:
+            reversals += 1
+        last_direction = direction
+        value = new
+        trajectory.append([outcome.end_ts, new])
+        evaluations_since_change = 0
+
+    converged = evaluations_since_change >= settle
+    return {
+        "initial": initial,
+        "final": value,
+        "evaluations": evaluations,
+        "changes": len(trajectory),
+        "reversals": reversals,
+        "converged": converged,
+        "converged_at": (trajectory[-1][0] if trajectory else None) if converged else None,
+        "trajectory": trajectory,
+    }
+
+
+def summarize(series: SeriesResult, settle: int = DEFAULT_SETTLE_EVALUATIONS) -> dict[str, Any]:
+    """JSON-ready backtest report for one series."""
+    outcomes = series.outcomes
+    names = sorted({p for o in outcomes for p in o.evaluated})
+    return {
+        "wan": series.wan_name,
+        "db": series.db_path,
+        "mode": "closed_loop" if series.closed_loop else "open_loop",
+        "windows": len(outcomes),
+        "first_window_end": outcomes[0].end_ts if outcomes else None,
+        "last_window_end": outcomes[-1].end_ts if outcomes else None,
+        "cache_hits": sum(1 for o in outcomes if o.cached),
+        "oscillation_checks": sum(1 for o in outcomes if o.lockout is not None),
+        "oscillation_lockouts": sum(1 for o in outcomes if o.lockout),
+        "parameters": {
+            name: _parameter_report(name, series.initial_params.get(name), outcomes, settle)
+            for name in names
+        },
+    }
+
+
+def format_report(reports: list[dict[str, Any]]) -> str:
+    """Human-readable table of backtest reports."""
+    blocks = []
+    for report in reports:
+        header = (
+            f"{report['wan']} ({report['db']}): {report['windows']} windows, "
+            f"{report['mode'].replace('_', '-')}, "
+            f"{report['oscillation_lockouts']}/{report['oscillation_checks']} "
+            f"oscillation lockouts, {report['cache_hits']} cached"
+        )
+        rows = [
+            [
+                name,
+                p["initial"],
+                p["final"],
+                p["changes"],
+                p["reversals"],
+                "yes" if p["converged"] else "no",
+            ]
+            for name, p in report["parameters"].items()
+        ]
+        table = tabulate(
+            rows,
+            headers=["Parameter", "Initial", "Final", "Changes", "Reversals", "Converged"],
+            tablefmt="simple",
+        )
+        blocks.append(f"{header}\n{table}")
+    return "\n\n".join(blocks)
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+
+def params_from_config(config: Any) -> dict[str, float]:
+    """Starting parameter values, as the daemon's _build_current_params() sees them."""
+    sp = config.signal_processing_config
+    return {
+        "target_bloat_ms": float(config.target_bloat_ms),
+        "warn_bloat_ms": float(config.warn_bloat_ms),
+        "hard_red_bloat_ms": float(config.hard_red_bloat_ms),
+        "alpha_load": float(config.alpha_load),
+        "alpha_baseline": float(config.alpha_baseline),
+        "hampel_sigma_threshold": float(sp["hampel_sigma_threshold"]),
+        "hampel_window_size": float(sp["hampel_window_size"]),
+        "reflector_min_score": float(config.reflector_quality_config["min_score"]),
+        "fusion_icmp_weight": float(config.fusion_config["icmp_weight"]),
+        "load_time_constant_sec": 0.05 / config.alpha_load,
+        "baseline_rtt_min": float(config.baseline_rtt_min),
+        "baseline_rtt_max": float(config.baseline_rtt_max),
+        "dl_step_up_mbps": config.download_step_up / 1e6,
+        "ul_step_up_mbps": config.upload_step_up / 1e6,
+        "dl_factor_down": float(config.download_factor_down),
+        "ul_factor_down": float(config.upload_factor_down),
+        "dl_green_required": float(config.download_green_required),
+        "ul_green_required": float(config.upload_green_required),
+    }
+
+
+def _oscillation_threshold(config: Any) -> float:
+    raw = (config.data.get("tuning") or {}).get("oscillation_threshold")
+    if isinstance(raw, (int, float)) and not isinstance(raw, bool):
+        return float(raw)
+    return DEFAULT_OSCILLATION_THRESHOLD
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """Create argument parser for the backtest CLI."""
+    parser = argparse.ArgumentParser(
+        prog="wanctl-tuning-backtest",
+        description="Replay the adaptive tuner over metrics history in sliding windows.",
+    )
+    parser.add_argument(
+        "--config",
+        type=Path,
+        action="append",
+        required=True,
+        help="Autorate config supplying tuning settings and starting values (repeatable)",
+    )
+    parser.add_argument(
+        "--db",
+        type=Path,
+        action="append",
+        help="Metrics database (repeatable; default: discover per-WAN databases)",
+    )
+    parser.add_argument("--days", type=float, help="Only replay windows ending in the last N days")
+    parser.add_argument("--lookback-hours", type=int, help="Override tuning.lookback_hours")
+    parser.add_argument(
+        "--step-hours", type=float, help="Window step (default: tuning.cadence_sec)"
+    )
+    parser.add_argument(
+        "--open-loop",
+        action="store_true",
+        help="Evaluate every strategy on every window at the configured values",
+    )
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=DEFAULT_CACHE_DIR,
+        help=f"Per-window result cache (default: {DEFAULT_CACHE_DIR})",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Disable the result cache")
+    parser.add_argument(
+        "--settle",
+        type=int,
+        default=DEFAULT_SETTLE_EVALUATIONS,
+        help="Evaluations without a change before a parameter counts as converged",
+    )
+    parser.add_argument("--json", action="store_true", help="Print JSON (with trajectories)")
+    return parser
+
+
+def _load_wan_settings(
+    args: argparse.Namespace,
+) -> dict[str, tuple[dict[str, float], TuningConfig, float, str]]:
+    """wan_name -> (params, tuning_config, oscillation threshold, config db_path)."""
+    from dataclasses import replace
+
+    from wanctl.autorate_config import Config
+    from wanctl.config_base import get_storage_config
+
+    settings = {}
+    for path in args.config:
+        config = Config(str(path))
+        tuning_config = config.tuning_config
+        if tuning_config is None:
+            raise ValueError(f"{path}: tuning section is missing or disabled")
+        overrides: dict[str, Any] = {}
+        if args.lookback_hours is not None:
+            overrides["lookback_hours"] = args.lookback_hours
+        if args.step_hours is not None:
+            overrides["cadence_sec"] = int(args.step_hours * 3600)
+        tuning_config = replace(tuning_config, **overrides)
+        db_path = get_storage_config(config.data).get("db_path", "")
+        settings[config.wan_name] = (
+            params_from_config(config),
+            tuning_config,
+            _oscillation_threshold(config),
+            db_path,
+        )
+    return settings
+
+
+def _resolve_series(
+    args: argparse.Namespace,
+    settings: dict[str, tuple[dict[str, float], TuningConfig, float, str]],
+) -> list[tuple[str, str, dict[str, float], TuningConfig, float]]:
+    from wanctl.storage.db_utils import discover_wan_dbs
+
+    if args.db:
+        db_paths = [str(p) for p in args.db]
+    else:
+        configured = [s[3] for s in settings.values() if s[3] and Path(s[3]).exists()]
+        db_paths = sorted(set(configured)) or [str(p) for p in discover_wan_dbs()]
+
+    lowered = {name.lower(): name for name in settings}
+    series = []
+    for db_path in db_paths:
+        for wan_name in list_wans(db_path):
+            config_name = lowered.get(wan_name.lower())
+            if config_name is None:
+                logger.warning("No --config for WAN %s in %s, skipping", wan_name, db_path)
+                continue
+            params, tuning_config, threshold, _ = settings[config_name]
+            series.append((db_path, wan_name, params, tuning_config, threshold))
+    return series
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI entry point for wanctl-tuning-backtest."""
+    args = create_parser().parse_args(argv)
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s: %(message)s")
+
+    try:
+        settings = _load_wan_settings(args)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    series = _resolve_series(args, settings)
+    if not series:
+        print("No metrics found for the configured WANs.", file=sys.stderr)
+        return 1
+
+    jobs = max(1, args.jobs)
+    since_ts = int(time.time() - args.days * 86400) if args.days is not None else None
+    tasks = plan_tasks(
+        series,
+        closed_loop=not args.open_loop,
+        jobs=jobs,
+        cache_dir=None if args.no_cache else str(args.cache_dir),
+        since_ts=since_ts,
+    )
+    if not tasks:
+        print("Not enough history for a single tuning window.", file=sys.stderr)
+        return 1
+
+    started = time.monotonic()
+    reports = [summarize(s, args.settle) for s in run_backtest(tasks, jobs)]
+    elapsed = time.monotonic() - started
+
+    if args.json:
+        print(json.dumps(reports, indent=2))
+    else:
+        print(format_report(reports))
+        windows = sum(r["windows"] for r in reports)
+        print(f"\n{windows} windows in {elapsed:.1f}s ({jobs} jobs)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+"""Bottom-up tuning layer definitions (SIGP-04).
+
+The daemon executes one layer per tuning cadence, round-robin, so signal
+processing settles before EWMA, thresholds, advanced and finally response
+parameters are tuned. The offline backtest replays the same rotation.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+LAYER_NAMES = ("signal", "ewma", "threshold", "advanced", "response")
+
+
+def build_tuning_layers() -> list[list[tuple[str, Any]]]:
+    """Build layer definitions for bottom-up tuning.
+
+    Lazy-imports tuning strategy modules.
+
+    Returns:
+        One list of (parameter_name, strategy_fn) per entry in LAYER_NAMES.
+    """
+    from wanctl.tuning.strategies.advanced import (
+        tune_baseline_bounds_max,
+        tune_baseline_bounds_min,
+        tune_fusion_weight,
+        tune_reflector_min_score,
+    )
+    from wanctl.tuning.strategies.congestion_thresholds import (
+        calibrate_target_bloat,
+        calibrate_warn_bloat,
+    )
+    from wanctl.tuning.strategies.response import (
+        tune_dl_factor_down,
+        tune_dl_green_required,
+        tune_dl_step_up,
+        tune_ul_factor_down,
+        tune_ul_green_required,
+        tune_ul_step_up,
+    )
+    from wanctl.tuning.strategies.signal_processing import (
+        tune_alpha_load,
+        tune_hampel_sigma,
+        tune_hampel_window,
+    )
+
+    _layer_t = list[tuple[str, Any]]
+    signal: _layer_t = [
+        ("hampel_sigma_threshold", tune_hampel_sigma),
+        ("hampel_window_size", tune_hampel_window),
+    ]
+    ewma: _layer_t = [("load_time_constant_sec", tune_alpha_load)]
+    threshold: _layer_t = [
+        ("target_bloat_ms", calibrate_target_bloat),
+        ("warn_bloat_ms", calibrate_warn_bloat),
+    ]
+    advanced: _layer_t = [
+        ("fusion_icmp_weight", tune_fusion_weight),
+        ("reflector_min_score", tune_reflector_min_score),
+        ("baseline_rtt_min", tune_baseline_bounds_min),
+        ("baseline_rtt_max", tune_baseline_bounds_max),
+    ]
+    response: _layer_t = [
+        ("dl_step_up_mbps", tune_dl_step_up),
+        ("ul_step_up_mbps", tune_ul_step_up),
+        ("dl_factor_down", tune_dl_factor_down),
+        ("ul_factor_down", tune_ul_factor_down),
+        ("dl_green_required", tune_dl_green_required),
+        ("ul_green_required", tune_ul_green_required),
+    ]
+    return [signal, ewma, threshold, advanced, response]
@@ -0,0 +1,165 @@
+"""Per-WAN sliding window of 1m metric rows shared by the tuning engine.
+
+Every tuning pass used to re-read the whole ``lookback_hours`` of 1m rows
+(analysis and oscillation lockout) plus overlapping ranges for the revert
+and pre-adjustment congestion checks. MetricWindow keeps those rows in
+memory and refreshes incrementally:
+
+    - The first refresh (or one after the window went stale) loads the full
+      span once.
+    - Later refreshes only read rows from the last fetched timestamp onward.
+      The trailing REFETCH_OVERLAP_SEC of the window is re-read and replaced,
+      so 1m aggregates the downsampler writes late are still picked up.
+    - Rows older than the span are evicted from the front.
+
+The span is ``lookback_hours``, capped at storage's 1m retention
+(``aggregate_1m_age_seconds``). Older 1m rows have already been rolled up
+into 5m aggregates, so the capped window still answers 1m queries over the
+full lookback.
+
+rows() returns rows in query_metrics() order (newest first). The row dicts
+are shared between callers and must not be mutated.
+
+The tuning backtest reuses the window over historical data by passing each
+simulated tuning pass's end as ``now_ts``; fetches never read past it.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any
+
+from wanctl.storage.reader import query_metrics
+
+# Trailing seconds re-read on each refresh (one storage maintenance interval)
+REFETCH_OVERLAP_SEC = 900
+
+
+class MetricWindow:
+    """In-memory sliding window of one WAN's 1m metric rows.
+
+    Args:
+        db_path: Path to the metrics SQLite database.
+        wan_name: WAN name to filter (e.g., "Spectrum").
+        lookback_hours: Window span in hours.
+        max_age_sec: Optional cap on the span (storage's 1m retention).
+    """
+
+    def __init__(
+        self,
+        db_path: Path | str,
+        wan_name: str,
+        lookback_hours: int,
+        max_age_sec: int | None = None,
+    ) -> None:
+        self.db_path = str(db_path)
+        self.wan_name = wan_name
+        self.lookback_sec = 0
+        self.span_sec = 0
+        self.configure(lookback_hours, max_age_sec)
+        # Oldest first, so eviction pops from the left
+        self._rows: deque[dict[str, Any]] = deque()
+        self._last_ts: int | None = None
+        self._lock = threading.Lock()
+        self._refreshes = 0
+        self._full_loads = 0
+        self._last_fetch_rows = 0
+
+    def configure(self, lookback_hours: int, max_age_sec: int | None = None) -> None:
+        """Set the lookback and cached span (applied on the next refresh)."""
+        self.lookback_sec = int(lookback_hours * 3600)
+        span_sec = self.lookback_sec
+        if max_age_sec is not None and max_age_sec > 0:
+            span_sec = min(span_sec, int(max_age_sec))
+        self.span_sec = span_sec
+
+    def refresh(self, now_ts: int | None = None) -> None:
+        """Read rows up to ``now_ts`` newer than the last fetch; evict rows older than the span."""
+        if now_ts is None:
+            now_ts = int(time.time())
+        window_start = now_ts - self.span_sec
+        with self._lock:
+            rows = self._rows
+            if self._last_ts is None or self._last_ts < window_start:
+                fetch_start = window_start
+                rows.clear()
+                self._full_loads += 1
+            else:
+                fetch_start = max(window_start, self._last_ts - REFETCH_OVERLAP_SEC)
+                while rows and rows[-1]["timestamp"] >= fetch_start:
+                    rows.pop()
+
+            fetched = query_metrics(
+                db_path=self.db_path,
+                start_ts=fetch_start,
+                end_ts=now_ts,
+                wan=self.wan_name,
+                granularity="1m",
+            )
+            rows.extend(reversed(fetched))
+            while rows and rows[0]["timestamp"] < window_start:
+                rows.popleft()
+
+            self._last_ts = rows[-1]["timestamp"] if rows else None
+            self._refreshes += 1
+            self._last_fetch_rows = len(fetched)
+
+    def covers(self, start_ts: int, now_ts: int | None = None) -> bool:
+        """Return True if the window answers 1m queries starting at ``start_ts``."""
+        if now_ts is None:
+            now_ts = int(time.time())
+        return start_ts >= now_ts - self.lookback_sec
+
+    def rows(
+        self,
+        start_ts: int | None = None,
+        end_ts: int | None = None,
+        metrics: list[str] | None = None,
+        now_ts: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Refresh, then return cached rows (newest first) matching the filters.
+
+        Args:
+            start_ts: Start timestamp (inclusive), Unix seconds.
+            end_ts: End timestamp (inclusive), Unix seconds.
+            metrics: Metric names to keep (exact match).
+            now_ts: Refresh as of this time (default: wall clock).
+        """
+        self.refresh(now_ts)
+        with self._lock:
+            snapshot = list(reversed(self._rows))
+        if start_ts is None and end_ts is None and metrics is None:
+            return snapshot
+        wanted = set(metrics) if metrics is not None else None
+        return [
+            row
+            for row in snapshot
+            if (start_ts is None or row["timestamp"] >= start_ts)
+            and (end_ts is None or row["timestamp"] <= end_ts)
+            and (wanted is None or row["metric_name"] in wanted)
+        ]
+
+    def get_status(self) -> dict[str, Any]:
+        """Return window size and refresh counters for /health."""
+        with self._lock:
+            oldest = self._rows[0]["timestamp"] if self._rows else None
+            newest = self._rows[-1]["timestamp"] if self._rows else None
+            row_count = len(self._rows)
+        return {
+            "rows": row_count,
+            "lookback_hours": round(self.lookback_sec / 3600.0, 2),
+            "span_hours": round(self.span_sec / 3600.0, 2),
+            "oldest_ts": oldest,
+            "newest_ts": newest,
+            "coverage_hours": (
+                round((newest - oldest) / 3600.0, 2)
+                if oldest is not None and newest is not None
+                else 0.0
+            ),
+            "refreshes": self._refreshes,
+            "full_loads": self._full_loads,
+            "last_fetch_rows": self._last_fetch_rows,
+        }
@@ -15,6 +15,7 @@ from dataclasses import dataclass
 from pathlib import Path
 
 from wanctl.storage.reader import query_metrics
+from wanctl.tuning.metric_window import MetricWindow
 from wanctl.tuning.models import TuningResult
 from wanctl.tuning.state_samples import state_rows_for_direction
 
@@ -47,6 +48,7 @@ def measure_congestion_rate(
     wan_name: str,
     start_ts: int,
     end_ts: int,
+    window: MetricWindow | None = None,
 ) -> float | None:
     """Measure the fraction of time in congested state (SOFT_RED or RED).
 
@@ -58,18 +60,23 @@ def measure_congestion_rate(
         wan_name: WAN name to filter (e.g., "Spectrum").
         start_ts: Start timestamp (Unix seconds, inclusive).
         end_ts: End timestamp (Unix seconds, inclusive).
+        window: Optional MetricWindow; used instead of SQLite when it covers start_ts.
 
     Returns:
         Fraction of congested samples (0.0-1.0), or None if insufficient data.
     """
-    rows = query_metrics(
-        db_path=db_path,
-        start_ts=start_ts,
-        end_ts=end_ts,
-        metrics=["wanctl_state_download", "wanctl_state"],
-        wan=wan_name,
-        granularity="1m",
-    )
+    state_metrics = ["wanctl_state_download", "wanctl_state"]
+    if window is not None and window.covers(start_ts):
+        rows = window.rows(start_ts=start_ts, end_ts=end_ts, metrics=state_metrics)
+    else:
+        rows = query_metrics(
+            db_path=db_path,
+            start_ts=start_ts,
+            end_ts=end_ts,
+            metrics=state_metrics,
+            wan=wan_name,
+            granularity="1m",
+        )
 
     state_values = [row["value"] for row in state_rows_for_direction(rows, "download")]
 
@@ -86,6 +93,7 @@ def check_and_revert(
     wan_name: str,
     revert_threshold: float = DEFAULT_REVERT_THRESHOLD,
     min_congestion_rate: float = DEFAULT_MIN_CONGESTION_RATE,
+    window: MetricWindow | None = None,
 ) -> list[TuningResult]:
     """Check if a previous tuning adjustment caused degradation and produce reverts.
 
@@ -99,6 +107,7 @@ def check_and_revert(
         wan_name: WAN name to check.
         revert_threshold: Ratio threshold for triggering revert (default 1.5).
         min_congestion_rate: Minimum post rate to consider (default 0.05).
+        window: Optional shared MetricWindow for this WAN.
 
     Returns:
         List of revert TuningResults (empty if no revert needed).
@@ -111,6 +120,7 @@ def check_and_revert(
         wan_name=wan_name,
         start_ts=pending_observation.applied_ts,
         end_ts=int(time.time()),
+        window=window,
     )
 
     if post_rate is None:
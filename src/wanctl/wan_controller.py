@@ -6,6 +6,7 @@ adjustments for a single WAN interface.
 """
 
 import concurrent.futures
+import functools
 import json
 import logging
 import math
@@ -14,6 +15,7 @@ import statistics
 import threading
 import time
 from collections import deque
+from collections.abc import Callable
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Protocol
 
@@ -26,26 +28,34 @@ from wanctl.asymmetry_analyzer import (
 from wanctl.autorate_config import Config
 from wanctl.cake_stats_thread import BackgroundCakeStatsThread
 from wanctl.config_base import get_storage_config
+from wanctl.config_snapshot import ConfigSnapshot, load_config_snapshot, reload_data
 from wanctl.error_handling import handle_errors
 from wanctl.fusion_healer import FusionHealer, HealState
-from wanctl.irtt_measurement import IRTTResult
-from wanctl.irtt_thread import IRTTThread
+from wanctl.measurement_scheduler import (
+    IRTT_SCHEDULE_SOURCE,
+    MeasurementScheduler,
+    MeasurementSlot,
+)
 from wanctl.metrics import (
     get_storage_metrics_snapshot,
     record_autorate_cycle,
     record_ping_failure,
     record_rate_limit_event,
     record_router_update,
+    record_router_write,
+    record_subsystem_timings,
 )
 from wanctl.pending_rates import PendingRateChange
 from wanctl.perf_profiler import (
-    OperationProfiler,
+    ArrayOperationProfiler,
     PerfTimer,
     record_cycle_profiling,
 )
 from wanctl.queue_controller import QueueController
 from wanctl.rate_utils import RateLimiter
+from wanctl.reflector_fleet import ReflectorFleet
 from wanctl.reflector_scorer import ReflectorScorer
+from wanctl.router_apply_thread import BackgroundRouterApplyThread, RouterApplyResult
 from wanctl.router_connectivity import RouterConnectivityState
 from wanctl.routeros_interface import RouterOS
 from wanctl.rtt_backend import RttSample
@@ -62,11 +72,15 @@ from wanctl.runtime_pressure import (
 from wanctl.signal_processing import SignalProcessor, SignalResult
 from wanctl.storage import MetricsWriter
 from wanctl.storage.deferred_writer import DeferredIOWorker
+from wanctl.tuning.metric_window import MetricWindow
 from wanctl.tuning.models import TuningResult, TuningState
 from wanctl.wan_controller_state import WANControllerState
+from wanctl.zone_events import ZoneEventPublisher
 
 if TYPE_CHECKING:
     from wanctl.cake_signal import CakeSignalSnapshot
+    from wanctl.irtt_measurement import IRTTResult
+    from wanctl.irtt_thread import IRTTThread
 
 
 class _BackgroundRttDriver(Protocol):
@@ -355,6 +369,8 @@ class WANController:
     ):
         self.wan_name = wan_name
         self.config = config
+        snapshot = getattr(config, "snapshot", None)
+        self._config_snapshot = snapshot if isinstance(snapshot, ConfigSnapshot) else None
         self.router = router
         self.rtt_measurement = rtt_measurement
         self.logger = logger
@@ -592,6 +608,14 @@ class WANController:
         self._dl_zone: str = "GREEN"
         self._ul_zone: str = "GREEN"
         self._cycles_since_forced_save = 0
+        self._init_zone_events()
+
+    def _init_zone_events(self) -> None:
+        """Initialize optional zone transition publisher for event-driven steering."""
+        self._zone_event_publisher: ZoneEventPublisher | None = None
+        socket_path = getattr(self.config, "zone_event_socket", None)
+        if isinstance(socket_path, str) and socket_path:
+            self._zone_event_publisher = ZoneEventPublisher(socket_path, self.wan_name, self.logger)
 
     def _init_metrics_storage(self) -> None:
         """Initialize optional SQLite metrics history storage."""
@@ -721,8 +745,30 @@ class WANController:
         self._last_ul_state_emitted: float | None = None
 
     def _init_reflector_scoring(self) -> None:
-        """Initialize per-reflector rolling quality scoring."""
+        """Initialize per-reflector rolling quality scoring.
+
+        With reflector_quality.candidates configured, a ReflectorFleet picks the
+        active reflectors from ping_hosts plus the candidates.
+        """
         rq_config = self.config.reflector_quality_config
+        candidates = rq_config.get("candidates") or []
+        self._reflector_fleet: ReflectorFleet | None = None
+        if candidates:
+            self._reflector_fleet = ReflectorFleet(
+                hosts=self.config.ping_hosts,
+                candidates=candidates,
+                active_count=rq_config.get("active_count"),
+                probe_budget_per_sec=rq_config.get("probe_budget_per_sec", 2.0),
+                reselect_interval_sec=rq_config.get("reselect_interval_sec", 30.0),
+                min_score=rq_config["min_score"],
+                window_size=rq_config["window_size"],
+                probe_interval_sec=rq_config["probe_interval_sec"],
+                recovery_count=rq_config["recovery_count"],
+                logger=self.logger,
+                wan_name=self.wan_name,
+            )
+            self._reflector_scorer: ReflectorScorer = self._reflector_fleet
+            return
         self._reflector_scorer = ReflectorScorer(
             hosts=self.config.ping_hosts,
             min_score=rq_config["min_score"],
@@ -778,7 +824,7 @@ class WANController:
         config = self.config
 
         # Profiling instrumentation (PROF-01, PROF-02)
-        self._profiler = OperationProfiler(max_samples=1200)
+        self._profiler = ArrayOperationProfiler(max_samples=1200)
         self._profile_cycle_count = 0
         self._profiling_enabled = False
         self._overrun_count = 0
@@ -809,6 +855,15 @@ class WANController:
         # Background CAKE stats thread (offloads 7-20ms netlink I/O from main loop)
         self._cake_stats_thread: BackgroundCakeStatsThread | None = None
 
+        # Background router apply writer (router_apply_mode: async)
+        self._router_apply_mode: str = getattr(config, "router_apply_mode", "sync")
+        self._router_apply_thread: BackgroundRouterApplyThread | None = None
+
+        # Shared phase-aligned cadence for the background producers (optional)
+        self._measurement_scheduler: MeasurementScheduler | None = None
+        self._rtt_source = f"{self.wan_name}:rtt"
+        self._cake_stats_source = f"{self.wan_name}:cake_stats"
+
         # Deferred I/O worker (Phase 155: CYCLE-02)
         self._io_worker: DeferredIOWorker | None = None
 
@@ -831,6 +886,7 @@ class WANController:
         self._tuning_layer_index: int = 0
         self._parameter_locks: dict[str, float] = {}  # param -> monotonic lock expiry
         self._pending_observation = None  # PendingObservation | None (lazy import)
+        self._metric_window: MetricWindow | None = None  # Shared 1m tuning rows
 
         # Oscillation lockout threshold (RTUN-04)
         from wanctl.tuning.strategies.response import DEFAULT_OSCILLATION_THRESHOLD
@@ -919,8 +975,8 @@ class WANController:
                 self.wan_name,
             )
 
-    def _parse_cake_signal_config(self) -> Any:
-        """Parse cake_signal section from YAML config file.
+    def _parse_cake_signal_config(self, data: dict[str, Any] | None = None) -> Any:
+        """Parse cake_signal section from YAML config file (or reload ``data``).
 
         Returns CakeSignalConfig with all booleans defaulting to False
         and time_constant_sec defaulting to 1.0 if section missing or invalid.
@@ -928,10 +984,7 @@ class WANController:
         from wanctl.cake_signal import CakeSignalConfig
 
         try:
-            import yaml
-
-            with open(self.config.config_file_path) as f:
-                data = yaml.safe_load(f)
+            data = reload_data(self.config.config_file_path, data)
         except Exception:
             return CakeSignalConfig()
 
@@ -1121,7 +1174,7 @@ class WANController:
         The control loop reads from the shared variable via measure_rtt()
         instead of blocking on ICMP I/O.
         """
-        max_workers = max(3, len(self.config.ping_hosts))
+        max_workers = max(3, len(self._reflector_scorer.get_active_hosts()))
         self._rtt_pool = concurrent.futures.ThreadPoolExecutor(
             max_workers=max_workers,
             thread_name_prefix="wanctl-rtt-ping",
@@ -1132,19 +1185,41 @@ class WANController:
                 shutdown_event,
                 pool=self._rtt_pool,
                 cadence_sec=self._background_rtt_cadence_sec(),
+                schedule_for=self._rtt_schedule_for(),
             )
         else:
+            schedule_for = self._rtt_schedule_for()
+            cadence_sec = self._background_rtt_cadence_sec()
             self._rtt_thread = BackgroundRTTThread(
                 rtt_measurement=self.rtt_measurement,
                 hosts_fn=self._reflector_scorer.get_active_hosts,
                 shutdown_event=shutdown_event,
                 logger=self.logger,
                 pool=self._rtt_pool,
-                cadence_sec=self._background_rtt_cadence_sec(),
+                cadence_sec=cadence_sec,
+                schedule=schedule_for(cadence_sec) if schedule_for else None,
             )
         self._rtt_thread_started_ts = time.monotonic()
         self._initial_rtt_pending_logged = False
         self._rtt_thread.start()
+        if self._reflector_fleet is not None:
+            self._reflector_fleet.start(self.rtt_measurement, shutdown_event)
+
+    def _rtt_schedule_for(self) -> Callable[[float], MeasurementSlot] | None:
+        """Return the RTT producer's slot registration, or None without a scheduler.
+
+        Adapted cadence never drops below BACKGROUND_RTT_MIN_CADENCE_SECONDS, so
+        congestion speed-up cannot hammer public reflectors.
+        """
+        scheduler = self._measurement_scheduler
+        if scheduler is None:
+            return None
+        return functools.partial(
+            scheduler.register,
+            self._rtt_source,
+            wan=self.wan_name,
+            min_cadence_sec=BACKGROUND_RTT_MIN_CADENCE_SECONDS,
+        )
 
     def _background_rtt_cadence_sec(self) -> float:
         """Return the capped cadence used by the ICMP background thread."""
@@ -1156,8 +1231,8 @@ class WANController:
     def start_background_cake_stats(self, shutdown_event: threading.Event) -> None:
         """Start background CAKE stats thread if transport supports it.
 
-        Creates a BackgroundCakeStatsThread with its own IPRoute connections
-        that reads CAKE qdisc stats continuously. The main loop reads cached
+        Creates a BackgroundCakeStatsThread on its own netlink socket that
+        reads CAKE (or HTB fq_codel) qdisc stats continuously. The main loop reads cached
         results via _run_cake_stats() instead of blocking on 7-20ms netlink I/O.
         """
         if not self._cake_signal_supported:
@@ -1165,17 +1240,50 @@ class WANController:
         if not self._dl_cake_signal.config.enabled and not self._ul_cake_signal.config.enabled:
             return
 
+        from wanctl.backends.linux_cake import LinuxHtbFqCodelBackend
         from wanctl.backends.linux_cake_adapter import LinuxCakeAdapter
 
         adapter: LinuxCakeAdapter = self.router  # type: ignore[assignment]
+        scheduler = self._measurement_scheduler
         self._cake_stats_thread = BackgroundCakeStatsThread(
             dl_interface=adapter.dl_backend.interface,
             ul_interface=adapter.ul_backend.interface,
             shutdown_event=shutdown_event,
             cadence_sec=self._cake_stats_cadence_sec,
+            htb_directions=(
+                isinstance(adapter.dl_backend, LinuxHtbFqCodelBackend),
+                isinstance(adapter.ul_backend, LinuxHtbFqCodelBackend),
+            ),
+            schedule=(
+                scheduler.register(
+                    self._cake_stats_source, self._cake_stats_cadence_sec, wan=self.wan_name
+                )
+                if scheduler is not None
+                else None
+            ),
         )
         self._cake_stats_thread.start()
 
+    def start_background_router_apply(self, shutdown_event: threading.Event) -> None:
+        """Start the async router apply writer if router_apply_mode is "async".
+
+        The control loop then posts rate targets to a single-slot,
+        latest-value-wins mailbox instead of blocking on set_limits().
+        """
+        if self._router_apply_mode != "async":
+            return
+
+        from wanctl.backends.linux_cake_adapter import LinuxCakeAdapter
+
+        if isinstance(self.router, LinuxCakeAdapter):
+            self.router.enable_concurrent_directions()
+        self._router_apply_thread = BackgroundRouterApplyThread(
+            wan_name=self.wan_name,
+            apply_fn=self._write_router_limits,
+            shutdown_event=shutdown_event,
+        )
+        self._router_apply_thread.start()
+
     def measure_rtt(self) -> float | None:
         """Read latest RTT from background thread (non-blocking).
 
@@ -1210,6 +1318,8 @@ class WANController:
             return None
 
         age = time.monotonic() - snapshot.timestamp
+        if self._measurement_scheduler is not None:
+            self._measurement_scheduler.observe_age(self._rtt_source, age)
         soft_stale_sec, hard_stale_sec = WANController._rtt_staleness_limits(self)
         if age > hard_stale_sec:  # Hard limit, cadence-aware for slow background producers.
             self.logger.warning(
@@ -1232,6 +1342,8 @@ class WANController:
             self._reflector_scorer.record_results(
                 {host: rtt_val is not None for host, rtt_val in snapshot.per_host_results.items()}
             )
+            if self._reflector_fleet is not None:
+                self._reflector_fleet.record_rtts(snapshot.per_host_results)
         self._persist_reflector_events()
         now = time.monotonic()
         if zero_success_cycle:
@@ -1391,6 +1503,8 @@ class WANController:
             self._reflector_scorer.record_results(
                 {host: rtt_val is not None for host, rtt_val in results.items()}
             )
+            if self._reflector_fleet is not None:
+                self._reflector_fleet.record_rtts(results)
 
         # Persist any deprioritization/recovery events
         self._persist_reflector_events()
@@ -1736,26 +1850,15 @@ class WANController:
             and self.rate_limiter is not None
             and not self.rate_limiter.can_change()
         ):
-            self._last_rate_apply_outcome = "rate_limited_no_io"
-            # Log once when entering throttled state (not every cycle)
-            if not self._rate_limit_logged:
-                wait_time = self.rate_limiter.time_until_available()
-                self.logger.debug(
-                    f"{self.wan_name}: Rate limit active "
-                    f"(>{self.rate_limiter.max_changes} changes/"
-                    f"{self.rate_limiter.window_seconds}s), throttling updates "
-                    f"(next slot in {wait_time:.1f}s)"
-                )
-                self._rate_limit_logged = True
-            if self.config.metrics_enabled:
-                record_rate_limit_event(self.wan_name)
+            self._throttle_rate_change()
             # Still return True - cycle completed, just throttled the update
-            # Save state to preserve EWMA and streak counters
-            self.save_state()
             return True
 
         # Apply to router
+        write_start = time.perf_counter()
         success = self.router.set_limits(wan=self.wan_name, down_bps=dl_rate, up_bps=ul_rate)
+        if self.config.metrics_enabled:
+            record_router_write(self.wan_name, time.perf_counter() - write_start)
         try:
             self._update_overlap_counters_on_apply_completion()
         except Exception:
@@ -1775,24 +1878,61 @@ class WANController:
         if self.config.metrics_enabled:
             record_router_update(self.wan_name)
 
-        # Linux CAKE adapters may coalesce small increases and report the actual
-        # applied kernel rates separately. Fall back to the requested values for
-        # backends that do not expose that detail.
-        applied_dl_rate, applied_ul_rate = dl_rate, ul_rate
-        applied_rates = getattr(self.router, "get_last_applied_limits", None)
-        if callable(applied_rates):
-            applied = applied_rates()
-            if isinstance(applied, tuple) and len(applied) == 2:
-                applied_dl_rate, applied_ul_rate = applied
-
         # Update tracking after successful write/coalesced apply
-        self.last_applied_dl_rate = applied_dl_rate
-        self.last_applied_ul_rate = applied_ul_rate
+        self.last_applied_dl_rate, self.last_applied_ul_rate = self._router_applied_limits(
+            dl_rate, ul_rate
+        )
         self.pending_rates.clear()
         self._last_rate_apply_outcome = "successful_contact"
         self.logger.debug(f"{self.wan_name}: Applied new limits to router")
         return True
 
+    def _throttle_rate_change(self) -> None:
+        """Skip a rate change blocked by the RateLimiter (logs once per throttle window)."""
+        assert self.rate_limiter is not None
+        self._last_rate_apply_outcome = "rate_limited_no_io"
+        # Log once when entering throttled state (not every cycle)
+        if not self._rate_limit_logged:
+            wait_time = self.rate_limiter.time_until_available()
+            self.logger.debug(
+                f"{self.wan_name}: Rate limit active "
+                f"(>{self.rate_limiter.max_changes} changes/"
+                f"{self.rate_limiter.window_seconds}s), throttling updates "
+                f"(next slot in {wait_time:.1f}s)"
+            )
+            self._rate_limit_logged = True
+        if self.config.metrics_enabled:
+            record_rate_limit_event(self.wan_name)
+        # Save state to preserve EWMA and streak counters
+        self.save_state()
+
+    def _router_applied_limits(self, dl_rate: int, ul_rate: int) -> tuple[int, int]:
+        """Return the rates actually in effect after applying (dl_rate, ul_rate).
+
+        Linux CAKE adapters may coalesce small increases and report the actual
+        applied kernel rates separately. Fall back to the requested values for
+        backends that do not expose that detail.
+        """
+        applied_rates = getattr(self.router, "get_last_applied_limits", None)
+        if callable(applied_rates):
+            applied = applied_rates()
+            if isinstance(applied, tuple) and len(applied) == 2:
+                return applied
+        return dl_rate, ul_rate
+
+    def _write_router_limits(
+        self, dl_rate: int, ul_rate: int
+    ) -> tuple[bool, tuple[int, int], dict[str, float]]:
+        """Router write performed by the async apply writer thread.
+
+        Returns (success, applied rates, per-direction write timings). Gating
+        and controller bookkeeping happen on the control thread when the
+        result is collected (_absorb_router_apply_result).
+        """
+        success = self.router.set_limits(wan=self.wan_name, down_bps=dl_rate, up_bps=ul_rate)
+        timings = self._consume_router_write_timings()
+        return success, self._router_applied_limits(dl_rate, ul_rate), timings
+
     def handle_icmp_failure(self) -> tuple[bool, float | None]:
         """
         Handle ICMP ping failure with TCP RTT fallback.
@@ -2019,17 +2159,14 @@ class WANController:
         )
         return fused
 
-    def _reload_fusion_config(self) -> None:
+    def _reload_fusion_config(self, data: dict[str, Any] | None = None) -> None:
         """Re-read fusion config from YAML (triggered by SIGUSR1).
 
         Reloads both enabled and icmp_weight. Validates with same rules as
         _load_fusion_config(). Logs old->new transitions at WARNING level.
         """
         try:
-            import yaml
-
-            with open(self.config.config_file_path) as f:
-                fresh_data = yaml.safe_load(f)
+            fresh_data = reload_data(self.config.config_file_path, data)
         except Exception as e:
             self.logger.error(f"[FUSION] Config reload failed: {e}")
             return
@@ -2110,17 +2247,14 @@ class WANController:
                         f"{self._fusion_healer._grace_period_sec:.0f}s grace period"
                     )
 
-    def _reload_tuning_config(self) -> None:
+    def _reload_tuning_config(self, data: dict[str, Any] | None = None) -> None:
         """Re-read tuning config from YAML (triggered by SIGUSR1).
 
         Reloads enabled state. Validates with same rules as
         _load_tuning_config(). Logs old->new transitions at WARNING level.
         """
         try:
-            import yaml
-
-            with open(self.config.config_file_path) as f:
-                fresh_data = yaml.safe_load(f)
+            fresh_data = reload_data(self.config.config_file_path, data)
         except Exception as e:
             self.logger.error(f"[TUNING] Config reload failed: {e}")
             return
@@ -2165,8 +2299,9 @@ class WANController:
             self._tuning_state = None
             self._parameter_locks = {}
             self._pending_observation = None
+            self._metric_window = None
 
-    def _reload_hysteresis_config(self) -> None:
+    def _reload_hysteresis_config(self, data: dict[str, Any] | None = None) -> None:
         """Re-read hysteresis config from YAML (triggered by SIGUSR1).
 
         Reloads dwell_cycles and deadband_ms from continuous_monitoring.thresholds.
@@ -2174,10 +2309,7 @@ class WANController:
         Applies to both download and upload QueueControllers.
         """
         try:
-            import yaml
-
-            with open(self.config.config_file_path) as f:
-                fresh_data = yaml.safe_load(f)
+            fresh_data = reload_data(self.config.config_file_path, data)
         except Exception as e:
             self.logger.error(f"[HYSTERESIS] Config reload failed: {e}")
             return
@@ -2240,17 +2372,14 @@ class WANController:
         self.upload.dwell_cycles = new_dwell
         self.upload.deadband_ms = new_deadband
 
-    def _reload_cycle_budget_config(self) -> None:
+    def _reload_cycle_budget_config(self, data: dict[str, Any] | None = None) -> None:
         """Re-read cycle budget warning threshold from YAML (triggered by SIGUSR1).
 
         Reads continuous_monitoring.warning_threshold_pct from YAML.
         Validates range [1.0, 200.0]. Logs old->new transitions.
         """
         try:
-            import yaml
-
-            with open(self.config.config_file_path) as f:
-                fresh_data = yaml.safe_load(f)
+            fresh_data = reload_data(self.config.config_file_path, data)
         except Exception as e:
             self.logger.error(f"[CYCLE_BUDGET] Config reload failed: {e}")
             return
@@ -2283,17 +2412,14 @@ class WANController:
         self.logger.warning("[CYCLE_BUDGET] Config reload: %s", threshold_str)
         self._warning_threshold_pct = new_threshold
 
-    def _reload_suppression_alert_config(self) -> None:
+    def _reload_suppression_alert_config(self, data: dict[str, Any] | None = None) -> None:
         """Re-read suppression alert threshold from YAML (triggered by SIGUSR1).
 
         Reads continuous_monitoring.thresholds.suppression_alert_threshold from YAML.
         Per D-03: Default 20 suppressions/min, SIGUSR1 hot-reloadable.
         """
         try:
-            import yaml
-
-            with open(self.config.config_file_path) as f:
-                fresh_data = yaml.safe_load(f)
+            fresh_data = reload_data(self.config.config_file_path, data)
         except Exception as e:
             self.logger.error(f"[HYSTERESIS] Suppression alert config reload failed: {e}")
             return
@@ -2327,7 +2453,7 @@ class WANController:
         self.logger.warning("[HYSTERESIS] Config reload: %s", threshold_str)
         self._suppression_alert_threshold = new_threshold
 
-    def _reload_asymmetry_gate_config(self) -> None:
+    def _reload_asymmetry_gate_config(self, data: dict[str, Any] | None = None) -> None:
         """Re-read asymmetry gate config from YAML (triggered by SIGUSR1).
 
         Reloads continuous_monitoring.upload.asymmetry_gate section.
@@ -2335,10 +2461,7 @@ class WANController:
         Logs old->new transitions at WARNING level for enabled changes.
         """
         try:
-            import yaml
-
-            with open(self.config.config_file_path) as f:
-                fresh_data = yaml.safe_load(f)
+            fresh_data = reload_data(self.config.config_file_path, data)
         except Exception as e:
             self.logger.error(f"[ASYMMETRY_GATE] Config reload failed: {e}")
             return
@@ -2448,9 +2571,9 @@ class WANController:
             self._asymmetry_gate_active = False
             self._asymmetry_downstream_streak = 0
 
-    def _reload_cake_signal_config(self) -> None:
+    def _reload_cake_signal_config(self, data: dict[str, Any] | None = None) -> None:
         """Re-read cake_signal config from YAML (triggered by SIGUSR1, CAKE-05)."""
-        new_config = self._parse_cake_signal_config()
+        new_config = self._parse_cake_signal_config(data)
         old_config = self._dl_cake_signal.config
 
         # Log transitions
@@ -2603,6 +2726,9 @@ class WANController:
             profile_cycle_count=self._profile_cycle_count,
         )
 
+        if self.config.metrics_enabled:
+            record_subsystem_timings("autorate", self.wan_name, timings)
+
         # Check cycle budget alert after recording profiling
         total_ms = sum(timings.values())
         self._check_cycle_budget_alert(total_ms)
@@ -2701,6 +2827,12 @@ class WANController:
                 dl_zone, dl_rate, dl_tr, ul_zone, ul_rate, ul_tr, delta = (
                     self._run_congestion_assessment()
                 )
+                if self._zone_event_publisher is not None:
+                    self._zone_event_publisher.publish_if_changed(
+                        dl_zone, ul_zone, dl_rate, ul_rate
+                    )
+                if self._measurement_scheduler is not None:
+                    self._measurement_scheduler.report_zones(self.wan_name, dl_zone, ul_zone)
             with PerfTimer("autorate_irtt_observation", self.logger) as irtt_timer:
                 irtt_result = self._run_irtt_observation(signal_result)
             with PerfTimer("autorate_logging_metrics", self.logger) as metrics_timer:
@@ -2937,6 +3069,8 @@ class WANController:
             if snapshot is not None:
                 # Staleness detection: warn at 500ms, fall through to inline at 5s
                 age_s = time.monotonic() - snapshot.timestamp
+                if self._measurement_scheduler is not None:
+                    self._measurement_scheduler.observe_age(self._cake_stats_source, age_s)
                 if age_s > 5.0:
                     self.logger.warning(
                         "%s: CAKE stats cache stale (%.1fs old) — falling back to inline",
@@ -3239,11 +3373,13 @@ class WANController:
     def _run_irtt_observation(
         self,
         signal_result: SignalResult,
-    ) -> IRTTResult | None:
+    ) -> "IRTTResult | None":
         """IRTT observation: protocol correlation, fusion healer, asymmetry, loss alerts."""
         irtt_result = self._irtt_thread.get_latest() if self._irtt_thread else None
         if irtt_result is not None:
             age = time.monotonic() - irtt_result.timestamp
+            if self._measurement_scheduler is not None:
+                self._measurement_scheduler.observe_age(IRTT_SCHEDULE_SOURCE, age)
             cadence = self._irtt_thread.cadence_sec if self._irtt_thread else 10.0
             self.logger.debug(
                 f"{self.wan_name}: IRTT RTT={irtt_result.rtt_mean_ms:.1f}ms, "
@@ -3294,7 +3430,7 @@ class WANController:
     def _tick_fusion_healer(
         self,
         filtered_rtt: float,
-        irtt_result: IRTTResult,
+        irtt_result: "IRTTResult",
     ) -> None:
         """Feed ICMP/IRTT deltas to fusion healer on new IRTT measurements."""
         if self._fusion_healer is None or irtt_result.timestamp == self._prev_irtt_ts:
@@ -3344,7 +3480,7 @@ class WANController:
         delta: float,
         dl_transition_reason: str | None,
         ul_transition_reason: str | None,
-        irtt_result: IRTTResult | None,
+        irtt_result: "IRTTResult | None",
     ) -> None:
         """Logging and metrics subsystem: cycle log, SQLite history recording."""
         if self.logger.isEnabledFor(logging.DEBUG):
@@ -3472,7 +3608,7 @@ class WANController:
             )
 
     def _append_irtt_metrics(
-        self, ts: int, metrics_batch: list, irtt_result: IRTTResult | None
+        self, ts: int, metrics_batch: list, irtt_result: "IRTTResult | None"
     ) -> None:
         """Append IRTT and asymmetry metrics when a fresh result is available."""
         if irtt_result is not None and irtt_result.timestamp != self._last_irtt_write_ts:
@@ -3817,6 +3953,16 @@ class WANController:
             "autorate_router_write_skipped": 0.0,
             "autorate_router_write_fallback": 0.0,
         }
+        if self._router_apply_thread is not None:
+            routed = self._route_to_router_apply_thread(dl_rate, ul_rate, breakdown)
+            if routed is not None:
+                return routed
+        return self._run_router_communication_sync(dl_rate, ul_rate, breakdown)
+
+    def _run_router_communication_sync(
+        self, dl_rate: int, ul_rate: int, breakdown: dict[str, float]
+    ) -> tuple[bool, dict[str, float]]:
+        """Apply rates on the control thread, replaying pending rates after outages."""
         try:
             with PerfTimer("autorate_router_apply_primary") as primary_timer:
                 primary_ok = self.apply_rate_changes_if_needed(dl_rate, ul_rate)
@@ -3895,6 +4041,102 @@ class WANController:
 
         return False, breakdown  # router_failed = False
 
+    def _route_to_router_apply_thread(
+        self, dl_rate: int, ul_rate: int, breakdown: dict[str, float]
+    ) -> tuple[bool, dict[str, float]] | None:
+        """Hand the cycle to the async writer, or return None to apply synchronously.
+
+        Pending-rate replay and recovery probes after an outage stay on the
+        control thread, so the writer is only used while the router is
+        reachable and nothing is queued.
+        """
+        assert self._router_apply_thread is not None
+        if self.router_connectivity.is_reachable and not self.pending_rates.has_pending():
+            return self._run_router_communication_async(dl_rate, ul_rate, breakdown)
+        self._router_apply_thread.cancel_pending()
+        if self._router_apply_thread.busy:
+            # Never write from both threads: hold the target until the
+            # writer finishes, then recovery continues synchronously
+            self.pending_rates.queue(dl_rate, ul_rate)
+            return True, breakdown
+        return None
+
+    def _run_router_communication_async(
+        self, dl_rate: int, ul_rate: int, breakdown: dict[str, float]
+    ) -> tuple[bool, dict[str, float]]:
+        """Async router apply: absorb the writer's last result, then post the new target.
+
+        Flash wear and rate limiting are decided here exactly as in
+        apply_rate_changes_if_needed(), comparing against the newest target
+        that is posted or in flight rather than only the last acknowledged one.
+        """
+        assert self._router_apply_thread is not None
+        writer = self._router_apply_thread
+        with PerfTimer("autorate_router_apply_primary") as primary_timer:
+            result = writer.collect()
+            if result is not None and not self._absorb_router_apply_result(result):
+                writer.cancel_pending()
+                breakdown["autorate_router_apply_primary"] = primary_timer.elapsed_ms
+                return True, breakdown  # router_failed = True
+
+            target = writer.pending_target() or (
+                self.last_applied_dl_rate,
+                self.last_applied_ul_rate,
+            )
+            if (dl_rate, ul_rate) == target:
+                # PROTECTED: Flash wear protection - only post changed rates
+                self._last_rate_apply_outcome = "unchanged_no_io"
+            elif self.rate_limiter is not None and not self.rate_limiter.can_change():
+                self._throttle_rate_change()
+            else:
+                writer.post(dl_rate, ul_rate)
+                self._last_rate_apply_outcome = "posted"
+        breakdown["autorate_router_apply_primary"] = primary_timer.elapsed_ms
+        return False, breakdown
+
+    def _absorb_router_apply_result(self, result: RouterApplyResult) -> bool:
+        """Apply the bookkeeping of a completed async apply on the control thread.
+
+        Every write since the previous collect counts: each success against
+        the rate limiter and each failure against router connectivity, even
+        though only the newest result's rates are adopted.
+
+        Returns:
+            True if the newest apply succeeded, False if it failed (recorded
+            as a router failure, like a failed synchronous apply)
+        """
+        if self.config.metrics_enabled:
+            record_router_write(self.wan_name, result.apply_ms / 1000.0)
+        try:
+            self._update_overlap_counters_on_apply_completion()
+        except Exception:
+            self.logger.debug("overlap counter update failed", exc_info=True)
+        if result.apply_ms >= SLOW_ROUTER_APPLY_LOG_MS:
+            slow_breakdown = {"autorate_router_apply_primary": result.apply_ms}
+            slow_breakdown.update(result.write_timings)
+            self._log_slow_router_apply(
+                result.apply_ms, result.dl_rate, result.ul_rate, slow_breakdown
+            )
+
+        for _ in range(result.applied_writes):
+            if self.rate_limiter is not None:
+                self.rate_limiter.record_change()
+            if self.config.metrics_enabled:
+                record_router_update(self.wan_name)
+        if result.failed_writes:
+            self.logger.error(f"{self.wan_name}: Failed to apply limits")
+            error = result.error or ConnectionError("Failed to apply rate limits to router")
+            for _ in range(result.failed_writes):
+                self.router_connectivity.record_failure(error)
+        if not result.success:
+            return False
+
+        self._rate_limit_logged = False
+        self.last_applied_dl_rate = result.applied_dl_rate
+        self.last_applied_ul_rate = result.applied_ul_rate
+        self.router_connectivity.record_success()
+        return True
+
     def _run_post_cycle(
         self,
         cycle_start: float,
@@ -4149,7 +4391,7 @@ class WANController:
         )
         self._burst_transition_timestamps.clear()
 
-    def _check_irtt_loss_alerts(self, irtt_result: IRTTResult) -> None:
+    def _check_irtt_loss_alerts(self, irtt_result: "IRTTResult") -> None:
         """Check sustained IRTT packet loss and fire alerts (ALRT-01, ALRT-02, ALRT-03).
 
         Called each run_cycle() when IRTT result is fresh (within 3x cadence).
@@ -4468,26 +4710,71 @@ class WANController:
     # =========================================================================
 
     def reload(self) -> None:
-        """Reload all hot-reloadable config sections (SIGUSR1 handler)."""
-        self._reload_fusion_config()
-        self._reload_tuning_config()
-        self._reload_hysteresis_config()
-        self._reload_cycle_budget_config()
-        self._reload_suppression_alert_config()
-        self._reload_asymmetry_gate_config()
-        self._reload_cake_signal_config()  # Phase 159, CAKE-05
+        """Reload hot-reloadable config sections (SIGUSR1 handler).
+
+        The file is parsed once into a ConfigSnapshot. Kill-switch sections
+        (fusion, tuning, asymmetry gate, CAKE signal) are always re-applied:
+        their runtime state can drift from the YAML (healer suspension,
+        tuning locks, gate streaks), and SIGUSR1 with an unchanged file is how
+        operators force it back. The remaining subsystems only reload when
+        their sections changed since the last applied snapshot; without a
+        previous snapshot every subsystem reloads.
+        """
+        try:
+            snapshot = load_config_snapshot(self.config.config_file_path)
+        except Exception as e:
+            self.logger.error(f"Config reload failed: {e}")
+            return
+        previous = getattr(self, "_config_snapshot", None)
+
+        data = snapshot.as_dict()
+        kill_switches: tuple[Callable[[dict[str, Any]], None], ...] = (
+            self._reload_fusion_config,
+            self._reload_tuning_config,
+            self._reload_asymmetry_gate_config,
+            self._reload_cake_signal_config,  # Phase 159, CAKE-05
+        )
+        reloaders: tuple[tuple[Callable[[dict[str, Any]], None], tuple[str, ...]], ...] = (
+            (self._reload_hysteresis_config, ("continuous_monitoring.thresholds",)),
+            (self._reload_cycle_budget_config, ("continuous_monitoring.warning_threshold_pct",)),
+            (self._reload_suppression_alert_config, ("continuous_monitoring.thresholds",)),
+        )
+        for kill_switch in kill_switches:
+            kill_switch(data)
+        ran = len(kill_switches)
+        for reloader, paths in reloaders:
+            if snapshot.changed(previous, *paths):
+                reloader(data)
+                ran += 1
+        self._config_snapshot = snapshot
+        self.logger.info(
+            f"Config reload: {ran}/{len(kill_switches) + len(reloaders)} subsystems "
+            f"reconfigured (config {snapshot.content_hash[:12]})"
+        )
 
     def shutdown_threads(self) -> None:
-        """Stop background threads (RTT thread and thread pool)."""
+        """Stop background threads (RTT thread, router apply writer and thread pool)."""
+        if self._router_apply_thread is not None:
+            # Let the last posted target land before the writer exits
+            self._router_apply_thread.wait_idle(timeout=1.0)
+            self._router_apply_thread.stop()
         if self._rtt_thread is not None:
             self._rtt_thread.stop()
+        if self._reflector_fleet is not None:
+            self._reflector_fleet.stop()
         if self._rtt_pool is not None:
             self._rtt_pool.shutdown(wait=True, cancel_futures=True)
+        if self._zone_event_publisher is not None:
+            self._zone_event_publisher.close()
 
     def set_irtt_thread(self, thread: "IRTTThread") -> None:
         """Set the IRTT measurement thread reference."""
         self._irtt_thread = thread
 
+    def set_measurement_scheduler(self, scheduler: MeasurementScheduler | None) -> None:
+        """Set the shared measurement scheduler (before start_background_*)."""
+        self._measurement_scheduler = scheduler
+
     def enable_profiling(self, enabled: bool = True) -> None:
         """Enable or disable cycle profiling."""
         self._profiling_enabled = enabled
@@ -4508,6 +4795,25 @@ class WANController:
         """Clear the pending tuning observation."""
         self._pending_observation = None
 
+    def get_metric_window(
+        self,
+        db_path: str,
+        lookback_hours: int,
+        max_age_sec: int | None = None,
+    ) -> MetricWindow:
+        """Get this WAN's shared tuning metric window, creating it on first use.
+
+        The window is rebuilt if the database path changes; a changed
+        lookback or retention only resizes it.
+        """
+        window = self._metric_window
+        if window is None or window.db_path != str(db_path):
+            window = MetricWindow(db_path, self.wan_name, lookback_hours, max_age_sec)
+            self._metric_window = window
+        else:
+            window.configure(lookback_hours, max_age_sec)
+        return window
+
     def get_parameter_locks(self) -> dict[str, float]:
         """Get the current parameter locks dict (reference, not copy)."""
         return self._parameter_locks
@@ -4564,6 +4870,9 @@ class WANController:
             self._cake_stats_thread.get_latest() if self._cake_stats_thread is not None else None
         )
         irtt_latest = self._irtt_thread.get_latest() if self._irtt_thread is not None else None
+        zone_publisher = getattr(self, "_zone_event_publisher", None)
+        transport_stats = getattr(self.router, "get_transport_stats", None)
+        router_transport = transport_stats() if callable(transport_stats) else None
         rtt_backend_status = self._rtt_backend_status
         backend_active = (
             getattr(rtt_backend_status, "backend_active", "icmplib")
@@ -4612,6 +4921,11 @@ class WANController:
             },
             "reflector": {
                 "scorer": self._reflector_scorer,
+                "fleet": (
+                    self._reflector_fleet.get_fleet_status()
+                    if self._reflector_fleet is not None
+                    else None
+                ),
             },
             "fusion": {
                 "enabled": self._fusion_enabled,
@@ -4701,6 +5015,9 @@ class WANController:
                 "state": self._tuning_state,
                 "parameter_locks": self._parameter_locks,
                 "pending_observation": self._pending_observation,
+                "window": (
+                    self._metric_window.get_status() if self._metric_window is not None else None
+                ),
             },
             "suppression_alert": {
                 "threshold": self._suppression_alert_threshold,
@@ -4777,6 +5094,30 @@ class WANController:
             },
             "storage": storage_snapshot,
             "storage_files": storage_files,
+            "zone_events": (
+                zone_publisher.get_health_data() if zone_publisher is not None else None
+            ),
+            "router_transport": router_transport if isinstance(router_transport, dict) else None,
+            "router_apply": self._router_apply_health(),
+            "measurement_schedule": (
+                self._measurement_scheduler.get_status(self.wan_name)
+                if self._measurement_scheduler is not None
+                else None
+            ),
+        }
+
+    def _router_apply_health(self) -> dict[str, Any] | None:
+        """Return async router apply writer status, or None in sync mode."""
+        writer = self._router_apply_thread
+        if writer is None:
+            return None
+        return {
+            "mode": "async",
+            "acknowledged_dl_rate": self.last_applied_dl_rate,
+            "acknowledged_ul_rate": self.last_applied_ul_rate,
+            "pending_target": writer.pending_target(),
+            "stats": writer.get_profile_stats(),
+            **writer.get_status(),
         }
 
     @handle_errors(error_msg="{self.wan_name}: Could not load state: {exception}")
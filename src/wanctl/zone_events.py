@@ -0,0 +1,271 @@
+"""Autorate zone transition events for event-driven steering.
+
+Autorate persists its congestion zone to the state file at most once per
+MIN_SAVE_INTERVAL_SEC, and steering only re-reads that file on its own
+measurement tick. A RED transition can therefore take several seconds to
+reach the steering state machine.
+
+This module adds a push path alongside the state file:
+
+- ZoneEventPublisher (autorate side): sends one small JSON datagram over a
+  Unix datagram socket whenever the DL or UL zone changes. Sending is
+  non-blocking and fire-and-forget -- if steering is not running, the
+  datagram is dropped and the control loop never waits.
+- ZoneEventListener (steering side): binds the socket and lets the daemon
+  loop sleep until either the periodic tick expires or an event arrives.
+
+The state file stays authoritative for baseline RTT. Events only shorten
+the time it takes steering to observe a zone change.
+"""
+
+import dataclasses
+import errno
+import json
+import logging
+import os
+import select
+import socket
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from wanctl.path_utils import ensure_file_directory
+
+DEFAULT_ZONE_EVENT_SOCKET = "/run/wanctl/steering-events.sock"
+
+# Upper bound for one encoded event. Real payloads are ~150 bytes.
+MAX_EVENT_BYTES = 1024
+
+# Listener wait slice: bounds shutdown latency without a self-pipe.
+# Signal handlers only set the shutdown Event, and select() is restarted
+# after EINTR (PEP 475), so the wait must re-check the event periodically.
+_SHUTDOWN_POLL_SEC = 0.25
+
+_VALID_ZONES = frozenset({"GREEN", "YELLOW", "SOFT_RED", "RED"})
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class ZoneEvent:
+    """One autorate zone transition.
+
+    Attributes:
+        wan_name: Autorate WAN name (matches steering topology.primary_wan)
+        dl_state: Download congestion zone after the transition
+        ul_state: Upload congestion zone after the transition
+        dl_rate_bps: Download rate chosen in the same cycle
+        ul_rate_bps: Upload rate chosen in the same cycle
+        timestamp: Wall-clock send time (comparable to state file mtime)
+    """
+
+    wan_name: str
+    dl_state: str
+    ul_state: str
+    dl_rate_bps: int
+    ul_rate_bps: int
+    timestamp: float
+
+    def encode(self) -> bytes:
+        """Serialize to a compact JSON datagram."""
+        return json.dumps(dataclasses.asdict(self), separators=(",", ":")).encode()
+
+    @classmethod
+    def decode(cls, payload: bytes) -> "ZoneEvent | None":
+        """Parse a datagram, returning None for anything malformed.
+
+        The socket is local-only, but the listener still treats every
+        datagram as untrusted input: unknown zones and wrong types are
+        dropped instead of reaching the steering state machine.
+        """
+        try:
+            data: Any = json.loads(payload.decode())
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            return None
+        if not isinstance(data, dict):
+            return None
+        wan_name = data.get("wan_name")
+        dl_state = data.get("dl_state")
+        ul_state = data.get("ul_state")
+        if not isinstance(wan_name, str) or not wan_name:
+            return None
+        if dl_state not in _VALID_ZONES or ul_state not in _VALID_ZONES:
+            return None
+        try:
+            return cls(
+                wan_name=wan_name,
+                dl_state=dl_state,
+                ul_state=ul_state,
+                dl_rate_bps=int(data.get("dl_rate_bps", 0)),
+                ul_rate_bps=int(data.get("ul_rate_bps", 0)),
+                timestamp=float(data.get("timestamp", 0.0)),
+            )
+        except (TypeError, ValueError):
+            return None
+
+
+class ZoneEventPublisher:
+    """Fire-and-forget zone transition publisher (autorate side).
+
+    Only zone changes are sent, so the datagram rate is bounded by the
+    transition rate rather than the 50ms cycle rate. Send failures are
+    counted and logged once per failure streak; they never raise into the
+    control loop.
+    """
+
+    def __init__(self, socket_path: str, wan_name: str, logger: logging.Logger):
+        self.socket_path = socket_path
+        self.wan_name = wan_name
+        self.logger = logger
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._sock.setblocking(False)
+        self._last_zones: tuple[str, str] | None = None
+        self._send_failure_logged = False
+        self.events_sent = 0
+        self.send_failures = 0
+
+    def publish_if_changed(self, dl_zone: str, ul_zone: str, dl_rate: int, ul_rate: int) -> bool:
+        """Publish an event when (dl_zone, ul_zone) differs from the last call.
+
+        Returns:
+            True if a datagram was sent, False if unchanged or send failed.
+        """
+        zones = (dl_zone, ul_zone)
+        if zones == self._last_zones:
+            return False
+        self._last_zones = zones
+        event = ZoneEvent(
+            wan_name=self.wan_name,
+            dl_state=dl_zone,
+            ul_state=ul_zone,
+            dl_rate_bps=int(dl_rate),
+            ul_rate_bps=int(ul_rate),
+            timestamp=time.time(),
+        )
+        return self._send(event)
+
+    def _send(self, event: ZoneEvent) -> bool:
+        try:
+            self._sock.sendto(event.encode(), self.socket_path)
+        except OSError as e:
+            # ENOENT/ECONNREFUSED: steering not running. EAGAIN: receiver
+            # backlog full. Either way the state file still carries the zone.
+            self.send_failures += 1
+            if not self._send_failure_logged:
+                self.logger.debug(
+                    f"{self.wan_name}: zone event not delivered to {self.socket_path}: {e}"
+                )
+                self._send_failure_logged = True
+            return False
+        self.events_sent += 1
+        self._send_failure_logged = False
+        return True
+
+    def get_health_data(self) -> dict[str, Any]:
+        """Publisher counters for the autorate health endpoint."""
+        return {
+            "socket_path": self.socket_path,
+            "events_sent": self.events_sent,
+            "send_failures": self.send_failures,
+        }
+
+    def close(self) -> None:
+        """Close the publisher socket."""
+        self._sock.close()
+
+
+class ZoneEventListener:
+    """Unix datagram listener that wakes the steering loop (steering side).
+
+    Owns the socket file: a stale file left by a previous run is removed
+    on open(), and the file is unlinked again on close().
+    """
+
+    def __init__(self, socket_path: str, logger: logging.Logger):
+        self.socket_path = socket_path
+        self.logger = logger
+        self._sock: socket.socket | None = None
+        self.events_received = 0
+        self.events_rejected = 0
+        self.wakeups = 0
+
+    def open(self) -> None:
+        """Bind the listener socket (replacing any stale socket file)."""
+        path = Path(self.socket_path)
+        ensure_file_directory(path)
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sock.bind(self.socket_path)
+        os.chmod(self.socket_path, 0o660)
+        sock.setblocking(False)
+        self._sock = sock
+        self.logger.info(f"Zone event listener bound to {self.socket_path}")
+
+    def close(self) -> None:
+        """Close the socket and remove the socket file."""
+        if self._sock is None:
+            return
+        self._sock.close()
+        self._sock = None
+        try:
+            Path(self.socket_path).unlink()
+        except OSError:
+            pass
+
+    def wait(self, timeout: float, shutdown_event: threading.Event) -> list[ZoneEvent]:
+        """Sleep until a zone event arrives, shutdown, or timeout.
+
+        Args:
+            timeout: Maximum seconds to wait (the periodic tick remainder)
+            shutdown_event: Daemon shutdown event; checked between wait slices
+
+        Returns:
+            Events drained from the socket (empty on timeout or shutdown).
+        """
+        if self._sock is None:
+            shutdown_event.wait(timeout=timeout)
+            return []
+        deadline = time.monotonic() + max(0.0, timeout)
+        while not shutdown_event.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return []
+            readable, _, _ = select.select([self._sock], [], [], min(remaining, _SHUTDOWN_POLL_SEC))
+            if readable:
+                events = self.drain()
+                if events:
+                    self.wakeups += 1
+                    return events
+        return []
+
+    def drain(self) -> list[ZoneEvent]:
+        """Read every pending datagram without blocking."""
+        events: list[ZoneEvent] = []
+        if self._sock is None:
+            return events
+        while True:
+            try:
+                payload = self._sock.recv(MAX_EVENT_BYTES)
+            except OSError as e:
+                if e.errno not in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    self.logger.debug(f"Zone event recv failed: {e}")
+                break
+            event = ZoneEvent.decode(payload)
+            if event is None:
+                self.events_rejected += 1
+                continue
+            events.append(event)
+        self.events_received += len(events)
+        return events
+
+    def get_health_data(self) -> dict[str, Any]:
+        """Listener counters for the steering health endpoint."""
+        return {
+            "socket_path": self.socket_path,
+            "bound": self._sock is not None,
+            "events_received": self.events_received,
+            "events_rejected": self.events_rejected,
+            "wakeups": self.wakeups,
+        }
@@ -204,6 +204,41 @@ class TestSetLimits:
         self.dl_backend.set_bandwidth.assert_called_once_with(queue="", rate_bps=55_000_000)
         assert adapter.get_last_applied_limits() == (55_000_000, 10_000_000)
 
+    def test_concurrent_directions_write_upload_on_its_own_thread(self):
+        import threading
+
+        dl_started = threading.Event()
+        ul_started = threading.Event()
+
+        def write_download(queue, rate_bps):
+            dl_started.set()
+            # Upload must start while download is still in progress
+            return ul_started.wait(timeout=5.0)
+
+        def write_upload(queue, rate_bps):
+            ul_started.set()
+            return dl_started.wait(timeout=5.0)
+
+        self.dl_backend.set_bandwidth.side_effect = write_download
+        self.ul_backend.set_bandwidth.side_effect = write_upload
+        self.dl_backend._last_write_elapsed_ms = 3.0
+        self.ul_backend._last_write_elapsed_ms = 2.0
+        self.dl_backend._last_write_used_fallback = False
+        self.ul_backend._last_write_used_fallback = False
+        self.dl_backend._last_write_skipped = False
+        self.ul_backend._last_write_skipped = False
+        self.adapter.enable_concurrent_directions()
+
+        try:
+            assert self.adapter.set_limits("att", 50_000_000, 10_000_000) is True
+        finally:
+            self.adapter.close()
+
+        assert self.adapter.get_last_applied_limits() == (50_000_000, 10_000_000)
+        stats = self.adapter.consume_last_set_limits_stats()
+        assert stats["autorate_router_write_download"] == 3.0
+        assert stats["autorate_router_write_upload"] == 2.0
+
 
 class TestFromConfig:
     """Test from_config() factory creates backends and initializes CAKE."""
@@ -362,6 +397,51 @@ class TestFromConfig:
         assert adapter._last_set_up_bps == 18_000_000
 
 
+class TestMakeBackend:
+    """Backend selection per direction qdisc mode and transport."""
+
+    def _make_config(self, transport: str):
+        config = MagicMock()
+        config.router_transport = transport
+        config.data = {
+            "cake_params": {
+                "download_interface": "ens28",
+                "upload_interface": "ens27",
+                "upload_qdisc": "htb_fq_codel",
+            },
+        }
+        return config
+
+    def test_netlink_transport_uses_netlink_htb_backend(self):
+        from wanctl.backends.linux_cake_adapter import _make_backend
+        from wanctl.backends.netlink_cake import NetlinkCakeBackend, NetlinkHtbFqCodelBackend
+
+        config = self._make_config("linux-cake-netlink")
+
+        assert type(_make_backend(config, "download")) is NetlinkCakeBackend
+        assert type(_make_backend(config, "upload")) is NetlinkHtbFqCodelBackend
+
+    def test_subprocess_transport_keeps_tc_htb_backend(self):
+        from wanctl.backends.linux_cake import LinuxHtbFqCodelBackend
+        from wanctl.backends.linux_cake_adapter import _make_backend
+
+        backend = _make_backend(self._make_config("linux-cake"), "upload")
+
+        assert type(backend) is LinuxHtbFqCodelBackend
+
+    def test_get_transport_stats_reports_both_directions(self):
+        dl_backend = MagicMock()
+        dl_backend.get_transport_stats.return_value = {"transport": "netlink"}
+        ul_backend = MagicMock()
+        ul_backend.get_transport_stats.return_value = {"transport": "tc"}
+        adapter = LinuxCakeAdapter(dl_backend, ul_backend, MagicMock())
+
+        assert adapter.get_transport_stats() == {
+            "download": {"transport": "netlink"},
+            "upload": {"transport": "tc"},
+        }
+
+
 class TestDaemonWiring:
     """Test that ContinuousAutoRate branches on router_transport."""
 
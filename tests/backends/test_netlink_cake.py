@@ -22,11 +22,14 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from wanctl.backends.linux_cake import LinuxCakeBackend
+from wanctl.backends.linux_cake import LinuxCakeBackend, LinuxHtbFqCodelBackend
 from wanctl.backends.netlink_cake import (
     _DIFFSERV_NAME_TO_INT,
     _VALIDATE_KEY_TO_TCA,
     NetlinkCakeBackend,
+    NetlinkHtbFqCodelBackend,
+    SharedIPRoute,
+    _parse_size_bytes,
 )
 
 # =============================================================================
@@ -1264,6 +1267,41 @@ class TestGetQueueStats:
         assert result["tins"] == []
         assert result["ecn_marked"] == 0
 
+    @patch("wanctl.backends.netlink_cake.IPRoute")
+    def test_tin_stats_read_from_nla_attrs_list(self, MockIPRoute, backend):
+        """pyroute2-shaped tins (dict with an attrs list) fill tin_stats in one pass."""
+
+        class _AttrsNla(dict):
+            def get_attr(self, key):
+                raise AssertionError(f"get_attr({key}) on a tin with an attrs list")
+
+        tins = {
+            f"TCA_CAKE_TIN_STATS_{i}": _AttrsNla(
+                attrs=[("TCA_CAKE_TIN_STATS_THRESHOLD_RATE64", 0), *td.items()]
+            )
+            for i, td in enumerate(_TIN_DATA, start=1)
+        }
+        app = _make_mock_stats_app()
+        container = MagicMock()
+        container.get_attr.side_effect = lambda key: tins.get(key)
+        app.get_attr.side_effect = lambda key: (
+            container if key == "TCA_CAKE_STATS_TIN_STATS" else 0
+        )
+        mock_instance = MagicMock()
+        mock_instance.link_lookup.return_value = [42]
+        mock_instance.tc.return_value = [
+            _make_mock_cake_dump_msg(_make_mock_stats2(app=app))
+        ]
+        MockIPRoute.return_value = mock_instance
+
+        result = backend.get_queue_stats("q")
+
+        assert result is not None
+        assert result["tin_stats"].count == 4
+        assert list(result["tin_stats"].column("dropped_packets")) == [2, 5, 0, 0]
+        assert result["tins"][1]["backlog_bytes"] == 500
+        assert result["ecn_marked"] == 4
+
 
 # =============================================================================
 # TestStatsContractParity (NLNK-04)
@@ -1416,3 +1454,314 @@ class TestStatsContractParity:
         ):
             for key in nl_tin:
                 assert nl_tin[key] == sp_tin[key], f"Mismatch on tin[{i}].{key}"
+
+
+# =============================================================================
+# TestSharedIPRoute
+# =============================================================================
+
+
+class TestSharedIPRoute:
+    """Process-wide shared netlink socket and tc fallback counters."""
+
+    @patch("wanctl.backends.netlink_cake.IPRoute")
+    def test_backends_share_one_socket(self, MockIPRoute, mock_logger):
+        mock_instance = MagicMock()
+        mock_instance.link_lookup.side_effect = lambda ifname: {"dl": [1], "ul": [2]}[ifname]
+        MockIPRoute.return_value = mock_instance
+        shared = SharedIPRoute()
+
+        dl = NetlinkCakeBackend(interface="dl", logger=mock_logger, iproute=shared)
+        ul = NetlinkCakeBackend(interface="ul", logger=mock_logger, iproute=shared)
+        dl.set_bandwidth("", 500_000_000)
+        ul.set_bandwidth("", 40_000_000)
+
+        MockIPRoute.assert_called_once_with(groups=0)
+        assert (dl._ifindex, ul._ifindex) == (1, 2)
+        assert mock_instance.tc.call_count == 2
+
+    @patch("wanctl.backends.netlink_cake.IPRoute")
+    def test_dump_response_materialized_under_lock(self, MockIPRoute):
+        mock_instance = MagicMock()
+        mock_instance.tc.return_value = iter(["a", "b"])
+        MockIPRoute.return_value = mock_instance
+
+        assert SharedIPRoute().tc("dump") == ["a", "b"]
+
+    @patch("wanctl.backends.netlink_cake.IPRoute")
+    def test_close_reopens_on_next_request(self, MockIPRoute):
+        MockIPRoute.side_effect = [MagicMock(), MagicMock()]
+        shared = SharedIPRoute()
+
+        shared.tc("dump")
+        shared.close()
+        shared.tc("dump")
+
+        assert MockIPRoute.call_count == 2
+        assert shared.opens == 2
+
+    @patch("wanctl.backends.netlink_cake.IPRoute")
+    def test_invalidate_closes_failed_socket_once(self, MockIPRoute):
+        dead, fresh = MagicMock(), MagicMock()
+        dead.tc.side_effect = OSError("socket closed")
+        MockIPRoute.side_effect = [dead, fresh]
+        shared = SharedIPRoute()
+
+        with pytest.raises(OSError):
+            shared.tc("dump")
+        shared.invalidate()
+        shared.tc("dump")
+        shared.invalidate()  # late reset left over from the old failure
+        shared.tc("dump")
+
+        dead.close.assert_called_once()
+        fresh.close.assert_not_called()
+        assert shared.opens == 2
+
+    @patch("wanctl.backends.netlink_cake.IPRoute")
+    @patch.object(LinuxCakeBackend, "set_bandwidth", return_value=True)
+    def test_socket_failure_reopens_once_for_all_backends(
+        self, mock_super_set, MockIPRoute, mock_logger
+    ):
+        dead, fresh = MagicMock(), MagicMock()
+        for sock in (dead, fresh):
+            sock.link_lookup.side_effect = lambda ifname: {"dl": [1], "ul": [2]}[ifname]
+        dead.tc.side_effect = OSError("socket closed")
+        MockIPRoute.side_effect = [dead, fresh]
+        shared = SharedIPRoute()
+        dl = NetlinkCakeBackend(interface="dl", logger=mock_logger, iproute=shared)
+        ul = NetlinkCakeBackend(interface="ul", logger=mock_logger, iproute=shared)
+        dl._get_ipr()
+        ul._get_ipr()
+
+        dl.set_bandwidth("", 500_000_000)
+        ul.set_bandwidth("", 40_000_000)
+
+        mock_super_set.assert_called_once()
+        dead.close.assert_called_once()
+        fresh.tc.assert_called_once()
+        assert MockIPRoute.call_count == 2
+
+    @patch("wanctl.backends.netlink_cake.IPRoute")
+    def test_reset_keeps_healthy_shared_socket(self, MockIPRoute, mock_logger):
+        mock_instance = MagicMock()
+        mock_instance.link_lookup.side_effect = lambda ifname: {"dl": [1], "ul": [2]}[ifname]
+        MockIPRoute.return_value = mock_instance
+        shared = SharedIPRoute()
+        dl = NetlinkCakeBackend(interface="dl", logger=mock_logger, iproute=shared)
+        ul = NetlinkCakeBackend(interface="ul", logger=mock_logger, iproute=shared)
+        dl.set_bandwidth("", 500_000_000)
+        ul.set_bandwidth("", 40_000_000)
+
+        dl._reset_ipr()
+        dl.close()
+        ul.set_bandwidth("", 30_000_000)
+
+        mock_instance.close.assert_not_called()
+        MockIPRoute.assert_called_once_with(groups=0)
+        assert dl._ipr is None
+
+    @patch("wanctl.backends.netlink_cake.IPRoute")
+    @patch.object(LinuxCakeBackend, "set_bandwidth", return_value=True)
+    def test_fallbacks_counted_per_operation(self, mock_super_set, MockIPRoute, backend):
+        mock_instance = MagicMock()
+        mock_instance.link_lookup.return_value = [42]
+        mock_instance.tc.side_effect = OSError("socket error")
+        MockIPRoute.return_value = mock_instance
+
+        backend.set_bandwidth("", 500_000_000)
+        backend.set_bandwidth("", 400_000_000)
+
+        stats = backend.get_transport_stats()
+        assert stats["transport"] == "netlink"
+        assert stats["tc_fallbacks"] == 2
+        assert stats["tc_fallbacks_by_operation"] == {"set_bandwidth": 2}
+
+    def test_subprocess_backend_reports_tc_transport(self):
+        stats = LinuxCakeBackend(interface="eth0").get_transport_stats()
+        assert stats["transport"] == "tc"
+        assert stats["tc_fallbacks"] == 0
+
+    def test_from_config_uses_process_shared_socket(self):
+        config = MagicMock()
+        config.data = {"cake_params": {"download_interface": "dl", "upload_interface": "ul"}}
+
+        dl = NetlinkCakeBackend.from_config(config, direction="download")
+        ul = NetlinkHtbFqCodelBackend.from_config(config, direction="upload")
+
+        assert dl._shared_ipr is not None
+        assert dl._shared_ipr is ul._shared_ipr
+
+
+# =============================================================================
+# TestNetlinkHtbFqCodelBackend
+# =============================================================================
+
+
+def _make_mock_fq_codel_dump_msg() -> MagicMock:
+    stats2 = _make_mock_stats2(app=None)
+    msg_attrs = {"TCA_KIND": "fq_codel", "TCA_STATS2": stats2}
+    msg = MagicMock()
+    msg.get_attr.side_effect = lambda key: msg_attrs.get(key)
+    return msg
+
+
+@pytest.fixture
+def htb_backend(mock_logger):
+    return NetlinkHtbFqCodelBackend(interface="eth0", logger=mock_logger)
+
+
+class TestNetlinkHtbFqCodelBackend:
+    """HTB class change, fq_codel stats and init/readback over netlink."""
+
+    def test_is_htb_backend(self, htb_backend):
+        assert isinstance(htb_backend, LinuxHtbFqCodelBackend)
+        assert htb_backend._htb_burst == "256k"
+
+    @pytest.mark.parametrize(
+        ("raw", "expected"), [("256k", 262144), ("1mb", 1048576), ("1500", 1500), ("64b", 64)]
+    )
+    def test_parse_size_bytes(self, raw, expected):
+        assert _parse_size_bytes(raw) == expected
+
+    @patch("wanctl.backends.netlink_cake.IPRoute")
+    def test_set_bandwidth_changes_htb_class(self, MockIPRoute, htb_backend):
+        mock_instance = MagicMock()
+        mock_instance.link_lookup.return_value = [42]
+        MockIPRoute.return_value = mock_instance
+
+        assert htb_backend.set_bandwidth("", 35_000_000) is True
+        mock_instance.tc.assert_called_once_with(
+            "change-class",
+            kind="htb",
+            index=42,
+            handle=0x10010,
+            parent=0x10000,
+            rate="35000kbit",
+            ceil="35000kbit",
+            burst=262144,
+            cburst=262144,
+        )
+        assert htb_backend._last_bandwidth_bps == 35_000_000
+        assert htb_backend._last_write_used_fallback is False
+
+    @patch("wanctl.backends.netlink_cake.IPRoute")
+    def test_set_bandwidth_skips_no_op(self, MockIPRoute, htb_backend):
+        mock_instance = MagicMock()
+        mock_instance.link_lookup.return_value = [42]
+        MockIPRoute.return_value = mock_instance
+
+        htb_backend.set_bandwidth("", 35_000_000)
+        htb_backend.set_bandwidth("", 35_000_500)
+
+        assert mock_instance.tc.call_count == 1
+        assert htb_backend._last_write_skipped is True
+
+    @patch("wanctl.backends.netlink_cake.IPRoute")
+    @patch.object(LinuxHtbFqCodelBackend, "set_bandwidth", return_value=True)
+    def test_set_bandwidth_falls_back_to_tc_class_change(
+        self, mock_htb_set, MockIPRoute, htb_backend
+    ):
+        mock_instance = MagicMock()
+        mock_instance.link_lookup.return_value = [42]
+        mock_instance.tc.side_effect = OSError("socket error")
+        MockIPRoute.return_value = mock_instance
+
+        assert htb_backend.set_bandwidth("", 35_000_000) is True
+        mock_htb_set.assert_called_once_with(htb_backend, "", 35_000_000)
+        assert htb_backend._last_write_used_fallback is True
+        assert htb_backend.get_transport_stats()["tc_fallbacks_by_operation"] == {
+            "set_bandwidth": 1
+        }
+        assert htb_backend._ipr is None
+
+    @patch("wanctl.backends.netlink_cake.IPRoute")
+    def test_get_queue_stats_reads_fq_codel_leaf(self, MockIPRoute, htb_backend):
+        mock_instance = MagicMock()
+        mock_instance.link_lookup.return_value = [42]
+        mock_instance.tc.return_value = [_make_mock_fq_codel_dump_msg()]
+        MockIPRoute.return_value = mock_instance
+
+        stats = htb_backend.get_queue_stats("")
+
+        assert stats == {
+            "packets": 987654,
+            "bytes": 123456789,
+            "dropped": 42,
+            "queued_packets": 3,
+            "queued_bytes": 1500,
+            "tins": [],
+        }
+
+    @patch("wanctl.backends.netlink_cake.IPRoute")
+    def test_get_queue_stats_zeros_without_leaf(self, MockIPRoute, htb_backend):
+        mock_instance = MagicMock()
+        mock_instance.link_lookup.return_value = [42]
+        mock_instance.tc.return_value = []
+        MockIPRoute.return_value = mock_instance
+
+        stats = htb_backend.get_queue_stats("")
+        assert stats is not None
+        assert stats["packets"] == 0
+        assert stats["tins"] == []
+
+    @patch("wanctl.backends.netlink_cake.IPRoute")
+    def test_initialize_builds_htb_tree(self, MockIPRoute, htb_backend):
+        mock_instance = MagicMock()
+        mock_instance.link_lookup.return_value = [42]
+        MockIPRoute.return_value = mock_instance
+
+        ok = htb_backend.initialize_cake(
+            {"bandwidth": "38000kbit", "htb_burst": "128k", "fq_codel_target": "3ms"}
+        )
+
+        assert ok is True
+        commands = [(c.args[0], c.kwargs.get("kind")) for c in mock_instance.tc.call_args_list]
+        assert commands == [
+            ("del", None),
+            ("replace", "htb"),
+            ("replace-class", "htb"),
+            ("replace", "fq_codel"),
+        ]
+        leaf_kwargs = mock_instance.tc.call_args_list[3].kwargs
+        assert leaf_kwargs["fqc_target"] == "3ms"
+        assert leaf_kwargs["parent"] == 0x10010
+        assert htb_backend._htb_burst == "128k"
+        assert htb_backend._last_bandwidth_bps == 38_000_000
+
+    @patch("wanctl.backends.netlink_cake.IPRoute")
+    @patch.object(LinuxHtbFqCodelBackend, "initialize_cake", return_value=True)
+    def test_initialize_falls_back_on_failure(self, mock_htb_init, MockIPRoute, htb_backend):
+        mock_instance = MagicMock()
+        mock_instance.link_lookup.return_value = [42]
+        mock_instance.tc.side_effect = [None, OSError("boom")]
+        MockIPRoute.return_value = mock_instance
+
+        assert htb_backend.initialize_cake({"bandwidth": "38000kbit"}) is True
+        mock_htb_init.assert_called_once()
+        assert htb_backend.tc_fallback_count == 1
+
+    @patch("wanctl.backends.netlink_cake.IPRoute")
+    def test_validate_checks_class_and_leaf(self, MockIPRoute, htb_backend):
+        htb_class = MagicMock()
+        htb_class.get_attr.side_effect = lambda key: "htb" if key == "TCA_KIND" else None
+        htb_class.get.side_effect = lambda key, default=None: (
+            0x10010 if key == "handle" else default
+        )
+        mock_instance = MagicMock()
+        mock_instance.link_lookup.return_value = [42]
+        mock_instance.tc.side_effect = lambda cmd, **kw: (
+            [htb_class] if cmd == "dump-class" else [_make_mock_fq_codel_dump_msg()]
+        )
+        MockIPRoute.return_value = mock_instance
+
+        assert htb_backend.validate_cake({}) is True
+
+    @patch("wanctl.backends.netlink_cake.IPRoute")
+    def test_validate_fails_when_leaf_missing(self, MockIPRoute, htb_backend):
+        mock_instance = MagicMock()
+        mock_instance.link_lookup.return_value = [42]
+        mock_instance.tc.return_value = []
+        MockIPRoute.return_value = mock_instance
+
+        assert htb_backend.validate_cake({}) is False
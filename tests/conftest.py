@@ -28,6 +28,13 @@ except (ImportError, AttributeError):
     _wanctl_metrics = None
 
 
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "perf: wall-clock performance gate; excluded by default, run serially via `make perf`",
+    )
+
+
 @pytest.fixture(autouse=True)
 def reset_prometheus_registry():
     """Reset Prometheus metrics registry before and after each test.
@@ -235,6 +242,10 @@ def _build_mock_autorate_config():
     }
     # Tuning config (optional, disabled by default)
     config.tuning_config = None
+    # Zone events for steering (disabled by default)
+    config.zone_event_socket = None
+    # Router applies stay on the control thread unless a test opts in
+    config.router_apply_mode = "sync"
     return config
 
 
@@ -19,6 +19,10 @@ def pytest_configure(config: pytest.Config) -> None:
         "markers",
         "slow: marks tests as slow (deselect with '-m \"not slow\"')",
     )
+    config.addinivalue_line(
+        "markers",
+        "netns: needs root and the network-namespace testbed (tests/integration/netns)",
+    )
 
 
 def pytest_addoption(parser: pytest.Parser) -> None:
@@ -68,6 +72,10 @@ def skip_if_missing_deps(
     check_dependencies: dict[str, bool],
 ) -> None:
     """Skip integration tests if required dependencies are missing."""
+    if request.node.get_closest_marker("netns"):
+        # The namespace testbed brings its own traffic tools and checks its
+        # own prerequisites (tests/integration/netns/testbed.py).
+        return
     if request.node.get_closest_marker("integration"):
         # Need at least one load generator
         if not check_dependencies["flent"] and not check_dependencies["netperf"]:
@@ -0,0 +1,175 @@
+"""Network-namespace closed-loop testbed.
+
+The end-to-end classes are marked ``integration`` and ``netns``: they need
+root, iproute2, pyroute2 and the sch_cake/sch_netem qdiscs, and are skipped
+when any is missing. Run them with:
+
+    sudo pytest -o addopts='' tests/integration/netns -v
+
+The remaining tests cover topology planning, the daemon config, the
+scenario analysis and the traffic tool on loopback, and run in the default
+suite.
+"""
+
+import socket
+import threading
+
+import pytest
+import yaml
+
+from tests.integration.netns import traffic
+from tests.integration.netns.testbed import (
+    SERVER_ADDR,
+    LabSpec,
+    NetnsLab,
+    autorate_config,
+    missing_prerequisites,
+    namespace_names,
+    run_scenario,
+    setup_commands,
+    summarize_run,
+)
+from wanctl.autorate_config import Config
+
+
+class TestTopologyPlan:
+    def test_namespaces_created_before_links(self) -> None:
+        names = namespace_names("7")
+        commands = setup_commands(names, LabSpec())
+
+        assert [c[3] for c in commands[:4]] == list(names.values())
+        veths = [c for c in commands if c[:3] == ["ip", "link", "add"]]
+        assert len(veths) == 3
+        assert all("veth" in c for c in veths)
+
+    def test_netem_bottleneck_sized_from_spec(self) -> None:
+        spec = LabSpec(dl_capacity_mbps=40, ul_capacity_mbps=8, base_rtt_ms=30, isp_buffer_ms=200)
+        netem = [c for c in setup_commands(namespace_names("7"), spec) if "netem" in c]
+
+        dl, ul = netem
+        assert dl[dl.index("dev") + 1] == "cpe0"
+        assert dl[dl.index("rate") + 1] == "40mbit"
+        assert dl[dl.index("delay") + 1] == "15ms"
+        # 200ms at 40 Mbit/s is 1 MB, about 660 full-size frames
+        assert dl[dl.index("limit") + 1] == "660"
+        assert ul[ul.index("rate") + 1] == "8mbit"
+        assert int(ul[ul.index("limit") + 1]) >= 100
+
+
+class TestAutorateConfig:
+    def test_config_loads_with_linux_cake_netlink(self, tmp_path) -> None:
+        spec = LabSpec(dl_capacity_mbps=40, ul_capacity_mbps=8)
+        path = tmp_path / "autorate.yaml"
+        path.write_text(yaml.safe_dump(autorate_config(spec, tmp_path)))
+
+        config = Config(str(path))
+
+        assert config.router_transport == "linux-cake-netlink"
+        assert config.download_ceiling == 50_000_000
+        assert config.upload_ceiling == 10_000_000
+        assert config.ping_hosts == [SERVER_ADDR]
+        assert config.state_file.parent == tmp_path
+        # Green floor sits below capacity so the controller can drain the ISP queue
+        assert config.download_floor_green < 40_000_000
+
+
+class TestSummarizeRun:
+    def _report(self) -> dict:
+        start = 1000.0
+        probes = [[start - 5 + i * 0.1, 20.0] for i in range(50)]
+        probes += [[start + i * 0.1, 200.0 if i < 50 else 30.0] for i in range(200)]
+        probes[-1][1] = None
+        return {
+            "load_start": start,
+            "load_stop": start + 20.0,
+            "probes": probes,
+            "download_bytes": [[start + t, t * 4_000_000] for t in range(21)],
+            "upload_bytes": [[start + t, t * 1_000_000] for t in range(21)],
+        }
+
+    def test_reaction_latency_and_goodput(self) -> None:
+        rates = [(995.0, 50_000_000), (1000.2, 50_000_000), (1001.5, 45_000_000)]
+        rates += [(1003.0, 36_000_000), (1030.0, 10_000_000)]
+
+        run = summarize_run(self._report(), rates, settle_sec=10.0)
+
+        assert run.idle_rtt_ms == 20.0
+        assert run.time_to_react_sec == 1.5
+        assert run.steady_rtt_ms == {"p50": 30.0, "p95": 30.0, "p99": 30.0}
+        assert run.steady_loss_pct == 1.0
+        assert run.download_mbps == 32.0
+        assert run.upload_mbps == 8.0
+        # Samples after the load stopped are ignored
+        assert run.min_dl_rate_mbps == 36.0
+
+    def test_no_reaction_when_rate_never_drops(self) -> None:
+        rates = [(995.0, 50_000_000), (1005.0, 50_000_000)]
+
+        run = summarize_run(self._report(), rates, settle_sec=10.0)
+
+        assert run.time_to_react_sec is None
+
+
+def _free_port(kind: int) -> int:
+    with socket.socket(socket.AF_INET, kind) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TestTrafficLoopback:
+    def test_load_and_probes_over_loopback(self) -> None:
+        tcp_port = _free_port(socket.SOCK_STREAM)
+        udp_port = _free_port(socket.SOCK_DGRAM)
+        threading.Thread(
+            target=traffic.serve, args=("127.0.0.1", tcp_port, udp_port), daemon=True
+        ).start()
+
+        report = traffic.run(
+            "127.0.0.1",
+            duration=2.0,
+            load_start=0.5,
+            load_stop=1.5,
+            download_streams=1,
+            upload_streams=1,
+            tcp_port=tcp_port,
+            udp_port=udp_port,
+        )
+
+        assert report["load_start"] is not None
+        assert report["load_stop"] > report["load_start"]
+        answered = [rtt for _, rtt in report["probes"] if rtt is not None]
+        assert len(answered) >= 20
+        assert report["download_bytes"][-1][1] > 0
+        assert report["upload_bytes"][-1][1] > 0
+
+
+@pytest.fixture(scope="module")
+def lab():
+    missing = missing_prerequisites()
+    if missing:
+        pytest.skip(f"netns testbed needs {', '.join(missing)}")
+    with NetnsLab(LabSpec()) as built:
+        yield built
+
+
+@pytest.mark.integration
+@pytest.mark.netns
+@pytest.mark.timeout(300)
+class TestClosedLoop:
+    """Autorate end to end against a 40/8 Mbit/s bottleneck with a 250ms ISP buffer."""
+
+    def test_uncontrolled_link_bufferbloats(self, lab, tmp_path) -> None:
+        run = run_scenario(lab, tmp_path, controlled=False, load_sec=20.0, settle_sec=8.0)
+
+        # Fixed CAKE above capacity does not shape: the ISP queue fills
+        assert run.steady_rtt_ms["p50"] > run.idle_rtt_ms + 100.0
+
+    def test_autorate_controls_latency_under_load(self, lab, tmp_path) -> None:
+        spec = lab.spec
+        run = run_scenario(lab, tmp_path, controlled=True, load_sec=30.0, settle_sec=10.0)
+
+        assert run.time_to_react_sec is not None
+        assert run.time_to_react_sec < 3.0
+        assert run.min_dl_rate_mbps < spec.dl_capacity_mbps
+        assert run.steady_rtt_ms["p95"] < run.idle_rtt_ms + 45.0
+        assert run.download_mbps > spec.dl_capacity_mbps * 0.5
@@ -0,0 +1,532 @@
+"""Self-contained closed-loop testbed in Linux network namespaces.
+
+Four namespaces joined by veth pairs stand in for the lab in
+tests/integration/framework, with no SSH host and no external network:
+
+    client (cli0) --- (lan0) router (wan0) --- (cpe0) isp (core0) --- (srv0) server
+                        CAKE dl   CAKE ul       netem dl   netem ul
+
+- ``router`` runs the real autorate daemon with ``linux-cake-netlink``
+  transport: LinuxCakeAdapter/NetlinkCakeBackend install and retune CAKE on
+  lan0 (download) and wan0 (upload), and its ICMP probes go to the server,
+  whose kernel is the reflector;
+- ``isp`` is the bottleneck: a netem qdisc with a fixed rate, half the base
+  RTT of delay and a deep (bufferbloated) queue on each egress;
+- ``client`` and ``server`` run tests/integration/netns/traffic.py for bulk
+  TCP load and UDP echo latency probes.
+
+A host-side observer polls the download CAKE bandwidth through ``tc -n``,
+so time-to-react is measured from what the kernel was actually told.
+
+Requires root, iproute2, pyroute2 and the sch_cake/sch_netem qdiscs;
+missing_prerequisites() lists what is absent.
+
+Usage:
+    sudo python -m tests.integration.netns.testbed --load-sec 30
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import importlib.util
+import json
+import logging
+import os
+import shutil
+import signal
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from wanctl.backends.linux_cake import LinuxCakeBackend
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+AUTORATE_EXAMPLE = REPO_ROOT / "configs" / "examples" / "cable.yaml.example"
+
+CLIENT_ADDR = "10.201.1.2"
+ROUTER_LAN_ADDR = "10.201.1.1"
+ROUTER_WAN_ADDR = "10.201.2.1"
+ISP_CPE_ADDR = "10.201.2.2"
+ISP_CORE_ADDR = "10.201.3.1"
+SERVER_ADDR = "10.201.3.2"
+
+# (namespace role, interface, address) for every veth end
+_INTERFACES = (
+    ("client", "cli0", CLIENT_ADDR),
+    ("router", "lan0", ROUTER_LAN_ADDR),
+    ("router", "wan0", ROUTER_WAN_ADDR),
+    ("isp", "cpe0", ISP_CPE_ADDR),
+    ("isp", "core0", ISP_CORE_ADDR),
+    ("server", "srv0", SERVER_ADDR),
+)
+_VETH_PAIRS = (
+    (("client", "cli0"), ("router", "lan0")),
+    (("router", "wan0"), ("isp", "cpe0")),
+    (("isp", "core0"), ("server", "srv0")),
+)
+_ROUTES = (
+    ("client", "default", ROUTER_LAN_ADDR),
+    ("server", "default", ISP_CORE_ADDR),
+    ("router", "10.201.3.0/24", ISP_CPE_ADDR),
+    ("isp", "10.201.1.0/24", ROUTER_WAN_ADDR),
+)
+ROLES = ("client", "router", "isp", "server")
+DOWNLOAD_IFACE = "lan0"
+UPLOAD_IFACE = "wan0"
+
+_MTU_BYTES = 1514
+
+_LOGGER = logging.getLogger("wanctl.netns_testbed")
+_LOGGER.addHandler(logging.NullHandler())
+
+
+class LabError(RuntimeError):
+    """Testbed setup or teardown failed."""
+
+
+@dataclass(frozen=True, slots=True)
+class LabSpec:
+    """Bottleneck and controller sizing for one testbed.
+
+    Attributes:
+        dl_capacity_mbps: ISP download bottleneck (netem rate)
+        ul_capacity_mbps: ISP upload bottleneck
+        base_rtt_ms: Round-trip propagation delay across the ISP
+        isp_buffer_ms: ISP queue depth at capacity (the bufferbloat)
+        ceiling_ratio: CAKE ceiling relative to capacity; > 1 means an
+            uncontrolled CAKE does not shape and the ISP queue fills
+    """
+
+    dl_capacity_mbps: float = 40.0
+    ul_capacity_mbps: float = 8.0
+    base_rtt_ms: float = 20.0
+    isp_buffer_ms: float = 250.0
+    ceiling_ratio: float = 1.25
+
+    @property
+    def dl_ceiling_mbps(self) -> int:
+        return round(self.dl_capacity_mbps * self.ceiling_ratio)
+
+    @property
+    def ul_ceiling_mbps(self) -> int:
+        return round(self.ul_capacity_mbps * self.ceiling_ratio)
+
+    def netem_limit(self, capacity_mbps: float) -> int:
+        """netem queue limit (packets) holding ``isp_buffer_ms`` at capacity."""
+        bytes_per_ms = capacity_mbps * 1e6 / 8 / 1000
+        return max(100, int(self.isp_buffer_ms * bytes_per_ms / _MTU_BYTES))
+
+
+def namespace_names(tag: str) -> dict[str, str]:
+    """Namespace name per role; ``tag`` keeps concurrent testbeds apart."""
+    return {role: f"wtb{tag}-{role}" for role in ROLES}
+
+
+def setup_commands(names: dict[str, str], spec: LabSpec) -> list[list[str]]:
+    """iproute2 commands that build the topology (namespaces are added first)."""
+    commands = [["ip", "netns", "add", names[role]] for role in ROLES]
+    for (role_a, dev_a), (role_b, dev_b) in _VETH_PAIRS:
+        commands.append(
+            ["ip", "link", "add", dev_a, "netns", names[role_a], "type", "veth",
+             "peer", "name", dev_b, "netns", names[role_b]]
+        )  # fmt: skip
+    for role in ROLES:
+        commands.append(["ip", "-n", names[role], "link", "set", "lo", "up"])
+    for role, dev, addr in _INTERFACES:
+        commands.append(["ip", "-n", names[role], "addr", "add", f"{addr}/24", "dev", dev])
+        commands.append(["ip", "-n", names[role], "link", "set", dev, "up"])
+    for role, prefix, via in _ROUTES:
+        commands.append(["ip", "-n", names[role], "route", "add", prefix, "via", via])
+    for role in ("router", "isp"):
+        commands.append(
+            ["ip", "netns", "exec", names[role], "sysctl", "-qw", "net.ipv4.ip_forward=1"]
+        )
+    half_rtt = f"{spec.base_rtt_ms / 2:g}ms"
+    for dev, capacity in (("cpe0", spec.dl_capacity_mbps), ("core0", spec.ul_capacity_mbps)):
+        commands.append(
+            ["tc", "-n", names["isp"], "qdisc", "replace", "dev", dev, "root", "netem",
+             "rate", f"{capacity:g}mbit", "delay", half_rtt,
+             "limit", str(spec.netem_limit(capacity))]
+        )  # fmt: skip
+    return commands
+
+
+def autorate_config(spec: LabSpec, workdir: Path) -> dict[str, Any]:
+    """Autorate config for the router namespace, derived from the cable example.
+
+    Rates, floors and the reflector are scaled to the testbed; every path
+    lives under ``workdir`` and SQLite history is off.
+    """
+    data = copy.deepcopy(yaml.safe_load(AUTORATE_EXAMPLE.read_text()))
+    data["wan_name"] = "testbed"
+    data["router"].update(transport="linux-cake-netlink", host=ISP_CPE_ADDR)
+    data["cake_params"] = {
+        "download_interface": DOWNLOAD_IFACE,
+        "upload_interface": UPLOAD_IFACE,
+        "rtt": "100ms",
+    }
+    cm = data["continuous_monitoring"]
+    dl_ceiling, ul_ceiling = spec.dl_ceiling_mbps, spec.ul_ceiling_mbps
+    cm["baseline_rtt_initial"] = spec.base_rtt_ms
+    cm["download"].update(
+        floor_green_mbps=round(dl_ceiling * 0.6),
+        floor_yellow_mbps=round(dl_ceiling * 0.4),
+        floor_soft_red_mbps=round(dl_ceiling * 0.3),
+        floor_red_mbps=round(dl_ceiling * 0.2),
+        ceiling_mbps=dl_ceiling,
+        step_up_mbps=max(1, round(dl_ceiling * 0.02)),
+    )
+    cm["upload"].update(
+        floor_mbps=max(1, round(ul_ceiling * 0.25)),
+        ceiling_mbps=ul_ceiling,
+        step_up_mbps=max(1, round(ul_ceiling * 0.03)),
+    )
+    cm["ping_hosts"] = [SERVER_ADDR]
+    cm["use_median_of_three"] = False
+    data["storage"] = {"db_path": ""}
+    data["logging"] = {
+        "main_log": str(workdir / "autorate.log"),
+        "debug_log": str(workdir / "autorate_debug.log"),
+    }
+    data["lock_file"] = str(workdir / "autorate.lock")
+    data["state_file"] = str(workdir / "autorate_state.json")
+    data["health_check"] = {"enabled": True, "host": "127.0.0.1", "port": 9101}
+    return data
+
+
+# =============================================================================
+# TESTBED
+# =============================================================================
+
+
+def _run(cmd: list[str], timeout: float = 10.0) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(cmd, capture_output=True, text=True, timeout=timeout, check=False)
+
+
+def _qdisc_supported(kind: str) -> bool:
+    """Whether the kernel can attach qdisc ``kind`` (probed in a scratch namespace)."""
+    ns = f"wtb-probe-{os.getpid()}"
+    try:
+        if _run(["ip", "netns", "add", ns]).returncode != 0:
+            return False
+        _run(["ip", "-n", ns, "link", "add", "p0", "type", "veth", "peer", "name", "p1"])
+        return _run(["tc", "-n", ns, "qdisc", "add", "dev", "p0", "root", kind]).returncode == 0
+    finally:
+        _run(["ip", "netns", "del", ns])
+
+
+def missing_prerequisites() -> list[str]:
+    """What this host lacks to run the testbed (empty when it can)."""
+    missing = []
+    if os.geteuid() != 0:
+        missing.append("root")
+    missing.extend(tool for tool in ("ip", "tc", "sysctl") if shutil.which(tool) is None)
+    if importlib.util.find_spec("pyroute2") is None:
+        missing.append("pyroute2")
+    if missing:
+        return missing
+    return [f"sch_{kind} qdisc" for kind in ("cake", "netem") if not _qdisc_supported(kind)]
+
+
+class NamespacedCakeBackend(LinuxCakeBackend):
+    """LinuxCakeBackend whose tc commands target another network namespace."""
+
+    def __init__(self, namespace: str, interface: str):
+        super().__init__(interface=interface, logger=_LOGGER)
+        self.namespace = namespace
+
+    def _run_tc(self, args: list[str], timeout: float | None = None) -> tuple[int, str, str]:
+        return super()._run_tc(["-n", self.namespace, *args], timeout)
+
+
+class RateObserver(threading.Thread):
+    """Polls a CAKE qdisc's bandwidth; samples are (wall_ts, bps)."""
+
+    def __init__(self, backend: LinuxCakeBackend, interval: float = 0.05):
+        super().__init__(daemon=True)
+        self.backend = backend
+        self.interval = interval
+        self.samples: list[tuple[float, int]] = []
+        self._stop = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop.is_set():
+            bandwidth = self.backend.get_bandwidth("")
+            if bandwidth is not None:
+                self.samples.append((time.time(), bandwidth))
+            self._stop.wait(self.interval)
+
+    def stop(self) -> list[tuple[float, int]]:
+        self._stop.set()
+        self.join(timeout=5.0)
+        return self.samples
+
+
+class NetnsLab:
+    """Builds the four-namespace topology and runs processes inside it.
+
+    Use as a context manager; exit kills every started process and deletes
+    the namespaces (which removes the veths and qdiscs with them).
+    """
+
+    def __init__(self, spec: LabSpec | None = None, tag: str | None = None):
+        self.spec = spec or LabSpec()
+        self.names = namespace_names(tag or str(os.getpid()))
+        self._procs: list[subprocess.Popen[str]] = []
+
+    def __enter__(self) -> NetnsLab:
+        try:
+            for cmd in setup_commands(self.names, self.spec):
+                result = _run(cmd)
+                if result.returncode != 0:
+                    raise LabError(f"{' '.join(cmd)}: {result.stderr.strip()}")
+        except BaseException:
+            self.close()
+            raise
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        for proc in self._procs:
+            self.stop(proc)
+        self._procs.clear()
+        for ns in self.names.values():
+            _run(["ip", "netns", "del", ns])
+
+    def popen(self, role: str, argv: list[str]) -> subprocess.Popen[str]:
+        """Start ``argv`` inside ``role``'s namespace (repo src on PYTHONPATH)."""
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            p for p in (str(REPO_ROOT / "src"), str(REPO_ROOT), env.get("PYTHONPATH")) if p
+        )
+        proc = subprocess.Popen(
+            ["ip", "netns", "exec", self.names[role], *argv],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            cwd=REPO_ROOT,
+            env=env,
+        )
+        self._procs.append(proc)
+        return proc
+
+    @staticmethod
+    def stop(proc: subprocess.Popen[str], timeout: float = 10.0) -> None:
+        if proc.poll() is None:
+            proc.send_signal(signal.SIGTERM)
+            try:
+                proc.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+
+    def cake(self, interface: str) -> NamespacedCakeBackend:
+        return NamespacedCakeBackend(self.names["router"], interface)
+
+    def install_static_cake(self) -> None:
+        """Fixed CAKE at the ceilings (the uncontrolled reference)."""
+        for interface, mbps in (
+            (DOWNLOAD_IFACE, self.spec.dl_ceiling_mbps),
+            (UPLOAD_IFACE, self.spec.ul_ceiling_mbps),
+        ):
+            if not self.cake(interface).initialize_cake({"bandwidth": f"{mbps}mbit"}):
+                raise LabError(f"could not install CAKE on {interface}")
+
+    def start_server(self) -> subprocess.Popen[str]:
+        proc = self.popen(
+            "server",
+            [sys.executable, "-m", "tests.integration.netns.traffic", "serve", "--bind",
+             SERVER_ADDR],
+        )  # fmt: skip
+        assert proc.stdout is not None
+        if proc.stdout.readline().strip() != "ready":
+            raise LabError(f"traffic server failed: {proc.stderr.read() if proc.stderr else ''}")
+        return proc
+
+    def start_autorate(self, workdir: Path) -> subprocess.Popen[str]:
+        """Start the daemon and wait until it has installed CAKE at the ceiling."""
+        config_path = workdir / "autorate.yaml"
+        config_path.write_text(yaml.safe_dump(autorate_config(self.spec, workdir)))
+        proc = self.popen(
+            "router",
+            [sys.executable, "-m", "wanctl.autorate_continuous", "--config", str(config_path)],
+        )
+        backend = self.cake(DOWNLOAD_IFACE)
+        deadline = time.monotonic() + 30.0
+        while time.monotonic() < deadline:
+            if proc.poll() is not None:
+                raise LabError(f"autorate exited: {proc.stderr.read() if proc.stderr else ''}")
+            if backend.get_bandwidth("") is not None:
+                return proc
+            time.sleep(0.2)
+        raise LabError("autorate did not install CAKE within 30s")
+
+
+# =============================================================================
+# SCENARIO
+# =============================================================================
+
+
+@dataclass(slots=True)
+class LabRun:
+    """End-to-end measurements from one load scenario.
+
+    Attributes:
+        idle_rtt_ms: Median client-observed RTT before the load started
+        time_to_react_sec: Load start to the first download CAKE rate
+            reduction (None if the rate never dropped)
+        steady_rtt_ms: Client RTT percentiles after the settle period
+        download_mbps: Client goodput after the settle period
+        min_dl_rate_mbps: Lowest download CAKE rate seen under load
+    """
+
+    idle_rtt_ms: float
+    time_to_react_sec: float | None
+    steady_rtt_ms: dict[str, float]
+    steady_loss_pct: float
+    download_mbps: float
+    upload_mbps: float
+    min_dl_rate_mbps: float | None
+    rate_samples: int = 0
+    notes: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def _goodput_mbps(counters: list[list[float]], start: float) -> float:
+    window = [c for c in counters if c[0] >= start]
+    if len(window) < 2 or window[-1][0] <= window[0][0]:
+        return 0.0
+    return (window[-1][1] - window[0][1]) * 8 / (window[-1][0] - window[0][0]) / 1e6
+
+
+def summarize_run(
+    report: dict[str, Any], rate_samples: list[tuple[float, int]], settle_sec: float
+) -> LabRun:
+    """Reduce a traffic report and CAKE rate samples to the scenario metrics."""
+    load_start = report["load_start"]
+    load_stop = report["load_stop"] or float("inf")
+    steady_from = load_start + settle_sec
+    probes = report["probes"]
+    idle = [rtt for ts, rtt in probes if ts < load_start and rtt is not None]
+    steady_all = [rtt for ts, rtt in probes if steady_from <= ts < load_stop]
+    steady = sorted(rtt for rtt in steady_all if rtt is not None)
+
+    def pct(q: float) -> float:
+        return round(steady[min(len(steady) - 1, int(q * len(steady)))], 2) if steady else 0.0
+
+    before = [bps for ts, bps in rate_samples if ts < load_start]
+    under_load = [(ts, bps) for ts, bps in rate_samples if load_start <= ts < load_stop]
+    reference = before[-1] if before else (under_load[0][1] if under_load else None)
+    react = next((ts - load_start for ts, bps in under_load if reference and bps < reference), None)
+    return LabRun(
+        idle_rtt_ms=round(statistics.median(idle), 2) if idle else 0.0,
+        time_to_react_sec=None if react is None else round(react, 3),
+        steady_rtt_ms={"p50": pct(0.50), "p95": pct(0.95), "p99": pct(0.99)},
+        steady_loss_pct=(
+            round(100.0 * (len(steady_all) - len(steady)) / len(steady_all), 2)
+            if steady_all
+            else 0.0
+        ),
+        download_mbps=round(_goodput_mbps(report["download_bytes"], steady_from), 2),
+        upload_mbps=round(_goodput_mbps(report["upload_bytes"], steady_from), 2),
+        min_dl_rate_mbps=(
+            round(min(bps for _, bps in under_load) / 1e6, 2) if under_load else None
+        ),
+        rate_samples=len(rate_samples),
+    )
+
+
+def run_scenario(
+    lab: NetnsLab,
+    workdir: Path,
+    *,
+    controlled: bool = True,
+    idle_sec: float = 5.0,
+    load_sec: float = 30.0,
+    settle_sec: float = 10.0,
+) -> LabRun:
+    """Idle, then bulk load in both directions, with or without the daemon.
+
+    Args:
+        lab: Entered NetnsLab
+        workdir: Scratch directory for the daemon's config, logs and state
+        controlled: Run autorate; otherwise CAKE sits fixed at the ceilings
+        idle_sec: Probing before the load (idle RTT)
+        load_sec: Load duration
+        settle_sec: Start of the steady-state window after load start
+    """
+    server = lab.start_server()
+    daemon = lab.start_autorate(workdir) if controlled else None
+    if daemon is None:
+        lab.install_static_cake()
+    observer = RateObserver(lab.cake(DOWNLOAD_IFACE))
+    observer.start()
+    duration = idle_sec + load_sec + 1.0
+    try:
+        client = lab.popen(
+            "client",
+            [sys.executable, "-m", "tests.integration.netns.traffic", "run",
+             "--server", SERVER_ADDR, "--duration", str(duration),
+             "--load-start", str(idle_sec), "--load-stop", str(idle_sec + load_sec)],
+        )  # fmt: skip
+        stdout, stderr = client.communicate(timeout=duration + 30.0)
+        if client.returncode != 0:
+            raise LabError(f"traffic client failed: {stderr}")
+    finally:
+        rate_samples = observer.stop()
+        if daemon is not None:
+            lab.stop(daemon)
+        lab.stop(server)
+    return summarize_run(json.loads(stdout), rate_samples, settle_sec)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the wanctl netns closed-loop testbed")
+    parser.add_argument("--dl-mbps", type=float, default=LabSpec.dl_capacity_mbps)
+    parser.add_argument("--ul-mbps", type=float, default=LabSpec.ul_capacity_mbps)
+    parser.add_argument("--rtt-ms", type=float, default=LabSpec.base_rtt_ms)
+    parser.add_argument("--buffer-ms", type=float, default=LabSpec.isp_buffer_ms)
+    parser.add_argument("--load-sec", type=float, default=30.0)
+    parser.add_argument("--settle-sec", type=float, default=10.0)
+    parser.add_argument(
+        "--uncontrolled", action="store_true", help="Fixed CAKE at the ceilings, no daemon"
+    )
+    args = parser.parse_args(argv)
+
+    missing = missing_prerequisites()
+    if missing:
+        print(f"Error: testbed needs {', '.join(missing)}", file=sys.stderr)
+        return 1
+    spec = LabSpec(
+        dl_capacity_mbps=args.dl_mbps,
+        ul_capacity_mbps=args.ul_mbps,
+        base_rtt_ms=args.rtt_ms,
+        isp_buffer_ms=args.buffer_ms,
+    )
+    with tempfile.TemporaryDirectory(prefix="wanctl-netns-") as tmp, NetnsLab(spec) as lab:
+        run = run_scenario(
+            lab,
+            Path(tmp),
+            controlled=not args.uncontrolled,
+            load_sec=args.load_sec,
+            settle_sec=args.settle_sec,
+        )
+    print(json.dumps(run.to_dict(), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
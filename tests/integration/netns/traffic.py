@@ -0,0 +1,253 @@
+"""Load and latency traffic for the network-namespace testbed.
+
+Pure-Python so the testbed needs nothing beyond iproute2 and the kernel
+qdiscs. Two roles, each run inside a namespace with ``ip netns exec``:
+
+    serve  - TCP bulk source/sink plus a UDP echo reflector (server side)
+    run    - bulk download/upload streams for a load window, with UDP
+             echo probes throughout; prints one JSON report (client side)
+
+TCP streams open with a one-byte command: ``D`` makes the server send until
+the client disconnects, ``U`` makes it discard what the client sends.
+All timestamps in the report are wall-clock (``time.time()``), which every
+namespace on the host shares, so they line up with the host-side CAKE rate
+observer.
+
+Usage:
+    python -m tests.integration.netns.traffic serve --bind 10.201.3.2
+    python -m tests.integration.netns.traffic run --server 10.201.3.2 \\
+        --duration 40 --load-start 5 --load-stop 35
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import socket
+import struct
+import sys
+import threading
+import time
+from typing import Any
+
+TCP_PORT = 5201
+UDP_PORT = 5202
+CHUNK = 64 * 1024
+# Probe payload: sequence number + send time (wall clock, ns)
+_PROBE = struct.Struct("!Qq")
+
+
+# =============================================================================
+# SERVER
+# =============================================================================
+
+
+def _serve_stream(conn: socket.socket) -> None:
+    with conn:
+        try:
+            command = conn.recv(1)
+            if command == b"D":
+                payload = bytes(CHUNK)
+                while True:
+                    conn.sendall(payload)
+            elif command == b"U":
+                while conn.recv(CHUNK):
+                    pass
+        except OSError:
+            pass
+
+
+def _serve_echo(sock: socket.socket) -> None:
+    while True:
+        try:
+            data, addr = sock.recvfrom(256)
+            sock.sendto(data, addr)
+        except OSError:
+            return
+
+
+def serve(bind: str, tcp_port: int = TCP_PORT, udp_port: int = UDP_PORT) -> None:
+    """Run the TCP source/sink and UDP echo reflector until killed."""
+    echo = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    echo.bind((bind, udp_port))
+    threading.Thread(target=_serve_echo, args=(echo,), daemon=True).start()
+
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    listener.bind((bind, tcp_port))
+    listener.listen(64)
+    print("ready", flush=True)
+    while True:
+        conn, _ = listener.accept()
+        threading.Thread(target=_serve_stream, args=(conn,), daemon=True).start()
+
+
+# =============================================================================
+# CLIENT
+# =============================================================================
+
+
+class _Stream(threading.Thread):
+    """One bulk TCP stream counting the bytes it moved."""
+
+    def __init__(self, server: str, port: int, direction: str, stop: threading.Event):
+        super().__init__(daemon=True)
+        self.server = server
+        self.port = port
+        self.direction = direction
+        self.stop = stop
+        self.bytes = 0
+
+    def run(self) -> None:
+        try:
+            with socket.create_connection((self.server, self.port), timeout=5.0) as sock:
+                sock.settimeout(1.0)
+                if self.direction == "download":
+                    sock.sendall(b"D")
+                    while not self.stop.is_set():
+                        try:
+                            data = sock.recv(CHUNK)
+                        except TimeoutError:
+                            continue
+                        if not data:
+                            return
+                        self.bytes += len(data)
+                else:
+                    sock.sendall(b"U")
+                    payload = bytes(CHUNK)
+                    while not self.stop.is_set():
+                        try:
+                            self.bytes += sock.send(payload)
+                        except TimeoutError:
+                            continue
+        except OSError:
+            return
+
+
+def _probe_loop(
+    server: str, port: int, interval: float, until: float, samples: list[list[Any]]
+) -> None:
+    """UDP echo probes at ``interval``; appends [send_ts, rtt_ms | None]."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.connect((server, port))
+    sock.settimeout(interval)
+    seq = 0
+    pending: dict[int, int] = {}
+    next_send = time.time()
+    while time.time() < until:
+        now = time.time()
+        if now >= next_send:
+            sent_ns = time.time_ns()
+            sock.send(_PROBE.pack(seq, sent_ns))
+            pending[seq] = len(samples)
+            samples.append([sent_ns / 1e9, None])
+            seq += 1
+            next_send += interval
+        try:
+            sock.settimeout(max(0.001, next_send - time.time()))
+            data = sock.recv(64)
+        except (TimeoutError, ConnectionRefusedError):
+            continue
+        rseq, sent_ns = _PROBE.unpack(data[: _PROBE.size])
+        index = pending.pop(rseq, None)
+        if index is not None:
+            samples[index][1] = (time.time_ns() - sent_ns) / 1e6
+    sock.close()
+
+
+def run(
+    server: str,
+    duration: float,
+    load_start: float,
+    load_stop: float,
+    download_streams: int = 4,
+    upload_streams: int = 2,
+    probe_hz: float = 20.0,
+    tcp_port: int = TCP_PORT,
+    udp_port: int = UDP_PORT,
+) -> dict[str, Any]:
+    """Probe for ``duration`` seconds with bulk load between the two offsets.
+
+    Returns:
+        Report with ``probes`` ([send_ts, rtt_ms | None]), the wall-clock
+        ``load_start``/``load_stop`` and per-direction byte counters sampled
+        every 0.5s as [ts, cumulative_bytes].
+    """
+    t0 = time.time()
+    probes: list[list[Any]] = []
+    prober = threading.Thread(
+        target=_probe_loop,
+        args=(server, udp_port, 1.0 / probe_hz, t0 + duration, probes),
+        daemon=True,
+    )
+    prober.start()
+
+    stop = threading.Event()
+    streams: list[_Stream] = []
+    counters: dict[str, list[list[float]]] = {"download": [], "upload": []}
+    started_at = stopped_at = None
+    while (now := time.time()) < t0 + duration:
+        if started_at is None and now >= t0 + load_start:
+            started_at = now
+            streams = [_Stream(server, tcp_port, "download", stop) for _ in range(download_streams)]
+            streams += [_Stream(server, tcp_port, "upload", stop) for _ in range(upload_streams)]
+            for stream in streams:
+                stream.start()
+        if started_at is not None and stopped_at is None:
+            for direction in counters:
+                moved = sum(s.bytes for s in streams if s.direction == direction)
+                counters[direction].append([now, moved])
+            if now >= t0 + load_stop:
+                stopped_at = now
+                stop.set()
+        time.sleep(0.5)
+    stop.set()
+    prober.join(timeout=2.0)
+    return {
+        "load_start": started_at,
+        "load_stop": stopped_at,
+        "probes": probes,
+        "download_bytes": counters["download"],
+        "upload_bytes": counters["upload"],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="wanctl netns testbed traffic")
+    sub = parser.add_subparsers(dest="role", required=True)
+    p_serve = sub.add_parser("serve", help="TCP source/sink and UDP echo reflector")
+    p_serve.add_argument("--bind", default="0.0.0.0")
+    p_serve.add_argument("--tcp-port", type=int, default=TCP_PORT)
+    p_serve.add_argument("--udp-port", type=int, default=UDP_PORT)
+    p_run = sub.add_parser("run", help="Load + latency probes; prints a JSON report")
+    p_run.add_argument("--server", required=True)
+    p_run.add_argument("--duration", type=float, required=True)
+    p_run.add_argument("--load-start", type=float, required=True)
+    p_run.add_argument("--load-stop", type=float, required=True)
+    p_run.add_argument("--download-streams", type=int, default=4)
+    p_run.add_argument("--upload-streams", type=int, default=2)
+    p_run.add_argument("--probe-hz", type=float, default=20.0)
+    p_run.add_argument("--tcp-port", type=int, default=TCP_PORT)
+    p_run.add_argument("--udp-port", type=int, default=UDP_PORT)
+    args = parser.parse_args(argv)
+
+    if args.role == "serve":
+        serve(args.bind, args.tcp_port, args.udp_port)
+        return 0
+    report = run(
+        args.server,
+        args.duration,
+        args.load_start,
+        args.load_stop,
+        args.download_streams,
+        args.upload_streams,
+        args.probe_hz,
+        args.tcp_port,
+        args.udp_port,
+    )
+    json.dump(report, sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
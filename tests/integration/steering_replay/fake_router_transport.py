@@ -7,6 +7,12 @@ import logging
 import re
 from typing import Any
 
+from wanctl.steering.route_ownership_guard import RouteOwnershipGuard
+from wanctl.steering.route_ownership_inspector import (
+    DEFAULT_ROUTE_PRINT,
+    ROUTE_PRINT,
+)
+
 
 class FakeRouterTransport:
     """RouterOSController-shaped fake with only the daemon-facing surface.
@@ -91,12 +97,12 @@ class FakeRouterTransport:
         JSON for those read paths, but deny route mutations so replay tests keep
         proving that active route writes are not happening offline.
         """
-        if cmd == "/system script print detail":
+        if cmd == RouteOwnershipGuard.SCRIPT_PRINT:
             out = "[]"
             self._record("run_cmd", (0, out, ""), cmd=cmd, capture=capture, timeout=timeout)
             return 0, out, ""
 
-        if cmd == "/ip route print":
+        if cmd in (ROUTE_PRINT, DEFAULT_ROUTE_PRINT):
             routes = [
                 {**route, "dst-address": "0.0.0.0/0", "gateway": "fixture-gateway", "distance": "1"}
                 for route in self._routes_by_comment.values()
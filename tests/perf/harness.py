@@ -0,0 +1,606 @@
+"""Cycle-latency benchmarks for the control-loop hot paths.
+
+Each benchmark is a context manager that builds one hot-path component over
+in-memory fakes and yields a zero-argument callable performing a single
+call (one controller cycle, one signal update, one metrics batch, ...).
+measure() times that callable per call and records what it allocates.
+
+Shared by tests/perf/test_cycle_latency.py (regression gate against the
+JSON baseline) and scripts/bench_cycle_latency.py (reporting and baseline
+refresh).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import copy
+import gc
+import logging
+import tempfile
+import time
+import tracemalloc
+from array import array
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import yaml
+
+from wanctl.autorate_config import Config
+from wanctl.backends.netlink_cake import NetlinkCakeBackend
+from wanctl.cake_signal import CakeSignalConfig, CakeSignalProcessor, CakeTinStats
+from wanctl.queue_controller import QueueController
+from wanctl.rtt_backend import RttSample
+from wanctl.signal_processing import SignalProcessor
+from wanctl.sim import BottleneckLink, LinkDirection, Simulation, Trace
+from wanctl.steering.cake_stats import CakeStats
+from wanctl.steering.daemon import (
+    BaselineLoader,
+    SteeringConfig,
+    SteeringDaemon,
+    SteeringStateManager,
+    create_steering_state_schema,
+)
+from wanctl.storage.writer import MetricsWriter
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+BASELINE_PATH = REPO_ROOT / "tests" / "fixtures" / "cycle_latency_baseline.json"
+AUTORATE_EXAMPLE = REPO_ROOT / "configs" / "examples" / "cable.yaml.example"
+STEERING_EXAMPLE = REPO_ROOT / "configs" / "examples" / "steering.yaml.example"
+
+BenchCall = Callable[[], object]
+
+_LOGGER = logging.getLogger("wanctl.bench")
+_LOGGER.addHandler(logging.NullHandler())
+_LOGGER.propagate = False
+
+
+@dataclass(frozen=True, slots=True)
+class BenchSpec:
+    """One hot path: how to build it and how many calls make a round.
+
+    Attributes:
+        setup: Context manager factory taking a scratch directory and
+            yielding the per-call callable
+        calls: Timed calls per round
+        warmup: Untimed calls before the first round (EWMA/dwell warm-up)
+    """
+
+    setup: Callable[[Path], contextlib.AbstractContextManager[BenchCall]]
+    calls: int
+    warmup: int
+
+
+@dataclass(frozen=True, slots=True)
+class BenchResult:
+    """Per-call latency and allocation figures for one benchmark.
+
+    Latencies are the best (lowest) per-round percentile, which filters
+    scheduler noise without hiding a real slowdown.
+
+    Attributes:
+        name: Benchmark name (``Class.method``)
+        calls: Timed calls per round
+        rounds: Timed rounds
+        p50_us: Median per-call latency in microseconds
+        p99_us: 99th-percentile per-call latency in microseconds
+        alloc_peak_bytes: Mean peak traced allocation during one call
+        retained_bytes: Mean net traced growth per call (leak indicator)
+    """
+
+    name: str
+    calls: int
+    rounds: int
+    p50_us: float
+    p99_us: float
+    alloc_peak_bytes: float
+    retained_bytes: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+# =============================================================================
+# HOT PATHS
+# =============================================================================
+
+
+@contextlib.contextmanager
+def wan_controller_cycle(workdir: Path) -> Iterator[BenchCall]:
+    """WANController.run_cycle() against the simulator's fluid link model.
+
+    The link runs saturated at 600 Mbit/s under a 940 Mbit/s ceiling, so
+    cycles exercise rate decreases, probing and the CAKE stats path.
+    """
+    link = BottleneckLink(
+        download=LinkDirection(Trace.constant(600e6), Trace.constant(1.2e9)),
+        upload=LinkDirection(Trace.constant(36e6), Trace.constant(10e6)),
+        seed=7,
+    )
+    with Simulation(Config(str(AUTORATE_EXAMPLE)), link, state_dir=workdir) as sim:
+        # Builds the controller and settles baseline and EWMAs
+        sim.run(2.0)
+        controller = sim.controller
+        assert controller is not None
+        clock = sim.clock
+        interval = sim.cycle_interval_sec
+
+        def call() -> object:
+            link.advance(interval)
+            clock.advance(interval)
+            return controller.run_cycle()
+
+        with clock.install(sim.time_seams):
+            yield call
+
+
+class _StaticBaselineLoader(BaselineLoader):
+    """BaselineLoader with a fixed baseline and no state-file or health reads."""
+
+    def load_baseline_rtt(self) -> tuple[float | None, str | None]:
+        return 25.0, "GREEN"
+
+    def _load_target_wan_health(self) -> dict[str, Any] | None:
+        return None
+
+
+class _CyclingRttProbe:
+    """RttBackend stand-in cycling through a short RTT pattern."""
+
+    def __init__(self, pattern: tuple[float, ...]):
+        self._pattern = pattern
+        self._i = 0
+
+    def probe(self, hosts: list[str]) -> RttSample:
+        rtt = self._pattern[self._i % len(self._pattern)]
+        self._i += 1
+        return RttSample(
+            rtt_ms=rtt,
+            per_host_results={hosts[0]: rtt},
+            timestamp=time.monotonic(),
+            measurement_ms=0.1,
+        )
+
+
+class _CountingCakeReader:
+    """CakeStatsReader stand-in with slowly growing drop/queue counters."""
+
+    is_linux_cake = False
+    last_tin_stats = None
+
+    def __init__(self) -> None:
+        self._cycle = 0
+
+    def read_stats(self, queue_name: str) -> CakeStats:
+        self._cycle += 1
+        return CakeStats(dropped=self._cycle // 10, queued_packets=self._cycle % 40)
+
+
+class _InMemoryRouter:
+    """Steering rule transport that only tracks the rule state."""
+
+    client = None
+
+    def __init__(self) -> None:
+        self.enabled = False
+
+    def get_rule_status(self) -> bool:
+        return self.enabled
+
+    def enable_steering(self) -> bool:
+        self.enabled = True
+        return True
+
+    def disable_steering(self) -> bool:
+        self.enabled = False
+        return True
+
+
+def _steering_config(workdir: Path) -> SteeringConfig:
+    """SteeringConfig from the shipped example with every path under ``workdir``."""
+    data = copy.deepcopy(yaml.safe_load(STEERING_EXAMPLE.read_text()))
+    data["topology"]["primary_wan_config"] = str(workdir / "primary.yaml")
+    data["cake_state_sources"]["primary"] = str(workdir / "primary_state.json")
+    data["state"]["file"] = str(workdir / "steering_state.json")
+    data.setdefault("storage", {})["db_path"] = ""
+    data["logging"]["main_log"] = str(workdir / "steering.log")
+    data["logging"]["debug_log"] = str(workdir / "steering_debug.log")
+    data["lock_file"] = str(workdir / "steering.lock")
+    (workdir / "primary.yaml").write_text(
+        yaml.safe_dump({"router": {"transport": "rest"}, "health_check": {"port": 9101}})
+    )
+    path = workdir / "steering.yaml"
+    path.write_text(yaml.safe_dump(data))
+    return SteeringConfig(str(path))
+
+
+@contextlib.contextmanager
+def steering_daemon_cycle(workdir: Path) -> Iterator[BenchCall]:
+    """SteeringDaemon.run_cycle() with RTT rising and falling through the thresholds."""
+    config = _steering_config(workdir)
+    state = SteeringStateManager(
+        config.state_file,
+        create_steering_state_schema(config),
+        _LOGGER,
+        history_maxlen=config.history_size,
+    )
+    state.load()
+    # 25 ms baseline; a 60-cycle ramp up to +60 ms and back
+    ramp = tuple(25.0 + i for i in range(0, 60, 2))
+    with patch("wanctl.steering.daemon.CakeStatsReader"):
+        daemon = SteeringDaemon(
+            config=config,
+            state=state,
+            router=_InMemoryRouter(),  # type: ignore[arg-type]
+            rtt_measurement=_CyclingRttProbe(ramp + ramp[::-1]),  # type: ignore[arg-type]
+            baseline_loader=_StaticBaselineLoader(config, _LOGGER),
+            logger=_LOGGER,
+        )
+    daemon._load_target_wan_health = lambda: None  # type: ignore[method-assign]
+    daemon._get_wan_congestion_state_with_fail = lambda _wan: ("GREEN", False)  # type: ignore[method-assign]
+    daemon.cake_reader = _CountingCakeReader()
+    yield daemon.run_cycle
+
+
+@contextlib.contextmanager
+def signal_processor(workdir: Path) -> Iterator[BenchCall]:
+    """SignalProcessor.process() on jittery RTT with periodic outliers."""
+    processor = SignalProcessor("bench", {}, _LOGGER)
+    samples = [25.0 + (i % 7) * 0.4 + (30.0 if i % 50 == 0 else 0.0) for i in range(500)]
+    i = 0
+
+    def call() -> object:
+        nonlocal i
+        raw = samples[i % 500]
+        i += 1
+        return processor.process(raw_rtt=raw, load_rtt=raw, baseline_rtt=25.0)
+
+    yield call
+
+
+def _cake_stats(cycle: int) -> dict[str, Any]:
+    """get_queue_stats()-shaped dict with counters that grow every cycle."""
+    stats: dict[str, Any] = {
+        "packets": 100_000 + cycle * 1500,
+        "bytes": 150_000_000 + cycle * 2_250_000,
+        "dropped": cycle // 3,
+        "queued_packets": cycle % 20,
+        "queued_bytes": (cycle % 20) * 1500,
+        "memory_used": 27_700_000,
+        "memory_limit": 67_108_864,
+        "capacity_estimate": 500_000_000,
+        "ecn_marked": cycle // 5,
+        "tins": [
+            {
+                "sent_bytes": 1000 + cycle * 500 * (tin + 1),
+                "sent_packets": 10 + cycle * (tin + 1),
+                "dropped_packets": cycle // (3 + tin),
+                "ecn_marked_packets": cycle // (5 + tin),
+                "backlog_bytes": (cycle % 20) * 300,
+                "peak_delay_us": 2000 + (cycle % 50) * 100,
+                "avg_delay_us": 800 + (cycle % 50) * 20,
+                "base_delay_us": 300,
+                "sparse_flows": 2,
+                "bulk_flows": tin,
+                "unresponsive_flows": 0,
+            }
+            for tin in range(4)
+        ],
+    }
+    # Both CAKE backends pack the tins into columns for CakeSignalProcessor
+    stats["tin_stats"] = CakeTinStats.from_dicts(stats["tins"])
+    return stats
+
+
+@contextlib.contextmanager
+def cake_signal(workdir: Path) -> Iterator[BenchCall]:
+    """CakeSignalProcessor.update() with every signal enabled."""
+    processor = CakeSignalProcessor(
+        CakeSignalConfig(
+            enabled=True,
+            drop_rate_enabled=True,
+            backlog_enabled=True,
+            peak_delay_enabled=True,
+            metrics_enabled=True,
+        )
+    )
+    # Pre-built so the timed call is update() alone, not dict construction
+    stats = [_cake_stats(cycle) for cycle in range(1, 2001)]
+    i = 0
+
+    def call() -> object:
+        nonlocal i
+        raw = stats[i % 2000]
+        i += 1
+        if i % 2000 == 0:
+            # Counters wrap back to the start: restart the delta tracking too
+            processor.reset()
+        return processor.update(raw)
+
+    yield call
+
+
+class _NlaSlot:
+    """pyroute2 nla_slot stand-in: a (name, value) cell read through __getitem__."""
+
+    __slots__ = ("cell",)
+
+    def __init__(self, name: str, value: Any) -> None:
+        self.cell = (name, value)
+
+    def __getitem__(self, key: int) -> Any:
+        if key in (0, 1):
+            return self.cell[key]
+        raise IndexError(key)
+
+
+class _Nla(dict):
+    """pyroute2 nla stand-in with the same get_attr() cost: a scan of the attrs slots."""
+
+    def __init__(self, attrs: list[tuple[str, Any]], **fields: Any) -> None:
+        super().__init__(fields, attrs=[_NlaSlot(name, value) for name, value in attrs])
+
+    def get_attr(self, name: str, default: Any = None) -> Any:
+        found = [slot[1] for slot in self["attrs"] if slot[0] == name]
+        return found[0] if found else default
+
+
+def _cake_dump_msg(ifindex: int, cycle: int) -> _Nla:
+    """One CAKE qdisc message of a ``tc("dump")`` response, built from _cake_stats()."""
+    stats = _cake_stats(cycle)
+    tins = [
+        _Nla(
+            [
+                ("TCA_CAKE_TIN_STATS_SENT_BYTES64", tin["sent_bytes"]),
+                ("TCA_CAKE_TIN_STATS_SENT_PACKETS", tin["sent_packets"]),
+                ("TCA_CAKE_TIN_STATS_THRESHOLD_RATE64", 0),
+                ("TCA_CAKE_TIN_STATS_TARGET_US", 5000),
+                ("TCA_CAKE_TIN_STATS_DROPPED_PACKETS", tin["dropped_packets"]),
+                ("TCA_CAKE_TIN_STATS_ECN_MARKED_PACKETS", tin["ecn_marked_packets"]),
+                ("TCA_CAKE_TIN_STATS_BACKLOG_BYTES", tin["backlog_bytes"]),
+                ("TCA_CAKE_TIN_STATS_PEAK_DELAY_US", tin["peak_delay_us"]),
+                ("TCA_CAKE_TIN_STATS_AVG_DELAY_US", tin["avg_delay_us"]),
+                ("TCA_CAKE_TIN_STATS_BASE_DELAY_US", tin["base_delay_us"]),
+                ("TCA_CAKE_TIN_STATS_SPARSE_FLOWS", tin["sparse_flows"]),
+                ("TCA_CAKE_TIN_STATS_BULK_FLOWS", tin["bulk_flows"]),
+                ("TCA_CAKE_TIN_STATS_UNRESPONSIVE_FLOWS", tin["unresponsive_flows"]),
+            ]
+        )
+        for tin in stats["tins"]
+    ]
+    app = _Nla(
+        [
+            ("TCA_CAKE_STATS_CAPACITY_ESTIMATE64", stats["capacity_estimate"]),
+            ("TCA_CAKE_STATS_MEMORY_LIMIT", stats["memory_limit"]),
+            ("TCA_CAKE_STATS_MEMORY_USED", stats["memory_used"]),
+            (
+                "TCA_CAKE_STATS_TIN_STATS",
+                _Nla([(f"TCA_CAKE_TIN_STATS_{i + 1}", tin) for i, tin in enumerate(tins)]),
+            ),
+        ]
+    )
+    stats2 = _Nla(
+        [
+            ("TCA_STATS_BASIC", {"bytes": stats["bytes"], "packets": stats["packets"]}),
+            (
+                "TCA_STATS_QUEUE",
+                {
+                    "drops": stats["dropped"],
+                    "qlen": stats["queued_packets"],
+                    "backlog": stats["queued_bytes"],
+                },
+            ),
+            ("TCA_STATS_APP", app),
+        ]
+    )
+    return _Nla([("TCA_KIND", "cake"), ("TCA_STATS2", stats2)], index=ifindex)
+
+
+@contextlib.contextmanager
+def cake_netlink_cycle(workdir: Path) -> Iterator[BenchCall]:
+    """One CAKE stats cycle end to end: parse a two-qdisc netlink dump, update both signals.
+
+    Covers the background thread's NetlinkCakeBackend._parse_cake_msg() for
+    both directions plus the control loop's two CakeSignalProcessor.update()
+    calls on the parsed stats.
+    """
+    backends = []
+    for ifindex, interface in ((11, "bench-dl"), (12, "bench-ul")):
+        backend = NetlinkCakeBackend(interface=interface, logger=_LOGGER)
+        backend._ifindex = ifindex
+        backends.append(backend)
+    config = CakeSignalConfig(enabled=True, drop_rate_enabled=True, metrics_enabled=True)
+    processors = (CakeSignalProcessor(config), CakeSignalProcessor(config))
+    dumps = [[_cake_dump_msg(11, cycle), _cake_dump_msg(12, cycle)] for cycle in range(1, 501)]
+    i = 0
+
+    def call() -> object:
+        nonlocal i
+        msgs = dumps[i % 500]
+        i += 1
+        if i % 500 == 0:
+            for processor in processors:
+                processor.reset()
+        dl_stats = backends[0]._parse_cake_msg(msgs)
+        ul_stats = backends[1]._parse_cake_msg(msgs)
+        return processors[0].update(dl_stats), processors[1].update(ul_stats)
+
+    yield call
+
+
+@contextlib.contextmanager
+def queue_controller_4state(workdir: Path) -> Iterator[BenchCall]:
+    """QueueController.adjust_4state() sweeping load RTT through all four zones."""
+    controller = QueueController(
+        name="download",
+        floor_green=550_000_000,
+        floor_yellow=350_000_000,
+        floor_soft_red=275_000_000,
+        floor_red=200_000_000,
+        ceiling=940_000_000,
+        step_up=10_000_000,
+        factor_down=0.85,
+        factor_down_yellow=0.96,
+    )
+    # 0..90 ms of delta over a 25 ms baseline, up and back down
+    sweep = [25.0 + d * 0.5 for d in range(180)]
+    loads = sweep + sweep[::-1]
+    i = 0
+
+    def call() -> object:
+        nonlocal i
+        load = loads[i % len(loads)]
+        i += 1
+        return controller.adjust_4state(25.0, load, 9.0, 45.0, 80.0)
+
+    yield call
+
+
+@contextlib.contextmanager
+def metrics_writer_batch(workdir: Path) -> Iterator[BenchCall]:
+    """MetricsWriter.write_metrics_batch() with one cycle's worth of rows."""
+    MetricsWriter._reset_instance()
+    writer = MetricsWriter(workdir / "metrics.db")
+    metric_names = (
+        "wanctl_rtt_ms",
+        "wanctl_rtt_baseline_ms",
+        "wanctl_rtt_delta_ms",
+        "wanctl_rate_download_mbps",
+        "wanctl_rate_upload_mbps",
+        "wanctl_state_download",
+        "wanctl_state_upload",
+        "wanctl_cycle_duration_ms",
+        "wanctl_signal_jitter_ms",
+        "wanctl_signal_variance_ms2",
+        "wanctl_cake_drop_rate",
+        "wanctl_cake_backlog_bytes",
+    )
+    ts = 1_700_000_000
+
+    def call() -> object:
+        nonlocal ts
+        ts += 1
+        rows = [(ts, "spectrum", name, float(ts % 97), None, "raw") for name in metric_names]
+        rows.append((ts, "spectrum", "wanctl_cake_tin_drops", 1.0, {"tin": "bulk"}, "raw"))
+        rows.append((ts, "spectrum", "wanctl_cake_tin_drops", 0.0, {"tin": "voice"}, "raw"))
+        return writer.write_metrics_batch(rows)
+
+    try:
+        yield call
+    finally:
+        writer.close()
+        MetricsWriter._reset_instance()
+
+
+BENCHMARKS: dict[str, BenchSpec] = {
+    "WANController.run_cycle": BenchSpec(wan_controller_cycle, calls=300, warmup=50),
+    "SteeringDaemon.run_cycle": BenchSpec(steering_daemon_cycle, calls=300, warmup=50),
+    "SignalProcessor.process": BenchSpec(signal_processor, calls=2000, warmup=100),
+    "CakeSignalProcessor.update": BenchSpec(cake_signal, calls=2000, warmup=100),
+    "CakeStats.netlink_cycle": BenchSpec(cake_netlink_cycle, calls=1000, warmup=100),
+    "QueueController.adjust_4state": BenchSpec(queue_controller_4state, calls=2000, warmup=100),
+    "MetricsWriter.write_metrics_batch": BenchSpec(metrics_writer_batch, calls=200, warmup=20),
+}
+
+
+# =============================================================================
+# MEASUREMENT
+# =============================================================================
+
+
+def _percentile(ordered: array[int], q: float) -> int:
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def _time_rounds(call: BenchCall, calls: int, rounds: int) -> tuple[float, float]:
+    """Best-round (p50, p99) per-call latency in nanoseconds."""
+    clock = time.perf_counter_ns
+    best_p50 = best_p99 = float("inf")
+    samples = array("q", bytes(8 * calls))
+    for _ in range(rounds):
+        for i in range(calls):
+            start = clock()
+            call()
+            samples[i] = clock() - start
+        ordered = array("q", sorted(samples))
+        best_p50 = min(best_p50, _percentile(ordered, 0.50))
+        best_p99 = min(best_p99, _percentile(ordered, 0.99))
+    return best_p50, best_p99
+
+
+def _trace_allocations(call: BenchCall, calls: int) -> tuple[float, float]:
+    """(mean peak bytes allocated during one call, mean net growth per call)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start_current = tracemalloc.get_traced_memory()[0]
+        peak_total = 0
+        for _ in range(calls):
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            call()
+            peak_total += tracemalloc.get_traced_memory()[1] - before
+        retained = tracemalloc.get_traced_memory()[0] - start_current
+    finally:
+        tracemalloc.stop()
+    return peak_total / calls, retained / calls
+
+
+def measure(name: str, *, rounds: int = 5, scale: float = 1.0) -> BenchResult:
+    """Run benchmark ``name`` and return its per-call figures.
+
+    Args:
+        name: Key of BENCHMARKS
+        rounds: Timed rounds; the best round's percentiles are reported
+        scale: Multiplier on the benchmark's calls per round
+    """
+    spec = BENCHMARKS[name]
+    calls = max(10, int(spec.calls * scale))
+    with tempfile.TemporaryDirectory(prefix="wanctl-bench-") as tmp:
+        with spec.setup(Path(tmp)) as call:
+            for _ in range(spec.warmup):
+                call()
+            # Allocation pass first: tracing must not perturb the timed rounds
+            alloc_peak, retained = _trace_allocations(call, max(10, calls // 4))
+            p50_ns, p99_ns = _time_rounds(call, calls, rounds)
+    return BenchResult(
+        name=name,
+        calls=calls,
+        rounds=rounds,
+        p50_us=round(p50_ns / 1000.0, 2),
+        p99_us=round(p99_ns / 1000.0, 2),
+        alloc_peak_bytes=round(alloc_peak, 1),
+        retained_bytes=round(retained, 1),
+    )
+
+
+def compare(
+    result: BenchResult, baseline: dict[str, Any], thresholds: dict[str, float]
+) -> list[str]:
+    """Regressions of ``result`` against one baseline entry.
+
+    Args:
+        result: Fresh measurement
+        baseline: Baseline entry (``p50_us``, ``p99_us``, ``alloc_peak_bytes``)
+        thresholds: Allowed growth in percent, keyed ``time_pct`` and ``alloc_pct``
+
+    Returns:
+        One human-readable line per metric over its limit (empty if none).
+    """
+    limits = (
+        ("p50_us", thresholds["time_pct"]),
+        ("p99_us", thresholds["time_pct"]),
+        ("alloc_peak_bytes", thresholds["alloc_pct"]),
+    )
+    regressions = []
+    for key, pct in limits:
+        base = float(baseline[key])
+        current = float(getattr(result, key))
+        limit = base * (1.0 + pct / 100.0)
+        if current > limit:
+            regressions.append(
+                f"{result.name} {key}: {current:g} > {limit:g} (baseline {base:g} +{pct:g}%)"
+            )
+    return regressions
@@ -0,0 +1,80 @@
+"""Cycle-latency regression gate for the control-loop hot paths.
+
+Every benchmark in tests/perf/harness.py is measured once per session and
+compared against tests/fixtures/cycle_latency_baseline.json: per-call p50
+and p99 may grow by ``time_pct`` and per-call peak allocation by
+``alloc_pct`` before the test fails. Both thresholds can be overridden with
+WANCTL_BENCH_TIME_PCT / WANCTL_BENCH_ALLOC_PCT (e.g. on a slow runner).
+Refresh the baseline with ``python scripts/bench_cycle_latency.py --update-baseline``.
+
+The wall-clock gates are ``perf`` tests: they are excluded from the parallel
+default run and run serially with ``make perf``.
+"""
+
+import json
+import os
+
+import pytest
+
+from tests.perf.harness import BASELINE_PATH, BENCHMARKS, compare, measure
+from wanctl.wan_controller import CYCLE_INTERVAL_SECONDS
+
+BASELINE = json.loads(BASELINE_PATH.read_text())
+
+
+def _thresholds() -> dict[str, float]:
+    thresholds = dict(BASELINE["thresholds"])
+    for key, env in (
+        ("time_pct", "WANCTL_BENCH_TIME_PCT"),
+        ("alloc_pct", "WANCTL_BENCH_ALLOC_PCT"),
+    ):
+        if os.environ.get(env):
+            thresholds[key] = float(os.environ[env])
+    return thresholds
+
+
+@pytest.fixture(scope="module")
+def results():
+    cache = {}
+
+    def get(name):
+        if name not in cache:
+            cache[name] = measure(name)
+        return cache[name]
+
+    return get
+
+
+def test_baseline_covers_every_benchmark():
+    assert set(BASELINE["benchmarks"]) == set(BENCHMARKS)
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("name", sorted(BENCHMARKS))
+def test_no_regression_against_baseline(name, results):
+    regressions = compare(results(name), BASELINE["benchmarks"][name], _thresholds())
+
+    assert not regressions, "\n".join(regressions)
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("name", ["WANController.run_cycle", "SteeringDaemon.run_cycle"])
+def test_cycle_p99_within_cycle_interval(name, results):
+    # Both daemons tick at 20 Hz; a p99 near the interval means overruns
+    budget_us = CYCLE_INTERVAL_SECONDS * 1_000_000
+
+    assert results(name).p99_us < budget_us
+
+
+def test_compare_flags_growth_over_threshold():
+    result = measure("QueueController.adjust_4state", rounds=1, scale=0.05)
+    baseline = {
+        "p50_us": result.p50_us / 4,
+        "p99_us": result.p99_us * 10,
+        "alloc_peak_bytes": result.alloc_peak_bytes,
+    }
+
+    regressions = compare(result, baseline, {"time_pct": 100.0, "alloc_pct": 0.0})
+
+    assert len(regressions) == 1
+    assert "p50_us" in regressions[0]
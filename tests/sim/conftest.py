@@ -0,0 +1,15 @@
+"""Simulator subpackage test fixtures."""
+
+from pathlib import Path
+
+import pytest
+
+from wanctl.autorate_config import Config
+
+EXAMPLE_CONFIG = Path(__file__).resolve().parents[2] / "configs/examples/cable.yaml.example"
+
+
+@pytest.fixture
+def cable_config():
+    """Real autorate Config from the shipped cable example (940/38 Mbps ceilings)."""
+    return Config(str(EXAMPLE_CONFIG))
@@ -0,0 +1,109 @@
+"""Closed-loop tests: real WANController.run_cycle() against the link model."""
+
+import time
+
+import pytest
+
+from wanctl.sim import BottleneckLink, LinkDirection, Simulation, Trace
+
+
+def _link(dl_capacity, **kwargs):
+    kwargs.setdefault("base_rtt_ms", 24.0)
+    kwargs.setdefault("jitter_ms", 0.5)
+    return BottleneckLink(
+        download=LinkDirection(dl_capacity, Trace.constant(1.2e9)),
+        upload=LinkDirection(Trace.constant(36e6), Trace.constant(10e6)),
+        **kwargs,
+    )
+
+
+class TestSimulationClosedLoop:
+    def test_controller_backs_off_to_link_capacity(self, cable_config):
+        # Ceiling (940 Mbps) is well above what the link can carry
+        link = _link(Trace.constant(700e6))
+        with Simulation(cable_config, link) as sim:
+            result = sim.run(120.0)
+            summary = result.summary()
+
+        assert result.cycles == 2400
+        assert result.failed_cycles == 0
+        assert summary["rate_changes"]["download"] > 0
+        # Applied rates reached the link model and dropped below the ceiling
+        assert min(result.dl_rate_bps) < 700e6 < cable_config.download_ceiling
+        # Bloat is bounded well below the 250ms ISP buffer
+        assert summary["queue_delay_ms"]["p50"] < 50.0
+        assert summary["zones"]["download"]["GREEN"] > 0.3
+        assert summary["utilization"]["download"] > 0.6
+
+    def test_rtt_responds_to_applied_rates(self, cable_config):
+        link = _link(Trace.constant(700e6), jitter_ms=0.0)
+        with Simulation(cable_config, link) as sim:
+            result = sim.run(30.0)
+
+        # The rate applied in cycle i decides whether the ISP queue grows in cycle i+1
+        delay = result.queue_delay_ms
+        growth = [
+            (rate, delay[i + 1] - delay[i])
+            for i, rate in enumerate(result.dl_rate_bps[:-1])
+            if delay[i] < 240.0
+        ]
+        assert all(d > 0 for rate, d in growth if rate > 701e6)
+        assert all(d <= 0 for rate, d in growth if rate < 699e6)
+        assert any(rate > 701e6 for rate, _ in growth)
+        assert any(rate < 699e6 for rate, _ in growth)
+
+    def test_capacity_drop_pulls_rate_down(self, cable_config):
+        link = _link(Trace([(0.0, 900e6), (60.0, 400e6)]))
+        with Simulation(cable_config, link) as sim:
+            before = sim.run(60.0)
+            after = sim.run(60.0)
+
+        assert after.t_sec[0] == pytest.approx(60.05)
+        tail = after.dl_rate_bps[len(after.dl_rate_bps) // 2 :]
+        assert sum(tail) / len(tail) < sum(before.dl_rate_bps) / len(before.dl_rate_bps)
+        assert min(tail) < 400e6
+
+    def test_runs_are_deterministic(self, cable_config):
+        def run():
+            with Simulation(cable_config, _link(Trace.constant(600e6), seed=3)) as sim:
+                return sim.run(20.0)
+
+        first, second = run(), run()
+        assert list(first.dl_rate_bps) == list(second.dl_rate_bps)
+        assert list(first.queue_delay_ms) == list(second.queue_delay_ms)
+
+    def test_faster_than_real_time(self, cable_config):
+        start = time.perf_counter()
+        with Simulation(cable_config, _link(Trace.constant(700e6))) as sim:
+            result = sim.run(60.0, sample_every=20)
+
+        assert len(result.t_sec) == 60
+        assert time.perf_counter() - start < 60.0
+        assert result.speedup > 1.0
+
+
+class TestSimulationIsolation:
+    def test_config_and_host_state_untouched(self, cable_config, tmp_path):
+        original_state_file = cable_config.state_file
+        with Simulation(cable_config, _link(Trace.constant(700e6)), state_dir=tmp_path) as sim:
+            sim.run(10.0)
+            assert sim.controller is not None
+            assert sim.controller._metrics_writer is None
+
+        assert cable_config.state_file == original_state_file
+        assert "db_path" not in (cable_config.data.get("storage") or {})
+        assert (tmp_path / "cable_state.json").exists()
+
+    def test_clock_restored_after_run(self, cable_config):
+        import wanctl.wan_controller as wc
+
+        with Simulation(cable_config, _link(Trace.constant(700e6))) as sim:
+            sim.run(1.0)
+            assert sim.clock.elapsed == pytest.approx(1.0)
+
+        assert wc.time is time
+
+    def test_sample_every_validated(self, cable_config):
+        with Simulation(cable_config, _link(Trace.constant(700e6))) as sim:
+            with pytest.raises(ValueError):
+                sim.run(1.0, sample_every=0)
@@ -0,0 +1,143 @@
+"""Tests for the simulator clock and bottleneck link model."""
+
+import time
+
+import pytest
+
+from wanctl.cake_signal import CakeSignalConfig, CakeSignalProcessor
+from wanctl.sim import BottleneckLink, LinkDirection, Trace, VirtualClock
+
+
+def _link(capacity_bps, demand_bps, **kwargs):
+    kwargs.setdefault("jitter_ms", 0.0)
+    return BottleneckLink(
+        download=LinkDirection(Trace.constant(capacity_bps), Trace.constant(demand_bps)),
+        upload=LinkDirection(Trace.constant(20e6), Trace.constant(0.0)),
+        **kwargs,
+    )
+
+
+class TestTrace:
+    def test_step_lookup(self):
+        trace = Trace([(10.0, 2.0), (0.0, 1.0), (20.0, 3.0)])
+
+        assert [trace.at(t) for t in (-1.0, 0.0, 9.9, 10.0, 25.0)] == [1.0, 1.0, 1.0, 2.0, 3.0]
+
+    def test_empty_trace_rejected(self):
+        with pytest.raises(ValueError):
+            Trace([])
+
+    def test_diurnal_peak_and_trough(self):
+        trace = Trace.diurnal(100.0, 500.0, period_sec=100.0, step_sec=1.0, peak_sec=25.0)
+
+        assert trace.at(25.0) == pytest.approx(500.0)
+        assert trace.at(75.0) == pytest.approx(100.0)
+
+
+class TestVirtualClock:
+    def test_install_rebinds_control_seams_and_restores(self):
+        import wanctl.alert_engine as alert_engine
+        import wanctl.queue_controller as qc
+
+        clock = VirtualClock(start=50.0, wall_start=1_000_000.0)
+        with clock.install() as patched:
+            assert "wanctl.queue_controller" in patched
+            # Modules outside the control cycle keep real time
+            assert alert_engine.time is time
+            clock.advance(2.5)
+            assert qc.time.monotonic() == 52.5
+            assert qc.time.time() == 1_000_002.5
+            qc.time.sleep(0.5)
+            assert clock.elapsed == 3.0
+            # perf_counter stays real so profiling measures actual cost
+            assert qc.time.perf_counter is time.perf_counter
+        assert qc.time is time
+
+    def test_install_binds_only_named_modules(self):
+        import wanctl.queue_controller as qc
+        import wanctl.rate_utils as rate_utils
+
+        clock = VirtualClock(start=50.0)
+        with clock.install(["wanctl.rate_utils"]) as patched:
+            assert patched == ["wanctl.rate_utils"]
+            assert rate_utils.time.monotonic() == 50.0
+            assert qc.time is time
+        assert rate_utils.time is time
+
+    def test_negative_advance_ignored(self):
+        clock = VirtualClock(start=5.0)
+        clock.advance(-1.0)
+
+        assert clock.now == 5.0
+
+
+class TestBottleneckLink:
+    def test_shaper_below_capacity_keeps_isp_queue_empty(self):
+        link = _link(100e6, 1e9, base_rtt_ms=20.0)
+        link.set_shaper("download", 90e6)
+        for _ in range(200):
+            link.advance(0.05)
+
+        assert link.queue_delay_ms == 0.0
+        assert link.probe_rtt_ms() == 20.0
+        assert link.utilization("download") == pytest.approx(0.9, abs=0.01)
+
+    def test_shaper_above_capacity_builds_bounded_bloat(self):
+        link = _link(100e6, 1e9, base_rtt_ms=20.0)
+        link.set_shaper("download", 120e6)
+        link.advance(0.05)
+        first = link.queue_delay_ms
+        for _ in range(400):
+            link.advance(0.05)
+
+        assert first > 0.0
+        # Buffer is 250ms deep at capacity by default
+        assert link.queue_delay_ms == pytest.approx(250.0)
+        assert link.probe_rtt_ms() == pytest.approx(270.0)
+
+    def test_cross_traffic_shares_bottleneck(self):
+        link = BottleneckLink(
+            download=LinkDirection(
+                Trace.constant(100e6), Trace.constant(1e9), cross_traffic_bps=Trace.constant(30e6)
+            ),
+            upload=LinkDirection(Trace.constant(20e6), Trace.constant(0.0)),
+            jitter_ms=0.0,
+        )
+        link.set_shaper("download", 90e6)
+        for _ in range(20):
+            link.advance(0.05)
+
+        assert link.queue_delay_ms > 0.0
+
+    def test_saturated_shaper_reports_cake_drops_and_backlog(self):
+        link = _link(100e6, 1e9)
+        link.set_shaper("download", 80e6)
+        processor = CakeSignalProcessor(config=CakeSignalConfig(enabled=True))
+        processor.update(link.queue_stats("download"))
+        for _ in range(20):
+            link.advance(0.05)
+        stats = link.queue_stats("download")
+        snapshot = processor.update(stats)
+
+        assert stats["dropped"] > 0
+        # COBALT holds the shaper queue at the 5ms target
+        assert stats["tins"][0]["avg_delay_us"] == 5000
+        assert stats["queued_bytes"] == pytest.approx(80e6 * 0.005 / 8, rel=0.01)
+        assert snapshot is not None
+        assert snapshot.drop_rate > 0
+
+    def test_idle_link_has_no_drops(self):
+        link = _link(100e6, 10e6)
+        for _ in range(20):
+            link.advance(0.05)
+
+        assert link.queue_stats("download")["dropped"] == 0
+
+    def test_total_probe_loss(self):
+        assert _link(100e6, 0.0, loss_pct=100.0).probe_rtt_ms() is None
+
+    def test_jitter_is_seeded(self):
+        a = _link(100e6, 0.0, jitter_ms=2.0, seed=7)
+        b = _link(100e6, 0.0, jitter_ms=2.0, seed=7)
+
+        assert [a.probe_rtt_ms() for _ in range(5)] == [b.probe_rtt_ms() for _ in range(5)]
@@ -5,22 +5,28 @@ Covers:
 - FlapDetector: record_toggle, check_flapping, penalty activation/expiry, disabled mode
 - DryRunLogger: enabled/disabled, ENABLE/DISABLE decision logging
 - ConfidenceController.evaluate(): good/degraded state transitions, dry-run behavior
+- ConfidenceController.evaluate_compiled(): differential replay against evaluate()
 """
 
 import logging
+import random
 import time
+from collections import Counter, deque
 from unittest.mock import MagicMock
 
 import pytest
 
+from tests.fixtures.phase206_replay_corpus import load_golden
 from wanctl.steering.steering_confidence import (
     ConfidenceController,
     ConfidenceSignals,
     ConfidenceWeights,
     DryRunLogger,
     FlapDetector,
+    SustainCounters,
     TimerManager,
     TimerState,
+    compile_confidence_table,
     compute_confidence,
 )
 
@@ -1151,3 +1157,198 @@ class TestWanAwarenessLogging:
         assert any("wan_zone=RED" in c for c in info_calls), (
             f"Expected 'wan_zone=RED' in recovery_timer_reset reason, got: {info_calls}"
         )
+
+
+# =============================================================================
+# Compiled evaluation tests
+# =============================================================================
+
+
+def _golden_replay_cycles() -> list[tuple]:
+    """Steering cycles derived from the Phase 206 golden capture.
+
+    Returns (cake_state, rtt_delta_ms, drops, queue_pct, wan_zone, stats_ok).
+    """
+    cycles = []
+    for index, sample in enumerate(load_golden()):
+        delta = sample.load_rtt_ms - sample.baseline_rtt_ms
+        if delta > 80.0:
+            cake_state = "RED"
+        elif delta > 45.0:
+            cake_state = "SOFT_RED"
+        elif delta > 15.0:
+            cake_state = "YELLOW"
+        else:
+            cake_state = "GREEN"
+        delay_ms = sample.cake_avg_delay_us / 1000.0
+        wan_zone = (None, "GREEN", "SOFT_RED", "RED", "YELLOW")[(index // 40) % 5]
+        cycles.append(
+            (cake_state, delta, float(int(delay_ms) % 7), min(100.0, delay_ms), wan_zone, True)
+        )
+    return cycles
+
+
+def _random_walk_cycles(seed: int, count: int) -> list[tuple]:
+    """Sticky random walk covering every state, zone, tier and stats-read failure."""
+    rng = random.Random(seed)
+    # Weighted towards clear signals so recoveries happen as often as degrades
+    states = ("GREEN", "GREEN", "GREEN", "YELLOW", "SOFT_RED", "RED", "UNKNOWN")
+    zones = (None, "GREEN", "GREEN", "YELLOW", "SOFT_RED", "RED")
+    cake_state, wan_zone = "GREEN", None
+    rtt_delta, drops, queue = 0.0, 0.0, 0.0
+    cycles = []
+    for _ in range(count):
+        if rng.random() < 0.1:
+            cake_state = rng.choice(states)
+        if rng.random() < 0.05:
+            wan_zone = rng.choice(zones)
+        if rng.random() < 0.2:
+            rtt_delta = rng.choice(
+                [0.0, 0.0, 5.0, 9.9, 10.0, 50.0, 80.0, 80.1, 120.0, 120.5, 300.0]
+            )
+        if rng.random() < 0.2:
+            drops = rng.choice([0.0, 0.0, 0.0005, 1.0, 2.0, 5.0])
+        if rng.random() < 0.2:
+            queue = rng.choice([0.0, 50.0, 50.5, 90.0])
+        cycles.append((cake_state, rtt_delta, drops, queue, wan_zone, rng.random() > 0.1))
+    return cycles
+
+
+class TestCompiledEvaluation:
+    """Differential tests: evaluate_compiled() must match evaluate() cycle for cycle."""
+
+    @pytest.fixture
+    def logger(self):
+        return MagicMock(spec=logging.Logger)
+
+    def _config(self, compiled: bool) -> dict:
+        return {
+            "confidence": {
+                "steer_threshold": 55,
+                "recovery_threshold": 20,
+                "sustain_duration_sec": 0.2,
+                "recovery_sustain_sec": 0.3,
+                "compiled_evaluation": compiled,
+            },
+            "timers": {"hold_down_duration_sec": 1.0},
+            "flap_detection": {
+                "enabled": True,
+                "window_minutes": 5,
+                "max_toggles": 2,
+                "penalty_duration_sec": 60,
+                "penalty_threshold_add": 15,
+            },
+            "dry_run": {"enabled": False},
+        }
+
+    def _replay(self, cycles, logger, stats_history_len, weights=(None, None)) -> Counter:
+        """Drive both modes the way the steering daemon does; return decision counts."""
+        interpreted = ConfidenceController(self._config(False), logger)
+        compiled = ConfidenceController(
+            self._config(True), logger, stats_history_len=stats_history_len
+        )
+        cake_state_history: list[str] = []
+        drops_history: deque = deque(maxlen=stats_history_len)
+        queue_history: deque = deque(maxlen=stats_history_len)
+        current_state = "WAN1_GOOD"
+        decisions: Counter = Counter()
+
+        for cycle, (cake_state, rtt_delta, drops, queue, wan_zone, stats_ok) in enumerate(cycles):
+            if stats_ok:
+                drops_history.append(drops)
+                queue_history.append(queue)
+                compiled.record_cake_stats(drops, queue)
+            else:
+                drops = queue = 0.0
+            signals = ConfidenceSignals(
+                cake_state=cake_state,
+                rtt_delta_ms=rtt_delta,
+                drops_per_sec=drops,
+                queue_depth_pct=queue,
+                cake_state_history=list(cake_state_history),
+                drops_history=list(drops_history),
+                queue_history=list(queue_history),
+                wan_zone=wan_zone,
+            )
+
+            expected = interpreted.evaluate(
+                signals,
+                current_state,
+                wan_red_weight=weights[0],
+                wan_soft_red_weight=weights[1],
+            )
+            actual = compiled.evaluate_compiled(
+                cake_state,
+                rtt_delta,
+                drops,
+                queue,
+                current_state,
+                wan_zone=wan_zone,
+                wan_red_weight=weights[0],
+                wan_soft_red_weight=weights[1],
+            )
+
+            want, got = interpreted.timer_state, compiled.timer_state
+            assert actual == expected, f"cycle {cycle}"
+            assert got.confidence_score == want.confidence_score, f"cycle {cycle}"
+            assert got.confidence_contributors == want.confidence_contributors, f"cycle {cycle}"
+            assert (got.degrade_timer, got.hold_down_timer, got.recovery_timer) == (
+                want.degrade_timer,
+                want.hold_down_timer,
+                want.recovery_timer,
+            ), f"cycle {cycle}"
+            assert len(got.flap_window) == len(want.flap_window)
+
+            decisions[expected] += 1
+            if expected == "ENABLE_STEERING":
+                current_state = "WAN1_DEGRADED"
+            elif expected == "DISABLE_STEERING":
+                current_state = "WAN1_GOOD"
+            cake_state_history = [*cake_state_history, cake_state][-10:]
+            compiled.record_cake_state(cake_state)
+        return decisions
+
+    @pytest.mark.parametrize("stats_history_len", [1, 2, 3, 100])
+    def test_golden_replay_matches_interpreted(self, logger, stats_history_len):
+        decisions = self._replay(_golden_replay_cycles(), logger, stats_history_len)
+
+        assert decisions["ENABLE_STEERING"] > 0
+
+    @pytest.mark.parametrize(("seed", "stats_history_len"), [(1, 3), (2, 100), (3, 2)])
+    def test_random_walk_matches_interpreted(self, logger, seed, stats_history_len):
+        decisions = self._replay(
+            _random_walk_cycles(seed, 3000), logger, stats_history_len, weights=(30, 7)
+        )
+
+        assert decisions["ENABLE_STEERING"] > 0
+        assert decisions["DISABLE_STEERING"] > 0
+
+    def test_table_uses_configured_wan_weights(self):
+        table = compile_confidence_table(wan_red_weight=40)
+
+        assert table.wan_scores == (0, ConfidenceWeights.WAN_SOFT_RED, 40)
+        assert table.state_scores[3] == ConfidenceWeights.RED_STATE
+
+    def test_reset_matches_incremental_counters(self):
+        cake_states = ["RED", "SOFT_RED", "SOFT_RED", "SOFT_RED", "SOFT_RED"]
+        stats = [(0.0, 60.0), (1.0, 70.0), (3.0, 40.0), (4.0, 55.0), (5.0, 80.0)]
+        incremental = SustainCounters(stats_history_len=4)
+        for cake_state in cake_states:
+            incremental.record_cake_state(cake_state)
+        for drops, queue in stats:
+            incremental.record_cake_stats(drops, queue)
+
+        restored = SustainCounters(stats_history_len=4)
+        restored.reset(cake_states, [d for d, _ in stats][-4:], [q for _, q in stats][-4:])
+
+        for counters in (incremental, restored):
+            assert counters.soft_red_run == 4
+            assert counters.drops_len == 4
+            assert list(counters.recent_drops) == [3.0, 4.0, 5.0]
+            assert counters.queue_high_run == 2
+
+    def test_evaluate_compiled_requires_compiled_mode(self, logger):
+        controller = ConfidenceController(self._config(False), logger)
+
+        with pytest.raises(RuntimeError, match="compiled"):
+            controller.evaluate_compiled("GREEN", 0.0, 0.0, 0.0, "WAN1_GOOD")
@@ -3068,6 +3068,28 @@ class TestSteeringConfig:
         assert config.confidence_config["confidence"]["steer_threshold"] == 55
         assert config.confidence_config["dry_run"]["enabled"] is True
 
+    def test_confidence_compiled_evaluation_defaults_off(self, tmp_path, valid_config_dict):
+        """Test compiled_evaluation is opt-in and parsed as a bool."""
+        import yaml
+
+        from wanctl.steering.daemon import SteeringConfig
+
+        valid_config_dict["mode"] = {"use_confidence_scoring": True}
+        valid_config_dict["confidence"] = {"steer_threshold": 55}
+        config_file = tmp_path / "steering.yaml"
+        config_file.write_text(yaml.dump(valid_config_dict))
+        assert (
+            SteeringConfig(str(config_file)).confidence_config["confidence"]["compiled_evaluation"]
+            is False
+        )
+
+        valid_config_dict["confidence"]["compiled_evaluation"] = True
+        config_file.write_text(yaml.dump(valid_config_dict))
+        assert (
+            SteeringConfig(str(config_file)).confidence_config["confidence"]["compiled_evaluation"]
+            is True
+        )
+
     def test_confidence_steer_threshold_out_of_range(self, tmp_path, valid_config_dict):
         """Test error when steer_threshold not in 0-100 range."""
         import yaml
@@ -3886,6 +3908,43 @@ class TestConfidenceIntegration:
         # Verify evaluate was called - ConfidenceController handles logging internally
         daemon_with_confidence.confidence_controller.evaluate.assert_called_once()
 
+    def test_compiled_evaluation_skips_signal_snapshot(
+        self, mock_config, mock_state_mgr, mock_router, mock_logger
+    ):
+        """Test compiled mode seeds counters from state and calls evaluate_compiled()."""
+        from wanctl.steering.cake_stats import CongestionSignals
+        from wanctl.steering.daemon import SteeringDaemon
+
+        mock_config.confidence_config["confidence"]["compiled_evaluation"] = True
+        mock_state_mgr.state["cake_state_history"] = ["SOFT_RED", "SOFT_RED"]
+        with patch("wanctl.steering.daemon.CakeStatsReader"):
+            with patch("wanctl.steering.daemon.ConfidenceController"):
+                daemon = SteeringDaemon(
+                    config=mock_config,
+                    state=mock_state_mgr,
+                    router=mock_router,
+                    rtt_measurement=MagicMock(),
+                    baseline_loader=MagicMock(),
+                    logger=mock_logger,
+                )
+        controller = daemon.confidence_controller
+        controller.reset_sustain_counters.assert_called_once_with(["SOFT_RED", "SOFT_RED"], [], [])
+        controller.evaluate_compiled.return_value = None
+
+        signals = CongestionSignals(
+            rtt_delta=50.0,
+            rtt_delta_ewma=50.0,
+            cake_drops=3,
+            queued_packets=40,
+            baseline_rtt=25.0,
+        )
+        with patch.object(daemon, "_update_state_machine_unified", return_value=False):
+            daemon.update_state_machine(signals)
+
+        controller.evaluate.assert_not_called()
+        args = controller.evaluate_compiled.call_args.args
+        assert args == ("GREEN", 50.0, 3.0, 40.0, "SPECTRUM_GOOD")
+
     # =========================================================================
     # Live mode tests (dry_run=False)
     # =========================================================================
@@ -5909,7 +5968,7 @@ class TestDryRunReload:
         mock_daemon.logger.error.assert_called()
 
     def test_run_daemon_loop_calls_reload_on_signal(self):
-        """run_daemon_loop calls _reload_dry_run_config when is_reload_requested() returns True."""
+        """run_daemon_loop calls daemon.reload() when is_reload_requested() returns True."""
         from wanctl.steering.daemon import run_daemon_loop
 
         daemon = MagicMock()
@@ -5940,7 +5999,7 @@ class TestDryRunReload:
         ):
             run_daemon_loop(daemon, config, logger, shutdown_event)
 
-        daemon._reload_dry_run_config.assert_called()
+        daemon.reload.assert_called()
 
     def test_run_daemon_loop_calls_reset_reload_state(self):
         """run_daemon_loop calls reset_reload_state() after handling reload."""
@@ -5976,6 +6035,78 @@ class TestDryRunReload:
         mock_reset.assert_called()
 
 
+class TestSteeringReloadDispatch:
+    """SteeringDaemon.reload() re-applies kill switches; other reloaders run on change."""
+
+    _KILL_SWITCHES = ("_reload_dry_run_config", "_reload_wan_state_config")
+    _GATED = ("_reload_webhook_url_config",)
+
+    def _daemon(self, config_path, previous):
+        from wanctl.steering.daemon import SteeringDaemon
+
+        with patch.object(SteeringDaemon, "__init__", lambda self, *a, **k: None):
+            daemon = SteeringDaemon.__new__(SteeringDaemon)
+        daemon.config = MagicMock()
+        daemon.config.config_file_path = str(config_path)
+        daemon.logger = MagicMock()
+        daemon.route_manager = None
+        daemon._config_snapshot = previous
+        for name in (
+            *self._KILL_SWITCHES,
+            *self._GATED,
+            "_reload_route_management_config",
+            "_handle_mode_change",
+        ):
+            setattr(daemon, name, MagicMock())
+        return daemon
+
+    def test_only_changed_sections_reload(self, tmp_path):
+        from wanctl.config_snapshot import load_config_snapshot
+
+        old_path = tmp_path / "old.yaml"
+        new_path = tmp_path / "new.yaml"
+        old_path.write_text(yaml.dump({"wan_state": {"enabled": False}, "alerting": {}}))
+        new_path.write_text(
+            yaml.dump({"wan_state": {"enabled": False}, "alerting": {"webhook_url": "http://x"}})
+        )
+        daemon = self._daemon(new_path, load_config_snapshot(str(old_path)))
+
+        daemon.reload()
+
+        assert all(getattr(daemon, n).called for n in self._GATED)
+
+    def test_unchanged_file_reapplies_kill_switches_and_route_management(self, tmp_path):
+        from wanctl.config_snapshot import load_config_snapshot
+
+        path = tmp_path / "steering.yaml"
+        path.write_text(yaml.dump({"route_management": {"mode": "active"}}))
+        daemon = self._daemon(path, load_config_snapshot(str(path)))
+
+        daemon.reload()
+
+        assert not any(getattr(daemon, n).called for n in self._GATED)
+        assert all(getattr(daemon, n).called for n in self._KILL_SWITCHES)
+        daemon._reload_route_management_config.assert_called_once()
+        daemon._handle_mode_change.assert_called_once_with(old_mode=None)
+
+    def test_reloaders_share_one_read(self, tmp_path):
+        from wanctl.config_snapshot import load_config_snapshot
+
+        path = tmp_path / "steering.yaml"
+        path.write_text(yaml.dump({"alerting": {"webhook_url": "http://x"}}))
+        daemon = self._daemon(path, None)
+
+        with patch(
+            "wanctl.steering.daemon.load_config_snapshot", wraps=load_config_snapshot
+        ) as load:
+            daemon.reload()
+
+        load.assert_called_once_with(str(path))
+        data = {"alerting": {"webhook_url": "http://x"}}
+        for name in (*self._KILL_SWITCHES, *self._GATED, "_reload_route_management_config"):
+            getattr(daemon, name).assert_called_once_with(data)
+
+
 class TestWanStateReload:
     """Tests for SteeringDaemon._reload_wan_state_config() method.
 
@@ -6092,7 +6223,7 @@ class TestWanStateReload:
         assert "unchanged" in warn_msg.lower()
 
     def test_run_daemon_loop_calls_both_reload_methods_on_signal(self):
-        """run_daemon_loop SIGUSR1 block calls both _reload_dry_run_config AND _reload_wan_state_config."""
+        """run_daemon_loop SIGUSR1 block dispatches through daemon.reload()."""
         from wanctl.steering.daemon import run_daemon_loop
 
         daemon = MagicMock()
@@ -6122,8 +6253,7 @@ class TestWanStateReload:
         ):
             run_daemon_loop(daemon, config, logger, shutdown_event)
 
-        daemon._reload_dry_run_config.assert_called()
-        daemon._reload_wan_state_config.assert_called()
+        daemon.reload.assert_called()
 
 
 class TestStartupStorage:
@@ -6279,3 +6409,193 @@ class TestSteeringPeriodicMaintenance:
             _run_steering_maintenance(conn, retention, "/tmp/metrics.db", logger)
 
         mock_cleanup.assert_not_called()
+
+
+class TestZoneEventWakeup:
+    """Tests for event-driven steering wakeups from autorate zone transitions."""
+
+    @pytest.fixture
+    def loader_config(self, tmp_path):
+        config = MagicMock()
+        config.baseline_rtt_min = 10.0
+        config.baseline_rtt_max = 60.0
+        config.primary_wan = "spectrum"
+        state_file = tmp_path / "spectrum_state.json"
+        state_file.write_text(
+            json.dumps({"ewma": {"baseline_rtt": 25.0}, "congestion": {"dl_state": "GREEN"}})
+        )
+        config.primary_state_file = state_file
+        return config
+
+    @staticmethod
+    def _event(wan_name="spectrum", dl_state="RED", timestamp=None):
+        from wanctl.zone_events import ZoneEvent
+
+        return ZoneEvent(
+            wan_name=wan_name,
+            dl_state=dl_state,
+            ul_state="GREEN",
+            dl_rate_bps=400_000_000,
+            ul_rate_bps=30_000_000,
+            timestamp=time.time() if timestamp is None else timestamp,
+        )
+
+    def test_fresh_event_overrides_state_file_zone(self, loader_config):
+        from wanctl.steering.daemon import BaselineLoader
+
+        loader = BaselineLoader(loader_config, MagicMock())
+        assert loader.apply_zone_event(self._event()) is True
+
+        baseline_rtt, wan_zone = loader.load_baseline_rtt()
+
+        assert baseline_rtt == 25.0
+        assert wan_zone == "RED"
+
+    def test_event_for_other_wan_ignored(self, loader_config):
+        from wanctl.steering.daemon import BaselineLoader
+
+        loader = BaselineLoader(loader_config, MagicMock())
+        assert loader.apply_zone_event(self._event(wan_name="att")) is False
+
+        assert loader.load_baseline_rtt()[1] == "GREEN"
+
+    def test_event_older_than_state_file_ignored(self, loader_config):
+        from wanctl.steering.daemon import BaselineLoader
+
+        loader = BaselineLoader(loader_config, MagicMock())
+        mtime = loader_config.primary_state_file.stat().st_mtime
+        loader.apply_zone_event(self._event(timestamp=mtime - 1.0))
+
+        assert loader.load_baseline_rtt()[1] == "GREEN"
+
+    def test_stale_event_ignored(self, loader_config):
+        import os
+
+        from wanctl.steering.daemon import BaselineLoader
+
+        old = time.time() - 60.0
+        os.utime(loader_config.primary_state_file, (old - 10.0, old - 10.0))
+        loader = BaselineLoader(loader_config, MagicMock())
+        loader.apply_zone_event(self._event(timestamp=old))
+
+        # Event and file both stale -> SAFE-01 GREEN default
+        assert loader.load_baseline_rtt()[1] == "GREEN"
+
+    def test_loop_wakes_on_event_before_tick(self, tmp_path, mock_steering_config):
+        from wanctl.steering.daemon import run_daemon_loop
+        from wanctl.zone_events import ZoneEventListener, ZoneEventPublisher
+
+        mock_steering_config.measurement_interval = 5.0
+        mock_steering_config.zone_events_config = {
+            "socket_path": str(tmp_path / "ev.sock"),
+            "idle_interval_seconds": 5.0,
+        }
+        listener = ZoneEventListener(str(tmp_path / "ev.sock"), MagicMock())
+        listener.open()
+        publisher = ZoneEventPublisher(str(tmp_path / "ev.sock"), "spectrum", MagicMock())
+        shutdown_event = threading.Event()
+        cycle_times: list[float] = []
+
+        daemon = MagicMock()
+
+        def run_cycle():
+            cycle_times.append(time.monotonic())
+            if len(cycle_times) == 1:
+                threading.Timer(0.05, publisher.publish_if_changed, ("RED", "GREEN", 1, 1)).start()
+            else:
+                shutdown_event.set()
+            return True
+
+        daemon.run_cycle.side_effect = run_cycle
+        try:
+            with (
+                patch("wanctl.steering.daemon.is_systemd_available", return_value=False),
+                patch("wanctl.steering.daemon.notify_watchdog"),
+                patch("wanctl.steering.daemon.update_steering_health_status"),
+            ):
+                run_daemon_loop(
+                    daemon,
+                    mock_steering_config,
+                    MagicMock(),
+                    shutdown_event,
+                    zone_listener=listener,
+                )
+        finally:
+            publisher.close()
+            listener.close()
+
+        assert len(cycle_times) == 2
+        assert cycle_times[1] - cycle_times[0] < 1.0
+        applied = daemon.baseline_loader.apply_zone_event.call_args.args[0]
+        assert applied.dl_state == "RED"
+
+    def test_idle_interval_used_only_when_idle(self, mock_steering_config):
+        from wanctl.steering.daemon import run_daemon_loop
+
+        mock_steering_config.measurement_interval = 0.05
+        mock_steering_config.zone_events_config = {
+            "socket_path": "/unused",
+            "idle_interval_seconds": 2.0,
+        }
+        listener = MagicMock()
+        listener.drain.return_value = []
+        listener.wait.return_value = []
+        shutdown_event = threading.Event()
+        daemon = MagicMock()
+        daemon.is_idle.side_effect = [True, False]
+
+        def run_cycle():
+            if daemon.run_cycle.call_count >= 2:
+                shutdown_event.set()
+            return True
+
+        daemon.run_cycle.side_effect = run_cycle
+        with (
+            patch("wanctl.steering.daemon.is_systemd_available", return_value=False),
+            patch("wanctl.steering.daemon.notify_watchdog"),
+            patch("wanctl.steering.daemon.update_steering_health_status"),
+        ):
+            run_daemon_loop(
+                daemon,
+                mock_steering_config,
+                MagicMock(),
+                shutdown_event,
+                zone_listener=listener,
+            )
+
+        first_sleep = listener.wait.call_args_list[0].args[0]
+        assert first_sleep > 1.0
+        assert listener.wait.call_count == 1  # second cycle hit shutdown before waiting
+
+    def test_config_disabled_by_default(self, tmp_path):
+        from wanctl.steering.daemon import SteeringConfig
+
+        config = object.__new__(SteeringConfig)
+        config.data = {}
+        config.measurement_interval = 0.5
+        config._load_zone_events_config()
+
+        assert config.zone_events_config is None
+
+    def test_config_clamps_idle_interval_to_measurement_interval(self):
+        from wanctl.steering.daemon import SteeringConfig
+
+        config = object.__new__(SteeringConfig)
+        config.data = {"zone_events": {"enabled": True, "idle_interval_seconds": 0.1}}
+        config.measurement_interval = 0.5
+        config._load_zone_events_config()
+
+        assert config.zone_events_config == {
+            "socket_path": "/run/wanctl/steering-events.sock",
+            "idle_interval_seconds": 0.5,
+        }
+
+    def test_config_rejects_relative_socket_path(self):
+        from wanctl.steering.daemon import SteeringConfig
+
+        config = object.__new__(SteeringConfig)
+        config.data = {"zone_events": {"enabled": True, "socket_path": "events.sock"}}
+        config.measurement_interval = 0.5
+        config._load_zone_events_config()
+
+        assert config.zone_events_config is None
@@ -1372,6 +1372,7 @@ class TestWanAwarenessHealth:
             daemon._profiler = OperationProfiler(max_samples=1200)
             daemon._overrun_count = 0
             daemon._cycle_interval_ms = 50.0
+            daemon._zone_listener = None
             daemon._current_rtt_source = current
             daemon._last_measurement_source = current
             daemon._last_measurement_rtt_ms = 24.5
@@ -1401,6 +1402,7 @@ class TestWanAwarenessHealth:
             daemon._profiler = OperationProfiler(max_samples=1200)
             daemon._overrun_count = 0
             daemon._cycle_interval_ms = 50.0
+            daemon._zone_listener = None
             daemon._current_rtt_source = "wanctl_backend"
             daemon._last_measurement_source = "wanctl_backend"
             daemon._last_measurement_rtt_ms = 24.5
@@ -1437,6 +1439,7 @@ class TestWanAwarenessHealth:
         daemon._profiler = OperationProfiler(max_samples=1200)
         daemon._overrun_count = 0
         daemon._cycle_interval_ms = 50.0
+        daemon._zone_listener = None
         daemon._current_rtt_source = "steering_backend"
         daemon._last_measurement_source = "steering_backend"
         daemon._last_measurement_rtt_ms = 24.5
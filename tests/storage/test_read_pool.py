@@ -0,0 +1,146 @@
+"""Tests for the pooled read-only connections in storage/read_pool.py."""
+
+import os
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from wanctl.storage.read_pool import ReadConnectionPool
+
+
+def _make_db(db_path: Path, value: float) -> None:
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE IF NOT EXISTS t (v REAL)")
+    conn.execute("DELETE FROM t")
+    conn.execute("INSERT INTO t VALUES (?)", (value,))
+    conn.commit()
+    conn.close()
+
+
+@pytest.fixture
+def pool():
+    pool = ReadConnectionPool(max_idle_per_path=2, max_idle_total=3)
+    yield pool
+    pool.close_all()
+
+
+class TestReadConnectionPool:
+    def test_released_connection_is_reused(self, pool, tmp_path):
+        db_path = tmp_path / "a.db"
+        _make_db(db_path, 1.0)
+
+        first = pool.acquire(db_path)
+        pool.release(first)
+        second = pool.acquire(db_path)
+
+        assert second is first
+        pool.release(second)
+
+    def test_concurrent_checkouts_get_distinct_connections(self, pool, tmp_path):
+        db_path = tmp_path / "a.db"
+        _make_db(db_path, 1.0)
+
+        first = pool.acquire(db_path)
+        second = pool.acquire(db_path)
+
+        assert first is not second
+        pool.release(first)
+        pool.release(second)
+
+    def test_read_tuning_and_functions_applied(self, pool, tmp_path):
+        db_path = tmp_path / "a.db"
+        _make_db(db_path, 1.0)
+
+        conn = pool.acquire(db_path)
+        try:
+            assert conn.execute("PRAGMA query_only").fetchone() == (1,)
+            assert conn.execute("PRAGMA cache_size").fetchone() == (-8192,)
+            assert conn.execute("SELECT canonical_series_labels('m', NULL)").fetchone() == (None,)
+            with pytest.raises(sqlite3.OperationalError):
+                conn.execute("INSERT INTO t VALUES (2.0)")
+        finally:
+            pool.release(conn)
+
+    def test_release_resets_row_factory(self, pool, tmp_path):
+        db_path = tmp_path / "a.db"
+        _make_db(db_path, 1.0)
+
+        conn = pool.acquire(db_path)
+        conn.row_factory = sqlite3.Row
+        pool.release(conn)
+
+        assert pool.acquire(db_path).row_factory is None
+
+    def test_replaced_file_gets_fresh_connection(self, pool, tmp_path):
+        db_path = tmp_path / "a.db"
+        _make_db(db_path, 1.0)
+        conn = pool.acquire(db_path)
+        assert conn.execute("SELECT v FROM t").fetchone() == (1.0,)
+        pool.release(conn)
+
+        os.unlink(db_path)
+        _make_db(db_path, 2.0)
+
+        fresh = pool.acquire(db_path)
+        assert fresh is not conn
+        assert fresh.execute("SELECT v FROM t").fetchone() == (2.0,)
+        pool.release(fresh)
+
+    def test_wal_checkpoint_keeps_connection_pooled(self, pool, tmp_path):
+        db_path = tmp_path / "a.db"
+        _make_db(db_path, 1.0)
+        writer = sqlite3.connect(db_path)
+        writer.execute("PRAGMA journal_mode=WAL")
+        conn = pool.acquire(db_path)
+        pool.release(conn)
+
+        mtime_before = os.stat(db_path).st_mtime_ns
+        writer.execute("UPDATE t SET v = 3.0")
+        writer.commit()
+        os.utime(db_path, ns=(mtime_before + 10**9, mtime_before + 10**9))
+        writer.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        writer.close()
+
+        again = pool.acquire(db_path)
+        assert again is conn
+        assert again.execute("SELECT v FROM t").fetchone() == (3.0,)
+        pool.release(again)
+
+    def test_file_replaced_during_open_is_not_pooled(self, pool, tmp_path, monkeypatch):
+        from wanctl.storage import read_pool
+
+        db_path = tmp_path / "a.db"
+        _make_db(db_path, 1.0)
+        real_open = read_pool._open_read_connection
+
+        def replace_then_open(path):
+            os.unlink(path)
+            _make_db(path, 2.0)
+            return real_open(path)
+
+        monkeypatch.setattr(read_pool, "_open_read_connection", replace_then_open)
+        conn = pool.acquire(db_path)
+        assert conn.execute("SELECT v FROM t").fetchone() == (2.0,)
+        pool.release(conn)
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+    def test_missing_file_raises_operational_error(self, pool, tmp_path):
+        with pytest.raises(sqlite3.OperationalError):
+            pool.acquire(tmp_path / "missing.db")
+
+    def test_idle_connections_are_bounded(self, pool, tmp_path):
+        paths = [tmp_path / f"{name}.db" for name in "abcd"]
+        for db_path in paths:
+            _make_db(db_path, 1.0)
+
+        conns = [pool.acquire(db_path) for db_path in paths]
+        for conn in conns:
+            pool.release(conn)
+
+        # Total cap of 3: the least recently released path was evicted
+        with pytest.raises(sqlite3.ProgrammingError):
+            conns[0].execute("SELECT 1")
+        assert pool.acquire(paths[3]) is conns[3]
@@ -0,0 +1,158 @@
+"""Tests for columnar metrics archives (storage/archive.py)."""
+
+import math
+import random
+
+import pytest
+
+from wanctl.storage.archive import MetricsArchive, write_archive, write_parquet
+
+
+def _row(ts: int, value: float, metric: str = "wanctl_rtt_ms", **overrides) -> dict:
+    row = {
+        "timestamp": ts,
+        "wan_name": "spectrum",
+        "metric_name": metric,
+        "value": value,
+        "labels": None,
+        "granularity": "raw",
+    }
+    row.update(overrides)
+    return row
+
+
+class TestArchiveRoundTrip:
+    def test_irregular_timestamps_and_values_round_trip_exactly(self, tmp_path):
+        rng = random.Random(3)
+        special = [0.0, -0.0, math.inf, -math.inf, 1e-300, -1e300, 25.0, 25.0]
+        ts = 1_700_000_000
+        rows = []
+        for i in range(3000):
+            # Regular steps, repeats, small jitter and occasional large gaps
+            ts += rng.choice([1, 1, 1, 0, 2, 60, 5000]) if i % 700 else 10_000_000
+            value = rng.choice(special) if i % 5 == 0 else rng.uniform(-1e6, 1e6)
+            rows.append(_row(ts, value))
+        path = tmp_path / "metrics.wca"
+
+        assert write_archive(rows, path, block_samples=256) == 3000
+
+        with MetricsArchive(path) as archive:
+            (series,) = archive.series
+            assert series.count == 3000
+            assert len(series.blocks) == 12
+            timestamps, values = archive.read(series)
+        assert list(timestamps) == [row["timestamp"] for row in rows]
+        for decoded, row in zip(values, rows, strict=True):
+            assert decoded == row["value"]
+            assert math.copysign(1.0, decoded) == math.copysign(1.0, row["value"])
+
+    def test_nan_round_trips(self, tmp_path):
+        path = tmp_path / "metrics.wca"
+        write_archive([_row(1, 1.0), _row(2, math.nan), _row(3, 2.0)], path)
+
+        with MetricsArchive(path) as archive:
+            _, values = archive.read(archive.series[0])
+
+        assert values[0] == 1.0
+        assert math.isnan(values[1])
+        assert values[2] == 2.0
+
+    def test_regular_series_is_compact(self, tmp_path):
+        rows = [_row(1_700_000_000 + i, 25.0 + (i % 10) * 0.5) for i in range(20_000)]
+        path = tmp_path / "metrics.wca"
+
+        write_archive(rows, path)
+
+        # A raw (int64, float64) pair is 16 bytes per sample
+        assert path.stat().st_size < 20_000 * 2
+
+    def test_series_are_split_by_wan_metric_labels_and_granularity(self, tmp_path):
+        rows = [
+            _row(100, 1.0),
+            _row(100, 2.0, wan_name="att"),
+            _row(100, 3.0, metric="wanctl_state"),
+            _row(100, 4.0, labels='{"tin":"Voice"}'),
+            _row(60, 5.0, granularity="1m"),
+            _row(160, 6.0),
+        ]
+        path = tmp_path / "metrics.wca"
+
+        write_archive(rows, path)
+
+        with MetricsArchive(path) as archive:
+            assert len(archive.series) == 5
+            assert len(archive.select(wan_name="spectrum", metric_name="wanctl_rtt_ms")) == 3
+            assert archive.select(granularity="1m")[0].count == 1
+            assert archive.select(wan_name="spectrum", granularity="raw", metric_name="x") == []
+            by_labels = {s.labels: s for s in archive.select(metric_name="wanctl_rtt_ms")}
+            assert list(archive.read(by_labels[None])[1]) == [1.0, 6.0]
+            assert list(archive.read(by_labels['{"tin":"Voice"}'])[1]) == [4.0]
+
+
+class TestArchiveRead:
+    def test_range_read_decodes_only_overlapping_blocks(self, tmp_path):
+        rows = [_row(i, float(i)) for i in range(1000)]
+        path = tmp_path / "metrics.wca"
+        write_archive(rows, path, block_samples=100)
+
+        with MetricsArchive(path) as archive:
+            series = archive.series[0]
+            timestamps, values = archive.read(series, start_ts=250, end_ts=449)
+            edge_ts, _ = archive.read(series, start_ts=999)
+
+        assert list(timestamps) == list(range(250, 450))
+        assert list(values) == [float(i) for i in range(250, 450)]
+        assert list(edge_ts) == [999]
+
+    def test_empty_archive_has_no_series(self, tmp_path):
+        path = tmp_path / "metrics.wca"
+
+        assert write_archive([], path) == 0
+        with MetricsArchive(path) as archive:
+            assert archive.series == []
+
+    @pytest.mark.parametrize("content", [b"", b"not an archive", b"WCTLARC1" + b"\0" * 4])
+    def test_invalid_file_is_rejected(self, tmp_path, content):
+        path = tmp_path / "metrics.wca"
+        path.write_bytes(content)
+
+        with pytest.raises(ValueError, match="Not a wanctl metrics archive"):
+            MetricsArchive(path)
+
+    def test_failed_write_leaves_unreadable_file(self, tmp_path):
+        path = tmp_path / "metrics.wca"
+
+        def _rows():
+            yield _row(1, 1.0)
+            raise RuntimeError("source failed")
+
+        with pytest.raises(RuntimeError):
+            write_archive(_rows(), path)
+        with pytest.raises(ValueError):
+            MetricsArchive(path)
+
+
+class TestParquetExport:
+    def test_parquet_round_trip(self, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        rows = [_row(i, float(i), labels='{"tin":"Bulk"}' if i % 2 else None) for i in range(5)]
+        path = tmp_path / "metrics.parquet"
+
+        assert write_parquet(rows, path, batch_rows=2) == 5
+
+        assert pq.read_table(path).to_pylist() == rows
+
+    def test_missing_pyarrow_raises_import_error(self, tmp_path, monkeypatch):
+        import builtins
+
+        real_import = builtins.__import__
+
+        def _no_pyarrow(name, *args, **kwargs):
+            if name.startswith("pyarrow"):
+                raise ImportError(name)
+            return real_import(name, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "__import__", _no_pyarrow)
+
+        with pytest.raises(ImportError, match="requires pyarrow"):
+            write_parquet([_row(1, 1.0)], tmp_path / "metrics.parquet")
@@ -0,0 +1,314 @@
+"""Tests for the compressed 5m/1h cold tier (storage/cold_tier.py)."""
+
+import math
+import random
+import sqlite3
+import time
+from collections import Counter
+from unittest.mock import patch
+
+import pytest
+
+from wanctl.storage.cold_tier import (
+    COLD_DAY_SECONDS,
+    decode_cold_day,
+    encode_cold_day,
+    expire_cold_days,
+    freeze_cold_days,
+)
+from wanctl.storage.downsampler import downsample_metrics, downsample_to_granularity
+from wanctl.storage.reader import count_metrics, iter_metrics, query_metrics
+
+DAY = COLD_DAY_SECONDS
+
+
+def _insert(conn: sqlite3.Connection, rows: list[tuple]) -> None:
+    conn.execute("BEGIN")
+    conn.executemany(
+        """
+        INSERT INTO metrics (timestamp, wan_name, metric_name, value, labels, granularity)
+        VALUES (?, ?, ?, ?, ?, ?)
+        """,
+        rows,
+    )
+    conn.execute("COMMIT")
+
+
+def _as_counter(rows: list[dict]) -> Counter:
+    return Counter(tuple(sorted(row.items())) for row in rows)
+
+
+def _day_start(days_ago: int) -> int:
+    return (int(time.time()) // DAY - days_ago) * DAY
+
+
+def _hot_count(conn: sqlite3.Connection, granularity: str) -> int:
+    row = conn.execute("SELECT COUNT(*) FROM metrics WHERE granularity = ?", (granularity,))
+    return row.fetchone()[0]
+
+
+class TestColdDayCodec:
+    @pytest.mark.parametrize("codec", ["zlib", "lzma"])
+    def test_round_trip_is_exact(self, codec):
+        day = 1_700_006_400
+        values = [25.5, -0.0, math.inf, -math.inf, 1e-300, 3.0, 3.0]
+        samples = [(day + i * 300, value) for i, value in enumerate(values)]
+        samples.append((day + DAY - 1, 7.25))
+
+        decoded = decode_cold_day(codec, day, encode_cold_day(day, samples, codec))
+
+        assert decoded == samples
+        assert math.copysign(1.0, decoded[1][1]) == -1.0
+
+    def test_empty_day_round_trips(self):
+        assert decode_cold_day("zlib", 0, encode_cold_day(0, [])) == []
+
+    def test_unknown_codec_is_rejected(self):
+        with pytest.raises(ValueError, match="codec"):
+            decode_cold_day("brotli", 0, encode_cold_day(0, [(1, 1.0)]))
+
+
+class TestFreezeColdDays:
+    def test_only_complete_days_before_cutoff_are_frozen(self, test_db):
+        old_day, current_day = _day_start(3), _day_start(0)
+        _insert(
+            test_db,
+            [(old_day + i * 300, "spectrum", "wanctl_rtt_ms", 20.0, None, "5m") for i in range(288)]
+            + [(current_day, "spectrum", "wanctl_rtt_ms", 21.0, None, "5m")],
+        )
+
+        frozen = freeze_cold_days(test_db, "5m", int(time.time()))
+
+        assert frozen == 288
+        assert _hot_count(test_db, "5m") == 1
+        blob = test_db.execute(
+            "SELECT day_start, labels, first_ts, last_ts, count FROM metrics_cold"
+        ).fetchone()
+        assert blob == (old_day, "", old_day, old_day + 287 * 300, 288)
+
+    def test_series_are_split_by_labels(self, test_db):
+        day = _day_start(3)
+        _insert(
+            test_db,
+            [
+                (day, "spectrum", "wanctl_cake_tin_delay_us", 5.0, '{"tin":"Bulk"}', "5m"),
+                (day, "spectrum", "wanctl_cake_tin_delay_us", 6.0, '{"tin":"Voice"}', "5m"),
+                (day, "att", "wanctl_cake_tin_delay_us", 7.0, '{"tin":"Voice"}', "5m"),
+            ],
+        )
+
+        freeze_cold_days(test_db, "5m", int(time.time()))
+
+        assert test_db.execute("SELECT COUNT(*) FROM metrics_cold").fetchone() == (3,)
+
+    def test_late_rows_merge_into_existing_blob(self, test_db):
+        day = _day_start(3)
+        _insert(test_db, [(day + 600, "spectrum", "wanctl_rtt_ms", 2.0, None, "5m")])
+        freeze_cold_days(test_db, "5m", int(time.time()))
+        _insert(test_db, [(day + 300, "spectrum", "wanctl_rtt_ms", 1.0, None, "5m")])
+
+        freeze_cold_days(test_db, "5m", int(time.time()))
+
+        codec, payload = test_db.execute("SELECT codec, payload FROM metrics_cold").fetchone()
+        assert decode_cold_day(codec, day, payload) == [(day + 300, 1.0), (day + 600, 2.0)]
+        assert _hot_count(test_db, "5m") == 0
+
+    def test_other_tiers_are_never_frozen(self, test_db):
+        _insert(test_db, [(_day_start(3), "spectrum", "wanctl_rtt_ms", 1.0, None, "1m")])
+
+        assert freeze_cold_days(test_db, "1m", int(time.time())) == 0
+        assert _hot_count(test_db, "1m") == 1
+
+    def test_storage_shrinks_by_an_order_of_magnitude(self, tmp_path, test_db):
+        db_path = tmp_path / "test_metrics.db"
+        test_db.execute("VACUUM")
+        empty_size = db_path.stat().st_size
+        rng = random.Random(7)
+        generators = {
+            "wanctl_rtt_ms": lambda i: 25.0 + rng.gauss(0, 2),
+            "wanctl_rate_download_mbps": lambda i: 900.0 - 50 * (i // 40),
+            "wanctl_state": lambda i: float(rng.random() < 0.1),
+        }
+        rows = [
+            (_day_start(day_index) + i * 300, wan, metric, generate(i), None, "5m")
+            for day_index in range(1, 8)
+            for metric, generate in generators.items()
+            for wan in ("spectrum", "att")
+            for i in range(288)
+        ]
+        _insert(test_db, rows)
+        test_db.execute("VACUUM")
+        hot_size = db_path.stat().st_size - empty_size
+
+        freeze_cold_days(test_db, "5m", int(time.time()))
+        test_db.execute("VACUUM")
+        cold_size = db_path.stat().st_size - empty_size
+
+        assert cold_size * 10 < hot_size
+
+
+class TestColdTierReads:
+    @pytest.fixture
+    def mixed_db(self, tmp_path, test_db):
+        old_day = _day_start(10)
+        recent_day = _day_start(3)
+        rows = [
+            (old_day + i * 3600, "spectrum", "wanctl_rtt_ms", 30.0 + i, None, "1h")
+            for i in range(24)
+        ]
+        rows += [
+            (recent_day + i * 300, "spectrum", "wanctl_rtt_ms", 20.0 + i / 8, None, "5m")
+            for i in range(288)
+        ]
+        rows += [
+            (
+                recent_day + i * 300,
+                "att",
+                "wanctl_cake_tin_delay_us",
+                float(i),
+                '{"tin":"Bulk"}',
+                "5m",
+            )
+            for i in range(0, 288, 12)
+        ]
+        # 1m rows hide the overlapping tail of the 5m day in observed-tier queries
+        rows += [
+            (recent_day + DAY - 600 + i * 60, "spectrum", "wanctl_rtt_ms", 99.0, None, "1m")
+            for i in range(10)
+        ]
+        _insert(test_db, rows)
+        return tmp_path / "test_metrics.db", test_db, recent_day
+
+    def _freeze(self, conn):
+        now = int(time.time())
+        freeze_cold_days(conn, "5m", now)
+        freeze_cold_days(conn, "1h", now)
+        assert _hot_count(conn, "5m") == _hot_count(conn, "1h") == 0
+
+    def test_query_metrics_is_unchanged_by_freezing(self, mixed_db):
+        db_path, conn, recent_day = mixed_db
+        queries = [
+            {"use_observed_tiers": True},
+            {"use_observed_tiers": True, "wan": "spectrum", "start_ts": recent_day + 3600},
+            {"granularity": "5m", "metrics": ["wanctl_cake_tin_delay_us"]},
+            {"wan": "spectrum", "end_ts": recent_day + 1200, "limit": 7, "offset": 3},
+        ]
+        before = [query_metrics(db_path, **query) for query in queries]
+
+        self._freeze(conn)
+
+        after = [query_metrics(db_path, **query) for query in queries]
+        # Rows of different series sharing a timestamp have no defined order
+        assert [_as_counter(rows) for rows in after] == [_as_counter(rows) for rows in before]
+        for rows_after, rows_before in zip(after, before, strict=True):
+            assert [row["timestamp"] for row in rows_after] == [
+                row["timestamp"] for row in rows_before
+            ]
+        assert after[3] == before[3]
+        assert count_metrics(db_path, use_observed_tiers=True) == len(before[0])
+
+    @pytest.mark.parametrize("newest_first", [False, True])
+    def test_iter_metrics_is_unchanged_by_freezing(self, mixed_db, newest_first):
+        db_path, conn, recent_day = mixed_db
+        filters = {"start_ts": recent_day - 5 * DAY, "newest_first": newest_first}
+        before = list(iter_metrics(db_path, use_observed_tiers=True, batch_size=50, **filters))
+
+        self._freeze(conn)
+
+        after = list(iter_metrics(db_path, use_observed_tiers=True, batch_size=50, **filters))
+        assert _as_counter(after) == _as_counter(before)
+        timestamps = [row["timestamp"] for row in after]
+        assert timestamps == sorted(timestamps, reverse=newest_first)
+        assert 99.0 in [row["value"] for row in after]
+
+    def test_reads_decode_only_the_blobs_they_need(self, mixed_db):
+        db_path, conn, recent_day = mixed_db
+        expected_count = count_metrics(db_path)
+        self._freeze(conn)
+
+        with patch("wanctl.storage.reader.decode_cold_day", wraps=decode_cold_day) as decode:
+            assert count_metrics(db_path) == expected_count
+            assert decode.call_count == 0
+
+            # Blobs straddling a bound are decoded; the rest use their count
+            assert count_metrics(db_path, start_ts=recent_day + 3600) == 288 - 12 + 24 - 1 + 10
+            assert decode.call_count == 2
+
+            decode.reset_mock()
+            newest = query_metrics(db_path, limit=5)
+            # Only the newest frozen day is expanded, never the 10-day-old 1h blob
+            assert {call.args[1] for call in decode.call_args_list} == {recent_day}
+        assert [row["timestamp"] for row in newest][0] == recent_day + DAY - 600 + 9 * 60
+
+    def test_raw_queries_skip_the_cold_tier(self, mixed_db):
+        db_path, conn, _ = mixed_db
+        self._freeze(conn)
+
+        assert query_metrics(db_path, granularity="raw") == []
+        assert count_metrics(db_path, granularity="1m") == 10
+
+
+class TestColdTierMaintenance:
+    def test_frozen_5m_days_roll_up_into_1h(self, test_db):
+        day = _day_start(9)
+        _insert(
+            test_db,
+            [
+                (day + i * 300, "spectrum", "wanctl_rtt_ms", float(i // 12), None, "5m")
+                for i in range(288)
+            ],
+        )
+        freeze_cold_days(test_db, "5m", int(time.time()))
+        cutoff = day + 6 * 3600 + 100
+
+        rows = downsample_to_granularity(test_db, "5m", "1h", 3600, cutoff)
+
+        assert rows == 6
+        hourly = test_db.execute(
+            "SELECT timestamp, value FROM metrics WHERE granularity = '1h' ORDER BY timestamp"
+        ).fetchall()
+        assert hourly == [(day + h * 3600, float(h)) for h in range(6)]
+        # The rest of the day stays frozen
+        assert _hot_count(test_db, "5m") == 0
+        first_ts, count = test_db.execute("SELECT first_ts, count FROM metrics_cold").fetchone()
+        assert (first_ts, count) == (day + 6 * 3600, 288 - 72)
+
+    def test_downsample_metrics_freezes_days_past_their_last_rollup(self, test_db):
+        recent_day, old_day = _day_start(3), _day_start(9)
+        _insert(
+            test_db,
+            [
+                (recent_day + i * 60, "spectrum", "wanctl_rtt_ms", 15.0, None, "1m")
+                for i in range(60)
+            ]
+            + [
+                (old_day + i * 300, "spectrum", "wanctl_rtt_ms", 5.0, None, "5m") for i in range(24)
+            ],
+        )
+
+        results = downsample_metrics(test_db)
+
+        assert (results["1m->5m"], results["5m->1h"]) == (12, 2)
+        # 5m days stay hot until the 5m->1h rollup consumes them
+        assert _hot_count(test_db, "5m") == 12
+        assert _hot_count(test_db, "1h") == 0
+        blobs = test_db.execute("SELECT granularity, count FROM metrics_cold").fetchall()
+        assert blobs == [("1h", 2)]
+
+    def test_expiry_trims_straddling_blobs(self, test_db):
+        old_day, newer_day = _day_start(20), _day_start(12)
+        _insert(
+            test_db,
+            [(old_day + h * 3600, "spectrum", "wanctl_rtt_ms", 1.0, None, "1h") for h in range(24)]
+            + [
+                (newer_day + h * 3600, "spectrum", "wanctl_rtt_ms", 2.0, None, "1h")
+                for h in range(24)
+            ],
+        )
+        freeze_cold_days(test_db, "1h", int(time.time()))
+
+        deleted = expire_cold_days(test_db, {"1h": newer_day + 10 * 3600})
+
+        assert deleted == 24 + 10
+        blobs = test_db.execute("SELECT day_start, first_ts, count FROM metrics_cold").fetchall()
+        assert blobs == [(newer_day, newer_day + 10 * 3600, 14)]
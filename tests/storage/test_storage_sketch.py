@@ -0,0 +1,309 @@
+"""Tests for summary sketches: the sketch itself, downsampler roll-up, reader and retention."""
+
+import random
+import sqlite3
+import time
+
+import pytest
+
+from wanctl.quantile_sketch import QuantileSketch
+from wanctl.storage.downsampler import downsample_to_granularity
+from wanctl.storage.reader import compute_summary, query_metric_sketches
+from wanctl.storage.retention import cleanup_old_metrics
+
+
+def _sketch(values: list[float]) -> QuantileSketch:
+    sketch = QuantileSketch()
+    for value in values:
+        sketch.add(value)
+    return sketch
+
+
+def _insert(conn: sqlite3.Connection, rows: list[tuple]) -> None:
+    conn.executemany(
+        """
+        INSERT INTO metrics (timestamp, wan_name, metric_name, value, labels, granularity)
+        VALUES (?, ?, ?, ?, ?, ?)
+        """,
+        rows,
+    )
+    conn.commit()
+
+
+def _sketch_rows(conn: sqlite3.Connection, granularity: str) -> list[tuple]:
+    return conn.execute(
+        """
+        SELECT bucket_start, wan_name, metric_name, count, sum, min, max
+        FROM metric_sketches
+        WHERE granularity = ?
+        ORDER BY bucket_start
+        """,
+        (granularity,),
+    ).fetchall()
+
+
+class TestQuantileSketch:
+    def test_summary_tracks_exact_summary(self):
+        rng = random.Random(7)
+        values = [rng.lognormvariate(3.0, 0.6) for _ in range(5000)]
+
+        approx = _sketch(values).summary()
+        exact = compute_summary(values)
+
+        assert approx["count"] == 5000
+        assert approx["min"] == exact["min"]
+        assert approx["max"] == exact["max"]
+        assert approx["avg"] == pytest.approx(exact["avg"])
+        for key in ("p50", "p95", "p99"):
+            assert approx[key] == pytest.approx(exact[key], rel=0.02)
+
+    def test_zero_and_negative_values_are_ordered(self):
+        sketch = _sketch([-8.0, -2.0, 0.0, 0.0, 4.0])
+
+        assert sketch.quantiles((0.0, 0.25, 0.5, 1.0)) == [
+            -8.0,
+            pytest.approx(-2.0, rel=0.02),
+            0.0,
+            4.0,
+        ]
+
+    def test_single_value_is_exact(self):
+        assert _sketch([42.5]).summary() == {
+            "min": 42.5,
+            "max": 42.5,
+            "avg": 42.5,
+            "p50": 42.5,
+            "p95": 42.5,
+            "p99": 42.5,
+            "count": 1,
+        }
+
+    def test_merge_equals_sketch_of_union(self):
+        left, right = [1.0, 5.0, 9.0, -3.0], [0.0, 2.5, 100.0]
+
+        merged = _sketch(left)
+        merged.merge(_sketch(right))
+        union = _sketch(left + right)
+
+        assert merged.summary() == union.summary()
+        assert merged.distribution() == union.distribution()
+
+    def test_bulk_update_matches_per_sample_add(self):
+        rng = random.Random(3)
+        values = [rng.lognormvariate(1.0, 2.0) for _ in range(500)]
+        values += [-3.5, 0.0, 1e-12, -1e-12, float("nan"), float("inf"), 1e300]
+        bulk = QuantileSketch()
+        bulk.update(values)
+        single = _sketch(values)
+
+        assert (bulk.count, bulk.min, bulk.max, bulk.zeros) == (
+            single.count,
+            single.min,
+            single.max,
+            single.zeros,
+        )
+        assert bulk.total == pytest.approx(single.total)
+        assert (bulk.positive, bulk.negative) == (single.positive, single.negative)
+
+    def test_row_round_trip(self):
+        original = _sketch([-1.5, 0.0, 3.0, 3.1, 1e9])
+
+        restored = QuantileSketch.from_row(
+            original.count, original.total, original.min, original.max, original.buckets_blob()
+        )
+
+        assert restored.summary() == original.summary()
+        assert restored.distribution() == original.distribution()
+
+    def test_empty_sketch_has_empty_summary(self):
+        sketch = _sketch([float("nan")])
+
+        assert sketch.count == 0
+        assert sketch.summary() == {}
+
+
+class TestDownsamplerSketches:
+    def test_raw_to_1m_sketches_every_retired_sample(self, test_db):
+        base = (int(time.time()) - 3600) // 60 * 60
+        _insert(
+            test_db,
+            [(base + i, "spectrum", "wanctl_rtt_ms", float(i), None, "raw") for i in range(120)],
+        )
+
+        downsample_to_granularity(test_db, "raw", "1m", 60, base + 120)
+
+        assert _sketch_rows(test_db, "1m") == [
+            (base, "spectrum", "wanctl_rtt_ms", 60, float(sum(range(60))), 0.0, 59.0),
+            (base + 60, "spectrum", "wanctl_rtt_ms", 60, float(sum(range(60, 120))), 60.0, 119.0),
+        ]
+
+    def test_incomplete_bucket_is_sketched_on_a_later_pass(self, test_db):
+        base = (int(time.time()) - 3600) // 60 * 60
+        _insert(
+            test_db,
+            [(base + i, "spectrum", "wanctl_rtt_ms", 1.0, None, "raw") for i in range(90)],
+        )
+
+        downsample_to_granularity(test_db, "raw", "1m", 60, base + 90)
+        assert [row[3] for row in _sketch_rows(test_db, "1m")] == [60]
+
+        downsample_to_granularity(test_db, "raw", "1m", 60, base + 120)
+        assert [row[3] for row in _sketch_rows(test_db, "1m")] == [60, 30]
+
+    def test_late_samples_merge_into_existing_sketch(self, test_db):
+        base = (int(time.time()) - 3600) // 60 * 60
+        _insert(test_db, [(base, "spectrum", "wanctl_rtt_ms", 1.0, None, "raw")])
+        downsample_to_granularity(test_db, "raw", "1m", 60, base + 60)
+
+        _insert(test_db, [(base + 30, "spectrum", "wanctl_rtt_ms", 3.0, None, "raw")])
+        downsample_to_granularity(test_db, "raw", "1m", 60, base + 60)
+
+        assert _sketch_rows(test_db, "1m") == [
+            (base, "spectrum", "wanctl_rtt_ms", 2, 4.0, 1.0, 3.0)
+        ]
+
+    def test_1m_to_5m_rolls_up_and_retires_source_sketches(self, test_db):
+        base = (int(time.time()) - 86400) // 300 * 300
+        _insert(
+            test_db,
+            [
+                (base + i, "spectrum", "wanctl_rtt_ms", float(i % 7), None, "raw")
+                for i in range(600)
+            ],
+        )
+        downsample_to_granularity(test_db, "raw", "1m", 60, base + 600)
+
+        downsample_to_granularity(test_db, "1m", "5m", 300, base + 600)
+
+        assert _sketch_rows(test_db, "1m") == []
+        rows = _sketch_rows(test_db, "5m")
+        assert [(row[0], row[3]) for row in rows] == [(base, 300), (base + 300, 300)]
+
+    def test_labelled_series_are_pooled_per_metric(self, test_db):
+        base = (int(time.time()) - 3600) // 60 * 60
+        _insert(
+            test_db,
+            [
+                (base, "spectrum", "wanctl_cake_tin_delay_us", 100.0, '{"tin":"Bulk"}', "raw"),
+                (base, "spectrum", "wanctl_cake_tin_delay_us", 300.0, '{"tin":"Voice"}', "raw"),
+            ],
+        )
+
+        downsample_to_granularity(test_db, "raw", "1m", 60, base + 60)
+
+        assert _sketch_rows(test_db, "1m") == [
+            (base, "spectrum", "wanctl_cake_tin_delay_us", 2, 400.0, 100.0, 300.0)
+        ]
+
+
+class TestQueryMetricSketches:
+    def test_merges_sketches_with_raw_tail(self, tmp_path, test_db):
+        db_path = tmp_path / "test_metrics.db"
+        base = (int(time.time()) - 3600) // 60 * 60
+        _insert(
+            test_db,
+            [(base + i, "spectrum", "wanctl_rtt_ms", float(i), None, "raw") for i in range(180)],
+        )
+        downsample_to_granularity(test_db, "raw", "1m", 60, base + 120)
+
+        results = query_metric_sketches(db_path, start_ts=base, end_ts=base + 600)
+
+        assert len(results) == 1
+        summary = results[0]["sketch"].summary()
+        assert summary["count"] == 180
+        assert summary["min"] == 0.0
+        assert summary["max"] == 179.0
+        assert summary["p50"] == pytest.approx(89.0, rel=0.02)
+
+    def test_range_selects_buckets_by_start(self, tmp_path, test_db):
+        db_path = tmp_path / "test_metrics.db"
+        base = (int(time.time()) - 3600) // 60 * 60
+        _insert(
+            test_db,
+            [(base + i, "spectrum", "wanctl_rtt_ms", 1.0, None, "raw") for i in range(180)],
+        )
+        downsample_to_granularity(test_db, "raw", "1m", 60, base + 180)
+
+        results = query_metric_sketches(db_path, start_ts=base + 60, end_ts=base + 119)
+
+        assert results[0]["sketch"].count == 60
+
+    def test_aggregates_older_than_first_sketch_count_as_samples(self, tmp_path, test_db):
+        db_path = tmp_path / "test_metrics.db"
+        base = (int(time.time()) - 7200) // 300 * 300
+        _insert(
+            test_db,
+            [
+                (base, "spectrum", "wanctl_rtt_ms", 50.0, None, "5m"),
+                (base + 3600, "spectrum", "wanctl_rtt_ms", 10.0, None, "raw"),
+            ],
+        )
+        downsample_to_granularity(test_db, "raw", "1m", 60, base + 3660)
+
+        results = query_metric_sketches(db_path, start_ts=base, end_ts=base + 7200)
+
+        sketch = results[0]["sketch"]
+        # The legacy 5m row plus the sketched raw sample; the 1m aggregate
+        # written for that sample is covered by its sketch
+        assert (sketch.count, sketch.min, sketch.max) == (2, 10.0, 50.0)
+
+    def test_unsketched_series_in_a_sketched_tier_counts_as_samples(self, tmp_path, test_db):
+        db_path = tmp_path / "test_metrics.db"
+        base = (int(time.time()) - 7200) // 60 * 60
+        _insert(
+            test_db,
+            [
+                (base, "att", "wanctl_rtt_ms", 40.0, None, "1m"),
+                (base + 3600, "spectrum", "wanctl_rtt_ms", 10.0, None, "raw"),
+            ],
+        )
+        downsample_to_granularity(test_db, "raw", "1m", 60, base + 3660)
+
+        results = query_metric_sketches(db_path, start_ts=base, end_ts=base + 7200)
+
+        counts = {row["wan_name"]: row["sketch"].count for row in results}
+        assert counts == {"att": 1, "spectrum": 1}
+
+    def test_database_without_sketch_table_uses_rows(self, tmp_path):
+        db_path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "CREATE TABLE metrics (id INTEGER PRIMARY KEY, timestamp INTEGER, wan_name TEXT,"
+            " metric_name TEXT, value REAL, labels TEXT, granularity TEXT)"
+        )
+        _insert(conn, [(100, "att", "wanctl_rtt_ms", 5.0, None, "1m")])
+        conn.close()
+
+        results = query_metric_sketches(db_path, start_ts=0, end_ts=200)
+
+        assert results[0]["wan_name"] == "att"
+        assert results[0]["sketch"].count == 1
+
+    def test_missing_database_returns_empty(self, tmp_path):
+        assert query_metric_sketches(tmp_path / "missing.db") == []
+
+
+class TestSketchRetention:
+    def test_sketches_expire_with_their_tier(self, test_db):
+        now = int(time.time())
+        old = (now - 3 * 86400) // 60 * 60
+        recent = (now - 3600) // 60 * 60
+        _insert(
+            test_db,
+            [
+                (old, "spectrum", "wanctl_rtt_ms", 1.0, None, "raw"),
+                (recent, "spectrum", "wanctl_rtt_ms", 1.0, None, "raw"),
+            ],
+        )
+        downsample_to_granularity(test_db, "raw", "1m", 60, now)
+
+        cleanup_old_metrics(
+            test_db,
+            retention_config={
+                "raw_age_seconds": 3600,
+                "aggregate_1m_age_seconds": 86400,
+                "aggregate_5m_age_seconds": 604800,
+            },
+        )
+
+        assert [row[0] for row in _sketch_rows(test_db, "1m")] == [recent]
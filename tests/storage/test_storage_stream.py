@@ -0,0 +1,135 @@
+"""Tests for the streaming, keyset-paginated metrics reader (iter_metrics)."""
+
+import sqlite3
+import time
+import tracemalloc
+from collections import Counter
+
+import pytest
+
+from wanctl.storage.reader import iter_metrics, query_metrics
+
+
+def _insert(conn: sqlite3.Connection, rows: list[tuple]) -> None:
+    # The fixture connection autocommits; one transaction keeps bulk inserts fast
+    conn.execute("BEGIN")
+    conn.executemany(
+        """
+        INSERT INTO metrics (timestamp, wan_name, metric_name, value, labels, granularity)
+        VALUES (?, ?, ?, ?, ?, ?)
+        """,
+        rows,
+    )
+    conn.execute("COMMIT")
+
+
+def _as_counter(rows: list[dict]) -> Counter:
+    return Counter(tuple(sorted(row.items())) for row in rows)
+
+
+class TestIterMetrics:
+    def test_pages_across_equal_timestamps(self, tmp_path, test_db):
+        # 5 rows per timestamp with 3-row pages: every page boundary splits a timestamp
+        _insert(
+            test_db,
+            [(100 + i // 5, "spectrum", "wanctl_rtt_ms", float(i), None, "raw") for i in range(20)],
+        )
+
+        rows = list(iter_metrics(tmp_path / "test_metrics.db", batch_size=3))
+
+        assert [row["value"] for row in rows] == [float(i) for i in range(20)]
+        assert set(rows[0]) == {
+            "timestamp",
+            "wan_name",
+            "metric_name",
+            "value",
+            "labels",
+            "granularity",
+        }
+
+    def test_newest_first_reverses_order(self, tmp_path, test_db):
+        _insert(
+            test_db,
+            [(100 + i // 4, "spectrum", "wanctl_rtt_ms", float(i), None, "raw") for i in range(10)],
+        )
+
+        rows = list(iter_metrics(tmp_path / "test_metrics.db", newest_first=True, batch_size=3))
+
+        assert [row["value"] for row in rows] == [float(i) for i in reversed(range(10))]
+
+    def test_filters_match_query_metrics(self, tmp_path, test_db):
+        _insert(
+            test_db,
+            [
+                (100, "spectrum", "wanctl_rtt_ms", 1.0, None, "raw"),
+                (150, "att", "wanctl_rtt_ms", 2.0, None, "raw"),
+                (200, "spectrum", "wanctl_state", 0.0, None, "raw"),
+                (300, "spectrum", "wanctl_rtt_ms", 3.0, None, "raw"),
+            ],
+        )
+        db_path = tmp_path / "test_metrics.db"
+        filters = {"start_ts": 120, "end_ts": 300, "metrics": ["wanctl_rtt_ms"], "wan": "spectrum"}
+
+        streamed = list(iter_metrics(db_path, batch_size=1, **filters))
+
+        assert streamed == list(reversed(query_metrics(db_path, **filters)))
+        assert [row["value"] for row in streamed] == [3.0]
+
+    def test_observed_tiers_match_query_metrics(self, tmp_path, test_db):
+        base = (int(time.time()) - 86400) // 3600 * 3600
+        _insert(
+            test_db,
+            [
+                (base, "spectrum", "wanctl_rtt_ms", 10.0, None, "1h"),
+                (base + 3600, "spectrum", "wanctl_rtt_ms", 11.0, None, "5m"),
+                (base + 3900, "spectrum", "wanctl_rtt_ms", 12.0, None, "1m"),
+                # Overlapping coarser rows hidden by the finer tiers
+                (base + 3900, "spectrum", "wanctl_rtt_ms", 99.0, None, "5m"),
+                (base + 7200, "spectrum", "wanctl_rtt_ms", 99.0, None, "1h"),
+                (base + 4000, "spectrum", "wanctl_rtt_ms", 13.0, None, "raw"),
+                (base + 4000, "spectrum", "wanctl_rtt_ms", 99.0, None, "1m"),
+                (base + 4000, "spectrum", "wanctl_cake_tin_delay_us", 5.0, '{"tin":"Bulk"}', "1m"),
+                (
+                    base + 4001,
+                    "spectrum",
+                    "wanctl_cake_tin_delay_us",
+                    6.0,
+                    '{"tin":"Voice"}',
+                    "raw",
+                ),
+            ],
+        )
+        db_path = tmp_path / "test_metrics.db"
+
+        streamed = list(iter_metrics(db_path, use_observed_tiers=True, batch_size=2))
+        expected = query_metrics(db_path, use_observed_tiers=True)
+
+        assert _as_counter(streamed) == _as_counter(expected)
+        assert 99.0 not in [row["value"] for row in streamed]
+
+    def test_granularity_with_observed_tiers_is_rejected(self, tmp_path):
+        with pytest.raises(ValueError, match="mutually exclusive"):
+            next(iter_metrics(tmp_path / "x.db", granularity="raw", use_observed_tiers=True))
+
+    def test_missing_database_yields_nothing(self, tmp_path):
+        assert list(iter_metrics(tmp_path / "missing.db")) == []
+
+    def test_memory_stays_flat_for_large_ranges(self, tmp_path, test_db):
+        _insert(
+            test_db,
+            [(i, "spectrum", "wanctl_rtt_ms", float(i), None, "raw") for i in range(20_000)],
+        )
+        db_path = tmp_path / "test_metrics.db"
+
+        tracemalloc.start()
+        try:
+            count = sum(1 for _ in iter_metrics(db_path, batch_size=500))
+            _, streamed_peak = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            materialized = query_metrics(db_path)
+            _, materialized_peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert count == len(materialized) == 20_000
+        assert streamed_peak * 10 < materialized_peak
@@ -1639,3 +1639,132 @@ lock_timeout: 300
 
         assert boundary_config.cake_stats_cadence_sec == pytest.approx(10.0)
         assert not any("capping at" in message for message in caplog.messages)
+
+
+class TestRouterApplyConfig:
+    """Tests for _load_router_apply_config (continuous_monitoring.router_apply_mode)."""
+
+    def _load(self, data: dict) -> Config:
+        config = object.__new__(Config)
+        config.data = data
+        config._load_router_apply_config()
+        return config
+
+    def test_sync_by_default(self):
+        assert self._load({}).router_apply_mode == "sync"
+
+    def test_async_is_accepted(self):
+        config = self._load({"continuous_monitoring": {"router_apply_mode": "async"}})
+
+        assert config.router_apply_mode == "async"
+
+    @pytest.mark.parametrize("value", ["ASYNC", "threaded", True, None])
+    def test_invalid_mode_warns_and_defaults(self, caplog, value):
+        with caplog.at_level(logging.WARNING, logger="wanctl.autorate_config"):
+            config = self._load({"continuous_monitoring": {"router_apply_mode": value}})
+
+        assert config.router_apply_mode == "sync"
+        assert any("router_apply_mode must be" in message for message in caplog.messages)
+
+
+class TestMeasurementSchedulerConfig:
+    """Tests for _load_measurement_scheduler_config (continuous_monitoring.measurement_scheduler)."""
+
+    def _load(self, section: object) -> Config:
+        config = object.__new__(Config)
+        config.data = {"continuous_monitoring": {"measurement_scheduler": section}}
+        config._load_measurement_scheduler_config()
+        return config
+
+    def test_disabled_by_default(self):
+        config = object.__new__(Config)
+        config.data = {}
+        config._load_measurement_scheduler_config()
+
+        assert config.measurement_scheduler_config == {
+            "enabled": False,
+            "idle_after_sec": 60.0,
+            "idle_cadence_factor": 2.0,
+            "busy_cadence_factor": 0.5,
+            "lead_margin_ms": 5.0,
+        }
+
+    def test_values_are_accepted(self):
+        config = self._load({"enabled": True, "idle_after_sec": 30, "busy_cadence_factor": 0.25})
+
+        assert config.measurement_scheduler_config["enabled"] is True
+        assert config.measurement_scheduler_config["idle_after_sec"] == 30.0
+        assert config.measurement_scheduler_config["busy_cadence_factor"] == 0.25
+
+    @pytest.mark.parametrize(
+        ("key", "value"),
+        [("idle_cadence_factor", 4.0), ("busy_cadence_factor", 0), ("lead_margin_ms", True)],
+    )
+    def test_out_of_range_warns_and_defaults(self, caplog, key, value):
+        with caplog.at_level(logging.WARNING, logger="wanctl.autorate_config"):
+            config = self._load({key: value})
+
+        default = {"idle_cadence_factor": 2.0, "busy_cadence_factor": 0.5, "lead_margin_ms": 5.0}
+        assert config.measurement_scheduler_config[key] == default[key]
+        assert any(f"measurement_scheduler.{key} must be" in m for m in caplog.messages)
+
+    def test_non_dict_section_uses_defaults(self, caplog):
+        with caplog.at_level(logging.WARNING, logger="wanctl.autorate_config"):
+            config = self._load("on")
+
+        assert config.measurement_scheduler_config["enabled"] is False
+        assert any("measurement_scheduler must be dict" in m for m in caplog.messages)
+
+
+class TestRouterSSHModeConfig:
+    """Tests for router.ssh_mode in _load_router_transport_config."""
+
+    def _load(self, router: dict) -> Config:
+        config = object.__new__(Config)
+        config.data = {"router": router}
+        config._load_router_transport_config()
+        return config
+
+    def test_exec_by_default(self):
+        assert self._load({}).router_ssh_mode == "exec"
+
+    def test_shell_is_accepted(self):
+        assert self._load({"ssh_mode": "shell"}).router_ssh_mode == "shell"
+
+    @pytest.mark.parametrize("value", ["SHELL", "pipelined", None])
+    def test_invalid_mode_warns_and_defaults(self, caplog, value):
+        with caplog.at_level(logging.WARNING, logger="wanctl.autorate_config"):
+            config = self._load({"ssh_mode": value})
+
+        assert config.router_ssh_mode == "exec"
+        assert any("router.ssh_mode must be" in message for message in caplog.messages)
+
+
+class TestZoneEventsConfig:
+    """Tests for _load_zone_events_config (autorate -> steering event push)."""
+
+    def _load(self, data: dict) -> Config:
+        config = object.__new__(Config)
+        config.data = data
+        config._load_zone_events_config()
+        return config
+
+    def test_disabled_by_default(self):
+        assert self._load({}).zone_event_socket is None
+
+    def test_enabled_uses_default_socket(self):
+        config = self._load({"zone_events": {"enabled": True}})
+
+        assert config.zone_event_socket == "/run/wanctl/steering-events.sock"
+
+    def test_custom_socket_path(self):
+        config = self._load({"zone_events": {"enabled": True, "socket_path": "/tmp/ev.sock"}})
+
+        assert config.zone_event_socket == "/tmp/ev.sock"
+
+    def test_relative_socket_path_disables_with_warning(self, caplog):
+        with caplog.at_level(logging.WARNING, logger="wanctl.autorate_config"):
+            config = self._load({"zone_events": {"enabled": True, "socket_path": "ev.sock"}})
+
+        assert config.zone_event_socket is None
+        assert any("zone_events.socket_path" in m for m in caplog.messages)
@@ -13,12 +13,15 @@ from typing import Any
 import pytest
 
 from wanctl.cake_signal import (
+    MAX_TINS,
     SANITY_MAX_DELTA,
     U32_MAX,
     CakeSignalConfig,
     CakeSignalProcessor,
     CakeSignalSnapshot,
+    CakeTinStats,
     TinSnapshot,
+    TinSnapshotView,
     u32_delta,
 )
 
@@ -671,6 +674,73 @@ class TestCakeSignalProcessorTinSnapshots:
         assert snap.tins[3].drop_delta == 1  # 2 - 1
 
 
+# ---------------------------------------------------------------------------
+# CakeTinStats columns and the lazy TinSnapshotView
+# ---------------------------------------------------------------------------
+
+class TestCakeTinStats:
+    """Tests for the fixed-layout per-tin stats and the snapshot view over them."""
+
+    def test_dicts_round_trip_through_columns(self) -> None:
+        tins = make_mock_stats(tin_drops=[5, 10, 3, 1], tin_backlog=[0, 500, 0, 0])["tins"]
+
+        stats = CakeTinStats.from_dicts(tins)
+
+        assert stats.count == 4
+        assert list(stats.column("dropped_packets")) == [5, 10, 3, 1]
+        assert stats.total("backlog_bytes") == 500
+        assert stats.to_dicts() == tins
+
+    def test_tins_beyond_max_are_ignored(self) -> None:
+        stats = CakeTinStats.from_dicts([{"dropped_packets": i} for i in range(MAX_TINS + 2)])
+
+        assert stats.count == MAX_TINS
+        assert list(stats.column("dropped_packets")) == list(range(MAX_TINS))
+
+    def test_tin_stats_and_tins_dicts_give_identical_snapshots(self) -> None:
+        cycles = [
+            make_mock_stats(
+                tin_drops=[d, 2 * d, d // 2, 1],
+                tin_backlog=[100, 400 * d, 0, 50],
+                tin_peak_delay=[9000, 3000 + d, 1000, 200],
+                tin_avg_delay=[4000, 1000 + d, 2500, 100],
+                tin_base_delay=[500, 200, 3000, 50],
+            )
+            for d in (10, 20, 35, 70)
+        ]
+        from_dicts = CakeSignalProcessor(config=CakeSignalConfig(enabled=True))
+        from_columns = CakeSignalProcessor(config=CakeSignalConfig(enabled=True))
+
+        for raw in cycles:
+            columnar = {**raw, "tins": [], "tin_stats": CakeTinStats.from_dicts(raw["tins"])}
+            expected = from_dicts.update(raw)
+            snap = from_columns.update(columnar)
+
+            assert snap == expected
+            assert snap.tins == expected.tins
+
+    def test_view_slices_and_negative_indices(self) -> None:
+        proc = CakeSignalProcessor(config=CakeSignalConfig(enabled=True))
+        proc.update(make_mock_stats(tin_drops=[5, 10, 3, 1]))
+        snap = proc.update(make_mock_stats(tin_drops=[7, 15, 4, 2]))
+
+        assert snap is not None
+        assert isinstance(snap.tins, TinSnapshotView)
+        assert snap.tins[-1] == snap.tins[3]
+        assert [tin.name for tin in snap.tins[1:]] == ["BestEffort", "Video", "Voice"]
+        with pytest.raises(IndexError):
+            snap.tins[4]
+
+    def test_previous_stats_are_not_mutated(self) -> None:
+        proc = CakeSignalProcessor(config=CakeSignalConfig(enabled=True))
+        first = proc.update(make_mock_stats(tin_drops=[5, 10, 3, 1]))
+        proc.update(make_mock_stats(tin_drops=[7, 15, 4, 2]))
+
+        assert first is not None
+        assert [tin.dropped_packets for tin in first.tins] == [5, 10, 3, 1]
+        assert [tin.drop_delta for tin in first.tins] == [0, 0, 0, 0]
+
+
 # ---------------------------------------------------------------------------
 # YAML config parsing (_parse_cake_signal_config) -- Phase 159, CAKE-05
 # ---------------------------------------------------------------------------
@@ -110,3 +110,41 @@ def test_cadence_sec_constructor_param_is_honored() -> None:
     )
 
     assert thread._cadence_sec == 0.25
+
+
+def test_background_thread_dumps_on_its_own_socket() -> None:
+    """Stats dumps must not share the writers' socket lock."""
+    from wanctl.backends import netlink_cake
+
+    shutdown_event = threading.Event()
+    thread = BackgroundCakeStatsThread(
+        dl_interface="if-dl",
+        ul_interface="if-ul",
+        shutdown_event=shutdown_event,
+        htb_directions=(False, True),
+    )
+    built = []
+
+    def make_backend(cls_name):
+        def factory(interface, iproute):
+            backend = MagicMock()
+            backend._parse_cake_msg.side_effect = lambda msgs: shutdown_event.set()
+            built.append((cls_name, interface, iproute))
+            return backend
+
+        return factory
+
+    with (
+        patch.object(netlink_cake, "NetlinkCakeBackend", side_effect=make_backend("cake")),
+        patch.object(netlink_cake, "NetlinkHtbFqCodelBackend", side_effect=make_backend("htb")),
+    ):
+        thread._run()
+
+    assert [(name, interface) for name, interface, _ in built] == [
+        ("cake", "if-dl"),
+        ("htb", "if-ul"),
+    ]
+    stats_socket = built[0][2]
+    assert stats_socket is built[1][2]
+    assert isinstance(stats_socket, netlink_cake.SharedIPRoute)
+    assert stats_socket is not netlink_cake.shared_iproute()
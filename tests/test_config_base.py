@@ -1,5 +1,6 @@
 """Tests for config_base module - schema validation and security checks."""
 
+import logging
 from pathlib import Path
 
 import pytest
@@ -634,6 +635,21 @@ class TestValidateCommentSecurityEdgeCases:
         assert result == comment
 
 
+class TestValidateSshMode:
+    """Tests for validate_ssh_mode (shared by autorate and steering configs)."""
+
+    @pytest.mark.parametrize("mode", ["exec", "shell"])
+    def test_supported_modes_pass_through(self, mode):
+        assert BaseConfig.validate_ssh_mode(mode, "router.ssh_mode") == mode
+
+    @pytest.mark.parametrize("value", ["SHELL", "pipelined", None, 1])
+    def test_unknown_mode_warns_and_defaults_to_exec(self, caplog, value):
+        with caplog.at_level(logging.WARNING, logger="wanctl.config_base"):
+            assert BaseConfig.validate_ssh_mode(value, "router.ssh_mode") == "exec"
+
+        assert "router.ssh_mode must be 'exec' or 'shell'" in caplog.text
+
+
 class TestYAMLParseErrors:
     """Tests for YAML parse error handling with line numbers."""
 
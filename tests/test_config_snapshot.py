@@ -0,0 +1,175 @@
+"""Tests for content-addressed config snapshots (config_snapshot.py)."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+import yaml
+
+from wanctl.config_snapshot import (
+    ConfigSnapshot,
+    load_config_snapshot,
+    reload_data,
+    snapshot_from_parsed,
+)
+from wanctl.wan_controller import WANController
+
+
+def _write(path, data):
+    path.write_text(yaml.safe_dump(data))
+    return str(path)
+
+
+class TestConfigSnapshot:
+    def test_data_is_read_only(self, tmp_path):
+        snapshot = load_config_snapshot(_write(tmp_path / "c.yaml", {"fusion": {"w": [1, 2]}}))
+
+        with pytest.raises(TypeError):
+            snapshot.data["fusion"]["w"] = 3  # type: ignore[index]
+        assert snapshot.data["fusion"]["w"] == (1, 2)
+
+    def test_as_dict_returns_independent_plain_copy(self, tmp_path):
+        snapshot = load_config_snapshot(_write(tmp_path / "c.yaml", {"fusion": {"w": [1, 2]}}))
+
+        copy = snapshot.as_dict()
+        copy["fusion"]["w"].append(3)
+
+        assert isinstance(copy["fusion"], dict)
+        assert snapshot.get("fusion.w") == [1, 2]
+        assert snapshot.get("fusion.missing") is None
+
+    def test_unchanged_content_is_a_cache_hit_without_parsing(self, tmp_path):
+        path = _write(tmp_path / "c.yaml", {"tuning": {"enabled": True}})
+        first = load_config_snapshot(path)
+
+        with patch("wanctl.config_snapshot.yaml.safe_load") as safe_load:
+            second = load_config_snapshot(path)
+
+        safe_load.assert_not_called()
+        assert second is first
+
+    def test_changed_compares_only_requested_paths(self, tmp_path):
+        old = load_config_snapshot(
+            _write(tmp_path / "a.yaml", {"fusion": {"enabled": True}, "tuning": {"enabled": False}})
+        )
+        new = load_config_snapshot(
+            _write(tmp_path / "b.yaml", {"fusion": {"enabled": True}, "tuning": {"enabled": True}})
+        )
+
+        assert new.changed(old, "tuning") is True
+        assert new.changed(old, "fusion") is False
+        assert new.changed(old, "cake_signal") is False  # absent in both
+        assert new.changed(None, "fusion") is True
+
+    def test_key_order_does_not_affect_digest(self):
+        a = ConfigSnapshot.from_mapping({"s": {"x": 1, "y": 2}}, "a")
+        b = ConfigSnapshot.from_mapping({"s": {"y": 2, "x": 1}}, "b")
+
+        assert a.digest("s") == b.digest("s")
+
+    def test_non_mapping_document_rejected(self, tmp_path):
+        path = tmp_path / "c.yaml"
+        path.write_text("- just\n- a list\n")
+
+        with pytest.raises(TypeError):
+            load_config_snapshot(str(path))
+
+    def test_snapshot_from_parsed_seeds_cache(self, tmp_path):
+        path = tmp_path / "c.yaml"
+        path.write_text("fusion:\n  enabled: false\n")
+        seeded = snapshot_from_parsed(path.read_bytes(), {"fusion": {"enabled": False}})
+
+        assert load_config_snapshot(str(path)) is seeded
+
+    def test_reload_data_prefers_passed_data(self, tmp_path):
+        path = _write(tmp_path / "c.yaml", {"fusion": {"enabled": True}})
+        passed = {"fusion": {"enabled": False}}
+
+        with patch("wanctl.config_snapshot.open") as opener:
+            assert reload_data(path, passed) is passed
+        opener.assert_not_called()
+        assert reload_data(path) == {"fusion": {"enabled": True}}
+
+
+class TestWANControllerReloadDispatch:
+    """reload() always re-applies kill switches; other reloaders run on change."""
+
+    _KILL_SWITCHES = (
+        "_reload_fusion_config",
+        "_reload_tuning_config",
+        "_reload_asymmetry_gate_config",
+        "_reload_cake_signal_config",
+    )
+    _RELOADERS = (
+        *_KILL_SWITCHES,
+        "_reload_hysteresis_config",
+        "_reload_cycle_budget_config",
+        "_reload_suppression_alert_config",
+    )
+
+    def _controller(self, config_path, previous):
+        controller = WANController.__new__(WANController)
+        controller.config = MagicMock()
+        controller.config.config_file_path = config_path
+        controller.logger = MagicMock()
+        controller._config_snapshot = previous
+        for name in self._RELOADERS:
+            setattr(controller, name, MagicMock())
+        return controller
+
+    def test_only_changed_sections_reload(self, tmp_path):
+        base = {
+            "fusion": {"enabled": False},
+            "continuous_monitoring": {"thresholds": {"dwell_cycles": 3}},
+        }
+        previous = load_config_snapshot(_write(tmp_path / "old.yaml", base))
+        base["continuous_monitoring"]["thresholds"]["dwell_cycles"] = 5
+        controller = self._controller(_write(tmp_path / "new.yaml", base), previous)
+
+        controller.reload()
+
+        called = {n for n in self._RELOADERS if getattr(controller, n).called}
+        assert called == {
+            *self._KILL_SWITCHES,
+            "_reload_hysteresis_config",
+            "_reload_suppression_alert_config",
+        }
+        assert controller._config_snapshot is not previous
+
+    def test_unchanged_file_reapplies_only_kill_switches(self, tmp_path):
+        path = _write(tmp_path / "c.yaml", {"fusion": {"enabled": False}})
+        controller = self._controller(path, load_config_snapshot(path))
+
+        controller.reload()
+
+        called = {n for n in self._RELOADERS if getattr(controller, n).called}
+        assert called == set(self._KILL_SWITCHES)
+
+    def test_without_previous_snapshot_everything_reloads(self, tmp_path):
+        controller = self._controller(_write(tmp_path / "c.yaml", {}), None)
+
+        controller.reload()
+
+        assert all(getattr(controller, n).called for n in self._RELOADERS)
+
+    def test_unreadable_file_keeps_previous_snapshot(self, tmp_path):
+        previous = load_config_snapshot(_write(tmp_path / "c.yaml", {}))
+        controller = self._controller(str(tmp_path / "missing.yaml"), previous)
+
+        controller.reload()
+
+        assert controller._config_snapshot is previous
+        controller.logger.error.assert_called_once()
+        assert not any(getattr(controller, n).called for n in self._RELOADERS)
+
+    def test_reloaders_share_one_read(self, tmp_path):
+        path = _write(tmp_path / "c.yaml", {"fusion": {"enabled": True}})
+        controller = self._controller(path, None)
+
+        with patch(
+            "wanctl.wan_controller.load_config_snapshot", wraps=load_config_snapshot
+        ) as load:
+            controller.reload()
+
+        load.assert_called_once_with(path)
+        for name in self._RELOADERS:
+            getattr(controller, name).assert_called_once_with({"fusion": {"enabled": True}})
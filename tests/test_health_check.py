@@ -23,7 +23,7 @@ from wanctl.health_check import (
     update_health_status,
 )
 from wanctl.irtt_measurement import IRTTResult
-from wanctl.perf_profiler import OperationProfiler
+from wanctl.perf_profiler import ArrayOperationProfiler, OperationProfiler
 from wanctl.queue_controller import QueueController
 from wanctl.signal_processing import SignalResult
 from wanctl.steering.health import SteeringHealthHandler
@@ -1083,6 +1083,25 @@ class TestBuildCycleBudget:
         assert "p95" in result["cycle_time_ms"]
         assert "p99" in result["cycle_time_ms"]
 
+    def test_array_profiler_adds_lifetime_percentiles(self):
+        """ArrayOperationProfiler stats surface long-horizon p50/p99/p999."""
+        profiler = ArrayOperationProfiler(max_samples=1200)
+        for _ in range(10):
+            profiler.record("autorate_cycle_total", 40.0)
+            profiler.record("autorate_rtt_measurement", 20.0)
+
+        result = _build_cycle_budget(
+            profiler, overrun_count=0, cycle_interval_ms=50.0, total_label="autorate_cycle_total"
+        )
+        assert result is not None
+        assert result["cycle_time_ms"]["lifetime"] == {
+            "count": 10,
+            "p50": 40.0,
+            "p99": 40.0,
+            "p999": 40.0,
+        }
+        assert result["subsystems"]["rtt_measurement"]["lifetime"]["p999"] == 20.0
+
     def test_utilization_pct_calculation(self):
         """utilization_pct = (avg_ms / cycle_interval_ms) * 100, rounded to 1 decimal."""
         profiler = OperationProfiler(max_samples=1200)
@@ -3675,50 +3694,47 @@ class TestReloadCycleBudgetConfig:
     """Tests for SIGUSR1 cycle budget config reload (Phase 132: PERF-03)."""
 
     @staticmethod
-    def _make_controller_stub(threshold: float = 80.0):
+    def _make_controller_stub(config_path, yaml_data, threshold: float = 80.0):
         """Build a minimal stub with attributes _reload_cycle_budget_config needs."""
+        import yaml
+
         from wanctl.wan_controller import WANController
 
+        config_path.write_text(yaml.safe_dump(yaml_data))
         stub = MagicMock(spec=[])
         stub._warning_threshold_pct = threshold
         stub.config = MagicMock()
-        stub.config.config_file_path = "/tmp/test_wanctl_config.yaml"
+        stub.config.config_file_path = str(config_path)
         stub.logger = MagicMock()
         stub._reload_cycle_budget_config = WANController._reload_cycle_budget_config.__get__(
             stub, type(stub)
         )
         return stub
 
-    def test_reload_updates_threshold(self):
+    def test_reload_updates_threshold(self, tmp_path):
         """Reload picks up new warning_threshold_pct from YAML."""
-        stub = self._make_controller_stub(threshold=80.0)
-
         yaml_data = {"continuous_monitoring": {"warning_threshold_pct": 90.0}}
-        with patch("builtins.open", MagicMock()):
-            with patch("yaml.safe_load", return_value=yaml_data):
-                stub._reload_cycle_budget_config()
+        stub = self._make_controller_stub(tmp_path / "config.yaml", yaml_data, threshold=80.0)
+
+        stub._reload_cycle_budget_config()
 
         assert stub._warning_threshold_pct == 90.0
 
-    def test_reload_rejects_invalid(self):
+    def test_reload_rejects_invalid(self, tmp_path):
         """Invalid (non-numeric) value keeps current threshold."""
-        stub = self._make_controller_stub(threshold=80.0)
-
         yaml_data = {"continuous_monitoring": {"warning_threshold_pct": "invalid"}}
-        with patch("builtins.open", MagicMock()):
-            with patch("yaml.safe_load", return_value=yaml_data):
-                stub._reload_cycle_budget_config()
+        stub = self._make_controller_stub(tmp_path / "config.yaml", yaml_data, threshold=80.0)
+
+        stub._reload_cycle_budget_config()
 
         assert stub._warning_threshold_pct == 80.0
 
-    def test_reload_rejects_out_of_range(self):
+    def test_reload_rejects_out_of_range(self, tmp_path):
         """Out-of-range value (>200) keeps current threshold."""
-        stub = self._make_controller_stub(threshold=80.0)
-
         yaml_data = {"continuous_monitoring": {"warning_threshold_pct": 300.0}}
-        with patch("builtins.open", MagicMock()):
-            with patch("yaml.safe_load", return_value=yaml_data):
-                stub._reload_cycle_budget_config()
+        stub = self._make_controller_stub(tmp_path / "config.yaml", yaml_data, threshold=80.0)
+
+        stub._reload_cycle_budget_config()
 
         assert stub._warning_threshold_pct == 80.0
 
@@ -4183,6 +4199,88 @@ class TestMetricsHistoryEndpoint:
             finally:
                 server.shutdown()
 
+    def test_summary_merges_sketches_per_metric(self, sample_db: Path):
+        """?summary=1 returns one sketch summary per metric."""
+        port = find_free_port()
+        with patch("wanctl.health_check.DEFAULT_DB_PATH", sample_db):
+            server = start_health_server(host="127.0.0.1", port=port, controller=None)
+
+            try:
+                url = f"http://127.0.0.1:{port}/metrics/history?range=1h&summary=1"
+                with urllib.request.urlopen(url, timeout=5) as response:
+                    data = json.loads(response.read().decode())
+
+                assert data["metadata"]["summary_mode"] == "sketch"
+                rtt = next(row for row in data["data"] if row["metric_name"] == "wanctl_rtt_ms")
+                assert rtt["granularity"] == "sketch"
+                assert rtt["count"] == 10
+                assert rtt["min"] == 25.0
+                assert rtt["max"] == 34.0
+                assert rtt["avg"] == 29.5
+            finally:
+                server.shutdown()
+
+    def test_summary_exact_uses_stored_rows(self, sample_db: Path):
+        """?summary=1&exact=1 summarizes stored rows per tier."""
+        port = find_free_port()
+        with patch("wanctl.health_check.DEFAULT_DB_PATH", sample_db):
+            server = start_health_server(host="127.0.0.1", port=port, controller=None)
+
+            try:
+                url = f"http://127.0.0.1:{port}/metrics/history?range=1h&summary=true&exact=true"
+                with urllib.request.urlopen(url, timeout=5) as response:
+                    data = json.loads(response.read().decode())
+
+                assert data["metadata"]["summary_mode"] == "exact"
+                rtt = next(row for row in data["data"] if row["metric_name"] == "wanctl_rtt_ms")
+                assert rtt["granularity"] == "raw"
+                assert rtt["count"] == 10
+                assert rtt["p50"] == 29.5
+            finally:
+                server.shutdown()
+
+    def test_ndjson_format_streams_chunked_rows(self, sample_db: Path):
+        """?format=ndjson streams every row newest first with chunked encoding."""
+        port = find_free_port()
+        with patch("wanctl.health_check.DEFAULT_DB_PATH", sample_db):
+            server = start_health_server(host="127.0.0.1", port=port, controller=None)
+
+            try:
+                url = f"http://127.0.0.1:{port}/metrics/history?range=1h&format=ndjson"
+                with urllib.request.urlopen(url, timeout=5) as response:
+                    assert response.status == 200
+                    assert response.headers["Content-Type"] == "application/x-ndjson"
+                    assert response.headers["Transfer-Encoding"] == "chunked"
+                    rows = [json.loads(line) for line in response.read().decode().splitlines()]
+
+                assert len(rows) == 20
+                timestamps = [row["timestamp"] for row in rows]
+                assert timestamps == sorted(timestamps, reverse=True)
+                assert "T" in timestamps[0]
+            finally:
+                server.shutdown()
+
+    def test_csv_format_streams_header_and_rows(self, sample_db: Path):
+        """?format=csv streams a header plus the filtered rows."""
+        port = find_free_port()
+        with patch("wanctl.health_check.DEFAULT_DB_PATH", sample_db):
+            server = start_health_server(host="127.0.0.1", port=port, controller=None)
+
+            try:
+                url = (
+                    f"http://127.0.0.1:{port}/metrics/history"
+                    "?range=1h&format=csv&metrics=wanctl_rtt_ms"
+                )
+                with urllib.request.urlopen(url, timeout=5) as response:
+                    assert response.headers["Content-Type"].startswith("text/csv")
+                    lines = response.read().decode().splitlines()
+
+                assert lines[0] == "timestamp,wan_name,metric_name,value,labels,granularity"
+                assert len(lines) == 11
+                assert lines[1].endswith(",spectrum,wanctl_rtt_ms,34.0,,raw")
+            finally:
+                server.shutdown()
+
 
 class TestHistoryParamsValidation:
     """Tests for 400 error responses on invalid params."""
@@ -4259,6 +4357,92 @@ class TestHistoryParamsValidation:
             finally:
                 server.shutdown()
 
+    def test_exact_without_summary(self, sample_db: Path):
+        """?exact=1 without summary returns 400."""
+        port = find_free_port()
+        with patch("wanctl.health_check.DEFAULT_DB_PATH", sample_db):
+            server = start_health_server(host="127.0.0.1", port=port, controller=None)
+
+            try:
+                url = f"http://127.0.0.1:{port}/metrics/history?exact=1"
+                with pytest.raises(urllib.error.HTTPError) as exc_info:
+                    urllib.request.urlopen(url, timeout=5)
+
+                assert exc_info.value.code == 400
+                data = json.loads(exc_info.value.read().decode())
+                assert "summary" in data["error"]
+                exc_info.value.close()
+            finally:
+                server.shutdown()
+
+    def test_invalid_summary_flag(self, sample_db: Path):
+        """?summary=maybe returns 400."""
+        port = find_free_port()
+        with patch("wanctl.health_check.DEFAULT_DB_PATH", sample_db):
+            server = start_health_server(host="127.0.0.1", port=port, controller=None)
+
+            try:
+                url = f"http://127.0.0.1:{port}/metrics/history?summary=maybe"
+                with pytest.raises(urllib.error.HTTPError) as exc_info:
+                    urllib.request.urlopen(url, timeout=5)
+
+                assert exc_info.value.code == 400
+                exc_info.value.close()
+            finally:
+                server.shutdown()
+
+    def test_invalid_format(self, sample_db: Path):
+        """?format=xml returns 400."""
+        port = find_free_port()
+        with patch("wanctl.health_check.DEFAULT_DB_PATH", sample_db):
+            server = start_health_server(host="127.0.0.1", port=port, controller=None)
+
+            try:
+                url = f"http://127.0.0.1:{port}/metrics/history?format=xml"
+                with pytest.raises(urllib.error.HTTPError) as exc_info:
+                    urllib.request.urlopen(url, timeout=5)
+
+                assert exc_info.value.code == 400
+                exc_info.value.close()
+            finally:
+                server.shutdown()
+
+    def test_stream_format_rejects_pagination(self, sample_db: Path):
+        """?format=ndjson&limit=10 returns 400: streams are not paginated."""
+        port = find_free_port()
+        with patch("wanctl.health_check.DEFAULT_DB_PATH", sample_db):
+            server = start_health_server(host="127.0.0.1", port=port, controller=None)
+
+            try:
+                url = f"http://127.0.0.1:{port}/metrics/history?format=ndjson&limit=10"
+                with pytest.raises(urllib.error.HTTPError) as exc_info:
+                    urllib.request.urlopen(url, timeout=5)
+
+                assert exc_info.value.code == 400
+                data = json.loads(exc_info.value.read().decode())
+                assert "limit" in data["error"]
+                exc_info.value.close()
+            finally:
+                server.shutdown()
+
+    def test_stream_format_rejects_ranges_over_7d(self, sample_db: Path):
+        """?format=ndjson&range=8d returns 400 before any row is read."""
+        port = find_free_port()
+        with patch("wanctl.health_check.DEFAULT_DB_PATH", sample_db):
+            server = start_health_server(host="127.0.0.1", port=port, controller=None)
+
+            try:
+                url = f"http://127.0.0.1:{port}/metrics/history?format=ndjson&range=8d"
+                with pytest.raises(urllib.error.HTTPError) as exc_info:
+                    urllib.request.urlopen(url, timeout=5)
+
+                assert exc_info.value.code == 400
+                data = json.loads(exc_info.value.read().decode())
+                assert "7d" in data["error"]
+                exc_info.value.close()
+            finally:
+                server.shutdown()
+
 
 class TestHistoryHelperMethods:
     """Unit tests for helper methods used by /metrics/history."""
@@ -4815,6 +4999,56 @@ class TestBuildCakeSignalSection:
         assert result is None
 
 
+class TestBuildRouterApplySection:
+    """Tests for _build_router_apply_section in HealthCheckHandler."""
+
+    def test_returns_none_in_sync_mode(self) -> None:
+        handler = HealthCheckHandler.__new__(HealthCheckHandler)
+
+        assert handler._build_router_apply_section({"router_apply": None}) is None
+
+    def test_renders_acknowledged_rates_and_lag(self) -> None:
+        handler = HealthCheckHandler.__new__(HealthCheckHandler)
+        health_data = {
+            "router_apply": {
+                "mode": "async",
+                "acknowledged_dl_rate": 812_345_678,
+                "acknowledged_ul_rate": 35_000_000,
+                "pending_target": (800_000_000, 35_000_000),
+                "stats": {"avg_ms": 4.44, "p95_ms": 9.99, "p99_ms": 12.0, "max_ms": 40.01},
+                "posted": 12,
+                "superseded": 3,
+                "applied": 8,
+                "failed": 1,
+                "in_flight": True,
+                "waiting": False,
+                "last_result": {
+                    "success": True,
+                    "applied_dl_rate": 812_345_678,
+                    "applied_ul_rate": 35_000_000,
+                    "apply_ms": 38.04,
+                    "lag_ms": 41.26,
+                    "age_sec": 0.01234,
+                },
+            }
+        }
+
+        result = handler._build_router_apply_section(health_data)
+
+        assert result == {
+            "mode": "async",
+            "acknowledged": {"download_mbps": 812.3, "upload_mbps": 35.0},
+            "pending": {"download_mbps": 800.0, "upload_mbps": 35.0},
+            "last_apply": {"success": True, "apply_ms": 38.0, "lag_ms": 41.3, "age_sec": 0.012},
+            "posted": 12,
+            "superseded": 3,
+            "applied": 8,
+            "failed": 1,
+            "in_flight": True,
+            "apply_time_ms": {"avg": 4.4, "p95": 10.0, "max": 40.0},
+        }
+
+
 class TestBuildSignalArbitrationSection:
     """Tests for _build_signal_arbitration_section in HealthCheckHandler."""
 
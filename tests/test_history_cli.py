@@ -1,6 +1,7 @@
 """Tests for wanctl-history CLI tool."""
 
 import argparse
+import io
 import json
 import sqlite3
 import subprocess
@@ -12,6 +13,7 @@ import pytest
 
 from wanctl.history import (
     create_parser,
+    format_sketch_summary,
     format_summary,
     format_table,
     format_timestamp,
@@ -19,7 +21,10 @@ from wanctl.history import (
     main,
     parse_duration,
     parse_timestamp,
+    write_csv,
+    write_ndjson,
 )
+from wanctl.quantile_sketch import QuantileSketch
 from wanctl.storage.schema import TUNING_PARAMS_SCHEMA
 from wanctl.storage.writer import MetricsWriter
 
@@ -274,6 +279,86 @@ class TestFormatSummary:
         assert summary.count("avg:") == 2
 
 
+def _sketch_row(metric_name: str, wan_name: str, values: list[float]) -> dict:
+    sketch = QuantileSketch()
+    for value in values:
+        sketch.add(value)
+    return {"metric_name": metric_name, "wan_name": wan_name, "sketch": sketch}
+
+
+class TestFormatSketchSummary:
+    """Tests for format_sketch_summary function."""
+
+    def test_pools_wans_into_one_section_per_metric(self):
+        results = [
+            _sketch_row("wanctl_rtt_ms", "spectrum", [10.0, 20.0]),
+            _sketch_row("wanctl_rtt_ms", "att", [30.0]),
+        ]
+
+        summary = format_sketch_summary(results)
+
+        assert "wanctl_rtt_ms (3 samples)" in summary
+        assert "  min: 10\n" in summary
+        assert "  max: 30\n" in summary
+        assert "  avg: 20\n" in summary
+        assert summary.endswith("  p99: 30")
+
+    def test_state_summary_shows_percentages(self):
+        results = [_sketch_row("wanctl_state", "spectrum", [0.0, 0.0, 1.0, 3.0])]
+
+        summary = format_sketch_summary(results)
+
+        assert "GREEN: 50.0%" in summary
+        assert "YELLOW: 25.0%" in summary
+        assert "RED: 25.0%" in summary
+
+
+class TestStreamWriters:
+    """Tests for the streaming NDJSON/CSV writers."""
+
+    ROWS = [
+        {
+            "timestamp": 100,
+            "wan_name": "spectrum",
+            "metric_name": "wanctl_rtt_ms",
+            "value": 12.5,
+            "labels": None,
+            "granularity": "raw",
+        },
+        {
+            "timestamp": 160,
+            "wan_name": "spectrum",
+            "metric_name": "wanctl_cake_tin_delay_us",
+            "value": 300.0,
+            "labels": '{"tin":"Voice"}',
+            "granularity": "1m",
+        },
+    ]
+
+    def test_ndjson_writes_one_object_per_line(self):
+        out = io.StringIO()
+
+        assert write_ndjson(iter(self.ROWS), out) == 2
+        assert [json.loads(line) for line in out.getvalue().splitlines()] == self.ROWS
+
+    def test_csv_writes_header_and_rows(self):
+        out = io.StringIO()
+
+        assert write_csv(iter(self.ROWS), out) == 2
+        assert out.getvalue().splitlines() == [
+            "timestamp,wan_name,metric_name,value,labels,granularity",
+            "100,spectrum,wanctl_rtt_ms,12.5,,raw",
+            '160,spectrum,wanctl_cake_tin_delay_us,300.0,"{""tin"":""Voice""}",1m',
+        ]
+
+    def test_empty_input_writes_only_csv_header(self):
+        out = io.StringIO()
+
+        assert write_ndjson(iter([]), out) == 0
+        assert write_csv(iter([]), out) == 0
+        assert out.getvalue() == "timestamp,wan_name,metric_name,value,labels,granularity\n"
+
+
 # =============================================================================
 # ARGUMENT PARSER TESTS
 # =============================================================================
@@ -329,6 +414,12 @@ class TestArgumentParser:
         args = parser.parse_args(["--summary"])
         assert args.summary is True
 
+    def test_exact_flag(self):
+        """--exact flag is parsed correctly."""
+        parser = create_parser()
+        args = parser.parse_args(["--summary", "--exact"])
+        assert args.exact is True
+
     def test_verbose_flag(self):
         """-v/--verbose flag is parsed correctly."""
         parser = create_parser()
@@ -621,6 +712,147 @@ class TestMain:
         # Should have output (data exists)
         assert "wanctl" in captured.out or "No data" in captured.out
 
+    def test_summary_reads_sketches_by_default(self, temp_db, monkeypatch, capsys):
+        """--summary pools WANs per metric from the sketch reader."""
+        monkeypatch.setattr(
+            sys, "argv", ["wanctl-history", "--last", "1h", "--summary", "--db", str(temp_db)]
+        )
+
+        assert main() == 0
+        out = capsys.readouterr().out
+        assert "wanctl_rtt_ms (15 samples)" in out
+        assert "YELLOW: 100.0%" in out
+
+    def test_summary_exact_computes_from_rows(self, temp_db, monkeypatch, capsys):
+        """--summary --exact keeps the row-based summary."""
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            ["wanctl-history", "--last", "1h", "--summary", "--exact", "--db", str(temp_db)],
+        )
+
+        with patch("wanctl.history.query_metric_sketches") as sketches:
+            assert main() == 0
+        sketches.assert_not_called()
+        assert "wanctl_rtt_ms (15 samples)" in capsys.readouterr().out
+
+    def test_exact_requires_summary(self, temp_db, monkeypatch):
+        """--exact on its own is a usage error."""
+        monkeypatch.setattr(sys, "argv", ["wanctl-history", "--exact", "--db", str(temp_db)])
+
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+        assert exc_info.value.code == 2
+
+    def test_ndjson_streams_rows_oldest_first(self, temp_db, monkeypatch, capsys):
+        """--ndjson streams every row without materializing query_metrics()."""
+        monkeypatch.setattr(
+            sys, "argv", ["wanctl-history", "--last", "1h", "--ndjson", "--db", str(temp_db)]
+        )
+
+        with patch("wanctl.history.query_metrics") as query:
+            assert main() == 0
+        query.assert_not_called()
+        rows = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert len(rows) == 25
+        timestamps = [row["timestamp"] for row in rows]
+        assert timestamps == sorted(timestamps)
+
+    def test_csv_filters_by_metric(self, temp_db, monkeypatch, capsys):
+        """--csv writes a header plus the filtered rows."""
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            [
+                "wanctl-history",
+                "--last",
+                "1h",
+                "--csv",
+                "--metrics",
+                "wanctl_state",
+                "--db",
+                str(temp_db),
+            ],
+        )
+
+        assert main() == 0
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[0] == "timestamp,wan_name,metric_name,value,labels,granularity"
+        assert len(lines) == 11
+        assert all(",wanctl_state,1.0," in line for line in lines[1:])
+
+    def test_export_writes_columnar_archive(self, temp_db, tmp_path, monkeypatch, capsys):
+        """--export writes every row to a columnar archive."""
+        from wanctl.storage.archive import MetricsArchive
+
+        out_path = tmp_path / "history.wca"
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            ["wanctl-history", "--last", "1h", "--export", str(out_path), "--db", str(temp_db)],
+        )
+
+        assert main() == 0
+        assert "Exported 25 rows" in capsys.readouterr().out
+        with MetricsArchive(out_path) as archive:
+            assert sum(series.count for series in archive.series) == 25
+            (att,) = archive.select(wan_name="att")
+            assert sorted(archive.read(att)[1]) == [25.0, 26.0, 27.0, 28.0, 29.0]
+
+    def test_parquet_export_without_pyarrow_fails_cleanly(
+        self, temp_db, tmp_path, monkeypatch, capsys
+    ):
+        """--format parquet reports a missing pyarrow instead of crashing."""
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            [
+                "wanctl-history",
+                "--export",
+                str(tmp_path / "history.parquet"),
+                "--format",
+                "parquet",
+                "--db",
+                str(temp_db),
+            ],
+        )
+
+        with patch(
+            "wanctl.history.write_parquet",
+            side_effect=ImportError("Parquet export requires pyarrow"),
+        ):
+            assert main() == 1
+        assert "requires pyarrow" in capsys.readouterr().err
+
+    def test_format_requires_export(self, temp_db, monkeypatch):
+        """--format on its own is a usage error."""
+        monkeypatch.setattr(
+            sys, "argv", ["wanctl-history", "--format", "columnar", "--db", str(temp_db)]
+        )
+
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+        assert exc_info.value.code == 2
+
+    @pytest.mark.parametrize(
+        "extra",
+        [
+            ["--ndjson", "--csv"],
+            ["--ndjson", "--json"],
+            ["--csv", "--summary"],
+            ["--csv", "--tins"],
+            ["--export", "x.wca", "--ndjson"],
+            ["--export", "x.wca", "--alerts"],
+        ],
+    )
+    def test_stream_formats_reject_other_output_modes(self, temp_db, monkeypatch, extra):
+        """--ndjson/--csv cannot be combined with other output modes."""
+        monkeypatch.setattr(sys, "argv", ["wanctl-history", *extra, "--db", str(temp_db)])
+
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+        assert exc_info.value.code == 2
+
 
 # =============================================================================
 # PER-TIN HISTORY TESTS (CAKE-07)
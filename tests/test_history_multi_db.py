@@ -1,5 +1,6 @@
 import sqlite3
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -181,3 +182,134 @@ def test_history_main_returns_one_when_no_databases_found(
     monkeypatch.setattr("sys.argv", ["wanctl-history", "--last", "1h"])
 
     assert history.main() == 1
+
+
+def test_query_all_wans_heap_merge_matches_stable_sort() -> None:
+    from wanctl.storage.db_utils import query_all_wans
+
+    # Each reader returns newest-first; ties must keep DB order, then row order
+    rows_by_db = {
+        Path("metrics-att.db"): [
+            {"timestamp": 300, "id": "att-3"},
+            {"timestamp": 200, "id": "att-2b"},
+            {"timestamp": 200, "id": "att-2a"},
+            {"timestamp": 100, "id": "att-1"},
+        ],
+        Path("metrics-spectrum.db"): [
+            {"timestamp": 200, "id": "spectrum-2"},
+            {"timestamp": 100, "id": "spectrum-1"},
+        ],
+    }
+
+    results = query_all_wans(lambda db_path: list(rows_by_db[db_path]), db_paths=list(rows_by_db))
+
+    expected = sorted(
+        [row for rows in rows_by_db.values() for row in rows], key=lambda row: row["timestamp"]
+    )
+    assert results == expected
+    assert [row["id"] for row in results][:4] == ["att-1", "spectrum-1", "att-2b", "att-2a"]
+
+
+def test_query_all_wans_fans_out_across_threads() -> None:
+    import threading
+
+    from wanctl.storage.db_utils import query_all_wans
+
+    paths = [Path("metrics-att.db"), Path("metrics-spectrum.db")]
+    barrier = threading.Barrier(len(paths), timeout=5)
+    threads: set[str] = set()
+
+    def _query(db_path: Path) -> list[dict]:
+        # Both queries must be in flight at once to pass the barrier
+        barrier.wait()
+        threads.add(threading.current_thread().name)
+        return [{"timestamp": 1, "wan_name": db_path.stem}]
+
+    results = query_all_wans(_query, db_paths=paths)
+
+    assert [row["wan_name"] for row in results] == ["metrics-att", "metrics-spectrum"]
+    assert len(threads) == 2
+    assert all(name.startswith("wanctl-query") for name in threads)
+
+
+def test_query_all_wans_fan_out_does_not_swallow_programmer_errors() -> None:
+    from wanctl.storage.db_utils import query_all_wans
+
+    def _query(db_path: Path) -> list[dict]:
+        if db_path.name == "metrics-spectrum.db":
+            raise TypeError("bug")
+        return []
+
+    with pytest.raises(TypeError, match="bug"):
+        query_all_wans(_query, db_paths=[Path("metrics-att.db"), Path("metrics-spectrum.db")])
+
+
+def test_query_all_wans_fan_out_counts_partial_failures(tmp_path: Path) -> None:
+    from wanctl.storage.db_utils import query_all_wans
+    from wanctl.storage.reader import query_metrics
+
+    good = tmp_path / "metrics-spectrum.db"
+    bad = tmp_path / "metrics-att.db"
+    _create_metrics_db(good, [(200, "spectrum", "wanctl_rtt_ms", 2.0, "", "raw")])
+    bad.write_bytes(b"broken")
+
+    results = query_all_wans(query_metrics, db_paths=[bad, good])
+
+    assert [row["wan_name"] for row in results] == ["spectrum"]
+    assert results.all_failed is False
+
+
+def test_iter_all_wans_streams_merged_rows(tmp_path: Path) -> None:
+    from wanctl.storage.db_utils import iter_all_wans
+    from wanctl.storage.reader import iter_metrics
+
+    spectrum_db = tmp_path / "metrics-spectrum.db"
+    att_db = tmp_path / "metrics-att.db"
+    _create_metrics_db(
+        spectrum_db,
+        [
+            (100, "spectrum", "wanctl_rtt_ms", 1.0, "", "raw"),
+            (300, "spectrum", "wanctl_rtt_ms", 3.0, "", "raw"),
+        ],
+    )
+    _create_metrics_db(att_db, [(200, "att", "wanctl_rtt_ms", 2.0, "", "raw")])
+
+    oldest_first = iter_all_wans(iter_metrics, db_paths=[att_db, spectrum_db], batch_size=1)
+    newest_first = iter_all_wans(
+        iter_metrics, db_paths=[att_db, spectrum_db], newest_first=True, batch_size=1
+    )
+
+    assert [row["timestamp"] for row in oldest_first] == [100, 200, 300]
+    assert [row["timestamp"] for row in newest_first] == [300, 200, 100]
+
+
+def test_closing_iter_all_wans_releases_every_reader(tmp_path: Path) -> None:
+    from wanctl.storage import reader
+    from wanctl.storage.db_utils import iter_all_wans
+
+    paths = [tmp_path / "metrics-spectrum.db", tmp_path / "metrics-att.db"]
+    for db_path, wan in zip(paths, ("spectrum", "att"), strict=True):
+        _create_metrics_db(db_path, [(100, wan, "wanctl_rtt_ms", 1.0, "", "raw")])
+
+    with patch.object(
+        reader, "release_read_connection", wraps=reader.release_read_connection
+    ) as release:
+        rows = iter_all_wans(reader.iter_metrics, db_paths=paths)
+        next(rows)
+        rows.close()
+
+    assert release.call_count == 2
+
+
+def test_iter_all_wans_skips_unreadable_db(tmp_path: Path) -> None:
+    from wanctl.storage.db_utils import iter_all_wans
+    from wanctl.storage.reader import iter_metrics
+
+    good = tmp_path / "metrics-spectrum.db"
+    bad = tmp_path / "metrics-att.db"
+    _create_metrics_db(good, [(200, "spectrum", "wanctl_rtt_ms", 2.0, "", "raw")])
+    bad.write_bytes(b"broken")
+
+    rows = list(iter_all_wans(iter_metrics, db_paths=[bad, good]))
+
+    assert [row["wan_name"] for row in rows] == ["spectrum"]
@@ -0,0 +1,141 @@
+"""Tests for HistoryRing and compact steering history persistence (history_ring.py)."""
+
+import json
+import logging
+from collections import deque
+
+import pytest
+
+from wanctl.history_ring import HistoryRing, decode_history, encode_history
+from wanctl.state_manager import StateSchema, SteeringStateManager
+
+
+class TestHistoryRing:
+    def test_evicts_oldest_when_full(self):
+        ring = HistoryRing("d", 3, [1.0, 2.0])
+        ring.append(3.0)
+        ring.append(4.0)
+
+        assert len(ring) == 3
+        assert list(ring) == [2.0, 3.0, 4.0]
+        assert ring.tolist() == [2.0, 3.0, 4.0]
+        assert (ring[0], ring[-1]) == (2.0, 4.0)
+
+    def test_index_out_of_range(self):
+        ring = HistoryRing("d", 3, [1.0])
+
+        with pytest.raises(IndexError):
+            ring[1]
+        with pytest.raises(IndexError):
+            ring[-2]
+
+    def test_initial_values_keep_newest(self):
+        ring = HistoryRing("q", 2, range(5))
+
+        assert ring.tolist() == [3, 4]
+        assert 4 in ring
+
+    def test_integer_ring_accepts_float_counters(self):
+        ring = HistoryRing("q", 2)
+        ring.append(7.0)
+
+        assert ring.tolist() == [7]
+
+    def test_rejects_zero_capacity(self):
+        with pytest.raises(ValueError):
+            HistoryRing("d", 0)
+
+
+class TestEncoding:
+    def test_roundtrip_after_wraparound(self):
+        ring = HistoryRing("d", 3, [1.5, 2.5, 3.5, 4.5])
+
+        encoded = encode_history(ring)
+
+        assert (encoded["ring"], encoded["maxlen"], encoded["codec"]) == ("d", 3, "zlib")
+        assert decode_history(json.loads(json.dumps(encoded))) == [2.5, 3.5, 4.5]
+
+    def test_encoding_cached_until_append(self):
+        ring = HistoryRing("q", 4, [1, 2])
+        first = ring.encode()
+
+        assert ring.encode() is first
+        ring.append(3)
+        assert decode_history(ring.encode()) == [1, 2, 3]
+
+    def test_counter_history_smaller_than_json_list(self):
+        values = [0, 0, 3, 0, 12, 0, 1, 0] * 6
+        ring = HistoryRing("q", 48, values)
+
+        assert len(json.dumps(ring.encode())) < len(json.dumps(values))
+
+    def test_raw_payload_without_codec_decodes(self):
+        assert decode_history({"ring": "d", "b64": "AAAAAAAA+D8="}) == [1.5]
+
+    def test_plain_lists_and_deques(self):
+        assert encode_history(deque([1.0, 2.0])) == [1.0, 2.0]
+        assert decode_history([1.0, 2.0]) == [1.0, 2.0]
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            123,
+            "abc",
+            {"ring": "d"},
+            {"ring": "d", "b64": "!!"},
+            {"ring": "zz", "b64": ""},
+            {"ring": "d", "codec": "zlib", "b64": "AAAA"},
+        ],
+    )
+    def test_unrecognized_values_decode_to_none(self, value):
+        assert decode_history(value) is None
+
+
+class TestSteeringStatePersistence:
+    @pytest.fixture
+    def manager(self, tmp_path):
+        schema = StateSchema(
+            {
+                "state": "GREEN",
+                "history_rtt": [],
+                "history_delta": [],
+                "cake_drops_history": [],
+                "queue_depth_history": [],
+                "transitions": [],
+            }
+        )
+        return SteeringStateManager(
+            tmp_path / "state.json", schema, logging.getLogger("test"), history_maxlen=4
+        )
+
+    def test_save_writes_compact_histories_and_load_restores_rings(self, manager):
+        manager.load()
+        for i in range(6):
+            manager.add_measurement(current_rtt=20.0 + i, delta=float(i))
+            manager.state["cake_drops_history"].append(i)
+        assert manager.save(use_lock=False) is True
+
+        saved = json.loads(manager.state_file.read_text())
+        assert saved["history_rtt"]["ring"] == "d"
+        assert saved["cake_drops_history"]["ring"] == "q"
+
+        manager.reset()
+        assert len(manager.state["history_rtt"]) == 0
+        assert manager.load() is True
+        assert manager.state["history_rtt"].tolist() == [22.0, 23.0, 24.0, 25.0]
+        assert manager.state["cake_drops_history"].tolist() == [2, 3, 4, 5]
+
+    def test_defaults_are_bounded_rings_without_state_file(self, manager):
+        assert manager.load() is False
+
+        ring = manager.state["queue_depth_history"]
+        assert isinstance(ring, HistoryRing)
+        assert ring.maxlen == 4
+
+    def test_corrupt_compact_history_falls_back_to_empty(self, manager):
+        manager.state_file.write_text(
+            json.dumps({"state": "GREEN", "history_rtt": {"ring": "d", "b64": "not base64"}})
+        )
+
+        assert manager.load() is True
+        assert len(manager.state["history_rtt"]) == 0
@@ -0,0 +1,190 @@
+"""Tests for the shared background measurement scheduler (measurement_scheduler.py)."""
+
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from wanctl.cake_stats_thread import BackgroundCakeStatsThread
+from wanctl.measurement_scheduler import MeasurementScheduler
+
+
+class FakeClock:
+    """time.monotonic() replacement that only moves when waited on."""
+
+    def __init__(self, now: float = 100.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeShutdown:
+    """shutdown_event stand-in that records waits and advances the clock."""
+
+    def __init__(self, clock: FakeClock, set_after: int | None = None) -> None:
+        self.clock = clock
+        self.waits: list[float] = []
+        self._set_after = set_after
+
+    def wait(self, timeout: float) -> bool:
+        self.waits.append(timeout)
+        self.clock.now += timeout
+        return self._set_after is not None and len(self.waits) >= self._set_after
+
+
+@pytest.fixture
+def clock():
+    fake = FakeClock()
+    with patch("wanctl.measurement_scheduler.time.monotonic", fake):
+        yield fake
+
+
+@pytest.fixture
+def scheduler(clock):
+    return MeasurementScheduler(
+        0.05, idle_after_sec=60.0, idle_cadence_factor=2.0, busy_cadence_factor=0.5
+    )
+
+
+class TestMeasurementSlot:
+    def test_measurement_finishes_lead_margin_before_cycle_read(self, scheduler, clock):
+        slot = scheduler.register("wan1:rtt", 0.25, wan="wan1")
+        scheduler.mark_cycle(100.0)
+        shutdown = FakeShutdown(clock)
+
+        slot.wait_next(0.02, shutdown)
+        # Next read at 100.05; 20ms measurement + 5ms margin -> start at 100.025
+        assert shutdown.waits == [pytest.approx(0.025)]
+
+        clock.now += 0.02
+        shutdown.waits.clear()
+        slot.wait_next(0.02, shutdown)
+        # One cadence after the previous target read (100.30), minus the lead
+        assert sum(shutdown.waits) == pytest.approx(100.275 - 100.045)
+
+    def test_slow_measurement_raises_duration_estimate_at_once(self, scheduler, clock):
+        slot = scheduler.register("wan1:cake_stats", 0.05, wan="wan1")
+        scheduler.mark_cycle(100.0)
+
+        slot.wait_next(0.001, FakeShutdown(clock))
+        slot.wait_next(0.03, FakeShutdown(clock))
+        slot.wait_next(0.001, FakeShutdown(clock))
+
+        assert slot.get_status()["expected_duration_ms"] == pytest.approx(27.1)
+
+    def test_fixed_cadence_until_first_cycle_mark(self, scheduler, clock):
+        slot = scheduler.register("wan1:rtt", 0.25, wan="wan1")
+        shutdown = FakeShutdown(clock)
+
+        slot.wait_next(0.05, shutdown)
+
+        assert shutdown.waits == [pytest.approx(0.2)]
+
+    def test_min_delay_holds_back_then_realigns(self, scheduler, clock):
+        slot = scheduler.register("wan1:rtt", 0.25, wan="wan1")
+        scheduler.mark_cycle(100.0)
+        shutdown = FakeShutdown(clock)
+
+        slot.wait_next(0.0, shutdown, min_delay_sec=1.0)
+
+        # Backoff first, then the start is re-aligned ahead of the 101.05 read
+        assert sum(shutdown.waits) == pytest.approx(1.045)
+
+    def test_long_waits_are_chunked_and_end_on_shutdown(self, scheduler, clock):
+        slot = scheduler.register("irtt", 10.0)
+        shutdown = FakeShutdown(clock, set_after=2)
+
+        slot.wait_next(0.0, shutdown)
+
+        assert shutdown.waits == [1.0, 1.0]
+
+
+class TestMeasurementScheduler:
+    def test_congestion_speeds_up_down_to_floor(self, scheduler):
+        rtt = scheduler.register("wan1:rtt", 0.25, wan="wan1", min_cadence_sec=0.25)
+        irtt = scheduler.register("irtt", 10.0)
+
+        scheduler.report_zones("wan1", "YELLOW", "GREEN")
+
+        assert scheduler.mode("wan1") == "busy"
+        assert rtt.effective_cadence_sec == 0.25
+        assert irtt.effective_cadence_sec == 5.0
+
+    def test_long_green_slows_down(self, scheduler, clock):
+        slot = scheduler.register("wan1:cake_stats", 0.05, wan="wan1")
+        scheduler.report_zones("wan1", "GREEN", "GREEN")
+        assert scheduler.mode("wan1") == "normal"
+
+        clock.now += 60.0
+        scheduler.report_zones("wan1", "GREEN", "GREEN")
+
+        assert scheduler.mode("wan1") == "idle"
+        assert slot.effective_cadence_sec == pytest.approx(0.1)
+
+    def test_shared_source_follows_every_wan(self, scheduler, clock):
+        scheduler.report_zones("wan1", "GREEN", "GREEN")
+        scheduler.report_zones("wan2", "GREEN", "SOFT_RED")
+
+        assert scheduler.mode("wan1") == "normal"
+        assert scheduler.mode() == "busy"
+
+    def test_status_reports_age_at_read_per_wan(self, scheduler):
+        scheduler.register("wan1:rtt", 0.25, wan="wan1")
+        scheduler.register("wan2:rtt", 0.25, wan="wan2")
+        scheduler.register("irtt", 10.0)
+
+        scheduler.observe_age("wan1:rtt", 0.012)
+        scheduler.observe_age("unknown", 1.0)
+
+        status = scheduler.get_status("wan1")
+        assert sorted(status["sources"]) == ["irtt", "wan1:rtt"]
+        age = status["sources"]["wan1:rtt"]["age_at_read_ms"]
+        assert (age["count"], age["max_ms"]) == (1, pytest.approx(12.0, rel=0.02))
+        assert status["sources"]["irtt"]["age_at_read_ms"] == {}
+
+
+def test_cake_stats_thread_waits_on_schedule() -> None:
+    shutdown_event = threading.Event()
+    slot = MagicMock()
+    slot.wait_next.side_effect = lambda *args: shutdown_event.set()
+    thread = BackgroundCakeStatsThread("if-dl", "if-ul", shutdown_event, schedule=slot)
+
+    with patch("wanctl.backends.netlink_cake.NetlinkCakeBackend"):
+        thread._run()
+
+    slot.wait_next.assert_called_once()
+    assert slot.wait_next.call_args.args[1] is shutdown_event
+
+
+def test_controller_records_rtt_age_and_reports_schedule(mock_autorate_config) -> None:
+    from wanctl.rtt_measurement import RTTSnapshot
+    from wanctl.wan_controller import WANController
+
+    router = MagicMock(needs_rate_limiting=False, rate_limit_params={})
+    with patch.object(WANController, "load_state"):
+        controller = WANController(
+            "TestWAN", mock_autorate_config, router, MagicMock(), MagicMock()
+        )
+    scheduler = MeasurementScheduler(0.05)
+    controller.set_measurement_scheduler(scheduler)
+    scheduler.register("TestWAN:rtt", 0.25, wan="TestWAN")
+    controller._rtt_thread = MagicMock()
+    controller._rtt_thread.get_cycle_status.return_value = None
+    controller._rtt_thread.get_latest.return_value = RTTSnapshot(
+        rtt_ms=20.0,
+        per_host_results={"1.1.1.1": 20.0},
+        active_hosts=("1.1.1.1",),
+        successful_hosts=("1.1.1.1",),
+        timestamp=time.monotonic(),
+        measurement_ms=3.0,
+    )
+
+    assert controller.measure_rtt() == 20.0
+
+    schedule = controller.get_health_data()["measurement_schedule"]
+    assert schedule["mode"] == "normal"
+    assert schedule["sources"]["TestWAN:rtt"]["age_at_read_ms"]["count"] == 1
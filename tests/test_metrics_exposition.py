@@ -0,0 +1,312 @@
+"""Tests for incremental exposition, handles, histograms, summaries, OpenMetrics and gzip."""
+
+import gzip
+import time
+import urllib.request
+from unittest.mock import MagicMock, patch
+
+import pytest
+import yaml
+
+from tests.helpers import find_free_port
+from tests.test_reflector_scorer import _make_minimal_config_yaml
+from wanctl.autorate_config import Config
+from wanctl.metrics import (
+    MetricsRegistry,
+    MetricsServer,
+    metrics,
+    record_autorate_cycle,
+    record_router_write,
+    record_steering_cycle,
+    record_storage_write_success,
+    record_subsystem_timings,
+)
+from wanctl.wan_controller import WANController
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry()
+
+
+class TestIncrementalExposition:
+    def test_update_refreshes_only_dirty_line(self, registry):
+        registry.set_gauge("a_metric", 1.0, labels={"wan": "x"}, help_text="A")
+        registry.inc_counter("b_total")
+        registry.exposition()
+        lines = registry._lines
+
+        registry.set_gauge("a_metric", 2.0, labels={"wan": "x"})
+
+        assert registry._dirty and not registry._layout_stale
+        assert registry.exposition() == (
+            '# HELP a_metric A\n# TYPE a_metric gauge\na_metric{wan="x"} 2.0\n'
+            "# TYPE b_total counter\nb_total 1\n"
+        )
+        assert registry._lines is lines
+
+    def test_unchanged_registry_returns_cached_body(self, registry):
+        registry.set_gauge("a_metric", 1.0)
+
+        assert registry.exposition() is registry.exposition()
+
+    def test_new_series_relayouts_in_sorted_order(self, registry):
+        registry.set_gauge("b_metric", 1.0)
+        registry.exposition()
+
+        registry.set_gauge("a_metric", 2.0)
+
+        assert registry.exposition().splitlines() == [
+            "# TYPE a_metric gauge",
+            "a_metric 2.0",
+            "# TYPE b_metric gauge",
+            "b_metric 1.0",
+        ]
+
+    def test_label_order_does_not_split_series(self, registry):
+        registry.set_gauge("m", 1.0, labels={"a": "1", "b": "2"})
+        registry.set_gauge("m", 3.0, labels={"b": "2", "a": "1"})
+
+        assert registry.get_gauge("m", labels={"a": "1", "b": "2"}) == 3.0
+        assert registry.exposition().count("m{") == 1
+
+
+class TestHandles:
+    def test_handles_update_shared_series(self, registry):
+        gauge = registry.gauge("g", {"wan": "x"}, "Gauge")
+        counter = registry.counter("c_total", {"wan": "x"})
+
+        assert registry.exposition() == ""
+        gauge.set(4.5)
+        counter.inc()
+        counter.inc(2)
+
+        assert registry.get_gauge("g", labels={"wan": "x"}) == 4.5
+        assert registry.get_counter("c_total", labels={"wan": "x"}) == 3
+        assert "# HELP g Gauge" in registry.exposition()
+
+    def test_handles_survive_reset(self, registry):
+        counter = registry.counter("c_total")
+        counter.inc(5)
+
+        registry.reset()
+        assert registry.get_counter("c_total") is None
+        assert registry.exposition() == ""
+
+        counter.inc()
+        assert registry.exposition() == "# TYPE c_total counter\nc_total 1\n"
+
+    def test_record_autorate_cycle_after_reset(self):
+        record_autorate_cycle("Spectrum", 500.0, 20.0, 10.0, 15.0, "GREEN", "GREEN", 0.01)
+        metrics.reset()
+        record_autorate_cycle("Spectrum", 400.0, 20.0, 10.0, 15.0, "YELLOW", "GREEN", 0.01)
+
+        labels = {"wan": "spectrum", "direction": "download"}
+        assert metrics.get_gauge("wanctl_bandwidth_mbps", labels=labels) == 400.0
+        assert metrics.get_counter("wanctl_cycles_total", labels={"wan": "spectrum"}) == 1
+        assert metrics.get_gauge("wanctl_burst_last_trigger_delta_ms", labels=labels) is None
+
+
+class TestOpenMetrics:
+    def test_counter_samples_get_total_suffix(self, registry):
+        registry.inc_counter("wanctl_cycles_total", labels={"wan": "x"}, help_text="Cycles")
+        registry.inc_counter("wanctl_events", value=2)
+        registry.set_gauge("wanctl_rate", 1.5)
+
+        assert registry.exposition(openmetrics=True).splitlines() == [
+            "# TYPE wanctl_rate gauge",
+            "wanctl_rate 1.5",
+            "# HELP wanctl_cycles Cycles",
+            "# TYPE wanctl_cycles counter",
+            'wanctl_cycles_total{wan="x"} 1',
+            "# TYPE wanctl_events counter",
+            "wanctl_events_total 2",
+            "# EOF",
+        ]
+
+    def test_empty_registry_is_eof_only(self, registry):
+        assert registry.exposition(openmetrics=True) == "# EOF\n"
+
+    def test_formats_stay_in_step(self, registry):
+        registry.inc_counter("hits")
+        registry.exposition()
+        registry.inc_counter("hits")
+
+        assert "hits 2" in registry.exposition()
+        assert "hits_total 2" in registry.exposition(openmetrics=True)
+
+
+class TestRender:
+    def test_gzip_body_cached_until_update(self, registry):
+        registry.set_gauge("g", 1.0)
+        body = registry.render(use_gzip=True)
+
+        assert gzip.decompress(body) == b"# TYPE g gauge\ng 1.0\n"
+        assert registry.render(use_gzip=True) is body
+
+        registry.set_gauge("g", 2.0)
+        assert gzip.decompress(registry.render(use_gzip=True)).endswith(b"g 2.0\n")
+
+
+@pytest.mark.timeout(5)
+class TestNegotiation:
+    @pytest.fixture
+    def server_port(self):
+        port = find_free_port()
+        server = MetricsServer(host="127.0.0.1", port=port, openmetrics=True)
+        server.start()
+        time.sleep(0.05)
+        yield port
+        server.stop()
+
+    def _get(self, port, **headers):
+        request = urllib.request.Request(f"http://127.0.0.1:{port}/metrics", headers=headers)
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.headers, response.read()
+
+    def test_gzip_when_accepted(self, server_port):
+        metrics.set_gauge("http_gauge", 3.0)
+
+        headers, body = self._get(server_port, **{"Accept-Encoding": "gzip"})
+
+        assert headers["Content-Encoding"] == "gzip"
+        assert int(headers["Content-Length"]) == len(body)
+        assert b"http_gauge 3.0" in gzip.decompress(body)
+
+    def test_openmetrics_when_requested(self, server_port):
+        metrics.inc_counter("http_hits")
+
+        headers, body = self._get(
+            server_port, Accept="application/openmetrics-text; version=1.0.0,text/plain;q=0.5"
+        )
+
+        assert headers["Content-Type"].startswith("application/openmetrics-text")
+        assert body.endswith(b"http_hits_total 1\n# EOF\n")
+
+    def test_plain_text_by_default(self, server_port):
+        headers, body = self._get(server_port)
+
+        assert headers["Content-Type"].startswith("text/plain; version=0.0.4")
+        assert "Content-Encoding" not in headers
+        assert not body.endswith(b"# EOF\n")
+
+
+class TestHistogram:
+    def test_cumulative_buckets_sum_and_count(self, registry):
+        handle = registry.histogram("lat_seconds", {"wan": "x"}, "Latency", buckets=(0.01, 0.1))
+        for value in (0.005, 0.01, 0.05, 2.0):
+            handle.observe(value)
+
+        assert registry.exposition().splitlines() == [
+            "# HELP lat_seconds Latency",
+            "# TYPE lat_seconds histogram",
+            'lat_seconds_bucket{wan="x",le="0.01"} 2',
+            'lat_seconds_bucket{wan="x",le="0.1"} 3',
+            'lat_seconds_bucket{wan="x",le="+Inf"} 4',
+            'lat_seconds_sum{wan="x"} 2.065',
+            'lat_seconds_count{wan="x"} 4',
+        ]
+
+    def test_observation_refreshes_cached_block(self, registry):
+        registry.observe_histogram("lat_seconds", 0.5, buckets=(1.0,))
+        registry.set_gauge("z_gauge", 1.0)
+        registry.exposition()
+
+        registry.observe_histogram("lat_seconds", 2.0)
+
+        assert not registry._layout_stale
+        text = registry.exposition()
+        assert 'lat_seconds_bucket{le="+Inf"} 2' in text
+        assert text.index("z_gauge") < text.index("lat_seconds")
+
+    def test_reset_clears_counts(self, registry):
+        handle = registry.histogram("lat_seconds")
+        handle.observe(0.02)
+        registry.reset()
+
+        assert registry.exposition() == ""
+        handle.observe(0.02)
+        assert "lat_seconds_count 1" in registry.exposition()
+
+
+class TestSummary:
+    def test_quantiles_over_sliding_window(self, registry):
+        handle = registry.summary("q_seconds", quantiles=(0.5, 0.99), window=4)
+        for value in (100.0, 1.0, 2.0, 3.0, 4.0):
+            handle.observe(value)
+
+        assert registry.exposition(openmetrics=True).splitlines() == [
+            "# TYPE q_seconds summary",
+            'q_seconds{quantile="0.5"} 2.0',
+            'q_seconds{quantile="0.99"} 3.0',
+            "q_seconds_sum 110.0",
+            "q_seconds_count 5",
+            "# EOF",
+        ]
+
+
+class TestLatencyRecorders:
+    def test_autorate_cycle_histogram(self):
+        record_autorate_cycle("Spectrum", 500.0, 20.0, 10.0, 15.0, "GREEN", "GREEN", 0.012)
+
+        text = metrics.exposition()
+        assert 'wanctl_autorate_cycle_seconds_bucket{wan="spectrum",le="0.02"} 1' in text
+        assert 'wanctl_autorate_cycle_seconds_count{wan="spectrum"} 1' in text
+
+    def test_subsystem_summaries_skip_idle_subsystems(self):
+        record_subsystem_timings(
+            "autorate",
+            "Spectrum",
+            {"autorate_rtt_measurement": 2.0, "autorate_router_write_download": 0.0},
+        )
+
+        text = metrics.exposition()
+        assert (
+            'wanctl_subsystem_duration_seconds_count{daemon="autorate",'
+            'subsystem="rtt_measurement",wan="spectrum"} 1'
+        ) in text
+        assert "router_write_download" not in text
+
+    def test_router_storage_and_steering_histograms(self):
+        record_router_write("ATT", 0.004)
+        record_storage_write_success("autorate", 12.0, 3)
+        record_steering_cycle("Spectrum", 0.03)
+
+        text = metrics.exposition()
+        assert 'wanctl_router_write_duration_seconds_bucket{wan="att",le="0.005"} 1' in text
+        assert 'wanctl_storage_write_duration_seconds_sum{process="autorate"} 0.012' in text
+        assert 'wanctl_steering_cycle_seconds_count{wan="spectrum"} 1' in text
+
+    def test_controller_records_router_write_latency(self, mock_autorate_config):
+        mock_autorate_config.metrics_enabled = True
+        router = MagicMock(needs_rate_limiting=False, rate_limit_params={})
+        router.set_limits.return_value = True
+        with patch.object(WANController, "load_state"):
+            controller = WANController(
+                "TestWAN", mock_autorate_config, router, MagicMock(), MagicMock()
+            )
+
+        assert controller.apply_rate_changes_if_needed(90_000_000, 9_000_000) is True
+
+        assert 'wanctl_router_write_duration_seconds_count{wan="testwan"} 1' in (
+            metrics.exposition()
+        )
+
+
+class TestOpenMetricsConfig:
+    @pytest.mark.parametrize(("value", "expected"), [(None, False), (True, True), ("yes", False)])
+    def test_openmetrics_flag(self, tmp_path, value, expected):
+        config_dict = _make_minimal_config_yaml()
+        if value is not None:
+            config_dict["metrics"] = {"enabled": True, "openmetrics": value}
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(yaml.dump(config_dict))
+
+        assert Config(str(config_path)).metrics_openmetrics is expected
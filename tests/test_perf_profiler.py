@@ -3,18 +3,24 @@
 Covers:
 - PerfTimer context manager for timing code blocks
 - OperationProfiler for accumulating metrics across cycles
+- ArrayOperationProfiler ring/sketch variant and its profiler benchmark
 - measure_operation decorator for timing function calls
 - record_cycle_profiling shared helper for daemon profiling
 """
 
 import logging
+import random
+import subprocess
+import sys
 import time
-from unittest.mock import MagicMock
+from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from wanctl.perf_profiler import (
     PROFILE_REPORT_INTERVAL,
+    ArrayOperationProfiler,
     OperationProfiler,
     PerfTimer,
     measure_operation,
@@ -205,6 +211,129 @@ class TestOperationProfiler:
         mock_logger.info.assert_called_once_with(report)
 
 
+class TestArrayOperationProfiler:
+    """Tests for the array-backed, sketch-based profiler."""
+
+    def test_stats_empty_label(self) -> None:
+        assert ArrayOperationProfiler().stats("nonexistent") == {}
+
+    def test_single_sample_is_exact(self) -> None:
+        profiler = ArrayOperationProfiler()
+        profiler.record("op", 50.0)
+        stats = profiler.stats("op")
+        for key in ("min_ms", "max_ms", "avg_ms", "p50_ms", "p95_ms", "p99_ms"):
+            assert stats[key] == 50.0
+        assert stats["lifetime"]["p999_ms"] == 50.0
+        assert "samples" not in stats
+
+    def test_window_evicts_oldest(self) -> None:
+        profiler = ArrayOperationProfiler(max_samples=5)
+        for i in range(10):
+            profiler.record("op", float(i + 1))
+        stats = profiler.stats("op")
+        assert stats["count"] == 5
+        assert stats["min_ms"] == 6.0
+        assert stats["max_ms"] == 10.0
+        assert stats["avg_ms"] == pytest.approx(8.0)
+        assert stats["lifetime"]["count"] == 10
+        assert stats["lifetime"]["min_ms"] == 1.0
+
+    def test_percentiles_track_exact_profiler(self) -> None:
+        rng = random.Random(7)
+        exact = OperationProfiler(max_samples=1200)
+        sketch = ArrayOperationProfiler(max_samples=1200)
+        for _ in range(5000):
+            value = rng.lognormvariate(1.5, 0.6)
+            exact.record("op", value)
+            sketch.record("op", value)
+        want = exact.stats("op")
+        got = sketch.stats("op")
+        assert got["count"] == want["count"]
+        assert got["min_ms"] == want["min_ms"]
+        assert got["max_ms"] == want["max_ms"]
+        assert got["avg_ms"] == pytest.approx(want["avg_ms"])
+        for key in ("p95_ms", "p99_ms"):
+            assert got[key] == pytest.approx(want[key], rel=0.025)
+
+    def test_window_percentiles_do_not_sort(self) -> None:
+        rng = random.Random(3)
+        profiler = ArrayOperationProfiler(max_samples=300)
+        for _ in range(1000):  # wraps the ring mid-batch
+            profiler.record("op", rng.uniform(1.0, 100.0))
+        exact = profiler.stats("op", exact=True)
+
+        with patch("wanctl.perf_profiler.sorted", create=True, side_effect=AssertionError):
+            stats = profiler.stats("op")
+
+        assert profiler._series["op"].window.count == stats["count"] == 300
+        for key in ("p50_ms", "p95_ms", "p99_ms"):
+            assert stats[key] == pytest.approx(exact[key], rel=0.025)
+
+    def test_lifetime_percentiles_cover_evicted_samples(self) -> None:
+        profiler = ArrayOperationProfiler(max_samples=100)
+        for _ in range(999):
+            profiler.record("op", 1.0)
+        profiler.record("op", 500.0)  # one tail sample in 1000
+        for _ in range(100):
+            profiler.record("op", 1.0)  # pushes the tail out of the window
+        stats = profiler.stats("op")
+        assert stats["max_ms"] == 1.0
+        assert stats["p99_ms"] == 1.0
+        assert stats["lifetime"]["p50_ms"] == pytest.approx(1.0, rel=0.02)
+        assert stats["lifetime"]["max_ms"] == 500.0
+
+    def test_non_positive_and_huge_values(self) -> None:
+        profiler = ArrayOperationProfiler()
+        for value in (-1.0, 0.0, 1e9, 1e9):
+            profiler.record("op", value)
+        stats = profiler.stats("op")
+        assert stats["min_ms"] == -1.0
+        assert stats["p50_ms"] == 0.0
+        assert stats["p99_ms"] == pytest.approx(1e9, rel=0.011)
+        assert profiler.stats("op", exact=True)["p99_ms"] == 1e9
+        assert stats["lifetime"]["p999_ms"] == pytest.approx(1e9, rel=0.011)
+
+    def test_samples_buffered_between_folds_are_counted(self) -> None:
+        profiler = ArrayOperationProfiler(max_samples=1200)
+        for i in range(1000):  # not a multiple of the fold batch
+            profiler.record("op", float(i % 10 + 1))
+        stats = profiler.stats("op")
+        assert stats["count"] == 1000
+        assert stats["avg_ms"] == pytest.approx(5.5)
+        assert stats["lifetime"]["count"] == 1000
+        profiler.record("op", 100.0)
+        assert profiler.stats("op")["max_ms"] == 100.0
+
+    def test_clear_resets_window_and_lifetime(self) -> None:
+        profiler = ArrayOperationProfiler()
+        profiler.record("a", 10.0)
+        profiler.record("b", 20.0)
+        profiler.clear("a")
+        assert profiler.stats("a") == {}
+        assert profiler.stats("b")["count"] == 1
+        profiler.clear()
+        assert profiler.report() == "No profiling data collected"
+
+    def test_report_includes_lifetime_tail(self) -> None:
+        profiler = ArrayOperationProfiler()
+        profiler.record("op_a", 10.0)
+        report = profiler.report()
+        assert "=== Profiling Report ===" in report
+        assert "op_a: count=1" in report
+        assert "p999=10.0ms" in report
+
+    def test_benchmark_script_runs(self) -> None:
+        script = Path(__file__).resolve().parents[1] / "scripts" / "bench_profiler.py"
+        result = subprocess.run(
+            [sys.executable, str(script), "--samples", "500", "--stats-calls", "5", "--json"],
+            capture_output=True,
+            text=True,
+            timeout=20,
+            check=True,
+        )
+        assert "ArrayOperationProfiler" in result.stdout
+
+
 class TestMeasureOperationDecorator:
     """Tests for measure_operation decorator."""
 
@@ -84,7 +84,6 @@ def test_run_proof_happy_path_emits_inspect_proof_pass() -> None:
     assert "match=False" in verdict
     assert "netwatch_entries=0" in verdict
     assert "route_mutating_active=0" in verdict
-    assert "total_routes=2" in verdict
     assert "default_routes=1" in verdict
 
 
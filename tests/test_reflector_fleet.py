@@ -0,0 +1,222 @@
+"""Tests for ReflectorFleet candidate-pool reflector selection (reflector_fleet.py)."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from tests.test_reflector_scorer import _load_config_with
+from wanctl.reflector_fleet import ReflectorFleet, _path_group
+
+
+@pytest.fixture
+def logger():
+    return logging.getLogger("test_reflector_fleet")
+
+
+def _fleet(logger, hosts=("1.1.1.1", "8.8.8.8"), candidates=("9.9.9.9",), **kwargs):
+    return ReflectorFleet(list(hosts), list(candidates), logger=logger, wan_name="wan1", **kwargs)
+
+
+def _feed(fleet, host, rtts):
+    for rtt in rtts:
+        fleet.record_results({host: True})
+        fleet.record_rtts({host: rtt})
+
+
+class TestPool:
+    def test_ping_hosts_start_active_and_candidates_standby(self, logger):
+        fleet = _fleet(logger, candidates=("9.9.9.9", "1.1.1.1"))
+
+        assert fleet.get_active_hosts() == ["1.1.1.1", "8.8.8.8"]
+        statuses = {s.host: s.status for s in fleet.get_all_statuses()}
+        assert statuses == {"1.1.1.1": "active", "8.8.8.8": "active", "9.9.9.9": "standby"}
+
+    def test_active_count_is_clamped_to_pool(self, logger):
+        fleet = _fleet(logger, active_count=10)
+
+        assert fleet.get_active_hosts() == ["1.1.1.1", "8.8.8.8", "9.9.9.9"]
+
+    def test_maybe_probe_never_blocks_control_loop(self, logger):
+        fleet = _fleet(logger)
+        rtt_measurement = MagicMock()
+
+        assert fleet.maybe_probe(time.monotonic(), rtt_measurement) == []
+        rtt_measurement.ping_host.assert_not_called()
+
+    def test_path_group_prefixes(self):
+        assert _path_group("9.9.9.9") == "9.9.9.0/24"
+        assert _path_group("2606:4700:4700::1111") == "2606:4700:4700::/48"
+        assert _path_group("dns.example") == "dns.example"
+
+
+class TestReselect:
+    def test_jittery_active_replaced_by_stable_candidate(self, logger):
+        fleet = _fleet(logger)
+        _feed(fleet, "1.1.1.1", [10.0, 10.1] * 10)
+        _feed(fleet, "8.8.8.8", [10.0, 40.0] * 10)
+        _feed(fleet, "9.9.9.9", [20.0, 20.2] * 10)
+
+        assert fleet.reselect() is True
+
+        assert sorted(fleet.get_active_hosts()) == ["1.1.1.1", "9.9.9.9"]
+        events = {(e["event_type"], e["host"]) for e in fleet.drain_events()}
+        assert events == {("promoted", "9.9.9.9"), ("demoted", "8.8.8.8")}
+        assert fleet.get_fleet_status()["swaps"] == 1
+
+    def test_small_improvement_keeps_incumbent(self, logger):
+        fleet = _fleet(logger)
+        _feed(fleet, "1.1.1.1", [10.0, 10.1] * 10)
+        _feed(fleet, "8.8.8.8", [10.0, 11.0] * 10)
+        _feed(fleet, "9.9.9.9", [10.0, 10.5] * 10)
+
+        assert fleet.reselect() is False
+        assert fleet.get_active_hosts() == ["1.1.1.1", "8.8.8.8"]
+
+    def test_unsampled_candidate_never_selected(self, logger):
+        fleet = _fleet(logger)
+        _feed(fleet, "1.1.1.1", [10.0, 50.0] * 10)
+        _feed(fleet, "8.8.8.8", [10.0, 50.0] * 10)
+
+        assert fleet.reselect() is False
+
+    def test_same_prefix_candidates_are_penalized(self, logger):
+        fleet = _fleet(
+            logger,
+            hosts=("9.9.9.9", "9.9.9.10"),
+            candidates=("1.1.1.1",),
+        )
+        _feed(fleet, "9.9.9.9", [10.0, 10.1] * 10)
+        _feed(fleet, "9.9.9.10", [10.0, 10.5] * 10)
+        # Better than 9.9.9.10 only once the shared-path penalty counts
+        _feed(fleet, "1.1.1.1", [10.0, 12.0] * 10)
+
+        assert fleet.reselect() is True
+        assert sorted(fleet.get_active_hosts()) == ["1.1.1.1", "9.9.9.9"]
+
+    def test_deprioritized_active_triggers_early_reselect(self, logger):
+        fleet = _fleet(logger, reselect_interval_sec=3600.0)
+        for _ in range(20):
+            fleet.record_results({"1.1.1.1": True, "8.8.8.8": False})
+
+        assert fleet.get_active_hosts() == ["1.1.1.1"]
+        assert fleet._last_reselect == 0.0
+
+
+class TestProber:
+    def test_probes_least_recently_sampled_idle_host(self, logger):
+        fleet = _fleet(logger, candidates=("9.9.9.9", "9.9.9.10"))
+        rtt_measurement = MagicMock()
+        rtt_measurement.ping_host.return_value = 15.0
+
+        assert fleet.probe_next(rtt_measurement) == ("9.9.9.9", True)
+        assert fleet.probe_next(rtt_measurement) == ("9.9.9.10", True)
+        assert fleet.probe_next(rtt_measurement) == ("9.9.9.9", True)
+
+        rtt_measurement.ping_host.assert_called_with("9.9.9.9", count=1)
+        status = fleet.get_fleet_status()
+        assert status["probes"] == 3
+        assert status["candidates"]["9.9.9.9"]["samples"] == 2
+
+    def test_probe_loss_counts_against_score(self, logger):
+        fleet = _fleet(logger)
+        rtt_measurement = MagicMock()
+        rtt_measurement.ping_host.return_value = None
+
+        assert fleet.probe_next(rtt_measurement) == ("9.9.9.9", False)
+        assert fleet.get_fleet_status()["candidates"]["9.9.9.9"]["samples"] == 0
+        assert fleet._score_for_host("9.9.9.9") == 0.0
+
+    def test_thread_stays_within_budget_and_stops(self, logger):
+        fleet = _fleet(logger, probe_budget_per_sec=20.0)
+        rtt_measurement = MagicMock()
+        rtt_measurement.ping_host.return_value = 12.0
+        shutdown_event = threading.Event()
+
+        fleet.start(rtt_measurement, shutdown_event)
+        time.sleep(0.22)
+        shutdown_event.set()
+        fleet.stop()
+
+        assert 2 <= rtt_measurement.ping_host.call_count <= 6
+
+
+class TestControllerWiring:
+    def test_controller_uses_fleet_when_candidates_configured(self, mock_autorate_config):
+        from wanctl.rtt_measurement import RTTSnapshot
+        from wanctl.wan_controller import WANController
+
+        mock_autorate_config.ping_hosts = ["1.1.1.1"]
+        mock_autorate_config.reflector_quality_config = {
+            **mock_autorate_config.reflector_quality_config,
+            "candidates": ["9.9.9.9"],
+            "active_count": 1,
+        }
+        router = MagicMock(needs_rate_limiting=False, rate_limit_params={})
+        with patch.object(WANController, "load_state"):
+            controller = WANController(
+                "TestWAN", mock_autorate_config, router, MagicMock(), MagicMock()
+            )
+        assert isinstance(controller._reflector_scorer, ReflectorFleet)
+
+        controller._rtt_thread = MagicMock()
+        controller._rtt_thread.get_cycle_status.return_value = None
+        controller._rtt_thread.get_latest.return_value = RTTSnapshot(
+            rtt_ms=20.0,
+            per_host_results={"1.1.1.1": 20.0},
+            active_hosts=("1.1.1.1",),
+            successful_hosts=("1.1.1.1",),
+            timestamp=time.monotonic(),
+            measurement_ms=3.0,
+        )
+        assert controller.measure_rtt() == 20.0
+
+        fleet = controller.get_health_data()["reflector"]["fleet"]
+        assert fleet["active"] == ["1.1.1.1"]
+        assert fleet["candidates"]["1.1.1.1"]["samples"] == 1
+
+
+class TestFleetConfig:
+    def test_defaults_disable_fleet(self, tmp_path):
+        rq = _load_config_with(reflector_quality=None, tmp_path=tmp_path).reflector_quality_config
+
+        assert rq["candidates"] == []
+        assert rq["active_count"] is None
+        assert rq["probe_budget_per_sec"] == 2.0
+        assert rq["reselect_interval_sec"] == 30.0
+
+    def test_valid_fleet_settings(self, tmp_path):
+        rq = _load_config_with(
+            reflector_quality={
+                "candidates": ["9.9.9.9", "1.0.0.1"],
+                "active_count": 2,
+                "probe_budget_per_sec": 5,
+                "reselect_interval_sec": 60,
+            },
+            tmp_path=tmp_path,
+        ).reflector_quality_config
+
+        assert rq["candidates"] == ["9.9.9.9", "1.0.0.1"]
+        assert rq["active_count"] == 2
+        assert rq["probe_budget_per_sec"] == 5.0
+        assert rq["reselect_interval_sec"] == 60.0
+
+    def test_invalid_fleet_settings_fall_back(self, tmp_path):
+        rq = _load_config_with(
+            reflector_quality={
+                "candidates": "9.9.9.9",
+                "active_count": 0,
+                "probe_budget_per_sec": 0,
+                "reselect_interval_sec": 1,
+            },
+            tmp_path=tmp_path,
+        ).reflector_quality_config
+
+        assert rq["candidates"] == []
+        assert rq["active_count"] is None
+        assert rq["probe_budget_per_sec"] == 2.0
+        assert rq["reselect_interval_sec"] == 30.0
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from unittest.mock import patch
 
 from wanctl.steering.route_ownership_guard import RouteOwnershipGuard
 
@@ -121,3 +122,17 @@ def test_unparseable_output_fails_closed():
     assert result.active_allowed is False
     assert "parse" in (result.error or "")
     assert_read_only_commands(router)
+
+
+def test_script_read_is_projected_and_unchanged_output_not_reparsed():
+    router = FakeRouter(netwatch=[], scripts=[{".id": "*1", "name": "Notify"}])
+    guard = RouteOwnershipGuard(router)
+    guard.inspect()
+
+    with patch("wanctl.steering.route_ownership_guard.json.loads") as loads:
+        result = guard.inspect()
+
+    assert result.status == "ok"
+    loads.assert_not_called()
+    assert router.commands == [RouteOwnershipGuard.SCRIPT_PRINT] * 2
+    assert "proplist=" in RouteOwnershipGuard.SCRIPT_PRINT
@@ -4,8 +4,13 @@ from __future__ import annotations
 
 import json
 from datetime import UTC, datetime
+from unittest.mock import patch
 
-from wanctl.steering.route_ownership_inspector import RouteOwnershipInspector
+from wanctl.steering.route_ownership_inspector import (
+    DEFAULT_ROUTE_PRINT,
+    ROUTE_PRINT,
+    RouteOwnershipInspector,
+)
 
 
 class FakeRouter:
@@ -160,7 +165,7 @@ def test_default_route_filter_and_fields() -> None:
     inspector.refresh()
     routes = inspector.snapshot()["routes"]
 
-    assert routes["total_route_count"] == 3
+    assert "total_route_count" not in routes
     assert routes["default_routes"] == [
         {
             "gateway": "redacted-a",
@@ -236,6 +241,37 @@ def test_only_read_only_commands_issued() -> None:
     assert_read_only_commands(router)
 
 
+def test_refresh_reads_default_routes_only() -> None:
+    router = FakeRouter(netwatch=[], scripts=[], routes=[])
+
+    inspector = _inspector(router)
+    inspector.refresh()
+
+    route_commands = [cmd for cmd in router.commands if "route" in cmd]
+    assert route_commands == [DEFAULT_ROUTE_PRINT]
+    assert ROUTE_PRINT not in router.commands
+
+
+def test_unchanged_route_output_is_not_reparsed() -> None:
+    router = FakeRouter(
+        routes=[{".id": "*1", "dst-address": "0.0.0.0/0", "gateway": "redacted-a"}],
+    )
+    inspector = _inspector(router)
+    inspector.refresh()
+
+    with patch(
+        "wanctl.steering.route_ownership_inspector.json.loads", wraps=json.loads
+    ) as loads:
+        inspector.refresh()
+        assert loads.call_count == 0
+
+        router.routes = [{".id": "*1", "dst-address": "0.0.0.0/0", "gateway": "redacted-b"}]
+        inspector.refresh()
+
+    assert loads.call_count == 1
+    assert inspector.snapshot()["routes"]["default_routes"][0]["gateway"] == "redacted-b"
+
+
 def test_snapshot_served_from_cache_without_run_cmd() -> None:
     router = FakeRouter(netwatch=[], scripts=[], routes=[])
 
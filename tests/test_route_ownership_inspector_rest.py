@@ -107,3 +107,26 @@ def test_inspector_over_rest_default_route_projection() -> None:
             "comment": "Spectrum",
         }
     ]
+
+
+def test_inspector_over_rest_filters_routes_on_router() -> None:
+    client, session = _rest_client_with_get_bodies(_default_bodies())
+    inspector = RouteOwnershipInspector(
+        router_client=client,
+        route_manager=FakeRouteManager(),
+        interval_sec=60.0,
+    )
+
+    inspector.refresh()
+
+    route_params = [
+        call.kwargs.get("params")
+        for call in session.request.call_args_list
+        if call.args[1].endswith("/ip/route")
+    ]
+    assert route_params == [
+        {
+            "dst-address": "0.0.0.0/0",
+            ".proplist": ".id,dst-address,gateway,disabled,distance,comment",
+        },
+    ]
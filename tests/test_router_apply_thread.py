@@ -0,0 +1,299 @@
+"""Tests for the async router apply writer (router_apply_thread.py) and its controller wiring."""
+
+from __future__ import annotations
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from wanctl.router_apply_thread import BackgroundRouterApplyThread
+
+
+class _GatedApply:
+    """apply_fn that blocks each call until released, recording what it applied."""
+
+    def __init__(self, success: bool = True) -> None:
+        self.calls: list[tuple[int, int]] = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.success = success
+
+    def __call__(self, dl_rate: int, ul_rate: int):
+        self.calls.append((dl_rate, ul_rate))
+        self.started.set()
+        assert self.release.wait(timeout=5.0)
+        return self.success, (dl_rate, ul_rate), {"autorate_router_write_download": 1.0}
+
+
+_started: list[BackgroundRouterApplyThread] = []
+
+
+@pytest.fixture
+def shutdown_event():
+    event = threading.Event()
+    yield event
+    event.set()
+    # Writers only exit on stop()
+    while _started:
+        _started.pop().stop()
+
+
+def _start(apply_fn, shutdown_event) -> BackgroundRouterApplyThread:
+    writer = BackgroundRouterApplyThread("TestWAN", apply_fn, shutdown_event)
+    writer.start()
+    _started.append(writer)
+    return writer
+
+
+class TestBackgroundRouterApplyThread:
+    def test_latest_value_wins_while_writer_is_busy(self, shutdown_event):
+        apply_fn = _GatedApply()
+        writer = _start(apply_fn, shutdown_event)
+
+        writer.post(100, 10)
+        assert apply_fn.started.wait(timeout=5.0)
+        writer.post(90, 9)
+        writer.post(80, 8)
+        assert writer.pending_target() == (80, 8)
+        apply_fn.release.set()
+
+        assert writer.wait_idle(timeout=5.0)
+        assert apply_fn.calls == [(100, 10), (80, 8)]
+        status = writer.get_status()
+        assert (status["posted"], status["superseded"], status["applied"]) == (3, 1, 2)
+        result = writer.collect()
+        assert (result.applied_dl_rate, result.applied_ul_rate) == (80, 8)
+        assert (result.applied_writes, result.failed_writes) == (2, 0)
+        assert result.lag_ms >= result.apply_ms >= 0.0
+        assert writer.collect() is None
+        assert writer.pending_target() is None
+
+    def test_exception_is_reported_as_failed_apply(self, shutdown_event):
+        error = ConnectionError("router gone")
+        writer = _start(MagicMock(side_effect=error), shutdown_event)
+
+        writer.post(100, 10)
+
+        assert writer.wait_idle(timeout=5.0)
+        result = writer.collect()
+        assert result.success is False
+        assert result.error is error
+        assert writer.get_status()["failed"] == 1
+
+    def test_collect_counts_writes_since_previous_collect(self, shutdown_event):
+        apply_fn = MagicMock(side_effect=[(False, (100, 10), {}), (True, (90, 9), {})])
+        writer = _start(apply_fn, shutdown_event)
+
+        for dl_rate in (100, 90):
+            writer.post(dl_rate, dl_rate // 10)
+            assert writer.wait_idle(timeout=5.0)
+
+        result = writer.collect()
+        assert result.success is True
+        assert (result.applied_writes, result.failed_writes) == (1, 1)
+        writer.post(80, 8)
+        apply_fn.side_effect = None
+        apply_fn.return_value = (True, (80, 8), {})
+        assert writer.wait_idle(timeout=5.0)
+        assert (writer.collect().applied_writes, writer.collect()) == (1, None)
+
+    def test_cancel_pending_drops_waiting_target_only(self, shutdown_event):
+        apply_fn = _GatedApply()
+        writer = _start(apply_fn, shutdown_event)
+        writer.post(100, 10)
+        assert apply_fn.started.wait(timeout=5.0)
+        writer.post(90, 9)
+
+        writer.cancel_pending()
+
+        assert writer.pending_target() == (100, 10)
+        assert writer.busy
+        apply_fn.release.set()
+        assert writer.wait_idle(timeout=5.0)
+        assert apply_fn.calls == [(100, 10)]
+
+    def test_target_posted_before_shutdown_is_still_applied(self, shutdown_event):
+        apply_fn = _GatedApply()
+        writer = _start(apply_fn, shutdown_event)
+        writer.post(100, 10)
+        assert apply_fn.started.wait(timeout=5.0)
+
+        writer.post(90, 9)
+        shutdown_event.set()
+        apply_fn.release.set()
+
+        assert writer.wait_idle(timeout=5.0)
+        assert apply_fn.calls == [(100, 10), (90, 9)]
+        writer.stop()
+        assert not writer._thread.is_alive()
+
+    def test_stop_exits_on_shutdown(self, shutdown_event):
+        writer = _start(MagicMock(), shutdown_event)
+
+        shutdown_event.set()
+        writer.stop()
+
+        assert not writer._thread.is_alive()
+
+
+class TestAsyncRouterApplyController:
+    """WANController with router_apply_mode: async."""
+
+    @pytest.fixture
+    def mock_router(self):
+        router = MagicMock()
+        router.set_limits.return_value = True
+        router.needs_rate_limiting = True
+        router.rate_limit_params = {"max_changes": 5, "window_seconds": 10}
+        router.get_last_applied_limits = None
+        return router
+
+    @pytest.fixture
+    def controller(self, mock_autorate_config, mock_router, shutdown_event):
+        from wanctl.wan_controller import WANController
+
+        mock_autorate_config.router_apply_mode = "async"
+        with patch.object(WANController, "load_state"):
+            controller = WANController(
+                wan_name="TestWAN",
+                config=mock_autorate_config,
+                router=mock_router,
+                rtt_measurement=MagicMock(),
+                logger=MagicMock(),
+            )
+        controller.save_state = MagicMock()
+        controller.last_applied_dl_rate = 100_000_000
+        controller.last_applied_ul_rate = 20_000_000
+        controller.start_background_router_apply(shutdown_event)
+        yield controller
+        controller._router_apply_thread.stop()
+
+    def _cycle(self, controller, dl_rate, ul_rate) -> bool:
+        router_failed, _ = controller._run_router_communication(dl_rate, ul_rate)
+        return router_failed
+
+    def test_change_is_posted_and_acknowledged_next_cycle(self, controller, mock_router):
+        assert self._cycle(controller, 90_000_000, 18_000_000) is False
+        assert controller._router_apply_thread.wait_idle(timeout=5.0)
+        mock_router.set_limits.assert_called_once_with(
+            wan="TestWAN", down_bps=90_000_000, up_bps=18_000_000
+        )
+        # Acknowledged rates only move once the control thread collects the result
+        assert controller.last_applied_dl_rate == 100_000_000
+
+        assert self._cycle(controller, 90_000_000, 18_000_000) is False
+
+        assert (controller.last_applied_dl_rate, controller.last_applied_ul_rate) == (
+            90_000_000,
+            18_000_000,
+        )
+        assert mock_router.set_limits.call_count == 1
+        assert len(controller.rate_limiter.change_times) == 1
+        health = controller.get_health_data()["router_apply"]
+        assert health["acknowledged_dl_rate"] == 90_000_000
+        assert health["last_result"]["success"] is True
+
+    def test_target_in_flight_is_not_reposted(self, controller, mock_router):
+        gate = threading.Event()
+        mock_router.set_limits.side_effect = lambda **_: gate.wait(timeout=5.0)
+
+        self._cycle(controller, 90_000_000, 18_000_000)
+        self._cycle(controller, 90_000_000, 18_000_000)
+
+        assert controller._router_apply_thread.get_status()["posted"] == 1
+        assert controller._last_rate_apply_outcome == "unchanged_no_io"
+        gate.set()
+
+    def test_failed_apply_is_a_router_failure(self, controller, mock_router):
+        mock_router.set_limits.return_value = False
+        self._cycle(controller, 90_000_000, 18_000_000)
+        assert controller._router_apply_thread.wait_idle(timeout=5.0)
+
+        assert self._cycle(controller, 90_000_000, 18_000_000) is True
+
+        assert controller.router_connectivity.consecutive_failures == 1
+        assert controller.last_applied_dl_rate == 100_000_000
+
+    def test_every_write_between_collects_is_counted(self, controller, mock_router):
+        writer = controller._router_apply_thread
+        mock_router.set_limits.side_effect = [True, False, True]
+        for dl_rate in (90_000_000, 80_000_000, 70_000_000):
+            writer.post(dl_rate, 18_000_000)
+            assert writer.wait_idle(timeout=5.0)
+
+        connectivity = controller.router_connectivity
+        with patch.object(
+            connectivity, "record_failure", wraps=connectivity.record_failure
+        ) as record_failure:
+            assert self._cycle(controller, 70_000_000, 18_000_000) is False
+
+        assert len(controller.rate_limiter.change_times) == 2
+        assert record_failure.call_count == 1
+        assert controller.last_applied_dl_rate == 70_000_000
+
+    def test_consecutive_failed_writes_each_count(self, controller, mock_router):
+        writer = controller._router_apply_thread
+        mock_router.set_limits.return_value = False
+        for dl_rate in (90_000_000, 80_000_000):
+            writer.post(dl_rate, 18_000_000)
+            assert writer.wait_idle(timeout=5.0)
+
+        assert self._cycle(controller, 80_000_000, 18_000_000) is True
+
+        assert controller.router_connectivity.consecutive_failures == 2
+
+    def test_overlap_counters_update_on_control_thread(self, controller):
+        threads: list[str] = []
+        controller._update_overlap_counters_on_apply_completion = lambda: threads.append(
+            threading.current_thread().name
+        )
+        self._cycle(controller, 90_000_000, 18_000_000)
+        assert controller._router_apply_thread.wait_idle(timeout=5.0)
+        assert threads == []
+
+        self._cycle(controller, 90_000_000, 18_000_000)
+
+        assert threads == [threading.current_thread().name]
+
+    def test_rate_limited_change_is_not_posted(self, controller):
+        for _ in range(5):
+            controller.rate_limiter.record_change()
+
+        assert self._cycle(controller, 90_000_000, 18_000_000) is False
+
+        assert controller._router_apply_thread.get_status()["posted"] == 0
+        assert controller._last_rate_apply_outcome == "rate_limited_no_io"
+        controller.save_state.assert_called_once()
+
+    def test_unreachable_router_recovers_on_control_thread(self, controller, mock_router):
+        controller.router_connectivity.is_reachable = False
+        apply_threads: list[str] = []
+        mock_router.set_limits.side_effect = lambda **_: (
+            apply_threads.append(threading.current_thread().name) or True
+        )
+
+        assert self._cycle(controller, 90_000_000, 18_000_000) is False
+
+        # The queued target is replayed by the synchronous recovery probe
+        assert apply_threads == [threading.current_thread().name]
+        assert controller._router_apply_thread.get_status()["posted"] == 0
+        assert controller.router_connectivity.is_reachable
+        assert not controller.pending_rates.has_pending()
+
+    def test_sync_mode_starts_no_writer(self, mock_autorate_config, mock_router, shutdown_event):
+        from wanctl.wan_controller import WANController
+
+        with patch.object(WANController, "load_state"):
+            controller = WANController(
+                wan_name="TestWAN",
+                config=mock_autorate_config,
+                router=mock_router,
+                rtt_measurement=MagicMock(),
+                logger=MagicMock(),
+            )
+
+        controller.start_background_router_apply(shutdown_event)
+
+        assert controller._router_apply_thread is None
+        assert controller.get_health_data()["router_apply"] is None
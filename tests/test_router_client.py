@@ -297,6 +297,32 @@ class TestFailoverRouterClient:
             assert call_args[1] is mock_config
 
 
+    def test_transport_stats_follow_active_client(
+        self, mock_config: MagicMock, mock_logger: MagicMock
+    ) -> None:
+        """Health stats report the active transport and merge its own stats."""
+        mock_rest = MagicMock(spec=["run_cmd", "close"])
+        mock_rest.run_cmd.side_effect = ConnectionError("REST connection failed")
+        mock_ssh = MagicMock()
+        mock_ssh.run_cmd.return_value = (0, "output", "")
+        mock_ssh.get_transport_stats.return_value = {"transport": "ssh", "ssh_mode": "shell"}
+
+        with patch("wanctl.router_client._create_transport_with_password") as mock_create:
+            mock_create.side_effect = [mock_rest, mock_ssh]
+            client = get_router_client_with_failover(mock_config, mock_logger)
+
+            client._get_primary()
+            assert client.get_transport_stats() == {"transport": "rest", "using_fallback": False}
+
+            client.run_cmd("/queue tree print")
+
+        assert client.get_transport_stats() == {
+            "transport": "ssh",
+            "using_fallback": True,
+            "ssh_mode": "shell",
+        }
+
+
 class TestFailoverRouterClientInit:
     """Tests for FailoverRouterClient initialization."""
 
@@ -1031,6 +1031,43 @@ class TestRouteOperations:
         assert rc == 0
         assert json.loads(stdout) == [{"comment": "Force ATT_OUT to ATT WAN", ".id": "*6"}]
 
+    def test_route_print_pushes_filter_and_projection_to_router(self, rest_client, mock_session):
+        response = MagicMock()
+        response.ok = True
+        # A router ignoring the query parameters still yields the filtered projection
+        response.json.return_value = [
+            {"dst-address": "0.0.0.0/0", "gateway": "wan", "comment": "Spectrum", ".id": "*1"},
+            {"dst-address": "10.0.0.0/24", "gateway": "lan", "comment": "LAN", ".id": "*2"},
+        ]
+        mock_session.get.return_value = response
+
+        rc, stdout, _ = rest_client.run_cmd(
+            '/ip route print proplist=.id,gateway where dst-address="0.0.0.0/0"'
+        )
+
+        assert rc == 0
+        assert json.loads(stdout) == [{".id": "*1", "gateway": "wan"}]
+        mock_session.get.assert_called_once_with(
+            f"{rest_client.base_url}/ip/route",
+            params={"dst-address": "0.0.0.0/0", ".proplist": ".id,gateway"},
+            timeout=rest_client.timeout,
+        )
+
+    def test_route_print_contains_filter_stays_client_side(self, rest_client, mock_session):
+        response = MagicMock()
+        response.ok = True
+        response.json.return_value = [
+            {"comment": "Spectrum", ".id": "*1"},
+            {"comment": "Force ATT_OUT to ATT WAN", ".id": "*6"},
+        ]
+        mock_session.get.return_value = response
+
+        rc, stdout, _ = rest_client.run_cmd('/ip route print proplist=.id where comment~"ATT"')
+
+        assert rc == 0
+        assert json.loads(stdout) == [{".id": "*6", "comment": "Force ATT_OUT to ATT WAN"}]
+        assert mock_session.get.call_args.kwargs["params"] == {".proplist": ".id,comment"}
+
     def test_route_print_get_failure_fails_closed(self, rest_client, mock_session):
         response = MagicMock()
         response.ok = False
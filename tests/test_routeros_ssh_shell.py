@@ -0,0 +1,245 @@
+"""Tests for the persistent RouterOS console channel (routeros_ssh_shell.py)."""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+import time
+from collections.abc import Callable
+from unittest.mock import MagicMock, patch
+
+import paramiko
+import pytest
+
+from wanctl.routeros_ssh import RouterOSSSH
+from wanctl.routeros_ssh_shell import RouterOSShellSession
+
+_FRAME_RE = re.compile(
+    r'^\{:local r 0; :do \{(?P<cmd>.*)\} on-error=\{:set r 1\}; :put "(?P<tag>\S+)_rc=\$r"\}$'
+)
+_PUT_RE = re.compile(r'^:put "(?P<text>[^"]*)"$')
+
+
+class FakeConsole:
+    """Channel-shaped fake of an interactive RouterOS console.
+
+    Echoes every input line after a prompt, like the real console, and runs
+    framed commands through ``handler``: it returns the command output, or
+    raises to make the command fail. ``handler`` returning None leaves the
+    command hanging (no response at all).
+    """
+
+    def __init__(self, handler: Callable[[str], str | None]) -> None:
+        self.handler = handler
+        self.sent: list[bytes] = []
+        self.closed = False
+        self._out = bytearray(b"\r\n  MikroTik RouterOS 7.16 (c) 1999-2024\r\n\r\n")
+        self._cond = threading.Condition()
+        self._timeout: float | None = None
+        self._hung = False
+
+    def settimeout(self, timeout: float) -> None:
+        self._timeout = timeout
+
+    def sendall(self, data: bytes) -> None:
+        if self.closed:
+            raise OSError("Socket is closed")
+        self.sent.append(data)
+        with self._cond:
+            for line in data.decode().split("\r\n"):
+                if line and not self._hung:
+                    self._out += f"[admin@MikroTik] > {line}\r\n".encode()
+                    self._execute(line)
+            self._cond.notify_all()
+
+    def _execute(self, line: str) -> None:
+        frame = _FRAME_RE.match(line)
+        if frame is not None:
+            try:
+                output = self.handler(frame.group("cmd"))
+            except Exception as e:
+                self._out += f"failure: {e}\r\n".encode()
+                self._out += f"{frame.group('tag')}_rc=1\r\n".encode()
+                return
+            if output is None:
+                self._hung = True
+                return
+            if output:
+                self._out += output.replace("\n", "\r\n").encode() + b"\r\n"
+            self._out += f"{frame.group('tag')}_rc=0\r\n".encode()
+            return
+        put = _PUT_RE.match(line)
+        if put is not None:
+            self._out += put.group("text").encode() + b"\r\n"
+            return
+        self._out += b"syntax error (line 1 column 1)\r\n"
+
+    def recv(self, size: int) -> bytes:
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._out or self.closed, timeout=self._timeout):
+                raise TimeoutError("timed out")
+            data = bytes(self._out[:size])
+            del self._out[:size]
+            return data
+
+    def close(self) -> None:
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+
+
+def _identity(cmd: str) -> str:
+    if cmd == "/system identity print":
+        return "  name: MikroTik"
+    if cmd.startswith("/queue tree set"):
+        return ""
+    raise ValueError("no such item")
+
+
+def _wait_ready(session: RouterOSShellSession) -> None:
+    deadline = time.monotonic() + 5.0
+    while not session.ready:
+        assert time.monotonic() < deadline, "shell session did not connect"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def consoles():
+    return []
+
+
+@pytest.fixture
+def session(consoles):
+    def _open() -> FakeConsole:
+        console = FakeConsole(_identity)
+        consoles.append(console)
+        return console
+
+    session = RouterOSShellSession(_open, logging.getLogger("test"))
+    session.start()
+    _wait_ready(session)
+    yield session
+    session.close()
+
+
+class TestRouterOSShellSession:
+    def test_command_output_excludes_banner_echo_and_markers(self, session):
+        assert session.run(["/system identity print"], timeout=2.0) == [(0, "  name: MikroTik", "")]
+
+    def test_failed_command_reports_console_output_as_stderr(self, session):
+        assert session.run(["/queue tree print where name=x"], timeout=2.0) == [
+            (1, "", "failure: no such item")
+        ]
+
+    def test_batch_is_written_once_and_split_in_order(self, session, consoles):
+        cmds = [
+            '/queue tree set [find name="WAN-Download"] max-limit=900000000',
+            "/system identity print",
+            "/bogus",
+        ]
+
+        results = session.run(cmds, timeout=2.0)
+
+        assert [rc for rc, _, _ in results] == [0, 0, 1]
+        assert results[1][1] == "  name: MikroTik"
+        # One write for the sync marker, one for the whole batch
+        assert len(consoles[0].sent) == 2
+        assert session.get_status()["command_ms"]["count"] == 3
+
+    def test_timeout_drops_channel_and_reconnects_in_background(self, session, consoles):
+        consoles[0].handler = lambda cmd: None
+
+        with pytest.raises(TimeoutError):
+            session.run(["/system identity print"], timeout=0.2)
+
+        assert consoles[0].closed
+        _wait_ready(session)
+        assert session.run(["/system identity print"], timeout=2.0)[0][0] == 0
+        status = session.get_status()
+        assert (status["connects"], status["drops"]) == (2, 1)
+
+    def test_closed_channel_is_a_connection_error(self, session, consoles):
+        consoles[0].close()
+
+        with pytest.raises(ConnectionError):
+            session.run(["/system identity print"], timeout=2.0)
+
+        _wait_ready(session)
+        assert len(consoles) == 2
+
+    def test_run_before_connect_is_a_connection_error(self):
+        session = RouterOSShellSession(MagicMock(), logging.getLogger("test"))
+
+        with pytest.raises(ConnectionError):
+            session.run(["/system identity print"], timeout=1.0)
+
+
+class TestRouterOSSSHShellMode:
+    @pytest.fixture
+    def exec_client(self):
+        client = MagicMock(spec=paramiko.SSHClient)
+        client.get_transport.return_value.is_active.return_value = True
+        stdout = MagicMock()
+        stdout.read.return_value = b"exec output"
+        stdout.channel.recv_exit_status.return_value = 0
+        stderr = MagicMock()
+        stderr.read.return_value = b""
+        client.exec_command.return_value = (MagicMock(), stdout, stderr)
+        return client
+
+    @pytest.fixture
+    def ssh(self, exec_client, tmp_path):
+        key_file = tmp_path / "key"
+        key_file.touch()
+        with patch("wanctl.routeros_ssh.paramiko.SSHClient", return_value=exec_client):
+            client = RouterOSSSH("192.168.1.1", "admin", str(key_file), ssh_mode="shell")
+        client._client = exec_client
+        yield client
+        client.close()
+
+    def test_exec_is_used_until_shell_is_ready(self, ssh, exec_client):
+        console = FakeConsole(_identity)
+        ssh._shell._open_channel = lambda: console
+
+        first = ssh.run_cmd("/system identity print", capture=True)
+        _wait_ready(ssh._shell)
+        second = ssh.run_cmd("/system identity print", capture=True)
+
+        assert first == (0, "exec output", "")
+        assert second == (0, "  name: MikroTik", "")
+        exec_client.exec_command.assert_called_once()
+        stats = ssh.get_transport_stats()
+        assert stats["ssh_mode"] == "shell"
+        assert stats["shell"]["connected"] is True
+        assert stats["shell"]["command_ms"]["count"] == 1
+        assert stats["exec_command_ms"]["count"] == 1
+
+    def test_shell_login_disables_colors_and_autodetection(self, ssh, exec_client):
+        channel = MagicMock()
+        exec_client.get_transport.return_value.open_session.return_value = channel
+
+        with patch("wanctl.routeros_ssh.paramiko.SSHClient", return_value=exec_client):
+            assert ssh._open_shell_channel() is channel
+
+        assert exec_client.connect.call_args.kwargs["username"] == "admin+ct4096w"
+        channel.invoke_shell.assert_called_once()
+
+    def test_exec_mode_has_no_shell(self, tmp_path):
+        client = RouterOSSSH("192.168.1.1", "admin", str(tmp_path / "key"))
+
+        assert client.get_transport_stats()["ssh_mode"] == "exec"
+        assert "shell" not in client.get_transport_stats()
+
+    def test_unknown_mode_is_rejected(self, tmp_path):
+        with pytest.raises(ValueError, match="ssh_mode"):
+            RouterOSSSH("192.168.1.1", "admin", str(tmp_path / "key"), ssh_mode="pty")
+
+    def test_from_config_reads_ssh_mode(self):
+        config = MagicMock()
+        config.router_ssh_mode = "shell"
+
+        client = RouterOSSSH.from_config(config, logging.getLogger("test"))
+
+        assert client.ssh_mode == "shell"
+        client.close()
@@ -1,11 +1,14 @@
 """Tests for bounded runtime/storage pressure helpers."""
 
+import os
+
 from wanctl.runtime_pressure import (
     build_runtime_section,
     build_storage_section,
     classify_memory_status,
     classify_swap_status,
     get_storage_file_snapshot,
+    read_process_age_seconds,
 )
 
 
@@ -122,3 +125,19 @@ def test_build_runtime_section_includes_swap_pressure():
     assert runtime["swap_bytes"] == 256 * 1024 * 1024
     assert runtime["swap_status"] == "warning"
     assert runtime["status"] == "warning"
+
+
+def test_read_process_age_seconds_parses_starttime_after_comm(tmp_path):
+    ticks = os.sysconf("SC_CLK_TCK")
+    stat = tmp_path / "stat"
+    uptime = tmp_path / "uptime"
+    # comm with spaces and a ')' must not shift the field index
+    fields = ["S"] + ["0"] * 18 + [str(100 * ticks)] + ["0"] * 10
+    stat.write_text("1234 (wanctl (x) y) " + " ".join(fields))
+    uptime.write_text("102.50 400.00\n")
+
+    assert read_process_age_seconds(str(stat), str(uptime)) == 2.5
+
+
+def test_read_process_age_seconds_missing_proc_is_none(tmp_path):
+    assert read_process_age_seconds(str(tmp_path / "nope"), str(tmp_path / "nope")) is None
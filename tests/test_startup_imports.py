@@ -0,0 +1,145 @@
+"""Startup gates for daemon and CLI entry modules.
+
+Each check runs in a fresh interpreter. Heavy optional modules listed as
+``deferred`` must not load at import time (deterministic, default suite).
+The wall-clock budgets in tests/fixtures/startup_import_budget.json --
+cumulative ``-X importtime`` cost, ``--help`` latency of the CLIs and
+process start to the first completed autorate cycle -- are ``perf`` tests:
+parallel workers skew them, so they run serially via ``make perf``.
+"""
+
+import json
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).parent.parent
+BUDGET_PATH = Path(__file__).parent / "fixtures" / "startup_import_budget.json"
+_BUDGET_DATA = json.loads(BUDGET_PATH.read_text())
+BUDGETS = _BUDGET_DATA["modules"]
+CLI_BUDGETS = _BUDGET_DATA["cli"]
+FIRST_CYCLE = _BUDGET_DATA["first_cycle"]
+
+# Autorate startup up to its first cycle: daemon imports, config load,
+# controller construction, one cycle against the simulator's link model.
+_FIRST_CYCLE_SCRIPT = """
+import sys
+import wanctl.autorate_continuous
+from wanctl.autorate_config import Config
+from wanctl.runtime_pressure import read_process_age_seconds
+from wanctl.sim import BottleneckLink, LinkDirection, Simulation, Trace
+
+link = BottleneckLink(
+    download=LinkDirection(Trace.constant(600e6), Trace.constant(1.2e9)),
+    upload=LinkDirection(Trace.constant(36e6), Trace.constant(10e6)),
+)
+with Simulation(Config(sys.argv[1]), link) as sim:
+    sim.run(sim.cycle_interval_sec)
+    print(read_process_age_seconds())
+"""
+
+# "import time: self [us] | cumulative | imported package"
+_IMPORTTIME_RE = re.compile(r"^import time:\s+\d+ \|\s+(\d+) \|\s*(\S+)\s*$")
+
+
+def _cumulative_import_ms(module: str) -> float:
+    """Best-of-3 cumulative import time for ``module`` in a fresh interpreter."""
+    best = float("inf")
+    for _ in range(3):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            timeout=20,
+            check=True,
+        )
+        for line in reversed(result.stderr.splitlines()):
+            match = _IMPORTTIME_RE.match(line)
+            if match and match.group(2) == module:
+                best = min(best, int(match.group(1)) / 1000.0)
+                break
+    return best
+
+
+@pytest.mark.parametrize("module", sorted(BUDGETS))
+def test_deferred_modules_not_imported(module):
+    deferred = BUDGETS[module]["deferred"]
+    script = (
+        f"import json, sys, {module}\n"
+        f"print(json.dumps([m for m in {deferred!r} if m in sys.modules]))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, timeout=20, check=True
+    )
+
+    assert json.loads(result.stdout) == []
+
+
+def _best_wall_ms(argv: list[str]) -> float:
+    """Best-of-3 wall time of a fresh interpreter running ``argv``."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, *argv], capture_output=True, timeout=20, check=True, cwd=REPO_ROOT
+        )
+        best = min(best, (time.perf_counter() - start) * 1000.0)
+    return best
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("module", sorted(BUDGETS))
+def test_import_time_within_budget(module):
+    elapsed_ms = _cumulative_import_ms(module)
+
+    assert elapsed_ms < BUDGETS[module]["budget_ms"], (
+        f"{module} import took {elapsed_ms:.0f}ms (budget {BUDGETS[module]['budget_ms']}ms)"
+    )
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("module", sorted(CLI_BUDGETS))
+def test_cli_help_latency_within_budget(module):
+    elapsed_ms = _best_wall_ms(["-m", module, "--help"])
+
+    assert elapsed_ms < CLI_BUDGETS[module]["budget_ms"], (
+        f"{module} --help took {elapsed_ms:.0f}ms (budget {CLI_BUDGETS[module]['budget_ms']}ms)"
+    )
+
+
+@pytest.mark.perf
+def test_time_to_first_cycle_within_budget():
+    best_ms = float("inf")
+    for _ in range(3):
+        result = subprocess.run(
+            [sys.executable, "-c", _FIRST_CYCLE_SCRIPT, FIRST_CYCLE["config"]],
+            capture_output=True,
+            text=True,
+            timeout=30,
+            check=True,
+            cwd=REPO_ROOT,
+        )
+        age = result.stdout.strip().splitlines()[-1]
+        if age == "None":
+            pytest.skip("process start time unavailable (no /proc)")
+        best_ms = min(best_ms, float(age) * 1000.0)
+
+    assert best_ms < FIRST_CYCLE["budget_ms"], (
+        f"first cycle completed {best_ms:.0f}ms after process start "
+        f"(budget {FIRST_CYCLE['budget_ms']}ms)"
+    )
+
+
+def test_backends_package_resolves_lazy_exports():
+    script = (
+        "import sys, wanctl.backends as b\n"
+        "assert 'wanctl.backends.netlink_cake' not in sys.modules\n"
+        "cls = b.NetlinkCakeBackend\n"
+        "assert cls.__module__ == 'wanctl.backends.netlink_cake'\n"
+        "assert b.RouterOSBackend.__name__ == 'RouterOSBackend'\n"
+    )
+    subprocess.run([sys.executable, "-c", script], timeout=20, check=True)
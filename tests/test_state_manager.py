@@ -632,7 +632,7 @@ class TestSteeringStateManager:
 
     def test_load_converts_lists_to_deques(self, temp_state_file, steering_schema, logger):
         """Test JSON lists are converted to deques on load."""
-        from collections import deque
+        from wanctl.history_ring import HistoryRing
 
         # Write state with lists
         temp_state_file.write_text(
@@ -645,14 +645,14 @@ class TestSteeringStateManager:
         result = manager.load()
 
         assert result is True
-        assert isinstance(manager.state["history_rtt"], deque)
-        assert isinstance(manager.state["history_delta"], deque)
+        assert isinstance(manager.state["history_rtt"], HistoryRing)
+        assert isinstance(manager.state["history_delta"], HistoryRing)
         assert list(manager.state["history_rtt"]) == [10.0, 11.0, 12.0]
         assert list(manager.state["history_delta"]) == [1.0, 2.0]
 
     def test_load_enforces_history_maxlen(self, temp_state_file, steering_schema, logger):
         """Test history_maxlen is enforced on deques."""
-        from collections import deque
+        from wanctl.history_ring import HistoryRing
 
         # Write state with more items than maxlen
         long_history = [float(i) for i in range(100)]
@@ -673,14 +673,14 @@ class TestSteeringStateManager:
         result = manager.load()
 
         assert result is True
-        assert isinstance(manager.state["history_rtt"], deque)
+        assert isinstance(manager.state["history_rtt"], HistoryRing)
         # Should be trimmed to last 10 items
         assert len(manager.state["history_rtt"]) == 10
         assert manager.state["history_rtt"].maxlen == 10
 
     def test_load_converts_non_list_to_empty_deque(self, temp_state_file, steering_schema, logger):
         """Test non-list/non-deque values are converted to empty deque."""
-        from collections import deque
+        from wanctl.history_ring import HistoryRing
 
         # Write state with integer value for history field (not iterable)
         temp_state_file.write_text(
@@ -694,8 +694,8 @@ class TestSteeringStateManager:
         result = manager.load()
 
         assert result is True
-        assert isinstance(manager.state["history_rtt"], deque)
-        assert isinstance(manager.state["history_delta"], deque)
+        assert isinstance(manager.state["history_rtt"], HistoryRing)
+        assert isinstance(manager.state["history_delta"], HistoryRing)
         # Non-list/non-deque values should become empty deques
         assert len(manager.state["history_rtt"]) == 0
         assert len(manager.state["history_delta"]) == 0
@@ -704,7 +704,7 @@ class TestSteeringStateManager:
         self, temp_state_file, steering_schema, logger, caplog
     ):
         """Test backup recovery works with deque conversion."""
-        from collections import deque
+        from wanctl.history_ring import HistoryRing
 
         # Create corrupt primary
         temp_state_file.write_text("{ invalid json")
@@ -725,7 +725,7 @@ class TestSteeringStateManager:
         assert result is True
         assert manager.state["state"] == "YELLOW"
         assert manager.state["bad_count"] == 5
-        assert isinstance(manager.state["history_rtt"], deque)
+        assert isinstance(manager.state["history_rtt"], HistoryRing)
         assert list(manager.state["history_rtt"]) == [15.0, 16.0]
 
     def test_load_both_corrupt_uses_defaults(self, temp_state_file, steering_schema, logger):
@@ -846,6 +846,8 @@ class TestSteeringStateManager:
         """Test deques are serialized as lists in JSON, restored as deques on load."""
         from collections import deque
 
+        from wanctl.history_ring import HistoryRing
+
         manager1 = SteeringStateManager(temp_state_file, steering_schema, logger)
         # Set up deques manually
         manager1.state["history_rtt"] = deque([10.0, 11.0, 12.0], maxlen=50)
@@ -858,9 +860,9 @@ class TestSteeringStateManager:
         manager2 = SteeringStateManager(temp_state_file, steering_schema, logger)
         assert manager2.load() is True
 
-        # Verify deques restored
-        assert isinstance(manager2.state["history_rtt"], deque)
-        assert isinstance(manager2.state["history_delta"], deque)
+        # Verify rings restored
+        assert isinstance(manager2.state["history_rtt"], HistoryRing)
+        assert isinstance(manager2.state["history_delta"], HistoryRing)
         assert list(manager2.state["history_rtt"]) == [10.0, 11.0, 12.0]
         assert list(manager2.state["history_delta"]) == [1.0, 2.0]
 
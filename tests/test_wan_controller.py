@@ -5713,3 +5713,36 @@ class TestSigusr1ReloadScopePhase201:
 
         assert "docsis_mode" not in reload_body
         assert "setpoint_mbps" not in reload_body
+
+
+class TestZoneEventPublishing:
+    """Zone transitions are pushed to steering when zone_events is enabled."""
+
+    def _make_controller(self, config):
+        from wanctl.wan_controller import WANController
+
+        with patch.object(WANController, "load_state"):
+            return WANController(
+                wan_name="TestWAN",
+                config=config,
+                router=MagicMock(),
+                rtt_measurement=MagicMock(),
+                logger=MagicMock(),
+            )
+
+    def test_publisher_disabled_by_default(self, mock_autorate_config):
+        controller = self._make_controller(mock_autorate_config)
+
+        assert controller._zone_event_publisher is None
+
+    def test_publisher_created_and_closed(self, mock_autorate_config, tmp_path):
+        from wanctl.zone_events import ZoneEventPublisher
+
+        mock_autorate_config.zone_event_socket = str(tmp_path / "ev.sock")
+        controller = self._make_controller(mock_autorate_config)
+        publisher = controller._zone_event_publisher
+
+        assert isinstance(publisher, ZoneEventPublisher)
+        assert publisher.wan_name == "TestWAN"
+        controller.shutdown_threads()
+        assert publisher._sock.fileno() == -1
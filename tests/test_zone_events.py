@@ -0,0 +1,143 @@
+"""Tests for autorate -> steering zone transition events (zone_events.py)."""
+
+import json
+import logging
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from wanctl.zone_events import ZoneEvent, ZoneEventListener, ZoneEventPublisher
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    # AF_UNIX paths are limited to ~108 bytes; tmp_path is short enough here.
+    return str(tmp_path / "events.sock")
+
+
+@pytest.fixture
+def listener(socket_path):
+    listener = ZoneEventListener(socket_path, logging.getLogger("test"))
+    listener.open()
+    yield listener
+    listener.close()
+
+
+class TestZoneEventCodec:
+    def test_round_trip(self):
+        event = ZoneEvent("spectrum", "RED", "YELLOW", 400_000_000, 30_000_000, 123.5)
+
+        assert ZoneEvent.decode(event.encode()) == event
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            b"not json",
+            b"\xff\xfe",
+            b"[]",
+            json.dumps({"wan_name": "", "dl_state": "RED", "ul_state": "GREEN"}).encode(),
+            json.dumps({"wan_name": "x", "dl_state": "PURPLE", "ul_state": "GREEN"}).encode(),
+            json.dumps(
+                {"wan_name": "x", "dl_state": "RED", "ul_state": "GREEN", "dl_rate_bps": "fast"}
+            ).encode(),
+        ],
+    )
+    def test_malformed_payload_rejected(self, payload):
+        assert ZoneEvent.decode(payload) is None
+
+
+class TestZoneEventPublisher:
+    def test_publishes_only_on_zone_change(self, listener, socket_path):
+        publisher = ZoneEventPublisher(socket_path, "spectrum", MagicMock())
+        try:
+            assert publisher.publish_if_changed("GREEN", "GREEN", 900, 40) is True
+            assert publisher.publish_if_changed("GREEN", "GREEN", 880, 40) is False
+            assert publisher.publish_if_changed("RED", "GREEN", 400, 40) is True
+        finally:
+            publisher.close()
+
+        events = listener.drain()
+        assert [e.dl_state for e in events] == ["GREEN", "RED"]
+        assert events[-1].dl_rate_bps == 400
+        assert publisher.events_sent == 2
+
+    def test_missing_listener_counts_failure_without_raising(self, socket_path):
+        logger = MagicMock()
+        publisher = ZoneEventPublisher(socket_path, "spectrum", logger)
+        try:
+            assert publisher.publish_if_changed("RED", "GREEN", 1, 1) is False
+            assert publisher.publish_if_changed("GREEN", "GREEN", 1, 1) is False
+        finally:
+            publisher.close()
+
+        assert publisher.send_failures == 2
+        # Logged once per failure streak, not per event
+        assert logger.debug.call_count == 1
+
+
+class TestZoneEventListener:
+    def test_wait_returns_on_event_before_timeout(self, listener, socket_path):
+        publisher = ZoneEventPublisher(socket_path, "spectrum", MagicMock())
+        shutdown = threading.Event()
+        timer = threading.Timer(0.05, publisher.publish_if_changed, ("RED", "GREEN", 1, 1))
+        timer.start()
+        try:
+            start = time.monotonic()
+            events = listener.wait(5.0, shutdown)
+            elapsed = time.monotonic() - start
+        finally:
+            timer.join()
+            publisher.close()
+
+        assert [e.dl_state for e in events] == ["RED"]
+        assert elapsed < 1.0
+        assert listener.wakeups == 1
+
+    def test_wait_times_out_with_no_events(self, listener):
+        assert listener.wait(0.05, threading.Event()) == []
+
+    def test_wait_returns_promptly_on_shutdown(self, listener):
+        shutdown = threading.Event()
+        threading.Timer(0.05, shutdown.set).start()
+
+        start = time.monotonic()
+        assert listener.wait(5.0, shutdown) == []
+        assert time.monotonic() - start < 1.0
+
+    def test_drain_returns_every_pending_event_in_order(self, listener, socket_path):
+        for wan, zone in (("spectrum", "YELLOW"), ("att", "RED"), ("spectrum", "RED")):
+            publisher = ZoneEventPublisher(socket_path, wan, MagicMock())
+            publisher.publish_if_changed(zone, "GREEN", 1, 1)
+            publisher.close()
+
+        events = listener.drain()
+        assert [(e.wan_name, e.dl_state) for e in events] == [
+            ("spectrum", "YELLOW"),
+            ("att", "RED"),
+            ("spectrum", "RED"),
+        ]
+        assert listener.events_received == 3
+        assert listener.drain() == []
+
+    def test_rejected_datagrams_counted(self, listener, socket_path):
+        import socket
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sock.sendto(b"garbage", socket_path)
+        sock.close()
+
+        assert listener.drain() == []
+        assert listener.get_health_data()["events_rejected"] == 1
+
+    def test_open_replaces_stale_socket_file_and_close_removes_it(self, socket_path):
+        from pathlib import Path
+
+        Path(socket_path).write_text("stale")
+        listener = ZoneEventListener(socket_path, MagicMock())
+        listener.open()
+        assert listener.get_health_data()["bound"] is True
+        listener.close()
+
+        assert not Path(socket_path).exists()
@@ -0,0 +1,150 @@
+"""Tests for the shared per-WAN tuning metric window (metric_window.py)."""
+
+import sqlite3
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from wanctl.storage.reader import query_metrics
+from wanctl.storage.schema import create_tables
+from wanctl.tuning.analyzer import _query_wan_metrics
+from wanctl.tuning.metric_window import REFETCH_OVERLAP_SEC, MetricWindow
+from wanctl.tuning.safety import measure_congestion_rate
+
+
+def _write_rows(db_path: Path, rows: list[tuple[int, str, str, float]]) -> None:
+    conn = sqlite3.connect(db_path)
+    create_tables(conn)
+    conn.executemany(
+        """
+        INSERT INTO metrics (timestamp, wan_name, metric_name, value, labels, granularity)
+        VALUES (?, ?, ?, ?, NULL, '1m')
+        """,
+        rows,
+    )
+    conn.commit()
+    conn.close()
+
+
+def _state_rows(start_ts: int, count: int, wan: str = "Spectrum") -> list:
+    rows = []
+    for i in range(count):
+        ts = start_ts + i * 60
+        rows.append((ts, wan, "wanctl_state_download", 3.0 if i % 4 == 0 else 0.0))
+        rows.append((ts, wan, "wanctl_rtt_ms", 20.0 + i))
+    return rows
+
+
+@pytest.fixture
+def now_ts():
+    return int(time.time()) // 60 * 60
+
+
+@pytest.fixture
+def db_path(tmp_path, now_ts):
+    path = tmp_path / "metrics.db"
+    _write_rows(path, _state_rows(now_ts - 3 * 3600, 120))
+    _write_rows(path, [(now_ts - 30, "ATT", "wanctl_rtt_ms", 9.0)])
+    return path
+
+
+class TestRefresh:
+    def test_first_refresh_loads_span_then_reads_only_the_tail(self, db_path, now_ts):
+        window = MetricWindow(db_path, "Spectrum", lookback_hours=2)
+        with patch("wanctl.tuning.metric_window.query_metrics", wraps=query_metrics) as spy:
+            window.refresh(now_ts)
+            newest = window.get_status()["newest_ts"]
+            window.refresh(now_ts + 60)
+
+        assert spy.call_args_list[0].kwargs["start_ts"] == now_ts - 7200
+        assert spy.call_args_list[1].kwargs["start_ts"] == newest - REFETCH_OVERLAP_SEC
+        status = window.get_status()
+        assert (status["full_loads"], status["refreshes"]) == (1, 2)
+        assert status["last_fetch_rows"] == 2 * (REFETCH_OVERLAP_SEC // 60 + 1)
+
+    def test_late_rows_are_picked_up_and_old_rows_evicted(self, db_path, now_ts):
+        window = MetricWindow(db_path, "Spectrum", lookback_hours=2)
+        window.refresh(now_ts)
+        first_rows = window.get_status()["rows"]
+
+        last_ts = window.get_status()["newest_ts"]
+        _write_rows(db_path, [(last_ts - 120, "Spectrum", "wanctl_late", 1.0)])
+        window.refresh(now_ts + 600)
+
+        assert window.get_status()["rows"] == first_rows + 1 - 2 * 10
+        assert any(row["metric_name"] == "wanctl_late" for row in window.rows())
+        assert window.get_status()["oldest_ts"] >= now_ts + 600 - 7200
+
+    def test_stale_window_reloads_in_full(self, db_path, now_ts):
+        window = MetricWindow(db_path, "Spectrum", lookback_hours=1)
+        window.refresh(now_ts - 3600)
+        window.refresh(now_ts + 3 * 3600)
+
+        status = window.get_status()
+        assert status["full_loads"] == 2
+        assert status["rows"] == 0
+
+
+class TestQueries:
+    def test_rows_match_query_metrics(self, db_path, now_ts):
+        window = MetricWindow(db_path, "Spectrum", lookback_hours=24)
+        start_ts = now_ts - 3600
+
+        assert window.rows(start_ts=start_ts) == query_metrics(
+            db_path=db_path, start_ts=start_ts, wan="Spectrum", granularity="1m"
+        )
+
+    def test_analyzer_and_safety_read_from_window(self, db_path, now_ts):
+        window = MetricWindow(db_path, "Spectrum", lookback_hours=24)
+        start_ts = now_ts - 3600
+        expected_rate = measure_congestion_rate(db_path, "Spectrum", start_ts, now_ts)
+        expected_rows = _query_wan_metrics(str(db_path), "Spectrum", 24)
+        window.refresh()
+
+        with patch("wanctl.tuning.safety.query_metrics") as safety_qm:
+            rate = measure_congestion_rate(db_path, "Spectrum", start_ts, now_ts, window=window)
+        with patch("wanctl.tuning.analyzer.query_metrics") as analyzer_qm:
+            rows = _query_wan_metrics(str(db_path), "Spectrum", 24, window)
+
+        safety_qm.assert_not_called()
+        analyzer_qm.assert_not_called()
+        assert rate == expected_rate
+        assert rows == expected_rows
+
+    def test_span_capped_at_1m_retention_still_covers_lookback(self, db_path, now_ts):
+        window = MetricWindow(db_path, "Spectrum", lookback_hours=72, max_age_sec=3600)
+
+        assert window.span_sec == 3600
+        assert window.covers(now_ts - 72 * 3600, now_ts)
+        assert not window.covers(now_ts - 73 * 3600, now_ts)
+
+    def test_range_outside_window_falls_back_to_sqlite(self, db_path, now_ts):
+        window = MetricWindow(db_path, "Spectrum", lookback_hours=1)
+
+        rate = measure_congestion_rate(db_path, "Spectrum", now_ts - 3 * 3600, now_ts, window)
+
+        assert rate == measure_congestion_rate(db_path, "Spectrum", now_ts - 3 * 3600, now_ts)
+        assert window.get_status()["refreshes"] == 0
+
+
+class TestControllerWindow:
+    def test_window_reused_per_db_and_reported_in_health(self, mock_autorate_config, tmp_path):
+        from wanctl.wan_controller import WANController
+
+        router = MagicMock(needs_rate_limiting=False, rate_limit_params={})
+        with patch.object(WANController, "load_state"):
+            controller = WANController(
+                "TestWAN", mock_autorate_config, router, MagicMock(), MagicMock()
+            )
+        assert controller.get_health_data()["tuning"]["window"] is None
+
+        window = controller.get_metric_window(str(tmp_path / "a.db"), 24)
+        assert controller.get_metric_window(str(tmp_path / "a.db"), 12, 3600) is window
+        assert window.span_sec == 3600
+        assert controller.get_metric_window(str(tmp_path / "b.db"), 24) is not window
+
+        status = controller.get_health_data()["tuning"]["window"]
+        assert status["rows"] == 0
+        assert status["lookback_hours"] == 24.0
@@ -0,0 +1,266 @@
+"""Tests for the sliding-window tuning backtest (wanctl.tuning.backtest)."""
+
+import json
+import logging
+import sqlite3
+from pathlib import Path
+
+import pytest
+import yaml
+
+from wanctl.storage.reader import query_metrics
+from wanctl.storage.schema import METRICS_SCHEMA
+from wanctl.tuning.backtest import (
+    _window_rows,
+    _WindowDigests,
+    build_windows,
+    list_wans,
+    main,
+    plan_tasks,
+    run_backtest,
+    summarize,
+)
+from wanctl.tuning.metric_window import MetricWindow
+from wanctl.tuning.models import SafetyBounds, TuningConfig
+from wanctl.tuning.strategies.response import RESPONSE_PARAMS
+
+EXAMPLE_CONFIG = Path(__file__).resolve().parents[2] / "configs/examples/cable.yaml.example"
+
+START_TS = 1_700_000_000
+HOUR = 3600
+
+
+def _tuning_config(**overrides) -> TuningConfig:
+    values = {
+        "enabled": True,
+        "cadence_sec": HOUR,
+        "lookback_hours": 6,
+        "warmup_hours": 1,
+        "max_step_pct": 10.0,
+        "bounds": {
+            "target_bloat_ms": SafetyBounds(min_value=3.0, max_value=50.0),
+            "warn_bloat_ms": SafetyBounds(min_value=10.0, max_value=100.0),
+        },
+        "min_confidence": 0.0,
+    }
+    values.update(overrides)
+    return TuningConfig(**values)
+
+
+def _write_history(db_path, hours: int, start_hour: int = 0, flap_hours=()) -> None:
+    """1m GREEN history with RTT deltas drifting upwards (never converged).
+
+    During ``flap_hours`` the download state flips every minute, which is
+    far above the oscillation lockout threshold.
+    """
+    conn = sqlite3.connect(str(db_path))
+    conn.executescript(METRICS_SCHEMA)
+    rows = []
+    for minute in range(start_hour * 60, (start_hour + hours) * 60):
+        ts = START_TS + minute * 60
+        hour = minute // 60
+        state = float(minute % 2) if hour in flap_hours else 0.0
+        delta = 5.0 + minute / 60.0 + (minute % 7) * 0.3
+        rows.append((ts, "spectrum", "wanctl_rtt_delta_ms", delta, None, "1m"))
+        rows.append((ts, "spectrum", "wanctl_state_download", state, None, "1m"))
+    conn.executemany(
+        "INSERT INTO metrics (timestamp, wan_name, metric_name, value, labels, granularity) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        rows,
+    )
+    conn.commit()
+    conn.close()
+
+
+def _params() -> dict[str, float]:
+    return {"target_bloat_ms": 15.0, "warn_bloat_ms": 45.0, "dl_factor_down": 0.85}
+
+
+def _run(db_path, *, cache_dir=None, closed_loop=True, jobs=1, tuning_config=None):
+    series = [(str(db_path), "spectrum", _params(), tuning_config or _tuning_config(), 0.1)]
+    tasks = plan_tasks(series, closed_loop=closed_loop, jobs=jobs, cache_dir=cache_dir)
+    return [summarize(s) for s in run_backtest(tasks, jobs)]
+
+
+class TestBuildWindows:
+    def test_windows_step_by_cadence_and_skip_warmup(self) -> None:
+        windows = build_windows(
+            0, 10 * HOUR, lookback_sec=6 * HOUR, step_sec=HOUR, warmup_sec=2 * HOUR
+        )
+
+        assert [w.index for w in windows] == list(range(2, 11))
+        assert windows[0].end_ts == 2 * HOUR
+        assert windows[0].start_ts == -4 * HOUR
+        assert windows[-1].end_ts == 10 * HOUR
+
+    def test_short_history_has_no_windows(self) -> None:
+        assert build_windows(0, HOUR - 1, lookback_sec=HOUR, step_sec=HOUR) == []
+
+    def test_non_positive_step_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            build_windows(0, HOUR, lookback_sec=HOUR, step_sec=0)
+
+
+class TestWindowFeed:
+    def test_sliding_rows_match_a_fresh_query(self, tmp_path) -> None:
+        db = tmp_path / "metrics-spectrum.db"
+        _write_history(db, hours=12)
+        feed = MetricWindow(str(db), "spectrum", lookback_hours=3)
+
+        for window in build_windows(START_TS, START_TS + 12 * HOUR, 3 * HOUR, HOUR):
+            expected = query_metrics(
+                db_path=db,
+                start_ts=window.start_ts,
+                end_ts=window.end_ts,
+                wan="spectrum",
+                granularity="1m",
+            )
+            assert _window_rows(feed, window) == expected
+        assert feed.get_status()["full_loads"] == 1
+
+    def test_digest_does_not_depend_on_replay_start(self, tmp_path) -> None:
+        db = tmp_path / "metrics-spectrum.db"
+        _write_history(db, hours=12)
+        windows = build_windows(START_TS, START_TS + 12 * HOUR, 3 * HOUR, HOUR)
+        sliding = MetricWindow(str(db), "spectrum", lookback_hours=3)
+        sliding_digests = _WindowDigests()
+
+        digests = []
+        for window in windows:
+            digests.append(sliding_digests.digest(_window_rows(sliding, window), window))
+
+        fresh = MetricWindow(str(db), "spectrum", lookback_hours=3)
+        fresh_rows = _window_rows(fresh, windows[-1])
+        assert _WindowDigests().digest(fresh_rows, windows[-1]) == digests[-1]
+        assert len(set(digests)) == len(digests)
+
+
+class TestClosedLoopReplay:
+    def test_threshold_layer_steps_toward_history(self, tmp_path) -> None:
+        db = tmp_path / "metrics-spectrum.db"
+        _write_history(db, hours=30)
+
+        (report,) = _run(db)
+
+        assert report["windows"] == 29
+        target = report["parameters"]["target_bloat_ms"]
+        # Threshold layer runs on every fifth window (index % 5 == 2)
+        assert target["evaluations"] == 6
+        assert target["changes"] >= 2
+        # Each step is clamped to max_step_pct of the previous applied value
+        previous = target["initial"]
+        for _, value in target["trajectory"]:
+            assert abs(value - previous) <= previous * 0.1 + 0.05
+            previous = value
+        assert target["final"] == previous
+
+    def test_rerun_is_served_from_cache(self, tmp_path) -> None:
+        db = tmp_path / "metrics-spectrum.db"
+        _write_history(db, hours=30)
+        cache = str(tmp_path / "cache")
+
+        first = _run(db, cache_dir=cache)
+        second = _run(db, cache_dir=cache)
+
+        assert first[0]["cache_hits"] == 0
+        assert second[0]["cache_hits"] == second[0]["windows"]
+        assert second[0]["parameters"] == first[0]["parameters"]
+
+    def test_new_history_only_evaluates_new_windows(self, tmp_path) -> None:
+        db = tmp_path / "metrics-spectrum.db"
+        cache = str(tmp_path / "cache")
+        _write_history(db, hours=20)
+        (before,) = _run(db, cache_dir=cache)
+
+        _write_history(db, hours=5, start_hour=20)
+        (after,) = _run(db, cache_dir=cache)
+
+        assert after["windows"] == before["windows"] + 5
+        assert after["cache_hits"] == before["windows"]
+
+    def test_oscillation_lockout_counted_and_skips_response_params(self, tmp_path) -> None:
+        db = tmp_path / "metrics-spectrum.db"
+        _write_history(db, hours=30, flap_hours={3, 4})
+        bounds = dict(_tuning_config().bounds)
+        bounds["dl_factor_down"] = SafetyBounds(min_value=0.5, max_value=0.95)
+
+        series = [(str(db), "spectrum", _params(), _tuning_config(bounds=bounds), 0.1)]
+        (result,) = run_backtest(plan_tasks(series))
+        report = summarize(result)
+
+        assert report["oscillation_lockouts"] == 1
+        response = [o for o in result.outcomes if o.layer == "response"]
+        locked = response[0]
+        assert locked.lockout is True
+        assert not set(locked.evaluated) & set(RESPONSE_PARAMS)
+        # Two-hour lockout has expired by the next response pass (5 hours later)
+        assert "dl_factor_down" in response[1].evaluated
+
+
+class TestOpenLoop:
+    def test_process_pool_matches_serial(self, tmp_path) -> None:
+        db = tmp_path / "metrics-spectrum.db"
+        _write_history(db, hours=12)
+
+        serial = _run(db, closed_loop=False, jobs=1)
+        pooled = _run(db, closed_loop=False, jobs=2)
+
+        assert pooled == serial
+        assert serial[0]["mode"] == "open_loop"
+        # Every window evaluates every strategy against the configured value
+        target = serial[0]["parameters"]["target_bloat_ms"]
+        assert target["evaluations"] == serial[0]["windows"]
+
+    def test_serial_run_quiets_tuning_logs_like_workers(self, tmp_path, caplog) -> None:
+        db = tmp_path / "metrics-spectrum.db"
+        _write_history(db, hours=30)
+        tuning_logger = logging.getLogger("wanctl.tuning")
+
+        with caplog.at_level(logging.WARNING):
+            (report,) = _run(db, jobs=1)
+
+        assert report["parameters"]["target_bloat_ms"]["changes"] > 0
+        assert not [r for r in caplog.records if r.name.startswith("wanctl.tuning.applier")]
+        assert tuning_logger.level == logging.NOTSET
+
+
+class TestCli:
+    def test_list_wans(self, tmp_path) -> None:
+        db = tmp_path / "metrics-spectrum.db"
+        _write_history(db, hours=2)
+        assert list_wans(db) == ["spectrum"]
+        assert list_wans(tmp_path / "missing.db") == []
+
+    def test_json_report(self, tmp_path, capsys) -> None:
+        db = tmp_path / "metrics-spectrum.db"
+        _write_history(db, hours=12)
+        data = yaml.safe_load(EXAMPLE_CONFIG.read_text())
+        data["wan_name"] = "spectrum"
+        data["tuning"] = {
+            "enabled": True,
+            "cadence_sec": 3600,
+            "lookback_hours": 6,
+            "warmup_hours": 1,
+            "bounds": {"target_bloat_ms": {"min": 3, "max": 50}},
+        }
+        config = tmp_path / "spectrum.yaml"
+        config.write_text(yaml.safe_dump(data))
+
+        code = main(
+            ["--config", str(config), "--db", str(db), "--jobs", "1", "--no-cache", "--json"]
+        )
+
+        assert code == 0
+        (report,) = json.loads(capsys.readouterr().out)
+        assert report["wan"] == "spectrum"
+        assert report["windows"] == 11
+        thresholds = data["continuous_monitoring"]["thresholds"]
+        target = report["parameters"]["target_bloat_ms"]
+        assert target["initial"] == thresholds["target_bloat_ms"]
+
+    def test_missing_tuning_section_is_an_error(self, tmp_path, capsys) -> None:
+        config = tmp_path / "bad.yaml"
+        config.write_text("wan_name: spectrum\n")
+
+        assert main(["--config", str(config), "--jobs", "1"]) == 1
+        assert "Error" in capsys.readouterr().err
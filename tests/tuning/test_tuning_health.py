@@ -204,6 +204,23 @@ class TestTuningHealthAwaitingData:
         assert wan["tuning"]["last_run_ago_sec"] is None
         assert wan["tuning"]["parameters"] == {}
         assert wan["tuning"]["recent_adjustments"] == []
+        assert "window" not in wan["tuning"]
+
+    def test_metric_window_status_passed_through(self):
+        """Shared metric window status is exposed once the window exists."""
+        state = TuningState(
+            enabled=True,
+            last_run_ts=None,
+            recent_adjustments=[],
+            parameters={},
+        )
+        wc = _make_wan_controller(tuning_enabled=True, tuning_state=state)
+        window = {"rows": 42, "span_hours": 24.0, "full_loads": 1}
+        wc.get_health_data.return_value["tuning"]["window"] = window
+        handler = _make_health_handler(wc)
+        health = handler._get_health_status()
+
+        assert health["wans"][0]["tuning"]["window"] == window
 
 
 class TestTuningHealthActive:
@@ -17,6 +17,10 @@ frame  # noqa
 # --- sqlite3 Row factory (assigned for dict-like row access) ---
 _.row_factory
 
+# --- BaseHTTPRequestHandler attributes read by http.server (chunked history stream) ---
+_.protocol_version  # noqa
+_.close_connection  # noqa
+
 # --- Dataclass fields (structural, stored for observability/serialization) ---
 _.send_delay_ms
 _.receive_delay_ms
@@ -84,6 +88,7 @@ safe_file_path  # noqa
 _.get_gauge
 _.get_counter
 _.is_running
+_.exposition  # noqa
 
 # dashboard/poller.py
 _.is_online
@@ -140,6 +145,9 @@ _.log_cake_stats  # config attribute, validated in check_config.py
 _.last_decision  # SteeringState dataclass field
 _.last_decision_time  # SteeringState dataclass field
 
+# steering/route_ownership_inspector.py -- full-table read used by the phase259/260 scripts
+ROUTE_PRINT  # noqa
+
 # routeros_rest.py -- session attribute assignments (D-05)
 # These are self._session.auth and self._session.verify (requests.Session attrs)
 _.auth  # requests.Session.auth assignment
@@ -225,3 +233,12 @@ RecommendationError
 check_telemetry_health
 score_and_recommend
 verify_read_only
+# zone_events.py
+dl_rate_bps  # noqa  -- ZoneEvent dataclass field (serialized in datagram)
+ul_rate_bps  # noqa  -- ZoneEvent dataclass field (serialized in datagram)
+# backends/__init__.py
+__getattr__  # noqa  -- PEP 562 lazy backend exports
+# perf_profiler.py
+OperationProfiler  # noqa  -- exact reference profiler (tests, scripts/bench_profiler.py)
+# sim/link.py
+diurnal  # noqa  -- Trace.diurnal() scenario builder (public sim API)